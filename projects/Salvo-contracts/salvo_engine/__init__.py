@@ -0,0 +1,109 @@
+# salvo_engine/__init__.py
+from salvo_engine.bitboard import (
+    CELL_OBSTACLE,
+    CELL_OCCUPIED,
+    CELL_PATH,
+    Bitboard,
+    cell_bit,
+    iter_cells,
+    neighbors,
+    shift_east,
+    shift_north,
+    shift_south,
+    shift_west,
+)
+from salvo_engine.game_record import (
+    GameRecord,
+    decode_game_characters,
+    game_record_character_offset,
+    game_record_lobby_offset,
+)
+from salvo_engine.grid_codec import (
+    get_packed_cell,
+    pack_grid,
+    pack_grid_array,
+    unpack_grid,
+    unpack_grid_array,
+)
+from salvo_engine.movement import (
+    DIRECTIONS,
+    MOVE_INVALID,
+    MOVE_REVERTED_COORDS,
+    MOVE_VALID,
+    PADDING,
+    REVERT_MESSAGES,
+    check_move_sequence,
+    get_neighbors_with_count,
+    grids_from_boxes,
+    grids_from_cells,
+    is_move_sequence_valid,
+)
+from salvo_engine.neighbor_table import (
+    NEIGHBOR_INDICES,
+    build_neighbor_table,
+    is_neighbor_path_cell,
+    neighbor_indices,
+)
+from salvo_engine.open_lobby import (
+    decode_open_lobby_index,
+    open_lobby_box_key,
+    open_lobby_bucket,
+    stake_tier,
+)
+from salvo_engine.path_index import (
+    UNREACHABLE,
+    PathIndex,
+    bfs_distances,
+    clear_path_index_cache,
+    reachable_cells,
+)
+from salvo_engine.resolution import RoundResult, resolve_round
+
+__all__ = [
+    "CELL_OBSTACLE",
+    "CELL_OCCUPIED",
+    "CELL_PATH",
+    "DIRECTIONS",
+    "MOVE_INVALID",
+    "MOVE_REVERTED_COORDS",
+    "MOVE_VALID",
+    "NEIGHBOR_INDICES",
+    "PADDING",
+    "REVERT_MESSAGES",
+    "UNREACHABLE",
+    "Bitboard",
+    "GameRecord",
+    "PathIndex",
+    "RoundResult",
+    "bfs_distances",
+    "build_neighbor_table",
+    "cell_bit",
+    "check_move_sequence",
+    "clear_path_index_cache",
+    "decode_game_characters",
+    "decode_open_lobby_index",
+    "game_record_character_offset",
+    "game_record_lobby_offset",
+    "get_neighbors_with_count",
+    "get_packed_cell",
+    "grids_from_boxes",
+    "grids_from_cells",
+    "is_move_sequence_valid",
+    "is_neighbor_path_cell",
+    "iter_cells",
+    "neighbor_indices",
+    "neighbors",
+    "open_lobby_box_key",
+    "open_lobby_bucket",
+    "pack_grid",
+    "pack_grid_array",
+    "reachable_cells",
+    "resolve_round",
+    "shift_east",
+    "shift_north",
+    "shift_south",
+    "shift_west",
+    "stake_tier",
+    "unpack_grid",
+    "unpack_grid_array",
+]
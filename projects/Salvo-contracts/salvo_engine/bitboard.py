@@ -0,0 +1,187 @@
+# salvo_engine/bitboard.py
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from salvo_engine.grid_codec import pack_grid, unpack_grid
+from smart_contracts.salvo import constants as cst
+from smart_contracts.salvo import errors as err
+
+# Grid cell values: only `CELL_PATH` cells are walkable, same as `srt.is_path_cell`
+CELL_PATH = 0
+CELL_OBSTACLE = 1
+CELL_OCCUPIED = 2
+
+# Bit `row * 11 + col` of a bitboard is set when cell (row, col) is in the set
+FULL_MASK = (1 << cst.GRID_CELL_TOTAL) - 1
+
+# Cells of the first and last column, used to stop West/East shifts from wrapping into another row
+WEST_EDGE = sum(1 << (row * cst.GRID_SIZE) for row in range(cst.GRID_SIZE))
+EAST_EDGE = WEST_EDGE << (cst.GRID_SIZE - 1)
+NOT_WEST_EDGE = FULL_MASK & ~WEST_EDGE
+NOT_EAST_EDGE = FULL_MASK & ~EAST_EDGE
+
+
+# Get the single-cell bitboard of (row, col)
+def cell_bit(row: int, col: int) -> int:
+    if not (0 <= row < cst.GRID_SIZE and 0 <= col < cst.GRID_SIZE):
+        raise ValueError(err.INVALID_POS_COORDS)
+    return 1 << (row * cst.GRID_SIZE + col)
+
+
+# Move every cell of a bitboard one step North; row 0 cells fall off the board
+def shift_north(bits: int) -> int:
+    return bits >> cst.GRID_SIZE
+
+
+# Move every cell of a bitboard one step South; row 10 cells fall off the board
+def shift_south(bits: int) -> int:
+    return (bits << cst.GRID_SIZE) & FULL_MASK
+
+
+# Move every cell of a bitboard one step West; column 0 cells fall off the board
+def shift_west(bits: int) -> int:
+    return (bits & NOT_WEST_EDGE) >> 1
+
+
+# Move every cell of a bitboard one step East; column 10 cells fall off the board
+def shift_east(bits: int) -> int:
+    return (bits & NOT_EAST_EDGE) << 1
+
+
+# Get the union of the N/S/W/E neighbors of every cell of a bitboard
+def neighbors(bits: int) -> int:
+    return (
+        (bits >> cst.GRID_SIZE)
+        | ((bits << cst.GRID_SIZE) & FULL_MASK)
+        | ((bits & NOT_WEST_EDGE) >> 1)
+        | ((bits & NOT_EAST_EDGE) << 1)
+    )
+
+
+# Iterate the (row, col) coords of every cell of a bitboard, in index order
+def iter_cells(bits: int) -> Iterator[tuple[int, int]]:
+    while bits:
+        low = bits & -bits
+        yield divmod(low.bit_length() - 1, cst.GRID_SIZE)
+        bits ^= low
+
+
+# Pack a uint8[121] cell mask into a bitboard
+def mask_to_bits(mask: np.ndarray) -> int:
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+# Unpack a bitboard into a bool[121] cell mask
+def bits_to_mask(bits: int) -> np.ndarray:
+    packed = np.frombuffer(bits.to_bytes(16, "little"), dtype=np.uint8)
+    return np.unpackbits(packed, bitorder="little")[: cst.GRID_CELL_TOTAL].astype(bool)
+
+
+# Class for an 11x11 game grid as obstacle and occupancy layers of 121-bit Python ints
+@dataclass(frozen=True)
+class Bitboard:
+    obstacles: int = 0
+    occupancy: int = 0
+
+    def __post_init__(self) -> None:
+        if (self.obstacles | self.occupancy) & ~FULL_MASK:
+            raise ValueError(f"Bitboard layers must fit in {cst.GRID_CELL_TOTAL} bits")
+        if self.obstacles & self.occupancy:
+            raise ValueError("A cell cannot hold both an obstacle and a character")
+
+    # Build a bitboard from 121 grid cell values
+    @classmethod
+    def from_cells(cls, cells: bytes | bytearray | memoryview) -> "Bitboard":
+        cells = np.frombuffer(cells, dtype=np.uint8)
+        if cells.size != cst.GRID_CELL_TOTAL:
+            raise ValueError(
+                f"Grid cells must be {cst.GRID_CELL_TOTAL} bytes, got {cells.size}"
+            )
+        if (cells > CELL_OCCUPIED).any():
+            raise ValueError(f"Unknown grid cell value {cells.max()}")
+        return cls(
+            mask_to_bits(cells == CELL_OBSTACLE), mask_to_bits(cells == CELL_OCCUPIED)
+        )
+
+    # Get the 121 grid cell values
+    def to_cells(self) -> bytes:
+        cells = np.zeros(cst.GRID_CELL_TOTAL, dtype=np.uint8)
+        cells[bits_to_mask(self.obstacles)] = CELL_OBSTACLE
+        cells[bits_to_mask(self.occupancy)] = CELL_OCCUPIED
+        return cells.tobytes()
+
+    # Build a bitboard from a bit-packed 31-byte game grid box value
+    @classmethod
+    def from_box(cls, value: bytes | bytearray | memoryview) -> "Bitboard":
+        return cls.from_cells(unpack_grid(value))
+
+    # Get the bit-packed 31-byte game grid box value
+    def to_box(self) -> bytes:
+        return pack_grid(self.to_cells())
+
+    # Walkable cells, i.e. the cells `srt.is_path_cell` accepts
+    @property
+    def free(self) -> int:
+        return FULL_MASK & ~(self.obstacles | self.occupancy)
+
+    def is_path_cell(self, row: int, col: int) -> bool:
+        return bool(self.free & cell_bit(row, col))
+
+    # Get the walkable neighbors of (row, col), same cells as `srt.get_neighbors_with_count`
+    def path_neighbors(self, row: int, col: int) -> int:
+        return neighbors(cell_bit(row, col)) & self.free
+
+    # Check a single move from `position` to the adjacent `coords`
+    def is_move_valid(self, position: tuple[int, int], coords: tuple[int, int]) -> bool:
+        return bool(self.path_neighbors(*position) & cell_bit(*coords))
+
+    # Check a movement sequence, same as `srt.is_move_sequence_valid`
+    def is_move_sequence_valid(
+        self, position: tuple[int, int], movement: Sequence[tuple[int, int]]
+    ) -> bool:
+        free = self.free
+        current = cell_bit(*position)
+        for coords in movement:
+            step = cell_bit(*coords)
+            if not neighbors(current) & free & step:
+                return False
+            current = step
+        return True
+
+    # Get the cells reachable from `position` in at most `max_steps` moves (unbounded if None)
+    # The start cell is included, as a character may stay in place
+    def reachable(self, position: tuple[int, int], max_steps: int | None = None) -> int:
+        free = self.free
+        reach = cell_bit(*position)
+        steps = 0
+        while max_steps is None or steps < max_steps:
+            grown = reach | (neighbors(reach) & free)
+            if grown == reach:
+                break
+            reach = grown
+            steps += 1
+        return reach
+
+    # Check if `target` can be reached from `position` in at most `max_steps` moves
+    def can_reach(
+        self,
+        position: tuple[int, int],
+        target: tuple[int, int],
+        max_steps: int | None = None,
+    ) -> bool:
+        return bool(self.reachable(position, max_steps) & cell_bit(*target))
+
+    # Get a copy w/ an obstacle placed on or removed from (row, col)
+    def with_obstacle(self, row: int, col: int, *, present: bool = True) -> "Bitboard":
+        bit = cell_bit(row, col)
+        obstacles = self.obstacles | bit if present else self.obstacles & ~bit
+        return replace(self, obstacles=obstacles)
+
+    # Get a copy w/ a character moved from `position` to `target`
+    def with_move(
+        self, position: tuple[int, int], target: tuple[int, int]
+    ) -> "Bitboard":
+        occupancy = (self.occupancy & ~cell_bit(*position)) | cell_bit(*target)
+        return replace(self, occupancy=occupancy)
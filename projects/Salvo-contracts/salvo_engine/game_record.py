@@ -0,0 +1,120 @@
+# salvo_engine/game_record.py
+from dataclasses import dataclass
+
+from algosdk import abi, encoding
+
+from salvo_engine.grid_codec import unpack_grid
+from smart_contracts.salvo import constants as cst
+
+# ABI types of the `stc.GameState` and `stc.GameCharacter` structs, in field order
+GAME_STATE_TYPE = abi.ABIType.from_string(
+    "(bool,uint8,uint8,uint16,uint64,uint64,address,uint256,uint8,uint8,bool,uint64)"
+)
+GAME_CHARACTER_TYPE = abi.ABIType.from_string(
+    "(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)"
+)
+GAME_STATE_FIELDS = (
+    "staking_closed",
+    "lobby_size",
+    "active_players",
+    "box_l_start_pos",
+    "expiry_ts",
+    "prize_pot",
+    "admin_address",
+    "grid_root",
+    "commit_scheme",
+    "stake_tier",
+    "open_lobby_listed",
+    "round_count",
+)
+GAME_CHARACTER_FIELDS = (
+    "has_committed_turn",
+    "has_revealed_turn",
+    "id",
+    "lobby_slot",
+    "action",
+    "position",
+    "target",
+    "move_points",
+    "direction",
+    "turn_hash",
+)
+
+# Lobby slot value of a slot no player holds
+EMPTY_SLOT = bytes(cst.ADDRESS_SIZE)
+
+
+# Get the start index of a lobby slot player address, same as `srt.game_record_lobby_offset`
+def game_record_lobby_offset(lobby_slot: int) -> int:
+    return cst.GAME_RECORD_LOBBY_OFFSET + lobby_slot * cst.ADDRESS_SIZE
+
+
+# Get the start index of a lobby slot game character, same as `srt.game_record_character_offset`
+def game_record_character_offset(lobby_slot: int) -> int:
+    return cst.GAME_RECORD_CHARACTERS_OFFSET + lobby_slot * cst.GAME_CHARACTER_SIZE
+
+
+# Decode a game characters (`c_`) box value into one game character per lobby slot
+def decode_game_characters(
+    value: bytes | bytearray | memoryview,
+) -> tuple[dict[str, object], ...]:
+    value = bytes(value)
+    size = cst.GAME_CHARACTER_SIZE * cst.MAX_LOBBY_SIZE
+    if len(value) != size:
+        raise ValueError(f"Game characters must be {size} bytes, got {len(value)}")
+    return tuple(
+        dict(zip(GAME_CHARACTER_FIELDS, GAME_CHARACTER_TYPE.decode(chunk), strict=True))
+        for chunk in (
+            value[i : i + cst.GAME_CHARACTER_SIZE]
+            for i in range(0, size, cst.GAME_CHARACTER_SIZE)
+        )
+    )
+
+
+# Class for a decoded unified game record (`m_` box) value
+@dataclass(frozen=True)
+class GameRecord:
+    state: dict[str, object]
+    lobby: tuple[
+        str | None, ...
+    ]  # Player address per lobby slot, None for an empty slot
+    grid: bytes  # 121 grid cell values
+    characters: tuple[dict[str, object], ...]  # Game character per lobby slot
+
+    @classmethod
+    def decode(cls, value: bytes | bytearray | memoryview) -> "GameRecord":
+        value = bytes(value)
+        if len(value) != cst.GAME_RECORD_SIZE:
+            raise ValueError(
+                f"Game record must be {cst.GAME_RECORD_SIZE} bytes, got {len(value)}"
+            )
+
+        state = GAME_STATE_TYPE.decode(
+            value[cst.GAME_RECORD_STATE_OFFSET : cst.GAME_RECORD_LOBBY_OFFSET]
+        )
+        lobby = []
+        for slot in range(cst.MAX_LOBBY_SIZE):
+            start = game_record_lobby_offset(slot)
+            address = value[start : start + cst.ADDRESS_SIZE]
+            lobby.append(
+                None if address == EMPTY_SLOT else encoding.encode_address(address)
+            )
+
+        grid = unpack_grid(
+            value[cst.GAME_RECORD_GRID_OFFSET : cst.GAME_RECORD_CHARACTERS_OFFSET]
+        )
+        return cls(
+            state=dict(zip(GAME_STATE_FIELDS, state, strict=True)),
+            lobby=tuple(lobby),
+            grid=grid,
+            characters=decode_game_characters(
+                value[cst.GAME_RECORD_CHARACTERS_OFFSET :]
+            ),
+        )
+
+    # Get the lobby slot held by an address, e.g. for the `commit_turn_record` argument
+    def lobby_slot(self, address: str) -> int:
+        try:
+            return self.lobby.index(address)
+        except ValueError:
+            raise ValueError(f"Address {address} is not in the game lobby") from None
@@ -0,0 +1,71 @@
+# salvo_engine/grid_codec.py
+import numpy as np
+import numpy.typing as npt
+
+from smart_contracts.salvo import constants as cst
+
+# Bit shift of each of the 4 cells packed in a byte, first cell in the high bits like `srt.grid_cell_shift`
+CELL_SHIFTS = np.array(
+    [
+        (cst.GRID_CELLS_PER_BYTE - 1 - k) * cst.GRID_CELL_BITS
+        for k in range(cst.GRID_CELLS_PER_BYTE)
+    ],
+    dtype=np.uint8,
+)
+
+# Number of cells covered by the packed bytes, incl. the unused padding cells of the last byte
+PADDED_CELL_TOTAL = cst.GRID_PACKED_SIZE * cst.GRID_CELLS_PER_BYTE
+
+
+# Pack uint8[N, 121] cell values into uint8[N, 31] game grid box values
+def pack_grid_array(cells: npt.ArrayLike) -> npt.NDArray[np.uint8]:
+    cells = np.asarray(cells, dtype=np.uint8)
+    if cells.ndim != 2 or cells.shape[1] != cst.GRID_CELL_TOTAL:
+        raise ValueError(f"Expected cells of shape (N, {cst.GRID_CELL_TOTAL})")
+    if cells.size and cells.max() > cst.GRID_CELL_MASK:
+        raise ValueError(
+            f"Grid cell value {cells.max()} does not fit in {cst.GRID_CELL_BITS} bits"
+        )
+    padded = np.zeros((cells.shape[0], PADDED_CELL_TOTAL), dtype=np.uint8)
+    padded[:, : cst.GRID_CELL_TOTAL] = cells
+    quads = padded.reshape(
+        cells.shape[0], cst.GRID_PACKED_SIZE, cst.GRID_CELLS_PER_BYTE
+    )
+    return np.bitwise_or.reduce(quads << CELL_SHIFTS, axis=2).astype(np.uint8)
+
+
+# Unpack uint8[N, 31] game grid box values into uint8[N, 121] cell values
+def unpack_grid_array(packed: npt.ArrayLike) -> npt.NDArray[np.uint8]:
+    packed = np.asarray(packed, dtype=np.uint8)
+    if packed.ndim != 2 or packed.shape[1] != cst.GRID_PACKED_SIZE:
+        raise ValueError(f"Expected packed grids of shape (N, {cst.GRID_PACKED_SIZE})")
+    cells = (packed[:, :, None] >> CELL_SHIFTS) & cst.GRID_CELL_MASK
+    return cells.reshape(packed.shape[0], PADDED_CELL_TOTAL)[:, : cst.GRID_CELL_TOTAL]
+
+
+# Pack 121 cell values into a 31-byte game grid box value
+def pack_grid(cells: bytes | bytearray | memoryview) -> bytes:
+    cells = np.frombuffer(cells, dtype=np.uint8)
+    if cells.size != cst.GRID_CELL_TOTAL:
+        raise ValueError(
+            f"Grid cells must be {cst.GRID_CELL_TOTAL} bytes, got {cells.size}"
+        )
+    return pack_grid_array(cells[None, :]).tobytes()
+
+
+# Unpack a 31-byte game grid box value into 121 cell values
+def unpack_grid(value: bytes | bytearray | memoryview) -> bytes:
+    packed = np.frombuffer(value, dtype=np.uint8)
+    if packed.size != cst.GRID_PACKED_SIZE:
+        raise ValueError(
+            f"Grid box value must be {cst.GRID_PACKED_SIZE} bytes, got {packed.size}"
+        )
+    return unpack_grid_array(packed[None, :]).tobytes()
+
+
+# Get the value of cell i straight from a packed box value, same as `srt.get_grid_cell_value`
+def get_packed_cell(value: bytes | bytearray | memoryview, i: int) -> int:
+    if not 0 <= i < cst.GRID_CELL_TOTAL:
+        raise ValueError(f"Grid cell index {i} is out of range")
+    shift = int(CELL_SHIFTS[i % cst.GRID_CELLS_PER_BYTE])
+    return (value[i // cst.GRID_CELLS_PER_BYTE] >> shift) & cst.GRID_CELL_MASK
@@ -0,0 +1,174 @@
+# salvo_engine/movement.py
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from salvo_engine.grid_codec import unpack_grid_array
+from smart_contracts.salvo import constants as cst
+from smart_contracts.salvo import errors as err
+
+# Padding value of unused neighbor slots, same as the contract `placeholder_coords`
+PADDING = 255
+
+# Neighbor directions in contract evaluation order: North, South, West, East
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+# Outcome of a movement sequence check, per game
+MOVE_VALID = 0  # `is_move_sequence_valid` returns True
+MOVE_INVALID = 1  # `is_move_sequence_valid` returns False
+MOVE_REVERTED_COORDS = 2  # The start or a movement entry fails `assert_coords_in_range`
+
+# Contract assert message of each reverted outcome
+REVERT_MESSAGES = {MOVE_REVERTED_COORDS: err.INVALID_POS_COORDS}
+
+# Largest coordinate value an arc4.UInt8 can hold
+UINT8_MAX = 255
+
+Grids = npt.NDArray[np.uint8]
+
+
+# Stack the 121 cell values of N grids into a uint8[N, 121] array
+def grids_from_cells(cells: Sequence[bytes]) -> Grids:
+    grids = np.frombuffer(b"".join(cells), dtype=np.uint8)
+    if grids.size != len(cells) * cst.GRID_CELL_TOTAL:
+        raise ValueError(f"Every grid must have {cst.GRID_CELL_TOTAL} cell bytes")
+    return grids.reshape(len(cells), cst.GRID_CELL_TOTAL)
+
+
+# Unpack N bit-packed 31-byte game grid box values into a uint8[N, 121] array
+def grids_from_boxes(boxes: Sequence[bytes]) -> Grids:
+    packed = np.frombuffer(b"".join(boxes), dtype=np.uint8)
+    if packed.size != len(boxes) * cst.GRID_PACKED_SIZE:
+        raise ValueError(f"Every grid box value must be {cst.GRID_PACKED_SIZE} bytes")
+    return unpack_grid_array(packed.reshape(len(boxes), cst.GRID_PACKED_SIZE))
+
+
+# Validate a uint8[N, 121] grid array and coords arrays of matching leading dimension
+def _check_inputs(grids: Grids, *coords: npt.NDArray[np.int64]) -> None:
+    if grids.ndim != 2 or grids.shape[1] != cst.GRID_CELL_TOTAL:
+        raise ValueError(f"Expected grids of shape (N, {cst.GRID_CELL_TOTAL})")
+    for c in coords:
+        if c.shape[0] != grids.shape[0] or c.shape[-1] != 2:
+            raise ValueError("Coords must have shape (N, ..., 2) matching the grids")
+        if c.size and (c.min() < 0 or c.max() > UINT8_MAX):
+            raise ValueError("Coords must be arc4.UInt8 values")
+
+
+# Evaluate the four neighbor candidates of each position like `get_neighbors_with_count`
+# Return per direction (row, col, is_valid_path_cell) and a mask of positions whose evaluation reverts
+def _neighbor_candidates(
+    grids: Grids, rows: npt.NDArray[np.int64], cols: npt.NDArray[np.int64]
+) -> tuple[list[tuple[npt.NDArray[np.int64], ...]], npt.NDArray[np.bool_]]:
+    games = np.arange(grids.shape[0])
+    reverted = np.zeros(grids.shape[0], dtype=bool)
+    bounds = (rows > 0, rows + 1 < cst.GRID_SIZE, cols > 0, cols + 1 < cst.GRID_SIZE)
+
+    candidates = []
+    for (dr, dc), in_bounds in zip(DIRECTIONS, bounds, strict=True):
+        n_rows, n_cols = rows + dr, cols + dc
+
+        # Only the other axis can be out of range (for an out of range position), in which case
+        # the flattened index either aliases into another row or makes the contract `getbyte` fail
+        index = n_rows * cst.GRID_SIZE + n_cols
+        reverted |= in_bounds & (index >= cst.GRID_CELL_TOTAL)
+        cell = grids[games, np.minimum(index, cst.GRID_CELL_TOTAL - 1)]
+
+        is_path = in_bounds & (index < cst.GRID_CELL_TOTAL) & (cell == 0)
+        candidates.append((n_rows, n_cols, is_path))
+    return candidates, reverted
+
+
+# Get every neighbor of each position and a count of valid path cells, same as `get_neighbors_with_count`
+# Return uint8[N, 4, 2] neighbors (N/S/W/E order, packed, 255 padded), uint8[N] counts and a reverted mask
+def get_neighbors_with_count(
+    grids: Grids, positions: npt.ArrayLike
+) -> tuple[Grids, Grids, npt.NDArray[np.bool_]]:
+    positions = np.asarray(positions, dtype=np.int64)
+    _check_inputs(grids, positions)
+    rows, cols = positions[:, 0], positions[:, 1]
+
+    candidates, reverted = _neighbor_candidates(grids, rows, cols)
+
+    games = np.arange(grids.shape[0])
+    neighbors = np.full((grids.shape[0], 4, 2), PADDING, dtype=np.uint8)
+    count = np.zeros(grids.shape[0], dtype=np.int64)
+    for n_rows, n_cols, is_path in candidates:
+        # Overwrite placeholder coords at the current count index, then increment count
+        slot = np.minimum(count, 3)
+        neighbors[games[is_path], slot[is_path], 0] = n_rows[is_path]
+        neighbors[games[is_path], slot[is_path], 1] = n_cols[is_path]
+        count += is_path
+    return neighbors, count.astype(np.uint8), reverted
+
+
+# Check the movement sequences of N games at once, same as `is_move_sequence_valid`
+# `movements` is int[N, L, 2], and `lengths` gives the number of used entries of each row (defaults to L)
+# Return uint8[N] outcomes: MOVE_VALID, MOVE_INVALID or MOVE_REVERTED_COORDS
+def is_move_sequence_valid(
+    grids: Grids,
+    positions: npt.ArrayLike,
+    movements: npt.ArrayLike,
+    lengths: npt.ArrayLike | None = None,
+) -> Grids:
+    positions = np.asarray(positions, dtype=np.int64)
+    movements = np.asarray(movements, dtype=np.int64).reshape(grids.shape[0], -1, 2)
+    _check_inputs(grids, positions, movements)
+    n_games, max_len = movements.shape[:2]
+    lengths = (
+        np.full(n_games, max_len, dtype=np.int64)
+        if lengths is None
+        else np.asarray(lengths, dtype=np.int64)
+    )
+    if lengths.shape != (n_games,) or (lengths < 0).any() or (lengths > max_len).any():
+        raise ValueError(f"Lengths must be {n_games} values in 0..{max_len}")
+
+    # Assert starting row and column are within valid range, before any movement entry is read
+    rows, cols = positions[:, 0].copy(), positions[:, 1].copy()
+    outcome = np.full(n_games, MOVE_VALID, dtype=np.uint8)
+    outcome[(rows >= cst.GRID_SIZE) | (cols >= cst.GRID_SIZE)] = MOVE_REVERTED_COORDS
+    for step in range(max_len):
+        # Games still walking their sequence (an invalid move returns early, a revert stops everything)
+        active = (outcome == MOVE_VALID) & (step < lengths)
+        if not active.any():
+            break
+        new_rows, new_cols = movements[:, step, 0], movements[:, step, 1]
+
+        # Assert row and column are within valid range
+        out_of_range = active & (
+            (new_rows >= cst.GRID_SIZE) | (new_cols >= cst.GRID_SIZE)
+        )
+        outcome[out_of_range] = MOVE_REVERTED_COORDS
+        active &= ~out_of_range
+
+        # Get all neighbors of current position; the coords are a valid move if any valid neighbor matches
+        # Every current position is in range here, so no neighbor lookup can revert
+        candidates, _ = _neighbor_candidates(grids, rows, cols)
+        is_valid = np.zeros(n_games, dtype=bool)
+        for n_rows, n_cols, is_path in candidates:
+            is_valid |= is_path & (n_rows == new_rows) & (n_cols == new_cols)
+
+        outcome[active & ~is_valid] = MOVE_INVALID
+        moved = active & is_valid
+        rows[moved], cols[moved] = new_rows[moved], new_cols[moved]
+
+    return outcome
+
+
+# Check a single movement sequence, raising like the contract assertions when it would revert
+# `grid` holds the 121 cell values, as bytes or an array
+def check_move_sequence(
+    grid: bytes | npt.ArrayLike,
+    position: tuple[int, int],
+    movement: Sequence[tuple[int, int]],
+) -> bool:
+    grids = (
+        grids_from_cells([grid])
+        if isinstance(grid, bytes | bytearray)
+        else np.asarray(grid, dtype=np.uint8).reshape(1, cst.GRID_CELL_TOTAL)
+    )
+    movements = np.asarray(movement, dtype=np.int64).reshape(1, -1, 2)
+    outcome = int(is_move_sequence_valid(grids, [position], movements)[0])
+    if outcome in REVERT_MESSAGES:
+        raise ValueError(REVERT_MESSAGES[outcome])
+    return outcome == MOVE_VALID
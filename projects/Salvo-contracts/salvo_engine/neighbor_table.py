@@ -0,0 +1,37 @@
+# salvo_engine/neighbor_table.py
+import numpy as np
+import numpy.typing as npt
+
+from salvo_engine.movement import DIRECTIONS
+from smart_contracts.salvo import constants as cst
+
+
+# Build the neighbor table of `cst.NEIGHBOR_TABLE`: N/S/W/E neighbor grid index per cell, 255 off the grid
+def build_neighbor_table() -> bytes:
+    table = bytearray()
+    for i in range(cst.GRID_CELL_TOTAL):
+        row, col = divmod(i, cst.GRID_SIZE)
+        for dr, dc in DIRECTIONS:
+            n_row, n_col = row + dr, col + dc
+            on_grid = 0 <= n_row < cst.GRID_SIZE and 0 <= n_col < cst.GRID_SIZE
+            table.append(
+                n_row * cst.GRID_SIZE + n_col if on_grid else cst.NEIGHBOR_NONE
+            )
+    return bytes(table)
+
+
+# Same table as a read-only uint8[121, 4] array, for vectorized lookups
+NEIGHBOR_INDICES: npt.NDArray[np.uint8] = np.frombuffer(
+    cst.NEIGHBOR_TABLE, dtype=np.uint8
+).reshape(cst.GRID_CELL_TOTAL, cst.NEIGHBOR_COUNT)
+
+
+# Get the on-grid neighbor indices of the cell at index i, in N/S/W/E order
+def neighbor_indices(i: int) -> tuple[int, ...]:
+    entries = cst.NEIGHBOR_TABLE[i * cst.NEIGHBOR_COUNT : (i + 1) * cst.NEIGHBOR_COUNT]
+    return tuple(n for n in entries if n != cst.NEIGHBOR_NONE)
+
+
+# Check a single move between grid indices like `srt.is_neighbor_path_cell`
+def is_neighbor_path_cell(grid: bytes, i: int, target: int) -> bool:
+    return grid[target] == 0 and target in neighbor_indices(i)
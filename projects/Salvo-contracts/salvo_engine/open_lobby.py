@@ -0,0 +1,47 @@
+# salvo_engine/open_lobby.py
+from smart_contracts.salvo import constants as cst
+
+# Key prefix of the open lobby index boxes, one box per bucket
+OPEN_LOBBY_KEY_PREFIX = b"o_"
+
+# Lowest stake amount of each stake tier, same thresholds as `srt.get_stake_tier`
+STAKE_TIER_THRESHOLDS = (0, cst.STAKE_TIER_1, cst.STAKE_TIER_2, cst.STAKE_TIER_3)
+
+
+# Get the stake tier of a stake amount, same as `srt.get_stake_tier`
+def stake_tier(amount: int) -> int:
+    return sum(amount >= threshold for threshold in STAKE_TIER_THRESHOLDS) - 1
+
+
+# Get the open lobby index bucket of a lobby size and stake tier, same as `srt.get_open_lobby_bucket`
+def open_lobby_bucket(lobby_size: int, tier: int) -> int:
+    if not (
+        cst.MIN_LOBBY_SIZE <= lobby_size <= cst.MAX_LOBBY_SIZE and lobby_size % 2 == 0
+    ):
+        raise ValueError(f"Invalid lobby size {lobby_size}")
+    if not 0 <= tier < cst.STAKE_TIER_COUNT:
+        raise ValueError(f"Invalid stake tier {tier}")
+    return (lobby_size // 2 - 1) * cst.STAKE_TIER_COUNT + tier
+
+
+# Get the box key of an open lobby index bucket, e.g. for the box references of `new_game`
+def open_lobby_box_key(bucket: int) -> bytes:
+    return OPEN_LOBBY_KEY_PREFIX + bucket.to_bytes(8, "big")
+
+
+# Decode an open lobby index (`o_`) box value into its open game ids, in entry order
+def decode_open_lobby_index(value: bytes | bytearray | memoryview) -> tuple[int, ...]:
+    value = bytes(value)
+    if len(value) != cst.OPEN_LOBBY_INDEX_SIZE:
+        raise ValueError(
+            f"Open lobby index must be {cst.OPEN_LOBBY_INDEX_SIZE} bytes, got {len(value)}"
+        )
+    count = int.from_bytes(value[: cst.OPEN_LOBBY_IDS_OFFSET], "big")
+    if count > cst.OPEN_LOBBY_CAPACITY:
+        raise ValueError(f"Open lobby index count {count} exceeds its capacity")
+    return tuple(
+        int.from_bytes(value[i : i + 8], "big")
+        for i in range(
+            cst.OPEN_LOBBY_IDS_OFFSET, cst.OPEN_LOBBY_IDS_OFFSET + 8 * count, 8
+        )
+    )
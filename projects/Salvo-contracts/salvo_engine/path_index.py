@@ -0,0 +1,142 @@
+# salvo_engine/path_index.py
+from collections import OrderedDict
+
+import numpy as np
+import numpy.typing as npt
+
+from salvo_engine.bitboard import Bitboard, bits_to_mask, mask_to_bits, neighbors
+from smart_contracts.salvo import constants as cst
+from smart_contracts.salvo import errors as err
+
+# Distance of a cell that cannot be reached (the longest possible path is 120 moves)
+UNREACHABLE = 255
+
+# Number of path indexes kept in the shared cache
+MAX_CACHED_INDEXES = 128
+
+# Shared cache of path indexes keyed by the walkable cells bitboard of their grid
+_CACHE: OrderedDict[int, "PathIndex"] = OrderedDict()
+
+
+# Get the grid cell index of (row, col)
+def _cell_index(position: tuple[int, int]) -> int:
+    row, col = position
+    if not (0 <= row < cst.GRID_SIZE and 0 <= col < cst.GRID_SIZE):
+        raise ValueError(err.INVALID_POS_COORDS)
+    return row * cst.GRID_SIZE + col
+
+
+# Run a BFS over the walkable cells from one source cell, one bitboard frontier per distance
+# The source itself may be occupied (e.g. the moving character); it is never walked back into
+def bfs_distances(free: int, source: int) -> npt.NDArray[np.uint8]:
+    distances = np.full(cst.GRID_CELL_TOTAL, UNREACHABLE, dtype=np.uint8)
+    distances[source] = 0
+    visited = frontier = 1 << source
+    distance = 0
+    while frontier:
+        distance += 1
+        frontier = neighbors(frontier) & free & ~visited
+        visited |= frontier
+        distances[bits_to_mask(frontier)] = distance
+    return distances
+
+
+# Class for the all-pairs move distances of a grid snapshot, as a 121x121 uint8 matrix
+# Rows are computed on first use; `update` carries over every row an obstacle change cannot affect
+class PathIndex:
+    def __init__(self, free: int) -> None:
+        self.free = free
+        self._distances = np.full(
+            (cst.GRID_CELL_TOTAL, cst.GRID_CELL_TOTAL), UNREACHABLE, dtype=np.uint8
+        )
+        self._ready = np.zeros(cst.GRID_CELL_TOTAL, dtype=bool)
+
+    # Get the shared path index of a grid, built once per distinct set of walkable cells
+    @classmethod
+    def for_grid(cls, grid: Bitboard | bytes | bytearray) -> "PathIndex":
+        board = grid if isinstance(grid, Bitboard) else Bitboard.from_box(grid)
+        index = _CACHE.get(board.free)
+        if index is None:
+            index = cls(board.free)
+            _cache(index)
+        else:
+            _CACHE.move_to_end(board.free)
+        return index
+
+    # Get the distances from `source` to every cell index, computing the row on first use
+    def _row(self, source: int) -> npt.NDArray[np.uint8]:
+        if not self._ready[source]:
+            self._distances[source] = bfs_distances(self.free, source)
+            self._ready[source] = True
+        return self._distances[source]
+
+    # Get the full distance matrix, `matrix[src_index, dst_index]`
+    @property
+    def matrix(self) -> npt.NDArray[np.uint8]:
+        for source in np.flatnonzero(~self._ready):
+            self._row(int(source))
+        matrix = self._distances.view()
+        matrix.flags.writeable = False
+        return matrix
+
+    # Get the distances from `position` to every cell index
+    def distances_from(self, position: tuple[int, int]) -> npt.NDArray[np.uint8]:
+        row = self._row(_cell_index(position)).view()
+        row.flags.writeable = False
+        return row
+
+    # Get the move count of the shortest path between two cells, or UNREACHABLE
+    def distance(self, position: tuple[int, int], target: tuple[int, int]) -> int:
+        return int(self._row(_cell_index(position))[_cell_index(target)])
+
+    # Check if `target` can be reached from `position` w/ at most `move_points` moves
+    def can_reach(
+        self, position: tuple[int, int], target: tuple[int, int], move_points: int
+    ) -> bool:
+        distance = self._row(_cell_index(position))[_cell_index(target)]
+        return distance != UNREACHABLE and distance <= move_points
+
+    # Get the path index of a changed grid, reusing every distance row the change leaves intact
+    # A row goes stale only if a newly blocked cell was reachable from its source,
+    # or a newly walkable cell borders (or is) a cell reachable from its source
+    def update(self, grid: Bitboard | bytes | bytearray) -> "PathIndex":
+        board = grid if isinstance(grid, Bitboard) else Bitboard.from_box(grid)
+        if board.free == self.free:
+            return self
+        cached = _CACHE.get(board.free)
+        if cached is not None:
+            _CACHE.move_to_end(board.free)
+            return cached
+
+        blocked = self.free & ~board.free
+        opened = board.free & ~self.free
+        touched = bits_to_mask(blocked | opened | neighbors(opened))
+        reachable = self._distances[:, touched] != UNREACHABLE
+        stale = reachable.any(axis=1)
+
+        index = PathIndex(board.free)
+        keep = self._ready & ~stale
+        index._distances[keep] = self._distances[keep]
+        index._ready = keep
+        _cache(index)
+        return index
+
+
+# Add a path index to the shared cache, evicting the least recently used one when full
+def _cache(index: PathIndex) -> None:
+    _CACHE[index.free] = index
+    if len(_CACHE) > MAX_CACHED_INDEXES:
+        _CACHE.popitem(last=False)
+
+
+# Empty the shared path index cache
+def clear_path_index_cache() -> None:
+    _CACHE.clear()
+
+
+# Build a bitboard of every cell within `move_points` moves of `position`, from a path index row
+def reachable_cells(
+    index: PathIndex, position: tuple[int, int], move_points: int
+) -> int:
+    distances = index.distances_from(position)
+    return mask_to_bits((distances <= move_points) & (distances != UNREACHABLE))
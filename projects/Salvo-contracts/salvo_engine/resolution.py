@@ -0,0 +1,101 @@
+# salvo_engine/resolution.py
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+from smart_contracts.salvo import constants as cst
+from smart_contracts.salvo import errors as err
+
+
+# Class for the outcome of a round, as `resolve_round` leaves it on-chain
+# `changes` lists every grid cell change as (i, old, new), in the order `resolve_round` consumes proofs
+@dataclass(frozen=True)
+class RoundResult:
+    cells: bytes
+    positions: tuple[int, ...]
+    hits: tuple[int, ...]
+    changes: tuple[tuple[int, int, int], ...]
+    blocked: tuple[int, ...]
+
+
+# Get the lobby slot of the present character standing on grid cell i, same as `srt.find_character_at`
+def _find_character_at(
+    positions: Sequence[int], present: Sequence[bool], i: int, skip_slot: int
+) -> int | None:
+    for slot, position in enumerate(positions):
+        if slot != skip_slot and present[slot] and position == i:
+            return slot
+    return None
+
+
+# Resolve a round off-chain, same order and rules as the contract `resolve_round`
+# `characters` are decoded character slots (see `decode_game_characters`), `present` flags held lobby slots
+# Raise like the contract when a present player has not revealed before the phase expired
+def resolve_round(
+    cells: bytes | bytearray | Sequence[int],
+    characters: Sequence[Mapping[str, int | bool]],
+    present: Sequence[bool],
+    *,
+    expired: bool = False,
+) -> RoundResult:
+    if len(cells) != cst.GRID_CELL_TOTAL:
+        raise ValueError(
+            f"Grid cells must be {cst.GRID_CELL_TOTAL} values, got {len(cells)}"
+        )
+    if len(characters) != len(present) or len(present) > cst.MAX_LOBBY_SIZE:
+        raise ValueError(
+            f"Expected at most {cst.MAX_LOBBY_SIZE} characters, one per lobby slot"
+        )
+
+    revealed = [
+        bool(is_present and character["has_revealed_turn"])
+        for character, is_present in zip(characters, present, strict=True)
+    ]
+    if not expired and any(
+        is_present and not is_revealed
+        for is_present, is_revealed in zip(present, revealed, strict=True)
+    ):
+        raise ValueError(err.ROUND_NOT_REVEALED)
+
+    grid = bytearray(cells)
+    positions = [int(character["position"]) for character in characters]
+    changes = []
+    blocked = []
+
+    # Move phase, in lobby slot order: a move only lands on a free path cell
+    for slot, character in enumerate(characters):
+        position, target = positions[slot], int(character["target"])
+        if not revealed[slot] or target == position:
+            continue
+        if (
+            grid[target] != cst.GRID_CELL_PATH
+            or _find_character_at(positions, present, target, slot) is not None
+        ):
+            blocked.append(slot)
+            continue
+        if grid[position] == cst.GRID_CELL_OCCUPIED:
+            grid[position] = cst.GRID_CELL_PATH
+            changes.append((position, cst.GRID_CELL_OCCUPIED, cst.GRID_CELL_PATH))
+        grid[target] = cst.GRID_CELL_OCCUPIED
+        changes.append((target, cst.GRID_CELL_PATH, cst.GRID_CELL_OCCUPIED))
+        positions[slot] = target
+
+    # Action phase: a shot hits the first character in the shooter facing direction
+    hits = [0] * len(characters)
+    for slot, character in enumerate(characters):
+        if not revealed[slot] or character["action"] != cst.ACTION_SHOOT:
+            continue
+        cell = positions[slot]
+        while True:
+            cell = cst.NEIGHBOR_TABLE[
+                cell * cst.NEIGHBOR_COUNT + int(character["direction"])
+            ]
+            if cell == cst.NEIGHBOR_NONE or grid[cell] == cst.GRID_CELL_OBSTACLE:
+                break
+            hit_slot = _find_character_at(positions, present, cell, slot)
+            if hit_slot is not None:
+                hits[hit_slot] += 1
+                break
+
+    return RoundResult(
+        bytes(grid), tuple(positions), tuple(hits), tuple(changes), tuple(blocked)
+    )
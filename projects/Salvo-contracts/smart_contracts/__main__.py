@@ -10,6 +10,8 @@ from shutil import rmtree
 from algokit_utils.config import config
 from dotenv import load_dotenv
 
+from smart_contracts.postprocess_client import postprocess_client
+
 # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
 # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
 # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
@@ -152,6 +154,10 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     raise Exception(
                         f"Could not generate typed client:\n{generate_result.stdout}"
                     )
+
+        # Swap the generated reflection-based ABI helpers for the cached fast-path ones
+        for client_path in output_dir.glob("*.py"):
+            postprocess_client(client_path)
     if client_file:
         return output_dir / client_file
     return output_dir
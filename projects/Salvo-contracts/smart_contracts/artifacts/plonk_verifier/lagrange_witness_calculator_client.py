@@ -20,30 +20,101 @@ import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
 _APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["DeleteApplication"]}, "args": [{"type": "uint256[]", "name": "signals"}, {"type": "(byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],uint256,uint256,uint256,uint256,uint256,uint256)", "name": "proof", "struct": "Proof"}], "name": "calculateLagrangeWitness", "returns": {"type": "(uint256[],uint256,uint256)", "struct": "LagrangeWitness"}, "events": [], "readonly": false, "recommendations": {}}], "name": "LagrangeWitnessCalculator", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"LagrangeWitness": [{"name": "L", "type": "uint256[]"}, {"name": "xin", "type": "uint256"}, {"name": "zh", "type": "uint256"}], "Proof": [{"name": "A", "type": "byte[96]"}, {"name": "B", "type": "byte[96]"}, {"name": "C", "type": "byte[96]"}, {"name": "Z", "type": "byte[96]"}, {"name": "T1", "type": "byte[96]"}, {"name": "T2", "type": "byte[96]"}, {"name": "T3", "type": "byte[96]"}, {"name": "Wxi", "type": "byte[96]"}, {"name": "Wxiw", "type": "byte[96]"}, {"name": "eval_a", "type": "uint256"}, {"name": "eval_b", "type": "uint256"}, {"name": "eval_c", "type": "uint256"}, {"name": "eval_s1", "type": "uint256"}, {"name": "eval_s2", "type": "uint256"}, {"name": "eval_zw", "type": "uint256"}]}, "byteCode": {"approval": "CiANIGABAIADwAGgAuADwASgBYAGiAbgByYGIHPtp1MpnX1IMznYCAmh2AVTvaQC//5b/v////8AAAABAAEBAwaBAQAAMRtBAA2ABIc5aCQ2GgCOAQABADEZgQUSRDEYFEQ2GgE2GgKIAC+ABBUffHVMULAkQ4oCAYv+KKqL/yiqTCigTKEoqomKAQGL/wIoqkkVIg5EIq+riYoCASVHDylHBoGi1woyDA1BABaxgQayEIEFshkrsh4rsh8lsgGzQv/gJwRJFSVLAQ8lSwJPAk0jSwIPI0sDTwJNSwNPAksCUkkVIxJEIQVLAw8hBUsETwJNSwRPA0sCUkkVIxJEIQZLBA8hBksFTwJNSwVPA0sCUkkVIxJEIQRLBQ8hBEsGTwJNSwZPA0sCUkkVIxJEIQdLBg8hB0sHTwJNSwdPA0sCUkkVIxJEIQhLBw8hCEsITwJNSwhPA0sCUkkVIxJEIQlLCA8hCUsJTwJNSwlPA0sCUkkVIxJEIQpLCQ8hCksKTwJNSwpPA0sCUkkVIxJEIQtLCg8hC0sLTwJNSwtPA0sCUheBkAZLCw+BkAZLDE8CTUsMTwNLAlIXgZgGSwwPgZgGSw1PAk1LDU8DSwJSF4GgBksND4GgBksOTwJNSw5PA0sCUhchDEsODyEMTw9PAk1PDk8DTwJSSRUhBRJETwxPDFBPC1BPClBPCVBPCFBPB1BPBlBPBRZQTwQWUE8DFlBPAhZQTFBJjAxJVwBgSwFXYGBQSwFXwGBQSwEhBiNYUEsBIQQjWFBLASEHI1hQSwEhCCNYUEwhCSNYUIwKi/4lWYwQJYwTixOLEAxBACqL/lcCAIsTSU4CIgsiWCiqSRUiDkQir6tJFSISRIsKTFCMCiQIjBNC/86L/1cAYIsKTFCL/1dgYFCL/1fAYFCI/dhJiP3UUEmMCov/IQYjWFCI/cZJjAOL/yEEI1hQi/8hByNYUIv/IQgjWFCI/atJjA6L/4HgBiJYUIv/gYAHIlhQi/+BoAciWFCL/4HAByJYUIv/IQwiWFCL/4GACCJYUCEFr0yI/XJcIIwLgQKMEosSgQYMQQAtixJJJAkiC4sLSU8CIlhLAVcgIKMoqkkVIg5EIq+rSwIiC0xdjAskCIwSQv/Li/8hCSNYi/8hCiNYUIj9JYsKiwNQiw5QiwtQTFCAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQSYwFV2AgjA8kjBEljBKLDCEKW4sSDUEAGIsPSaMoqowPixGBAguMEYsSJAiMEkL/3YsPSRUiDkQir0mMAkqriwWB4AJPAl1PAiqI/HVJFSIORE8CqyEETF2MBYsRFiiqjAcqjA2AIgABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACMAIsMIQtbSYwWQAEAJIwUJIwVixWLFA5BAL2LBUkhBCJYiw1JTwKjKKpPAldgIE8CiPwFiwejKKpMKKqMASiqSSmpRIAgc+2nUymdfUgzOdgICaHYBVO9pAL//lv+/////v////8qjAhMKKqMBIwGiwYppUEALYsGKqwpqYsIjAlBAAmLCIsEoyiqjAmLCYwIiwRJoyiqjASLBoABAqKMBkL/zIsBiwijKKpJFSIORIsCq4sASU8CUEwlWSQIFlcGAlwAjACLDScFoyiqjA2LFSQIjBVC/zuAAgGiiwVQiwBQSSVZSwEVSwJOAlJMgwICoANYSYHgAiJYTCEEIliAAgBCTwJQTFBMUIwAiYsWjBRC/vw=", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBAYWxnb3JhbmRmb3VuZGF0aW9uL2FsZ29yYW5kLXR5cGVzY3JpcHQvYXJjNC9pbmRleC5kLnRzOjpDb250cmFjdC5hcHByb3ZhbFByb2dyYW0oKSAtPiB1aW50NjQ6Cm1haW46CiAgICBpbnRjYmxvY2sgMzIgOTYgMSAwIDM4NCAxOTIgMjg4IDQ4MCA1NzYgNjcyIDc2OCA3NzYgOTkyCiAgICBieXRlY2Jsb2NrIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMSAweCAweDAxIDB4MDY4MTAxIFRNUExfVkVSSUZJQ0FUSU9OX0tFWSBUTVBMX1JPT1RfT0ZfVU5JVFkKICAgIC8vIGNvbnRyYWN0cy92ZXJpZmllci5hbGdvLnRzOjEzNAogICAgLy8gZXhwb3J0IGNsYXNzIExhZ3JhbmdlV2l0bmVzc0NhbGN1bGF0b3IgZXh0ZW5kcyBDb250cmFjdCB7CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9hZnRlcl9pZl9lbHNlQDcKICAgIHB1c2hieXRlcyAweDg3Mzk2ODI0IC8vIG1ldGhvZCAiY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzKHVpbnQyNTZbXSwoYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sdWludDI1Nix1aW50MjU2LHVpbnQyNTYsdWludDI1Nix1aW50MjU2LHVpbnQyNTYpKSh1aW50MjU2W10sdWludDI1Nix1aW50MjU2KSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzX3JvdXRlQDMKCm1haW5fYWZ0ZXJfaWZfZWxzZUA3OgogICAgZXJyCgptYWluX2NhbGN1bGF0ZUxhZ3JhbmdlV2l0bmVzc19yb3V0ZUAzOgogICAgLy8gY29udHJhY3RzL3ZlcmlmaWVyLmFsZ28udHM6MTM1CiAgICAvLyBAYWJpbWV0aG9kKHsgb25DcmVhdGU6ICJyZXF1aXJlIiwgYWxsb3dBY3Rpb25zOiAiRGVsZXRlQXBwbGljYXRpb24iIH0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBwdXNoaW50IDUgLy8gRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBEZWxldGVBcHBsaWNhdGlvbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIC8vIGNvbnRyYWN0cy92ZXJpZmllci5hbGdvLnRzOjEzNAogICAgLy8gZXhwb3J0IGNsYXNzIExhZ3JhbmdlV2l0bmVzc0NhbGN1bGF0b3IgZXh0ZW5kcyBDb250cmFjdCB7CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czoxMzUKICAgIC8vIEBhYmltZXRob2QoeyBvbkNyZWF0ZTogInJlcXVpcmUiLCBhbGxvd0FjdGlvbnM6ICJEZWxldGVBcHBsaWNhdGlvbiIgfSkKICAgIGNhbGxzdWIgY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMiAvLyAxCiAgICByZXR1cm4KCgovLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo6ZnJTdWIoYTogYnl0ZXMsIGI6IGJ5dGVzKSAtPiBieXRlczoKZnJTdWI6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxMzMKICAgIC8vIGZ1bmN0aW9uIGZyU3ViKGE6IGJpZ3VpbnQsIGI6IGJpZ3VpbnQpOiBiaWd1aW50IHsKICAgIHByb3RvIDIgMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTM1CiAgICAvLyBjb25zdCBhTjogYmlndWludCA9IGEgJSByOwogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjEzNgogICAgLy8gY29uc3QgYk46IGJpZ3VpbnQgPSBiICUgcjsKICAgIGZyYW1lX2RpZyAtMQogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxMzcKICAgIC8vIHJldHVybiAoYU4gKyByIC0gYk4pICUgcjsKICAgIHN3YXAKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiKwogICAgc3dhcAogICAgYi0KICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgcmV0c3ViCgoKLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OmdldENoYWxsZW5nZSh0ZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRDaGFsbGVuZ2U6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1MTcKICAgIC8vIGV4cG9ydCBmdW5jdGlvbiBnZXRDaGFsbGVuZ2UodGQ6IGJ5dGVzKTogVWludDI1NiB7CiAgICBwcm90byAxIDEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjUxOAogICAgLy8gbGV0IGhhc2ggPSBvcC5rZWNjYWsyNTYodGQpOwogICAgZnJhbWVfZGlnIC0xCiAgICBrZWNjYWsyNTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE1OAogICAgLy8gcmV0dXJuIGEgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjUxOQogICAgLy8gcmV0dXJuIG5ldyBVaW50MjU2KGZyU2NhbGFyKEJpZ1VpbnQoaGFzaCkpKTsKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGludGNfMCAvLyAzMgogICAgYnplcm8KICAgIGJ8CiAgICByZXRzdWIKCgovLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czo6TGFncmFuZ2VXaXRuZXNzQ2FsY3VsYXRvci5jYWxjdWxhdGVMYWdyYW5nZVdpdG5lc3Moc2lnbmFsczogYnl0ZXMsIHByb29mOiBieXRlcykgLT4gYnl0ZXM6CmNhbGN1bGF0ZUxhZ3JhbmdlV2l0bmVzczoKICAgIC8vIGNvbnRyYWN0cy92ZXJpZmllci5hbGdvLnRzOjEzNS0xMzkKICAgIC8vIEBhYmltZXRob2QoeyBvbkNyZWF0ZTogInJlcXVpcmUiLCBhbGxvd0FjdGlvbnM6ICJEZWxldGVBcHBsaWNhdGlvbiIgfSkKICAgIC8vIHB1YmxpYyBjYWxjdWxhdGVMYWdyYW5nZVdpdG5lc3MoCiAgICAvLyAgIHNpZ25hbHM6IFB1YmxpY1NpZ25hbHMsCiAgICAvLyAgIHByb29mOiBQcm9vZiwKICAgIC8vICk6IExhZ3JhbmdlV2l0bmVzcyB7CiAgICBwcm90byAyIDEKICAgIGludGNfMyAvLyAwCiAgICBkdXBuIDE1CiAgICBieXRlY18xIC8vICIiCiAgICBkdXBuIDYKCmNhbGN1bGF0ZUxhZ3JhbmdlV2l0bmVzc193aGlsZV90b3BAMjoKICAgIHB1c2hpbnQgMTc1MDEwIC8vIDE3NTAxMAogICAgZ2xvYmFsIE9wY29kZUJ1ZGdldAogICAgPgogICAgYnogY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzX2FmdGVyX3doaWxlQDcKICAgIGl0eG5fYmVnaW4KICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBwdXNoaW50IDUgLy8gRGVsZXRlQXBwbGljYXRpb24KICAgIGl0eG5fZmllbGQgT25Db21wbGV0aW9uCiAgICBieXRlY18zIC8vIDB4MDY4MTAxCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbQogICAgYnl0ZWNfMyAvLyAweDA2ODEwMQogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbQogICAgaW50Y18zIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgYiBjYWxjdWxhdGVMYWdyYW5nZVdpdG5lc3Nfd2hpbGVfdG9wQDIKCmNhbGN1bGF0ZUxhZ3JhbmdlV2l0bmVzc19hZnRlcl93aGlsZUA3OgogICAgLy8gY29udHJhY3RzL3ZlcmlmaWVyLmFsZ28udHM6MTQzCiAgICAvLyBjb25zdCB2ayA9IGRlY29kZVZrKHZrQnl0ZXMpOwogICAgYnl0ZWMgNCAvLyBUTVBMX1ZFUklGSUNBVElPTl9LRVkKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMwMQogICAgLy8gUW06IHZrQnl0ZXMuc2xpY2UoMCwgOTYpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAwCiAgICBkaWcgMQogICAgPj0KICAgIGludGNfMyAvLyAwCiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGludGNfMSAvLyA5NgogICAgZGlnIDIKICAgID49CiAgICBpbnRjXzEgLy8gOTYKICAgIGRpZyAzCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDMKICAgIHVuY292ZXIgMgogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMwMgogICAgLy8gUWw6IHZrQnl0ZXMuc2xpY2UoOTYsIDE5MikudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICBpbnRjIDUgLy8gMTkyCiAgICBkaWcgMwogICAgPj0KICAgIGludGMgNSAvLyAxOTIKICAgIGRpZyA0CiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDQKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMwMwogICAgLy8gUXI6IHZrQnl0ZXMuc2xpY2UoMTkyLCAyODgpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgaW50YyA2IC8vIDI4OAogICAgZGlnIDQKICAgID49CiAgICBpbnRjIDYgLy8gMjg4CiAgICBkaWcgNQogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyA1CiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDk2CiAgICA9PQogICAgYXNzZXJ0IC8vIExlbmd0aCBtdXN0IGJlIDk2CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozMDQKICAgIC8vIFFvOiB2a0J5dGVzLnNsaWNlKDI4OCwgMzg0KS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIGludGMgNCAvLyAzODQKICAgIGRpZyA1CiAgICA+PQogICAgaW50YyA0IC8vIDM4NAogICAgZGlnIDYKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgNgogICAgdW5jb3ZlciAzCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzA1CiAgICAvLyBRYzogdmtCeXRlcy5zbGljZSgzODQsIDQ4MCkudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICBpbnRjIDcgLy8gNDgwCiAgICBkaWcgNgogICAgPj0KICAgIGludGMgNyAvLyA0ODAKICAgIGRpZyA3CiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDcKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMwNgogICAgLy8gUzE6IHZrQnl0ZXMuc2xpY2UoNDgwLCA1NzYpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgaW50YyA4IC8vIDU3NgogICAgZGlnIDcKICAgID49CiAgICBpbnRjIDggLy8gNTc2CiAgICBkaWcgOAogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyA4CiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDk2CiAgICA9PQogICAgYXNzZXJ0IC8vIExlbmd0aCBtdXN0IGJlIDk2CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozMDcKICAgIC8vIFMyOiB2a0J5dGVzLnNsaWNlKDU3NiwgNjcyKS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIGludGMgOSAvLyA2NzIKICAgIGRpZyA4CiAgICA+PQogICAgaW50YyA5IC8vIDY3MgogICAgZGlnIDkKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgOQogICAgdW5jb3ZlciAzCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzA4CiAgICAvLyBTMzogdmtCeXRlcy5zbGljZSg2NzIsIDc2OCkudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICBpbnRjIDEwIC8vIDc2OAogICAgZGlnIDkKICAgID49CiAgICBpbnRjIDEwIC8vIDc2OAogICAgZGlnIDEwCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDEwCiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDk2CiAgICA9PQogICAgYXNzZXJ0IC8vIExlbmd0aCBtdXN0IGJlIDk2CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozMDkKICAgIC8vIHBvd2VyOiBvcC5idG9pKHZrQnl0ZXMuc2xpY2UoNzY4LCA3NzYpKSwKICAgIGludGMgMTEgLy8gNzc2CiAgICBkaWcgMTAKICAgID49CiAgICBpbnRjIDExIC8vIDc3NgogICAgZGlnIDExCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDExCiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBidG9pCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozMTAKICAgIC8vIG5QdWJsaWM6IG9wLmJ0b2kodmtCeXRlcy5zbGljZSg3NzYsIDc4NCkpLAogICAgcHVzaGludCA3ODQgLy8gNzg0CiAgICBkaWcgMTEKICAgID49CiAgICBwdXNoaW50IDc4NCAvLyA3ODQKICAgIGRpZyAxMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyAxMgogICAgdW5jb3ZlciAzCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgYnRvaQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzExCiAgICAvLyBrMTogb3AuYnRvaSh2a0J5dGVzLnNsaWNlKDc4NCwgNzkyKSksCiAgICBwdXNoaW50IDc5MiAvLyA3OTIKICAgIGRpZyAxMgogICAgPj0KICAgIHB1c2hpbnQgNzkyIC8vIDc5MgogICAgZGlnIDEzCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDEzCiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBidG9pCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozMTIKICAgIC8vIGsyOiBvcC5idG9pKHZrQnl0ZXMuc2xpY2UoNzkyLCA4MDApKSwKICAgIHB1c2hpbnQgODAwIC8vIDgwMAogICAgZGlnIDEzCiAgICA+PQogICAgcHVzaGludCA4MDAgLy8gODAwCiAgICBkaWcgMTQKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgMTQKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGJ0b2kKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMxMwogICAgLy8gWF8yOiB2a0J5dGVzLnNsaWNlKDgwMCwgOTkyKS50b0ZpeGVkKHsgbGVuZ3RoOiAxOTIgfSksCiAgICBpbnRjIDEyIC8vIDk5MgogICAgZGlnIDE0CiAgICA+PQogICAgaW50YyAxMiAvLyA5OTIKICAgIHVuY292ZXIgMTUKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICB1bmNvdmVyIDE0CiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBsZW4KICAgIGludGMgNSAvLyAxOTIKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgMTkyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozMDAtMzE0CiAgICAvLyByZXR1cm4gewogICAgLy8gICBRbTogdmtCeXRlcy5zbGljZSgwLCA5NikudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICAvLyAgIFFsOiB2a0J5dGVzLnNsaWNlKDk2LCAxOTIpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgLy8gICBRcjogdmtCeXRlcy5zbGljZSgxOTIsIDI4OCkudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICAvLyAgIFFvOiB2a0J5dGVzLnNsaWNlKDI4OCwgMzg0KS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIC8vICAgUWM6IHZrQnl0ZXMuc2xpY2UoMzg0LCA0ODApLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgLy8gICBTMTogdmtCeXRlcy5zbGljZSg0ODAsIDU3NikudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICAvLyAgIFMyOiB2a0J5dGVzLnNsaWNlKDU3NiwgNjcyKS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIC8vICAgUzM6IHZrQnl0ZXMuc2xpY2UoNjcyLCA3NjgpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgLy8gICBwb3dlcjogb3AuYnRvaSh2a0J5dGVzLnNsaWNlKDc2OCwgNzc2KSksCiAgICAvLyAgIG5QdWJsaWM6IG9wLmJ0b2kodmtCeXRlcy5zbGljZSg3NzYsIDc4NCkpLAogICAgLy8gICBrMTogb3AuYnRvaSh2a0J5dGVzLnNsaWNlKDc4NCwgNzkyKSksCiAgICAvLyAgIGsyOiBvcC5idG9pKHZrQnl0ZXMuc2xpY2UoNzkyLCA4MDApKSwKICAgIC8vICAgWF8yOiB2a0J5dGVzLnNsaWNlKDgwMCwgOTkyKS50b0ZpeGVkKHsgbGVuZ3RoOiAxOTIgfSksCiAgICAvLyB9OwogICAgdW5jb3ZlciAxMgogICAgdW5jb3ZlciAxMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDExCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTAKICAgIGNvbmNhdAogICAgdW5jb3ZlciA5CiAgICBjb25jYXQKICAgIHVuY292ZXIgOAogICAgY29uY2F0CiAgICB1bmNvdmVyIDcKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxMgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTM0CiAgICAvLyBsZXQgdGQgPSBvcC5jb25jYXQodmsuUW0sIHZrLlFsKTsKICAgIGR1cAogICAgZXh0cmFjdCAwIDk2CiAgICBkaWcgMQogICAgZXh0cmFjdCA5NiA5NgogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1MzUKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCB2ay5Rcik7CiAgICBkaWcgMQogICAgZXh0cmFjdCAxOTIgOTYKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTM2CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgdmsuUW8pOwogICAgZGlnIDEKICAgIGludGMgNiAvLyAyODgKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTM3CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgdmsuUWMpOwogICAgZGlnIDEKICAgIGludGMgNCAvLyAzODQKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTM4CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgdmsuUzEpOwogICAgZGlnIDEKICAgIGludGMgNyAvLyA0ODAKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTM5CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgdmsuUzIpOwogICAgZGlnIDEKICAgIGludGMgOCAvLyA1NzYKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTQwCiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgdmsuUzMpOwogICAgc3dhcAogICAgaW50YyA5IC8vIDY3MgogICAgaW50Y18xIC8vIDk2CiAgICBleHRyYWN0MwogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDEwCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1NDIKICAgIC8vIGZvciAoY29uc3Qgc2lnbmFsIG9mIHNpZ25hbHMpIHsKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18zIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9idXJ5IDE2CiAgICBpbnRjXzMgLy8gMAogICAgZnJhbWVfYnVyeSAxOQoKY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzX2Zvcl9oZWFkZXJAMTI6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1NDIKICAgIC8vIGZvciAoY29uc3Qgc2lnbmFsIG9mIHNpZ25hbHMpIHsKICAgIGZyYW1lX2RpZyAxOQogICAgZnJhbWVfZGlnIDE2CiAgICA8CiAgICBieiBjYWxjdWxhdGVMYWdyYW5nZVdpdG5lc3NfYWZ0ZXJfZm9yQDE0CiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMTkKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18wIC8vIDMyCiAgICAqCiAgICBpbnRjXzAgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTU4CiAgICAvLyByZXR1cm4gYSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTY2CiAgICAvLyByZXR1cm4gbmV3IFVpbnQyNTYoYSkuYnl0ZXMudG9GaXhlZCh7IGxlbmd0aDogMzIgfSk7CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBpbnRjXzAgLy8gMzIKICAgIGJ6ZXJvCiAgICBifAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSAzMgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTQzCiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgYjMyKGZyU2NhbGFyKHNpZ25hbC5uYXRpdmUpKSk7CiAgICBmcmFtZV9kaWcgMTAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAxMAogICAgaW50Y18yIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMTkKICAgIGIgY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzX2Zvcl9oZWFkZXJAMTIKCmNhbGN1bGF0ZUxhZ3JhbmdlV2l0bmVzc19hZnRlcl9mb3JAMTQ6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1NDcKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5BKTsKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAwIDk2CiAgICBmcmFtZV9kaWcgMTAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTQ4CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuQik7CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgOTYgOTYKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTQ5CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuQyk7CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMTkyIDk2CiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU1MQogICAgLy8gY29uc3QgYmV0YSA9IGdldENoYWxsZW5nZSh0ZCk7CiAgICBjYWxsc3ViIGdldENoYWxsZW5nZQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTU2CiAgICAvLyBjb25zdCBnYW1tYSA9IGdldENoYWxsZW5nZSh0ZCk7CiAgICBkdXAKICAgIGNhbGxzdWIgZ2V0Q2hhbGxlbmdlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1NjMKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBnYW1tYS5ieXRlcyk7CiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxMAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTY0CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuWik7CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGMgNiAvLyAyODgKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTY1CiAgICAvLyBjb25zdCBhbHBoYSA9IGdldENoYWxsZW5nZSh0ZCk7CiAgICBjYWxsc3ViIGdldENoYWxsZW5nZQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU3MgogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHByb29mLlQxKTsKICAgIGZyYW1lX2RpZyAtMQogICAgaW50YyA0IC8vIDM4NAogICAgaW50Y18xIC8vIDk2CiAgICBleHRyYWN0MwogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1NzMKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5UMik7CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGMgNyAvLyA0ODAKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTc0CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuVDMpOwogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjIDggLy8gNTc2CiAgICBpbnRjXzEgLy8gOTYKICAgIGV4dHJhY3QzCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU3NQogICAgLy8gY29uc3QgeGkgPSBnZXRDaGFsbGVuZ2UodGQpOwogICAgY2FsbHN1YiBnZXRDaGFsbGVuZ2UKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxNAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTgyCiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuZXZhbF9hLmJ5dGVzKTsKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA4NjQgLy8gODY0CiAgICBpbnRjXzAgLy8gMzIKICAgIGV4dHJhY3QzCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU4MwogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHByb29mLmV2YWxfYi5ieXRlcyk7CiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgODk2IC8vIDg5NgogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MwogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1ODQKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5ldmFsX2MuYnl0ZXMpOwogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDkyOCAvLyA5MjgKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTg1CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuZXZhbF9zMS5ieXRlcyk7CiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgOTYwIC8vIDk2MAogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MwogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1ODYKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5ldmFsX3MyLmJ5dGVzKTsKICAgIGZyYW1lX2RpZyAtMQogICAgaW50YyAxMiAvLyA5OTIKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTg3CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuZXZhbF96dy5ieXRlcyk7CiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMTAyNCAvLyAxMDI0CiAgICBpbnRjXzAgLy8gMzIKICAgIGV4dHJhY3QzCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU4OQogICAgLy8gY29uc3QgdiA9IG5ldyBGaXhlZEFycmF5PFVpbnQyNTYsIDY+KCk7CiAgICBpbnRjIDUgLy8gMTkyCiAgICBiemVybwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTkwCiAgICAvLyB2WzFdID0gZ2V0Q2hhbGxlbmdlKHRkKTsgLy8gdjEKICAgIHN3YXAKICAgIGNhbGxzdWIgZ2V0Q2hhbGxlbmdlCiAgICByZXBsYWNlMiAzMiAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2J1cnkgMTEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU5MQogICAgLy8gZm9yIChsZXQgaTogdWludDY0ID0gMjsgaSA8IDY7IGkrKykgewogICAgcHVzaGludCAyIC8vIDIKICAgIGZyYW1lX2J1cnkgMTgKCmNhbGN1bGF0ZUxhZ3JhbmdlV2l0bmVzc193aGlsZV90b3BAMTU6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1OTEKICAgIC8vIGZvciAobGV0IGk6IHVpbnQ2NCA9IDI7IGkgPCA2OyBpKyspIHsKICAgIGZyYW1lX2RpZyAxOAogICAgcHVzaGludCA2IC8vIDYKICAgIDwKICAgIGJ6IGNhbGN1bGF0ZUxhZ3JhbmdlV2l0bmVzc19hZnRlcl93aGlsZUAxNwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTkyCiAgICAvLyB2W2ldID0gbmV3IFVpbnQyNTYoZnJNdWwoKHZbaSAtIDFdIGFzIFVpbnQyNTYpLm5hdGl2ZSwgdlsxXS5uYXRpdmUpKTsgLy8gdltpXSA9IHYxXmkKICAgIGZyYW1lX2RpZyAxOAogICAgZHVwCiAgICBpbnRjXzIgLy8gMQogICAgLQogICAgaW50Y18wIC8vIDMyCiAgICAqCiAgICBmcmFtZV9kaWcgMTEKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBpbnRjXzAgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDEKICAgIGV4dHJhY3QgMzIgMzIgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1OTIKICAgIC8vIHZbaV0gPSBuZXcgVWludDI1Nihmck11bCgodltpIC0gMV0gYXMgVWludDI1NikubmF0aXZlLCB2WzFdLm5hdGl2ZSkpOyAvLyB2W2ldID0gdjFeaQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgaW50Y18wIC8vIDMyCiAgICBiemVybwogICAgYnwKICAgIGRpZyAyCiAgICBpbnRjXzAgLy8gMzIKICAgICoKICAgIHN3YXAKICAgIHJlcGxhY2UzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfYnVyeSAxMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTkxCiAgICAvLyBmb3IgKGxldCBpOiB1aW50NjQgPSAyOyBpIDwgNjsgaSsrKSB7CiAgICBpbnRjXzIgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxOAogICAgYiBjYWxjdWxhdGVMYWdyYW5nZVdpdG5lc3Nfd2hpbGVfdG9wQDE1CgpjYWxjdWxhdGVMYWdyYW5nZVdpdG5lc3NfYWZ0ZXJfd2hpbGVAMTc6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1OTkKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5XeGkpOwogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjIDkgLy8gNjcyCiAgICBpbnRjXzEgLy8gOTYKICAgIGV4dHJhY3QzCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2MDAKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5XeGl3KTsKICAgIGZyYW1lX2RpZyAtMQogICAgaW50YyAxMCAvLyA3NjgKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjAxCiAgICAvLyBjb25zdCB1ID0gZ2V0Q2hhbGxlbmdlKHRkKTsKICAgIGNhbGxzdWIgZ2V0Q2hhbGxlbmdlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2MDMtNjEyCiAgICAvLyByZXR1cm4gewogICAgLy8gICBiZXRhLAogICAgLy8gICBnYW1tYSwKICAgIC8vICAgYWxwaGEsCiAgICAvLyAgIHhpLAogICAgLy8gICB2LAogICAgLy8gICB1LAogICAgLy8gICB4aW46IG5ldyBVaW50MjU2KCksCiAgICAvLyAgIHpoOiBuZXcgVWludDI1NigpLAogICAgLy8gfTsKICAgIGZyYW1lX2RpZyAxMAogICAgZnJhbWVfZGlnIDMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDE0CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAxMQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2MjMKICAgIC8vIGxldCB4aW4gPSBjaGFsbGVuZ2VzLnhpLm5hdGl2ZTsKICAgIGV4dHJhY3QgOTYgMzIKICAgIGZyYW1lX2J1cnkgMTUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjYyNgogICAgLy8gbGV0IGRvbWFpblNpemU6IHVpbnQ2NCA9IDE7CiAgICBpbnRjXzIgLy8gMQogICAgZnJhbWVfYnVyeSAxNwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjI3CiAgICAvLyBmb3IgKGxldCBpOiB1aW50NjQgPSAwOyBpIDwgdmsucG93ZXI7IGkrKykgewogICAgaW50Y18zIC8vIDAKICAgIGZyYW1lX2J1cnkgMTgKCmNhbGN1bGF0ZUxhZ3JhbmdlV2l0bmVzc193aGlsZV90b3BAMjA6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2MjcKICAgIC8vIGZvciAobGV0IGk6IHVpbnQ2NCA9IDA7IGkgPCB2ay5wb3dlcjsgaSsrKSB7CiAgICBmcmFtZV9kaWcgMTIKICAgIGludGMgMTAgLy8gNzY4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIDE4CiAgICA+CiAgICBieiBjYWxjdWxhdGVMYWdyYW5nZVdpdG5lc3NfYWZ0ZXJfd2hpbGVAMjIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGZyYW1lX2RpZyAxNQogICAgZHVwCiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICBmcmFtZV9idXJ5IDE1CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2MjkKICAgIC8vIGRvbWFpblNpemUgKj0gMjsKICAgIGZyYW1lX2RpZyAxNwogICAgcHVzaGludCAyIC8vIDIKICAgICoKICAgIGZyYW1lX2J1cnkgMTcKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjYyNwogICAgLy8gZm9yIChsZXQgaTogdWludDY0ID0gMDsgaSA8IHZrLnBvd2VyOyBpKyspIHsKICAgIGZyYW1lX2RpZyAxOAogICAgaW50Y18yIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMTgKICAgIGIgY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzX3doaWxlX3RvcEAyMAoKY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzX2FmdGVyX3doaWxlQDIyOgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjMyCiAgICAvLyBjaGFsbGVuZ2VzLnhpbiA9IG5ldyBVaW50MjU2KHhpbik7CiAgICBmcmFtZV9kaWcgMTUKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGludGNfMCAvLyAzMgogICAgYnplcm8KICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICBkdXAyCiAgICBifAogICAgZnJhbWVfZGlnIDUKICAgIHB1c2hpbnQgMzUyIC8vIDM1MgogICAgdW5jb3ZlciAyCiAgICByZXBsYWNlMwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjMzCiAgICAvLyBjaGFsbGVuZ2VzLnpoID0gbmV3IFVpbnQyNTYoZnJTdWIoeGluLCBCaWdVaW50KDEpKSk7IC8vIFZhbmlzaGluZyBwb2x5bm9taWFsIFpfSCjOvikgPSDOvl5uIC0gMQogICAgdW5jb3ZlciAyCiAgICBieXRlY18yIC8vIDB4MDEKICAgIGNhbGxzdWIgZnJTdWIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIHVuY292ZXIgMgogICAgYnwKICAgIGludGMgNCAvLyAzODQKICAgIHN3YXAKICAgIHJlcGxhY2UzCiAgICBmcmFtZV9idXJ5IDUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjYzNQogICAgLy8gY29uc3QgbiA9IGZyU2NhbGFyKEJpZ1VpbnQoZG9tYWluU2l6ZSkpOwogICAgZnJhbWVfZGlnIDE3CiAgICBpdG9iCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNTgKICAgIC8vIHJldHVybiBhICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICBmcmFtZV9idXJ5IDcKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0MQogICAgLy8gbGV0IHcgPSBCaWdVaW50KDEpOwogICAgYnl0ZWNfMiAvLyAweDAxCiAgICBmcmFtZV9idXJ5IDEzCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NTAKICAgIC8vIGNvbnN0IEw6IFVpbnQyNTZbXSA9IFtuZXcgVWludDI1NigpXTsKICAgIHB1c2hieXRlcyAweDAwMDEwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY1MwogICAgLy8gY29uc3QgaXRlcmF0aW9uczogdWludDY0ID0gdmsublB1YmxpYyA9PT0gMCA/IDEgOiB2ay5uUHVibGljOwogICAgZnJhbWVfZGlnIDEyCiAgICBpbnRjIDExIC8vIDc3NgogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyMgogICAgYm56IGNhbGN1bGF0ZUxhZ3JhbmdlV2l0bmVzc190ZXJuYXJ5X2ZhbHNlQDI0CiAgICBpbnRjXzIgLy8gMQogICAgZnJhbWVfYnVyeSAyMAoKY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzX3Rlcm5hcnlfbWVyZ2VAMjU6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NTQKICAgIC8vIGZvciAobGV0IGk6IHVpbnQ2NCA9IDE7IGkgPD0gaXRlcmF0aW9uczsgaSsrKSB7CiAgICBpbnRjXzIgLy8gMQogICAgZnJhbWVfYnVyeSAyMQoKY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzX3doaWxlX3RvcEAyNjoKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY1NAogICAgLy8gZm9yIChsZXQgaTogdWludDY0ID0gMTsgaSA8PSBpdGVyYXRpb25zOyBpKyspIHsKICAgIGZyYW1lX2RpZyAyMQogICAgZnJhbWVfZGlnIDIwCiAgICA8PQogICAgYnogY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzX2FmdGVyX3doaWxlQDMzCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NTgKICAgIC8vIGZyTXVsKHcsIGNoYWxsZW5nZXMuemgubmF0aXZlKSwKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGludGMgNCAvLyAzODQKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGZyYW1lX2RpZyAxMwogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY1OQogICAgLy8gZnJNdWwobiwgZnJTdWIoY2hhbGxlbmdlcy54aS5uYXRpdmUsIHcpKSwKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdCA5NiAzMgogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIGZyU3ViCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBmcmFtZV9kaWcgNwogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTU4CiAgICAvLyByZXR1cm4gYSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIHN3YXAKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgZnJhbWVfYnVyeSAxCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjExMQogICAgLy8gYXNzZXJ0KHggIT09ICgwbiBhcyBiaWd1aW50KSwgIkZyIGludmVyc2Ugb2YgemVybyIpOwogICAgZHVwCiAgICBieXRlY18xIC8vIDB4CiAgICBiIT0KICAgIGFzc2VydCAvLyBGciBpbnZlcnNlIG9mIHplcm8KICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjExMgogICAgLy8gY29uc3QgaW52ID0gbW9kUG93KHgsIEJMUzEyXzM4MV9SX01JTlVTXzIsIHIpOwogICAgcHVzaGJ5dGVzIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmVmZmZmZmZmZgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OTAKICAgIC8vIGxldCByZXN1bHQgPSAxbiBhcyBiaWd1aW50OwogICAgYnl0ZWNfMiAvLyAweDAxCiAgICBmcmFtZV9idXJ5IDgKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjkxCiAgICAvLyBsZXQgYjogYmlndWludCA9IGJhc2UgJSBtb2Q7CiAgICBzd2FwCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxMTIKICAgIC8vIGNvbnN0IGludiA9IG1vZFBvdyh4LCBCTFMxMl8zODFfUl9NSU5VU18yLCByKTsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo5MQogICAgLy8gbGV0IGI6IGJpZ3VpbnQgPSBiYXNlICUgbW9kOwogICAgYiUKICAgIGZyYW1lX2J1cnkgNAogICAgZnJhbWVfYnVyeSA2CgpjYWxjdWxhdGVMYWdyYW5nZVdpdG5lc3Nfd2hpbGVfdG9wQDI4OgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OTMKICAgIC8vIHdoaWxlIChlID4gKDBuIGFzIGJpZ3VpbnQpKSB7CiAgICBmcmFtZV9kaWcgNgogICAgYnl0ZWNfMSAvLyAweAogICAgYj4KICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjkzLTk5CiAgICAvLyB3aGlsZSAoZSA+ICgwbiBhcyBiaWd1aW50KSkgewogICAgLy8gICBpZiAoKGUgJiAoMW4gYXMgYmlndWludCkpICE9PSAoMG4gYXMgYmlndWludCkpIHsKICAgIC8vICAgICByZXN1bHQgPSAocmVzdWx0ICogYikgJSBtb2Q7CiAgICAvLyAgIH0KICAgIC8vICAgYiA9IChiICogYikgJSBtb2Q7CiAgICAvLyAgIGUgPSBlIC8gQmlnVWludCgyKTsKICAgIC8vIH0KICAgIGJ6IGNhbGN1bGF0ZUxhZ3JhbmdlV2l0bmVzc19hZnRlcl93aGlsZUAzMgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OTQKICAgIC8vIGlmICgoZSAmICgxbiBhcyBiaWd1aW50KSkgIT09ICgwbiBhcyBiaWd1aW50KSkgewogICAgZnJhbWVfZGlnIDYKICAgIGJ5dGVjXzIgLy8gMHgwMQogICAgYiYKICAgIGJ5dGVjXzEgLy8gMHgKICAgIGIhPQogICAgZnJhbWVfZGlnIDgKICAgIGZyYW1lX2J1cnkgOQogICAgYnogY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzX2FmdGVyX2lmX2Vsc2VAMzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjk1CiAgICAvLyByZXN1bHQgPSAocmVzdWx0ICogYikgJSBtb2Q7CiAgICBmcmFtZV9kaWcgOAogICAgZnJhbWVfZGlnIDQKICAgIGIqCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxMTIKICAgIC8vIGNvbnN0IGludiA9IG1vZFBvdyh4LCBCTFMxMl8zODFfUl9NSU5VU18yLCByKTsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo5NQogICAgLy8gcmVzdWx0ID0gKHJlc3VsdCAqIGIpICUgbW9kOwogICAgYiUKICAgIGZyYW1lX2J1cnkgOQoKY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzX2FmdGVyX2lmX2Vsc2VAMzE6CiAgICBmcmFtZV9kaWcgOQogICAgZnJhbWVfYnVyeSA4CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo5NwogICAgLy8gYiA9IChiICogYikgJSBtb2Q7CiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBiKgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTEyCiAgICAvLyBjb25zdCBpbnYgPSBtb2RQb3coeCwgQkxTMTJfMzgxX1JfTUlOVVNfMiwgcik7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OTcKICAgIC8vIGIgPSAoYiAqIGIpICUgbW9kOwogICAgYiUKICAgIGZyYW1lX2J1cnkgNAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OTgKICAgIC8vIGUgPSBlIC8gQmlnVWludCgyKTsKICAgIGZyYW1lX2RpZyA2CiAgICBwdXNoYnl0ZXMgMHgwMgogICAgYi8KICAgIGZyYW1lX2J1cnkgNgogICAgYiBjYWxjdWxhdGVMYWdyYW5nZVdpdG5lc3Nfd2hpbGVfdG9wQDI4CgpjYWxjdWxhdGVMYWdyYW5nZVdpdG5lc3NfYWZ0ZXJfd2hpbGVAMzI6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxMjUKICAgIC8vIHJldHVybiAoYU4gKiBiSW52KSAlIHI7CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDgKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY1Ni02NjEKICAgIC8vIG5ldyBVaW50MjU2KAogICAgLy8gICBmckRpdigKICAgIC8vICAgICBmck11bCh3LCBjaGFsbGVuZ2VzLnpoLm5hdGl2ZSksCiAgICAvLyAgICAgZnJNdWwobiwgZnJTdWIoY2hhbGxlbmdlcy54aS5uYXRpdmUsIHcpKSwKICAgIC8vICAgKSwKICAgIC8vICksCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBmcmFtZV9kaWcgMgogICAgYnwKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY1NS02NjIKICAgIC8vIEwucHVzaCgKICAgIC8vICAgbmV3IFVpbnQyNTYoCiAgICAvLyAgICAgZnJEaXYoCiAgICAvLyAgICAgICBmck11bCh3LCBjaGFsbGVuZ2VzLnpoLm5hdGl2ZSksCiAgICAvLyAgICAgICBmck11bChuLCBmclN1YihjaGFsbGVuZ2VzLnhpLm5hdGl2ZSwgdykpLAogICAgLy8gICAgICksCiAgICAvLyAgICksCiAgICAvLyApOwogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQgLy8gb24gZXJyb3I6IG1heCBhcnJheSBsZW5ndGggZXhjZWVkZWQKICAgIHN3YXAKICAgIGludGNfMyAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18yIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICByZXBsYWNlMiAwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGZyYW1lX2RpZyAxMwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjYzCiAgICAvLyB3ID0gZnJNdWwodywgUk9PVF9PRl9VTklUWSk7IC8vIE5leHQgcm9vdCBvZiB1bml0eSBzdGVwICjPiV5pKQogICAgYnl0ZWMgNSAvLyBUTVBMX1JPT1RfT0ZfVU5JVFkKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIGZyYW1lX2J1cnkgMTMKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY1NAogICAgLy8gZm9yIChsZXQgaTogdWludDY0ID0gMTsgaSA8PSBpdGVyYXRpb25zOyBpKyspIHsKICAgIGZyYW1lX2RpZyAyMQogICAgaW50Y18yIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMjEKICAgIGIgY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzX3doaWxlX3RvcEAyNgoKY2FsY3VsYXRlTGFncmFuZ2VXaXRuZXNzX2FmdGVyX3doaWxlQDMzOgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjY1CiAgICAvLyByZXR1cm4geyBMLCBjaGFsbGVuZ2VzIH07CiAgICBwdXNoYnl0ZXMgMHgwMWEyCiAgICBmcmFtZV9kaWcgNQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMAogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czoxNTAKICAgIC8vIEw6IGNhbGMuTCwKICAgIGR1cAogICAgaW50Y18zIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgbGVuCiAgICBkaWcgMgogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgLy8gY29udHJhY3RzL3ZlcmlmaWVyLmFsZ28udHM6MTUxCiAgICAvLyB4aW46IGNhbGMuY2hhbGxlbmdlcy54aW4sCiAgICBzd2FwCiAgICBwdXNoaW50cyAyIDQxNiAvLyAyLCA0MTYKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIHB1c2hpbnQgMzUyIC8vIDM1MgogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MwogICAgLy8gY29udHJhY3RzL3ZlcmlmaWVyLmFsZ28udHM6MTUxLTE1MgogICAgLy8geGluOiBjYWxjLmNoYWxsZW5nZXMueGluLAogICAgLy8gemg6IGNhbGMuY2hhbGxlbmdlcy56aCwKICAgIHN3YXAKICAgIGludGMgNCAvLyAzODQKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMKICAgIC8vIGNvbnRyYWN0cy92ZXJpZmllci5hbGdvLnRzOjE0OS0xNTMKICAgIC8vIHJldHVybiB7CiAgICAvLyAgIEw6IGNhbGMuTCwKICAgIC8vICAgeGluOiBjYWxjLmNoYWxsZW5nZXMueGluLAogICAgLy8gICB6aDogY2FsYy5jaGFsbGVuZ2VzLnpoLAogICAgLy8gfTsKICAgIHB1c2hieXRlcyAweDAwNDIKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmNhbGN1bGF0ZUxhZ3JhbmdlV2l0bmVzc190ZXJuYXJ5X2ZhbHNlQDI0OgogICAgZnJhbWVfZGlnIDIyCiAgICBmcmFtZV9idXJ5IDIwCiAgICBiIGNhbGN1bGF0ZUxhZ3JhbmdlV2l0bmVzc190ZXJuYXJ5X21lcmdlQDI1Cg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBAYWxnb3JhbmRmb3VuZGF0aW9uL2FsZ29yYW5kLXR5cGVzY3JpcHQvYmFzZS1jb250cmFjdC5kLnRzOjpCYXNlQ29udHJhY3QuY2xlYXJTdGF0ZVByb2dyYW0oKSAtPiB1aW50NjQ6Cm1haW46CiAgICBwdXNoaW50IDEgLy8gMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [1083], "errorMessage": "Fr inverse of zero"}, {"pc": [440], "errorMessage": "Length must be 192"}, {"pc": [582], "errorMessage": "Length must be 32"}, {"pc": [161, 185, 209, 233, 257, 281, 305, 329], "errorMessage": "Length must be 96"}, {"pc": [24], "errorMessage": "OnCompletion is not DeleteApplication"}, {"pc": [28], "errorMessage": "can only call when creating"}, {"pc": [567, 722, 751, 754, 773], "errorMessage": "index access is out of bounds"}, {"pc": [1200], "errorMessage": "max array length exceeded"}, {"pc": [80, 574, 764, 934, 960, 1191], "errorMessage": "overflow"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"VERIFICATION_KEY": {"type": "AVMBytes"}, "ROOT_OF_UNITY": {"type": "AVMBytes"}}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+# post-processed: lazy APP_SPEC
+import functools
+
+
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    """Parse the embedded ARC-56 app spec once, on first use"""
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+
+def __getattr__(name: str) -> object:
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# post-processed: fast-path ABI helpers
+import operator
+
+_ABI_CONVERTERS: dict[type, typing.Callable[[object], object]] = {}
+_ARGS_GETTERS: dict[type, typing.Callable[[object], tuple]] = {}
+_IS_TXN_ARG: dict[type, bool] = {}
+_DATACLASS_INITS: dict[type, list[tuple[str, type | None]]] = {}
+_ABI_SCALAR_TYPES = (int, bool, str, bytes, bytearray, type(None))
+
+
+def _fields_getter(cls: type) -> typing.Callable[[object], tuple]:
+    """Build a getter returning the dataclass field values of `cls` as a tuple, in field order"""
+    names = [field.name for field in dataclasses.fields(cls)]
+    if len(names) == 1:
+        name = names[0]
+        return lambda value: (getattr(value, name),)
+    if not names:
+        return lambda value: ()
+    return operator.attrgetter(*names)
+
+
+def _abi_converter(cls: type) -> typing.Callable[[object], object]:
+    """Get the cached converter of a value type into the format expected by underlying client"""
+    converter = _ABI_CONVERTERS.get(cls)
+    if converter is not None:
+        return converter
+
+    if issubclass(cls, _ABI_SCALAR_TYPES):
+        def converter(value: object) -> object:
+            return value
+    elif dataclasses.is_dataclass(cls):
+        getter = _fields_getter(cls)
+
+        def converter(value: object) -> object:
+            return tuple([_convert_abi_value(item) for item in getter(value)])
+    elif issubclass(cls, (list, tuple)):
+        def converter(value: object) -> object:
+            # Arrays of scalars (e.g. uint256[]) are passed through w/o converting item by item
+            if all(type(item) in _ABI_SCALAR_TYPES for item in value):
+                return cls(value)
+            return cls(_convert_abi_value(item) for item in value)
+    else:
+        def converter(value: object) -> object:
+            return value
+
+    _ABI_CONVERTERS[cls] = converter
+    return converter
+
+
+def _convert_abi_value(value: object) -> object:
+    """Convert a single ABI arg value, recursing into dataclasses, lists and tuples"""
+    return _abi_converter(type(value))(value)
+
+
+def _is_txn_arg(value: object) -> bool:
+    """Check (w/ a per-type cache) if a value is a transaction argument the client handles itself"""
+    cls = type(value)
+    is_txn_arg = _IS_TXN_ARG.get(cls)
+    if is_txn_arg is None:
+        is_txn_arg = _IS_TXN_ARG[cls] = isinstance(value, algokit_utils.AppMethodCallTransactionArgument)
+    return is_txn_arg
+
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
     if args is None:
         return None
 
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
-    match args:
-        case tuple():
-            method_args = list(args)
-        case _ if dataclasses.is_dataclass(args):
-            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
-        case _:
-            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+    if isinstance(args, tuple):
+        method_args = list(args)
+    else:
+        getter = _ARGS_GETTERS.get(type(args))
+        if getter is None:
+            if not dataclasses.is_dataclass(args):
+                raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+            getter = _ARGS_GETTERS[type(args)] = _fields_getter(type(args))
+        method_args = list(getter(args))
 
     return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        _convert_abi_value(arg) if not _is_txn_arg(arg) else arg
         for arg in method_args
     ] if method_args else None
 
@@ -51,17 +122,23 @@ def _init_dataclass(cls: type, data: dict) -> object:
     """
     Recursively instantiate a dataclass of type `cls` from `data`.
 
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
+    The (field name, nested dataclass type) plan of each `cls` is built once and cached.
     """
+    plan = _DATACLASS_INITS.get(cls)
+    if plan is None:
+        plan = _DATACLASS_INITS[cls] = [
+            (field.name, typing.cast(type, field.type) if dataclasses.is_dataclass(field.type) else None)
+            for field in dataclasses.fields(cls)
+        ]
+
     field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
+    for name, nested in plan:
+        field_value = data.get(name)
         # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        if nested is not None and isinstance(field_value, dict):
+            field_values[name] = _init_dataclass(nested, field_value)
         else:
-            field_values[field.name] = field_value
+            field_values[name] = field_value
     return cls(**field_values)
 
 @dataclasses.dataclass(frozen=True)
@@ -190,7 +267,7 @@ class LagrangeWitnessCalculatorClient:
             self.app_client = algokit_utils.AppClient(
                 algokit_utils.AppClientParams(
                     algorand=algorand,
-                    app_spec=APP_SPEC,
+                    app_spec=_get_app_spec(),
                     app_id=app_id,
                     app_name=app_name,
                     default_sender=default_sender,
@@ -223,7 +300,7 @@ class LagrangeWitnessCalculatorClient:
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
                 app_name=app_name,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -245,7 +322,7 @@ class LagrangeWitnessCalculatorClient:
     ) -> "LagrangeWitnessCalculatorClient":
         return LagrangeWitnessCalculatorClient(
             algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 app_name=app_name,
                 default_sender=default_sender,
@@ -369,7 +446,7 @@ class LagrangeWitnessCalculatorFactory(algokit_utils.TypedAppFactoryProtocol[Lag
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
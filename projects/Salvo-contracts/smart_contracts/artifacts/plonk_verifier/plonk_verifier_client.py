@@ -20,30 +20,101 @@ import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
 _APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["CloseOut"], "create": []}, "args": [{"type": "(byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],uint64,uint64,uint64,uint64,byte[192])", "name": "_vk", "struct": "VerificationKey"}], "name": "_dummy", "returns": {"type": "void"}, "desc": "Dummy function that only exists so we can have the VerificationKey type in the generated client", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint256[]", "name": "signals"}, {"type": "(byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],uint256,uint256,uint256,uint256,uint256,uint256)", "name": "proof", "struct": "Proof"}, {"type": "(uint256[],uint256,uint256)", "name": "lw", "struct": "LagrangeWitness"}], "name": "verify", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "PlonkVerifier", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"LagrangeWitness": [{"name": "L", "type": "uint256[]"}, {"name": "xin", "type": "uint256"}, {"name": "zh", "type": "uint256"}], "Proof": [{"name": "A", "type": "byte[96]"}, {"name": "B", "type": "byte[96]"}, {"name": "C", "type": "byte[96]"}, {"name": "Z", "type": "byte[96]"}, {"name": "T1", "type": "byte[96]"}, {"name": "T2", "type": "byte[96]"}, {"name": "T3", "type": "byte[96]"}, {"name": "Wxi", "type": "byte[96]"}, {"name": "Wxiw", "type": "byte[96]"}, {"name": "eval_a", "type": "uint256"}, {"name": "eval_b", "type": "uint256"}, {"name": "eval_c", "type": "uint256"}, {"name": "eval_s1", "type": "uint256"}, {"name": "eval_s2", "type": "uint256"}, {"name": "eval_zw", "type": "uint256"}], "VerificationKey": [{"name": "Qm", "type": "byte[96]"}, {"name": "Ql", "type": "byte[96]"}, {"name": "Qr", "type": "byte[96]"}, {"name": "Qo", "type": "byte[96]"}, {"name": "Qc", "type": "byte[96]"}, {"name": "S1", "type": "byte[96]"}, {"name": "S2", "type": "byte[96]"}, {"name": "S3", "type": "byte[96]"}, {"name": "power", "type": "uint64"}, {"name": "nPublic", "type": "uint64"}, {"name": "k1", "type": "uint64"}, {"name": "k2", "type": "uint64"}, {"name": "X_2", "type": "byte[192]"}]}, "byteCode": {"approval": "CiAQIGABAIADwAGgAuADwASgBYAGiAaQBpgGoAbgByYGIHPtp1MpnX1IMznYCAmh2AVTvaQC//5b/v////8AAAABAAEBIHPtp1MpnX1IMznYCAmh2AVTvaQC//5b/v////8AAAAAAAAxG0EANoICBJXBDOQEC6l5YTYaAI4CABYAAQAxGRREMRhENhoBNhoCNhoDiABQJEMxGYECEkQxGEQkQzEZQP/aMRgURCRDigIBi/4oqov/KKpMKKBMoSiqiYoBAYv/FSIORCKvi/+rSRUiEkSJigEBi/8CKKpJFSIORCKvq4mKAwAlRxEpRwInBEkVJUsBDyVLAk8CTSNLAg8jSwNPAk1LA08CSwJSSRUjEkQhBUsDDyEFSwRPAk1LBE8DSwJSSRUjEkQhBksEDyEGSwVPAk1LBU8DSwJSSRUjEkQhBEsFDyEESwZPAk1LBk8DSwJSSRUjEkQhB0sGDyEHSwdPAk1LB08DSwJSSRUjEkQhCEsHDyEISwhPAk1LCE8DSwJSSRUjEkQhCUsIDyEJSwlPAk1LCU8DSwJSSRUjEkQhCksJDyEKSwpPAk1LCk8DSwJSSRUjEkQhC0sKDyELSwtPAk1LC08DSwJSFyEMSwsPIQxLDE8CTUsMTwNLAlIXIQ1LDA8hDUsNTwJNSw1PA0sCUhchDksNDyEOSw5PAk1LDk8DSwJSFyEPSw4PIQ9PD08CTU8OTwNPAlJJFSEFEkRPDE8MUE8LUE8KUE8JUE8IUE8HUE8GUE8FFlBPBBZQTwMWUE8CFlBMUEmL/lcAYElOAuQCRIv+V2BgSU4C5AJEi/5XwGBJTgLkAkSL/iEGI1hJTgLkAkSL/iEEI1hJTgLkAkSL/iEHI1hJTgLkAkSL/iEII1hJTgLkAkSL/iEJI1hJTgLkAkSL/iEKI1hJTgLkAkSL/oHgBiJYSU4CKKREi/6BgAciWElOAiikRIv+gaAHIlhJTgIopESL/oHAByJYSU4CKKREi/4hDyJYSU4CKKREi/6BgAgiWElOAiikRIv9JVlJTwIhC1tJTgISRCWLJ4slDEEAGIv9VwIAiydJTgIiCyJYKKREJAiMJ0L/4IsVSVcAYEsBV2BgUEsBV8BgUEsBIQYjWFBJjAlLASEEI1hJjAJQSwEhByNYSYwDUEsBIQgjWEmMBFBMIQkjWEmMBVCMCyWMJ4sniyUMQQAgi/1XAgCLJ0lOAiILIlgoqoj9KosLTFCMCyQIjCdC/9iLC4sWUIsXUIsYUIj9I0mI/R9QSYwLixlQiP0VSYwGixpQixtQixxQiP0GSYwPix9QiyBQiyFQiyJQiyNQiyRQIQWvTIj86lwgjAyBAowTixOBBgxBAC2LE0kkCSILiwxJTwIiWEsBVyAgoyiqSRUiDkQir6tLAiILTF2MDCQIjBNC/8uLHYseUEmMCoj8oosLiwZQiw9QiwxQTFCAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQjAeL/1cCIEmMDSikRIv/VyIgSYwOKKREJYwTi/8lWYv/FYv/TgJSSYwAJVlJjBKLEw1BABiLAFcCAIsTSU4CIgsiWCikRCQIjBNC/84kjBSLB1dgIEmMECWME4wRixUhCluLEw1BABiLEUmjKKqMEYsUgQILjBSLEyQIjBNC/92LEUkVIg5EIq9JjAFMSwGriw1LAahEKoj7kUkVIg5Eq4sOqESLJkAETiQkCIsSDkSLECqpRIsHgeACiw1dIQSLDl2MBymMCCWME4sTiyUMQQAui/1XAgCLE0lOAiILIlgoqkwkCEmME4sAVwIATCILIlijKKqLCEyI+zCMCEL/yosISRUiDkSLAUlOAquLAFciIIsHSU4CV0AgSUsBoyiqTwKjKKpLAlcAIEmLIklOCKMoqosfSU4HKKpMKKpLAaAoqksFVyAgTCiqTCiqTEsBoCiqSwOLI0lODKMoqosgSU4EKKpMKKpLAaAoqiiqSwOgKKqLIUlODiiqSUsFoCiqTwRPA6MoqklPAqMoqoskSU4OoyiqSwmjKKpPC0sJiPqKTIj6hkkVIg5ETw2riwmLGlCLG1CLHFCLAlBLDEsHoyiqSwwhBCJYKUsBiPpdSw6B4AIiWElLA6MoqilMiPpLSwFPAqMoqk8DoyiqKUyI+jpLD1dgIEsNSwGjKKpJKKpPDqAoqiiqSwygKKqLFUlOAyEMgQhYSwKjKKooqk8NoCiqKKpLDaAoqksDIQ2BCFhPA6MoqiiqTwygKKooqk8MoCiqTgKjKKqjKKpLDaMoqiiqTwwoqqAoqksNgcACIlhMKKpLASiqoCiqTw1PDaMoqksPoyiqTwujKKpPCYsZUIsFUIsWUIsXUIsYUIsDUIsEUE8JiPmnSw2I+aJQSwuI+ZxQSw+I+ZZQTwmI+ZBQTwiI+YpQTweI+YRQKoj5f1BPA4j5eVApTwOI+V+I+W9QTwdXgMBJVyAgTwJLAVBLAldAIExLAVBLA1dgIExLAVBLBFeAIExLAVBPBVegIExLAVBPBkzjAkkVIxJETwVPC6Moqk8JiPkTTwVPCaMoqkwoqkwoqqAoqk8ETwmjKKpMKKpMKKqgKKpPA08JoyiqTCiqTCiqoCiqTwJPB6MoqkwoqkwoqqAoqksCTwajKKpMKKpMKKqgKKqAYBfx06cxl9eUJpVjjE+prA/DaIxPl3S5BaFOOj8XG6xYbFXoP/l6Gu/7OvAK2yLGuwiz9IHjqqDxoJ4w7XQdiuT89eCV1dAK9gDbGMssBLPt0DzHRKKIiuQMqiMpRsXn4UzhAkkVIxJEix5LA+ECSRUjEkSLHUzgAkkVIxJETwNLBaMoqicFoyiqiPhITwVMUIsKTOMCSRUjEkRPA+ACSRUjEkRPAivhAkkVIxJE4AJJFSMSREwr4QJJFSMSRExQTCEOIQVYgMABAkqisvCPCpEmCAUnLcUQUcbketT6QDsCtFELZHrj0XcLrAMmqAW779SAVsjBIb24E+ArYFJxn2B9rNOgiCdPZVlr0NCZILYatdphu9x/UEkzTPESE5RdV+WsfQVdBCt+DOXVJ3J9bhGMyc3G2i41Gq39m6qMvdOnbUKaaVFg0SySOsnMO6yiieGTVIYIuCgBBgbEoC6nNMwyrNKwK8KLmcs+KH6Fp2OvJnSSq1cumas/Nw0nXOwdoaqpB1/wX3m+UOICRImLJkL7rg==", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBAYWxnb3JhbmRmb3VuZGF0aW9uL2FsZ29yYW5kLXR5cGVzY3JpcHQvYXJjNC9pbmRleC5kLnRzOjpDb250cmFjdC5hcHByb3ZhbFByb2dyYW0oKSAtPiB1aW50NjQ6Cm1haW46CiAgICBpbnRjYmxvY2sgMzIgOTYgMSAwIDM4NCAxOTIgMjg4IDQ4MCA1NzYgNjcyIDc2OCA3NzYgNzg0IDc5MiA4MDAgOTkyCiAgICBieXRlY2Jsb2NrIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMSAweCAweDAxIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMCBUTVBMX1ZFUklGSUNBVElPTl9LRVkgVE1QTF9ST09UX09GX1VOSVRZCiAgICAvLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czo0MwogICAgLy8gZXhwb3J0IGNsYXNzIFBsb25rVmVyaWZpZXIgZXh0ZW5kcyBDb250cmFjdCB7CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdANwogICAgcHVzaGJ5dGVzcyAweDk1YzEwY2U0IDB4MGJhOTc5NjEgLy8gbWV0aG9kICJfZHVtbXkoKGJ5dGVbOTZdLGJ5dGVbOTZdLGJ5dGVbOTZdLGJ5dGVbOTZdLGJ5dGVbOTZdLGJ5dGVbOTZdLGJ5dGVbOTZdLGJ5dGVbOTZdLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCxieXRlWzE5Ml0pKXZvaWQiLCBtZXRob2QgInZlcmlmeSh1aW50MjU2W10sKGJ5dGVbOTZdLGJ5dGVbOTZdLGJ5dGVbOTZdLGJ5dGVbOTZdLGJ5dGVbOTZdLGJ5dGVbOTZdLGJ5dGVbOTZdLGJ5dGVbOTZdLGJ5dGVbOTZdLHVpbnQyNTYsdWludDI1Nix1aW50MjU2LHVpbnQyNTYsdWludDI1Nix1aW50MjU2KSwodWludDI1NltdLHVpbnQyNTYsdWludDI1Nikpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fX2R1bW15X3JvdXRlQDMgbWFpbl92ZXJpZnlfcm91dGVANAoKbWFpbl9hZnRlcl9pZl9lbHNlQDExOgogICAgZXJyCgptYWluX3ZlcmlmeV9yb3V0ZUA0OgogICAgLy8gY29udHJhY3RzL3ZlcmlmaWVyLmFsZ28udHM6NDgKICAgIC8vIHZlcmlmeShzaWduYWxzOiBQdWJsaWNTaWduYWxzLCBwcm9vZjogUHJvb2YsIGx3OiBMYWdyYW5nZVdpdG5lc3MpOiB2b2lkIHsKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gY29udHJhY3RzL3ZlcmlmaWVyLmFsZ28udHM6NDMKICAgIC8vIGV4cG9ydCBjbGFzcyBQbG9ua1ZlcmlmaWVyIGV4dGVuZHMgQ29udHJhY3QgewogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgLy8gY29udHJhY3RzL3ZlcmlmaWVyLmFsZ28udHM6NDgKICAgIC8vIHZlcmlmeShzaWduYWxzOiBQdWJsaWNTaWduYWxzLCBwcm9vZjogUHJvb2YsIGx3OiBMYWdyYW5nZVdpdG5lc3MpOiB2b2lkIHsKICAgIGNhbGxzdWIgdmVyaWZ5CiAgICBpbnRjXzIgLy8gMQogICAgcmV0dXJuCgptYWluX19kdW1teV9yb3V0ZUAzOgogICAgLy8gY29udHJhY3RzL3ZlcmlmaWVyLmFsZ28udHM6NDUKICAgIC8vIEBhYmltZXRob2QoeyBhbGxvd0FjdGlvbnM6ICJDbG9zZU91dCIgfSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgMiAvLyBDbG9zZU91dAogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IENsb3NlT3V0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGludGNfMiAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDc6CiAgICAvLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czo0MwogICAgLy8gZXhwb3J0IGNsYXNzIFBsb25rVmVyaWZpZXIgZXh0ZW5kcyBDb250cmFjdCB7CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDExCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKCi8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjpmclN1YihhOiBieXRlcywgYjogYnl0ZXMpIC0+IGJ5dGVzOgpmclN1YjoKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjEzMwogICAgLy8gZnVuY3Rpb24gZnJTdWIoYTogYmlndWludCwgYjogYmlndWludCk6IGJpZ3VpbnQgewogICAgcHJvdG8gMiAxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxMzUKICAgIC8vIGNvbnN0IGFOOiBiaWd1aW50ID0gYSAlIHI7CiAgICBmcmFtZV9kaWcgLTIKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTM2CiAgICAvLyBjb25zdCBiTjogYmlndWludCA9IGIgJSByOwogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjEzNwogICAgLy8gcmV0dXJuIChhTiArIHIgLSBiTikgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIrCiAgICBzd2FwCiAgICBiLQogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICByZXRzdWIKCgovLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo6YjMyKGE6IGJ5dGVzKSAtPiBieXRlczoKYjMyOgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTY1CiAgICAvLyBmdW5jdGlvbiBiMzIoYTogYmlndWludCk6IGJ5dGVzPDMyPiB7CiAgICBwcm90byAxIDEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE2NgogICAgLy8gcmV0dXJuIG5ldyBVaW50MjU2KGEpLmJ5dGVzLnRvRml4ZWQoeyBsZW5ndGg6IDMyIH0pOwogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGludGNfMCAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgaW50Y18wIC8vIDMyCiAgICBiemVybwogICAgZnJhbWVfZGlnIC0xCiAgICBifAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSAzMgogICAgcmV0c3ViCgoKLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OmdldENoYWxsZW5nZSh0ZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRDaGFsbGVuZ2U6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1MTcKICAgIC8vIGV4cG9ydCBmdW5jdGlvbiBnZXRDaGFsbGVuZ2UodGQ6IGJ5dGVzKTogVWludDI1NiB7CiAgICBwcm90byAxIDEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjUxOAogICAgLy8gbGV0IGhhc2ggPSBvcC5rZWNjYWsyNTYodGQpOwogICAgZnJhbWVfZGlnIC0xCiAgICBrZWNjYWsyNTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE1OAogICAgLy8gcmV0dXJuIGEgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjUxOQogICAgLy8gcmV0dXJuIG5ldyBVaW50MjU2KGZyU2NhbGFyKEJpZ1VpbnQoaGFzaCkpKTsKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGludGNfMCAvLyAzMgogICAgYnplcm8KICAgIGJ8CiAgICByZXRzdWIKCgovLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czo6UGxvbmtWZXJpZmllci52ZXJpZnkoc2lnbmFsczogYnl0ZXMsIHByb29mOiBieXRlcywgbHc6IGJ5dGVzKSAtPiB2b2lkOgp2ZXJpZnk6CiAgICAvLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czo0OAogICAgLy8gdmVyaWZ5KHNpZ25hbHM6IFB1YmxpY1NpZ25hbHMsIHByb29mOiBQcm9vZiwgbHc6IExhZ3JhbmdlV2l0bmVzcyk6IHZvaWQgewogICAgcHJvdG8gMyAwCiAgICBpbnRjXzMgLy8gMAogICAgZHVwbiAxNwogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwbiAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDAKICAgIC8vIHJldHVybiB2ZXJpZnkoZGVjb2RlVmsodmtCeXRlcyksIHNpZ25hbHMsIHByb29mLCBsdyk7CiAgICBieXRlYyA0IC8vIFRNUExfVkVSSUZJQ0FUSU9OX0tFWQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzAxCiAgICAvLyBRbTogdmtCeXRlcy5zbGljZSgwLCA5NikudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDAKICAgIGRpZyAxCiAgICA+PQogICAgaW50Y18zIC8vIDAKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgaW50Y18xIC8vIDk2CiAgICBkaWcgMgogICAgPj0KICAgIGludGNfMSAvLyA5NgogICAgZGlnIDMKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgMwogICAgdW5jb3ZlciAyCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzAyCiAgICAvLyBRbDogdmtCeXRlcy5zbGljZSg5NiwgMTkyKS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIGludGMgNSAvLyAxOTIKICAgIGRpZyAzCiAgICA+PQogICAgaW50YyA1IC8vIDE5MgogICAgZGlnIDQKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgNAogICAgdW5jb3ZlciAzCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzAzCiAgICAvLyBRcjogdmtCeXRlcy5zbGljZSgxOTIsIDI4OCkudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICBpbnRjIDYgLy8gMjg4CiAgICBkaWcgNAogICAgPj0KICAgIGludGMgNiAvLyAyODgKICAgIGRpZyA1CiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDUKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMwNAogICAgLy8gUW86IHZrQnl0ZXMuc2xpY2UoMjg4LCAzODQpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgaW50YyA0IC8vIDM4NAogICAgZGlnIDUKICAgID49CiAgICBpbnRjIDQgLy8gMzg0CiAgICBkaWcgNgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyA2CiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDk2CiAgICA9PQogICAgYXNzZXJ0IC8vIExlbmd0aCBtdXN0IGJlIDk2CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozMDUKICAgIC8vIFFjOiB2a0J5dGVzLnNsaWNlKDM4NCwgNDgwKS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIGludGMgNyAvLyA0ODAKICAgIGRpZyA2CiAgICA+PQogICAgaW50YyA3IC8vIDQ4MAogICAgZGlnIDcKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgNwogICAgdW5jb3ZlciAzCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzA2CiAgICAvLyBTMTogdmtCeXRlcy5zbGljZSg0ODAsIDU3NikudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICBpbnRjIDggLy8gNTc2CiAgICBkaWcgNwogICAgPj0KICAgIGludGMgOCAvLyA1NzYKICAgIGRpZyA4CiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDgKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMwNwogICAgLy8gUzI6IHZrQnl0ZXMuc2xpY2UoNTc2LCA2NzIpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgaW50YyA5IC8vIDY3MgogICAgZGlnIDgKICAgID49CiAgICBpbnRjIDkgLy8gNjcyCiAgICBkaWcgOQogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyA5CiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDk2CiAgICA9PQogICAgYXNzZXJ0IC8vIExlbmd0aCBtdXN0IGJlIDk2CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozMDgKICAgIC8vIFMzOiB2a0J5dGVzLnNsaWNlKDY3MiwgNzY4KS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIGludGMgMTAgLy8gNzY4CiAgICBkaWcgOQogICAgPj0KICAgIGludGMgMTAgLy8gNzY4CiAgICBkaWcgMTAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgMTAKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMwOQogICAgLy8gcG93ZXI6IG9wLmJ0b2kodmtCeXRlcy5zbGljZSg3NjgsIDc3NikpLAogICAgaW50YyAxMSAvLyA3NzYKICAgIGRpZyAxMAogICAgPj0KICAgIGludGMgMTEgLy8gNzc2CiAgICBkaWcgMTEKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgMTEKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGJ0b2kKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMxMAogICAgLy8gblB1YmxpYzogb3AuYnRvaSh2a0J5dGVzLnNsaWNlKDc3NiwgNzg0KSksCiAgICBpbnRjIDEyIC8vIDc4NAogICAgZGlnIDExCiAgICA+PQogICAgaW50YyAxMiAvLyA3ODQKICAgIGRpZyAxMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyAxMgogICAgdW5jb3ZlciAzCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgYnRvaQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzExCiAgICAvLyBrMTogb3AuYnRvaSh2a0J5dGVzLnNsaWNlKDc4NCwgNzkyKSksCiAgICBpbnRjIDEzIC8vIDc5MgogICAgZGlnIDEyCiAgICA+PQogICAgaW50YyAxMyAvLyA3OTIKICAgIGRpZyAxMwogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyAxMwogICAgdW5jb3ZlciAzCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgYnRvaQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzEyCiAgICAvLyBrMjogb3AuYnRvaSh2a0J5dGVzLnNsaWNlKDc5MiwgODAwKSksCiAgICBpbnRjIDE0IC8vIDgwMAogICAgZGlnIDEzCiAgICA+PQogICAgaW50YyAxNCAvLyA4MDAKICAgIGRpZyAxNAogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyAxNAogICAgdW5jb3ZlciAzCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgYnRvaQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzEzCiAgICAvLyBYXzI6IHZrQnl0ZXMuc2xpY2UoODAwLCA5OTIpLnRvRml4ZWQoeyBsZW5ndGg6IDE5MiB9KSwKICAgIGludGMgMTUgLy8gOTkyCiAgICBkaWcgMTQKICAgID49CiAgICBpbnRjIDE1IC8vIDk5MgogICAgdW5jb3ZlciAxNQogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIHVuY292ZXIgMTQKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGxlbgogICAgaW50YyA1IC8vIDE5MgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSAxOTIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMwMC0zMTQKICAgIC8vIHJldHVybiB7CiAgICAvLyAgIFFtOiB2a0J5dGVzLnNsaWNlKDAsIDk2KS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIC8vICAgUWw6IHZrQnl0ZXMuc2xpY2UoOTYsIDE5MikudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICAvLyAgIFFyOiB2a0J5dGVzLnNsaWNlKDE5MiwgMjg4KS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIC8vICAgUW86IHZrQnl0ZXMuc2xpY2UoMjg4LCAzODQpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgLy8gICBRYzogdmtCeXRlcy5zbGljZSgzODQsIDQ4MCkudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICAvLyAgIFMxOiB2a0J5dGVzLnNsaWNlKDQ4MCwgNTc2KS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIC8vICAgUzI6IHZrQnl0ZXMuc2xpY2UoNTc2LCA2NzIpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgLy8gICBTMzogdmtCeXRlcy5zbGljZSg2NzIsIDc2OCkudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICAvLyAgIHBvd2VyOiBvcC5idG9pKHZrQnl0ZXMuc2xpY2UoNzY4LCA3NzYpKSwKICAgIC8vICAgblB1YmxpYzogb3AuYnRvaSh2a0J5dGVzLnNsaWNlKDc3NiwgNzg0KSksCiAgICAvLyAgIGsxOiBvcC5idG9pKHZrQnl0ZXMuc2xpY2UoNzg0LCA3OTIpKSwKICAgIC8vICAgazI6IG9wLmJ0b2kodmtCeXRlcy5zbGljZSg3OTIsIDgwMCkpLAogICAgLy8gICBYXzI6IHZrQnl0ZXMuc2xpY2UoODAwLCA5OTIpLnRvRml4ZWQoeyBsZW5ndGg6IDE5MiB9KSwKICAgIC8vIH07CiAgICB1bmNvdmVyIDEyCiAgICB1bmNvdmVyIDEyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTEKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMAogICAgY29uY2F0CiAgICB1bmNvdmVyIDkKICAgIGNvbmNhdAogICAgdW5jb3ZlciA4CiAgICBjb25jYXQKICAgIHVuY292ZXIgNwogICAgY29uY2F0CiAgICB1bmNvdmVyIDYKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MDYKICAgIC8vIGFzc2VydChncm91cENoZWNrKHByb29mLkEpLCAiQSBub3QgaW4gRzEiKTsKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAwIDk2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM0NAogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc3ViZ3JvdXBDaGVjayhvcC5FYy5CTFMxMl8zODFnMSwgcCk7CiAgICBlY19zdWJncm91cF9jaGVjayBCTFMxMl8zODFnMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDA2CiAgICAvLyBhc3NlcnQoZ3JvdXBDaGVjayhwcm9vZi5BKSwgIkEgbm90IGluIEcxIik7CiAgICBhc3NlcnQgLy8gQSBub3QgaW4gRzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQwNwogICAgLy8gYXNzZXJ0KGdyb3VwQ2hlY2socHJvb2YuQiksICJCIG5vdCBpbiBHMSIpOwogICAgZnJhbWVfZGlnIC0yCiAgICBleHRyYWN0IDk2IDk2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM0NAogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc3ViZ3JvdXBDaGVjayhvcC5FYy5CTFMxMl8zODFnMSwgcCk7CiAgICBlY19zdWJncm91cF9jaGVjayBCTFMxMl8zODFnMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDA3CiAgICAvLyBhc3NlcnQoZ3JvdXBDaGVjayhwcm9vZi5CKSwgIkIgbm90IGluIEcxIik7CiAgICBhc3NlcnQgLy8gQiBub3QgaW4gRzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQwOAogICAgLy8gYXNzZXJ0KGdyb3VwQ2hlY2socHJvb2YuQyksICJDIG5vdCBpbiBHMSIpOwogICAgZnJhbWVfZGlnIC0yCiAgICBleHRyYWN0IDE5MiA5NgogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDQKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLnN1Ymdyb3VwQ2hlY2sob3AuRWMuQkxTMTJfMzgxZzEsIHApOwogICAgZWNfc3ViZ3JvdXBfY2hlY2sgQkxTMTJfMzgxZzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQwOAogICAgLy8gYXNzZXJ0KGdyb3VwQ2hlY2socHJvb2YuQyksICJDIG5vdCBpbiBHMSIpOwogICAgYXNzZXJ0IC8vIEMgbm90IGluIEcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MDkKICAgIC8vIGFzc2VydChncm91cENoZWNrKHByb29mLlopLCAiWiBub3QgaW4gRzEiKTsKICAgIGZyYW1lX2RpZyAtMgogICAgaW50YyA2IC8vIDI4OAogICAgaW50Y18xIC8vIDk2CiAgICBleHRyYWN0MwogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDQKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLnN1Ymdyb3VwQ2hlY2sob3AuRWMuQkxTMTJfMzgxZzEsIHApOwogICAgZWNfc3ViZ3JvdXBfY2hlY2sgQkxTMTJfMzgxZzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQwOQogICAgLy8gYXNzZXJ0KGdyb3VwQ2hlY2socHJvb2YuWiksICJaIG5vdCBpbiBHMSIpOwogICAgYXNzZXJ0IC8vIFogbm90IGluIEcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MTAKICAgIC8vIGFzc2VydChncm91cENoZWNrKHByb29mLlQxKSwgIlQxIG5vdCBpbiBHMSIpOwogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjIDQgLy8gMzg0CiAgICBpbnRjXzEgLy8gOTYKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM0NAogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc3ViZ3JvdXBDaGVjayhvcC5FYy5CTFMxMl8zODFnMSwgcCk7CiAgICBlY19zdWJncm91cF9jaGVjayBCTFMxMl8zODFnMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDEwCiAgICAvLyBhc3NlcnQoZ3JvdXBDaGVjayhwcm9vZi5UMSksICJUMSBub3QgaW4gRzEiKTsKICAgIGFzc2VydCAvLyBUMSBub3QgaW4gRzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQxMQogICAgLy8gYXNzZXJ0KGdyb3VwQ2hlY2socHJvb2YuVDIpLCAiVDIgbm90IGluIEcxIik7CiAgICBmcmFtZV9kaWcgLTIKICAgIGludGMgNyAvLyA0ODAKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzQ0CiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5zdWJncm91cENoZWNrKG9wLkVjLkJMUzEyXzM4MWcxLCBwKTsKICAgIGVjX3N1Ymdyb3VwX2NoZWNrIEJMUzEyXzM4MWcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MTEKICAgIC8vIGFzc2VydChncm91cENoZWNrKHByb29mLlQyKSwgIlQyIG5vdCBpbiBHMSIpOwogICAgYXNzZXJ0IC8vIFQyIG5vdCBpbiBHMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDEyCiAgICAvLyBhc3NlcnQoZ3JvdXBDaGVjayhwcm9vZi5UMyksICJUMyBub3QgaW4gRzEiKTsKICAgIGZyYW1lX2RpZyAtMgogICAgaW50YyA4IC8vIDU3NgogICAgaW50Y18xIC8vIDk2CiAgICBleHRyYWN0MwogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDQKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLnN1Ymdyb3VwQ2hlY2sob3AuRWMuQkxTMTJfMzgxZzEsIHApOwogICAgZWNfc3ViZ3JvdXBfY2hlY2sgQkxTMTJfMzgxZzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQxMgogICAgLy8gYXNzZXJ0KGdyb3VwQ2hlY2socHJvb2YuVDMpLCAiVDMgbm90IGluIEcxIik7CiAgICBhc3NlcnQgLy8gVDMgbm90IGluIEcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MTMKICAgIC8vIGFzc2VydChncm91cENoZWNrKHByb29mLld4aSksICJXeGkgbm90IGluIEcxIik7CiAgICBmcmFtZV9kaWcgLTIKICAgIGludGMgOSAvLyA2NzIKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzQ0CiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5zdWJncm91cENoZWNrKG9wLkVjLkJMUzEyXzM4MWcxLCBwKTsKICAgIGVjX3N1Ymdyb3VwX2NoZWNrIEJMUzEyXzM4MWcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MTMKICAgIC8vIGFzc2VydChncm91cENoZWNrKHByb29mLld4aSksICJXeGkgbm90IGluIEcxIik7CiAgICBhc3NlcnQgLy8gV3hpIG5vdCBpbiBHMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDE0CiAgICAvLyBhc3NlcnQoZ3JvdXBDaGVjayhwcm9vZi5XeGl3KSwgIld4aXcgbm90IGluIEcxIik7CiAgICBmcmFtZV9kaWcgLTIKICAgIGludGMgMTAgLy8gNzY4CiAgICBpbnRjXzEgLy8gOTYKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM0NAogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc3ViZ3JvdXBDaGVjayhvcC5FYy5CTFMxMl8zODFnMSwgcCk7CiAgICBlY19zdWJncm91cF9jaGVjayBCTFMxMl8zODFnMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDE0CiAgICAvLyBhc3NlcnQoZ3JvdXBDaGVjayhwcm9vZi5XeGl3KSwgIld4aXcgbm90IGluIEcxIik7CiAgICBhc3NlcnQgLy8gV3hpdyBub3QgaW4gRzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM5NwogICAgLy8gYXNzZXJ0KGluRmllbGQocHJvb2YuZXZhbF9hKSwgImV2YWxfYSBub3QgaW4gRnIiKTsKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCA4NjQgLy8gODY0CiAgICBpbnRjXzAgLy8gMzIKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM0OAogICAgLy8gcmV0dXJuIHZhbHVlLm5hdGl2ZSA8IEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiPAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6Mzk3CiAgICAvLyBhc3NlcnQoaW5GaWVsZChwcm9vZi5ldmFsX2EpLCAiZXZhbF9hIG5vdCBpbiBGciIpOwogICAgYXNzZXJ0IC8vIGV2YWxfYSBub3QgaW4gRnIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM5OAogICAgLy8gYXNzZXJ0KGluRmllbGQocHJvb2YuZXZhbF9iKSwgImV2YWxfYiBub3QgaW4gRnIiKTsKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCA4OTYgLy8gODk2CiAgICBpbnRjXzAgLy8gMzIKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM0OAogICAgLy8gcmV0dXJuIHZhbHVlLm5hdGl2ZSA8IEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiPAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6Mzk4CiAgICAvLyBhc3NlcnQoaW5GaWVsZChwcm9vZi5ldmFsX2IpLCAiZXZhbF9iIG5vdCBpbiBGciIpOwogICAgYXNzZXJ0IC8vIGV2YWxfYiBub3QgaW4gRnIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM5OQogICAgLy8gYXNzZXJ0KGluRmllbGQocHJvb2YuZXZhbF9jKSwgImV2YWxfYyBub3QgaW4gRnIiKTsKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCA5MjggLy8gOTI4CiAgICBpbnRjXzAgLy8gMzIKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM0OAogICAgLy8gcmV0dXJuIHZhbHVlLm5hdGl2ZSA8IEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiPAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6Mzk5CiAgICAvLyBhc3NlcnQoaW5GaWVsZChwcm9vZi5ldmFsX2MpLCAiZXZhbF9jIG5vdCBpbiBGciIpOwogICAgYXNzZXJ0IC8vIGV2YWxfYyBub3QgaW4gRnIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQwMAogICAgLy8gYXNzZXJ0KGluRmllbGQocHJvb2YuZXZhbF9zMSksICJldmFsX3MxIG5vdCBpbiBGciIpOwogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDk2MCAvLyA5NjAKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzQ4CiAgICAvLyByZXR1cm4gdmFsdWUubmF0aXZlIDwgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGI8CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MDAKICAgIC8vIGFzc2VydChpbkZpZWxkKHByb29mLmV2YWxfczEpLCAiZXZhbF9zMSBub3QgaW4gRnIiKTsKICAgIGFzc2VydCAvLyBldmFsX3MxIG5vdCBpbiBGcgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDAxCiAgICAvLyBhc3NlcnQoaW5GaWVsZChwcm9vZi5ldmFsX3MyKSwgImV2YWxfczIgbm90IGluIEZyIik7CiAgICBmcmFtZV9kaWcgLTIKICAgIGludGMgMTUgLy8gOTkyCiAgICBpbnRjXzAgLy8gMzIKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM0OAogICAgLy8gcmV0dXJuIHZhbHVlLm5hdGl2ZSA8IEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiPAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDAxCiAgICAvLyBhc3NlcnQoaW5GaWVsZChwcm9vZi5ldmFsX3MyKSwgImV2YWxfczIgbm90IGluIEZyIik7CiAgICBhc3NlcnQgLy8gZXZhbF9zMiBub3QgaW4gRnIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQwMgogICAgLy8gYXNzZXJ0KGluRmllbGQocHJvb2YuZXZhbF96dyksICJldmFsX3p3IG5vdCBpbiBGciIpOwogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDEwMjQgLy8gMTAyNAogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MwogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDgKICAgIC8vIHJldHVybiB2YWx1ZS5uYXRpdmUgPCBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYjwKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQwMgogICAgLy8gYXNzZXJ0KGluRmllbGQocHJvb2YuZXZhbF96dyksICJldmFsX3p3IG5vdCBpbiBGciIpOwogICAgYXNzZXJ0IC8vIGV2YWxfencgbm90IGluIEZyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozODkKICAgIC8vIGFzc2VydChzaWduYWxzLmxlbmd0aCA9PT0gdmsublB1YmxpYywgIkludmFsaWQgbnVtYmVyIG9mIHB1YmxpYyBpbnB1dHMiKTsKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18zIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgaW50YyAxMSAvLyA3NzYKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgID09CiAgICBhc3NlcnQgLy8gSW52YWxpZCBudW1iZXIgb2YgcHVibGljIGlucHV0cwogICAgaW50Y18zIC8vIDAKCnZlcmlmeV9mb3JfaGVhZGVyQDI6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozOTEKICAgIC8vIGZvciAoY29uc3Qgc2lnbmFsIG9mIHNpZ25hbHMpIHsKICAgIGZyYW1lX2RpZyAzOQogICAgZnJhbWVfZGlnIDM3CiAgICA8CiAgICBieiB2ZXJpZnlfYWZ0ZXJfZm9yQDQKICAgIGZyYW1lX2RpZyAtMwogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAzOQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzAgLy8gMzIKICAgICoKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDgKICAgIC8vIHJldHVybiB2YWx1ZS5uYXRpdmUgPCBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYjwKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM5MgogICAgLy8gYXNzZXJ0KGluRmllbGQoc2lnbmFsKSwgInB1YmxpYyBzaWduYWwgbm90IGluIEZyIik7CiAgICBhc3NlcnQgLy8gcHVibGljIHNpZ25hbCBub3QgaW4gRnIKICAgIGludGNfMiAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDM5CiAgICBiIHZlcmlmeV9mb3JfaGVhZGVyQDIKCnZlcmlmeV9hZnRlcl9mb3JANDoKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjUzNAogICAgLy8gbGV0IHRkID0gb3AuY29uY2F0KHZrLlFtLCB2ay5RbCk7CiAgICBmcmFtZV9kaWcgMjEKICAgIGR1cAogICAgZXh0cmFjdCAwIDk2CiAgICBkaWcgMQogICAgZXh0cmFjdCA5NiA5NgogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1MzUKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCB2ay5Rcik7CiAgICBkaWcgMQogICAgZXh0cmFjdCAxOTIgOTYKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTM2CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgdmsuUW8pOwogICAgZGlnIDEKICAgIGludGMgNiAvLyAyODgKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDkKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjUzNwogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHZrLlFjKTsKICAgIGRpZyAxCiAgICBpbnRjIDQgLy8gMzg0CiAgICBpbnRjXzEgLy8gOTYKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1MzgKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCB2ay5TMSk7CiAgICBkaWcgMQogICAgaW50YyA3IC8vIDQ4MAogICAgaW50Y18xIC8vIDk2CiAgICBleHRyYWN0MwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDMKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTM5CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgdmsuUzIpOwogICAgZGlnIDEKICAgIGludGMgOCAvLyA1NzYKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGR1cAogICAgZnJhbWVfYnVyeSA0CiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU0MAogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHZrLlMzKTsKICAgIHN3YXAKICAgIGludGMgOSAvLyA2NzIKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMTEKICAgIGludGNfMyAvLyAwCiAgICBmcmFtZV9idXJ5IDM5Cgp2ZXJpZnlfZm9yX2hlYWRlckA3OgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTQyCiAgICAvLyBmb3IgKGNvbnN0IHNpZ25hbCBvZiBzaWduYWxzKSB7CiAgICBmcmFtZV9kaWcgMzkKICAgIGZyYW1lX2RpZyAzNwogICAgPAogICAgYnogdmVyaWZ5X2FmdGVyX2ZvckA5CiAgICBmcmFtZV9kaWcgLTMKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMzkKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18wIC8vIDMyCiAgICAqCiAgICBpbnRjXzAgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTU4CiAgICAvLyByZXR1cm4gYSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTQzCiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgYjMyKGZyU2NhbGFyKHNpZ25hbC5uYXRpdmUpKSk7CiAgICBjYWxsc3ViIGIzMgogICAgZnJhbWVfZGlnIDExCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMTEKICAgIGludGNfMiAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDM5CiAgICBiIHZlcmlmeV9mb3JfaGVhZGVyQDcKCnZlcmlmeV9hZnRlcl9mb3JAOToKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU0NwogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHByb29mLkEpOwogICAgZnJhbWVfZGlnIDExCiAgICBmcmFtZV9kaWcgMjIKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTQ4CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuQik7CiAgICBmcmFtZV9kaWcgMjMKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTQ5CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuQyk7CiAgICBmcmFtZV9kaWcgMjQKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTUxCiAgICAvLyBjb25zdCBiZXRhID0gZ2V0Q2hhbGxlbmdlKHRkKTsKICAgIGNhbGxzdWIgZ2V0Q2hhbGxlbmdlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1NTYKICAgIC8vIGNvbnN0IGdhbW1hID0gZ2V0Q2hhbGxlbmdlKHRkKTsKICAgIGR1cAogICAgY2FsbHN1YiBnZXRDaGFsbGVuZ2UKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU2MwogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIGdhbW1hLmJ5dGVzKTsKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDExCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1NjQKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5aKTsKICAgIGZyYW1lX2RpZyAyNQogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1NjUKICAgIC8vIGNvbnN0IGFscGhhID0gZ2V0Q2hhbGxlbmdlKHRkKTsKICAgIGNhbGxzdWIgZ2V0Q2hhbGxlbmdlCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTcyCiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuVDEpOwogICAgZnJhbWVfZGlnIDI2CiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU3MwogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHByb29mLlQyKTsKICAgIGZyYW1lX2RpZyAyNwogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1NzQKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5UMyk7CiAgICBmcmFtZV9kaWcgMjgKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTc1CiAgICAvLyBjb25zdCB4aSA9IGdldENoYWxsZW5nZSh0ZCk7CiAgICBjYWxsc3ViIGdldENoYWxsZW5nZQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDE1CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1ODIKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5ldmFsX2EuYnl0ZXMpOwogICAgZnJhbWVfZGlnIDMxCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU4MwogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHByb29mLmV2YWxfYi5ieXRlcyk7CiAgICBmcmFtZV9kaWcgMzIKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTg0CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuZXZhbF9jLmJ5dGVzKTsKICAgIGZyYW1lX2RpZyAzMwogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1ODUKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5ldmFsX3MxLmJ5dGVzKTsKICAgIGZyYW1lX2RpZyAzNAogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1ODYKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5ldmFsX3MyLmJ5dGVzKTsKICAgIGZyYW1lX2RpZyAzNQogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1ODcKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5ldmFsX3p3LmJ5dGVzKTsKICAgIGZyYW1lX2RpZyAzNgogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1ODkKICAgIC8vIGNvbnN0IHYgPSBuZXcgRml4ZWRBcnJheTxVaW50MjU2LCA2PigpOwogICAgaW50YyA1IC8vIDE5MgogICAgYnplcm8KICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU5MAogICAgLy8gdlsxXSA9IGdldENoYWxsZW5nZSh0ZCk7IC8vIHYxCiAgICBzd2FwCiAgICBjYWxsc3ViIGdldENoYWxsZW5nZQogICAgcmVwbGFjZTIgMzIgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9idXJ5IDEyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1OTEKICAgIC8vIGZvciAobGV0IGk6IHVpbnQ2NCA9IDI7IGkgPCA2OyBpKyspIHsKICAgIHB1c2hpbnQgMiAvLyAyCiAgICBmcmFtZV9idXJ5IDE5Cgp2ZXJpZnlfd2hpbGVfdG9wQDEwOgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTkxCiAgICAvLyBmb3IgKGxldCBpOiB1aW50NjQgPSAyOyBpIDwgNjsgaSsrKSB7CiAgICBmcmFtZV9kaWcgMTkKICAgIHB1c2hpbnQgNiAvLyA2CiAgICA8CiAgICBieiB2ZXJpZnlfYWZ0ZXJfd2hpbGVAMTIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU5MgogICAgLy8gdltpXSA9IG5ldyBVaW50MjU2KGZyTXVsKCh2W2kgLSAxXSBhcyBVaW50MjU2KS5uYXRpdmUsIHZbMV0ubmF0aXZlKSk7IC8vIHZbaV0gPSB2MV5pCiAgICBmcmFtZV9kaWcgMTkKICAgIGR1cAogICAgaW50Y18yIC8vIDEKICAgIC0KICAgIGludGNfMCAvLyAzMgogICAgKgogICAgZnJhbWVfZGlnIDEyCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGRpZyAxCiAgICBleHRyYWN0IDMyIDMyIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTkyCiAgICAvLyB2W2ldID0gbmV3IFVpbnQyNTYoZnJNdWwoKHZbaSAtIDFdIGFzIFVpbnQyNTYpLm5hdGl2ZSwgdlsxXS5uYXRpdmUpKTsgLy8gdltpXSA9IHYxXmkKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGludGNfMCAvLyAzMgogICAgYnplcm8KICAgIGJ8CiAgICBkaWcgMgogICAgaW50Y18wIC8vIDMyCiAgICAqCiAgICBzd2FwCiAgICByZXBsYWNlMyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2J1cnkgMTIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU5MQogICAgLy8gZm9yIChsZXQgaTogdWludDY0ID0gMjsgaSA8IDY7IGkrKykgewogICAgaW50Y18yIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMTkKICAgIGIgdmVyaWZ5X3doaWxlX3RvcEAxMAoKdmVyaWZ5X2FmdGVyX3doaWxlQDEyOgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjAwCiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuV3hpdyk7CiAgICBmcmFtZV9kaWcgMjkKICAgIGZyYW1lX2RpZyAzMAogICAgY29uY2F0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMTAKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjYwMQogICAgLy8gY29uc3QgdSA9IGdldENoYWxsZW5nZSh0ZCk7CiAgICBjYWxsc3ViIGdldENoYWxsZW5nZQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjAzLTYxMgogICAgLy8gcmV0dXJuIHsKICAgIC8vICAgYmV0YSwKICAgIC8vICAgZ2FtbWEsCiAgICAvLyAgIGFscGhhLAogICAgLy8gICB4aSwKICAgIC8vICAgdiwKICAgIC8vICAgdSwKICAgIC8vICAgeGluOiBuZXcgVWludDI1NigpLAogICAgLy8gICB6aDogbmV3IFVpbnQyNTYoKSwKICAgIC8vIH07CiAgICBmcmFtZV9kaWcgMTEKICAgIGZyYW1lX2RpZyA2CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAxNQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMTIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDcKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM1MgogICAgLy8gYXNzZXJ0KGluRmllbGQobHcueGluKSwgImx3LnhpbiBub3QgaW4gRnIiKTsKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDMyCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMTMKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM0OAogICAgLy8gcmV0dXJuIHZhbHVlLm5hdGl2ZSA8IEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiPAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzUyCiAgICAvLyBhc3NlcnQoaW5GaWVsZChsdy54aW4pLCAibHcueGluIG5vdCBpbiBGciIpOwogICAgYXNzZXJ0IC8vIGx3LnhpbiBub3QgaW4gRnIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM1MwogICAgLy8gYXNzZXJ0KGluRmllbGQobHcuemgpLCAibHcuemggbm90IGluIEZyIik7CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMzQgMzIKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxNAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzQ4CiAgICAvLyByZXR1cm4gdmFsdWUubmF0aXZlIDwgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGI8CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNTMKICAgIC8vIGFzc2VydChpbkZpZWxkKGx3LnpoKSwgImx3LnpoIG5vdCBpbiBGciIpOwogICAgYXNzZXJ0IC8vIGx3LnpoIG5vdCBpbiBGcgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzU0CiAgICAvLyBmb3IgKGxldCBpOiB1aW50NjQgPSAwOyBpIDwgbHcuTC5sZW5ndGg7IGkrKykgewogICAgaW50Y18zIC8vIDAKICAgIGZyYW1lX2J1cnkgMTkKCnZlcmlmeV93aGlsZV90b3BAMTU6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNTQKICAgIC8vIGZvciAobGV0IGk6IHVpbnQ2NCA9IDA7IGkgPCBsdy5MLmxlbmd0aDsgaSsrKSB7CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMyAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGZyYW1lX2RpZyAtMQogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGludGNfMyAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDE4CiAgICBmcmFtZV9kaWcgMTkKICAgID4KICAgIGJ6IHZlcmlmeV9hZnRlcl93aGlsZUAxNwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzU0LTM1NQogICAgLy8gZm9yIChsZXQgaTogdWludDY0ID0gMDsgaSA8IGx3LkwubGVuZ3RoOyBpKyspIHsKICAgIC8vICAgYXNzZXJ0KGluRmllbGQobHcuTFtpXSBhcyBVaW50MjU2KSwgImx3Lkwgbm90IGluIEZyIik7CiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAxOQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzAgLy8gMzIKICAgICoKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDgKICAgIC8vIHJldHVybiB2YWx1ZS5uYXRpdmUgPCBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYjwKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM1NQogICAgLy8gYXNzZXJ0KGluRmllbGQobHcuTFtpXSBhcyBVaW50MjU2KSwgImx3Lkwgbm90IGluIEZyIik7CiAgICBhc3NlcnQgLy8gbHcuTCBub3QgaW4gRnIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM1NAogICAgLy8gZm9yIChsZXQgaTogdWludDY0ID0gMDsgaSA8IGx3LkwubGVuZ3RoOyBpKyspIHsKICAgIGludGNfMiAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDE5CiAgICBiIHZlcmlmeV93aGlsZV90b3BAMTUKCnZlcmlmeV9hZnRlcl93aGlsZUAxNzoKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM2NwogICAgLy8gbGV0IG5Qb3c6IHVpbnQ2NCA9IDE7CiAgICBpbnRjXzIgLy8gMQogICAgZnJhbWVfYnVyeSAyMAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzY4CiAgICAvLyBsZXQgeGluID0gY2hhbGxlbmdlcy54aS5uYXRpdmU7CiAgICBmcmFtZV9kaWcgNwogICAgZXh0cmFjdCA5NiAzMgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDE2CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNjkKICAgIC8vIGZvciAobGV0IGk6IHVpbnQ2NCA9IDA7IGkgPCB2ay5wb3dlcjsgaSsrKSB7CiAgICBpbnRjXzMgLy8gMAogICAgZnJhbWVfYnVyeSAxOQogICAgZnJhbWVfYnVyeSAxNwoKdmVyaWZ5X3doaWxlX3RvcEAxODoKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM2OQogICAgLy8gZm9yIChsZXQgaTogdWludDY0ID0gMDsgaSA8IHZrLnBvd2VyOyBpKyspIHsKICAgIGZyYW1lX2RpZyAyMQogICAgaW50YyAxMCAvLyA3NjgKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgMTkKICAgID4KICAgIGJ6IHZlcmlmeV9hZnRlcl93aGlsZUAyMAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgZnJhbWVfZGlnIDE3CiAgICBkdXAKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIGZyYW1lX2J1cnkgMTcKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM3MQogICAgLy8gblBvdyAqPSAyOwogICAgZnJhbWVfZGlnIDIwCiAgICBwdXNoaW50IDIgLy8gMgogICAgKgogICAgZnJhbWVfYnVyeSAyMAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzY5CiAgICAvLyBmb3IgKGxldCBpOiB1aW50NjQgPSAwOyBpIDwgdmsucG93ZXI7IGkrKykgewogICAgZnJhbWVfZGlnIDE5CiAgICBpbnRjXzIgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxOQogICAgYiB2ZXJpZnlfd2hpbGVfdG9wQDE4Cgp2ZXJpZnlfYWZ0ZXJfd2hpbGVAMjA6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNzMKICAgIC8vIGNvbnN0IHhpbkV4cGVjdGVkID0gbmV3IFVpbnQyNTYoeGluKTsKICAgIGZyYW1lX2RpZyAxNwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgaW50Y18wIC8vIDMyCiAgICBiemVybwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIHN3YXAKICAgIGRpZyAxCiAgICBifAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6Mzc0CiAgICAvLyBhc3NlcnQobHcueGluLm5hdGl2ZSA9PT0geGluRXhwZWN0ZWQubmF0aXZlLCAibHcueGluICE9IHhpXm4iKTsKICAgIGZyYW1lX2RpZyAxMwogICAgZGlnIDEKICAgIGI9PQogICAgYXNzZXJ0IC8vIGx3LnhpbiAhPSB4aV5uCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNzcKICAgIC8vIGNvbnN0IHpoRXhwZWN0ZWQgPSBuZXcgVWludDI1NihmclN1Yih4aW5FeHBlY3RlZC5uYXRpdmUsIEJpZ1VpbnQoMSkpKTsKICAgIGJ5dGVjXzIgLy8gMHgwMQogICAgY2FsbHN1YiBmclN1YgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgYnwKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM3OAogICAgLy8gYXNzZXJ0KGx3LnpoLm5hdGl2ZSA9PT0gemhFeHBlY3RlZC5uYXRpdmUsICJsdy56aCAhPSB4aV5uIC0gMSIpOwogICAgZnJhbWVfZGlnIDE0CiAgICBiPT0KICAgIGFzc2VydCAvLyBsdy56aCAhPSB4aV5uIC0gMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzgxCiAgICAvLyBjb25zdCByZXF1aXJlZDogdWludDY0ID0gdmsublB1YmxpYyA9PT0gMCA/IDEgOiB2ay5uUHVibGljOwogICAgZnJhbWVfZGlnIDM4CiAgICBibnogdmVyaWZ5X3Rlcm5hcnlfZmFsc2VAMjIKICAgIGludGNfMiAvLyAxCgp2ZXJpZnlfdGVybmFyeV9tZXJnZUAyMzoKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM4MgogICAgLy8gYXNzZXJ0KGx3LkwubGVuZ3RoID49IHJlcXVpcmVkICsgMSwgImx3LkwgbGVuZ3RoIHRvbyBzaG9ydCIpOyAvLyBMWzBdIHVudXNlZDsgc3RhcnQgYXQgaW5kZXggMQogICAgaW50Y18yIC8vIDEKICAgICsKICAgIGZyYW1lX2RpZyAxOAogICAgPD0KICAgIGFzc2VydCAvLyBsdy5MIGxlbmd0aCB0b28gc2hvcnQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM4NQogICAgLy8gYXNzZXJ0KGNoYWxsZW5nZXMueGkubmF0aXZlICE9PSBCaWdVaW50KDEpLCAiaW52YWxpZCB4aSAoZXF1YWxzIDEpIik7CiAgICBmcmFtZV9kaWcgMTYKICAgIGJ5dGVjXzIgLy8gMHgwMQogICAgYiE9CiAgICBhc3NlcnQgLy8gaW52YWxpZCB4aSAoZXF1YWxzIDEpCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0NDMKICAgIC8vIGNoYWxsZW5nZXMueGluID0gbHcueGluOwogICAgZnJhbWVfZGlnIDcKICAgIHB1c2hpbnQgMzUyIC8vIDM1MgogICAgZnJhbWVfZGlnIDEzCiAgICByZXBsYWNlMwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDQ0CiAgICAvLyBjaGFsbGVuZ2VzLnpoID0gbHcuemg7CiAgICBpbnRjIDQgLy8gMzg0CiAgICBmcmFtZV9kaWcgMTQKICAgIHJlcGxhY2UzCiAgICBmcmFtZV9idXJ5IDcKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY3NQogICAgLy8gbGV0IHBpID0gQmlnVWludCgwKTsKICAgIGJ5dGVjXzEgLy8gMHgKICAgIGZyYW1lX2J1cnkgOAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6Njc2CiAgICAvLyBmb3IgKGxldCBpOiB1aW50NjQgPSAwOyBpIDwgcHVibGljU2lnbmFscy5sZW5ndGg7IGkrKykgewogICAgaW50Y18zIC8vIDAKICAgIGZyYW1lX2J1cnkgMTkKCnZlcmlmeV93aGlsZV90b3BAMjY6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NzYKICAgIC8vIGZvciAobGV0IGk6IHVpbnQ2NCA9IDA7IGkgPCBwdWJsaWNTaWduYWxzLmxlbmd0aDsgaSsrKSB7CiAgICBmcmFtZV9kaWcgMTkKICAgIGZyYW1lX2RpZyAzNwogICAgPAogICAgYnogdmVyaWZ5X2FmdGVyX3doaWxlQDI4CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NzcKICAgIC8vIGNvbnN0IHcgPSBmclNjYWxhcigocHVibGljU2lnbmFsc1tpXSBhcyBVaW50MjU2KS5uYXRpdmUpOwogICAgZnJhbWVfZGlnIC0zCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDE5CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMCAvLyAzMgogICAgKgogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE1OAogICAgLy8gcmV0dXJuIGEgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY3OAogICAgLy8gcGkgPSBmclN1YihwaSwgZnJNdWwodywgKExbaSArIDFdIGFzIFVpbnQyNTYpLm5hdGl2ZSkpOwogICAgc3dhcAogICAgaW50Y18yIC8vIDEKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxOQogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMiAwCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMzIKICAgICoKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NzgKICAgIC8vIHBpID0gZnJTdWIocGksIGZyTXVsKHcsIChMW2kgKyAxXSBhcyBVaW50MjU2KS5uYXRpdmUpKTsKICAgIGZyYW1lX2RpZyA4CiAgICBzd2FwCiAgICBjYWxsc3ViIGZyU3ViCiAgICBmcmFtZV9idXJ5IDgKICAgIGIgdmVyaWZ5X3doaWxlX3RvcEAyNgoKdmVyaWZ5X2FmdGVyX3doaWxlQDI4OgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjgwCiAgICAvLyByZXR1cm4gbmV3IFVpbnQyNTYocGkpOwogICAgZnJhbWVfZGlnIDgKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJ8CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0NTAKICAgIC8vIGNvbnN0IHIwID0gY2FsY3VsYXRlUjAocHJvb2YsIGNoYWxsZW5nZXMsIHBpLCBsdy5MWzFdIGFzIFVpbnQyNTYpOwogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMzQgMzIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjcwMQogICAgLy8gZnJNdWwoY2hhbGxlbmdlcy5hbHBoYS5uYXRpdmUsIGNoYWxsZW5nZXMuYWxwaGEubmF0aXZlKSwKICAgIGZyYW1lX2RpZyA3CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGV4dHJhY3QgNjQgMzIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGR1cAogICAgZGlnIDEKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIHVuY292ZXIgMgogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzA4CiAgICAvLyBmck11bChjaGFsbGVuZ2VzLmJldGEubmF0aXZlLCBwcm9vZi5ldmFsX3MxLm5hdGl2ZSksCiAgICBkaWcgMgogICAgZXh0cmFjdCAwIDMyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBkdXAKICAgIGZyYW1lX2RpZyAzNAogICAgZHVwCiAgICBjb3ZlciA4CiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDcKICAgIC8vIGNvbnN0IGFOOiBiaWd1aW50ID0gYSAlIHI7CiAgICBmcmFtZV9kaWcgMzEKICAgIGR1cAogICAgY292ZXIgNwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDgKICAgIC8vIGNvbnN0IGJOOiBiaWd1aW50ID0gYiAlIHI7CiAgICBzd2FwCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICBkaWcgMQogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzEwCiAgICAvLyBlM2EgPSBmckFkZChlM2EsIGNoYWxsZW5nZXMuZ2FtbWEubmF0aXZlKTsKICAgIGRpZyA1CiAgICBleHRyYWN0IDMyIDMyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDcKICAgIC8vIGNvbnN0IGFOOiBiaWd1aW50ID0gYSAlIHI7CiAgICBzd2FwCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OAogICAgLy8gY29uc3QgYk46IGJpZ3VpbnQgPSBiICUgcjsKICAgIHN3YXAKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ5CiAgICAvLyByZXR1cm4gKGFOICsgYk4pICUgcjsKICAgIHN3YXAKICAgIGRpZyAxCiAgICBiKwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBkaWcgMwogICAgZnJhbWVfZGlnIDM1CiAgICBkdXAKICAgIGNvdmVyIDEyCiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDcKICAgIC8vIGNvbnN0IGFOOiBiaWd1aW50ID0gYSAlIHI7CiAgICBmcmFtZV9kaWcgMzIKICAgIGR1cAogICAgY292ZXIgNAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDgKICAgIC8vIGNvbnN0IGJOOiBiaWd1aW50ID0gYiAlIHI7CiAgICBzd2FwCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICBkaWcgMQogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ3CiAgICAvLyBjb25zdCBhTjogYmlndWludCA9IGEgJSByOwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDkKICAgIC8vIHJldHVybiAoYU4gKyBiTikgJSByOwogICAgZGlnIDMKICAgIGIrCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0NwogICAgLy8gY29uc3QgYU46IGJpZ3VpbnQgPSBhICUgcjsKICAgIGZyYW1lX2RpZyAzMwogICAgZHVwCiAgICBjb3ZlciAxNAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDkKICAgIC8vIHJldHVybiAoYU4gKyBiTikgJSByOwogICAgZHVwCiAgICBkaWcgNQogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgdW5jb3ZlciA0CiAgICB1bmNvdmVyIDMKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICBmcmFtZV9kaWcgMzYKICAgIGR1cAogICAgY292ZXIgMTQKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIGRpZyA5CiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo3MjUKICAgIC8vIGNvbnN0IHIwID0gZnJTdWIoZnJTdWIoZTEsIGUyKSwgZTMpOwogICAgdW5jb3ZlciAxMQogICAgZGlnIDkKICAgIGNhbGxzdWIgZnJTdWIKICAgIHN3YXAKICAgIGNhbGxzdWIgZnJTdWIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjcyNgogICAgLy8gcmV0dXJuIG5ldyBVaW50MjU2KHIwKTsKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIHVuY292ZXIgMTMKICAgIGJ8CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo3NTQKICAgIC8vIHBvaW50cyA9IG9wLmNvbmNhdChwb2ludHMsIHByb29mLlQxKTsKICAgIGZyYW1lX2RpZyA5CiAgICBmcmFtZV9kaWcgMjYKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzU1CiAgICAvLyBwb2ludHMgPSBvcC5jb25jYXQocG9pbnRzLCBwcm9vZi5UMik7CiAgICBmcmFtZV9kaWcgMjcKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzU2CiAgICAvLyBwb2ludHMgPSBvcC5jb25jYXQocG9pbnRzLCBwcm9vZi5UMyk7CiAgICBmcmFtZV9kaWcgMjgKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzU3CiAgICAvLyBwb2ludHMgPSBvcC5jb25jYXQocG9pbnRzLCB2ay5RYyk7CiAgICBmcmFtZV9kaWcgMgogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBkaWcgMTIKICAgIGRpZyA3CiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo3NjYKICAgIC8vIGNvbnN0IHF1b3RpZW50U2NhbGFyMSA9IGZyU3ViKEJpZ1VpbnQoMCksIGNoYWxsZW5nZXMuemgubmF0aXZlKTsgLy8g4oiSemggKGFwcGxpZXMgdG8gVDEpCiAgICBkaWcgMTIKICAgIGludGMgNCAvLyAzODQKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMKICAgIGJ5dGVjXzEgLy8gMHgKICAgIGRpZyAxCiAgICBjYWxsc3ViIGZyU3ViCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo3NjkKICAgIC8vIGZyTXVsKGNoYWxsZW5nZXMueGluLm5hdGl2ZSwgY2hhbGxlbmdlcy56aC5uYXRpdmUpLAogICAgZGlnIDE0CiAgICBwdXNoaW50IDM1MiAvLyAzNTIKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGR1cAogICAgZGlnIDMKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjc2OAogICAgLy8gQmlnVWludCgwKSwKICAgIGJ5dGVjXzEgLy8gMHgKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjc2Ny03NzAKICAgIC8vIGNvbnN0IHF1b3RpZW50U2NhbGFyMiA9IGZyU3ViKAogICAgLy8gICBCaWdVaW50KDApLAogICAgLy8gICBmck11bChjaGFsbGVuZ2VzLnhpbi5uYXRpdmUsIGNoYWxsZW5nZXMuemgubmF0aXZlKSwKICAgIC8vICk7IC8vIOKIknhpbsK3emggKGFwcGxpZXMgdG8gVDIpCiAgICBzd2FwCiAgICBjYWxsc3ViIGZyU3ViCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBkaWcgMQogICAgdW5jb3ZlciAyCiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICB1bmNvdmVyIDMKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjc3MgogICAgLy8gQmlnVWludCgwKSwKICAgIGJ5dGVjXzEgLy8gMHgKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjc3MS03NzcKICAgIC8vIGNvbnN0IHF1b3RpZW50U2NhbGFyMyA9IGZyU3ViKAogICAgLy8gICBCaWdVaW50KDApLAogICAgLy8gICBmck11bCgKICAgIC8vICAgICBmck11bChjaGFsbGVuZ2VzLnhpbi5uYXRpdmUsIGNoYWxsZW5nZXMueGluLm5hdGl2ZSksCiAgICAvLyAgICAgY2hhbGxlbmdlcy56aC5uYXRpdmUsCiAgICAvLyAgICksCiAgICAvLyApOyAvLyDiiJJ4aW7CssK3emggKGFwcGxpZXMgdG8gVDMpCiAgICBzd2FwCiAgICBjYWxsc3ViIGZyU3ViCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo3ODAKICAgIC8vIGNvbnN0IGJldGF4aSA9IGZyTXVsKGNoYWxsZW5nZXMuYmV0YS5uYXRpdmUsIGNoYWxsZW5nZXMueGkubmF0aXZlKTsKICAgIGRpZyAxNQogICAgZXh0cmFjdCA5NiAzMgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgZGlnIDEzCiAgICBkaWcgMQogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ4CiAgICAvLyBjb25zdCBiTjogYmlndWludCA9IGIgJSByOwogICAgZHVwCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICB1bmNvdmVyIDE0CiAgICBiKwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDcKICAgIC8vIGNvbnN0IGFOOiBiaWd1aW50ID0gYSAlIHI7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICBkaWcgMTIKICAgIGIrCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjc4NgogICAgLy8gZnJBZGQocHJvb2YuZXZhbF9iLm5hdGl2ZSwgZnJNdWwoYmV0YXhpLCBCaWdVaW50KHZrLmsxKSkpLAogICAgZnJhbWVfZGlnIDIxCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGludGMgMTIgLy8gNzg0CiAgICBwdXNoaW50IDggLy8gOAogICAgZXh0cmFjdDMKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGRpZyAyCiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDgKICAgIC8vIGNvbnN0IGJOOiBiaWd1aW50ID0gYiAlIHI7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICB1bmNvdmVyIDEzCiAgICBiKwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDcKICAgIC8vIGNvbnN0IGFOOiBiaWd1aW50ID0gYSAlIHI7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICBkaWcgMTMKICAgIGIrCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjc5MAogICAgLy8gZnJBZGQocHJvb2YuZXZhbF9jLm5hdGl2ZSwgZnJNdWwoYmV0YXhpLCBCaWdVaW50KHZrLmsyKSkpLAogICAgZGlnIDMKICAgIGludGMgMTMgLy8gNzkyCiAgICBwdXNoaW50IDggLy8gOAogICAgZXh0cmFjdDMKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIHVuY292ZXIgMwogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ4CiAgICAvLyBjb25zdCBiTjogYmlndWludCA9IGIgJSByOwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDkKICAgIC8vIHJldHVybiAoYU4gKyBiTikgJSByOwogICAgdW5jb3ZlciAxMgogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ3CiAgICAvLyBjb25zdCBhTjogYmlndWludCA9IGEgJSByOwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDkKICAgIC8vIHJldHVybiAoYU4gKyBiTikgJSByOwogICAgdW5jb3ZlciAxMgogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgY292ZXIgMgogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgZGlnIDEzCiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDcKICAgIC8vIGNvbnN0IGFOOiBiaWd1aW50ID0gYSAlIHI7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OAogICAgLy8gY29uc3QgYk46IGJpZ3VpbnQgPSBiICUgcjsKICAgIHVuY292ZXIgMTIKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ5CiAgICAvLyByZXR1cm4gKGFOICsgYk4pICUgcjsKICAgIGIrCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjc5OAogICAgLy8gY29uc3QgelNjYWxhciA9IGZyQWRkKGZyQWRkKGQyYSwgZDJiKSwgY2hhbGxlbmdlcy51Lm5hdGl2ZSk7CiAgICBkaWcgMTMKICAgIHB1c2hpbnQgMzIwIC8vIDMyMAogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ3CiAgICAvLyBjb25zdCBhTjogYmlndWludCA9IGEgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDgKICAgIC8vIGNvbnN0IGJOOiBiaWd1aW50ID0gYiAlIHI7CiAgICBkaWcgMQogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDkKICAgIC8vIHJldHVybiAoYU4gKyBiTikgJSByOwogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgdW5jb3ZlciAxMwogICAgdW5jb3ZlciAxMwogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgZGlnIDE1CiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICB1bmNvdmVyIDExCiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4MjIKICAgIC8vIHBvaW50cyA9IG9wLmNvbmNhdChwb2ludHMsIHByb29mLlopOwogICAgdW5jb3ZlciA5CiAgICBmcmFtZV9kaWcgMjUKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6ODIzCiAgICAvLyBwb2ludHMgPSBvcC5jb25jYXQocG9pbnRzLCB2ay5TMyk7CiAgICBmcmFtZV9kaWcgNQogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4MjQKICAgIC8vIHBvaW50cyA9IG9wLmNvbmNhdChwb2ludHMsIHByb29mLkEpOwogICAgZnJhbWVfZGlnIDIyCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgyNQogICAgLy8gcG9pbnRzID0gb3AuY29uY2F0KHBvaW50cywgcHJvb2YuQik7CiAgICBmcmFtZV9kaWcgMjMKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6ODI2CiAgICAvLyBwb2ludHMgPSBvcC5jb25jYXQocG9pbnRzLCBwcm9vZi5DKTsKICAgIGZyYW1lX2RpZyAyNAogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4MjcKICAgIC8vIHBvaW50cyA9IG9wLmNvbmNhdChwb2ludHMsIHZrLlMxKTsKICAgIGZyYW1lX2RpZyAzCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgyOAogICAgLy8gcG9pbnRzID0gb3AuY29uY2F0KHBvaW50cywgdmsuUzIpOwogICAgZnJhbWVfZGlnIDQKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6ODMxCiAgICAvLyBsZXQgc2NhbGFycyA9IG9wLmNvbmNhdChiMzIoZ2F0ZVNjYWxhcjEpLCBiMzIoZ2F0ZVNjYWxhcjIpKTsKICAgIHVuY292ZXIgOQogICAgY2FsbHN1YiBiMzIKICAgIGRpZyAxMwogICAgY2FsbHN1YiBiMzIKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6ODMyCiAgICAvLyBzY2FsYXJzID0gb3AuY29uY2F0KHNjYWxhcnMsIGIzMihnYXRlU2NhbGFyMykpOwogICAgZGlnIDExCiAgICBjYWxsc3ViIGIzMgogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4MzMKICAgIC8vIHNjYWxhcnMgPSBvcC5jb25jYXQoc2NhbGFycywgYjMyKGdhdGVTY2FsYXI0KSk7CiAgICBkaWcgMTUKICAgIGNhbGxzdWIgYjMyCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgzNAogICAgLy8gc2NhbGFycyA9IG9wLmNvbmNhdChzY2FsYXJzLCBiMzIocXVvdGllbnRTY2FsYXIxKSk7CiAgICB1bmNvdmVyIDkKICAgIGNhbGxzdWIgYjMyCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgzNQogICAgLy8gc2NhbGFycyA9IG9wLmNvbmNhdChzY2FsYXJzLCBiMzIocXVvdGllbnRTY2FsYXIyKSk7CiAgICB1bmNvdmVyIDgKICAgIGNhbGxzdWIgYjMyCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgzNgogICAgLy8gc2NhbGFycyA9IG9wLmNvbmNhdChzY2FsYXJzLCBiMzIocXVvdGllbnRTY2FsYXIzKSk7CiAgICB1bmNvdmVyIDcKICAgIGNhbGxzdWIgYjMyCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgzNwogICAgLy8gc2NhbGFycyA9IG9wLmNvbmNhdChzY2FsYXJzLCBiMzIoQmlnVWludCgxKSkpOyAvLyBRYyB3aXRoIHNjYWxhciAxCiAgICBieXRlY18yIC8vIDB4MDEKICAgIGNhbGxzdWIgYjMyCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgzOAogICAgLy8gc2NhbGFycyA9IG9wLmNvbmNhdChzY2FsYXJzLCBiMzIoelNjYWxhcikpOyAvLyBaIHdpdGggelNjYWxhcgogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGIzMgogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4MzkKICAgIC8vIHNjYWxhcnMgPSBvcC5jb25jYXQoc2NhbGFycywgYjMyKGZyU3ViKEJpZ1VpbnQoMCksIHMzU2NhbGFyKSkpOyAvLyBTMyB3aXRoIC1zM1NjYWxhcgogICAgYnl0ZWNfMSAvLyAweAogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGZyU3ViCiAgICBjYWxsc3ViIGIzMgogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4NDAKICAgIC8vIHNjYWxhcnMgPSBvcC5jb25jYXQoc2NhbGFycywgKGNoYWxsZW5nZXMudlsxXSBhcyBVaW50MjU2KS5ieXRlcyk7CiAgICB1bmNvdmVyIDcKICAgIGV4dHJhY3QgMTI4IDE5MgogICAgZHVwCiAgICBleHRyYWN0IDMyIDMyIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdW5jb3ZlciAyCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4NDAtODQxCiAgICAvLyBzY2FsYXJzID0gb3AuY29uY2F0KHNjYWxhcnMsIChjaGFsbGVuZ2VzLnZbMV0gYXMgVWludDI1NikuYnl0ZXMpOwogICAgLy8gc2NhbGFycyA9IG9wLmNvbmNhdChzY2FsYXJzLCAoY2hhbGxlbmdlcy52WzJdIGFzIFVpbnQyNTYpLmJ5dGVzKTsKICAgIGRpZyAyCiAgICBleHRyYWN0IDY0IDMyIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6ODQxCiAgICAvLyBzY2FsYXJzID0gb3AuY29uY2F0KHNjYWxhcnMsIChjaGFsbGVuZ2VzLnZbMl0gYXMgVWludDI1NikuYnl0ZXMpOwogICAgc3dhcAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6ODQyCiAgICAvLyBzY2FsYXJzID0gb3AuY29uY2F0KHNjYWxhcnMsIChjaGFsbGVuZ2VzLnZbM10gYXMgVWludDI1NikuYnl0ZXMpOwogICAgZGlnIDMKICAgIGV4dHJhY3QgOTYgMzIgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBzd2FwCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4NDMKICAgIC8vIHNjYWxhcnMgPSBvcC5jb25jYXQoc2NhbGFycywgKGNoYWxsZW5nZXMudls0XSBhcyBVaW50MjU2KS5ieXRlcyk7CiAgICBkaWcgNAogICAgZXh0cmFjdCAxMjggMzIgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBzd2FwCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4NDQKICAgIC8vIHNjYWxhcnMgPSBvcC5jb25jYXQoc2NhbGFycywgKGNoYWxsZW5nZXMudls1XSBhcyBVaW50MjU2KS5ieXRlcyk7CiAgICB1bmNvdmVyIDUKICAgIGV4dHJhY3QgMTYwIDMyIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgc3dhcAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6ODQ3LTg1MQogICAgLy8gY29uc3QgRiA9IG9wLkVsbGlwdGljQ3VydmUuc2NhbGFyTXVsTXVsdGkoCiAgICAvLyAgIG9wLkVjLkJMUzEyXzM4MWcxLAogICAgLy8gICBwb2ludHMsCiAgICAvLyAgIHNjYWxhcnMsCiAgICAvLyApLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pOwogICAgdW5jb3ZlciA2CiAgICBzd2FwCiAgICBlY19tdWx0aV9zY2FsYXJfbXVsIEJMUzEyXzM4MWcxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDk2CiAgICA9PQogICAgYXNzZXJ0IC8vIExlbmd0aCBtdXN0IGJlIDk2CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICB1bmNvdmVyIDUKICAgIHVuY292ZXIgMTEKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjg2Ny04NzAKICAgIC8vIGxldCBlID0gZnJTdWIoCiAgICAvLyAgIGZyTXVsKChjaGFsbGVuZ2VzLnZbMV0gYXMgVWludDI1NikubmF0aXZlLCBwcm9vZi5ldmFsX2EubmF0aXZlKSwKICAgIC8vICAgcjAubmF0aXZlLAogICAgLy8gKTsKICAgIHVuY292ZXIgOQogICAgY2FsbHN1YiBmclN1YgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgdW5jb3ZlciA1CiAgICB1bmNvdmVyIDkKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0NwogICAgLy8gY29uc3QgYU46IGJpZ3VpbnQgPSBhICUgcjsKICAgIHN3YXAKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ4CiAgICAvLyBjb25zdCBiTjogYmlndWludCA9IGIgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDkKICAgIC8vIHJldHVybiAoYU4gKyBiTikgJSByOwogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgdW5jb3ZlciA0CiAgICB1bmNvdmVyIDkKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0NwogICAgLy8gY29uc3QgYU46IGJpZ3VpbnQgPSBhICUgcjsKICAgIHN3YXAKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ4CiAgICAvLyBjb25zdCBiTjogYmlndWludCA9IGIgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDkKICAgIC8vIHJldHVybiAoYU4gKyBiTikgJSByOwogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDkKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0NwogICAgLy8gY29uc3QgYU46IGJpZ3VpbnQgPSBhICUgcjsKICAgIHN3YXAKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ4CiAgICAvLyBjb25zdCBiTjogYmlndWludCA9IGIgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDkKICAgIC8vIHJldHVybiAoYU4gKyBiTikgJSByOwogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgdW5jb3ZlciAyCiAgICB1bmNvdmVyIDcKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0NwogICAgLy8gY29uc3QgYU46IGJpZ3VpbnQgPSBhICUgcjsKICAgIHN3YXAKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ4CiAgICAvLyBjb25zdCBiTjogYmlndWludCA9IGIgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDkKICAgIC8vIHJldHVybiAoYU4gKyBiTikgJSByOwogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgZGlnIDIKICAgIHVuY292ZXIgNgogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ3CiAgICAvLyBjb25zdCBhTjogYmlndWludCA9IGEgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDgKICAgIC8vIGNvbnN0IGJOOiBiaWd1aW50ID0gYiAlIHI7CiAgICBzd2FwCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICBiKwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4ODMKICAgIC8vIGNvbnN0IHJlcyA9IGcxVGltZXNGcihHMV9PTkUudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksIGUpOwogICAgcHVzaGJ5dGVzIDB4MTdmMWQzYTczMTk3ZDc5NDI2OTU2MzhjNGZhOWFjMGZjMzY4OGM0Zjk3NzRiOTA1YTE0ZTNhM2YxNzFiYWM1ODZjNTVlODNmZjk3YTFhZWZmYjNhZjAwYWRiMjJjNmJiMDhiM2Y0ODFlM2FhYTBmMWEwOWUzMGVkNzQxZDhhZTRmY2Y1ZTA5NWQ1ZDAwYWY2MDBkYjE4Y2IyYzA0YjNlZGQwM2NjNzQ0YTI4ODhhZTQwY2FhMjMyOTQ2YzVlN2UxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMzAKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLnNjYWxhck11bChvcC5FYy5CTFMxMl8zODFnMSwgcCwgQnl0ZXMocykpLnRvRml4ZWQoewogICAgc3dhcAogICAgZWNfc2NhbGFyX211bCBCTFMxMl8zODFnMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjMwLTIzMgogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc2NhbGFyTXVsKG9wLkVjLkJMUzEyXzM4MWcxLCBwLCBCeXRlcyhzKSkudG9GaXhlZCh7CiAgICAvLyAgIGxlbmd0aDogOTYsCiAgICAvLyB9KTsKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIzMAogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc2NhbGFyTXVsKG9wLkVjLkJMUzEyXzM4MWcxLCBwLCBCeXRlcyhzKSkudG9GaXhlZCh7CiAgICBmcmFtZV9kaWcgMzAKICAgIGRpZyAzCiAgICBlY19zY2FsYXJfbXVsIEJMUzEyXzM4MWcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMzAtMjMyCiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5zY2FsYXJNdWwob3AuRWMuQkxTMTJfMzgxZzEsIHAsIEJ5dGVzKHMpKS50b0ZpeGVkKHsKICAgIC8vICAgbGVuZ3RoOiA5NiwKICAgIC8vIH0pOwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjQxCiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5hZGQob3AuRWMuQkxTMTJfMzgxZzEsIHAxLCBwMikudG9GaXhlZCh7CiAgICBmcmFtZV9kaWcgMjkKICAgIHN3YXAKICAgIGVjX2FkZCBCTFMxMl8zODFnMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjQxLTI0MwogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuYWRkKG9wLkVjLkJMUzEyXzM4MWcxLCBwMSwgcDIpLnRvRml4ZWQoewogICAgLy8gICBsZW5ndGg6IDk2LAogICAgLy8gfSk7CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDk2CiAgICA9PQogICAgYXNzZXJ0IC8vIExlbmd0aCBtdXN0IGJlIDk2CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICB1bmNvdmVyIDMKICAgIGRpZyA1CiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo5MTUKICAgIC8vIFJPT1RfT0ZfVU5JVFksCiAgICBieXRlYyA1IC8vIFRNUExfUk9PVF9PRl9VTklUWQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OTE3CiAgICAvLyBjb25zdCBwYWlyaW5nU2NhbGFycyA9IG9wLmNvbmNhdChjaGFsbGVuZ2VzLnhpLmJ5dGVzLCBiMzIocykpOwogICAgY2FsbHN1YiBiMzIKICAgIHVuY292ZXIgNQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo5MTktOTIzCiAgICAvLyBsZXQgQjEgPSBvcC5FbGxpcHRpY0N1cnZlLnNjYWxhck11bE11bHRpKAogICAgLy8gICBvcC5FYy5CTFMxMl8zODFnMSwKICAgIC8vICAgcGFpcmluZ1BvaW50cywKICAgIC8vICAgcGFpcmluZ1NjYWxhcnMsCiAgICAvLyApLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pOwogICAgZnJhbWVfZGlnIDEwCiAgICBzd2FwCiAgICBlY19tdWx0aV9zY2FsYXJfbXVsIEJMUzEyXzM4MWcxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDk2CiAgICA9PQogICAgYXNzZXJ0IC8vIExlbmd0aCBtdXN0IGJlIDk2CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyNDEKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLmFkZChvcC5FYy5CTFMxMl8zODFnMSwgcDEsIHAyKS50b0ZpeGVkKHsKICAgIHVuY292ZXIgMwogICAgZWNfYWRkIEJMUzEyXzM4MWcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyNDEtMjQzCiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5hZGQob3AuRWMuQkxTMTJfMzgxZzEsIHAxLCBwMikudG9GaXhlZCh7CiAgICAvLyAgIGxlbmd0aDogOTYsCiAgICAvLyB9KTsKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIzMAogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc2NhbGFyTXVsKG9wLkVjLkJMUzEyXzM4MWcxLCBwLCBCeXRlcyhzKSkudG9GaXhlZCh7CiAgICB1bmNvdmVyIDIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjI1MgogICAgLy8gcmV0dXJuIGcxVGltZXNGcihwLCBSX01JTlVTXzEpOwogICAgYnl0ZWNfMyAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDAKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIzMAogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc2NhbGFyTXVsKG9wLkVjLkJMUzEyXzM4MWcxLCBwLCBCeXRlcyhzKSkudG9GaXhlZCh7CiAgICBlY19zY2FsYXJfbXVsIEJMUzEyXzM4MWcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMzAtMjMyCiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5zY2FsYXJNdWwob3AuRWMuQkxTMTJfMzgxZzEsIHAsIEJ5dGVzKHMpKS50b0ZpeGVkKHsKICAgIC8vICAgbGVuZ3RoOiA5NiwKICAgIC8vIH0pOwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjQxCiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5hZGQob3AuRWMuQkxTMTJfMzgxZzEsIHAxLCBwMikudG9GaXhlZCh7CiAgICBlY19hZGQgQkxTMTJfMzgxZzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjI0MS0yNDMKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLmFkZChvcC5FYy5CTFMxMl8zODFnMSwgcDEsIHAyKS50b0ZpeGVkKHsKICAgIC8vICAgbGVuZ3RoOiA5NiwKICAgIC8vIH0pOwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjMwCiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5zY2FsYXJNdWwob3AuRWMuQkxTMTJfMzgxZzEsIHAsIEJ5dGVzKHMpKS50b0ZpeGVkKHsKICAgIHN3YXAKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjI1MgogICAgLy8gcmV0dXJuIGcxVGltZXNGcihwLCBSX01JTlVTXzEpOwogICAgYnl0ZWNfMyAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDAKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIzMAogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc2NhbGFyTXVsKG9wLkVjLkJMUzEyXzM4MWcxLCBwLCBCeXRlcyhzKSkudG9GaXhlZCh7CiAgICBlY19zY2FsYXJfbXVsIEJMUzEyXzM4MWcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMzAtMjMyCiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5zY2FsYXJNdWwob3AuRWMuQkxTMTJfMzgxZzEsIHAsIEJ5dGVzKHMpKS50b0ZpeGVkKHsKICAgIC8vICAgbGVuZ3RoOiA5NiwKICAgIC8vIH0pOwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OTMwCiAgICAvLyBvcC5jb25jYXQoZzFOZWcoQTEpLCBCMSksIC8vIEcxIHBvaW50cwogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo5MzEKICAgIC8vIG9wLmNvbmNhdCh2ay5YXzIsIEcyX09ORSksIC8vIEcyIHBvaW50cwogICAgc3dhcAogICAgaW50YyAxNCAvLyA4MDAKICAgIGludGMgNSAvLyAxOTIKICAgIGV4dHJhY3QzCiAgICBwdXNoYnl0ZXMgMHgwMjRhYTJiMmYwOGYwYTkxMjYwODA1MjcyZGM1MTA1MWM2ZTQ3YWQ0ZmE0MDNiMDJiNDUxMGI2NDdhZTNkMTc3MGJhYzAzMjZhODA1YmJlZmQ0ODA1NmM4YzEyMWJkYjgxM2UwMmI2MDUyNzE5ZjYwN2RhY2QzYTA4ODI3NGY2NTU5NmJkMGQwOTkyMGI2MWFiNWRhNjFiYmRjN2Y1MDQ5MzM0Y2YxMTIxMzk0NWQ1N2U1YWM3ZDA1NWQwNDJiN2UwY2U1ZDUyNzcyN2Q2ZTExOGNjOWNkYzZkYTJlMzUxYWFkZmQ5YmFhOGNiZGQzYTc2ZDQyOWE2OTUxNjBkMTJjOTIzYWM5Y2MzYmFjYTI4OWUxOTM1NDg2MDhiODI4MDEwNjA2YzRhMDJlYTczNGNjMzJhY2QyYjAyYmMyOGI5OWNiM2UyODdlODVhNzYzYWYyNjc0OTJhYjU3MmU5OWFiM2YzNzBkMjc1Y2VjMWRhMWFhYTkwNzVmZjA1Zjc5YmUKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OTI4LTkzMgogICAgLy8gY29uc3QgcmVzID0gb3AuRWxsaXB0aWNDdXJ2ZS5wYWlyaW5nQ2hlY2soCiAgICAvLyAgIG9wLkVjLkJMUzEyXzM4MWcxLAogICAgLy8gICBvcC5jb25jYXQoZzFOZWcoQTEpLCBCMSksIC8vIEcxIHBvaW50cwogICAgLy8gICBvcC5jb25jYXQodmsuWF8yLCBHMl9PTkUpLCAvLyBHMiBwb2ludHMKICAgIC8vICk7CiAgICBlY19wYWlyaW5nX2NoZWNrIEJMUzEyXzM4MWcxCiAgICAvLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czo0OQogICAgLy8gYXNzZXJ0KHZlcmlmeUZyb21UZW1wbGF0ZShzaWduYWxzLCBwcm9vZiwgbHcpLCAiVmVyaWZpY2F0aW9uIGZhaWxlZCIpOwogICAgYXNzZXJ0IC8vIFZlcmlmaWNhdGlvbiBmYWlsZWQKICAgIHJldHN1YgoKdmVyaWZ5X3Rlcm5hcnlfZmFsc2VAMjI6CiAgICBmcmFtZV9kaWcgMzgKICAgIGIgdmVyaWZ5X3Rlcm5hcnlfbWVyZ2VAMjMK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBAYWxnb3JhbmRmb3VuZGF0aW9uL2FsZ29yYW5kLXR5cGVzY3JpcHQvYmFzZS1jb250cmFjdC5kLnRzOjpCYXNlQ29udHJhY3QuY2xlYXJTdGF0ZVByb2dyYW0oKSAtPiB1aW50NjQ6Cm1haW46CiAgICBwdXNoaW50IDEgLy8gMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [496], "errorMessage": "A not in G1"}, {"pc": [507], "errorMessage": "B not in G1"}, {"pc": [518], "errorMessage": "C not in G1"}, {"pc": [682], "errorMessage": "Invalid number of public inputs"}, {"pc": [443], "errorMessage": "Length must be 192"}, {"pc": [107], "errorMessage": "Length must be 32"}, {"pc": [170, 194, 218, 242, 266, 290, 314, 338, 1830, 2028, 2039, 2049, 2078, 2087, 2097, 2104, 2113], "errorMessage": "Length must be 96"}, {"pc": [53], "errorMessage": "OnCompletion is not CloseOut"}, {"pc": [30], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [542], "errorMessage": "T1 not in G1"}, {"pc": [554], "errorMessage": "T2 not in G1"}, {"pc": [566], "errorMessage": "T3 not in G1"}, {"pc": [2320], "errorMessage": "Verification failed"}, {"pc": [578], "errorMessage": "Wxi not in G1"}, {"pc": [590], "errorMessage": "Wxiw not in G1"}, {"pc": [530], "errorMessage": "Z not in G1"}, {"pc": [67], "errorMessage": "can only call when creating"}, {"pc": [33, 56], "errorMessage": "can only call when not creating"}, {"pc": [603], "errorMessage": "eval_a not in Fr"}, {"pc": [616], "errorMessage": "eval_b not in Fr"}, {"pc": [629], "errorMessage": "eval_c not in Fr"}, {"pc": [642], "errorMessage": "eval_s1 not in Fr"}, {"pc": [654], "errorMessage": "eval_s2 not in Fr"}, {"pc": [667], "errorMessage": "eval_zw not in Fr"}, {"pc": [705, 809, 899, 928, 931, 950, 1117, 1274, 1292, 1777, 1787, 1796, 1805, 1814], "errorMessage": "index access is out of bounds"}, {"pc": [1231], "errorMessage": "invalid xi (equals 1)"}, {"pc": [1226], "errorMessage": "lw.L length too short"}, {"pc": [1120], "errorMessage": "lw.L not in Fr"}, {"pc": [1200], "errorMessage": "lw.xin != xi^n"}, {"pc": [1063], "errorMessage": "lw.xin not in Fr"}, {"pc": [1214], "errorMessage": "lw.zh != xi^n - 1"}, {"pc": [1074], "errorMessage": "lw.zh not in Fr"}, {"pc": [97, 121, 941, 1185, 1209, 1313, 1476], "errorMessage": "overflow"}, {"pc": [708], "errorMessage": "public signal not in Fr"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"VERIFICATION_KEY": {"type": "AVMBytes"}, "ROOT_OF_UNITY": {"type": "AVMBytes"}}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+# post-processed: lazy APP_SPEC
+import functools
+
+
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    """Parse the embedded ARC-56 app spec once, on first use"""
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+
+def __getattr__(name: str) -> object:
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# post-processed: fast-path ABI helpers
+import operator
+
+_ABI_CONVERTERS: dict[type, typing.Callable[[object], object]] = {}
+_ARGS_GETTERS: dict[type, typing.Callable[[object], tuple]] = {}
+_IS_TXN_ARG: dict[type, bool] = {}
+_DATACLASS_INITS: dict[type, list[tuple[str, type | None]]] = {}
+_ABI_SCALAR_TYPES = (int, bool, str, bytes, bytearray, type(None))
+
+
+def _fields_getter(cls: type) -> typing.Callable[[object], tuple]:
+    """Build a getter returning the dataclass field values of `cls` as a tuple, in field order"""
+    names = [field.name for field in dataclasses.fields(cls)]
+    if len(names) == 1:
+        name = names[0]
+        return lambda value: (getattr(value, name),)
+    if not names:
+        return lambda value: ()
+    return operator.attrgetter(*names)
+
+
+def _abi_converter(cls: type) -> typing.Callable[[object], object]:
+    """Get the cached converter of a value type into the format expected by underlying client"""
+    converter = _ABI_CONVERTERS.get(cls)
+    if converter is not None:
+        return converter
+
+    if issubclass(cls, _ABI_SCALAR_TYPES):
+        def converter(value: object) -> object:
+            return value
+    elif dataclasses.is_dataclass(cls):
+        getter = _fields_getter(cls)
+
+        def converter(value: object) -> object:
+            return tuple([_convert_abi_value(item) for item in getter(value)])
+    elif issubclass(cls, (list, tuple)):
+        def converter(value: object) -> object:
+            # Arrays of scalars (e.g. uint256[]) are passed through w/o converting item by item
+            if all(type(item) in _ABI_SCALAR_TYPES for item in value):
+                return cls(value)
+            return cls(_convert_abi_value(item) for item in value)
+    else:
+        def converter(value: object) -> object:
+            return value
+
+    _ABI_CONVERTERS[cls] = converter
+    return converter
+
+
+def _convert_abi_value(value: object) -> object:
+    """Convert a single ABI arg value, recursing into dataclasses, lists and tuples"""
+    return _abi_converter(type(value))(value)
+
+
+def _is_txn_arg(value: object) -> bool:
+    """Check (w/ a per-type cache) if a value is a transaction argument the client handles itself"""
+    cls = type(value)
+    is_txn_arg = _IS_TXN_ARG.get(cls)
+    if is_txn_arg is None:
+        is_txn_arg = _IS_TXN_ARG[cls] = isinstance(value, algokit_utils.AppMethodCallTransactionArgument)
+    return is_txn_arg
+
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
     if args is None:
         return None
 
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
-    match args:
-        case tuple():
-            method_args = list(args)
-        case _ if dataclasses.is_dataclass(args):
-            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
-        case _:
-            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+    if isinstance(args, tuple):
+        method_args = list(args)
+    else:
+        getter = _ARGS_GETTERS.get(type(args))
+        if getter is None:
+            if not dataclasses.is_dataclass(args):
+                raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+            getter = _ARGS_GETTERS[type(args)] = _fields_getter(type(args))
+        method_args = list(getter(args))
 
     return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        _convert_abi_value(arg) if not _is_txn_arg(arg) else arg
         for arg in method_args
     ] if method_args else None
 
@@ -51,17 +122,23 @@ def _init_dataclass(cls: type, data: dict) -> object:
     """
     Recursively instantiate a dataclass of type `cls` from `data`.
 
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
+    The (field name, nested dataclass type) plan of each `cls` is built once and cached.
     """
+    plan = _DATACLASS_INITS.get(cls)
+    if plan is None:
+        plan = _DATACLASS_INITS[cls] = [
+            (field.name, typing.cast(type, field.type) if dataclasses.is_dataclass(field.type) else None)
+            for field in dataclasses.fields(cls)
+        ]
+
     field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
+    for name, nested in plan:
+        field_value = data.get(name)
         # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        if nested is not None and isinstance(field_value, dict):
+            field_values[name] = _init_dataclass(nested, field_value)
         else:
-            field_values[field.name] = field_value
+            field_values[name] = field_value
     return cls(**field_values)
 
 @dataclasses.dataclass(frozen=True)
@@ -328,7 +405,7 @@ class PlonkVerifierClient:
             self.app_client = algokit_utils.AppClient(
                 algokit_utils.AppClientParams(
                     algorand=algorand,
-                    app_spec=APP_SPEC,
+                    app_spec=_get_app_spec(),
                     app_id=app_id,
                     app_name=app_name,
                     default_sender=default_sender,
@@ -361,7 +438,7 @@ class PlonkVerifierClient:
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
                 app_name=app_name,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -383,7 +460,7 @@ class PlonkVerifierClient:
     ) -> "PlonkVerifierClient":
         return PlonkVerifierClient(
             algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 app_name=app_name,
                 default_sender=default_sender,
@@ -500,7 +577,7 @@ class PlonkVerifierFactory(algokit_utils.TypedAppFactoryProtocol[PlonkVerifierBa
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -20,30 +20,101 @@ import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
 _APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["CloseOut"], "create": []}, "args": [{"type": "(byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],uint64,uint64,uint64,uint64,byte[192])", "name": "_vk", "struct": "VerificationKey"}], "name": "_dummy", "returns": {"type": "void"}, "desc": "Dummy function that only exists so we can have the VerificationKey type in the generated client", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint256[]", "name": "signals"}, {"type": "(byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],uint256,uint256,uint256,uint256,uint256,uint256)", "name": "proof", "struct": "Proof"}, {"type": "(uint256[],uint256,uint256)", "name": "lw", "struct": "LagrangeWitness"}], "name": "verify", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "PlonkVerifierWithLogs", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"LagrangeWitness": [{"name": "L", "type": "uint256[]"}, {"name": "xin", "type": "uint256"}, {"name": "zh", "type": "uint256"}], "Proof": [{"name": "A", "type": "byte[96]"}, {"name": "B", "type": "byte[96]"}, {"name": "C", "type": "byte[96]"}, {"name": "Z", "type": "byte[96]"}, {"name": "T1", "type": "byte[96]"}, {"name": "T2", "type": "byte[96]"}, {"name": "T3", "type": "byte[96]"}, {"name": "Wxi", "type": "byte[96]"}, {"name": "Wxiw", "type": "byte[96]"}, {"name": "eval_a", "type": "uint256"}, {"name": "eval_b", "type": "uint256"}, {"name": "eval_c", "type": "uint256"}, {"name": "eval_s1", "type": "uint256"}, {"name": "eval_s2", "type": "uint256"}, {"name": "eval_zw", "type": "uint256"}], "VerificationKey": [{"name": "Qm", "type": "byte[96]"}, {"name": "Ql", "type": "byte[96]"}, {"name": "Qr", "type": "byte[96]"}, {"name": "Qo", "type": "byte[96]"}, {"name": "Qc", "type": "byte[96]"}, {"name": "S1", "type": "byte[96]"}, {"name": "S2", "type": "byte[96]"}, {"name": "S3", "type": "byte[96]"}, {"name": "power", "type": "uint64"}, {"name": "nPublic", "type": "uint64"}, {"name": "k1", "type": "uint64"}, {"name": "k2", "type": "uint64"}, {"name": "X_2", "type": "byte[192]"}]}, "byteCode": {"approval": "CiAQIGABAIADwAGgAuADwASgBYAGiAaQBpgGoAbgByYGIHPtp1MpnX1IMznYCAmh2AVTvaQC//5b/v////8AAAABAAEBIHPtp1MpnX1IMznYCAmh2AVTvaQC//5b/v////8AAAAAAAAxG0EANoICBJXBDOQEC6l5YTYaAI4CABYAAQAxGRREMRhENhoBNhoCNhoDiABQJEMxGYECEkQxGEQkQzEZQP/aMRgURCRDigIBi/4oqov/KKpMKKBMoSiqiYoBAYv/FSIORCKvi/+rSRUiEkSJigEBi/8CKKpJFSIORCKvq4mKAwAlRxUpRwInBEkVJUsBDyVLAk8CTSNLAg8jSwNPAk1LA08CSwJSSRUjEkQhBUsDDyEFSwRPAk1LBE8DSwJSSRUjEkQhBksEDyEGSwVPAk1LBU8DSwJSSRUjEkQhBEsFDyEESwZPAk1LBk8DSwJSSRUjEkQhB0sGDyEHSwdPAk1LB08DSwJSSRUjEkQhCEsHDyEISwhPAk1LCE8DSwJSSRUjEkQhCUsIDyEJSwlPAk1LCU8DSwJSSRUjEkQhCksJDyEKSwpPAk1LCk8DSwJSSRUjEkQhC0sKDyELSwtPAk1LC08DSwJSFyEMSwsPIQxLDE8CTUsMTwNLAlIXIQ1LDA8hDUsNTwJNSw1PA0sCUhchDksNDyEOSw5PAk1LDk8DSwJSFyEPSw4PIQ9PD08CTU8OTwNPAlJJFSEFEkRPDE8MUE8LUE8KUE8JUE8IUE8HUE8GUE8FFlBPBBZQTwMWUE8CFlBMUEmL/lcAYElOAuQCRIv+V2BgSU4C5AJEi/5XwGBJTgLkAkSL/iEGI1hJTgLkAkSL/iEEI1hJTgLkAkSL/iEHI1hJTgLkAkSL/iEII1hJTgLkAkSL/iEJI1hJTgLkAkSL/iEKI1hJTgLkAkSL/oHgBiJYSU4CKKREi/6BgAciWElOAiikRIv+gaAHIlhJTgIopESL/oHAByJYSU4CKKREi/4hDyJYSU4CKKREi/6BgAgiWElOAiikRIv9JVlJTwIhC1tJTgISRCWLK4spDEEAGIv9VwIAiytJTgIiCyJYKKREJAiMK0L/4IsZSVcAYEsBV2BgUEsBV8BgUEsBIQYjWFBJjAlLASEEI1hJjAJQSwEhByNYSYwDUEsBIQgjWEmMBFBMIQkjWEmMBVCMCyWMK4sriykMQQAgi/1XAgCLK0lOAiILIlgoqoj9KosLTFCMCyQIjCtC/9iLC4saUIsbUIscUIj9I0mI/R9QSYwLix1QiP0VSYwGix5Qix9QiyBQiP0GSYwUiyNQiyRQiyVQiyZQiydQiyhQIQWvTIj86lwgjAyBAowXixeBBgxBAC2LF0kkCSILiwxJTwIiWEsBVyAgoyiqSRUiDkQir6tLAiILTF2MDCQIjBdC/8uLIYsiUEmMCoj8oosLiwZQixRQiwxQTFCAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQSYwHSVcAIIAEYmV0YbCwSVcgIIAFZ2FtbWGwsElXQCCABWFscGhhsLBJV2AgSYwPgAJ4abCwgcACIliAAXWwsIv/VwIgSYwQKKREi/9XIiBJjBEopEQljBeL/yVZi/8Vi/9OAlJJjAAlWUmMFosXDUEAGIsAVwIAixdJTgIiCyJYKKREJAiMF0L/ziSMGCWMF4sPjBWLGSEKW4sXDUEAGIsVSaMoqowVixiBAguMGIsXJAiMF0L/3YsVSRUiDkQir0mMAUxLAauLEEsBqEQqiPtZSRUiDkSrixGoRIsqQATJJCQIixYORIsPKqlEiweB4AKLEF0hBIsRXUmMB0mB4AIiWEmMD4ADeGlusLBJIQQiWEmMEIACemiwsFeAwElXICBJjBGABHZbMV2wsElXQCBJjBKABHZbMl2wsElXYCBJjBOABHZbM12wsElXgCBJjA2ABHZbNF2wsFegIEmMDoAEdls1XbCwKYwIJYwXixeLKQxBAC6L/VcCAIsXSU4CIgsiWCiqTCQISYwXiwBXAgBMIgsiWKMoqosITIj6jIwIQv/KiwhJFSIORIsBSU4Cq4sAVyIggAZMMSh4aSmwSbCABlBJKHhpKbBLAbCLB0lOAldAIElLAaMoqk8CoyiqSwJXACBJiyZJTgijKKqLI0lOByiqTCiqSwGgKKpLBVcgIEwoqkwoqkxLAaAoqksDiydJTgyjKKqLJElOBCiqTCiqSwGgKKooqksDoCiqiyVJTg4oqklLBaAoqk8ETwOjKKpJTwKjKKqLKElODqMoqksJoyiqTwtLCYj5z0yI+ctJFSIORE8Nq4ACcjCwSbCLCYseUIsfUIsgUIsCUEsMSwejKKopixBJTgKI+Z6LD0lOAksDoyiqKUyI+Y9LAk8DoyiqTwOjKKopTIj5fksPV2AgSw1LAaMoqkkoqk8OoCiqKKpLDKAoqosZSU4DIQyBCFhLAqMoqiiqTw2gKKooqksNoCiqSwMhDYEIWE8DoyiqKKpPDKAoqiiqTwygKKpOAqMoqqMoqksNoyiqKKpPDCiqoCiqTw2BwAIiWEwoqksBKKqgKKpPDU8NoyiqSw6jKKpPC6Moqk8Jix1QiwVQixpQixtQixxQiwNQiwRQTwmI+OtLDIj45lBLC4j44FBLDoj42lBPCYj41FBPCIj4zlBPB4j4yFAqiPjDUE8DiPi9UClPA4j4o4j4s1CLEUlOAlCLEklOA1CLE0lOBFCLDUlOBVCLDklOB1BPBUzjAkkVIxJEgAFGsEmwTE8LoyiqTwmI+GZPAk8JoyiqTCiqTCiqoCiqTwJPCaMoqkwoqkwoqqAoqk8CTwmjKKpMKKpMKKqgKKpPAk8HoyiqTCiqTCiqoCiqSwJPBqMoqkwoqkwoqqAoqoBgF/HTpzGX15QmlWOMT6msD8NojE+XdLkFoU46PxcbrFhsVeg/+Xoa7/s68ArbIsa7CLP0geOqoPGgnjDtdB2K5Pz14JXV0Ar2ANsYyywEs+3QPMdEooiK5AyqIylGxefhTOECSRUjEkSAAUWwSbCLIksD4QJJFSMSRIshTOACSRUjEkRPA0sFoyiqJwWjKKqI95VPBUxQiwpM4wJJFSMSRE8D4AJJFSMSRE8CK+ECSRUjEkTgAkkVIxJETCvhAkkVIxJETFBMIQ4hBViAwAECSqKy8I8KkSYIBSctxRBRxuR61PpAOwK0UQtkeuPRdwusAyaoBbvv1IBWyMEhvbgT4CtgUnGfYH2s06CIJ09lWWvQ0Jkgthq12mG73H9QSTNM8RITlF1X5ax9BV0EK34M5dUncn1uEYzJzcbaLjUarf2bqoy906dtQpppUWDRLJI6ycw7rKKJ4ZNUhgi4KAEGBsSgLqc0zDKs0rArwouZyz4ofoWnY68mdJKrVy6Zqz83DSdc7B2hqqkHX/Bfeb5Q4gJEiYsqQvsz", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBAYWxnb3JhbmRmb3VuZGF0aW9uL2FsZ29yYW5kLXR5cGVzY3JpcHQvYXJjNC9pbmRleC5kLnRzOjpDb250cmFjdC5hcHByb3ZhbFByb2dyYW0oKSAtPiB1aW50NjQ6Cm1haW46CiAgICBpbnRjYmxvY2sgMzIgOTYgMSAwIDM4NCAxOTIgMjg4IDQ4MCA1NzYgNjcyIDc2OCA3NzYgNzg0IDc5MiA4MDAgOTkyCiAgICBieXRlY2Jsb2NrIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMSAweCAweDAxIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMCBUTVBMX1ZFUklGSUNBVElPTl9LRVkgVE1QTF9ST09UX09GX1VOSVRZCiAgICAvLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czozMAogICAgLy8gZXhwb3J0IGNsYXNzIFBsb25rVmVyaWZpZXJXaXRoTG9ncyBleHRlbmRzIENvbnRyYWN0IHsKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0A3CiAgICBwdXNoYnl0ZXNzIDB4OTVjMTBjZTQgMHgwYmE5Nzk2MSAvLyBtZXRob2QgIl9kdW1teSgoYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LGJ5dGVbMTkyXSkpdm9pZCIsIG1ldGhvZCAidmVyaWZ5KHVpbnQyNTZbXSwoYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sYnl0ZVs5Nl0sdWludDI1Nix1aW50MjU2LHVpbnQyNTYsdWludDI1Nix1aW50MjU2LHVpbnQyNTYpLCh1aW50MjU2W10sdWludDI1Nix1aW50MjU2KSl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9fZHVtbXlfcm91dGVAMyBtYWluX3ZlcmlmeV9yb3V0ZUA0CgptYWluX2FmdGVyX2lmX2Vsc2VAMTE6CiAgICBlcnIKCm1haW5fdmVyaWZ5X3JvdXRlQDQ6CiAgICAvLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czozNQogICAgLy8gdmVyaWZ5KHNpZ25hbHM6IFB1YmxpY1NpZ25hbHMsIHByb29mOiBQcm9vZiwgbHc6IExhZ3JhbmdlV2l0bmVzcyk6IHZvaWQgewogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czozMAogICAgLy8gZXhwb3J0IGNsYXNzIFBsb25rVmVyaWZpZXJXaXRoTG9ncyBleHRlbmRzIENvbnRyYWN0IHsKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIC8vIGNvbnRyYWN0cy92ZXJpZmllci5hbGdvLnRzOjM1CiAgICAvLyB2ZXJpZnkoc2lnbmFsczogUHVibGljU2lnbmFscywgcHJvb2Y6IFByb29mLCBsdzogTGFncmFuZ2VXaXRuZXNzKTogdm9pZCB7CiAgICBjYWxsc3ViIHZlcmlmeQogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKbWFpbl9fZHVtbXlfcm91dGVAMzoKICAgIC8vIGNvbnRyYWN0cy92ZXJpZmllci5hbGdvLnRzOjMyCiAgICAvLyBAYWJpbWV0aG9kKHsgYWxsb3dBY3Rpb25zOiAiQ2xvc2VPdXQiIH0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBwdXNoaW50IDIgLy8gQ2xvc2VPdXQKICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBDbG9zZU91dAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBpbnRjXzIgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0A3OgogICAgLy8gY29udHJhY3RzL3ZlcmlmaWVyLmFsZ28udHM6MzAKICAgIC8vIGV4cG9ydCBjbGFzcyBQbG9ua1ZlcmlmaWVyV2l0aExvZ3MgZXh0ZW5kcyBDb250cmFjdCB7CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDExCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKCi8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjpmclN1YihhOiBieXRlcywgYjogYnl0ZXMpIC0+IGJ5dGVzOgpmclN1YjoKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjEzMwogICAgLy8gZnVuY3Rpb24gZnJTdWIoYTogYmlndWludCwgYjogYmlndWludCk6IGJpZ3VpbnQgewogICAgcHJvdG8gMiAxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxMzUKICAgIC8vIGNvbnN0IGFOOiBiaWd1aW50ID0gYSAlIHI7CiAgICBmcmFtZV9kaWcgLTIKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTM2CiAgICAvLyBjb25zdCBiTjogYmlndWludCA9IGIgJSByOwogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjEzNwogICAgLy8gcmV0dXJuIChhTiArIHIgLSBiTikgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIrCiAgICBzd2FwCiAgICBiLQogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICByZXRzdWIKCgovLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo6YjMyKGE6IGJ5dGVzKSAtPiBieXRlczoKYjMyOgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTY1CiAgICAvLyBmdW5jdGlvbiBiMzIoYTogYmlndWludCk6IGJ5dGVzPDMyPiB7CiAgICBwcm90byAxIDEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE2NgogICAgLy8gcmV0dXJuIG5ldyBVaW50MjU2KGEpLmJ5dGVzLnRvRml4ZWQoeyBsZW5ndGg6IDMyIH0pOwogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGludGNfMCAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgaW50Y18wIC8vIDMyCiAgICBiemVybwogICAgZnJhbWVfZGlnIC0xCiAgICBifAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSAzMgogICAgcmV0c3ViCgoKLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OmdldENoYWxsZW5nZSh0ZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRDaGFsbGVuZ2U6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1MTcKICAgIC8vIGV4cG9ydCBmdW5jdGlvbiBnZXRDaGFsbGVuZ2UodGQ6IGJ5dGVzKTogVWludDI1NiB7CiAgICBwcm90byAxIDEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjUxOAogICAgLy8gbGV0IGhhc2ggPSBvcC5rZWNjYWsyNTYodGQpOwogICAgZnJhbWVfZGlnIC0xCiAgICBrZWNjYWsyNTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE1OAogICAgLy8gcmV0dXJuIGEgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjUxOQogICAgLy8gcmV0dXJuIG5ldyBVaW50MjU2KGZyU2NhbGFyKEJpZ1VpbnQoaGFzaCkpKTsKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGludGNfMCAvLyAzMgogICAgYnplcm8KICAgIGJ8CiAgICByZXRzdWIKCgovLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czo6UGxvbmtWZXJpZmllcldpdGhMb2dzLnZlcmlmeShzaWduYWxzOiBieXRlcywgcHJvb2Y6IGJ5dGVzLCBsdzogYnl0ZXMpIC0+IHZvaWQ6CnZlcmlmeToKICAgIC8vIGNvbnRyYWN0cy92ZXJpZmllci5hbGdvLnRzOjM1CiAgICAvLyB2ZXJpZnkoc2lnbmFsczogUHVibGljU2lnbmFscywgcHJvb2Y6IFByb29mLCBsdzogTGFncmFuZ2VXaXRuZXNzKTogdm9pZCB7CiAgICBwcm90byAzIDAKICAgIGludGNfMyAvLyAwCiAgICBkdXBuIDIxCiAgICBieXRlY18xIC8vICIiCiAgICBkdXBuIDIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMyNwogICAgLy8gcmV0dXJuIHZlcmlmeVdpdGhMb2dzKGRlY29kZVZrKHZrQnl0ZXMpLCBzaWduYWxzLCBwcm9vZiwgbHcpOwogICAgYnl0ZWMgNCAvLyBUTVBMX1ZFUklGSUNBVElPTl9LRVkKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMwMQogICAgLy8gUW06IHZrQnl0ZXMuc2xpY2UoMCwgOTYpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAwCiAgICBkaWcgMQogICAgPj0KICAgIGludGNfMyAvLyAwCiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGludGNfMSAvLyA5NgogICAgZGlnIDIKICAgID49CiAgICBpbnRjXzEgLy8gOTYKICAgIGRpZyAzCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDMKICAgIHVuY292ZXIgMgogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMwMgogICAgLy8gUWw6IHZrQnl0ZXMuc2xpY2UoOTYsIDE5MikudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICBpbnRjIDUgLy8gMTkyCiAgICBkaWcgMwogICAgPj0KICAgIGludGMgNSAvLyAxOTIKICAgIGRpZyA0CiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDQKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMwMwogICAgLy8gUXI6IHZrQnl0ZXMuc2xpY2UoMTkyLCAyODgpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgaW50YyA2IC8vIDI4OAogICAgZGlnIDQKICAgID49CiAgICBpbnRjIDYgLy8gMjg4CiAgICBkaWcgNQogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyA1CiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDk2CiAgICA9PQogICAgYXNzZXJ0IC8vIExlbmd0aCBtdXN0IGJlIDk2CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozMDQKICAgIC8vIFFvOiB2a0J5dGVzLnNsaWNlKDI4OCwgMzg0KS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIGludGMgNCAvLyAzODQKICAgIGRpZyA1CiAgICA+PQogICAgaW50YyA0IC8vIDM4NAogICAgZGlnIDYKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgNgogICAgdW5jb3ZlciAzCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzA1CiAgICAvLyBRYzogdmtCeXRlcy5zbGljZSgzODQsIDQ4MCkudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICBpbnRjIDcgLy8gNDgwCiAgICBkaWcgNgogICAgPj0KICAgIGludGMgNyAvLyA0ODAKICAgIGRpZyA3CiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDcKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMwNgogICAgLy8gUzE6IHZrQnl0ZXMuc2xpY2UoNDgwLCA1NzYpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgaW50YyA4IC8vIDU3NgogICAgZGlnIDcKICAgID49CiAgICBpbnRjIDggLy8gNTc2CiAgICBkaWcgOAogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyA4CiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDk2CiAgICA9PQogICAgYXNzZXJ0IC8vIExlbmd0aCBtdXN0IGJlIDk2CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozMDcKICAgIC8vIFMyOiB2a0J5dGVzLnNsaWNlKDU3NiwgNjcyKS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIGludGMgOSAvLyA2NzIKICAgIGRpZyA4CiAgICA+PQogICAgaW50YyA5IC8vIDY3MgogICAgZGlnIDkKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgOQogICAgdW5jb3ZlciAzCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzA4CiAgICAvLyBTMzogdmtCeXRlcy5zbGljZSg2NzIsIDc2OCkudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICBpbnRjIDEwIC8vIDc2OAogICAgZGlnIDkKICAgID49CiAgICBpbnRjIDEwIC8vIDc2OAogICAgZGlnIDEwCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDEwCiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDk2CiAgICA9PQogICAgYXNzZXJ0IC8vIExlbmd0aCBtdXN0IGJlIDk2CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozMDkKICAgIC8vIHBvd2VyOiBvcC5idG9pKHZrQnl0ZXMuc2xpY2UoNzY4LCA3NzYpKSwKICAgIGludGMgMTEgLy8gNzc2CiAgICBkaWcgMTAKICAgID49CiAgICBpbnRjIDExIC8vIDc3NgogICAgZGlnIDExCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDExCiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBidG9pCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozMTAKICAgIC8vIG5QdWJsaWM6IG9wLmJ0b2kodmtCeXRlcy5zbGljZSg3NzYsIDc4NCkpLAogICAgaW50YyAxMiAvLyA3ODQKICAgIGRpZyAxMQogICAgPj0KICAgIGludGMgMTIgLy8gNzg0CiAgICBkaWcgMTIKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgMTIKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGJ0b2kKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMxMQogICAgLy8gazE6IG9wLmJ0b2kodmtCeXRlcy5zbGljZSg3ODQsIDc5MikpLAogICAgaW50YyAxMyAvLyA3OTIKICAgIGRpZyAxMgogICAgPj0KICAgIGludGMgMTMgLy8gNzkyCiAgICBkaWcgMTMKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgMTMKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGJ0b2kKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMxMgogICAgLy8gazI6IG9wLmJ0b2kodmtCeXRlcy5zbGljZSg3OTIsIDgwMCkpLAogICAgaW50YyAxNCAvLyA4MDAKICAgIGRpZyAxMwogICAgPj0KICAgIGludGMgMTQgLy8gODAwCiAgICBkaWcgMTQKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgMTQKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGJ0b2kKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjMxMwogICAgLy8gWF8yOiB2a0J5dGVzLnNsaWNlKDgwMCwgOTkyKS50b0ZpeGVkKHsgbGVuZ3RoOiAxOTIgfSksCiAgICBpbnRjIDE1IC8vIDk5MgogICAgZGlnIDE0CiAgICA+PQogICAgaW50YyAxNSAvLyA5OTIKICAgIHVuY292ZXIgMTUKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICB1bmNvdmVyIDE0CiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBsZW4KICAgIGludGMgNSAvLyAxOTIKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgMTkyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozMDAtMzE0CiAgICAvLyByZXR1cm4gewogICAgLy8gICBRbTogdmtCeXRlcy5zbGljZSgwLCA5NikudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICAvLyAgIFFsOiB2a0J5dGVzLnNsaWNlKDk2LCAxOTIpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgLy8gICBRcjogdmtCeXRlcy5zbGljZSgxOTIsIDI4OCkudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICAvLyAgIFFvOiB2a0J5dGVzLnNsaWNlKDI4OCwgMzg0KS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIC8vICAgUWM6IHZrQnl0ZXMuc2xpY2UoMzg0LCA0ODApLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgLy8gICBTMTogdmtCeXRlcy5zbGljZSg0ODAsIDU3NikudG9GaXhlZCh7IGxlbmd0aDogOTYgfSksCiAgICAvLyAgIFMyOiB2a0J5dGVzLnNsaWNlKDU3NiwgNjcyKS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwKICAgIC8vICAgUzM6IHZrQnl0ZXMuc2xpY2UoNjcyLCA3NjgpLnRvRml4ZWQoeyBsZW5ndGg6IDk2IH0pLAogICAgLy8gICBwb3dlcjogb3AuYnRvaSh2a0J5dGVzLnNsaWNlKDc2OCwgNzc2KSksCiAgICAvLyAgIG5QdWJsaWM6IG9wLmJ0b2kodmtCeXRlcy5zbGljZSg3NzYsIDc4NCkpLAogICAgLy8gICBrMTogb3AuYnRvaSh2a0J5dGVzLnNsaWNlKDc4NCwgNzkyKSksCiAgICAvLyAgIGsyOiBvcC5idG9pKHZrQnl0ZXMuc2xpY2UoNzkyLCA4MDApKSwKICAgIC8vICAgWF8yOiB2a0J5dGVzLnNsaWNlKDgwMCwgOTkyKS50b0ZpeGVkKHsgbGVuZ3RoOiAxOTIgfSksCiAgICAvLyB9OwogICAgdW5jb3ZlciAxMgogICAgdW5jb3ZlciAxMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDExCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTAKICAgIGNvbmNhdAogICAgdW5jb3ZlciA5CiAgICBjb25jYXQKICAgIHVuY292ZXIgOAogICAgY29uY2F0CiAgICB1bmNvdmVyIDcKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDA2CiAgICAvLyBhc3NlcnQoZ3JvdXBDaGVjayhwcm9vZi5BKSwgIkEgbm90IGluIEcxIik7CiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMCA5NgogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDQKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLnN1Ymdyb3VwQ2hlY2sob3AuRWMuQkxTMTJfMzgxZzEsIHApOwogICAgZWNfc3ViZ3JvdXBfY2hlY2sgQkxTMTJfMzgxZzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQwNgogICAgLy8gYXNzZXJ0KGdyb3VwQ2hlY2socHJvb2YuQSksICJBIG5vdCBpbiBHMSIpOwogICAgYXNzZXJ0IC8vIEEgbm90IGluIEcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MDcKICAgIC8vIGFzc2VydChncm91cENoZWNrKHByb29mLkIpLCAiQiBub3QgaW4gRzEiKTsKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCA5NiA5NgogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDQKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLnN1Ymdyb3VwQ2hlY2sob3AuRWMuQkxTMTJfMzgxZzEsIHApOwogICAgZWNfc3ViZ3JvdXBfY2hlY2sgQkxTMTJfMzgxZzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQwNwogICAgLy8gYXNzZXJ0KGdyb3VwQ2hlY2socHJvb2YuQiksICJCIG5vdCBpbiBHMSIpOwogICAgYXNzZXJ0IC8vIEIgbm90IGluIEcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MDgKICAgIC8vIGFzc2VydChncm91cENoZWNrKHByb29mLkMpLCAiQyBub3QgaW4gRzEiKTsKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAxOTIgOTYKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzQ0CiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5zdWJncm91cENoZWNrKG9wLkVjLkJMUzEyXzM4MWcxLCBwKTsKICAgIGVjX3N1Ymdyb3VwX2NoZWNrIEJMUzEyXzM4MWcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MDgKICAgIC8vIGFzc2VydChncm91cENoZWNrKHByb29mLkMpLCAiQyBub3QgaW4gRzEiKTsKICAgIGFzc2VydCAvLyBDIG5vdCBpbiBHMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDA5CiAgICAvLyBhc3NlcnQoZ3JvdXBDaGVjayhwcm9vZi5aKSwgIlogbm90IGluIEcxIik7CiAgICBmcmFtZV9kaWcgLTIKICAgIGludGMgNiAvLyAyODgKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzQ0CiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5zdWJncm91cENoZWNrKG9wLkVjLkJMUzEyXzM4MWcxLCBwKTsKICAgIGVjX3N1Ymdyb3VwX2NoZWNrIEJMUzEyXzM4MWcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MDkKICAgIC8vIGFzc2VydChncm91cENoZWNrKHByb29mLlopLCAiWiBub3QgaW4gRzEiKTsKICAgIGFzc2VydCAvLyBaIG5vdCBpbiBHMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDEwCiAgICAvLyBhc3NlcnQoZ3JvdXBDaGVjayhwcm9vZi5UMSksICJUMSBub3QgaW4gRzEiKTsKICAgIGZyYW1lX2RpZyAtMgogICAgaW50YyA0IC8vIDM4NAogICAgaW50Y18xIC8vIDk2CiAgICBleHRyYWN0MwogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDQKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLnN1Ymdyb3VwQ2hlY2sob3AuRWMuQkxTMTJfMzgxZzEsIHApOwogICAgZWNfc3ViZ3JvdXBfY2hlY2sgQkxTMTJfMzgxZzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQxMAogICAgLy8gYXNzZXJ0KGdyb3VwQ2hlY2socHJvb2YuVDEpLCAiVDEgbm90IGluIEcxIik7CiAgICBhc3NlcnQgLy8gVDEgbm90IGluIEcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MTEKICAgIC8vIGFzc2VydChncm91cENoZWNrKHByb29mLlQyKSwgIlQyIG5vdCBpbiBHMSIpOwogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjIDcgLy8gNDgwCiAgICBpbnRjXzEgLy8gOTYKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM0NAogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc3ViZ3JvdXBDaGVjayhvcC5FYy5CTFMxMl8zODFnMSwgcCk7CiAgICBlY19zdWJncm91cF9jaGVjayBCTFMxMl8zODFnMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDExCiAgICAvLyBhc3NlcnQoZ3JvdXBDaGVjayhwcm9vZi5UMiksICJUMiBub3QgaW4gRzEiKTsKICAgIGFzc2VydCAvLyBUMiBub3QgaW4gRzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQxMgogICAgLy8gYXNzZXJ0KGdyb3VwQ2hlY2socHJvb2YuVDMpLCAiVDMgbm90IGluIEcxIik7CiAgICBmcmFtZV9kaWcgLTIKICAgIGludGMgOCAvLyA1NzYKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzQ0CiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5zdWJncm91cENoZWNrKG9wLkVjLkJMUzEyXzM4MWcxLCBwKTsKICAgIGVjX3N1Ymdyb3VwX2NoZWNrIEJMUzEyXzM4MWcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MTIKICAgIC8vIGFzc2VydChncm91cENoZWNrKHByb29mLlQzKSwgIlQzIG5vdCBpbiBHMSIpOwogICAgYXNzZXJ0IC8vIFQzIG5vdCBpbiBHMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDEzCiAgICAvLyBhc3NlcnQoZ3JvdXBDaGVjayhwcm9vZi5XeGkpLCAiV3hpIG5vdCBpbiBHMSIpOwogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjIDkgLy8gNjcyCiAgICBpbnRjXzEgLy8gOTYKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM0NAogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc3ViZ3JvdXBDaGVjayhvcC5FYy5CTFMxMl8zODFnMSwgcCk7CiAgICBlY19zdWJncm91cF9jaGVjayBCTFMxMl8zODFnMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDEzCiAgICAvLyBhc3NlcnQoZ3JvdXBDaGVjayhwcm9vZi5XeGkpLCAiV3hpIG5vdCBpbiBHMSIpOwogICAgYXNzZXJ0IC8vIFd4aSBub3QgaW4gRzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQxNAogICAgLy8gYXNzZXJ0KGdyb3VwQ2hlY2socHJvb2YuV3hpdyksICJXeGl3IG5vdCBpbiBHMSIpOwogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjIDEwIC8vIDc2OAogICAgaW50Y18xIC8vIDk2CiAgICBleHRyYWN0MwogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDQKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLnN1Ymdyb3VwQ2hlY2sob3AuRWMuQkxTMTJfMzgxZzEsIHApOwogICAgZWNfc3ViZ3JvdXBfY2hlY2sgQkxTMTJfMzgxZzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQxNAogICAgLy8gYXNzZXJ0KGdyb3VwQ2hlY2socHJvb2YuV3hpdyksICJXeGl3IG5vdCBpbiBHMSIpOwogICAgYXNzZXJ0IC8vIFd4aXcgbm90IGluIEcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozOTcKICAgIC8vIGFzc2VydChpbkZpZWxkKHByb29mLmV2YWxfYSksICJldmFsX2Egbm90IGluIEZyIik7CiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hpbnQgODY0IC8vIDg2NAogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MwogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDgKICAgIC8vIHJldHVybiB2YWx1ZS5uYXRpdmUgPCBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYjwKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM5NwogICAgLy8gYXNzZXJ0KGluRmllbGQocHJvb2YuZXZhbF9hKSwgImV2YWxfYSBub3QgaW4gRnIiKTsKICAgIGFzc2VydCAvLyBldmFsX2Egbm90IGluIEZyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozOTgKICAgIC8vIGFzc2VydChpbkZpZWxkKHByb29mLmV2YWxfYiksICJldmFsX2Igbm90IGluIEZyIik7CiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hpbnQgODk2IC8vIDg5NgogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MwogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDgKICAgIC8vIHJldHVybiB2YWx1ZS5uYXRpdmUgPCBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYjwKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM5OAogICAgLy8gYXNzZXJ0KGluRmllbGQocHJvb2YuZXZhbF9iKSwgImV2YWxfYiBub3QgaW4gRnIiKTsKICAgIGFzc2VydCAvLyBldmFsX2Igbm90IGluIEZyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozOTkKICAgIC8vIGFzc2VydChpbkZpZWxkKHByb29mLmV2YWxfYyksICJldmFsX2Mgbm90IGluIEZyIik7CiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hpbnQgOTI4IC8vIDkyOAogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MwogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDgKICAgIC8vIHJldHVybiB2YWx1ZS5uYXRpdmUgPCBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYjwKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM5OQogICAgLy8gYXNzZXJ0KGluRmllbGQocHJvb2YuZXZhbF9jKSwgImV2YWxfYyBub3QgaW4gRnIiKTsKICAgIGFzc2VydCAvLyBldmFsX2Mgbm90IGluIEZyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MDAKICAgIC8vIGFzc2VydChpbkZpZWxkKHByb29mLmV2YWxfczEpLCAiZXZhbF9zMSBub3QgaW4gRnIiKTsKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCA5NjAgLy8gOTYwCiAgICBpbnRjXzAgLy8gMzIKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM0OAogICAgLy8gcmV0dXJuIHZhbHVlLm5hdGl2ZSA8IEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiPAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDAwCiAgICAvLyBhc3NlcnQoaW5GaWVsZChwcm9vZi5ldmFsX3MxKSwgImV2YWxfczEgbm90IGluIEZyIik7CiAgICBhc3NlcnQgLy8gZXZhbF9zMSBub3QgaW4gRnIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQwMQogICAgLy8gYXNzZXJ0KGluRmllbGQocHJvb2YuZXZhbF9zMiksICJldmFsX3MyIG5vdCBpbiBGciIpOwogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjIDE1IC8vIDk5MgogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MwogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDgKICAgIC8vIHJldHVybiB2YWx1ZS5uYXRpdmUgPCBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYjwKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQwMQogICAgLy8gYXNzZXJ0KGluRmllbGQocHJvb2YuZXZhbF9zMiksICJldmFsX3MyIG5vdCBpbiBGciIpOwogICAgYXNzZXJ0IC8vIGV2YWxfczIgbm90IGluIEZyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MDIKICAgIC8vIGFzc2VydChpbkZpZWxkKHByb29mLmV2YWxfencpLCAiZXZhbF96dyBub3QgaW4gRnIiKTsKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCAxMDI0IC8vIDEwMjQKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzQ4CiAgICAvLyByZXR1cm4gdmFsdWUubmF0aXZlIDwgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGI8CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0MDIKICAgIC8vIGFzc2VydChpbkZpZWxkKHByb29mLmV2YWxfencpLCAiZXZhbF96dyBub3QgaW4gRnIiKTsKICAgIGFzc2VydCAvLyBldmFsX3p3IG5vdCBpbiBGcgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6Mzg5CiAgICAvLyBhc3NlcnQoc2lnbmFscy5sZW5ndGggPT09IHZrLm5QdWJsaWMsICJJbnZhbGlkIG51bWJlciBvZiBwdWJsaWMgaW5wdXRzIik7CiAgICBmcmFtZV9kaWcgLTMKICAgIGludGNfMyAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGludGMgMTEgLy8gNzc2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBjb3ZlciAyCiAgICA9PQogICAgYXNzZXJ0IC8vIEludmFsaWQgbnVtYmVyIG9mIHB1YmxpYyBpbnB1dHMKICAgIGludGNfMyAvLyAwCgp2ZXJpZnlfZm9yX2hlYWRlckAyOgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzkxCiAgICAvLyBmb3IgKGNvbnN0IHNpZ25hbCBvZiBzaWduYWxzKSB7CiAgICBmcmFtZV9kaWcgNDMKICAgIGZyYW1lX2RpZyA0MQogICAgPAogICAgYnogdmVyaWZ5X2FmdGVyX2ZvckA0CiAgICBmcmFtZV9kaWcgLTMKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgNDMKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18wIC8vIDMyCiAgICAqCiAgICBpbnRjXzAgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzQ4CiAgICAvLyByZXR1cm4gdmFsdWUubmF0aXZlIDwgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGI8CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozOTIKICAgIC8vIGFzc2VydChpbkZpZWxkKHNpZ25hbCksICJwdWJsaWMgc2lnbmFsIG5vdCBpbiBGciIpOwogICAgYXNzZXJ0IC8vIHB1YmxpYyBzaWduYWwgbm90IGluIEZyCiAgICBpbnRjXzIgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA0MwogICAgYiB2ZXJpZnlfZm9yX2hlYWRlckAyCgp2ZXJpZnlfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1MzQKICAgIC8vIGxldCB0ZCA9IG9wLmNvbmNhdCh2ay5RbSwgdmsuUWwpOwogICAgZnJhbWVfZGlnIDI1CiAgICBkdXAKICAgIGV4dHJhY3QgMCA5NgogICAgZGlnIDEKICAgIGV4dHJhY3QgOTYgOTYKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTM1CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgdmsuUXIpOwogICAgZGlnIDEKICAgIGV4dHJhY3QgMTkyIDk2CiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjUzNgogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHZrLlFvKTsKICAgIGRpZyAxCiAgICBpbnRjIDYgLy8gMjg4CiAgICBpbnRjXzEgLy8gOTYKICAgIGV4dHJhY3QzCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSA5CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1MzcKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCB2ay5RYyk7CiAgICBkaWcgMQogICAgaW50YyA0IC8vIDM4NAogICAgaW50Y18xIC8vIDk2CiAgICBleHRyYWN0MwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDIKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTM4CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgdmsuUzEpOwogICAgZGlnIDEKICAgIGludGMgNyAvLyA0ODAKICAgIGludGNfMSAvLyA5NgogICAgZXh0cmFjdDMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAzCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjUzOQogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHZrLlMyKTsKICAgIGRpZyAxCiAgICBpbnRjIDggLy8gNTc2CiAgICBpbnRjXzEgLy8gOTYKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNAogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1NDAKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCB2ay5TMyk7CiAgICBzd2FwCiAgICBpbnRjIDkgLy8gNjcyCiAgICBpbnRjXzEgLy8gOTYKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNQogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDExCiAgICBpbnRjXzMgLy8gMAogICAgZnJhbWVfYnVyeSA0MwoKdmVyaWZ5X2Zvcl9oZWFkZXJANzoKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU0MgogICAgLy8gZm9yIChjb25zdCBzaWduYWwgb2Ygc2lnbmFscykgewogICAgZnJhbWVfZGlnIDQzCiAgICBmcmFtZV9kaWcgNDEKICAgIDwKICAgIGJ6IHZlcmlmeV9hZnRlcl9mb3JAOQogICAgZnJhbWVfZGlnIC0zCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDQzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMCAvLyAzMgogICAgKgogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE1OAogICAgLy8gcmV0dXJuIGEgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU0MwogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIGIzMihmclNjYWxhcihzaWduYWwubmF0aXZlKSkpOwogICAgY2FsbHN1YiBiMzIKICAgIGZyYW1lX2RpZyAxMQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDExCiAgICBpbnRjXzIgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA0MwogICAgYiB2ZXJpZnlfZm9yX2hlYWRlckA3Cgp2ZXJpZnlfYWZ0ZXJfZm9yQDk6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1NDcKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5BKTsKICAgIGZyYW1lX2RpZyAxMQogICAgZnJhbWVfZGlnIDI2CiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU0OAogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHByb29mLkIpOwogICAgZnJhbWVfZGlnIDI3CiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU0OQogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHByb29mLkMpOwogICAgZnJhbWVfZGlnIDI4CiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU1MQogICAgLy8gY29uc3QgYmV0YSA9IGdldENoYWxsZW5nZSh0ZCk7CiAgICBjYWxsc3ViIGdldENoYWxsZW5nZQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTU2CiAgICAvLyBjb25zdCBnYW1tYSA9IGdldENoYWxsZW5nZSh0ZCk7CiAgICBkdXAKICAgIGNhbGxzdWIgZ2V0Q2hhbGxlbmdlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1NjMKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBnYW1tYS5ieXRlcyk7CiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTY0CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuWik7CiAgICBmcmFtZV9kaWcgMjkKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTY1CiAgICAvLyBjb25zdCBhbHBoYSA9IGdldENoYWxsZW5nZSh0ZCk7CiAgICBjYWxsc3ViIGdldENoYWxsZW5nZQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU3MgogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHByb29mLlQxKTsKICAgIGZyYW1lX2RpZyAzMAogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1NzMKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5UMik7CiAgICBmcmFtZV9kaWcgMzEKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTc0CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuVDMpOwogICAgZnJhbWVfZGlnIDMyCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU3NQogICAgLy8gY29uc3QgeGkgPSBnZXRDaGFsbGVuZ2UodGQpOwogICAgY2FsbHN1YiBnZXRDaGFsbGVuZ2UKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyMAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTgyCiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuZXZhbF9hLmJ5dGVzKTsKICAgIGZyYW1lX2RpZyAzNQogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1ODMKICAgIC8vIHRkID0gb3AuY29uY2F0KHRkLCBwcm9vZi5ldmFsX2IuYnl0ZXMpOwogICAgZnJhbWVfZGlnIDM2CiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU4NAogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHByb29mLmV2YWxfYy5ieXRlcyk7CiAgICBmcmFtZV9kaWcgMzcKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTg1CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuZXZhbF9zMS5ieXRlcyk7CiAgICBmcmFtZV9kaWcgMzgKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTg2CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuZXZhbF9zMi5ieXRlcyk7CiAgICBmcmFtZV9kaWcgMzkKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTg3CiAgICAvLyB0ZCA9IG9wLmNvbmNhdCh0ZCwgcHJvb2YuZXZhbF96dy5ieXRlcyk7CiAgICBmcmFtZV9kaWcgNDAKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTg5CiAgICAvLyBjb25zdCB2ID0gbmV3IEZpeGVkQXJyYXk8VWludDI1NiwgNj4oKTsKICAgIGludGMgNSAvLyAxOTIKICAgIGJ6ZXJvCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1OTAKICAgIC8vIHZbMV0gPSBnZXRDaGFsbGVuZ2UodGQpOyAvLyB2MQogICAgc3dhcAogICAgY2FsbHN1YiBnZXRDaGFsbGVuZ2UKICAgIHJlcGxhY2UyIDMyIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfYnVyeSAxMgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTkxCiAgICAvLyBmb3IgKGxldCBpOiB1aW50NjQgPSAyOyBpIDwgNjsgaSsrKSB7CiAgICBwdXNoaW50IDIgLy8gMgogICAgZnJhbWVfYnVyeSAyMwoKdmVyaWZ5X3doaWxlX3RvcEAxMDoKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU5MQogICAgLy8gZm9yIChsZXQgaTogdWludDY0ID0gMjsgaSA8IDY7IGkrKykgewogICAgZnJhbWVfZGlnIDIzCiAgICBwdXNoaW50IDYgLy8gNgogICAgPAogICAgYnogdmVyaWZ5X2FmdGVyX3doaWxlQDEyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1OTIKICAgIC8vIHZbaV0gPSBuZXcgVWludDI1Nihmck11bCgodltpIC0gMV0gYXMgVWludDI1NikubmF0aXZlLCB2WzFdLm5hdGl2ZSkpOyAvLyB2W2ldID0gdjFeaQogICAgZnJhbWVfZGlnIDIzCiAgICBkdXAKICAgIGludGNfMiAvLyAxCiAgICAtCiAgICBpbnRjXzAgLy8gMzIKICAgICoKICAgIGZyYW1lX2RpZyAxMgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMQogICAgZXh0cmFjdCAzMiAzMiAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjU5MgogICAgLy8gdltpXSA9IG5ldyBVaW50MjU2KGZyTXVsKCh2W2kgLSAxXSBhcyBVaW50MjU2KS5uYXRpdmUsIHZbMV0ubmF0aXZlKSk7IC8vIHZbaV0gPSB2MV5pCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBpbnRjXzAgLy8gMzIKICAgIGJ6ZXJvCiAgICBifAogICAgZGlnIDIKICAgIGludGNfMCAvLyAzMgogICAgKgogICAgc3dhcAogICAgcmVwbGFjZTMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9idXJ5IDEyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo1OTEKICAgIC8vIGZvciAobGV0IGk6IHVpbnQ2NCA9IDI7IGkgPCA2OyBpKyspIHsKICAgIGludGNfMiAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIzCiAgICBiIHZlcmlmeV93aGlsZV90b3BAMTAKCnZlcmlmeV9hZnRlcl93aGlsZUAxMjoKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjYwMAogICAgLy8gdGQgPSBvcC5jb25jYXQodGQsIHByb29mLld4aXcpOwogICAgZnJhbWVfZGlnIDMzCiAgICBmcmFtZV9kaWcgMzQKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEwCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2MDEKICAgIC8vIGNvbnN0IHUgPSBnZXRDaGFsbGVuZ2UodGQpOwogICAgY2FsbHN1YiBnZXRDaGFsbGVuZ2UKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjYwMy02MTIKICAgIC8vIHJldHVybiB7CiAgICAvLyAgIGJldGEsCiAgICAvLyAgIGdhbW1hLAogICAgLy8gICBhbHBoYSwKICAgIC8vICAgeGksCiAgICAvLyAgIHYsCiAgICAvLyAgIHUsCiAgICAvLyAgIHhpbjogbmV3IFVpbnQyNTYoKSwKICAgIC8vICAgemg6IG5ldyBVaW50MjU2KCksCiAgICAvLyB9OwogICAgZnJhbWVfZGlnIDExCiAgICBmcmFtZV9kaWcgNgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMjAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDEyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDcKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQ3NQogICAgLy8gZGVidWdMb2coImJldGEiLCBjaGFsbGVuZ2VzLmJldGEuYnl0ZXMpOwogICAgZHVwCiAgICBleHRyYWN0IDAgMzIKICAgIHB1c2hieXRlcyAiYmV0YSIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIyMAogICAgLy8gbG9nKG5hbWUpOwogICAgbG9nCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMjEKICAgIC8vIGxvZyh2YWx1ZSk7CiAgICBsb2cKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQ3NgogICAgLy8gZGVidWdMb2coImdhbW1hIiwgY2hhbGxlbmdlcy5nYW1tYS5ieXRlcyk7CiAgICBkdXAKICAgIGV4dHJhY3QgMzIgMzIKICAgIHB1c2hieXRlcyAiZ2FtbWEiCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMjAKICAgIC8vIGxvZyhuYW1lKTsKICAgIGxvZwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjIxCiAgICAvLyBsb2codmFsdWUpOwogICAgbG9nCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0NzcKICAgIC8vIGRlYnVnTG9nKCJhbHBoYSIsIGNoYWxsZW5nZXMuYWxwaGEuYnl0ZXMpOwogICAgZHVwCiAgICBleHRyYWN0IDY0IDMyCiAgICBwdXNoYnl0ZXMgImFscGhhIgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjIwCiAgICAvLyBsb2cobmFtZSk7CiAgICBsb2cKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIyMQogICAgLy8gbG9nKHZhbHVlKTsKICAgIGxvZwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDc4CiAgICAvLyBkZWJ1Z0xvZygieGkiLCBjaGFsbGVuZ2VzLnhpLmJ5dGVzKTsKICAgIGR1cAogICAgZXh0cmFjdCA5NiAzMgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDE1CiAgICBwdXNoYnl0ZXMgInhpIgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjIwCiAgICAvLyBsb2cobmFtZSk7CiAgICBsb2cKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIyMQogICAgLy8gbG9nKHZhbHVlKTsKICAgIGxvZwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDc5CiAgICAvLyBkZWJ1Z0xvZygidSIsIGNoYWxsZW5nZXMudS5ieXRlcyk7CiAgICBwdXNoaW50IDMyMCAvLyAzMjAKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMKICAgIHB1c2hieXRlcyAidSIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIyMAogICAgLy8gbG9nKG5hbWUpOwogICAgbG9nCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMjEKICAgIC8vIGxvZyh2YWx1ZSk7CiAgICBsb2cKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM1MgogICAgLy8gYXNzZXJ0KGluRmllbGQobHcueGluKSwgImx3LnhpbiBub3QgaW4gRnIiKTsKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDMyCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM0OAogICAgLy8gcmV0dXJuIHZhbHVlLm5hdGl2ZSA8IEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiPAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzUyCiAgICAvLyBhc3NlcnQoaW5GaWVsZChsdy54aW4pLCAibHcueGluIG5vdCBpbiBGciIpOwogICAgYXNzZXJ0IC8vIGx3LnhpbiBub3QgaW4gRnIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM1MwogICAgLy8gYXNzZXJ0KGluRmllbGQobHcuemgpLCAibHcuemggbm90IGluIEZyIik7CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMzQgMzIKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxNwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzQ4CiAgICAvLyByZXR1cm4gdmFsdWUubmF0aXZlIDwgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGI8CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNTMKICAgIC8vIGFzc2VydChpbkZpZWxkKGx3LnpoKSwgImx3LnpoIG5vdCBpbiBGciIpOwogICAgYXNzZXJ0IC8vIGx3LnpoIG5vdCBpbiBGcgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzU0CiAgICAvLyBmb3IgKGxldCBpOiB1aW50NjQgPSAwOyBpIDwgbHcuTC5sZW5ndGg7IGkrKykgewogICAgaW50Y18zIC8vIDAKICAgIGZyYW1lX2J1cnkgMjMKCnZlcmlmeV93aGlsZV90b3BAMTU6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNTQKICAgIC8vIGZvciAobGV0IGk6IHVpbnQ2NCA9IDA7IGkgPCBsdy5MLmxlbmd0aDsgaSsrKSB7CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMyAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGZyYW1lX2RpZyAtMQogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGludGNfMyAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDIyCiAgICBmcmFtZV9kaWcgMjMKICAgID4KICAgIGJ6IHZlcmlmeV9hZnRlcl93aGlsZUAxNwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzU0LTM1NQogICAgLy8gZm9yIChsZXQgaTogdWludDY0ID0gMDsgaSA8IGx3LkwubGVuZ3RoOyBpKyspIHsKICAgIC8vICAgYXNzZXJ0KGluRmllbGQobHcuTFtpXSBhcyBVaW50MjU2KSwgImx3Lkwgbm90IGluIEZyIik7CiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAyMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzAgLy8gMzIKICAgICoKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNDgKICAgIC8vIHJldHVybiB2YWx1ZS5uYXRpdmUgPCBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYjwKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM1NQogICAgLy8gYXNzZXJ0KGluRmllbGQobHcuTFtpXSBhcyBVaW50MjU2KSwgImx3Lkwgbm90IGluIEZyIik7CiAgICBhc3NlcnQgLy8gbHcuTCBub3QgaW4gRnIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM1NAogICAgLy8gZm9yIChsZXQgaTogdWludDY0ID0gMDsgaSA8IGx3LkwubGVuZ3RoOyBpKyspIHsKICAgIGludGNfMiAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIzCiAgICBiIHZlcmlmeV93aGlsZV90b3BAMTUKCnZlcmlmeV9hZnRlcl93aGlsZUAxNzoKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM2NwogICAgLy8gbGV0IG5Qb3c6IHVpbnQ2NCA9IDE7CiAgICBpbnRjXzIgLy8gMQogICAgZnJhbWVfYnVyeSAyNAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzY5CiAgICAvLyBmb3IgKGxldCBpOiB1aW50NjQgPSAwOyBpIDwgdmsucG93ZXI7IGkrKykgewogICAgaW50Y18zIC8vIDAKICAgIGZyYW1lX2J1cnkgMjMKICAgIGZyYW1lX2RpZyAxNQogICAgZnJhbWVfYnVyeSAyMQoKdmVyaWZ5X3doaWxlX3RvcEAxODoKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM2OQogICAgLy8gZm9yIChsZXQgaTogdWludDY0ID0gMDsgaSA8IHZrLnBvd2VyOyBpKyspIHsKICAgIGZyYW1lX2RpZyAyNQogICAgaW50YyAxMCAvLyA3NjgKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgMjMKICAgID4KICAgIGJ6IHZlcmlmeV9hZnRlcl93aGlsZUAyMAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgZnJhbWVfZGlnIDIxCiAgICBkdXAKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIGZyYW1lX2J1cnkgMjEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM3MQogICAgLy8gblBvdyAqPSAyOwogICAgZnJhbWVfZGlnIDI0CiAgICBwdXNoaW50IDIgLy8gMgogICAgKgogICAgZnJhbWVfYnVyeSAyNAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzY5CiAgICAvLyBmb3IgKGxldCBpOiB1aW50NjQgPSAwOyBpIDwgdmsucG93ZXI7IGkrKykgewogICAgZnJhbWVfZGlnIDIzCiAgICBpbnRjXzIgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAyMwogICAgYiB2ZXJpZnlfd2hpbGVfdG9wQDE4Cgp2ZXJpZnlfYWZ0ZXJfd2hpbGVAMjA6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNzMKICAgIC8vIGNvbnN0IHhpbkV4cGVjdGVkID0gbmV3IFVpbnQyNTYoeGluKTsKICAgIGZyYW1lX2RpZyAyMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgaW50Y18wIC8vIDMyCiAgICBiemVybwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIHN3YXAKICAgIGRpZyAxCiAgICBifAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6Mzc0CiAgICAvLyBhc3NlcnQobHcueGluLm5hdGl2ZSA9PT0geGluRXhwZWN0ZWQubmF0aXZlLCAibHcueGluICE9IHhpXm4iKTsKICAgIGZyYW1lX2RpZyAxNgogICAgZGlnIDEKICAgIGI9PQogICAgYXNzZXJ0IC8vIGx3LnhpbiAhPSB4aV5uCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czozNzcKICAgIC8vIGNvbnN0IHpoRXhwZWN0ZWQgPSBuZXcgVWludDI1NihmclN1Yih4aW5FeHBlY3RlZC5uYXRpdmUsIEJpZ1VpbnQoMSkpKTsKICAgIGJ5dGVjXzIgLy8gMHgwMQogICAgY2FsbHN1YiBmclN1YgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgYnwKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM3OAogICAgLy8gYXNzZXJ0KGx3LnpoLm5hdGl2ZSA9PT0gemhFeHBlY3RlZC5uYXRpdmUsICJsdy56aCAhPSB4aV5uIC0gMSIpOwogICAgZnJhbWVfZGlnIDE3CiAgICBiPT0KICAgIGFzc2VydCAvLyBsdy56aCAhPSB4aV5uIC0gMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MzgxCiAgICAvLyBjb25zdCByZXF1aXJlZDogdWludDY0ID0gdmsublB1YmxpYyA9PT0gMCA/IDEgOiB2ay5uUHVibGljOwogICAgZnJhbWVfZGlnIDQyCiAgICBibnogdmVyaWZ5X3Rlcm5hcnlfZmFsc2VAMjIKICAgIGludGNfMiAvLyAxCgp2ZXJpZnlfdGVybmFyeV9tZXJnZUAyMzoKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM4MgogICAgLy8gYXNzZXJ0KGx3LkwubGVuZ3RoID49IHJlcXVpcmVkICsgMSwgImx3LkwgbGVuZ3RoIHRvbyBzaG9ydCIpOyAvLyBMWzBdIHVudXNlZDsgc3RhcnQgYXQgaW5kZXggMQogICAgaW50Y18yIC8vIDEKICAgICsKICAgIGZyYW1lX2RpZyAyMgogICAgPD0KICAgIGFzc2VydCAvLyBsdy5MIGxlbmd0aCB0b28gc2hvcnQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjM4NQogICAgLy8gYXNzZXJ0KGNoYWxsZW5nZXMueGkubmF0aXZlICE9PSBCaWdVaW50KDEpLCAiaW52YWxpZCB4aSAoZXF1YWxzIDEpIik7CiAgICBmcmFtZV9kaWcgMTUKICAgIGJ5dGVjXzIgLy8gMHgwMQogICAgYiE9CiAgICBhc3NlcnQgLy8gaW52YWxpZCB4aSAoZXF1YWxzIDEpCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0ODMKICAgIC8vIGNoYWxsZW5nZXMueGluID0gbHcueGluOwogICAgZnJhbWVfZGlnIDcKICAgIHB1c2hpbnQgMzUyIC8vIDM1MgogICAgZnJhbWVfZGlnIDE2CiAgICByZXBsYWNlMwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDg0CiAgICAvLyBjaGFsbGVuZ2VzLnpoID0gbHcuemg7CiAgICBpbnRjIDQgLy8gMzg0CiAgICBmcmFtZV9kaWcgMTcKICAgIHJlcGxhY2UzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDg1CiAgICAvLyBkZWJ1Z0xvZygieGluIiwgY2hhbGxlbmdlcy54aW4uYnl0ZXMpOwogICAgZHVwCiAgICBwdXNoaW50IDM1MiAvLyAzNTIKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxNQogICAgcHVzaGJ5dGVzICJ4aW4iCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMjAKICAgIC8vIGxvZyhuYW1lKTsKICAgIGxvZwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjIxCiAgICAvLyBsb2codmFsdWUpOwogICAgbG9nCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0ODYKICAgIC8vIGRlYnVnTG9nKCJ6aCIsIGNoYWxsZW5nZXMuemguYnl0ZXMpOwogICAgZHVwCiAgICBpbnRjIDQgLy8gMzg0CiAgICBpbnRjXzAgLy8gMzIKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMTYKICAgIHB1c2hieXRlcyAiemgiCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMjAKICAgIC8vIGxvZyhuYW1lKTsKICAgIGxvZwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjIxCiAgICAvLyBsb2codmFsdWUpOwogICAgbG9nCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0ODcKICAgIC8vIGRlYnVnTG9nKCJ2WzFdIiwgKGNoYWxsZW5nZXMudlsxXSBhcyBVaW50MjU2KS5ieXRlcyk7CiAgICBleHRyYWN0IDEyOCAxOTIKICAgIGR1cAogICAgZXh0cmFjdCAzMiAzMiAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxNwogICAgcHVzaGJ5dGVzICJ2WzFdIgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjIwCiAgICAvLyBsb2cobmFtZSk7CiAgICBsb2cKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIyMQogICAgLy8gbG9nKHZhbHVlKTsKICAgIGxvZwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDg3LTQ4OAogICAgLy8gZGVidWdMb2coInZbMV0iLCAoY2hhbGxlbmdlcy52WzFdIGFzIFVpbnQyNTYpLmJ5dGVzKTsKICAgIC8vIGRlYnVnTG9nKCJ2WzJdIiwgKGNoYWxsZW5nZXMudlsyXSBhcyBVaW50MjU2KS5ieXRlcyk7CiAgICBkdXAKICAgIGV4dHJhY3QgNjQgMzIgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMTgKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQ4OAogICAgLy8gZGVidWdMb2coInZbMl0iLCAoY2hhbGxlbmdlcy52WzJdIGFzIFVpbnQyNTYpLmJ5dGVzKTsKICAgIHB1c2hieXRlcyAidlsyXSIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIyMAogICAgLy8gbG9nKG5hbWUpOwogICAgbG9nCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMjEKICAgIC8vIGxvZyh2YWx1ZSk7CiAgICBsb2cKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjQ4OQogICAgLy8gZGVidWdMb2coInZbM10iLCAoY2hhbGxlbmdlcy52WzNdIGFzIFVpbnQyNTYpLmJ5dGVzKTsKICAgIGR1cAogICAgZXh0cmFjdCA5NiAzMiAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxOQogICAgcHVzaGJ5dGVzICJ2WzNdIgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjIwCiAgICAvLyBsb2cobmFtZSk7CiAgICBsb2cKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIyMQogICAgLy8gbG9nKHZhbHVlKTsKICAgIGxvZwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDkwCiAgICAvLyBkZWJ1Z0xvZygidls0XSIsIChjaGFsbGVuZ2VzLnZbNF0gYXMgVWludDI1NikuYnl0ZXMpOwogICAgZHVwCiAgICBleHRyYWN0IDEyOCAzMiAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxMwogICAgcHVzaGJ5dGVzICJ2WzRdIgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjIwCiAgICAvLyBsb2cobmFtZSk7CiAgICBsb2cKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIyMQogICAgLy8gbG9nKHZhbHVlKTsKICAgIGxvZwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDkxCiAgICAvLyBkZWJ1Z0xvZygidls1XSIsIChjaGFsbGVuZ2VzLnZbNV0gYXMgVWludDI1NikuYnl0ZXMpOwogICAgZXh0cmFjdCAxNjAgMzIgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMTQKICAgIHB1c2hieXRlcyAidls1XSIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIyMAogICAgLy8gbG9nKG5hbWUpOwogICAgbG9nCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMjEKICAgIC8vIGxvZyh2YWx1ZSk7CiAgICBsb2cKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY3NQogICAgLy8gbGV0IHBpID0gQmlnVWludCgwKTsKICAgIGJ5dGVjXzEgLy8gMHgKICAgIGZyYW1lX2J1cnkgOAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6Njc2CiAgICAvLyBmb3IgKGxldCBpOiB1aW50NjQgPSAwOyBpIDwgcHVibGljU2lnbmFscy5sZW5ndGg7IGkrKykgewogICAgaW50Y18zIC8vIDAKICAgIGZyYW1lX2J1cnkgMjMKCnZlcmlmeV93aGlsZV90b3BAMjY6CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NzYKICAgIC8vIGZvciAobGV0IGk6IHVpbnQ2NCA9IDA7IGkgPCBwdWJsaWNTaWduYWxzLmxlbmd0aDsgaSsrKSB7CiAgICBmcmFtZV9kaWcgMjMKICAgIGZyYW1lX2RpZyA0MQogICAgPAogICAgYnogdmVyaWZ5X2FmdGVyX3doaWxlQDI4CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NzcKICAgIC8vIGNvbnN0IHcgPSBmclNjYWxhcigocHVibGljU2lnbmFsc1tpXSBhcyBVaW50MjU2KS5uYXRpdmUpOwogICAgZnJhbWVfZGlnIC0zCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMCAvLyAzMgogICAgKgogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE1OAogICAgLy8gcmV0dXJuIGEgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY3OAogICAgLy8gcGkgPSBmclN1YihwaSwgZnJNdWwodywgKExbaSArIDFdIGFzIFVpbnQyNTYpLm5hdGl2ZSkpOwogICAgc3dhcAogICAgaW50Y18yIC8vIDEKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyMwogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMiAwCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMzIKICAgICoKICAgIGludGNfMCAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NzgKICAgIC8vIHBpID0gZnJTdWIocGksIGZyTXVsKHcsIChMW2kgKyAxXSBhcyBVaW50MjU2KS5uYXRpdmUpKTsKICAgIGZyYW1lX2RpZyA4CiAgICBzd2FwCiAgICBjYWxsc3ViIGZyU3ViCiAgICBmcmFtZV9idXJ5IDgKICAgIGIgdmVyaWZ5X3doaWxlX3RvcEAyNgoKdmVyaWZ5X2FmdGVyX3doaWxlQDI4OgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjgwCiAgICAvLyByZXR1cm4gbmV3IFVpbnQyNTYocGkpOwogICAgZnJhbWVfZGlnIDgKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJ8CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0OTQtNDk1CiAgICAvLyBjb25zdCBwaSA9IGNhbGN1bGF0ZVBJKHNpZ25hbHMsIGx3LkwpOwogICAgLy8gZGVidWdMb2coIkwxKHhpKSIsIChsdy5MWzFdIGFzIFVpbnQyNTYpLmJ5dGVzKTsKICAgIGZyYW1lX2RpZyAwCiAgICBleHRyYWN0IDM0IDMyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo0OTUKICAgIC8vIGRlYnVnTG9nKCJMMSh4aSkiLCAobHcuTFsxXSBhcyBVaW50MjU2KS5ieXRlcyk7CiAgICBwdXNoYnl0ZXMgIkwxKHhpKSIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIyMAogICAgLy8gbG9nKG5hbWUpOwogICAgbG9nCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMjEKICAgIC8vIGxvZyh2YWx1ZSk7CiAgICBkdXAKICAgIGxvZwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NDk2CiAgICAvLyBkZWJ1Z0xvZygiUEkoeGkpIiwgcGkuYnl0ZXMpOwogICAgcHVzaGJ5dGVzICJQSSh4aSkiCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMjAKICAgIC8vIGxvZyhuYW1lKTsKICAgIGxvZwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjIxCiAgICAvLyBsb2codmFsdWUpOwogICAgZGlnIDEKICAgIGxvZwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzAxCiAgICAvLyBmck11bChjaGFsbGVuZ2VzLmFscGhhLm5hdGl2ZSwgY2hhbGxlbmdlcy5hbHBoYS5uYXRpdmUpLAogICAgZnJhbWVfZGlnIDcKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdCA2NCAzMgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgZHVwCiAgICBkaWcgMQogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgdW5jb3ZlciAyCiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo3MDgKICAgIC8vIGZyTXVsKGNoYWxsZW5nZXMuYmV0YS5uYXRpdmUsIHByb29mLmV2YWxfczEubmF0aXZlKSwKICAgIGRpZyAyCiAgICBleHRyYWN0IDAgMzIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGR1cAogICAgZnJhbWVfZGlnIDM4CiAgICBkdXAKICAgIGNvdmVyIDgKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0NwogICAgLy8gY29uc3QgYU46IGJpZ3VpbnQgPSBhICUgcjsKICAgIGZyYW1lX2RpZyAzNQogICAgZHVwCiAgICBjb3ZlciA3CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OAogICAgLy8gY29uc3QgYk46IGJpZ3VpbnQgPSBiICUgcjsKICAgIHN3YXAKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ5CiAgICAvLyByZXR1cm4gKGFOICsgYk4pICUgcjsKICAgIGRpZyAxCiAgICBiKwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo3MTAKICAgIC8vIGUzYSA9IGZyQWRkKGUzYSwgY2hhbGxlbmdlcy5nYW1tYS5uYXRpdmUpOwogICAgZGlnIDUKICAgIGV4dHJhY3QgMzIgMzIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0NwogICAgLy8gY29uc3QgYU46IGJpZ3VpbnQgPSBhICUgcjsKICAgIHN3YXAKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ4CiAgICAvLyBjb25zdCBiTjogYmlndWludCA9IGIgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDkKICAgIC8vIHJldHVybiAoYU4gKyBiTikgJSByOwogICAgc3dhcAogICAgZGlnIDEKICAgIGIrCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGRpZyAzCiAgICBmcmFtZV9kaWcgMzkKICAgIGR1cAogICAgY292ZXIgMTIKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0NwogICAgLy8gY29uc3QgYU46IGJpZ3VpbnQgPSBhICUgcjsKICAgIGZyYW1lX2RpZyAzNgogICAgZHVwCiAgICBjb3ZlciA0CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OAogICAgLy8gY29uc3QgYk46IGJpZ3VpbnQgPSBiICUgcjsKICAgIHN3YXAKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ5CiAgICAvLyByZXR1cm4gKGFOICsgYk4pICUgcjsKICAgIGRpZyAxCiAgICBiKwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDcKICAgIC8vIGNvbnN0IGFOOiBiaWd1aW50ID0gYSAlIHI7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICBkaWcgMwogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ3CiAgICAvLyBjb25zdCBhTjogYmlndWludCA9IGEgJSByOwogICAgZnJhbWVfZGlnIDM3CiAgICBkdXAKICAgIGNvdmVyIDE0CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICBkdXAKICAgIGRpZyA1CiAgICBiKwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgMwogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIGZyYW1lX2RpZyA0MAogICAgZHVwCiAgICBjb3ZlciAxNAogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgZGlnIDkKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjcyNQogICAgLy8gY29uc3QgcjAgPSBmclN1YihmclN1YihlMSwgZTIpLCBlMyk7CiAgICB1bmNvdmVyIDExCiAgICBkaWcgOQogICAgY2FsbHN1YiBmclN1YgogICAgc3dhcAogICAgY2FsbHN1YiBmclN1YgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzI2CiAgICAvLyByZXR1cm4gbmV3IFVpbnQyNTYocjApOwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgdW5jb3ZlciAxMwogICAgYnwKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjUwMAogICAgLy8gZGVidWdMb2coInIwIiwgcjAuYnl0ZXMpOwogICAgcHVzaGJ5dGVzICJyMCIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIyMAogICAgLy8gbG9nKG5hbWUpOwogICAgbG9nCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMjEKICAgIC8vIGxvZyh2YWx1ZSk7CiAgICBkdXAKICAgIGxvZwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzU0CiAgICAvLyBwb2ludHMgPSBvcC5jb25jYXQocG9pbnRzLCBwcm9vZi5UMSk7CiAgICBmcmFtZV9kaWcgOQogICAgZnJhbWVfZGlnIDMwCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjc1NQogICAgLy8gcG9pbnRzID0gb3AuY29uY2F0KHBvaW50cywgcHJvb2YuVDIpOwogICAgZnJhbWVfZGlnIDMxCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjc1NgogICAgLy8gcG9pbnRzID0gb3AuY29uY2F0KHBvaW50cywgcHJvb2YuVDMpOwogICAgZnJhbWVfZGlnIDMyCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjc1NwogICAgLy8gcG9pbnRzID0gb3AuY29uY2F0KHBvaW50cywgdmsuUWMpOwogICAgZnJhbWVfZGlnIDIKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgZGlnIDEyCiAgICBkaWcgNwogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzY2CiAgICAvLyBjb25zdCBxdW90aWVudFNjYWxhcjEgPSBmclN1YihCaWdVaW50KDApLCBjaGFsbGVuZ2VzLnpoLm5hdGl2ZSk7IC8vIOKIknpoIChhcHBsaWVzIHRvIFQxKQogICAgYnl0ZWNfMSAvLyAweAogICAgZnJhbWVfZGlnIDE2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgZnJTdWIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGZyYW1lX2RpZyAxNQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkaWcgMwogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzY4CiAgICAvLyBCaWdVaW50KDApLAogICAgYnl0ZWNfMSAvLyAweAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzY3LTc3MAogICAgLy8gY29uc3QgcXVvdGllbnRTY2FsYXIyID0gZnJTdWIoCiAgICAvLyAgIEJpZ1VpbnQoMCksCiAgICAvLyAgIGZyTXVsKGNoYWxsZW5nZXMueGluLm5hdGl2ZSwgY2hhbGxlbmdlcy56aC5uYXRpdmUpLAogICAgLy8gKTsgLy8g4oiSeGluwrd6aCAoYXBwbGllcyB0byBUMikKICAgIHN3YXAKICAgIGNhbGxzdWIgZnJTdWIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGRpZyAyCiAgICB1bmNvdmVyIDMKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIHVuY292ZXIgMwogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzcyCiAgICAvLyBCaWdVaW50KDApLAogICAgYnl0ZWNfMSAvLyAweAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzcxLTc3NwogICAgLy8gY29uc3QgcXVvdGllbnRTY2FsYXIzID0gZnJTdWIoCiAgICAvLyAgIEJpZ1VpbnQoMCksCiAgICAvLyAgIGZyTXVsKAogICAgLy8gICAgIGZyTXVsKGNoYWxsZW5nZXMueGluLm5hdGl2ZSwgY2hhbGxlbmdlcy54aW4ubmF0aXZlKSwKICAgIC8vICAgICBjaGFsbGVuZ2VzLnpoLm5hdGl2ZSwKICAgIC8vICAgKSwKICAgIC8vICk7IC8vIOKIknhpbsKywrd6aCAoYXBwbGllcyB0byBUMykKICAgIHN3YXAKICAgIGNhbGxzdWIgZnJTdWIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjc4MAogICAgLy8gY29uc3QgYmV0YXhpID0gZnJNdWwoY2hhbGxlbmdlcy5iZXRhLm5hdGl2ZSwgY2hhbGxlbmdlcy54aS5uYXRpdmUpOwogICAgZGlnIDE1CiAgICBleHRyYWN0IDk2IDMyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBkaWcgMTMKICAgIGRpZyAxCiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDgKICAgIC8vIGNvbnN0IGJOOiBiaWd1aW50ID0gYiAlIHI7CiAgICBkdXAKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ5CiAgICAvLyByZXR1cm4gKGFOICsgYk4pICUgcjsKICAgIHVuY292ZXIgMTQKICAgIGIrCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0NwogICAgLy8gY29uc3QgYU46IGJpZ3VpbnQgPSBhICUgcjsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ5CiAgICAvLyByZXR1cm4gKGFOICsgYk4pICUgcjsKICAgIGRpZyAxMgogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6Nzg2CiAgICAvLyBmckFkZChwcm9vZi5ldmFsX2IubmF0aXZlLCBmck11bChiZXRheGksIEJpZ1VpbnQodmsuazEpKSksCiAgICBmcmFtZV9kaWcgMjUKICAgIGR1cAogICAgY292ZXIgMwogICAgaW50YyAxMiAvLyA3ODQKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0MwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgZGlnIDIKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OAogICAgLy8gY29uc3QgYk46IGJpZ3VpbnQgPSBiICUgcjsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ5CiAgICAvLyByZXR1cm4gKGFOICsgYk4pICUgcjsKICAgIHVuY292ZXIgMTMKICAgIGIrCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0NwogICAgLy8gY29uc3QgYU46IGJpZ3VpbnQgPSBhICUgcjsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ5CiAgICAvLyByZXR1cm4gKGFOICsgYk4pICUgcjsKICAgIGRpZyAxMwogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NzkwCiAgICAvLyBmckFkZChwcm9vZi5ldmFsX2MubmF0aXZlLCBmck11bChiZXRheGksIEJpZ1VpbnQodmsuazIpKSksCiAgICBkaWcgMwogICAgaW50YyAxMyAvLyA3OTIKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0MwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgdW5jb3ZlciAzCiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDgKICAgIC8vIGNvbnN0IGJOOiBiaWd1aW50ID0gYiAlIHI7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICB1bmNvdmVyIDEyCiAgICBiKwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDcKICAgIC8vIGNvbnN0IGFOOiBiaWd1aW50ID0gYSAlIHI7CiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICB1bmNvdmVyIDEyCiAgICBiKwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBjb3ZlciAyCiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICBkaWcgMTMKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0NwogICAgLy8gY29uc3QgYU46IGJpZ3VpbnQgPSBhICUgcjsKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ4CiAgICAvLyBjb25zdCBiTjogYmlndWludCA9IGIgJSByOwogICAgdW5jb3ZlciAxMgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDkKICAgIC8vIHJldHVybiAoYU4gKyBiTikgJSByOwogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6Nzk4CiAgICAvLyBjb25zdCB6U2NhbGFyID0gZnJBZGQoZnJBZGQoZDJhLCBkMmIpLCBjaGFsbGVuZ2VzLnUubmF0aXZlKTsKICAgIHVuY292ZXIgMTMKICAgIHB1c2hpbnQgMzIwIC8vIDMyMAogICAgaW50Y18wIC8vIDMyCiAgICBleHRyYWN0MwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ3CiAgICAvLyBjb25zdCBhTjogYmlndWludCA9IGEgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDgKICAgIC8vIGNvbnN0IGJOOiBiaWd1aW50ID0gYiAlIHI7CiAgICBkaWcgMQogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDkKICAgIC8vIHJldHVybiAoYU4gKyBiTikgJSByOwogICAgYisKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgdW5jb3ZlciAxMwogICAgdW5jb3ZlciAxMwogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgZGlnIDE0CiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICB1bmNvdmVyIDExCiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4MjIKICAgIC8vIHBvaW50cyA9IG9wLmNvbmNhdChwb2ludHMsIHByb29mLlopOwogICAgdW5jb3ZlciA5CiAgICBmcmFtZV9kaWcgMjkKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6ODIzCiAgICAvLyBwb2ludHMgPSBvcC5jb25jYXQocG9pbnRzLCB2ay5TMyk7CiAgICBmcmFtZV9kaWcgNQogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4MjQKICAgIC8vIHBvaW50cyA9IG9wLmNvbmNhdChwb2ludHMsIHByb29mLkEpOwogICAgZnJhbWVfZGlnIDI2CiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgyNQogICAgLy8gcG9pbnRzID0gb3AuY29uY2F0KHBvaW50cywgcHJvb2YuQik7CiAgICBmcmFtZV9kaWcgMjcKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6ODI2CiAgICAvLyBwb2ludHMgPSBvcC5jb25jYXQocG9pbnRzLCBwcm9vZi5DKTsKICAgIGZyYW1lX2RpZyAyOAogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4MjcKICAgIC8vIHBvaW50cyA9IG9wLmNvbmNhdChwb2ludHMsIHZrLlMxKTsKICAgIGZyYW1lX2RpZyAzCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgyOAogICAgLy8gcG9pbnRzID0gb3AuY29uY2F0KHBvaW50cywgdmsuUzIpOwogICAgZnJhbWVfZGlnIDQKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6ODMxCiAgICAvLyBsZXQgc2NhbGFycyA9IG9wLmNvbmNhdChiMzIoZ2F0ZVNjYWxhcjEpLCBiMzIoZ2F0ZVNjYWxhcjIpKTsKICAgIHVuY292ZXIgOQogICAgY2FsbHN1YiBiMzIKICAgIGRpZyAxMgogICAgY2FsbHN1YiBiMzIKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6ODMyCiAgICAvLyBzY2FsYXJzID0gb3AuY29uY2F0KHNjYWxhcnMsIGIzMihnYXRlU2NhbGFyMykpOwogICAgZGlnIDExCiAgICBjYWxsc3ViIGIzMgogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4MzMKICAgIC8vIHNjYWxhcnMgPSBvcC5jb25jYXQoc2NhbGFycywgYjMyKGdhdGVTY2FsYXI0KSk7CiAgICBkaWcgMTQKICAgIGNhbGxzdWIgYjMyCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgzNAogICAgLy8gc2NhbGFycyA9IG9wLmNvbmNhdChzY2FsYXJzLCBiMzIocXVvdGllbnRTY2FsYXIxKSk7CiAgICB1bmNvdmVyIDkKICAgIGNhbGxzdWIgYjMyCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgzNQogICAgLy8gc2NhbGFycyA9IG9wLmNvbmNhdChzY2FsYXJzLCBiMzIocXVvdGllbnRTY2FsYXIyKSk7CiAgICB1bmNvdmVyIDgKICAgIGNhbGxzdWIgYjMyCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgzNgogICAgLy8gc2NhbGFycyA9IG9wLmNvbmNhdChzY2FsYXJzLCBiMzIocXVvdGllbnRTY2FsYXIzKSk7CiAgICB1bmNvdmVyIDcKICAgIGNhbGxzdWIgYjMyCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgzNwogICAgLy8gc2NhbGFycyA9IG9wLmNvbmNhdChzY2FsYXJzLCBiMzIoQmlnVWludCgxKSkpOyAvLyBRYyB3aXRoIHNjYWxhciAxCiAgICBieXRlY18yIC8vIDB4MDEKICAgIGNhbGxzdWIgYjMyCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjgzOAogICAgLy8gc2NhbGFycyA9IG9wLmNvbmNhdChzY2FsYXJzLCBiMzIoelNjYWxhcikpOyAvLyBaIHdpdGggelNjYWxhcgogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGIzMgogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4MzkKICAgIC8vIHNjYWxhcnMgPSBvcC5jb25jYXQoc2NhbGFycywgYjMyKGZyU3ViKEJpZ1VpbnQoMCksIHMzU2NhbGFyKSkpOyAvLyBTMyB3aXRoIC1zM1NjYWxhcgogICAgYnl0ZWNfMSAvLyAweAogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGZyU3ViCiAgICBjYWxsc3ViIGIzMgogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4NDAKICAgIC8vIHNjYWxhcnMgPSBvcC5jb25jYXQoc2NhbGFycywgKGNoYWxsZW5nZXMudlsxXSBhcyBVaW50MjU2KS5ieXRlcyk7CiAgICBmcmFtZV9kaWcgMTcKICAgIGR1cAogICAgY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4NDEKICAgIC8vIHNjYWxhcnMgPSBvcC5jb25jYXQoc2NhbGFycywgKGNoYWxsZW5nZXMudlsyXSBhcyBVaW50MjU2KS5ieXRlcyk7CiAgICBmcmFtZV9kaWcgMTgKICAgIGR1cAogICAgY292ZXIgMwogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4NDIKICAgIC8vIHNjYWxhcnMgPSBvcC5jb25jYXQoc2NhbGFycywgKGNoYWxsZW5nZXMudlszXSBhcyBVaW50MjU2KS5ieXRlcyk7CiAgICBmcmFtZV9kaWcgMTkKICAgIGR1cAogICAgY292ZXIgNAogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4NDMKICAgIC8vIHNjYWxhcnMgPSBvcC5jb25jYXQoc2NhbGFycywgKGNoYWxsZW5nZXMudls0XSBhcyBVaW50MjU2KS5ieXRlcyk7CiAgICBmcmFtZV9kaWcgMTMKICAgIGR1cAogICAgY292ZXIgNQogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4NDQKICAgIC8vIHNjYWxhcnMgPSBvcC5jb25jYXQoc2NhbGFycywgKGNoYWxsZW5nZXMudls1XSBhcyBVaW50MjU2KS5ieXRlcyk7CiAgICBmcmFtZV9kaWcgMTQKICAgIGR1cAogICAgY292ZXIgNwogICAgY29uY2F0CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo4NDctODUxCiAgICAvLyBjb25zdCBGID0gb3AuRWxsaXB0aWNDdXJ2ZS5zY2FsYXJNdWxNdWx0aSgKICAgIC8vICAgb3AuRWMuQkxTMTJfMzgxZzEsCiAgICAvLyAgIHBvaW50cywKICAgIC8vICAgc2NhbGFycywKICAgIC8vICkudG9GaXhlZCh7IGxlbmd0aDogOTYgfSk7CiAgICB1bmNvdmVyIDUKICAgIHN3YXAKICAgIGVjX211bHRpX3NjYWxhcl9tdWwgQkxTMTJfMzgxZzEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjUwNAogICAgLy8gZGVidWdMb2coIkYiLCBmKTsKICAgIHB1c2hieXRlcyAiRiIKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIyMAogICAgLy8gbG9nKG5hbWUpOwogICAgbG9nCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMjEKICAgIC8vIGxvZyh2YWx1ZSk7CiAgICBkdXAKICAgIGxvZwogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgc3dhcAogICAgdW5jb3ZlciAxMQogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6ODY3LTg3MAogICAgLy8gbGV0IGUgPSBmclN1YigKICAgIC8vICAgZnJNdWwoKGNoYWxsZW5nZXMudlsxXSBhcyBVaW50MjU2KS5uYXRpdmUsIHByb29mLmV2YWxfYS5uYXRpdmUpLAogICAgLy8gICByMC5uYXRpdmUsCiAgICAvLyApOwogICAgdW5jb3ZlciA5CiAgICBjYWxsc3ViIGZyU3ViCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICB1bmNvdmVyIDIKICAgIHVuY292ZXIgOQogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ3CiAgICAvLyBjb25zdCBhTjogYmlndWludCA9IGEgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDgKICAgIC8vIGNvbnN0IGJOOiBiaWd1aW50ID0gYiAlIHI7CiAgICBzd2FwCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICBiKwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICB1bmNvdmVyIDIKICAgIHVuY292ZXIgOQogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ3CiAgICAvLyBjb25zdCBhTjogYmlndWludCA9IGEgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDgKICAgIC8vIGNvbnN0IGJOOiBiaWd1aW50ID0gYiAlIHI7CiAgICBzd2FwCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICBiKwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICB1bmNvdmVyIDIKICAgIHVuY292ZXIgOQogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ3CiAgICAvLyBjb25zdCBhTjogYmlndWludCA9IGEgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDgKICAgIC8vIGNvbnN0IGJOOiBiaWd1aW50ID0gYiAlIHI7CiAgICBzd2FwCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICBiKwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICB1bmNvdmVyIDIKICAgIHVuY292ZXIgNwogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ3CiAgICAvLyBjb25zdCBhTjogYmlndWludCA9IGEgJSByOwogICAgc3dhcAogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDgKICAgIC8vIGNvbnN0IGJOOiBiaWd1aW50ID0gYiAlIHI7CiAgICBzd2FwCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OQogICAgLy8gcmV0dXJuIChhTiArIGJOKSAlIHI7CiAgICBiKwogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czo2NAogICAgLy8gcmV0dXJuIChhICogYikgJSBCTFMxMl8zODFfU0NBTEFSX01PRFVMVVM7CiAgICBkaWcgMgogICAgdW5jb3ZlciA2CiAgICBiKgogICAgYnl0ZWNfMCAvLyAweDczZWRhNzUzMjk5ZDdkNDgzMzM5ZDgwODA5YTFkODA1NTNiZGE0MDJmZmZlNWJmZWZmZmZmZmZmMDAwMDAwMDEKICAgIGIlCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoxNDcKICAgIC8vIGNvbnN0IGFOOiBiaWd1aW50ID0gYSAlIHI7CiAgICBzd2FwCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjE0OAogICAgLy8gY29uc3QgYk46IGJpZ3VpbnQgPSBiICUgcjsKICAgIHN3YXAKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MTQ5CiAgICAvLyByZXR1cm4gKGFOICsgYk4pICUgcjsKICAgIGIrCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjg4MwogICAgLy8gY29uc3QgcmVzID0gZzFUaW1lc0ZyKEcxX09ORS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KSwgZSk7CiAgICBwdXNoYnl0ZXMgMHgxN2YxZDNhNzMxOTdkNzk0MjY5NTYzOGM0ZmE5YWMwZmMzNjg4YzRmOTc3NGI5MDVhMTRlM2EzZjE3MWJhYzU4NmM1NWU4M2ZmOTdhMWFlZmZiM2FmMDBhZGIyMmM2YmIwOGIzZjQ4MWUzYWFhMGYxYTA5ZTMwZWQ3NDFkOGFlNGZjZjVlMDk1ZDVkMDBhZjYwMGRiMThjYjJjMDRiM2VkZDAzY2M3NDRhMjg4OGFlNDBjYWEyMzI5NDZjNWU3ZTEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIzMAogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc2NhbGFyTXVsKG9wLkVjLkJMUzEyXzM4MWcxLCBwLCBCeXRlcyhzKSkudG9GaXhlZCh7CiAgICBzd2FwCiAgICBlY19zY2FsYXJfbXVsIEJMUzEyXzM4MWcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMzAtMjMyCiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5zY2FsYXJNdWwob3AuRWMuQkxTMTJfMzgxZzEsIHAsIEJ5dGVzKHMpKS50b0ZpeGVkKHsKICAgIC8vICAgbGVuZ3RoOiA5NiwKICAgIC8vIH0pOwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NTA4CiAgICAvLyBkZWJ1Z0xvZygiRSIsIGUpOwogICAgcHVzaGJ5dGVzICJFIgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjIwCiAgICAvLyBsb2cobmFtZSk7CiAgICBsb2cKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIyMQogICAgLy8gbG9nKHZhbHVlKTsKICAgIGR1cAogICAgbG9nCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMzAKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLnNjYWxhck11bChvcC5FYy5CTFMxMl8zODFnMSwgcCwgQnl0ZXMocykpLnRvRml4ZWQoewogICAgZnJhbWVfZGlnIDM0CiAgICBkaWcgMwogICAgZWNfc2NhbGFyX211bCBCTFMxMl8zODFnMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjMwLTIzMgogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc2NhbGFyTXVsKG9wLkVjLkJMUzEyXzM4MWcxLCBwLCBCeXRlcyhzKSkudG9GaXhlZCh7CiAgICAvLyAgIGxlbmd0aDogOTYsCiAgICAvLyB9KTsKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjI0MQogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuYWRkKG9wLkVjLkJMUzEyXzM4MWcxLCBwMSwgcDIpLnRvRml4ZWQoewogICAgZnJhbWVfZGlnIDMzCiAgICBzd2FwCiAgICBlY19hZGQgQkxTMTJfMzgxZzEKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjI0MS0yNDMKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLmFkZChvcC5FYy5CTFMxMl8zODFnMSwgcDEsIHAyKS50b0ZpeGVkKHsKICAgIC8vICAgbGVuZ3RoOiA5NiwKICAgIC8vIH0pOwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6NjQKICAgIC8vIHJldHVybiAoYSAqIGIpICUgQkxTMTJfMzgxX1NDQUxBUl9NT0RVTFVTOwogICAgdW5jb3ZlciAzCiAgICBkaWcgNQogICAgYioKICAgIGJ5dGVjXzAgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAxCiAgICBiJQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OTE1CiAgICAvLyBST09UX09GX1VOSVRZLAogICAgYnl0ZWMgNSAvLyBUTVBMX1JPT1RfT0ZfVU5JVFkKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjY0CiAgICAvLyByZXR1cm4gKGEgKiBiKSAlIEJMUzEyXzM4MV9TQ0FMQVJfTU9EVUxVUzsKICAgIGIqCiAgICBieXRlY18wIC8vIDB4NzNlZGE3NTMyOTlkN2Q0ODMzMzlkODA4MDlhMWQ4MDU1M2JkYTQwMmZmZmU1YmZlZmZmZmZmZmYwMDAwMDAwMQogICAgYiUKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjkxNwogICAgLy8gY29uc3QgcGFpcmluZ1NjYWxhcnMgPSBvcC5jb25jYXQoY2hhbGxlbmdlcy54aS5ieXRlcywgYjMyKHMpKTsKICAgIGNhbGxzdWIgYjMyCiAgICB1bmNvdmVyIDUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OTE5LTkyMwogICAgLy8gbGV0IEIxID0gb3AuRWxsaXB0aWNDdXJ2ZS5zY2FsYXJNdWxNdWx0aSgKICAgIC8vICAgb3AuRWMuQkxTMTJfMzgxZzEsCiAgICAvLyAgIHBhaXJpbmdQb2ludHMsCiAgICAvLyAgIHBhaXJpbmdTY2FsYXJzLAogICAgLy8gKS50b0ZpeGVkKHsgbGVuZ3RoOiA5NiB9KTsKICAgIGZyYW1lX2RpZyAxMAogICAgc3dhcAogICAgZWNfbXVsdGlfc2NhbGFyX211bCBCTFMxMl8zODFnMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA5NgogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbXVzdCBiZSA5NgogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjQxCiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5hZGQob3AuRWMuQkxTMTJfMzgxZzEsIHAxLCBwMikudG9GaXhlZCh7CiAgICB1bmNvdmVyIDMKICAgIGVjX2FkZCBCTFMxMl8zODFnMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjQxLTI0MwogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuYWRkKG9wLkVjLkJMUzEyXzM4MWcxLCBwMSwgcDIpLnRvRml4ZWQoewogICAgLy8gICBsZW5ndGg6IDk2LAogICAgLy8gfSk7CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDk2CiAgICA9PQogICAgYXNzZXJ0IC8vIExlbmd0aCBtdXN0IGJlIDk2CiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMzAKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLnNjYWxhck11bChvcC5FYy5CTFMxMl8zODFnMSwgcCwgQnl0ZXMocykpLnRvRml4ZWQoewogICAgdW5jb3ZlciAyCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyNTIKICAgIC8vIHJldHVybiBnMVRpbWVzRnIocCwgUl9NSU5VU18xKTsKICAgIGJ5dGVjXzMgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAwCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMzAKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLnNjYWxhck11bChvcC5FYy5CTFMxMl8zODFnMSwgcCwgQnl0ZXMocykpLnRvRml4ZWQoewogICAgZWNfc2NhbGFyX211bCBCTFMxMl8zODFnMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjMwLTIzMgogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc2NhbGFyTXVsKG9wLkVjLkJMUzEyXzM4MWcxLCBwLCBCeXRlcyhzKSkudG9GaXhlZCh7CiAgICAvLyAgIGxlbmd0aDogOTYsCiAgICAvLyB9KTsKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjI0MQogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuYWRkKG9wLkVjLkJMUzEyXzM4MWcxLCBwMSwgcDIpLnRvRml4ZWQoewogICAgZWNfYWRkIEJMUzEyXzM4MWcxCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyNDEtMjQzCiAgICAvLyByZXR1cm4gb3AuRWxsaXB0aWNDdXJ2ZS5hZGQob3AuRWMuQkxTMTJfMzgxZzEsIHAxLCBwMikudG9GaXhlZCh7CiAgICAvLyAgIGxlbmd0aDogOTYsCiAgICAvLyB9KTsKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjIzMAogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc2NhbGFyTXVsKG9wLkVjLkJMUzEyXzM4MWcxLCBwLCBCeXRlcyhzKSkudG9GaXhlZCh7CiAgICBzd2FwCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyNTIKICAgIC8vIHJldHVybiBnMVRpbWVzRnIocCwgUl9NSU5VU18xKTsKICAgIGJ5dGVjXzMgLy8gMHg3M2VkYTc1MzI5OWQ3ZDQ4MzMzOWQ4MDgwOWExZDgwNTUzYmRhNDAyZmZmZTViZmVmZmZmZmZmZjAwMDAwMDAwCiAgICAvLyBjb250cmFjdHMvcGxvbmtfYmxzMTIzODEuYWxnby50czoyMzAKICAgIC8vIHJldHVybiBvcC5FbGxpcHRpY0N1cnZlLnNjYWxhck11bChvcC5FYy5CTFMxMl8zODFnMSwgcCwgQnl0ZXMocykpLnRvRml4ZWQoewogICAgZWNfc2NhbGFyX211bCBCTFMxMl8zODFnMQogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6MjMwLTIzMgogICAgLy8gcmV0dXJuIG9wLkVsbGlwdGljQ3VydmUuc2NhbGFyTXVsKG9wLkVjLkJMUzEyXzM4MWcxLCBwLCBCeXRlcyhzKSkudG9GaXhlZCh7CiAgICAvLyAgIGxlbmd0aDogOTYsCiAgICAvLyB9KTsKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOTYKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG11c3QgYmUgOTYKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjkzMAogICAgLy8gb3AuY29uY2F0KGcxTmVnKEExKSwgQjEpLCAvLyBHMSBwb2ludHMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3RzL3Bsb25rX2JsczEyMzgxLmFsZ28udHM6OTMxCiAgICAvLyBvcC5jb25jYXQodmsuWF8yLCBHMl9PTkUpLCAvLyBHMiBwb2ludHMKICAgIHN3YXAKICAgIGludGMgMTQgLy8gODAwCiAgICBpbnRjIDUgLy8gMTkyCiAgICBleHRyYWN0MwogICAgcHVzaGJ5dGVzIDB4MDI0YWEyYjJmMDhmMGE5MTI2MDgwNTI3MmRjNTEwNTFjNmU0N2FkNGZhNDAzYjAyYjQ1MTBiNjQ3YWUzZDE3NzBiYWMwMzI2YTgwNWJiZWZkNDgwNTZjOGMxMjFiZGI4MTNlMDJiNjA1MjcxOWY2MDdkYWNkM2EwODgyNzRmNjU1OTZiZDBkMDk5MjBiNjFhYjVkYTYxYmJkYzdmNTA0OTMzNGNmMTEyMTM5NDVkNTdlNWFjN2QwNTVkMDQyYjdlMGNlNWQ1Mjc3MjdkNmUxMThjYzljZGM2ZGEyZTM1MWFhZGZkOWJhYThjYmRkM2E3NmQ0MjlhNjk1MTYwZDEyYzkyM2FjOWNjM2JhY2EyODllMTkzNTQ4NjA4YjgyODAxMDYwNmM0YTAyZWE3MzRjYzMyYWNkMmIwMmJjMjhiOTljYjNlMjg3ZTg1YTc2M2FmMjY3NDkyYWI1NzJlOTlhYjNmMzcwZDI3NWNlYzFkYTFhYWE5MDc1ZmYwNWY3OWJlCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0cy9wbG9ua19ibHMxMjM4MS5hbGdvLnRzOjkyOC05MzIKICAgIC8vIGNvbnN0IHJlcyA9IG9wLkVsbGlwdGljQ3VydmUucGFpcmluZ0NoZWNrKAogICAgLy8gICBvcC5FYy5CTFMxMl8zODFnMSwKICAgIC8vICAgb3AuY29uY2F0KGcxTmVnKEExKSwgQjEpLCAvLyBHMSBwb2ludHMKICAgIC8vICAgb3AuY29uY2F0KHZrLlhfMiwgRzJfT05FKSwgLy8gRzIgcG9pbnRzCiAgICAvLyApOwogICAgZWNfcGFpcmluZ19jaGVjayBCTFMxMl8zODFnMQogICAgLy8gY29udHJhY3RzL3ZlcmlmaWVyLmFsZ28udHM6MzYtMzkKICAgIC8vIGFzc2VydCgKICAgIC8vICAgdmVyaWZ5RnJvbVRlbXBsYXRlV2l0aExvZ3Moc2lnbmFscywgcHJvb2YsIGx3KSwKICAgIC8vICAgIlZlcmlmaWNhdGlvbiBmYWlsZWQiLAogICAgLy8gKTsKICAgIGFzc2VydCAvLyBWZXJpZmljYXRpb24gZmFpbGVkCiAgICByZXRzdWIKCnZlcmlmeV90ZXJuYXJ5X2ZhbHNlQDIyOgogICAgZnJhbWVfZGlnIDQyCiAgICBiIHZlcmlmeV90ZXJuYXJ5X21lcmdlQDIzCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBAYWxnb3JhbmRmb3VuZGF0aW9uL2FsZ29yYW5kLXR5cGVzY3JpcHQvYmFzZS1jb250cmFjdC5kLnRzOjpCYXNlQ29udHJhY3QuY2xlYXJTdGF0ZVByb2dyYW0oKSAtPiB1aW50NjQ6Cm1haW46CiAgICBwdXNoaW50IDEgLy8gMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [496], "errorMessage": "A not in G1"}, {"pc": [507], "errorMessage": "B not in G1"}, {"pc": [518], "errorMessage": "C not in G1"}, {"pc": [682], "errorMessage": "Invalid number of public inputs"}, {"pc": [443], "errorMessage": "Length must be 192"}, {"pc": [107], "errorMessage": "Length must be 32"}, {"pc": [170, 194, 218, 242, 266, 290, 314, 338, 1998, 2201, 2218, 2228, 2257, 2266, 2276, 2283, 2292], "errorMessage": "Length must be 96"}, {"pc": [53], "errorMessage": "OnCompletion is not CloseOut"}, {"pc": [30], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [542], "errorMessage": "T1 not in G1"}, {"pc": [554], "errorMessage": "T2 not in G1"}, {"pc": [566], "errorMessage": "T3 not in G1"}, {"pc": [2499], "errorMessage": "Verification failed"}, {"pc": [578], "errorMessage": "Wxi not in G1"}, {"pc": [590], "errorMessage": "Wxiw not in G1"}, {"pc": [530], "errorMessage": "Z not in G1"}, {"pc": [67], "errorMessage": "can only call when creating"}, {"pc": [33, 56], "errorMessage": "can only call when not creating"}, {"pc": [603], "errorMessage": "eval_a not in Fr"}, {"pc": [616], "errorMessage": "eval_b not in Fr"}, {"pc": [629], "errorMessage": "eval_c not in Fr"}, {"pc": [642], "errorMessage": "eval_s1 not in Fr"}, {"pc": [654], "errorMessage": "eval_s2 not in Fr"}, {"pc": [667], "errorMessage": "eval_zw not in Fr"}, {"pc": [705, 809, 899, 928, 931, 950, 1179, 1338, 1353, 1368, 1383, 1397, 1438, 1456], "errorMessage": "index access is out of bounds"}, {"pc": [1287], "errorMessage": "invalid xi (equals 1)"}, {"pc": [1282], "errorMessage": "lw.L length too short"}, {"pc": [1182], "errorMessage": "lw.L not in Fr"}, {"pc": [1256], "errorMessage": "lw.xin != xi^n"}, {"pc": [1125], "errorMessage": "lw.xin not in Fr"}, {"pc": [1270], "errorMessage": "lw.zh != xi^n - 1"}, {"pc": [1136], "errorMessage": "lw.zh not in Fr"}, {"pc": [97, 121, 941, 1241, 1265, 1477, 1663], "errorMessage": "overflow"}, {"pc": [708], "errorMessage": "public signal not in Fr"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"VERIFICATION_KEY": {"type": "AVMBytes"}, "ROOT_OF_UNITY": {"type": "AVMBytes"}}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+# post-processed: lazy APP_SPEC
+import functools
+
+
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    """Parse the embedded ARC-56 app spec once, on first use"""
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+
+def __getattr__(name: str) -> object:
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# post-processed: fast-path ABI helpers
+import operator
+
+_ABI_CONVERTERS: dict[type, typing.Callable[[object], object]] = {}
+_ARGS_GETTERS: dict[type, typing.Callable[[object], tuple]] = {}
+_IS_TXN_ARG: dict[type, bool] = {}
+_DATACLASS_INITS: dict[type, list[tuple[str, type | None]]] = {}
+_ABI_SCALAR_TYPES = (int, bool, str, bytes, bytearray, type(None))
+
+
+def _fields_getter(cls: type) -> typing.Callable[[object], tuple]:
+    """Build a getter returning the dataclass field values of `cls` as a tuple, in field order"""
+    names = [field.name for field in dataclasses.fields(cls)]
+    if len(names) == 1:
+        name = names[0]
+        return lambda value: (getattr(value, name),)
+    if not names:
+        return lambda value: ()
+    return operator.attrgetter(*names)
+
+
+def _abi_converter(cls: type) -> typing.Callable[[object], object]:
+    """Get the cached converter of a value type into the format expected by underlying client"""
+    converter = _ABI_CONVERTERS.get(cls)
+    if converter is not None:
+        return converter
+
+    if issubclass(cls, _ABI_SCALAR_TYPES):
+        def converter(value: object) -> object:
+            return value
+    elif dataclasses.is_dataclass(cls):
+        getter = _fields_getter(cls)
+
+        def converter(value: object) -> object:
+            return tuple([_convert_abi_value(item) for item in getter(value)])
+    elif issubclass(cls, (list, tuple)):
+        def converter(value: object) -> object:
+            # Arrays of scalars (e.g. uint256[]) are passed through w/o converting item by item
+            if all(type(item) in _ABI_SCALAR_TYPES for item in value):
+                return cls(value)
+            return cls(_convert_abi_value(item) for item in value)
+    else:
+        def converter(value: object) -> object:
+            return value
+
+    _ABI_CONVERTERS[cls] = converter
+    return converter
+
+
+def _convert_abi_value(value: object) -> object:
+    """Convert a single ABI arg value, recursing into dataclasses, lists and tuples"""
+    return _abi_converter(type(value))(value)
+
+
+def _is_txn_arg(value: object) -> bool:
+    """Check (w/ a per-type cache) if a value is a transaction argument the client handles itself"""
+    cls = type(value)
+    is_txn_arg = _IS_TXN_ARG.get(cls)
+    if is_txn_arg is None:
+        is_txn_arg = _IS_TXN_ARG[cls] = isinstance(value, algokit_utils.AppMethodCallTransactionArgument)
+    return is_txn_arg
+
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
     if args is None:
         return None
 
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
-    match args:
-        case tuple():
-            method_args = list(args)
-        case _ if dataclasses.is_dataclass(args):
-            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
-        case _:
-            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+    if isinstance(args, tuple):
+        method_args = list(args)
+    else:
+        getter = _ARGS_GETTERS.get(type(args))
+        if getter is None:
+            if not dataclasses.is_dataclass(args):
+                raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+            getter = _ARGS_GETTERS[type(args)] = _fields_getter(type(args))
+        method_args = list(getter(args))
 
     return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        _convert_abi_value(arg) if not _is_txn_arg(arg) else arg
         for arg in method_args
     ] if method_args else None
 
@@ -51,17 +122,23 @@ def _init_dataclass(cls: type, data: dict) -> object:
     """
     Recursively instantiate a dataclass of type `cls` from `data`.
 
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
+    The (field name, nested dataclass type) plan of each `cls` is built once and cached.
     """
+    plan = _DATACLASS_INITS.get(cls)
+    if plan is None:
+        plan = _DATACLASS_INITS[cls] = [
+            (field.name, typing.cast(type, field.type) if dataclasses.is_dataclass(field.type) else None)
+            for field in dataclasses.fields(cls)
+        ]
+
     field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
+    for name, nested in plan:
+        field_value = data.get(name)
         # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        if nested is not None and isinstance(field_value, dict):
+            field_values[name] = _init_dataclass(nested, field_value)
         else:
-            field_values[field.name] = field_value
+            field_values[name] = field_value
     return cls(**field_values)
 
 @dataclasses.dataclass(frozen=True)
@@ -328,7 +405,7 @@ class PlonkVerifierWithLogsClient:
             self.app_client = algokit_utils.AppClient(
                 algokit_utils.AppClientParams(
                     algorand=algorand,
-                    app_spec=APP_SPEC,
+                    app_spec=_get_app_spec(),
                     app_id=app_id,
                     app_name=app_name,
                     default_sender=default_sender,
@@ -361,7 +438,7 @@ class PlonkVerifierWithLogsClient:
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
                 app_name=app_name,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -383,7 +460,7 @@ class PlonkVerifierWithLogsClient:
     ) -> "PlonkVerifierWithLogsClient":
         return PlonkVerifierWithLogsClient(
             algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 app_name=app_name,
                 default_sender=default_sender,
@@ -500,7 +577,7 @@ class PlonkVerifierWithLogsFactory(algokit_utils.TypedAppFactoryProtocol[PlonkVe
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -20,30 +20,101 @@ import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
 _APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint256[]", "name": "signals"}, {"type": "(byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],byte[96],uint256,uint256,uint256,uint256,uint256,uint256)", "name": "proof", "struct": "Proof"}, {"type": "(uint256[],uint256,uint256)", "name": "lw", "struct": "LagrangeWitness"}], "name": "signalsAndProof", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "SignalsAndProof", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"LagrangeWitness": [{"name": "L", "type": "uint256[]"}, {"name": "xin", "type": "uint256"}, {"name": "zh", "type": "uint256"}], "Proof": [{"name": "A", "type": "byte[96]"}, {"name": "B", "type": "byte[96]"}, {"name": "C", "type": "byte[96]"}, {"name": "Z", "type": "byte[96]"}, {"name": "T1", "type": "byte[96]"}, {"name": "T2", "type": "byte[96]"}, {"name": "T3", "type": "byte[96]"}, {"name": "Wxi", "type": "byte[96]"}, {"name": "Wxiw", "type": "byte[96]"}, {"name": "eval_a", "type": "uint256"}, {"name": "eval_b", "type": "uint256"}, {"name": "eval_c", "type": "uint256"}, {"name": "eval_s1", "type": "uint256"}, {"name": "eval_s2", "type": "uint256"}, {"name": "eval_zw", "type": "uint256"}]}, "byteCode": {"approval": "CjEbQQAYgASsO/dwNhoAjgEAAQAxGRREMRhEgQFDMRlA//AxGBREgQFD", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBAYWxnb3JhbmRmb3VuZGF0aW9uL2FsZ29yYW5kLXR5cGVzY3JpcHQvYXJjNC9pbmRleC5kLnRzOjpDb250cmFjdC5hcHByb3ZhbFByb2dyYW0oKSAtPiB1aW50NjQ6Cm1haW46CiAgICAvLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czoxMjYKICAgIC8vIGV4cG9ydCBjbGFzcyBTaWduYWxzQW5kUHJvb2YgZXh0ZW5kcyBDb250cmFjdCB7CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdANgogICAgcHVzaGJ5dGVzIDB4YWMzYmY3NzAgLy8gbWV0aG9kICJzaWduYWxzQW5kUHJvb2YodWludDI1NltdLChieXRlWzk2XSxieXRlWzk2XSxieXRlWzk2XSxieXRlWzk2XSxieXRlWzk2XSxieXRlWzk2XSxieXRlWzk2XSxieXRlWzk2XSxieXRlWzk2XSx1aW50MjU2LHVpbnQyNTYsdWludDI1Nix1aW50MjU2LHVpbnQyNTYsdWludDI1NiksKHVpbnQyNTZbXSx1aW50MjU2LHVpbnQyNTYpKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX3NpZ25hbHNBbmRQcm9vZl9yb3V0ZUAzCgptYWluX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICBlcnIKCm1haW5fc2lnbmFsc0FuZFByb29mX3JvdXRlQDM6CiAgICAvLyBjb250cmFjdHMvdmVyaWZpZXIuYWxnby50czoxMjctMTMxCiAgICAvLyBwdWJsaWMgc2lnbmFsc0FuZFByb29mKAogICAgLy8gICBzaWduYWxzOiBVaW50MjU2W10sCiAgICAvLyAgIHByb29mOiBQcm9vZiwKICAgIC8vICAgbHc6IExhZ3JhbmdlV2l0bmVzcywKICAgIC8vICk6IHZvaWQge30KICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGludCAxIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdANjoKICAgIC8vIGNvbnRyYWN0cy92ZXJpZmllci5hbGdvLnRzOjEyNgogICAgLy8gZXhwb3J0IGNsYXNzIFNpZ25hbHNBbmRQcm9vZiBleHRlbmRzIENvbnRyYWN0IHsKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMTAKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBwdXNoaW50IDEgLy8gMQogICAgcmV0dXJuCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBAYWxnb3JhbmRmb3VuZGF0aW9uL2FsZ29yYW5kLXR5cGVzY3JpcHQvYmFzZS1jb250cmFjdC5kLnRzOjpCYXNlQ29udHJhY3QuY2xlYXJTdGF0ZVByb2dyYW0oKSAtPiB1aW50NjQ6Cm1haW46CiAgICBwdXNoaW50IDEgLy8gMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [23], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [38], "errorMessage": "can only call when creating"}, {"pc": [26], "errorMessage": "can only call when not creating"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+# post-processed: lazy APP_SPEC
+import functools
+
+
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    """Parse the embedded ARC-56 app spec once, on first use"""
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+
+def __getattr__(name: str) -> object:
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# post-processed: fast-path ABI helpers
+import operator
+
+_ABI_CONVERTERS: dict[type, typing.Callable[[object], object]] = {}
+_ARGS_GETTERS: dict[type, typing.Callable[[object], tuple]] = {}
+_IS_TXN_ARG: dict[type, bool] = {}
+_DATACLASS_INITS: dict[type, list[tuple[str, type | None]]] = {}
+_ABI_SCALAR_TYPES = (int, bool, str, bytes, bytearray, type(None))
+
+
+def _fields_getter(cls: type) -> typing.Callable[[object], tuple]:
+    """Build a getter returning the dataclass field values of `cls` as a tuple, in field order"""
+    names = [field.name for field in dataclasses.fields(cls)]
+    if len(names) == 1:
+        name = names[0]
+        return lambda value: (getattr(value, name),)
+    if not names:
+        return lambda value: ()
+    return operator.attrgetter(*names)
+
+
+def _abi_converter(cls: type) -> typing.Callable[[object], object]:
+    """Get the cached converter of a value type into the format expected by underlying client"""
+    converter = _ABI_CONVERTERS.get(cls)
+    if converter is not None:
+        return converter
+
+    if issubclass(cls, _ABI_SCALAR_TYPES):
+        def converter(value: object) -> object:
+            return value
+    elif dataclasses.is_dataclass(cls):
+        getter = _fields_getter(cls)
+
+        def converter(value: object) -> object:
+            return tuple([_convert_abi_value(item) for item in getter(value)])
+    elif issubclass(cls, (list, tuple)):
+        def converter(value: object) -> object:
+            # Arrays of scalars (e.g. uint256[]) are passed through w/o converting item by item
+            if all(type(item) in _ABI_SCALAR_TYPES for item in value):
+                return cls(value)
+            return cls(_convert_abi_value(item) for item in value)
+    else:
+        def converter(value: object) -> object:
+            return value
+
+    _ABI_CONVERTERS[cls] = converter
+    return converter
+
+
+def _convert_abi_value(value: object) -> object:
+    """Convert a single ABI arg value, recursing into dataclasses, lists and tuples"""
+    return _abi_converter(type(value))(value)
+
+
+def _is_txn_arg(value: object) -> bool:
+    """Check (w/ a per-type cache) if a value is a transaction argument the client handles itself"""
+    cls = type(value)
+    is_txn_arg = _IS_TXN_ARG.get(cls)
+    if is_txn_arg is None:
+        is_txn_arg = _IS_TXN_ARG[cls] = isinstance(value, algokit_utils.AppMethodCallTransactionArgument)
+    return is_txn_arg
+
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
     if args is None:
         return None
 
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
-    match args:
-        case tuple():
-            method_args = list(args)
-        case _ if dataclasses.is_dataclass(args):
-            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
-        case _:
-            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+    if isinstance(args, tuple):
+        method_args = list(args)
+    else:
+        getter = _ARGS_GETTERS.get(type(args))
+        if getter is None:
+            if not dataclasses.is_dataclass(args):
+                raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+            getter = _ARGS_GETTERS[type(args)] = _fields_getter(type(args))
+        method_args = list(getter(args))
 
     return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        _convert_abi_value(arg) if not _is_txn_arg(arg) else arg
         for arg in method_args
     ] if method_args else None
 
@@ -51,17 +122,23 @@ def _init_dataclass(cls: type, data: dict) -> object:
     """
     Recursively instantiate a dataclass of type `cls` from `data`.
 
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
+    The (field name, nested dataclass type) plan of each `cls` is built once and cached.
     """
+    plan = _DATACLASS_INITS.get(cls)
+    if plan is None:
+        plan = _DATACLASS_INITS[cls] = [
+            (field.name, typing.cast(type, field.type) if dataclasses.is_dataclass(field.type) else None)
+            for field in dataclasses.fields(cls)
+        ]
+
     field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
+    for name, nested in plan:
+        field_value = data.get(name)
         # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        if nested is not None and isinstance(field_value, dict):
+            field_values[name] = _init_dataclass(nested, field_value)
         else:
-            field_values[field.name] = field_value
+            field_values[name] = field_value
     return cls(**field_values)
 
 @dataclasses.dataclass(frozen=True)
@@ -233,7 +310,7 @@ class SignalsAndProofClient:
             self.app_client = algokit_utils.AppClient(
                 algokit_utils.AppClientParams(
                     algorand=algorand,
-                    app_spec=APP_SPEC,
+                    app_spec=_get_app_spec(),
                     app_id=app_id,
                     app_name=app_name,
                     default_sender=default_sender,
@@ -266,7 +343,7 @@ class SignalsAndProofClient:
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
                 app_name=app_name,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -288,7 +365,7 @@ class SignalsAndProofClient:
     ) -> "SignalsAndProofClient":
         return SignalsAndProofClient(
             algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 app_name=app_name,
                 default_sender=default_sender,
@@ -399,7 +476,7 @@ class SignalsAndProofFactory(algokit_utils.TypedAppFactoryProtocol[SignalsAndPro
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
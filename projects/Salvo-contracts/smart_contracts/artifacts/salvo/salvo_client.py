@@ -19,31 +19,102 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint8", "name": "key_size"}, {"type": "uint16", "name": "value_size"}], "name": "calc_single_box_cost", "returns": {"type": "uint64"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "read_gen_unix", "returns": {"type": "uint64"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}, {"type": "uint8", "name": "i"}], "name": "read_grid_cell_value_by_index", "returns": {"type": "uint8"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}, {"type": "uint8", "name": "x"}, {"type": "uint8", "name": "y"}], "name": "read_grid_cell_value_at_coords", "returns": {"type": "uint8"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "account"}], "name": "does_box_user_registry_exist", "returns": {"type": "bool"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}], "name": "does_box_game_grid_exist", "returns": {"type": "bool"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}], "name": "does_box_game_state_exist", "returns": {"type": "bool"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "account"}], "name": "does_box_game_character_exist", "returns": {"type": "bool"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}], "name": "read_box_game_lobby", "returns": {"type": "address[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "generate", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "box_r_pay"}], "name": "get_box_user_registry", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "box_g_pay"}, {"type": "pay", "name": "box_s_pay"}, {"type": "pay", "name": "box_c_pay"}, {"type": "pay", "name": "box_l_pay"}, {"type": "pay", "name": "stake_pay"}, {"type": "uint8", "name": "lobby_size"}], "name": "new_game", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}, {"type": "uint256", "name": "turn_hash"}], "name": "commit_turn", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "mimc_tester", "returns": {"type": "byte[]"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "Salvo", "state": {"keys": {"box": {}, "global": {"game_id": {"key": "Z2FtZV9pZA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"box_user_registry": {"keyType": "address", "valueType": "UserRegistry", "prefix": "cl8="}, "box_game_grid": {"keyType": "uint64", "valueType": "uint8[121]", "prefix": "Z18="}, "box_game_state": {"keyType": "uint64", "valueType": "GameState", "prefix": "c18="}, "box_game_lobby": {"keyType": "uint64", "valueType": "AVMBytes", "prefix": "bF8="}, "box_game_character": {"keyType": "address", "valueType": "GameCharacter", "prefix": "Y18="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"GameCharacter": [{"name": "has_committed_turn", "type": "bool"}, {"name": "id", "type": "uint8"}, {"name": "position", "type": "uint8"}, {"name": "move_points", "type": "uint8"}, {"name": "direction", "type": "uint8"}, {"name": "turn_hash", "type": "uint256"}], "GameState": [{"name": "staking_closed", "type": "bool"}, {"name": "lobby_size", "type": "uint8"}, {"name": "active_players", "type": "uint8"}, {"name": "box_l_start_pos", "type": "uint16"}, {"name": "expiry_ts", "type": "uint64"}, {"name": "prize_pot", "type": "uint64"}, {"name": "admin_address", "type": "address"}], "UserRegistry": [{"name": "hosting_game", "type": "bool"}, {"name": "game_id", "type": "uint64"}, {"name": "commit_rand_round", "type": "uint64"}, {"name": "expiry_round", "type": "uint64"}]}, "byteCode": {"approval": "CyAGAQAgAgAAJgkEFR98dQEAAmNfAmdfAnJfAnNfAmxfB2dhbWVfaWQDBoEBMRtBAHCCDwRjM82dBLZtL1YEiZa7NwRTgdaoBHgV/kEEC0LRKgS7+o4BBPhQU60EBvDRMgRb4hnwBD/7yiQEgekFQgT9HNdqBPcXIUgEoOgYcjYaAI4PAV8BTwE4AR4BAwDqANEAtgCiAJUAfwA7ACgAEAACI0MxGYEEEkQxGESIBUUiQzEZFEQxGESIBMtJFRZXBgJMUChMULAiQzEZFEQxGEQ2GgEXNhoCiAQ6IkMxGRREMRhEMRaBBQlJOBAiEkQxFoEECUk4ECISRDEWgQMJSTgQIhJEMRYlCUk4ECISRDEWIglJOBAiEkQ2GgGIAlEiQzEZFEQxGEQxFiIJSTgQIhJEiAH2IkMxGRREMRgURIgB5CJDMRkURDEYRDYaAReIAVUoTFCwIkMxGRREMRhENhoBF8AciAE0KSNPAlQoTFCwIkMxGRREMRhENhoBF4gBDSkjTwJUKExQsCJDMRkURDEYRDYaAReIAOcpI08CVChMULAiQzEZFEQxGEQ2GgEXwByIAMApI08CVChMULAiQzEZFEQxGEQ2GgEXNhoCNhoDiACBKExQsCJDMRkURDEYRDYaARc2GgKIAF4oTFCwIkMxGRREMRhEIQQWKExQsCJDMRkURDEYRDYaATYaAogAJRYoTFCwIkOKAwGL/RaL/kxQSb1FAUSL/xdJgXkMREy+REwiWImKAgGL/heL/xcIgZADC4HEEwiJigIBi/4ri/+I/8SJigMBi/4XgQsLi/8XCBZJk4EIDkRXBwGL/StPAoj/pImKAQEnBIv/UL5FAYmKAQGL/xYrTFC+RQGJigEBi/8WJwVMUL5FAYmKAQEqi/9QvkUBiYoBASNJi/8WJwZMUEm9RQFEvkxJTwJEgAIAAEwVI4sFiwQMQQBUiwKLBSRYSYwAgCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABOLA4wBQQAUiwNXAgCLAFBJFSQKFlcGAkxQjAGLAYwDiwUkCIwFQv+kiwOMAIknByJniYoBADIEJRJEJwQxAFC9RQEURIv/OAAxABJEi/84BzIKEkQyBoEeCBaAEQAAAAAAAAAAAAAAAAAAAAAATFAnBDEAUEy/iYoGADIEgQYSRIv6OAiB9KwDD0SL+zgIgbTYAQ9Ei/04CIv/F0lOAiQLSU4CFkmTgRAORFcGAoABCkyI/okPRIv6OAAxABJEi/s4ADEAEkSL/DgAMQASRIv9OAAxABJEi/44ADEAEkSL+jgHMgoSRIv7OAcyChJEi/w4BzIKEkSL/TgHMgoSRIv+OAcyChJEi/+AAQKnQQEJi/+AAQSmQQEAiwAlGEAA+SJEIycHZURJFitLAVCAeQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC/MgeBsAkIFov+OAgWMQApi/9QgAEBUIACACBQTwNQTwJQTFAnBUsCUEy/iwGvJwZPAlBJvEhJTwK/KjEAUIAlAAYFAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAL8jMQC7IggnB0xniSNC/wSKAgCAAIv+FkknBUxQSb1FAUQxAEy+RCVVJAsjSYsFiwMMiwSMAEEAFCcGiwFQvkSLBSRYiwISQQAvIowAiwBEKjEAUL5EI1MpI08CVCNTFEQqMQBQSb5Ei/9cBb8qMQBQSb5EIyJUv4mLBSQIjAVC/6uKAAEjgACBgpgEMgwNQQAYsYEGshCBBbIZJwiyHicIsh8jsgGzQv/egACMACOMAYsBgXkMQQAwiwCAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABUIwAiwEiCIwBQv/IiwDmAYwAiSEFRDEAMgkSRIk=", "clear": "C4EBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8uX19hbGdvcHlfZW50cnlwb2ludF93aXRoX2luaXQoKSAtPiB1aW50NjQ6Cm1haW46CiAgICBpbnRjYmxvY2sgMSAwIDMyIDIgVE1QTF9HRU5fVU5JWCBUTVBMX1VQREFUQUJMRQogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1IDB4MDAgImNfIiAiZ18iICJyXyIgInNfIiAibF8iICJnYW1lX2lkIiAweDA2ODEwMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwLTMxCiAgICAvLyAjIFNtYXJ0IGNvbnRyYWN0IGNsYXNzCiAgICAvLyBjbGFzcyBTYWx2byhBUkM0Q29udHJhY3QsIGF2bV92ZXJzaW9uPTExKToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2FmdGVyX2lmX2Vsc2VAMjAKICAgIHB1c2hieXRlc3MgMHg2MzMzY2Q5ZCAweGI2NmQyZjU2IDB4ODk5NmJiMzcgMHg1MzgxZDZhOCAweDc4MTVmZTQxIDB4MGI0MmQxMmEgMHhiYmZhOGUwMSAweGY4NTA1M2FkIDB4MDZmMGQxMzIgMHg1YmUyMTlmMCAweDNmZmJjYTI0IDB4ODFlOTA1NDIgMHhmZDFjZDc2YSAweGY3MTcyMTQ4IDB4YTBlODE4NzIgLy8gbWV0aG9kICJjYWxjX3NpbmdsZV9ib3hfY29zdCh1aW50OCx1aW50MTYpdWludDY0IiwgbWV0aG9kICJyZWFkX2dlbl91bml4KCl1aW50NjQiLCBtZXRob2QgInJlYWRfZ3JpZF9jZWxsX3ZhbHVlX2J5X2luZGV4KHVpbnQ2NCx1aW50OCl1aW50OCIsIG1ldGhvZCAicmVhZF9ncmlkX2NlbGxfdmFsdWVfYXRfY29vcmRzKHVpbnQ2NCx1aW50OCx1aW50OCl1aW50OCIsIG1ldGhvZCAiZG9lc19ib3hfdXNlcl9yZWdpc3RyeV9leGlzdChhY2NvdW50KWJvb2wiLCBtZXRob2QgImRvZXNfYm94X2dhbWVfZ3JpZF9leGlzdCh1aW50NjQpYm9vbCIsIG1ldGhvZCAiZG9lc19ib3hfZ2FtZV9zdGF0ZV9leGlzdCh1aW50NjQpYm9vbCIsIG1ldGhvZCAiZG9lc19ib3hfZ2FtZV9jaGFyYWN0ZXJfZXhpc3QoYWNjb3VudClib29sIiwgbWV0aG9kICJyZWFkX2JveF9nYW1lX2xvYmJ5KHVpbnQ2NClhZGRyZXNzW10iLCBtZXRob2QgImdlbmVyYXRlKCl2b2lkIiwgbWV0aG9kICJnZXRfYm94X3VzZXJfcmVnaXN0cnkocGF5KXZvaWQiLCBtZXRob2QgIm5ld19nYW1lKHBheSxwYXkscGF5LHBheSxwYXksdWludDgpdm9pZCIsIG1ldGhvZCAiY29tbWl0X3R1cm4odWludDY0LHVpbnQyNTYpdm9pZCIsIG1ldGhvZCAibWltY190ZXN0ZXIoKWJ5dGVbXSIsIG1ldGhvZCAidXBkYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9jYWxjX3NpbmdsZV9ib3hfY29zdF9yb3V0ZUA1IG1haW5fcmVhZF9nZW5fdW5peF9yb3V0ZUA2IG1haW5fcmVhZF9ncmlkX2NlbGxfdmFsdWVfYnlfaW5kZXhfcm91dGVANyBtYWluX3JlYWRfZ3JpZF9jZWxsX3ZhbHVlX2F0X2Nvb3Jkc19yb3V0ZUA4IG1haW5fZG9lc19ib3hfdXNlcl9yZWdpc3RyeV9leGlzdF9yb3V0ZUA5IG1haW5fZG9lc19ib3hfZ2FtZV9ncmlkX2V4aXN0X3JvdXRlQDEwIG1haW5fZG9lc19ib3hfZ2FtZV9zdGF0ZV9leGlzdF9yb3V0ZUAxMSBtYWluX2RvZXNfYm94X2dhbWVfY2hhcmFjdGVyX2V4aXN0X3JvdXRlQDEyIG1haW5fcmVhZF9ib3hfZ2FtZV9sb2JieV9yb3V0ZUAxMyBtYWluX2dlbmVyYXRlX3JvdXRlQDE0IG1haW5fZ2V0X2JveF91c2VyX3JlZ2lzdHJ5X3JvdXRlQDE1IG1haW5fbmV3X2dhbWVfcm91dGVAMTYgbWFpbl9jb21taXRfdHVybl9yb3V0ZUAxNyBtYWluX21pbWNfdGVzdGVyX3JvdXRlQDE4IG1haW5fdXBkYXRlX3JvdXRlQDE5CgptYWluX2FmdGVyX2lmX2Vsc2VAMjA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAtMzEKICAgIC8vICMgU21hcnQgY29udHJhY3QgY2xhc3MKICAgIC8vIGNsYXNzIFNhbHZvKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTEpOgogICAgaW50Y18xIC8vIDAKICAgIHJldHVybgoKbWFpbl91cGRhdGVfcm91dGVAMTk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDE3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBwdXNoaW50IDQgLy8gVXBkYXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBVcGRhdGVBcHBsaWNhdGlvbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHVwZGF0ZQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9taW1jX3Rlc3Rlcl9yb3V0ZUAxODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozNDUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIG1pbWNfdGVzdGVyCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9jb21taXRfdHVybl9yb3V0ZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyNTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAtMzEKICAgIC8vICMgU21hcnQgY29udHJhY3QgY2xhc3MKICAgIC8vIGNsYXNzIFNhbHZvKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTEpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjI1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGNvbW1pdF90dXJuCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX25ld19nYW1lX3JvdXRlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE2MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgcHVzaGludCA1IC8vIDUKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMCAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4biBHcm91cEluZGV4CiAgICBwdXNoaW50IDQgLy8gNAogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuIEdyb3VwSW5kZXgKICAgIHB1c2hpbnQgMyAvLyAzCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18zIC8vIDIKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMCAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE2MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIG5ld19nYW1lCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9ib3hfdXNlcl9yZWdpc3RyeV9yb3V0ZUAxNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMzcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAtMzEKICAgIC8vICMgU21hcnQgY29udHJhY3QgY2xhc3MKICAgIC8vIGNsYXNzIFNhbHZvKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTEpOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTM3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgZ2V0X2JveF91c2VyX3JlZ2lzdHJ5CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dlbmVyYXRlX3JvdXRlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjEyNS0xMjYKICAgIC8vICMgR2VuZXJhdGUgdGhlIHNtYXJ0IGNvbnRyYWN0IGFwcGxpY2F0aW9uIGNsaWVudAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgY2FsbHN1YiBnZW5lcmF0ZQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZWFkX2JveF9nYW1lX2xvYmJ5X3JvdXRlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjEwMS0xMDIKICAgIC8vICMgUkVBRC1PTkxZOiBSZXR1cm4gYW4gYXJyYXkgb2YgYWxsIGFjdGl2ZSB1c2VycyBpbiB0aGUgZ2FtZSBsb2JieSBhdCB0aW1lIG9mIGNhbGwKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAtMzEKICAgIC8vICMgU21hcnQgY29udHJhY3QgY2xhc3MKICAgIC8vIGNsYXNzIFNhbHZvKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTEpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjEwMS0xMDIKICAgIC8vICMgUkVBRC1PTkxZOiBSZXR1cm4gYW4gYXJyYXkgb2YgYWxsIGFjdGl2ZSB1c2VycyBpbiB0aGUgZ2FtZSBsb2JieSBhdCB0aW1lIG9mIGNhbGwKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiByZWFkX2JveF9nYW1lX2xvYmJ5CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2RvZXNfYm94X2dhbWVfY2hhcmFjdGVyX2V4aXN0X3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojk2LTk3CiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIFRydWUgaWYgZ2FtZSBjaGFyYWN0ZXIgYm94IHZhbHVlIGV4aXN0cywgZWxzZSBGYWxzZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojk2LTk3CiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIFRydWUgaWYgZ2FtZSBjaGFyYWN0ZXIgYm94IHZhbHVlIGV4aXN0cywgZWxzZSBGYWxzZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGRvZXNfYm94X2dhbWVfY2hhcmFjdGVyX2V4aXN0CiAgICBieXRlY18xIC8vIDB4MDAKICAgIGludGNfMSAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9kb2VzX2JveF9nYW1lX3N0YXRlX2V4aXN0X3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjkxLTkyCiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIFRydWUgaWYgZ2FtZSBzdGF0ZSBib3ggdmFsdWUgZXhpc3RzLCBlbHNlIEZhbHNlCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwLTMxCiAgICAvLyAjIFNtYXJ0IGNvbnRyYWN0IGNsYXNzCiAgICAvLyBjbGFzcyBTYWx2byhBUkM0Q29udHJhY3QsIGF2bV92ZXJzaW9uPTExKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo5MS05MgogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBUcnVlIGlmIGdhbWUgc3RhdGUgYm94IHZhbHVlIGV4aXN0cywgZWxzZSBGYWxzZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGRvZXNfYm94X2dhbWVfc3RhdGVfZXhpc3QKICAgIGJ5dGVjXzEgLy8gMHgwMAogICAgaW50Y18xIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2RvZXNfYm94X2dhbWVfZ3JpZF9leGlzdF9yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4Ni04NwogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBUcnVlIGlmIGdhbWUgZ3JpZCBib3ggdmFsdWUgZXhpc3RzLCBlbHNlIEZhbHNlCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwLTMxCiAgICAvLyAjIFNtYXJ0IGNvbnRyYWN0IGNsYXNzCiAgICAvLyBjbGFzcyBTYWx2byhBUkM0Q29udHJhY3QsIGF2bV92ZXJzaW9uPTExKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4Ni04NwogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBUcnVlIGlmIGdhbWUgZ3JpZCBib3ggdmFsdWUgZXhpc3RzLCBlbHNlIEZhbHNlCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZG9lc19ib3hfZ2FtZV9ncmlkX2V4aXN0CiAgICBieXRlY18xIC8vIDB4MDAKICAgIGludGNfMSAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9kb2VzX2JveF91c2VyX3JlZ2lzdHJ5X2V4aXN0X3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODEtODIKICAgIC8vICMgUkVBRC1PTkxZOiBSZXR1cm4gVHJ1ZSBpZiB1c2VyIHJlZ2lzdHJ5IGJveCB2YWx1ZSBleGlzdHMsIGVsc2UgRmFsc2UKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAtMzEKICAgIC8vICMgU21hcnQgY29udHJhY3QgY2xhc3MKICAgIC8vIGNsYXNzIFNhbHZvKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTEpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MS04MgogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBUcnVlIGlmIHVzZXIgcmVnaXN0cnkgYm94IHZhbHVlIGV4aXN0cywgZWxzZSBGYWxzZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGRvZXNfYm94X3VzZXJfcmVnaXN0cnlfZXhpc3QKICAgIGJ5dGVjXzEgLy8gMHgwMAogICAgaW50Y18xIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3JlYWRfZ3JpZF9jZWxsX3ZhbHVlX2F0X2Nvb3Jkc19yb3V0ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjcxLTcyCiAgICAvLyAjIFJFQUQtT05MWTogUmVhZCBnYW1lIGdyaWQgY2VsbCB2YWx1ZSBhdCB4IGFuZCB5IGNvb3JkaW5hdGVzIHVuZGVyIHRoZSBnaXZlbiBnYW1lIGlkIGtleQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzEtNzIKICAgIC8vICMgUkVBRC1PTkxZOiBSZWFkIGdhbWUgZ3JpZCBjZWxsIHZhbHVlIGF0IHggYW5kIHkgY29vcmRpbmF0ZXMgdW5kZXIgdGhlIGdpdmVuIGdhbWUgaWQga2V5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgcmVhZF9ncmlkX2NlbGxfdmFsdWVfYXRfY29vcmRzCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3JlYWRfZ3JpZF9jZWxsX3ZhbHVlX2J5X2luZGV4X3JvdXRlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjMtNjQKICAgIC8vICMgUkVBRC1PTkxZOiBSZWFkIGdhbWUgZ3JpZCBjZWxsIHZhbHVlIGF0IGFycmF5IGluZGV4IHVuZGVyIHRoZSBnaXZlbiBnYW1lIGlkIGtleQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjMtNjQKICAgIC8vICMgUkVBRC1PTkxZOiBSZWFkIGdhbWUgZ3JpZCBjZWxsIHZhbHVlIGF0IGFycmF5IGluZGV4IHVuZGVyIHRoZSBnaXZlbiBnYW1lIGlkIGtleQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIHJlYWRfZ3JpZF9jZWxsX3ZhbHVlX2J5X2luZGV4CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3JlYWRfZ2VuX3VuaXhfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1OC01OQogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiB0aGUgYXBwIGdlbmVzaXMgdGltZXN0YW1wIGluIFVuaXggZm9ybWF0CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjYxCiAgICAvLyByZXR1cm4gVGVtcGxhdGVWYXJbVUludDY0XSgiR0VOX1VOSVgiKQogICAgaW50YyA0IC8vIFRNUExfR0VOX1VOSVgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1OC01OQogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiB0aGUgYXBwIGdlbmVzaXMgdGltZXN0YW1wIGluIFVuaXggZm9ybWF0CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY2FsY19zaW5nbGVfYm94X2Nvc3Rfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0NC00NQogICAgLy8gIyBSRUFELU9OTFk6IENhbGN1bGF0ZSB0aGUgbWluaW11bSBiYWxhbmNlIHJlcXVpcmVtZW50IChNQlIpIGNvc3QgZm9yIHN0b3JpbmcgYSBzaW5nbGUgYm94IHVuaXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAtMzEKICAgIC8vICMgU21hcnQgY29udHJhY3QgY2xhc3MKICAgIC8vIGNsYXNzIFNhbHZvKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTEpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQ0LTQ1CiAgICAvLyAjIFJFQUQtT05MWTogQ2FsY3VsYXRlIHRoZSBtaW5pbXVtIGJhbGFuY2UgcmVxdWlyZW1lbnQgKE1CUikgY29zdCBmb3Igc3RvcmluZyBhIHNpbmdsZSBib3ggdW5pdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGNhbGNfc2luZ2xlX2JveF9jb3N0CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLnN1YnJvdXRpbmVzLmdldF9ncmlkX2NlbGxfdmFsdWUoZ2FtZV9pZDogdWludDY0LCBib3hfZ2FtZV9ncmlkOiBieXRlcywgaTogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfZ3JpZF9jZWxsX3ZhbHVlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjE5OS0yMDMKICAgIC8vICMgR2V0IHRoZSB2YWx1ZSBvZiBhIGdyaWQgY2VsbCBhdCB0aGUgZXF1aXZhbGVudCBmbGF0dGVuZWQgMUQgYXJyYXkgaW5kZXgKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X2dyaWRfY2VsbF92YWx1ZSgKICAgIC8vICAgICBnYW1lX2lkOiBVSW50NjQsIGJveF9nYW1lX2dyaWQ6IEJveE1hcFtVSW50NjQsIHRhLkdhbWVHcmlkXSwgaTogYXJjNC5VSW50OAogICAgLy8gKSAtPiBhcmM0LlVJbnQ4OgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjA0LTIwNQogICAgLy8gIyBGYWlsIHRyYW5zYWN0aW9uIHVubGVzcyB0aGUgYXNzZXJ0aW9uIGJlbG93IGV2YWx1YXRlcyBUcnVlCiAgICAvLyBhc3NlcnQgZ2FtZV9pZCBpbiBib3hfZ2FtZV9ncmlkLCBlcnIuR0FNRV9JRF9OT1RfRk9VTkQKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gR2FtZSBJRCBub3QgZm91bmQuIEVuc3VyZSB0aGUgZ2FtZSB3YXMgY3JlYXRlZCBhbmQgc3RpbGwgZXhpc3RzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjIwNgogICAgLy8gYXNzZXJ0IGkubmF0aXZlIDwgY3N0LkdSSURfQ0VMTF9UT1RBTCwgZXJyLklOVkFMSURfUE9TX0lOREVYCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGR1cAogICAgcHVzaGludCAxMjEgLy8gMTIxCiAgICA8CiAgICBhc3NlcnQgLy8gSW52YWxpZCBwb3NpdGlvbiBpbmRleC4gRW5zdXJlIGluZGV4IHZhbHVlIGlzIHdpdGhpbiB2YWxpZCByYW5nZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyMDgtMjA5CiAgICAvLyAjIEFjY2VzcyB0aGUgZ2FtZSBncmlkIGJveCBjb250ZW50cywgYXQgdGhlIGdpdmVuIGluZGV4LCBhbmQgcmV0dXJuIHRoZSBieXRlIHZhbHVlCiAgICAvLyByZXR1cm4gYm94X2dhbWVfZ3JpZFtnYW1lX2lkXVtpLm5hdGl2ZV0KICAgIHN3YXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBCb3hNYXAgZW50cnkgZXhpc3RzCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMQogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8uY2FsY19zaW5nbGVfYm94X2Nvc3Qoa2V5X3NpemU6IGJ5dGVzLCB2YWx1ZV9zaXplOiBieXRlcykgLT4gdWludDY0OgpjYWxjX3NpbmdsZV9ib3hfY29zdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0NC00OAogICAgLy8gIyBSRUFELU9OTFk6IENhbGN1bGF0ZSB0aGUgbWluaW11bSBiYWxhbmNlIHJlcXVpcmVtZW50IChNQlIpIGNvc3QgZm9yIHN0b3JpbmcgYSBzaW5nbGUgYm94IHVuaXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGNhbGNfc2luZ2xlX2JveF9jb3N0KAogICAgLy8gICAgIHNlbGYsIGtleV9zaXplOiBhcmM0LlVJbnQ4LCB2YWx1ZV9zaXplOiBhcmM0LlVJbnQxNgogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1MgogICAgLy8ga2V5X3NpemUubmF0aXZlICsgdmFsdWVfc2l6ZS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTEKICAgIC8vIHNpemVfY29zdCA9IGFyYzQuVUludDE2KDQwMCkubmF0aXZlICogKAogICAgcHVzaGludCA0MDAgLy8gNDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTEtNTMKICAgIC8vIHNpemVfY29zdCA9IGFyYzQuVUludDE2KDQwMCkubmF0aXZlICogKAogICAgLy8gICAgIGtleV9zaXplLm5hdGl2ZSArIHZhbHVlX3NpemUubmF0aXZlCiAgICAvLyApICAjIFNpemUgZmVlICg0MDAgcGVyIGJ5dGUgKiAobGVuKGtleSkrbGVuKHZhbHVlKSkpCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTUtNTYKICAgIC8vICMgUmV0dXJuIHNpbmdsZSBib3ggdG90YWwgY29zdCBhbW91bnQKICAgIC8vIHJldHVybiBiYXNlX2Nvc3QubmF0aXZlICsgc2l6ZV9jb3N0CiAgICBwdXNoaW50IDI1MDAgLy8gMjUwMAogICAgKwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLnJlYWRfZ3JpZF9jZWxsX3ZhbHVlX2J5X2luZGV4KGdhbWVfaWQ6IHVpbnQ2NCwgaTogYnl0ZXMpIC0+IGJ5dGVzOgpyZWFkX2dyaWRfY2VsbF92YWx1ZV9ieV9pbmRleDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2My02NwogICAgLy8gIyBSRUFELU9OTFk6IFJlYWQgZ2FtZSBncmlkIGNlbGwgdmFsdWUgYXQgYXJyYXkgaW5kZXggdW5kZXIgdGhlIGdpdmVuIGdhbWUgaWQga2V5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiByZWFkX2dyaWRfY2VsbF92YWx1ZV9ieV9pbmRleCgKICAgIC8vICAgICBzZWxmLCBnYW1lX2lkOiBVSW50NjQsIGk6IGFyYzQuVUludDgKICAgIC8vICkgLT4gYXJjNC5VSW50ODoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjY4LTY5CiAgICAvLyAjIFJldHVybiBieXRlIHZhbHVlIGF0IGdyaWQgY2VsbCBpbmRleAogICAgLy8gcmV0dXJuIHNydC5nZXRfZ3JpZF9jZWxsX3ZhbHVlKGdhbWVfaWQsIHNlbGYuYm94X2dhbWVfZ3JpZCwgaSkKICAgIGZyYW1lX2RpZyAtMgogICAgYnl0ZWNfMyAvLyAiZ18iCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgZ2V0X2dyaWRfY2VsbF92YWx1ZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLnJlYWRfZ3JpZF9jZWxsX3ZhbHVlX2F0X2Nvb3JkcyhnYW1lX2lkOiB1aW50NjQsIHg6IGJ5dGVzLCB5OiBieXRlcykgLT4gYnl0ZXM6CnJlYWRfZ3JpZF9jZWxsX3ZhbHVlX2F0X2Nvb3JkczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3MS03NQogICAgLy8gIyBSRUFELU9OTFk6IFJlYWQgZ2FtZSBncmlkIGNlbGwgdmFsdWUgYXQgeCBhbmQgeSBjb29yZGluYXRlcyB1bmRlciB0aGUgZ2l2ZW4gZ2FtZSBpZCBrZXkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIHJlYWRfZ3JpZF9jZWxsX3ZhbHVlX2F0X2Nvb3JkcygKICAgIC8vICAgICBzZWxmLCBnYW1lX2lkOiBVSW50NjQsIHg6IGFyYzQuVUludDgsIHk6IGFyYzQuVUludDgKICAgIC8vICkgLT4gYXJjNC5VSW50ODoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjE5MgogICAgLy8gcm93Lm5hdGl2ZSAqIGNzdC5HUklEX1NJWkUgKyBjb2wubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIHB1c2hpbnQgMTEgLy8gMTEKICAgICoKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjE5NS0xOTYKICAgIC8vICMgUmV0dXJuIGluZGV4IHZhbHVlIHdyYXBwZWQgaW4gYW4gVUludDggZGF0YSB0eXBlCiAgICAvLyByZXR1cm4gYXJjNC5VSW50OChpKQogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc2LTc5CiAgICAvLyAjIENvbnZlcnQgeCAmIHkgY29vcmRzIHRvIGdyaWQgY2VsbCBpbmRleCwgdGhlbiByZXR1cm4gYnl0ZSB2YWx1ZSBhdCB0aGF0IGluZGV4CiAgICAvLyByZXR1cm4gc3J0LmdldF9ncmlkX2NlbGxfdmFsdWUoCiAgICAvLyAgICAgZ2FtZV9pZCwgc2VsZi5ib3hfZ2FtZV9ncmlkLCBzcnQuY29udmVydF9ncmlkX2Nvb3Jkc190b19pbmRleCh4LCB5KQogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzgKICAgIC8vIGdhbWVfaWQsIHNlbGYuYm94X2dhbWVfZ3JpZCwgc3J0LmNvbnZlcnRfZ3JpZF9jb29yZHNfdG9faW5kZXgoeCwgeSkKICAgIGJ5dGVjXzMgLy8gImdfIgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc2LTc5CiAgICAvLyAjIENvbnZlcnQgeCAmIHkgY29vcmRzIHRvIGdyaWQgY2VsbCBpbmRleCwgdGhlbiByZXR1cm4gYnl0ZSB2YWx1ZSBhdCB0aGF0IGluZGV4CiAgICAvLyByZXR1cm4gc3J0LmdldF9ncmlkX2NlbGxfdmFsdWUoCiAgICAvLyAgICAgZ2FtZV9pZCwgc2VsZi5ib3hfZ2FtZV9ncmlkLCBzcnQuY29udmVydF9ncmlkX2Nvb3Jkc190b19pbmRleCh4LCB5KQogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIGdldF9ncmlkX2NlbGxfdmFsdWUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by5kb2VzX2JveF91c2VyX3JlZ2lzdHJ5X2V4aXN0KGFjY291bnQ6IGJ5dGVzKSAtPiB1aW50NjQ6CmRvZXNfYm94X3VzZXJfcmVnaXN0cnlfZXhpc3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODEtODMKICAgIC8vICMgUkVBRC1PTkxZOiBSZXR1cm4gVHJ1ZSBpZiB1c2VyIHJlZ2lzdHJ5IGJveCB2YWx1ZSBleGlzdHMsIGVsc2UgRmFsc2UKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGRvZXNfYm94X3VzZXJfcmVnaXN0cnlfZXhpc3Qoc2VsZiwgYWNjb3VudDogQWNjb3VudCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg0CiAgICAvLyByZXR1cm4gc2VsZi5ib3hfdXNlcl9yZWdpc3RyeS5tYXliZShhY2NvdW50KVsxXQogICAgYnl0ZWMgNCAvLyAicl8iCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYnVyeSAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8uZG9lc19ib3hfZ2FtZV9ncmlkX2V4aXN0KGdhbWVfaWQ6IHVpbnQ2NCkgLT4gdWludDY0Ogpkb2VzX2JveF9nYW1lX2dyaWRfZXhpc3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODYtODgKICAgIC8vICMgUkVBRC1PTkxZOiBSZXR1cm4gVHJ1ZSBpZiBnYW1lIGdyaWQgYm94IHZhbHVlIGV4aXN0cywgZWxzZSBGYWxzZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZG9lc19ib3hfZ2FtZV9ncmlkX2V4aXN0KHNlbGYsIGdhbWVfaWQ6IFVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg5CiAgICAvLyByZXR1cm4gc2VsZi5ib3hfZ2FtZV9ncmlkLm1heWJlKGdhbWVfaWQpWzFdCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjXzMgLy8gImdfIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBidXJ5IDEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by5kb2VzX2JveF9nYW1lX3N0YXRlX2V4aXN0KGdhbWVfaWQ6IHVpbnQ2NCkgLT4gdWludDY0Ogpkb2VzX2JveF9nYW1lX3N0YXRlX2V4aXN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjkxLTkzCiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIFRydWUgaWYgZ2FtZSBzdGF0ZSBib3ggdmFsdWUgZXhpc3RzLCBlbHNlIEZhbHNlCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBkb2VzX2JveF9nYW1lX3N0YXRlX2V4aXN0KHNlbGYsIGdhbWVfaWQ6IFVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojk0CiAgICAvLyByZXR1cm4gc2VsZi5ib3hfZ2FtZV9zdGF0ZS5tYXliZShnYW1lX2lkKVsxXQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlYyA1IC8vICJzXyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYnVyeSAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8uZG9lc19ib3hfZ2FtZV9jaGFyYWN0ZXJfZXhpc3QoYWNjb3VudDogYnl0ZXMpIC0+IHVpbnQ2NDoKZG9lc19ib3hfZ2FtZV9jaGFyYWN0ZXJfZXhpc3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6OTYtOTgKICAgIC8vICMgUkVBRC1PTkxZOiBSZXR1cm4gVHJ1ZSBpZiBnYW1lIGNoYXJhY3RlciBib3ggdmFsdWUgZXhpc3RzLCBlbHNlIEZhbHNlCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBkb2VzX2JveF9nYW1lX2NoYXJhY3Rlcl9leGlzdChzZWxmLCBhY2NvdW50OiBBY2NvdW50KSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6OTkKICAgIC8vIHJldHVybiBzZWxmLmJveF9nYW1lX2NoYXJhY3Rlci5tYXliZShhY2NvdW50KVsxXQogICAgYnl0ZWNfMiAvLyAiY18iCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYnVyeSAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8ucmVhZF9ib3hfZ2FtZV9sb2JieShnYW1lX2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpyZWFkX2JveF9nYW1lX2xvYmJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjEwMS0xMDMKICAgIC8vICMgUkVBRC1PTkxZOiBSZXR1cm4gYW4gYXJyYXkgb2YgYWxsIGFjdGl2ZSB1c2VycyBpbiB0aGUgZ2FtZSBsb2JieSBhdCB0aW1lIG9mIGNhbGwKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIHJlYWRfYm94X2dhbWVfbG9iYnkoc2VsZiwgZ2FtZV9pZDogVUludDY0KSAtPiB0YS5HYW1lTG9iYnk6CiAgICBwcm90byAxIDEKICAgIGludGNfMSAvLyAwCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMDQtMTA1CiAgICAvLyAjIEZhaWwgdHJhbnNhY3Rpb24gdW5sZXNzIHRoZSBhc3NlcnRpb24gYmVsb3cgZXZhbHVhdGVzIFRydWUKICAgIC8vIGFzc2VydCBnYW1lX2lkIGluIHNlbGYuYm94X2dhbWVfbG9iYnksIGVyci5HQU1FX0lEX05PVF9GT1VORAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlYyA2IC8vICJsXyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBHYW1lIElEIG5vdCBmb3VuZC4gRW5zdXJlIHRoZSBnYW1lIHdhcyBjcmVhdGVkIGFuZCBzdGlsbCBleGlzdHMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTA3LTEwOAogICAgLy8gIyBSZXRyaWV2ZSBieXRlIGFycmF5IG9mIGN1cnJlbnQgdXNlciBhZGRyZXNzZXMgZnJvbSB0aGUgYm94IHVzaW5nIHRoZSBnYW1lIGlkIHBhcmFtZXRlcgogICAgLy8gZ2FtZV9sb2JieV9iX2FyciA9IHNlbGYuYm94X2dhbWVfbG9iYnlbZ2FtZV9pZF0KICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3hfZ2FtZV9sb2JieSBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMTAtMTExCiAgICAvLyAjIERlZmluZSBhIGR5bmFtaWMgYXJyYXkgdG8gYXBwZW5kIGFsbCByZW1haW5pbmcgYWN0aXZlIHVzZXJzCiAgICAvLyB1c2Vyc19pbl9sb2JieSA9IHRhLkdhbWVMb2JieSgpCiAgICBwdXNoYnl0ZXMgMHgwMDAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTEzLTExNAogICAgLy8gIyBJdGVyYXRlIHRocm91Z2ggdGhlIHVzZXJzIGJ5dGUgYXJyYXkKICAgIC8vIGZvciBpIGluIHVyYW5nZSgwLCBnYW1lX2xvYmJ5X2JfYXJyLmxlbmd0aCwgY3N0LkFERFJFU1NfU0laRSk6CiAgICBsZW4KICAgIGludGNfMSAvLyAwCgpyZWFkX2JveF9nYW1lX2xvYmJ5X2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMTMtMTE0CiAgICAvLyAjIEl0ZXJhdGUgdGhyb3VnaCB0aGUgdXNlcnMgYnl0ZSBhcnJheQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKDAsIGdhbWVfbG9iYnlfYl9hcnIubGVuZ3RoLCBjc3QuQUREUkVTU19TSVpFKToKICAgIGZyYW1lX2RpZyA1CiAgICBmcmFtZV9kaWcgNAogICAgPAogICAgYnogcmVhZF9ib3hfZ2FtZV9sb2JieV9hZnRlcl9mb3JANgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjExNS0xMTYKICAgIC8vICMgRXh0cmFjdCB0aGUgYnl0ZXMgcmVwcmVzZW50aW5nIHRoZSB1c2VyIGFkZHJlc3MKICAgIC8vIHVzZXJfYWRkcl9ieXRlcyA9IG9wLmV4dHJhY3QoZ2FtZV9sb2JieV9iX2FyciwgaSwgY3N0LkFERFJFU1NfU0laRSkKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgNQogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMTctMTE4CiAgICAvLyAjIE9ubHkgYXBwZW5kIGFkZHJlc3MgaWYgaXRzIGJ5dGVzIGRvIE5PVCBlcXVhbCB0byBhIHplcm9lZCBieXRlIGFycmF5IG9mIHNpemUgMzIKICAgIC8vIGlmIHVzZXJfYWRkcl9ieXRlcyAhPSBCeXRlcyhjc3QuWkVST0VEX0FERFJfQllURVMpOgogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgIT0KICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IDEKICAgIGJ6IHJlYWRfYm94X2dhbWVfbG9iYnlfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTIwCiAgICAvLyB1c2Vyc19pbl9sb2JieS5hcHBlbmQoYXJjNC5BZGRyZXNzKHVzZXJfYWNjb3VudCkpCiAgICBmcmFtZV9kaWcgMwogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMQoKcmVhZF9ib3hfZ2FtZV9sb2JieV9hZnRlcl9pZl9lbHNlQDQ6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTEzLTExNAogICAgLy8gIyBJdGVyYXRlIHRocm91Z2ggdGhlIHVzZXJzIGJ5dGUgYXJyYXkKICAgIC8vIGZvciBpIGluIHVyYW5nZSgwLCBnYW1lX2xvYmJ5X2JfYXJyLmxlbmd0aCwgY3N0LkFERFJFU1NfU0laRSk6CiAgICBmcmFtZV9kaWcgNQogICAgaW50Y18yIC8vIDMyCiAgICArCiAgICBmcmFtZV9idXJ5IDUKICAgIGIgcmVhZF9ib3hfZ2FtZV9sb2JieV9mb3JfaGVhZGVyQDEKCnJlYWRfYm94X2dhbWVfbG9iYnlfYWZ0ZXJfZm9yQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTIyLTEyMwogICAgLy8gIyBSZXR1cm4gdGhlIGFycmF5IGNvbnRhaW5pbmcgdGhlIHJlbWFpbmluZyBhY3RpdmUgdXNlcnMgaW4gdGhlIGdhbWUgbG9iYnkKICAgIC8vIHJldHVybiB1c2Vyc19pbl9sb2JieQogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLmdlbmVyYXRlKCkgLT4gdm9pZDoKZ2VuZXJhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTM0LTEzNQogICAgLy8gIyBTZXQgR2xvYmFsIFN0YXRlIHZhcmlhYmxlcyB0byB0aGVpciBkZWZhdWx0IHN0YXJ0aW5nIHZhbHVlcwogICAgLy8gc2VsZi5nYW1lX2lkID0gVUludDY0KDEpCiAgICBieXRlYyA3IC8vICJnYW1lX2lkIgogICAgaW50Y18wIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8uZ2V0X2JveF91c2VyX3JlZ2lzdHJ5KGJveF9yX3BheTogdWludDY0KSAtPiB2b2lkOgpnZXRfYm94X3VzZXJfcmVnaXN0cnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTM3LTE0MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZ2V0X2JveF91c2VyX3JlZ2lzdHJ5KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgYm94X3JfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE0Mi0xNDMKICAgIC8vICMgRmFpbCB0cmFuc2FjdGlvbiB1bmxlc3MgdGhlIGFzc2VydGlvbiBiZWxvdyBldmFsdWF0ZXMgVHJ1ZQogICAgLy8gYXNzZXJ0IEdsb2JhbC5ncm91cF9zaXplID09IDIsIGVyci5JTlZBTElEX0dST1VQX1NJWkUKICAgIGdsb2JhbCBHcm91cFNpemUKICAgIGludGNfMyAvLyAyCiAgICA9PQogICAgYXNzZXJ0IC8vIEludmFsaWQgZ3JvdXAgc2l6ZS4gRW5zdXJlIG51bWJlciBvZiB0cmFuc2FjdGlvbnMgaW4gZ3JvdXAgaXMgd2l0aGluIHZhbGlkIGJvdW5kcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNDQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyIG5vdCBpbiBzZWxmLmJveF91c2VyX3JlZ2lzdHJ5LCBlcnIuQk9YX0ZPVU5ECiAgICBieXRlYyA0IC8vICJyXyIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gQm94IGZvdW5kLiBFbnN1cmUgdGhlIGJveCBkb2VzIG5vdCBleGlzdC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNDctMTQ4CiAgICAvLyAjIGFzc2VydCBib3hfcl9wYXkuYW1vdW50ID09IGNzdC5CT1hfUl9DT1NULCBlcnIuSU5TVUZGSUNJRU5UX1BBWV9BTU9VTlQKICAgIC8vIGFzc2VydCBib3hfcl9wYXkuc2VuZGVyID09IFR4bi5zZW5kZXIsIGVyci5JTlZBTElEX0JPWF9QQVlfU0VOREVSCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBCb3ggcGF5bWVudCBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIHRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gYm94X3JfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE0OS0xNTEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYm94X3JfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksIGVyci5JTlZBTElEX0JPWF9QQVlfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBCb3ggcGF5bWVudCByZWNlaXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNTgKICAgIC8vIGV4cGlyeV9yb3VuZD1hcmM0LlVJbnQ2NChHbG9iYWwucm91bmQgKyBjc3QuQk9YX1JfRVhQX1JPVU5EX0RFTFRBKSwKICAgIGdsb2JhbCBSb3VuZAogICAgcHVzaGludCAzMCAvLyAzMAogICAgKwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE1My0xNTkKICAgIC8vICMgQ3JlYXRlIGEgbmV3IGJveCBzdG9yYWdlIHVuaXQgZm9yIHRoZSB1c2VyIHJlZ2lzdHJ5IHcvIHRoZSBzZW5kZXIgYWRkcmVzcyB2YWx1ZSBhcyBrZXkKICAgIC8vIHNlbGYuYm94X3VzZXJfcmVnaXN0cnlbVHhuLnNlbmRlcl0gPSBzdGMuVXNlclJlZ2lzdHJ5KAogICAgLy8gICAgIGhvc3RpbmdfZ2FtZT1hcmM0LkJvb2woRmFsc2UpLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICBnYW1lX2lkPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGNvbW1pdF9yYW5kX3JvdW5kPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGV4cGlyeV9yb3VuZD1hcmM0LlVJbnQ2NChHbG9iYWwucm91bmQgKyBjc3QuQk9YX1JfRVhQX1JPVU5EX0RFTFRBKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE1My0xNTQKICAgIC8vICMgQ3JlYXRlIGEgbmV3IGJveCBzdG9yYWdlIHVuaXQgZm9yIHRoZSB1c2VyIHJlZ2lzdHJ5IHcvIHRoZSBzZW5kZXIgYWRkcmVzcyB2YWx1ZSBhcyBrZXkKICAgIC8vIHNlbGYuYm94X3VzZXJfcmVnaXN0cnlbVHhuLnNlbmRlcl0gPSBzdGMuVXNlclJlZ2lzdHJ5KAogICAgYnl0ZWMgNCAvLyAicl8iCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNTMtMTU5CiAgICAvLyAjIENyZWF0ZSBhIG5ldyBib3ggc3RvcmFnZSB1bml0IGZvciB0aGUgdXNlciByZWdpc3RyeSB3LyB0aGUgc2VuZGVyIGFkZHJlc3MgdmFsdWUgYXMga2V5CiAgICAvLyBzZWxmLmJveF91c2VyX3JlZ2lzdHJ5W1R4bi5zZW5kZXJdID0gc3RjLlVzZXJSZWdpc3RyeSgKICAgIC8vICAgICBob3N0aW5nX2dhbWU9YXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgZ2FtZV9pZD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBjb21taXRfcmFuZF9yb3VuZD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBleHBpcnlfcm91bmQ9YXJjNC5VSW50NjQoR2xvYmFsLnJvdW5kICsgY3N0LkJPWF9SX0VYUF9ST1VORF9ERUxUQSksCiAgICAvLyApCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8ubmV3X2dhbWUoYm94X2dfcGF5OiB1aW50NjQsIGJveF9zX3BheTogdWludDY0LCBib3hfY19wYXk6IHVpbnQ2NCwgYm94X2xfcGF5OiB1aW50NjQsIHN0YWtlX3BheTogdWludDY0LCBsb2JieV9zaXplOiBieXRlcykgLT4gdm9pZDoKbmV3X2dhbWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTYxLTE3MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgbmV3X2dhbWUoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBib3hfZ19wYXk6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLAogICAgLy8gICAgIGJveF9zX3BheTogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sCiAgICAvLyAgICAgYm94X2NfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICAgICBib3hfbF9wYXk6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLAogICAgLy8gICAgIHN0YWtlX3BheTogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sCiAgICAvLyAgICAgbG9iYnlfc2l6ZTogYXJjNC5VSW50OCwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDYgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE3MS0xNzIKICAgIC8vICMgRmFpbCB0cmFuc2FjdGlvbiB1bmxlc3MgdGhlIGFzc2VydGlvbiBiZWxvdyBldmFsdWF0ZXMgVHJ1ZQogICAgLy8gYXNzZXJ0IEdsb2JhbC5ncm91cF9zaXplID09IDYsIGVyci5JTlZBTElEX0dST1VQX1NJWkUKICAgIGdsb2JhbCBHcm91cFNpemUKICAgIHB1c2hpbnQgNiAvLyA2CiAgICA9PQogICAgYXNzZXJ0IC8vIEludmFsaWQgZ3JvdXAgc2l6ZS4gRW5zdXJlIG51bWJlciBvZiB0cmFuc2FjdGlvbnMgaW4gZ3JvdXAgaXMgd2l0aGluIHZhbGlkIGJvdW5kcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNzQKICAgIC8vIGFzc2VydCBib3hfZ19wYXkuYW1vdW50ID49IGNzdC5CT1hfR19DT1NULCBlcnIuSU5TVUZGSUNJRU5UX1BBWV9BTU9VTlQKICAgIGZyYW1lX2RpZyAtNgogICAgZ3R4bnMgQW1vdW50CiAgICBwdXNoaW50IDU0OTAwIC8vIDU0OTAwCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBwYXltZW50IGFtb3VudC4gVmFsdWUgaXMgbm90IGVub3VnaCB0byBjb3ZlciB0aGUgbWluaW11bSByZXF1aXJlbWVudHMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTc1CiAgICAvLyBhc3NlcnQgYm94X3NfcGF5LmFtb3VudCA+PSBjc3QuQk9YX1NfQ09TVCwgZXJyLklOU1VGRklDSUVOVF9QQVlfQU1PVU5UCiAgICBmcmFtZV9kaWcgLTUKICAgIGd0eG5zIEFtb3VudAogICAgcHVzaGludCAyNzcwMCAvLyAyNzcwMAogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgcGF5bWVudCBhbW91bnQuIFZhbHVlIGlzIG5vdCBlbm91Z2ggdG8gY292ZXIgdGhlIG1pbmltdW0gcmVxdWlyZW1lbnRzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE3Ni0xNzcKICAgIC8vICMgYXNzZXJ0IGJveF9jX3BheS5hbW91bnQgPj0gY3N0LkJPWF9DX0NPU1QsIGVyci5JTlNVRkZJQ0lFTlRfUEFZX0FNT1VOVAogICAgLy8gYXNzZXJ0IGJveF9sX3BheS5hbW91bnQgPj0gc2VsZi5jYWxjX3NpbmdsZV9ib3hfY29zdCgKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTc5CiAgICAvLyB2YWx1ZV9zaXplPWFyYzQuVUludDE2KGNzdC5BRERSRVNTX1NJWkUgKiBsb2JieV9zaXplLm5hdGl2ZSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDE2IC8vIDE2CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDYgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE3OAogICAgLy8ga2V5X3NpemU9YXJjNC5VSW50OCgxMCksCiAgICBwdXNoYnl0ZXMgMHgwYQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE3Ni0xODAKICAgIC8vICMgYXNzZXJ0IGJveF9jX3BheS5hbW91bnQgPj0gY3N0LkJPWF9DX0NPU1QsIGVyci5JTlNVRkZJQ0lFTlRfUEFZX0FNT1VOVAogICAgLy8gYXNzZXJ0IGJveF9sX3BheS5hbW91bnQgPj0gc2VsZi5jYWxjX3NpbmdsZV9ib3hfY29zdCgKICAgIC8vICAgICBrZXlfc2l6ZT1hcmM0LlVJbnQ4KDEwKSwKICAgIC8vICAgICB2YWx1ZV9zaXplPWFyYzQuVUludDE2KGNzdC5BRERSRVNTX1NJWkUgKiBsb2JieV9zaXplLm5hdGl2ZSksCiAgICAvLyApLCBlcnIuSU5TVUZGSUNJRU5UX1BBWV9BTU9VTlQKICAgIHN3YXAKICAgIGNhbGxzdWIgY2FsY19zaW5nbGVfYm94X2Nvc3QKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IHBheW1lbnQgYW1vdW50LiBWYWx1ZSBpcyBub3QgZW5vdWdoIHRvIGNvdmVyIHRoZSBtaW5pbXVtIHJlcXVpcmVtZW50cy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxODgKICAgIC8vIGFzc2VydCBib3hfZ19wYXkuc2VuZGVyID09IFR4bi5zZW5kZXIsIGVyci5JTlZBTElEX0JPWF9QQVlfU0VOREVSCiAgICBmcmFtZV9kaWcgLTYKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBCb3ggcGF5bWVudCBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIHRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE4OQogICAgLy8gYXNzZXJ0IGJveF9zX3BheS5zZW5kZXIgPT0gVHhuLnNlbmRlciwgZXJyLklOVkFMSURfQk9YX1BBWV9TRU5ERVIKICAgIGZyYW1lX2RpZyAtNQogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIEJveCBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggdHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTkwCiAgICAvLyBhc3NlcnQgYm94X2NfcGF5LnNlbmRlciA9PSBUeG4uc2VuZGVyLCBlcnIuSU5WQUxJRF9CT1hfUEFZX1NFTkRFUgogICAgZnJhbWVfZGlnIC00CiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gQm94IHBheW1lbnQgc2VuZGVyIGFkZHJlc3MgbXVzdCBtYXRjaCB0cmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxOTEKICAgIC8vIGFzc2VydCBib3hfbF9wYXkuc2VuZGVyID09IFR4bi5zZW5kZXIsIGVyci5JTlZBTElEX0JPWF9QQVlfU0VOREVSCiAgICBmcmFtZV9kaWcgLTMKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBCb3ggcGF5bWVudCBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIHRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE5MgogICAgLy8gYXNzZXJ0IHN0YWtlX3BheS5zZW5kZXIgPT0gVHhuLnNlbmRlciwgZXJyLklOVkFMSURfU1RBS0VfUEFZX1NFTkRFUgogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gU3Rha2UgcGF5bWVudCBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIHNlbmRlciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE5NQogICAgLy8gYm94X2dfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtNgogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE5NC0xOTYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYm94X2dfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksIGVyci5JTlZBTElEX0JPWF9QQVlfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBCb3ggcGF5bWVudCByZWNlaXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxOTgKICAgIC8vIGJveF9zX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTUKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxOTctMTk5CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGJveF9zX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuSU5WQUxJRF9CT1hfUEFZX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gQm94IHBheW1lbnQgcmVjZWl2ZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjAxCiAgICAvLyBib3hfY19wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC00CiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjAwLTIwMgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBib3hfY19wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLklOVkFMSURfQk9YX1BBWV9SRUNFSVZFUgogICAgYXNzZXJ0IC8vIEJveCBwYXltZW50IHJlY2VpdmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIwNAogICAgLy8gYm94X2xfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIwMy0yMDUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYm94X2xfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksIGVyci5JTlZBTElEX0JPWF9QQVlfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBCb3ggcGF5bWVudCByZWNlaXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMDcKICAgIC8vIHN0YWtlX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMDYtMjA4CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHN0YWtlX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuSU5WQUxJRF9CT1hfUEFZX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gQm94IHBheW1lbnQgcmVjZWl2ZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjExCiAgICAvLyBsb2JieV9zaXplID49IGNzdC5NSU5fTE9CQllfU0laRQogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoYnl0ZXMgMHgwMgogICAgYj49CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjExLTIxMwogICAgLy8gbG9iYnlfc2l6ZSA+PSBjc3QuTUlOX0xPQkJZX1NJWkUKICAgIC8vIGFuZCBsb2JieV9zaXplIDw9IGNzdC5NQVhfTE9CQllfU0laRQogICAgLy8gYW5kIGxvYmJ5X3NpemUubmF0aXZlICUgMiA9PSAwCiAgICBieiBuZXdfZ2FtZV9ib29sX2ZhbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMTIKICAgIC8vIGFuZCBsb2JieV9zaXplIDw9IGNzdC5NQVhfTE9CQllfU0laRQogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoYnl0ZXMgMHgwNAogICAgYjw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjExLTIxMwogICAgLy8gbG9iYnlfc2l6ZSA+PSBjc3QuTUlOX0xPQkJZX1NJWkUKICAgIC8vIGFuZCBsb2JieV9zaXplIDw9IGNzdC5NQVhfTE9CQllfU0laRQogICAgLy8gYW5kIGxvYmJ5X3NpemUubmF0aXZlICUgMiA9PSAwCiAgICBieiBuZXdfZ2FtZV9ib29sX2ZhbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMTMKICAgIC8vIGFuZCBsb2JieV9zaXplLm5hdGl2ZSAlIDIgPT0gMAogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMyAvLyAyCiAgICAlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjExLTIxMwogICAgLy8gbG9iYnlfc2l6ZSA+PSBjc3QuTUlOX0xPQkJZX1NJWkUKICAgIC8vIGFuZCBsb2JieV9zaXplIDw9IGNzdC5NQVhfTE9CQllfU0laRQogICAgLy8gYW5kIGxvYmJ5X3NpemUubmF0aXZlICUgMiA9PSAwCiAgICBibnogbmV3X2dhbWVfYm9vbF9mYWxzZUA0CiAgICBpbnRjXzAgLy8gMQoKbmV3X2dhbWVfYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIxMC0yMTQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbG9iYnlfc2l6ZSA+PSBjc3QuTUlOX0xPQkJZX1NJWkUKICAgIC8vICAgICBhbmQgbG9iYnlfc2l6ZSA8PSBjc3QuTUFYX0xPQkJZX1NJWkUKICAgIC8vICAgICBhbmQgbG9iYnlfc2l6ZS5uYXRpdmUgJSAyID09IDAKICAgIC8vICksIGVyci5JTlZBTElEX0xPQkJZX1NJWkUKICAgIGFzc2VydCAvLyBJbnZhbGlkIExvYmJ5IHNpemUuIFZhbHVlIG11c3QgYmUgYW4gZXZlbiBudW1iZXIgYW5kIHdpdGhpbiBwZXJtaXR0ZWQgYm91bmRzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIxNi0yMTcKICAgIC8vICMgQ3JlYXRlIGEgbmV3IGJveCBzdG9yYWdlIHVuaXQgZm9yIHRoZSBnYW1lIGdyaWQgdy8gdGhlIGN1cnJlbnQgZ2xvYmFsIGdhbWVfaWQgdmFsdWUgYXMga2V5CiAgICAvLyBzZWxmLmJveF9nYW1lX2dyaWRbc2VsZi5nYW1lX2lkXSA9IHRhLkdhbWVHcmlkLmZyb21fYnl0ZXMoY3N0LkdSSURfWkVST0VEX0JZVEVTKQogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDcgLy8gImdhbWVfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2FtZV9pZCBleGlzdHMKICAgIGR1cAogICAgaXRvYgogICAgYnl0ZWNfMyAvLyAiZ18iCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIyNgogICAgLy8gZXhwaXJ5X3RzPWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wICsgY3N0LlBIQVNFX0VYUElSWV9JTlRFUlZBTCksCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBwdXNoaW50IDEyMDAgLy8gMTIwMAogICAgKwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIyNwogICAgLy8gcHJpemVfcG90PWFyYzQuVUludDY0KHN0YWtlX3BheS5hbW91bnQpLAogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBBbW91bnQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMjgKICAgIC8vIGFkbWluX2FkZHJlc3M9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIyMQogICAgLy8gc3Rha2luZ19jbG9zZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICBieXRlY18xIC8vIDB4MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMTktMjI5CiAgICAvLyAjIENyZWF0ZSBhIG5ldyBib3ggc3RvcmFnZSB1bml0IGZvciB0aGUgZ2FtZSBzdGF0ZSB3LyB0aGUgY3VycmVudCBnbG9iYWwgZ2FtZV9pZCB2YWx1ZSBhcyBrZXkKICAgIC8vIHNlbGYuYm94X2dhbWVfc3RhdGVbc2VsZi5nYW1lX2lkXSA9IHN0Yy5HYW1lU3RhdGUoCiAgICAvLyAgICAgc3Rha2luZ19jbG9zZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgIyBxdWlja19wbGF5X2VuYWJsZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgcXVpY2tfcGxheV9lbmFibGVkLAogICAgLy8gICAgIGxvYmJ5X3NpemU9bG9iYnlfc2l6ZSwKICAgIC8vICAgICBhY3RpdmVfcGxheWVycz1hcmM0LlVJbnQ4KDEpLAogICAgLy8gICAgIGJveF9sX3N0YXJ0X3Bvcz1hcmM0LlVJbnQxNihjc3QuQUREUkVTU19TSVpFKSwKICAgIC8vICAgICBleHBpcnlfdHM9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBjc3QuUEhBU0VfRVhQSVJZX0lOVEVSVkFMKSwKICAgIC8vICAgICBwcml6ZV9wb3Q9YXJjNC5VSW50NjQoc3Rha2VfcGF5LmFtb3VudCksCiAgICAvLyAgICAgYWRtaW5fYWRkcmVzcz1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gYWN0aXZlX3BsYXllcnM9YXJjNC5VSW50OCgxKSwKICAgIHB1c2hieXRlcyAweDAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjE5LTIyOQogICAgLy8gIyBDcmVhdGUgYSBuZXcgYm94IHN0b3JhZ2UgdW5pdCBmb3IgdGhlIGdhbWUgc3RhdGUgdy8gdGhlIGN1cnJlbnQgZ2xvYmFsIGdhbWVfaWQgdmFsdWUgYXMga2V5CiAgICAvLyBzZWxmLmJveF9nYW1lX3N0YXRlW3NlbGYuZ2FtZV9pZF0gPSBzdGMuR2FtZVN0YXRlKAogICAgLy8gICAgIHN0YWtpbmdfY2xvc2VkPWFyYzQuQm9vbChGYWxzZSksICAjIG5vcWE6IEZCVDAwMwogICAgLy8gICAgICMgcXVpY2tfcGxheV9lbmFibGVkPWFyYzQuQm9vbChGYWxzZSksICAjIHF1aWNrX3BsYXlfZW5hYmxlZCwKICAgIC8vICAgICBsb2JieV9zaXplPWxvYmJ5X3NpemUsCiAgICAvLyAgICAgYWN0aXZlX3BsYXllcnM9YXJjNC5VSW50OCgxKSwKICAgIC8vICAgICBib3hfbF9zdGFydF9wb3M9YXJjNC5VSW50MTYoY3N0LkFERFJFU1NfU0laRSksCiAgICAvLyAgICAgZXhwaXJ5X3RzPWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wICsgY3N0LlBIQVNFX0VYUElSWV9JTlRFUlZBTCksCiAgICAvLyAgICAgcHJpemVfcG90PWFyYzQuVUludDY0KHN0YWtlX3BheS5hbW91bnQpLAogICAgLy8gICAgIGFkbWluX2FkZHJlc3M9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjI1CiAgICAvLyBib3hfbF9zdGFydF9wb3M9YXJjNC5VSW50MTYoY3N0LkFERFJFU1NfU0laRSksCiAgICBwdXNoYnl0ZXMgMHgwMDIwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjE5LTIyOQogICAgLy8gIyBDcmVhdGUgYSBuZXcgYm94IHN0b3JhZ2UgdW5pdCBmb3IgdGhlIGdhbWUgc3RhdGUgdy8gdGhlIGN1cnJlbnQgZ2xvYmFsIGdhbWVfaWQgdmFsdWUgYXMga2V5CiAgICAvLyBzZWxmLmJveF9nYW1lX3N0YXRlW3NlbGYuZ2FtZV9pZF0gPSBzdGMuR2FtZVN0YXRlKAogICAgLy8gICAgIHN0YWtpbmdfY2xvc2VkPWFyYzQuQm9vbChGYWxzZSksICAjIG5vcWE6IEZCVDAwMwogICAgLy8gICAgICMgcXVpY2tfcGxheV9lbmFibGVkPWFyYzQuQm9vbChGYWxzZSksICAjIHF1aWNrX3BsYXlfZW5hYmxlZCwKICAgIC8vICAgICBsb2JieV9zaXplPWxvYmJ5X3NpemUsCiAgICAvLyAgICAgYWN0aXZlX3BsYXllcnM9YXJjNC5VSW50OCgxKSwKICAgIC8vICAgICBib3hfbF9zdGFydF9wb3M9YXJjNC5VSW50MTYoY3N0LkFERFJFU1NfU0laRSksCiAgICAvLyAgICAgZXhwaXJ5X3RzPWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wICsgY3N0LlBIQVNFX0VYUElSWV9JTlRFUlZBTCksCiAgICAvLyAgICAgcHJpemVfcG90PWFyYzQuVUludDY0KHN0YWtlX3BheS5hbW91bnQpLAogICAgLy8gICAgIGFkbWluX2FkZHJlc3M9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gKQogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIxOS0yMjAKICAgIC8vICMgQ3JlYXRlIGEgbmV3IGJveCBzdG9yYWdlIHVuaXQgZm9yIHRoZSBnYW1lIHN0YXRlIHcvIHRoZSBjdXJyZW50IGdsb2JhbCBnYW1lX2lkIHZhbHVlIGFzIGtleQogICAgLy8gc2VsZi5ib3hfZ2FtZV9zdGF0ZVtzZWxmLmdhbWVfaWRdID0gc3RjLkdhbWVTdGF0ZSgKICAgIGJ5dGVjIDUgLy8gInNfIgogICAgZGlnIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIxOS0yMjkKICAgIC8vICMgQ3JlYXRlIGEgbmV3IGJveCBzdG9yYWdlIHVuaXQgZm9yIHRoZSBnYW1lIHN0YXRlIHcvIHRoZSBjdXJyZW50IGdsb2JhbCBnYW1lX2lkIHZhbHVlIGFzIGtleQogICAgLy8gc2VsZi5ib3hfZ2FtZV9zdGF0ZVtzZWxmLmdhbWVfaWRdID0gc3RjLkdhbWVTdGF0ZSgKICAgIC8vICAgICBzdGFraW5nX2Nsb3NlZD1hcmM0LkJvb2woRmFsc2UpLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICAjIHF1aWNrX3BsYXlfZW5hYmxlZD1hcmM0LkJvb2woRmFsc2UpLCAgIyBxdWlja19wbGF5X2VuYWJsZWQsCiAgICAvLyAgICAgbG9iYnlfc2l6ZT1sb2JieV9zaXplLAogICAgLy8gICAgIGFjdGl2ZV9wbGF5ZXJzPWFyYzQuVUludDgoMSksCiAgICAvLyAgICAgYm94X2xfc3RhcnRfcG9zPWFyYzQuVUludDE2KGNzdC5BRERSRVNTX1NJWkUpLAogICAgLy8gICAgIGV4cGlyeV90cz1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCArIGNzdC5QSEFTRV9FWFBJUllfSU5URVJWQUwpLAogICAgLy8gICAgIHByaXplX3BvdD1hcmM0LlVJbnQ2NChzdGFrZV9wYXkuYW1vdW50KSwKICAgIC8vICAgICBhZG1pbl9hZGRyZXNzPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICkKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMzMtMjM2CiAgICAvLyAjIENyZWF0ZSBhIG5ldyBib3ggc3RvcmFnZSB1bml0IGZvciB0aGUgZ2FtZSBsb2JieSB3LyB0aGUgY3VycmVudCBnbG9iYWwgZ2FtZV9pZCB2YWx1ZSBhcyBrZXkKICAgIC8vIHNlbGYuYm94X2dhbWVfbG9iYnlbc2VsZi5nYW1lX2lkXSA9IG9wLmJ6ZXJvKAogICAgLy8gICAgIGNzdC5BRERSRVNTX1NJWkUgKiBsb2JieV9zaXplLm5hdGl2ZQogICAgLy8gKSAgIyBBc3NpZ24gemVyb2VkIGJ5dGVzIHRvIHN0b3JlIGFsbCBwbGF5ZXIgYWRkcmVzc2VzIGluIGxvYmJ5ICgzMiBieXRlcyBwZXIgcGxheWVyKQogICAgZnJhbWVfZGlnIDEKICAgIGJ6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjMzLTIzNAogICAgLy8gIyBDcmVhdGUgYSBuZXcgYm94IHN0b3JhZ2UgdW5pdCBmb3IgdGhlIGdhbWUgbG9iYnkgdy8gdGhlIGN1cnJlbnQgZ2xvYmFsIGdhbWVfaWQgdmFsdWUgYXMga2V5CiAgICAvLyBzZWxmLmJveF9nYW1lX2xvYmJ5W3NlbGYuZ2FtZV9pZF0gPSBvcC5iemVybygKICAgIGJ5dGVjIDYgLy8gImxfIgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMzMtMjM2CiAgICAvLyAjIENyZWF0ZSBhIG5ldyBib3ggc3RvcmFnZSB1bml0IGZvciB0aGUgZ2FtZSBsb2JieSB3LyB0aGUgY3VycmVudCBnbG9iYWwgZ2FtZV9pZCB2YWx1ZSBhcyBrZXkKICAgIC8vIHNlbGYuYm94X2dhbWVfbG9iYnlbc2VsZi5nYW1lX2lkXSA9IG9wLmJ6ZXJvKAogICAgLy8gICAgIGNzdC5BRERSRVNTX1NJWkUgKiBsb2JieV9zaXplLm5hdGl2ZQogICAgLy8gKSAgIyBBc3NpZ24gemVyb2VkIGJ5dGVzIHRvIHN0b3JlIGFsbCBwbGF5ZXIgYWRkcmVzc2VzIGluIGxvYmJ5ICgzMiBieXRlcyBwZXIgcGxheWVyKQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjM4LTIzOQogICAgLy8gIyBDcmVhdGUgYSBuZXcgYm94IHN0b3JhZ2UgdW5pdCBmb3IgdGhlIGdhbWUgY2hhcmFjdGVyIHcvIHRoZSBzZW5kZXIgYWRkcmVzcyB2YWx1ZSBhcyBrZXkKICAgIC8vIHNlbGYuYm94X2dhbWVfY2hhcmFjdGVyW1R4bi5zZW5kZXJdID0gc3RjLkdhbWVDaGFyYWN0ZXIoCiAgICBieXRlY18yIC8vICJjXyIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIzOC0yNDYKICAgIC8vICMgQ3JlYXRlIGEgbmV3IGJveCBzdG9yYWdlIHVuaXQgZm9yIHRoZSBnYW1lIGNoYXJhY3RlciB3LyB0aGUgc2VuZGVyIGFkZHJlc3MgdmFsdWUgYXMga2V5CiAgICAvLyBzZWxmLmJveF9nYW1lX2NoYXJhY3RlcltUeG4uc2VuZGVyXSA9IHN0Yy5HYW1lQ2hhcmFjdGVyKAogICAgLy8gICAgIGFyYzQuQm9vbChGYWxzZSksICAjIG5vcWE6IEZCVDAwMwogICAgLy8gICAgIGFyYzQuVUludDgoNiksCiAgICAvLyAgICAgYXJjNC5VSW50OCg1KSwKICAgIC8vICAgICBhcmM0LlVJbnQ4KDApLAogICAgLy8gICAgIGFyYzQuVUludDgoMSksCiAgICAvLyAgICAgYXJjNC5VSW50MjU2KDApLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MDAwNjA1MDAwMTAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyNTIKICAgIC8vIGdhbWVfbG9iYnlfYnJlZi5yZXBsYWNlKDAsIFR4bi5zZW5kZXIuYnl0ZXMpCiAgICBpbnRjXzEgLy8gMAogICAgdHhuIFNlbmRlcgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyNTQtMjU1CiAgICAvLyAjIEluY3JlbWVudCBnYW1lIGlkIGJ5IDEgZm9yIG5leHQgbmV3IGdhbWUgaW5zdGFuY2UKICAgIC8vIHNlbGYuZ2FtZV9pZCArPSAxCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgYnl0ZWMgNyAvLyAiZ2FtZV9pZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCm5ld19nYW1lX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMSAvLyAwCiAgICBiIG5ld19nYW1lX2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by5jb21taXRfdHVybihnYW1lX2lkOiB1aW50NjQsIHR1cm5faGFzaDogYnl0ZXMpIC0+IHZvaWQ6CmNvbW1pdF90dXJuOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjI1Ny0yNjIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGNvbW1pdF90dXJuKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgZ2FtZV9pZDogVUludDY0LAogICAgLy8gICAgIHR1cm5faGFzaDogYXJjNC5VSW50MjU2LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyNjMtMjY1CiAgICAvLyAjIEZhaWwgdHJhbnNhY3Rpb24gdW5sZXNzIHRoZSBhc3NlcnRpb24gYmVsb3cgZXZhbHVhdGVzIFRydWUKICAgIC8vICMgYXNzZXJ0IEdsb2JhbC5ncm91cF9zaXplID09IDIsIGVyci5JTlZBTElEX0dST1VQX1NJWkUKICAgIC8vIGFzc2VydCBnYW1lX2lkIGluIHNlbGYuYm94X2dhbWVfc3RhdGUsIGVyci5HQU1FX0lEX05PVF9GT1VORAogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBkdXAKICAgIGJ5dGVjIDUgLy8gInNfIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIEdhbWUgSUQgbm90IGZvdW5kLiBFbnN1cmUgdGhlIGdhbWUgd2FzIGNyZWF0ZWQgYW5kIHN0aWxsIGV4aXN0cy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyNjkKICAgIC8vIGFjY291bnQ9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyNzEKICAgIC8vIHBsYXllcl9jb3VudD1zZWxmLmJveF9nYW1lX3N0YXRlW2dhbWVfaWRdLmFjdGl2ZV9wbGF5ZXJzLm5hdGl2ZSwKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveF9nYW1lX3N0YXRlIGVudHJ5IGV4aXN0cwogICAgaW50Y18zIC8vIDIKICAgIGdldGJ5dGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyNTEtMjUyCiAgICAvLyAjIENhbGN1bGF0ZSB0b3RhbCBieXRlIGxlbmd0aCB0byBpdGVyYXRlIG92ZXIgYmFzZWQgb24gcGxheWVyIGNvdW50IGFuZCBhZGRyZXNzIHNpemUKICAgIC8vIGdhbWVfbG9iYnlfbGVuZ3RoID0gcGxheWVyX2NvdW50ICogY3N0LkFERFJFU1NfU0laRQogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjU0LTI1NQogICAgLy8gIyBJbml0aWFsaXplIGZsYWcgdG8gdHJhY2sgaWYgYWNjb3VudCBpcyBmb3VuZCBpbiBnYW1lCiAgICAvLyBhY2NfaW5fZ2FtZSA9IEZhbHNlCiAgICBpbnRjXzEgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI1Ny0yNTgKICAgIC8vICMgSXRlcmF0ZSB0aHJvdWdoIHRoZSBsb2JieSBieXRlIGFycmF5IGxlbmd0aCBpbiAzMi1ieXRlIGNodW5rcyAob25lIGFkZHJlc3MgcGVyIGNodW5rKQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKDAsIGdhbWVfbG9iYnlfbGVuZ3RoLCBjc3QuQUREUkVTU19TSVpFKToKICAgIGR1cAoKY29tbWl0X3R1cm5fZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI1Ny0yNTgKICAgIC8vICMgSXRlcmF0ZSB0aHJvdWdoIHRoZSBsb2JieSBieXRlIGFycmF5IGxlbmd0aCBpbiAzMi1ieXRlIGNodW5rcyAob25lIGFkZHJlc3MgcGVyIGNodW5rKQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKDAsIGdhbWVfbG9iYnlfbGVuZ3RoLCBjc3QuQUREUkVTU19TSVpFKToKICAgIGZyYW1lX2RpZyA1CiAgICBmcmFtZV9kaWcgMwogICAgPAogICAgZnJhbWVfZGlnIDQKICAgIGZyYW1lX2J1cnkgMAogICAgYnogY29tbWl0X3R1cm5fYWZ0ZXJfZm9yQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyNzAKICAgIC8vIGJveF9nYW1lX2xvYmJ5PXNlbGYuYm94X2dhbWVfbG9iYnksCiAgICBieXRlYyA2IC8vICJsXyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyNTktMjYwCiAgICAvLyAjIEV4dHJhY3QgdGhlIDMyLWJ5dGUgcGxheWVyIGFkZHJlc3MgYXQgc3RhcnQgaW5kZXggaQogICAgLy8gcGxheWVyX2FkZHJfYnl0ZXMgPSBvcC5leHRyYWN0KGJveF9nYW1lX2xvYmJ5W2dhbWVfaWRdLCBpLCBjc3QuQUREUkVTU19TSVpFKQogICAgZnJhbWVfZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIEJveE1hcCBlbnRyeSBleGlzdHMKICAgIGZyYW1lX2RpZyA1CiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjYyLTI2MwogICAgLy8gIyBDaGVjayBpZiB0aGUgZXh0cmFjdGVkIHBsYXllciBhZGRyZXNzIGJ5dGVzIG1hdGNoIHVwIHdpdGggdGhlIGFjY291bnQgYnl0ZXMKICAgIC8vIGlmIGFjY291bnQuYnl0ZXMgPT0gcGxheWVyX2FkZHJfYnl0ZXM6CiAgICBmcmFtZV9kaWcgMgogICAgPT0KICAgIGJ6IGNvbW1pdF90dXJuX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI2NAogICAgLy8gYWNjX2luX2dhbWUgPSBUcnVlCiAgICBpbnRjXzAgLy8gMQogICAgZnJhbWVfYnVyeSAwCgpjb21taXRfdHVybl9hZnRlcl9mb3JAODoKICAgIGZyYW1lX2RpZyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjY3LTI3MwogICAgLy8gYXNzZXJ0IHNydC5jaGVja19hY2NfaW5fZ2FtZSgKICAgIC8vICAgICBnYW1lX2lkPWdhbWVfaWQsCiAgICAvLyAgICAgYWNjb3VudD1UeG4uc2VuZGVyLAogICAgLy8gICAgIGJveF9nYW1lX2xvYmJ5PXNlbGYuYm94X2dhbWVfbG9iYnksCiAgICAvLyAgICAgcGxheWVyX2NvdW50PXNlbGYuYm94X2dhbWVfc3RhdGVbZ2FtZV9pZF0uYWN0aXZlX3BsYXllcnMubmF0aXZlLAogICAgLy8gICAgIGNsZWFyX3BsYXllcj1GYWxzZSwKICAgIC8vICksIGVyci5QTEFZRVJfTk9UX0ZPVU5ECiAgICBhc3NlcnQgLy8gUGxheWVyIG5vdCBmb3VuZC4gRW5zdXJlIHBsYXllciBhZGRyZXNzIGlzIGluc2lkZSB0aGUgZ2FtZSBsb2JieS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyNzYKICAgIC8vIHNlbGYuYm94X2dhbWVfY2hhcmFjdGVyW1R4bi5zZW5kZXJdLmhhc19jb21taXR0ZWRfdHVybi5uYXRpdmUgICMgbm9xYTogRTcxMgogICAgYnl0ZWNfMiAvLyAiY18iCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveF9nYW1lX2NoYXJhY3RlciBlbnRyeSBleGlzdHMKICAgIGludGNfMSAvLyAwCiAgICBnZXRiaXQKICAgIGJ5dGVjXzEgLy8gMHgwMAogICAgaW50Y18xIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBpbnRjXzEgLy8gMAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Mjc2LTI3NwogICAgLy8gc2VsZi5ib3hfZ2FtZV9jaGFyYWN0ZXJbVHhuLnNlbmRlcl0uaGFzX2NvbW1pdHRlZF90dXJuLm5hdGl2ZSAgIyBub3FhOiBFNzEyCiAgICAvLyA9PSBGYWxzZQogICAgIQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjI3NS0yNzgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VsZi5ib3hfZ2FtZV9jaGFyYWN0ZXJbVHhuLnNlbmRlcl0uaGFzX2NvbW1pdHRlZF90dXJuLm5hdGl2ZSAgIyBub3FhOiBFNzEyCiAgICAvLyAgICAgPT0gRmFsc2UKICAgIC8vICkKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjI4MAogICAgLy8gc2VsZi5ib3hfZ2FtZV9jaGFyYWN0ZXJbVHhuLnNlbmRlcl0udHVybl9oYXNoID0gdHVybl9oYXNoCiAgICBieXRlY18yIC8vICJjXyIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3hfZ2FtZV9jaGFyYWN0ZXIgZW50cnkgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIHJlcGxhY2UyIDUKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyODEKICAgIC8vIHNlbGYuYm94X2dhbWVfY2hhcmFjdGVyW1R4bi5zZW5kZXJdLmhhc19jb21taXR0ZWRfdHVybiA9IGFyYzQuQm9vbCgKICAgIGJ5dGVjXzIgLy8gImNfIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveF9nYW1lX2NoYXJhY3RlciBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyODEtMjgzCiAgICAvLyBzZWxmLmJveF9nYW1lX2NoYXJhY3RlcltUeG4uc2VuZGVyXS5oYXNfY29tbWl0dGVkX3R1cm4gPSBhcmM0LkJvb2woCiAgICAvLyAgICAgVHJ1ZSAgIyBub3FhOiBGQlQwMDMKICAgIC8vICkKICAgIGludGNfMSAvLyAwCiAgICBpbnRjXzAgLy8gMQogICAgc2V0Yml0CiAgICBib3hfcHV0CiAgICByZXRzdWIKCmNvbW1pdF90dXJuX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyNTctMjU4CiAgICAvLyAjIEl0ZXJhdGUgdGhyb3VnaCB0aGUgbG9iYnkgYnl0ZSBhcnJheSBsZW5ndGggaW4gMzItYnl0ZSBjaHVua3MgKG9uZSBhZGRyZXNzIHBlciBjaHVuaykKICAgIC8vIGZvciBpIGluIHVyYW5nZSgwLCBnYW1lX2xvYmJ5X2xlbmd0aCwgY3N0LkFERFJFU1NfU0laRSk6CiAgICBmcmFtZV9kaWcgNQogICAgaW50Y18yIC8vIDMyCiAgICArCiAgICBmcmFtZV9idXJ5IDUKICAgIGIgY29tbWl0X3R1cm5fZm9yX2hlYWRlckAyCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLm1pbWNfdGVzdGVyKCkgLT4gYnl0ZXM6Cm1pbWNfdGVzdGVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjM0NS0zNDYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIG1pbWNfdGVzdGVyKHNlbGYpIC0+IEJ5dGVzOgogICAgcHJvdG8gMCAxCiAgICBpbnRjXzEgLy8gMAogICAgcHVzaGJ5dGVzICIiCgptaW1jX3Rlc3Rlcl93aGlsZV90b3BAODoKICAgIHB1c2hpbnQgNjg2MTAgLy8gNjg2MTAKICAgIGdsb2JhbCBPcGNvZGVCdWRnZXQKICAgID4KICAgIGJ6IG1pbWNfdGVzdGVyX2FmdGVyX3doaWxlQDEzCiAgICBpdHhuX2JlZ2luCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICBpdHhuX2ZpZWxkIE9uQ29tcGxldGlvbgogICAgYnl0ZWMgOCAvLyAweDA2ODEwMQogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW0KICAgIGJ5dGVjIDggLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW0KICAgIGludGNfMSAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGIgbWltY190ZXN0ZXJfd2hpbGVfdG9wQDgKCm1pbWNfdGVzdGVyX2FmdGVyX3doaWxlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjM3NC0zNzUKICAgIC8vICMgSW5pdGlhbGl6ZSBhIHByZWltYWdlIGJ5dGUgYXJyYXkgdGhhdCB3aWxsIHN0b3JlIHNjYWxhciBpbnB1dCBpbnRzIGZvciBNaU1DIGhhc2hpbmcKICAgIC8vIHByZWltYWdlID0gQnl0ZXMoKQogICAgcHVzaGJ5dGVzIDB4CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozODctMzkxCiAgICAvLyAjICMgQWRkIHJlc3Qgb2YgdGhlIHNjYWxhciBpbnB1dHMKICAgIC8vICMgcHJlaW1hZ2UgKz0gc3J0LnU4X3RvX2ZyMzIoYWN0aW9uKQogICAgLy8gIyBwcmVpbWFnZSArPSBzcnQudThfdG9fZnIzMihkaXJlY3Rpb24pCiAgICAvLyAjIHByZWltYWdlICs9IHNydC51NjRfdG9fZnIzMihzYWx0KQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKDEyMSk6ICAjIHVyYW5nZSgxMjEpIGdlbmVyYXRlcyBVSW50NjQgdmFsdWVzIGZyb20gMCB0byAxMjAKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDEKCm1pbWNfdGVzdGVyX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozODctMzkxCiAgICAvLyAjICMgQWRkIHJlc3Qgb2YgdGhlIHNjYWxhciBpbnB1dHMKICAgIC8vICMgcHJlaW1hZ2UgKz0gc3J0LnU4X3RvX2ZyMzIoYWN0aW9uKQogICAgLy8gIyBwcmVpbWFnZSArPSBzcnQudThfdG9fZnIzMihkaXJlY3Rpb24pCiAgICAvLyAjIHByZWltYWdlICs9IHNydC51NjRfdG9fZnIzMihzYWx0KQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKDEyMSk6ICAjIHVyYW5nZSgxMjEpIGdlbmVyYXRlcyBVSW50NjQgdmFsdWVzIGZyb20gMCB0byAxMjAKICAgIGZyYW1lX2RpZyAxCiAgICBwdXNoaW50IDEyMSAvLyAxMjEKICAgIDwKICAgIGJ6IG1pbWNfdGVzdGVyX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzkyCiAgICAvLyBwcmVpbWFnZSArPSBzcnQudThfdG9fZnIzMihhcmM0LlVJbnQ4KDEpKQogICAgZnJhbWVfZGlnIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxNjItMTYzCiAgICAvLyAjIFJldHVybiBiaWctZW5kaWFuIGJ5dGUgYXJyYXkgKEFWTSB0eXBlOiBCeXRlcyksIFVJbnQ4IGxlZnQtcGFkZGVkIHcvIHplcm9zIHRvIG1hdGNoIDMyLWJ5dGUgc2NhbGFyIGZvcm1hdAogICAgLy8gcmV0dXJuIG9wLmJ6ZXJvKDMxKSArIHUuYnl0ZXMKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozOTIKICAgIC8vIHByZWltYWdlICs9IHNydC51OF90b19mcjMyKGFyYzQuVUludDgoMSkpCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjM4Ny0zOTEKICAgIC8vICMgIyBBZGQgcmVzdCBvZiB0aGUgc2NhbGFyIGlucHV0cwogICAgLy8gIyBwcmVpbWFnZSArPSBzcnQudThfdG9fZnIzMihhY3Rpb24pCiAgICAvLyAjIHByZWltYWdlICs9IHNydC51OF90b19mcjMyKGRpcmVjdGlvbikKICAgIC8vICMgcHJlaW1hZ2UgKz0gc3J0LnU2NF90b19mcjMyKHNhbHQpCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoMTIxKTogICMgdXJhbmdlKDEyMSkgZ2VuZXJhdGVzIFVJbnQ2NCB2YWx1ZXMgZnJvbSAwIHRvIDEyMAogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgbWltY190ZXN0ZXJfZm9yX2hlYWRlckAxCgptaW1jX3Rlc3Rlcl9hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0MDkKICAgIC8vIG91dHB1dCA9IG9wLm1pbWMob3AuTWlNQ0NvbmZpZ3VyYXRpb25zLkJMUzEyXzM4MU1wMTExLCBwcmVpbWFnZSkKICAgIGZyYW1lX2RpZyAwCiAgICBtaW1jIEJMUzEyXzM4MU1wMTExCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDE1CiAgICAvLyByZXR1cm4gb3V0cHV0CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by51cGRhdGUoKSAtPiB2b2lkOgp1cGRhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDE5CiAgICAvLyBhc3NlcnQgVGVtcGxhdGVWYXJbYm9vbF0oIlVQREFUQUJMRSIpLCBlcnIuVVBEQVRBQkxFX05PVF9UUlVFCiAgICBpbnRjIDUgLy8gVE1QTF9VUERBVEFCTEUKICAgIGFzc2VydCAvLyBUZW1wbGF0ZSB2YXJpYWJsZSAnVVBEQVRBQkxFJyBuZWVkcyB0byBiZSAnVHJ1ZScgYXQgZGVwbG95LXRpbWUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDIwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCBlcnIuU0VOREVSX05PVF9DUkVBVE9SCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBhcHAgY3JlYXRvciBjYW4gYWN0IGFzIHRoZSBzZW5kZXIgYWRkcmVzcy4KICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [783], "errorMessage": "Box found. Ensure the box does not exist."}, {"pc": [799, 945, 953, 961, 969, 977], "errorMessage": "Box payment receiver address must match application address."}, {"pc": [791, 905, 913, 921, 929], "errorMessage": "Box payment sender address must match transaction sender address."}, {"pc": [505, 650, 1273], "errorMessage": "Game ID not found. Ensure the game was created and still exists."}, {"pc": [519], "errorMessage": "Index access is out of bounds"}, {"pc": [853, 863, 897], "errorMessage": "Insufficient payment amount. Value is not enough to cover the minimum requirements."}, {"pc": [1004], "errorMessage": "Invalid Lobby size. Value must be an even number and within permitted bounds."}, {"pc": [773, 843], "errorMessage": "Invalid group size. Ensure number of transactions in group is within valid bounds."}, {"pc": [513], "errorMessage": "Invalid position index. Ensure index value is within valid range."}, {"pc": [136, 160, 179, 247, 269, 282, 302, 329, 354, 379, 406, 432, 455, 471], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [124], "errorMessage": "OnCompletion is not UpdateApplication"}, {"pc": [1488], "errorMessage": "Only app creator can act as the sender address."}, {"pc": [1319], "errorMessage": "Player not found. Ensure player address is inside the game lobby."}, {"pc": [937], "errorMessage": "Stake payment sender address must match sender address."}, {"pc": [1482], "errorMessage": "Template variable 'UPDATABLE' needs to be 'True' at deploy-time."}, {"pc": [273], "errorMessage": "can only call when creating"}, {"pc": [127, 139, 163, 182, 250, 285, 305, 332, 357, 382, 409, 435, 458, 474], "errorMessage": "can only call when not creating"}, {"pc": [516, 1303], "errorMessage": "check BoxMap entry exists"}, {"pc": [1325, 1343, 1355], "errorMessage": "check self.box_game_character entry exists"}, {"pc": [656], "errorMessage": "check self.box_game_lobby entry exists"}, {"pc": [1278], "errorMessage": "check self.box_game_state entry exists"}, {"pc": [1009], "errorMessage": "check self.game_id exists"}, {"pc": [571, 885], "errorMessage": "overflow"}, {"pc": [193, 204, 215, 225, 235, 260], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"GEN_UNIX": {"type": "AVMUint64"}, "UPDATABLE": {"type": "AVMUint64"}}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint8", "name": "key_size"}, {"type": "uint16", "name": "value_size"}], "name": "calc_single_box_cost", "returns": {"type": "uint64"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "read_gen_unix", "returns": {"type": "uint64"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}, {"type": "uint8", "name": "i"}], "name": "read_grid_cell_value_by_index", "returns": {"type": "uint8"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}, {"type": "uint8", "name": "x"}, {"type": "uint8", "name": "y"}], "name": "read_grid_cell_value_at_coords", "returns": {"type": "uint8"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "account"}], "name": "does_box_user_registry_exist", "returns": {"type": "bool"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}], "name": "does_box_game_grid_exist", "returns": {"type": "bool"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}], "name": "does_box_game_state_exist", "returns": {"type": "bool"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}], "name": "does_box_game_characters_exist", "returns": {"type": "bool"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}], "name": "read_box_game_characters", "returns": {"type": "(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)[4]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}], "name": "does_box_game_record_exist", "returns": {"type": "bool"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}], "name": "read_game_record_state", "returns": {"type": "(bool,uint8,uint8,uint16,uint64,uint64,address,uint256,uint8,uint8,bool,uint64)", "struct": "GameState"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}, {"type": "uint8", "name": "lobby_slot"}], "name": "read_game_record_character", "returns": {"type": "(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)", "struct": "GameCharacter"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}], "name": "read_box_game_lobby", "returns": {"type": "address[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint8", "name": "lobby_size"}, {"type": "uint8", "name": "stake_tier"}, {"type": "uint64", "name": "start"}, {"type": "uint64", "name": "count"}], "name": "read_open_lobbies", "returns": {"type": "uint64[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "generate", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "box_r_pay"}], "name": "get_box_user_registry", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "box_g_pay"}, {"type": "pay", "name": "box_s_pay"}, {"type": "pay", "name": "box_c_pay"}, {"type": "pay", "name": "box_l_pay"}, {"type": "pay", "name": "stake_pay"}, {"type": "uint8", "name": "lobby_size"}, {"type": "uint8", "name": "commit_scheme"}], "name": "new_game", "returns": {"type": "bool"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "box_m_pay"}, {"type": "pay", "name": "stake_pay"}, {"type": "uint8", "name": "lobby_size"}, {"type": "uint8", "name": "commit_scheme"}], "name": "new_game_record", "returns": {"type": "bool"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "box_o_pay"}, {"type": "uint8", "name": "lobby_size"}, {"type": "uint8", "name": "stake_tier"}], "name": "create_open_lobby_index", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}], "name": "close_staking", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}, {"type": "uint8", "name": "lobby_slot"}, {"type": "uint256", "name": "turn_hash"}], "name": "commit_turn", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}, {"type": "(uint8,uint256,byte[64])[]", "name": "commits"}], "name": "commit_turns", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}, {"type": "uint8", "name": "lobby_slot"}, {"type": "uint256", "name": "turn_hash"}], "name": "commit_turn_record", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}, {"type": "uint8", "name": "lobby_slot"}, {"type": "(uint8,uint8)[]", "name": "movement"}, {"type": "uint8", "name": "action"}, {"type": "uint8", "name": "direction"}, {"type": "uint64", "name": "salt"}], "name": "reveal_turn", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "game_id"}, {"type": "uint256[7][]", "name": "proofs"}], "name": "resolve_round", "returns": {"type": "uint8[4]"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "chunk"}, {"type": "bool", "name": "is_first"}], "name": "mimc_absorb", "returns": {"type": "byte[]"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "mimc_tester", "returns": {"type": "byte[]"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "Salvo", "state": {"keys": {"box": {}, "global": {"game_id": {"key": "Z2FtZV9pZA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"box_user_registry": {"keyType": "address", "valueType": "UserRegistry", "prefix": "cl8="}, "box_game_grid": {"keyType": "uint64", "valueType": "byte[31]", "prefix": "Z18="}, "box_game_state": {"keyType": "uint64", "valueType": "GameState", "prefix": "c18="}, "box_game_lobby": {"keyType": "uint64", "valueType": "AVMBytes", "prefix": "bF8="}, "box_game_characters": {"keyType": "uint64", "valueType": "(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)[4]", "prefix": "Y18="}, "box_game_record": {"keyType": "uint64", "valueType": "AVMBytes", "prefix": "bV8="}, "box_open_lobbies": {"keyType": "uint64", "valueType": "AVMBytes", "prefix": "b18="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"GameCharacter": [{"name": "has_committed_turn", "type": "bool"}, {"name": "has_revealed_turn", "type": "bool"}, {"name": "id", "type": "uint8"}, {"name": "lobby_slot", "type": "uint8"}, {"name": "action", "type": "uint8"}, {"name": "position", "type": "uint8"}, {"name": "target", "type": "uint8"}, {"name": "move_points", "type": "uint8"}, {"name": "direction", "type": "uint8"}, {"name": "turn_hash", "type": "uint256"}], "GameState": [{"name": "staking_closed", "type": "bool"}, {"name": "lobby_size", "type": "uint8"}, {"name": "active_players", "type": "uint8"}, {"name": "box_l_start_pos", "type": "uint16"}, {"name": "expiry_ts", "type": "uint64"}, {"name": "prize_pot", "type": "uint64"}, {"name": "admin_address", "type": "address"}, {"name": "grid_root", "type": "uint256"}, {"name": "commit_scheme", "type": "uint8"}, {"name": "stake_tier", "type": "uint8"}, {"name": "open_lobby_listed", "type": "bool"}, {"name": "round_count", "type": "uint64"}], "UserRegistry": [{"name": "hosting_game", "type": "bool"}, {"name": "game_id", "type": "uint64"}, {"name": "commit_rand_round", "type": "uint64"}, {"name": "expiry_round", "type": "uint64"}]}, "byteCode": {"approval": "CyAKAAEEAv8B4AGwCe/ssYu2CgAAJhcBAAQVH3x1B2dhbWVfaWQAAnNfAmNfAmdfAm1fAmxfIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAm9fAQIBBAJyXwEBBElc/18DBoEBAgAAAgAgICiGzs07KK+TIvuhBPeHDtHzC1Ee7H3xSqoaRwevRbVLCAAAAAAAAAAAKAAGAAAFBQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADkA/8L/wH/DAAC/w0BA/8OAgT/DwMF/xAEBv8RBQf/EgYI/xMHCf8UCAr/FQn/ABb/DAEXCw0CGAwOAxkNDwQaDhAFGw8RBhwQEgcdERMIHhIUCR8TFQogFP8LIf8XDCIWGA0jFxkOJBgaDyUZGxAmGhwRJxsdEigcHhMpHR8UKh4gFSsf/xYs/yIXLSEjGC4iJBkvIyUaMCQmGzElJxwyJigdMycpHjQoKh81KSsgNir/ITf/LSI4LC4jOS0vJDouMCU7LzEmPDAyJz0xMyg+MjQpPzM1KkA0NitBNf8sQv84LUM3OS5EODovRTk7MEY6PDFHOz0ySDw+M0k9PzRKPkA1Sz9BNkxA/zdN/0M4TkJEOU9DRTpQREY7UUVHPFJGSD1TR0k+VEhKP1VJS0BWSkxBV0v/Qlj/TkNZTU9EWk5QRVtPUUZcUFJHXVFTSF5SVElfU1VKYFRWS2FVV0xiVv9NY/9ZTmRYWk9lWVtQZlpcUWdbXVJoXF5TaV1fVGpeYFVrX2FWbGBiV21h/1hu/2RZb2NlWnBkZltxZWdccmZoXXNnaV50aGpfdWlrYHZqbGF3a21ieGz/Y///b2T/bnBl/29xZv9wcmf/cXNo/3J0af9zdWr/dHZr/3V3bP92eG3/d/8xG0EAyoIZBGMzzZ0Etm0vVgSJlrs3BFOB1qgEeBX+QQQLQtEqBLv6jgEEE85XJASoysiRBAdti5wET51PEwT155tMBAbw0TIEDZ4apwRb4hnwBD/7yiQEGeCaLgQPsXo/BPJHDZgEmRLj+wQqsWyPBKpXI04EseS9yAQV2KgMBH132j8nD4ICBPcXIUgEoOgYcjYaAI4cAr0CrQKWAnwCYQJIAi8CFgICAekB1QG+AaoBjAF/AWkBGgDrAM8AvwCpAJYAgABhAEoAJwAPAAIiQzEZJBJEMRhEiBO2I0MxGRREMRhEiBNeSRUWVwYCTFApTFCwI0MxGRREMRhENhoBVwIANhoCIlOIEr9JFRZXBgJMUClMULAjQzEZFEQxGEQ2GgEXNhoCiA7DKUxQsCNDMRkURDEYRDYaARc2GgI2GgM2GgQ2GgU2GgaIDAcjQzEZFEQxGEQ2GgEXNhoCNhoDiAuaI0MxGRREMRhENhoBFzYaAogKdyNDMRkURDEYRDYaARc2GgI2GgOICh4jQzEZFEQxGEQ2GgEXiAkGI0MxGRREMRhEMRYjCUk4ECMSRDYaATYaAogIiCNDMRkURDEYRDEWJQlJOBAjEkQxFiMJSTgQIxJENhoBNhoCiAeBKCJPAlQpTFCwI0MxGRREMRhEMRaBBQlJOBAjEkQxFiQJSTgQIxJEMRaBAwlJOBAjEkQxFiUJSTgQIxJEMRYjCUk4ECMSRDYaATYaAogFwSgiTwJUKUxQsCNDMRkURDEYRDEWIwlJOBAjEkSIBV0jQzEZFEQxGBREiAVMI0MxGRREMRhENhoBNhoCNhoDFzYaBBeIBKUpTFCwI0MxGRREMRhENhoBF4gEMSlMULAjQzEZFEQxGEQ2GgEXNhoCiAP6KUxQsCNDMRkURDEYRDYaAReIA9IpTFCwI0MxGRREMRhENhoBF4gDsCgiTwJUKUxQsCNDMRkURDEYRDYaAReIA4UpTFCwI0MxGRREMRhENhoBF4gDYygiTwJUKUxQsCNDMRkURDEYRDYaAReIAzwoIk8CVClMULAjQzEZFEQxGEQ2GgEXiAMVKCJPAlQpTFCwI0MxGRREMRhENhoBF8AciALuKCJPAlQpTFCwI0MxGRREMRhENhoBFzYaAjYaA4gCuylMULAjQzEZFEQxGEQ2GgEXNhoCiAKXKUxQsCNDMRkURDEYRCEIFilMULAjQzEZFEQxGEQ2GgE2GgKIAl4WKUxQsCNDigIAi/6BCgiLADIMDUEAKrGBBrIQgQWyGScQsh4nELIfi/+NAgALAASzQv/bMgCyAUL/9SKyAUL/74mKAgCL/oABC6RBAAyL/4ABC6RBAAMjRIkiQv/6igIBi/4XgQsLi/8XCBZJk4EIDkRXBwGJigMBi/0Wi/5MUEm9RQFEi/8XSYF5DERJJApPAkwjuhdMJBiBA0wJJQuRgQMaFkmTgQgORFcHAYmKAwIii/6LAIEHDEEAM4sAgSALi/9MgSBYi/0lGEAAF4sBTFDmAYwBi/0lCoz9iwAjCIwAQv/PiwFQ5gGMAUL/54sBi/9PA08DiYoFAov9FkmTgQgORFcHAYEfr0lPAlCL/EyL/4j/mIz/i/sSRIv+FkmTgQgORFcHAVCL/EyL/4j/fUmM/4mKAwGL/iQKi/4kGIEDTAklC4v9SwJVgQNLApAcGov/TwKQGYv9TgJWiYoEAiKLACQMQQA3iwCL/xNBACaL/YsAkSMaIxJBABqLAIEoC4v8TIEoWCRVi/4SQQAHiwCL/E8CiYsAIwiMAEL/wiSL/E8CiYoFAYv+gSALSYv7Fov9TFBJTwKBIAhMvUQNQQAEIowAiYsBiwCBILqL/BNBAAQijACJi/9BAAeLAYsAJwm7I4wAiYoBAYv/gYCEr18PQQADgQOJi/+BgOHrFw9BAAIliYv/gYCt4gQPQQACI4kiiYoDASuL/haL/UxQSb1FAUAABCKMAImLASKBCLoXSYwAgUAPQQAEIowAiYsASYEIC4EICIv/FosBSU4DTgK7TCMIFiJMuyOMAImKAgGL/heL/xcIgZADC4HEEwiJigIBi/4nBov/iP35iYoDAYv+i/+I/daL/ScGTwKI/eWJigEBJw2L/1C+RQGJigEBi/8WJwZMUL5FAYmKAQGL/xYnBExQvkUBiYoBAYv/FicFTFC+RQGJigEBi/8WJwVMUEm9RQFEvkSJigEBi/8WJwdMUL5FAYmKAQGL/xYnB0xQSb1FAUQigWC6iYoCAYv+FicHTFBJvUUBRIv/F0kkDESBKAshBAiBKLqJigEBIkmL/xYnCExQSb1FAUS+TElPAkQnEUwVIosFiwQMQQA3iwKLBYEgWEmMACcJE4sDjAFBABWLA1cCAIsAUEkVgSAKFlcGAkxQjAGLAYwDiwWBIAiMBUL/wYsDjACJigQBIiuL/CcLp0EAfIv8JwymQQB0i/wXJRhAAGwjRIv9F0kkDESL/BclCiMJJAsIFicKTFBJjAC9RQFAAAUnEYwAiYsAIoEIuheL/ksBDEsBi/5PAk1JjP4JSYwBi/8NQAAEiwGM/4v/FkmTgRAORFcGAov+gQgLgQgIi/+BCAuLAE4CulCMAIkiQv+RKiNniYoBADIEJRJEJw0xAFC9RQEURIv/OAAxABJEi/84BzIKEkQyBoEeCBaAEQAAAAAAAAAAAAAAAAAAAAAATFAnDTEAUEy/iYoHATIEgQYSRIv5OAiB1JMBD0SL+jgIgeTeAg9Ei/w4CIv+F0lOAoEgC0lOAhZJk4EQDkRXBgKAAQpMiP3OD0SL+TgAMQASRIv6OAAxABJEi/s4ADEAEkSL/DgAMQASRIv9OAAxABJEi/k4BzIKEkSL+jgHMgoSRIv7OAcyChJEi/w4BzIKEkSL/TgHMgoSRIv+JwunQQDVi/4nDKZBAM2LACUYQADGI0SL/xclDkQiKmVEFicGTFCAHwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC/i/04CEmI/LSLACUKIwkkC0sBCCIqZUQnCk4CiPzLMgchBggWTwMWMQBPBBZJk4EIDkRXBwEoIksGVCiL/lAnDlAnElBPBVBPBFBPA1AnE1CL/1BPAlBMUCcUUCIqZURJFicESwFQTwO/iwGvJwhLAlBJvEhJTwK/gaABrycFTwNQTCcVXAC/IjEAuyMIKkxnjACJIkL/N4oEATIEgQMSRIv8OAiB1MMKD0SL/DgAMQASRIv9OAAxABJEi/w4BzIKEkSL/TgHMgoSRIv+JwunQQCii/4nDKZBAJqL/hclGEAAkiNEi/8XJQ5EIiplRBYnB0xQSYGfA7lIi/04CEmI+7uL/hclCiMJJAtLAQgiKmVEJwpOAoj70TIHIQYIFk8DFjEATwQWSZOBCA5EVwcBKCJLBlQoi/5QJw5QJxJQTwVQTwRQTwNQJxNQi/9QTwJQTFAnFFBLAiJPArsxAEsCgWBPArtMIQQnFbsiKmVEIwgqTGeJIkL/a4oDADIEJRJEi/04CIHkiw0PRIv9OAAxABJEi/04BzIKEkSL/icLp0EANIv+JwymQQAsi/4XJRhAACQjRIv/F0kkDESL/hclCiMJJAsIFicKTFBJvUUBFESBiAS5SIkiQv/ZigEAIkcDK0cEi/8WSScHTFBJvUlPAkhBANyLCiKBYLqMADEAiwBJTgJXFSASREkiUygiTwJUIlMUREmBuAVTKCJPAlQiU0yMAUEAhYsASSNVTIFWVUwlCiMJJAsIFicKTFBJjANJvUUBREkigQi6F0mMBIEIC4EITLqMAiKMBSKMB4sHiwQMiwWMBkEAN4sHgQgLSYwIiwJMW4v/EkEATYEIiwgIiwQjCUmBCAuLAkyBCFiLA0lOAk8ETwK7TBYiTLsjjAaLBkSLAIG4BSJUjAGLASIjVIwAiwtBAAeLCiKLALuJJwSLCVCLAL+JiwcjCIwHQv+MJwSLCVBJvUUBRL5MjABEQv8aigMAi/0WJwRLAVC9RQFEMQCL/heL/U8CJwhLAyKI+XhEJwVPAlBMgSgLSoEoukkiUygiTwJUIlMURIv/XAgiI1S7iYoCACJHAyuL/hZJJwRMUEm9RQFEi/8iWUlBAPCLByQOQQDpI0SB7A6LBwuBvAUIIoj3gycIiwVJTgJQvkyMAkQnBUsBUEmMAL5MjAFEiwa+RDIIFoATTVhzYWx2bzpjb21taXRfdHVybkxQTwJQSwFXBQhQTFdYCFCMAyKMBIsEiwcMQQCAi/9XAgCLBElOAoFhC4FhWEkiVUmBIAtJgSAIiwJJTgIVDkRMgSBYSScJE0RLAlcBIIsDSwFQTwRXIUBPA4RESwGBKAuLAUlOA0sBgShYSSJTKCJPAlQiUxRETwJcCE8DJAxETwJLAk8CXUlLAoEoWCIjVExOAl2MASMIjARC/3iLAIsBv4kiQv8UigMAi/0WJwdMUEm9RQFEMQCL/hdJJA9BACkiRIsCgSgLIQQIiwBJTgJLAYEoukkiUygiTwJUIlMURIv/XAgiI1S7iYsCgSALgWAIiwBMgSC6iwESQv/EigYAIkcFK0cDi/oWSScESwFQSb1FAUS+REkiUygiTwJUIlNEMQCL+xeL+k8CJwhLAyKI97lEJwVPA1BJTgNMgSgLSU4DgSi6SU4CSSJTKCJPAlQiU0RJI1MoIk8CVCJTFESL/CJZSU4DTIEGVUsBD0SL/ScOpkSL/oABA6ZETIFVVUlOAoF4TwILgfgKCElPAkAAEyWLDguBBQiBpgQLgQoIixAIjBGLESKI9aKLDyMSQQFEIQcWiwpQi/xQi/1Qi/5Qi/9QAYsNSVcIIE8CEkRJVwQBjAIkVUmBeQxESYELCkyBCxhMFkmTgQgORFcHAUwWSZOBCA5EVwcBUCcGiwpQSb1FAURLAVcAAUsCVwEBiPV2vkyMAURJIlWBCwtMI1UIjAYijAeLB4sODEEAxIv8VwIAiwclCyVYSVcAAUsBVwEBiPVDSSJVgQsLTCNVCEmMCUkkCosBTFVMJBiBA0wJJQuRgQMaQQBYIkAARyJEiw2LAlwFSYwNjACLDkEAIIsOIwmL/FcCAEwlCyVYSVcAAUxXAQGI9QyLDUxcBYwAiwCL/VwDi/5cByNJVIsLiwxPAruJiwcjCIwHiwmMBkL/ZYsGJAsnFkwkWIwDIowIiwgkDEEAGIsDiwhViwkSQQAEI0L/hYsIIwiMCEL/4SJC/3gjQv94iw8lEkEAFiEHFosKUIv8UIv9UIv+UIv/UANC/rKBGK9JjAWLClCAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFNhbHZvTFCMBCKMB4sHiw4MQQAvi/xXAgCLB0lOAiULJVhJVwABTFcBAYEfr0lPA1BMTwJQUIsETFCMBCMIjAdC/8mBH69Ji/1QiwRMUEyL/lBQiwWL/1BQ5gFC/i6KAgEiRwUrRwqL/hYnBEsBUElOAkm9RQFEvkxJTgJOA0RJIlMoIk8CVCJTRIv/IllJTgOBgH0LgbgXCCKI83cnCEsCUL5MSU4DTgREJwVLA1BJTgS+TE4ERCcGTwNQSU4DvkxOA0RJVzUgTgIyB0yBBVsPTBWBIAoiRwKLHosbDEEAY4segSALixRMgSBYJwkTix2MDoscjA1BADMjix5JTgKQSYwQixwZjByBKAuLFkyBKFgjUygiTwJUIlNBACCLHYsQGYwdix2MDoscjA2LDowdiw2MHIseIwiMHkL/m4saREL/4SKMCiKMHoseixsMQQFwix5JgSgLSYwJixZJTgNMgShYSSRVjAyBBVWMD4sdTJEjGiMSiwqMC4sZjASLGIwBTIwAQQEhiw+LDBOLCowLixmMBIsYjAGLFowAQQEJiw9JJAqLGElOA0xVTCQYgQNMCSULkYEDGosKjAuLGYwETIwBixaMAEAA3osWixyLD4seiPOVSU4CjBYkEosKjAuLGYwEixiMAUyMAEEAuosMSSQKixhJTgNMVUwkGIEDTAklC5GBAxolEkyMAYsKjAuLGYwEQQAxi/9XAgCLCklOAiEFCyEFWIsZiwxJTgMlIk8EiPLPSEyLGEwiiPMDTwIjCIwLjAGMBIsBiwSLC4v/VwIASwEhBQshBVhPAosPSU4DIiVPBIjym0hOA08CSwEliPLNTwIjCE8CFkmTgQgORFcHAYsWSU4CiwlJTgSBKFhMXASLHiQMRExOAl1MjAtPAowEjACMAYsLjAqLBIwZiwGMGIsAjBaLHiMIjB5C/oiLCosTEkQkr4wCIoweix6LGwxBALmLHYsekSMaIxKLAowDixaMAEEAlIsegSgLixZJTwKBKFhJjAWBA1UjEosCjANMjABBAHWLBUkkVYwGgQdVjAeLBiQLiwcIJxZMVUmMBiEEEkAATYsGSSQKixhMVUwkGIEDTAklC5GBAxojEkAAMosWixyLBoseiPIbjBZJjAgkE0H/vIsCSYsISU4CVSMIFkmTgQgORFcHAUsBJAxEXYwCiwKMA4sWjACLA4wCiwCMFoseIwiMHkL/PyKMHoseixsMQQB2ixyLHpEjGiMSixaMAEEAWYseSYEoC4sWSU4DSwGBKFgiSVRPAiQMRE8CSwJPAl1JSwKBKFgjIlRLAkxdSUsCgShYKFwDSwJMXUlLAoEoWElXBAFcBUsCTF1JSwKBKFgnCVwITE4CXYwAiwCMFoseIwiMHkL/gosXixi/ixWLFr+LEosZXDUyByEGCBZcBUmBWFsjCBZcWIsRTL+LAowAiYoCASIri/4VSUEAbIsCgSAYQABkiwKBgAIOQQBbI0SL/owAi/9AADExFkQxFiMJSYwBSTgQgQYSRDgYMggSQQAziwEiwhonDxJBACgjRDEWIwk7AIv+UIwAiwBJFYEgCoGmBAuB0gEIIojvbeYBSTUAjACJIkL/1SJC/6KKAAGB+JcEIojvUisiiwGBeQxBADCLAIAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFQjACLASMIjAFC/8iLAOYBjACJIQlEMQAyCRJEiQ==", "clear": "C4EBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8uX19hbGdvcHlfZW50cnlwb2ludF93aXRoX2luaXQoKSAtPiB1aW50NjQ6Cm1haW46CiAgICBpbnRjYmxvY2sgMCAxIDQgMiAyNTUgMjI0IDEyMDAgMzU4MTE2NzgzNzI3IFRNUExfR0VOX1VOSVggVE1QTF9VUERBVEFCTEUKICAgIGJ5dGVjYmxvY2sgMHgwMCAweDE1MWY3Yzc1ICJnYW1lX2lkIiAweCAic18iICJjXyIgImdfIiAibV8iICJsXyIgMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwICJvXyIgMHgwMiAweDA0ICJyXyIgMHgwMSAweDQ5NWNmZjVmIDB4MDY4MTAxIDB4MDAwMCAweDAwMjAgMHgyODg2Y2VjZDNiMjhhZjkzMjJmYmExMDRmNzg3MGVkMWYzMGI1MTFlZWM3ZGYxNGFhYTFhNDcwN2FmNDViNTRiIDB4MDAwMDAwMDAwMDAwMDAwMCAweDAwMDYwMDAwMDUwNTAwMDEwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwIDB4ZmYwYmZmMDFmZjBjMDAwMmZmMGQwMTAzZmYwZTAyMDRmZjBmMDMwNWZmMTAwNDA2ZmYxMTA1MDdmZjEyMDYwOGZmMTMwNzA5ZmYxNDA4MGFmZjE1MDlmZjAwMTZmZjBjMDExNzBiMGQwMjE4MGMwZTAzMTkwZDBmMDQxYTBlMTAwNTFiMGYxMTA2MWMxMDEyMDcxZDExMTMwODFlMTIxNDA5MWYxMzE1MGEyMDE0ZmYwYjIxZmYxNzBjMjIxNjE4MGQyMzE3MTkwZTI0MTgxYTBmMjUxOTFiMTAyNjFhMWMxMTI3MWIxZDEyMjgxYzFlMTMyOTFkMWYxNDJhMWUyMDE1MmIxZmZmMTYyY2ZmMjIxNzJkMjEyMzE4MmUyMjI0MTkyZjIzMjUxYTMwMjQyNjFiMzEyNTI3MWMzMjI2MjgxZDMzMjcyOTFlMzQyODJhMWYzNTI5MmIyMDM2MmFmZjIxMzdmZjJkMjIzODJjMmUyMzM5MmQyZjI0M2EyZTMwMjUzYjJmMzEyNjNjMzAzMjI3M2QzMTMzMjgzZTMyMzQyOTNmMzMzNTJhNDAzNDM2MmI0MTM1ZmYyYzQyZmYzODJkNDMzNzM5MmU0NDM4M2EyZjQ1MzkzYjMwNDYzYTNjMzE0NzNiM2QzMjQ4M2MzZTMzNDkzZDNmMzQ0YTNlNDAzNTRiM2Y0MTM2NGM0MGZmMzc0ZGZmNDMzODRlNDI0NDM5NGY0MzQ1M2E1MDQ0NDYzYjUxNDU0NzNjNTI0NjQ4M2Q1MzQ3NDkzZTU0NDg0YTNmNTU0OTRiNDA1NjRhNGM0MTU3NGJmZjQyNThmZjRlNDM1OTRkNGY0NDVhNGU1MDQ1NWI0ZjUxNDY1YzUwNTI0NzVkNTE1MzQ4NWU1MjU0NDk1ZjUzNTU0YTYwNTQ1NjRiNjE1NTU3NGM2MjU2ZmY0ZDYzZmY1OTRlNjQ1ODVhNGY2NTU5NWI1MDY2NWE1YzUxNjc1YjVkNTI2ODVjNWU1MzY5NWQ1ZjU0NmE1ZTYwNTU2YjVmNjE1NjZjNjA2MjU3NmQ2MWZmNTg2ZWZmNjQ1OTZmNjM2NTVhNzA2NDY2NWI3MTY1Njc1YzcyNjY2ODVkNzM2NzY5NWU3NDY4NmE1Zjc1Njk2YjYwNzY2YTZjNjE3NzZiNmQ2Mjc4NmNmZjYzZmZmZjZmNjRmZjZlNzA2NWZmNmY3MTY2ZmY3MDcyNjdmZjcxNzM2OGZmNzI3NDY5ZmY3Mzc1NmFmZjc0NzY2YmZmNzU3NzZjZmY3Njc4NmRmZjc3ZmYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSwgc2NyYXRjaF9zbG90cz0oY3N0Lk1JTUNfQ0hBSU5fU0xPVCwpKToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2FmdGVyX2lmX2Vsc2VAMzMKICAgIHB1c2hieXRlc3MgMHg2MzMzY2Q5ZCAweGI2NmQyZjU2IDB4ODk5NmJiMzcgMHg1MzgxZDZhOCAweDc4MTVmZTQxIDB4MGI0MmQxMmEgMHhiYmZhOGUwMSAweDEzY2U1NzI0IDB4YThjYWM4OTEgMHgwNzZkOGI5YyAweDRmOWQ0ZjEzIDB4ZjVlNzliNGMgMHgwNmYwZDEzMiAweDBkOWUxYWE3IDB4NWJlMjE5ZjAgMHgzZmZiY2EyNCAweDE5ZTA5YTJlIDB4MGZiMTdhM2YgMHhmMjQ3MGQ5OCAweDk5MTJlM2ZiIDB4MmFiMTZjOGYgMHhhYTU3MjM0ZSAweGIxZTRiZGM4IDB4MTVkOGE4MGMgMHg3ZDc3ZGEzZiAvLyBtZXRob2QgImNhbGNfc2luZ2xlX2JveF9jb3N0KHVpbnQ4LHVpbnQxNil1aW50NjQiLCBtZXRob2QgInJlYWRfZ2VuX3VuaXgoKXVpbnQ2NCIsIG1ldGhvZCAicmVhZF9ncmlkX2NlbGxfdmFsdWVfYnlfaW5kZXgodWludDY0LHVpbnQ4KXVpbnQ4IiwgbWV0aG9kICJyZWFkX2dyaWRfY2VsbF92YWx1ZV9hdF9jb29yZHModWludDY0LHVpbnQ4LHVpbnQ4KXVpbnQ4IiwgbWV0aG9kICJkb2VzX2JveF91c2VyX3JlZ2lzdHJ5X2V4aXN0KGFjY291bnQpYm9vbCIsIG1ldGhvZCAiZG9lc19ib3hfZ2FtZV9ncmlkX2V4aXN0KHVpbnQ2NClib29sIiwgbWV0aG9kICJkb2VzX2JveF9nYW1lX3N0YXRlX2V4aXN0KHVpbnQ2NClib29sIiwgbWV0aG9kICJkb2VzX2JveF9nYW1lX2NoYXJhY3RlcnNfZXhpc3QodWludDY0KWJvb2wiLCBtZXRob2QgInJlYWRfYm94X2dhbWVfY2hhcmFjdGVycyh1aW50NjQpKGJvb2wsYm9vbCx1aW50OCx1aW50OCx1aW50OCx1aW50OCx1aW50OCx1aW50OCx1aW50OCx1aW50MjU2KVs0XSIsIG1ldGhvZCAiZG9lc19ib3hfZ2FtZV9yZWNvcmRfZXhpc3QodWludDY0KWJvb2wiLCBtZXRob2QgInJlYWRfZ2FtZV9yZWNvcmRfc3RhdGUodWludDY0KShib29sLHVpbnQ4LHVpbnQ4LHVpbnQxNix1aW50NjQsdWludDY0LGFkZHJlc3MsdWludDI1Nix1aW50OCx1aW50OCxib29sLHVpbnQ2NCkiLCBtZXRob2QgInJlYWRfZ2FtZV9yZWNvcmRfY2hhcmFjdGVyKHVpbnQ2NCx1aW50OCkoYm9vbCxib29sLHVpbnQ4LHVpbnQ4LHVpbnQ4LHVpbnQ4LHVpbnQ4LHVpbnQ4LHVpbnQ4LHVpbnQyNTYpIiwgbWV0aG9kICJyZWFkX2JveF9nYW1lX2xvYmJ5KHVpbnQ2NClhZGRyZXNzW10iLCBtZXRob2QgInJlYWRfb3Blbl9sb2JiaWVzKHVpbnQ4LHVpbnQ4LHVpbnQ2NCx1aW50NjQpdWludDY0W10iLCBtZXRob2QgImdlbmVyYXRlKCl2b2lkIiwgbWV0aG9kICJnZXRfYm94X3VzZXJfcmVnaXN0cnkocGF5KXZvaWQiLCBtZXRob2QgIm5ld19nYW1lKHBheSxwYXkscGF5LHBheSxwYXksdWludDgsdWludDgpYm9vbCIsIG1ldGhvZCAibmV3X2dhbWVfcmVjb3JkKHBheSxwYXksdWludDgsdWludDgpYm9vbCIsIG1ldGhvZCAiY3JlYXRlX29wZW5fbG9iYnlfaW5kZXgocGF5LHVpbnQ4LHVpbnQ4KXZvaWQiLCBtZXRob2QgImNsb3NlX3N0YWtpbmcodWludDY0KXZvaWQiLCBtZXRob2QgImNvbW1pdF90dXJuKHVpbnQ2NCx1aW50OCx1aW50MjU2KXZvaWQiLCBtZXRob2QgImNvbW1pdF90dXJucyh1aW50NjQsKHVpbnQ4LHVpbnQyNTYsYnl0ZVs2NF0pW10pdm9pZCIsIG1ldGhvZCAiY29tbWl0X3R1cm5fcmVjb3JkKHVpbnQ2NCx1aW50OCx1aW50MjU2KXZvaWQiLCBtZXRob2QgInJldmVhbF90dXJuKHVpbnQ2NCx1aW50OCwodWludDgsdWludDgpW10sdWludDgsdWludDgsdWludDY0KXZvaWQiLCBtZXRob2QgInJlc29sdmVfcm91bmQodWludDY0LHVpbnQyNTZbN11bXSl1aW50OFs0XSIKICAgIGJ5dGVjIDE1IC8vIG1ldGhvZCAibWltY19hYnNvcmIoYnl0ZVtdLGJvb2wpYnl0ZVtdIgogICAgcHVzaGJ5dGVzcyAweGY3MTcyMTQ4IDB4YTBlODE4NzIgLy8gbWV0aG9kICJtaW1jX3Rlc3RlcigpYnl0ZVtdIiwgbWV0aG9kICJ1cGRhdGUoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NhbGNfc2luZ2xlX2JveF9jb3N0X3JvdXRlQDUgbWFpbl9yZWFkX2dlbl91bml4X3JvdXRlQDYgbWFpbl9yZWFkX2dyaWRfY2VsbF92YWx1ZV9ieV9pbmRleF9yb3V0ZUA3IG1haW5fcmVhZF9ncmlkX2NlbGxfdmFsdWVfYXRfY29vcmRzX3JvdXRlQDggbWFpbl9kb2VzX2JveF91c2VyX3JlZ2lzdHJ5X2V4aXN0X3JvdXRlQDkgbWFpbl9kb2VzX2JveF9nYW1lX2dyaWRfZXhpc3Rfcm91dGVAMTAgbWFpbl9kb2VzX2JveF9nYW1lX3N0YXRlX2V4aXN0X3JvdXRlQDExIG1haW5fZG9lc19ib3hfZ2FtZV9jaGFyYWN0ZXJzX2V4aXN0X3JvdXRlQDEyIG1haW5fcmVhZF9ib3hfZ2FtZV9jaGFyYWN0ZXJzX3JvdXRlQDEzIG1haW5fZG9lc19ib3hfZ2FtZV9yZWNvcmRfZXhpc3Rfcm91dGVAMTQgbWFpbl9yZWFkX2dhbWVfcmVjb3JkX3N0YXRlX3JvdXRlQDE1IG1haW5fcmVhZF9nYW1lX3JlY29yZF9jaGFyYWN0ZXJfcm91dGVAMTYgbWFpbl9yZWFkX2JveF9nYW1lX2xvYmJ5X3JvdXRlQDE3IG1haW5fcmVhZF9vcGVuX2xvYmJpZXNfcm91dGVAMTggbWFpbl9nZW5lcmF0ZV9yb3V0ZUAxOSBtYWluX2dldF9ib3hfdXNlcl9yZWdpc3RyeV9yb3V0ZUAyMCBtYWluX25ld19nYW1lX3JvdXRlQDIxIG1haW5fbmV3X2dhbWVfcmVjb3JkX3JvdXRlQDIyIG1haW5fY3JlYXRlX29wZW5fbG9iYnlfaW5kZXhfcm91dGVAMjMgbWFpbl9jbG9zZV9zdGFraW5nX3JvdXRlQDI0IG1haW5fY29tbWl0X3R1cm5fcm91dGVAMjUgbWFpbl9jb21taXRfdHVybnNfcm91dGVAMjYgbWFpbl9jb21taXRfdHVybl9yZWNvcmRfcm91dGVAMjcgbWFpbl9yZXZlYWxfdHVybl9yb3V0ZUAyOCBtYWluX3Jlc29sdmVfcm91bmRfcm91dGVAMjkgbWFpbl9taW1jX2Fic29yYl9yb3V0ZUAzMCBtYWluX21pbWNfdGVzdGVyX3JvdXRlQDMxIG1haW5fdXBkYXRlX3JvdXRlQDMyCgptYWluX2FmdGVyX2lmX2Vsc2VAMzM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAtMzEKICAgIC8vICMgU21hcnQgY29udHJhY3QgY2xhc3MKICAgIC8vIGNsYXNzIFNhbHZvKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTEsIHNjcmF0Y2hfc2xvdHM9KGNzdC5NSU1DX0NIQUlOX1NMT1QsKSk6CiAgICBpbnRjXzAgLy8gMAogICAgcmV0dXJuCgptYWluX3VwZGF0ZV9yb3V0ZUAzMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo5ODYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludGNfMiAvLyBVcGRhdGVBcHBsaWNhdGlvbgogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IFVwZGF0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgdXBkYXRlCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX21pbWNfdGVzdGVyX3JvdXRlQDMxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjkxNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgbWltY190ZXN0ZXIKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX21pbWNfYWJzb3JiX3JvdXRlQDMwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg4NC04ODcKICAgIC8vICMgQWJzb3JiIG9uZSBjaHVuayBvZiBhIGxvbmcgTWlNQyBwcmVpbWFnZSwgc28gdGhlIGhhc2ggc3ByZWFkcyBvdmVyIHNldmVyYWwgYXBwIGNhbGxzIGluIGEgZ3JvdXAKICAgIC8vICMgVGhlIGZpcnN0IGNodW5rIGlzIGhhc2hlZCBhbG9uZSwgZXZlcnkgbGF0ZXIgY2h1bmsgaXMgaGFzaGVkIGFmdGVyIHRoZSBwcmV2aW91cyBjaHVuayBkaWdlc3QKICAgIC8vICMgUmV0dXJuIHRoZSBydW5uaW5nIGRpZ2VzdDsgdGhlIGRpZ2VzdCByZXR1cm5lZCBieSB0aGUgbGFzdCBjaHVuayBpcyB0aGUgZmluYWwgaGFzaAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSwgc2NyYXRjaF9zbG90cz0oY3N0Lk1JTUNfQ0hBSU5fU0xPVCwpKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODg0LTg4NwogICAgLy8gIyBBYnNvcmIgb25lIGNodW5rIG9mIGEgbG9uZyBNaU1DIHByZWltYWdlLCBzbyB0aGUgaGFzaCBzcHJlYWRzIG92ZXIgc2V2ZXJhbCBhcHAgY2FsbHMgaW4gYSBncm91cAogICAgLy8gIyBUaGUgZmlyc3QgY2h1bmsgaXMgaGFzaGVkIGFsb25lLCBldmVyeSBsYXRlciBjaHVuayBpcyBoYXNoZWQgYWZ0ZXIgdGhlIHByZXZpb3VzIGNodW5rIGRpZ2VzdAogICAgLy8gIyBSZXR1cm4gdGhlIHJ1bm5pbmcgZGlnZXN0OyB0aGUgZGlnZXN0IHJldHVybmVkIGJ5IHRoZSBsYXN0IGNodW5rIGlzIHRoZSBmaW5hbCBoYXNoCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgbWltY19hYnNvcmIKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3Jlc29sdmVfcm91bmRfcm91dGVAMjk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzU3LTc2MQogICAgLy8gIyBSZXNvbHZlIGEgcm91bmQ6IGFwcGx5IGV2ZXJ5IHJldmVhbGVkIHR1cm4gb2YgYSBnYW1lIGluIGxvYmJ5IHNsb3Qgb3JkZXIsIGluIGEgc2luZ2xlIGdyaWQgcGFzcwogICAgLy8gIyBNb3ZlcyBhcmUgYXBwbGllZCBmaXJzdCwgdGhlbiBzaG90czsgYSBtb3ZlIG9udG8gYSBjZWxsIHRoYXQgaXMgbm8gbG9uZ2VyIGZyZWUgaXMgYmxvY2tlZAogICAgLy8gIyBgcHJvb2ZzYCBob2xkcyBvbmUgZ3JpZCBNZXJrbGUgcHJvb2YgcGVyIGNoYW5nZWQgZ3JpZCBjZWxsLCBpbiBjaGFuZ2Ugb3JkZXIgKHNlZSB1dGlscy5ncmlkX21lcmtsZSkKICAgIC8vICMgUmV0dXJuIHRoZSBudW1iZXIgb2YgaGl0cyBlYWNoIGxvYmJ5IHNsb3QgdG9vayB0aGlzIHJvdW5kCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwLTMxCiAgICAvLyAjIFNtYXJ0IGNvbnRyYWN0IGNsYXNzCiAgICAvLyBjbGFzcyBTYWx2byhBUkM0Q29udHJhY3QsIGF2bV92ZXJzaW9uPTExLCBzY3JhdGNoX3Nsb3RzPShjc3QuTUlNQ19DSEFJTl9TTE9ULCkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc1Ny03NjEKICAgIC8vICMgUmVzb2x2ZSBhIHJvdW5kOiBhcHBseSBldmVyeSByZXZlYWxlZCB0dXJuIG9mIGEgZ2FtZSBpbiBsb2JieSBzbG90IG9yZGVyLCBpbiBhIHNpbmdsZSBncmlkIHBhc3MKICAgIC8vICMgTW92ZXMgYXJlIGFwcGxpZWQgZmlyc3QsIHRoZW4gc2hvdHM7IGEgbW92ZSBvbnRvIGEgY2VsbCB0aGF0IGlzIG5vIGxvbmdlciBmcmVlIGlzIGJsb2NrZWQKICAgIC8vICMgYHByb29mc2AgaG9sZHMgb25lIGdyaWQgTWVya2xlIHByb29mIHBlciBjaGFuZ2VkIGdyaWQgY2VsbCwgaW4gY2hhbmdlIG9yZGVyIChzZWUgdXRpbHMuZ3JpZF9tZXJrbGUpCiAgICAvLyAjIFJldHVybiB0aGUgbnVtYmVyIG9mIGhpdHMgZWFjaCBsb2JieSBzbG90IHRvb2sgdGhpcyByb3VuZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHJlc29sdmVfcm91bmQKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fcmV2ZWFsX3R1cm5fcm91dGVAMjg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjgwLTY4MQogICAgLy8gIyBSZXZlYWwgYSBjb21taXR0ZWQgdHVybjogcmVjb21wdXRlIGl0cyBoYXNoIHcvIHRoZSBnYW1lIGNvbW1pdCBzY2hlbWUsIHRoZW4gdmFsaWRhdGUgdGhlIG1vdmUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAtMzEKICAgIC8vICMgU21hcnQgY29udHJhY3QgY2xhc3MKICAgIC8vIGNsYXNzIFNhbHZvKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTEsIHNjcmF0Y2hfc2xvdHM9KGNzdC5NSU1DX0NIQUlOX1NMT1QsKSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjgwLTY4MQogICAgLy8gIyBSZXZlYWwgYSBjb21taXR0ZWQgdHVybjogcmVjb21wdXRlIGl0cyBoYXNoIHcvIHRoZSBnYW1lIGNvbW1pdCBzY2hlbWUsIHRoZW4gdmFsaWRhdGUgdGhlIG1vdmUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiByZXZlYWxfdHVybgogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jb21taXRfdHVybl9yZWNvcmRfcm91dGVAMjc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjQ3LTY0OAogICAgLy8gIyBDb21taXQgYSB0dXJuIGhhc2ggdG8gdGhlIHNlbmRlciBjaGFyYWN0ZXIgb2YgYSB1bmlmaWVkIGdhbWUgcmVjb3JkCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwLTMxCiAgICAvLyAjIFNtYXJ0IGNvbnRyYWN0IGNsYXNzCiAgICAvLyBjbGFzcyBTYWx2byhBUkM0Q29udHJhY3QsIGF2bV92ZXJzaW9uPTExLCBzY3JhdGNoX3Nsb3RzPShjc3QuTUlNQ19DSEFJTl9TTE9ULCkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjY0Ny02NDgKICAgIC8vICMgQ29tbWl0IGEgdHVybiBoYXNoIHRvIHRoZSBzZW5kZXIgY2hhcmFjdGVyIG9mIGEgdW5pZmllZCBnYW1lIHJlY29yZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGNvbW1pdF90dXJuX3JlY29yZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jb21taXRfdHVybnNfcm91dGVAMjY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTc4LTU4MAogICAgLy8gIyBDb21taXQgdGhlIHR1cm4gaGFzaGVzIG9mIHNldmVyYWwgcGxheWVycyBhdCBvbmNlLCBlLmcuIGZyb20gYSByZWxheSBvciBnYW1lIHNlcnZlcgogICAgLy8gIyBFYWNoIGNvbW1pdCBpcyBhdXRob3JpemVkIGJ5IHRoZSBwbGF5ZXIgc2lnbmF0dXJlIGluc3RlYWQgb2YgdGhlIHRyYW5zYWN0aW9uIHNlbmRlcgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSwgc2NyYXRjaF9zbG90cz0oY3N0Lk1JTUNfQ0hBSU5fU0xPVCwpKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1NzgtNTgwCiAgICAvLyAjIENvbW1pdCB0aGUgdHVybiBoYXNoZXMgb2Ygc2V2ZXJhbCBwbGF5ZXJzIGF0IG9uY2UsIGUuZy4gZnJvbSBhIHJlbGF5IG9yIGdhbWUgc2VydmVyCiAgICAvLyAjIEVhY2ggY29tbWl0IGlzIGF1dGhvcml6ZWQgYnkgdGhlIHBsYXllciBzaWduYXR1cmUgaW5zdGVhZCBvZiB0aGUgdHJhbnNhY3Rpb24gc2VuZGVyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY29tbWl0X3R1cm5zCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NvbW1pdF90dXJuX3JvdXRlQDI1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU0NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSwgc2NyYXRjaF9zbG90cz0oY3N0Lk1JTUNfQ0hBSU5fU0xPVCwpKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1NDQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBjb21taXRfdHVybgogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jbG9zZV9zdGFraW5nX3JvdXRlQDI0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjUwMi01MDQKICAgIC8vICMgQ2xvc2Ugc3Rha2luZyBvZiBhIGdhbWUsIHNvIGl0IGdvZXMgbGl2ZSBhbmQgbGVhdmVzIHRoZSBvcGVuIGxvYmJ5IGluZGV4CiAgICAvLyAjIFdvcmtzIGZvciBib3RoIHRoZSBzZXBhcmF0ZSBnYW1lIGJveGVzIGFuZCB0aGUgdW5pZmllZCBnYW1lIHJlY29yZCBvZiBhIGdhbWUgaWQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAtMzEKICAgIC8vICMgU21hcnQgY29udHJhY3QgY2xhc3MKICAgIC8vIGNsYXNzIFNhbHZvKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTEsIHNjcmF0Y2hfc2xvdHM9KGNzdC5NSU1DX0NIQUlOX1NMT1QsKSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTAyLTUwNAogICAgLy8gIyBDbG9zZSBzdGFraW5nIG9mIGEgZ2FtZSwgc28gaXQgZ29lcyBsaXZlIGFuZCBsZWF2ZXMgdGhlIG9wZW4gbG9iYnkgaW5kZXgKICAgIC8vICMgV29ya3MgZm9yIGJvdGggdGhlIHNlcGFyYXRlIGdhbWUgYm94ZXMgYW5kIHRoZSB1bmlmaWVkIGdhbWUgcmVjb3JkIG9mIGEgZ2FtZSBpZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGNsb3NlX3N0YWtpbmcKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX29wZW5fbG9iYnlfaW5kZXhfcm91dGVAMjM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDcwLTQ3MgogICAgLy8gIyBDcmVhdGUgdGhlIG9wZW4gbG9iYnkgaW5kZXggYm94IG9mIGEgKGxvYmJ5X3NpemUsIHN0YWtlIHRpZXIpIGJ1Y2tldCwgdy8gb25lIE1CUiBwYXltZW50CiAgICAvLyAjIEFueW9uZSBtYXkgZnVuZCBhIGJ1Y2tldDsgZ2FtZXMgY3JlYXRlZCBiZWZvcmUgaXQgZXhpc3RzIGFyZSBub3QgbGlzdGVkCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwLTMxCiAgICAvLyAjIFNtYXJ0IGNvbnRyYWN0IGNsYXNzCiAgICAvLyBjbGFzcyBTYWx2byhBUkM0Q29udHJhY3QsIGF2bV92ZXJzaW9uPTExLCBzY3JhdGNoX3Nsb3RzPShjc3QuTUlNQ19DSEFJTl9TTE9ULCkpOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDcwLTQ3MgogICAgLy8gIyBDcmVhdGUgdGhlIG9wZW4gbG9iYnkgaW5kZXggYm94IG9mIGEgKGxvYmJ5X3NpemUsIHN0YWtlIHRpZXIpIGJ1Y2tldCwgdy8gb25lIE1CUiBwYXltZW50CiAgICAvLyAjIEFueW9uZSBtYXkgZnVuZCBhIGJ1Y2tldDsgZ2FtZXMgY3JlYXRlZCBiZWZvcmUgaXQgZXhpc3RzIGFyZSBub3QgbGlzdGVkCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY3JlYXRlX29wZW5fbG9iYnlfaW5kZXgKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fbmV3X2dhbWVfcmVjb3JkX3JvdXRlQDIyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjM3My0zNzUKICAgIC8vICMgQ3JlYXRlIGEgbmV3IGdhbWUgYXMgYSBzaW5nbGUgdW5pZmllZCBnYW1lIHJlY29yZCBib3gsIHcvIG9uZSBNQlIgcGF5bWVudCBhbmQgYSBzdGFrZQogICAgLy8gIyBSZXR1cm4gVHJ1ZSBpZiB0aGUgZ2FtZSBnb3QgbGlzdGVkIGluIHRoZSBvcGVuIGxvYmJ5IGluZGV4LCBzYW1lIGFzIGBuZXdfZ2FtZWAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAtMzEKICAgIC8vICMgU21hcnQgY29udHJhY3QgY2xhc3MKICAgIC8vIGNsYXNzIFNhbHZvKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTEsIHNjcmF0Y2hfc2xvdHM9KGNzdC5NSU1DX0NIQUlOX1NMT1QsKSk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18zIC8vIDIKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjM3My0zNzUKICAgIC8vICMgQ3JlYXRlIGEgbmV3IGdhbWUgYXMgYSBzaW5nbGUgdW5pZmllZCBnYW1lIHJlY29yZCBib3gsIHcvIG9uZSBNQlIgcGF5bWVudCBhbmQgYSBzdGFrZQogICAgLy8gIyBSZXR1cm4gVHJ1ZSBpZiB0aGUgZ2FtZSBnb3QgbGlzdGVkIGluIHRoZSBvcGVuIGxvYmJ5IGluZGV4LCBzYW1lIGFzIGBuZXdfZ2FtZWAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBuZXdfZ2FtZV9yZWNvcmQKICAgIGJ5dGVjXzAgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX25ld19nYW1lX3JvdXRlQDIxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjI0Ny0yNDkKICAgIC8vICMgQ3JlYXRlIGEgbmV3IGdhbWUsIHJldHVybiBUcnVlIGlmIGl0IGdvdCBsaXN0ZWQgaW4gdGhlIG9wZW4gbG9iYnkgaW5kZXgKICAgIC8vICMgQSBnYW1lIHdob3NlIGJ1Y2tldCBib3ggd2FzIG5vdCBjcmVhdGVkIHlldCwgb3IgaXMgZnVsbCwgc3RheXMgcGxheWFibGUgYnV0IHVubGlzdGVkCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwLTMxCiAgICAvLyAjIFNtYXJ0IGNvbnRyYWN0IGNsYXNzCiAgICAvLyBjbGFzcyBTYWx2byhBUkM0Q29udHJhY3QsIGF2bV92ZXJzaW9uPTExLCBzY3JhdGNoX3Nsb3RzPShjc3QuTUlNQ19DSEFJTl9TTE9ULCkpOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIHB1c2hpbnQgNSAvLyA1CiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18yIC8vIDQKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4biBHcm91cEluZGV4CiAgICBwdXNoaW50IDMgLy8gMwogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMyAvLyAyCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyNDctMjQ5CiAgICAvLyAjIENyZWF0ZSBhIG5ldyBnYW1lLCByZXR1cm4gVHJ1ZSBpZiBpdCBnb3QgbGlzdGVkIGluIHRoZSBvcGVuIGxvYmJ5IGluZGV4CiAgICAvLyAjIEEgZ2FtZSB3aG9zZSBidWNrZXQgYm94IHdhcyBub3QgY3JlYXRlZCB5ZXQsIG9yIGlzIGZ1bGwsIHN0YXlzIHBsYXlhYmxlIGJ1dCB1bmxpc3RlZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIG5ld19nYW1lCiAgICBieXRlY18wIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYm94X3VzZXJfcmVnaXN0cnlfcm91dGVAMjA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjIzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwLTMxCiAgICAvLyAjIFNtYXJ0IGNvbnRyYWN0IGNsYXNzCiAgICAvLyBjbGFzcyBTYWx2byhBUkM0Q29udHJhY3QsIGF2bV92ZXJzaW9uPTExLCBzY3JhdGNoX3Nsb3RzPShjc3QuTUlNQ19DSEFJTl9TTE9ULCkpOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjIzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgZ2V0X2JveF91c2VyX3JlZ2lzdHJ5CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dlbmVyYXRlX3JvdXRlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIxMS0yMTIKICAgIC8vICMgR2VuZXJhdGUgdGhlIHNtYXJ0IGNvbnRyYWN0IGFwcGxpY2F0aW9uIGNsaWVudAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgY2FsbHN1YiBnZW5lcmF0ZQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZWFkX29wZW5fbG9iYmllc19yb3V0ZUAxODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNzgtMTgwCiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIGEgcGFnZSBvZiB0aGUgb3BlbiBnYW1lIGlkcyBvZiBhIChsb2JieV9zaXplLCBzdGFrZSB0aWVyKSBidWNrZXQKICAgIC8vICMgVGhlIHBhZ2UgaG9sZHMgdXAgdG8gYGNvdW50YCBpZHMgZnJvbSBlbnRyeSBgc3RhcnRgLCBhbmQgaXMgZW1wdHkgcGFzdCB0aGUgbGFzdCBlbnRyeQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSwgc2NyYXRjaF9zbG90cz0oY3N0Lk1JTUNfQ0hBSU5fU0xPVCwpKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNzgtMTgwCiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIGEgcGFnZSBvZiB0aGUgb3BlbiBnYW1lIGlkcyBvZiBhIChsb2JieV9zaXplLCBzdGFrZSB0aWVyKSBidWNrZXQKICAgIC8vICMgVGhlIHBhZ2UgaG9sZHMgdXAgdG8gYGNvdW50YCBpZHMgZnJvbSBlbnRyeSBgc3RhcnRgLCBhbmQgaXMgZW1wdHkgcGFzdCB0aGUgbGFzdCBlbnRyeQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIHJlYWRfb3Blbl9sb2JiaWVzCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3JlYWRfYm94X2dhbWVfbG9iYnlfcm91dGVAMTc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTU0LTE1NQogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBhbiBhcnJheSBvZiBhbGwgYWN0aXZlIHVzZXJzIGluIHRoZSBnYW1lIGxvYmJ5IGF0IHRpbWUgb2YgY2FsbAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSwgc2NyYXRjaF9zbG90cz0oY3N0Lk1JTUNfQ0hBSU5fU0xPVCwpKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNTQtMTU1CiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIGFuIGFycmF5IG9mIGFsbCBhY3RpdmUgdXNlcnMgaW4gdGhlIGdhbWUgbG9iYnkgYXQgdGltZSBvZiBjYWxsCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgcmVhZF9ib3hfZ2FtZV9sb2JieQogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZWFkX2dhbWVfcmVjb3JkX2NoYXJhY3Rlcl9yb3V0ZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMzQtMTM1CiAgICAvLyAjIFJFQUQtT05MWTogUmVhZCB0aGUgZ2FtZSBjaGFyYWN0ZXIgYXQgYSBsb2JieSBzbG90IG9mIGEgdW5pZmllZCBnYW1lIHJlY29yZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSwgc2NyYXRjaF9zbG90cz0oY3N0Lk1JTUNfQ0hBSU5fU0xPVCwpKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMzQtMTM1CiAgICAvLyAjIFJFQUQtT05MWTogUmVhZCB0aGUgZ2FtZSBjaGFyYWN0ZXIgYXQgYSBsb2JieSBzbG90IG9mIGEgdW5pZmllZCBnYW1lIHJlY29yZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIHJlYWRfZ2FtZV9yZWNvcmRfY2hhcmFjdGVyCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3JlYWRfZ2FtZV9yZWNvcmRfc3RhdGVfcm91dGVAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTIwLTEyMQogICAgLy8gIyBSRUFELU9OTFk6IFJlYWQgdGhlIGdhbWUgc3RhdGUgc2VjdGlvbiBvZiBhIHVuaWZpZWQgZ2FtZSByZWNvcmQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAtMzEKICAgIC8vICMgU21hcnQgY29udHJhY3QgY2xhc3MKICAgIC8vIGNsYXNzIFNhbHZvKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTEsIHNjcmF0Y2hfc2xvdHM9KGNzdC5NSU1DX0NIQUlOX1NMT1QsKSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTIwLTEyMQogICAgLy8gIyBSRUFELU9OTFk6IFJlYWQgdGhlIGdhbWUgc3RhdGUgc2VjdGlvbiBvZiBhIHVuaWZpZWQgZ2FtZSByZWNvcmQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiByZWFkX2dhbWVfcmVjb3JkX3N0YXRlCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2RvZXNfYm94X2dhbWVfcmVjb3JkX2V4aXN0X3JvdXRlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjExNS0xMTYKICAgIC8vICMgUkVBRC1PTkxZOiBSZXR1cm4gVHJ1ZSBpZiB1bmlmaWVkIGdhbWUgcmVjb3JkIGJveCB2YWx1ZSBleGlzdHMsIGVsc2UgRmFsc2UKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAtMzEKICAgIC8vICMgU21hcnQgY29udHJhY3QgY2xhc3MKICAgIC8vIGNsYXNzIFNhbHZvKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTEsIHNjcmF0Y2hfc2xvdHM9KGNzdC5NSU1DX0NIQUlOX1NMT1QsKSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTE1LTExNgogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBUcnVlIGlmIHVuaWZpZWQgZ2FtZSByZWNvcmQgYm94IHZhbHVlIGV4aXN0cywgZWxzZSBGYWxzZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGRvZXNfYm94X2dhbWVfcmVjb3JkX2V4aXN0CiAgICBieXRlY18wIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZWFkX2JveF9nYW1lX2NoYXJhY3RlcnNfcm91dGVAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTA3LTEwOAogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBldmVyeSBnYW1lIGNoYXJhY3RlciBvZiBhIGdhbWUsIGluZGV4ZWQgYnkgbG9iYnkgc2xvdCwgaW4gb25lIGJveCByZWFkCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwLTMxCiAgICAvLyAjIFNtYXJ0IGNvbnRyYWN0IGNsYXNzCiAgICAvLyBjbGFzcyBTYWx2byhBUkM0Q29udHJhY3QsIGF2bV92ZXJzaW9uPTExLCBzY3JhdGNoX3Nsb3RzPShjc3QuTUlNQ19DSEFJTl9TTE9ULCkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjEwNy0xMDgKICAgIC8vICMgUkVBRC1PTkxZOiBSZXR1cm4gZXZlcnkgZ2FtZSBjaGFyYWN0ZXIgb2YgYSBnYW1lLCBpbmRleGVkIGJ5IGxvYmJ5IHNsb3QsIGluIG9uZSBib3ggcmVhZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIHJlYWRfYm94X2dhbWVfY2hhcmFjdGVycwogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9kb2VzX2JveF9nYW1lX2NoYXJhY3RlcnNfZXhpc3Rfcm91dGVAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTAyLTEwMwogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBUcnVlIGlmIGdhbWUgY2hhcmFjdGVycyBib3ggdmFsdWUgZXhpc3RzLCBlbHNlIEZhbHNlCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwLTMxCiAgICAvLyAjIFNtYXJ0IGNvbnRyYWN0IGNsYXNzCiAgICAvLyBjbGFzcyBTYWx2byhBUkM0Q29udHJhY3QsIGF2bV92ZXJzaW9uPTExLCBzY3JhdGNoX3Nsb3RzPShjc3QuTUlNQ19DSEFJTl9TTE9ULCkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjEwMi0xMDMKICAgIC8vICMgUkVBRC1PTkxZOiBSZXR1cm4gVHJ1ZSBpZiBnYW1lIGNoYXJhY3RlcnMgYm94IHZhbHVlIGV4aXN0cywgZWxzZSBGYWxzZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGRvZXNfYm94X2dhbWVfY2hhcmFjdGVyc19leGlzdAogICAgYnl0ZWNfMCAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZG9lc19ib3hfZ2FtZV9zdGF0ZV9leGlzdF9yb3V0ZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo5Ny05OAogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBUcnVlIGlmIGdhbWUgc3RhdGUgYm94IHZhbHVlIGV4aXN0cywgZWxzZSBGYWxzZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSwgc2NyYXRjaF9zbG90cz0oY3N0Lk1JTUNfQ0hBSU5fU0xPVCwpKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo5Ny05OAogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBUcnVlIGlmIGdhbWUgc3RhdGUgYm94IHZhbHVlIGV4aXN0cywgZWxzZSBGYWxzZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGRvZXNfYm94X2dhbWVfc3RhdGVfZXhpc3QKICAgIGJ5dGVjXzAgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2RvZXNfYm94X2dhbWVfZ3JpZF9leGlzdF9yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo5Mi05MwogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBUcnVlIGlmIGdhbWUgZ3JpZCBib3ggdmFsdWUgZXhpc3RzLCBlbHNlIEZhbHNlCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwLTMxCiAgICAvLyAjIFNtYXJ0IGNvbnRyYWN0IGNsYXNzCiAgICAvLyBjbGFzcyBTYWx2byhBUkM0Q29udHJhY3QsIGF2bV92ZXJzaW9uPTExLCBzY3JhdGNoX3Nsb3RzPShjc3QuTUlNQ19DSEFJTl9TTE9ULCkpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjkyLTkzCiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIFRydWUgaWYgZ2FtZSBncmlkIGJveCB2YWx1ZSBleGlzdHMsIGVsc2UgRmFsc2UKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBkb2VzX2JveF9nYW1lX2dyaWRfZXhpc3QKICAgIGJ5dGVjXzAgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2RvZXNfYm94X3VzZXJfcmVnaXN0cnlfZXhpc3Rfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4Ny04OAogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBUcnVlIGlmIHVzZXIgcmVnaXN0cnkgYm94IHZhbHVlIGV4aXN0cywgZWxzZSBGYWxzZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSwgc2NyYXRjaF9zbG90cz0oY3N0Lk1JTUNfQ0hBSU5fU0xPVCwpKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODctODgKICAgIC8vICMgUkVBRC1PTkxZOiBSZXR1cm4gVHJ1ZSBpZiB1c2VyIHJlZ2lzdHJ5IGJveCB2YWx1ZSBleGlzdHMsIGVsc2UgRmFsc2UKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBkb2VzX2JveF91c2VyX3JlZ2lzdHJ5X2V4aXN0CiAgICBieXRlY18wIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZWFkX2dyaWRfY2VsbF92YWx1ZV9hdF9jb29yZHNfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3Ny03OAogICAgLy8gIyBSRUFELU9OTFk6IFJlYWQgZ2FtZSBncmlkIGNlbGwgdmFsdWUgYXQgeCBhbmQgeSBjb29yZGluYXRlcyB1bmRlciB0aGUgZ2l2ZW4gZ2FtZSBpZCBrZXkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAtMzEKICAgIC8vICMgU21hcnQgY29udHJhY3QgY2xhc3MKICAgIC8vIGNsYXNzIFNhbHZvKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTEsIHNjcmF0Y2hfc2xvdHM9KGNzdC5NSU1DX0NIQUlOX1NMT1QsKSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzctNzgKICAgIC8vICMgUkVBRC1PTkxZOiBSZWFkIGdhbWUgZ3JpZCBjZWxsIHZhbHVlIGF0IHggYW5kIHkgY29vcmRpbmF0ZXMgdW5kZXIgdGhlIGdpdmVuIGdhbWUgaWQga2V5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgcmVhZF9ncmlkX2NlbGxfdmFsdWVfYXRfY29vcmRzCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3JlYWRfZ3JpZF9jZWxsX3ZhbHVlX2J5X2luZGV4X3JvdXRlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjktNzAKICAgIC8vICMgUkVBRC1PTkxZOiBSZWFkIGdhbWUgZ3JpZCBjZWxsIHZhbHVlIGF0IGFycmF5IGluZGV4IHVuZGVyIHRoZSBnaXZlbiBnYW1lIGlkIGtleQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSwgc2NyYXRjaF9zbG90cz0oY3N0Lk1JTUNfQ0hBSU5fU0xPVCwpKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2OS03MAogICAgLy8gIyBSRUFELU9OTFk6IFJlYWQgZ2FtZSBncmlkIGNlbGwgdmFsdWUgYXQgYXJyYXkgaW5kZXggdW5kZXIgdGhlIGdpdmVuIGdhbWUgaWQga2V5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgcmVhZF9ncmlkX2NlbGxfdmFsdWVfYnlfaW5kZXgKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fcmVhZF9nZW5fdW5peF9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjY0LTY1CiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIHRoZSBhcHAgZ2VuZXNpcyB0aW1lc3RhbXAgaW4gVW5peCBmb3JtYXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjcKICAgIC8vIHJldHVybiBUZW1wbGF0ZVZhcltVSW50NjRdKCJHRU5fVU5JWCIpCiAgICBpbnRjIDggLy8gVE1QTF9HRU5fVU5JWAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjY0LTY1CiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIHRoZSBhcHAgZ2VuZXNpcyB0aW1lc3RhbXAgaW4gVW5peCBmb3JtYXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jYWxjX3NpbmdsZV9ib3hfY29zdF9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjUwLTUxCiAgICAvLyAjIFJFQUQtT05MWTogQ2FsY3VsYXRlIHRoZSBtaW5pbXVtIGJhbGFuY2UgcmVxdWlyZW1lbnQgKE1CUikgY29zdCBmb3Igc3RvcmluZyBhIHNpbmdsZSBib3ggdW5pdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMC0zMQogICAgLy8gIyBTbWFydCBjb250cmFjdCBjbGFzcwogICAgLy8gY2xhc3MgU2Fsdm8oQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMSwgc2NyYXRjaF9zbG90cz0oY3N0Lk1JTUNfQ0hBSU5fU0xPVCwpKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1MC01MQogICAgLy8gIyBSRUFELU9OTFk6IENhbGN1bGF0ZSB0aGUgbWluaW11bSBiYWxhbmNlIHJlcXVpcmVtZW50IChNQlIpIGNvc3QgZm9yIHN0b3JpbmcgYSBzaW5nbGUgYm94IHVuaXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBjYWxjX3NpbmdsZV9ib3hfY29zdAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIF9wdXlhX2xpYi51dGlsLmVuc3VyZV9idWRnZXQocmVxdWlyZWRfYnVkZ2V0OiB1aW50NjQsIGZlZV9zb3VyY2U6IHVpbnQ2NCkgLT4gdm9pZDoKZW5zdXJlX2J1ZGdldDoKICAgIHByb3RvIDIgMAogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICArCgplbnN1cmVfYnVkZ2V0X3doaWxlX3RvcEAxOgogICAgZnJhbWVfZGlnIDAKICAgIGdsb2JhbCBPcGNvZGVCdWRnZXQKICAgID4KICAgIGJ6IGVuc3VyZV9idWRnZXRfYWZ0ZXJfd2hpbGVANwogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgaXR4bl9maWVsZCBPbkNvbXBsZXRpb24KICAgIGJ5dGVjIDE2IC8vIDB4MDY4MTAxCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbQogICAgYnl0ZWMgMTYgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW0KICAgIGZyYW1lX2RpZyAtMQogICAgc3dpdGNoIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMEAzIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMUA0CgplbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlX25leHRANjoKICAgIGl0eG5fc3VibWl0CiAgICBiIGVuc3VyZV9idWRnZXRfd2hpbGVfdG9wQDEKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMUA0OgogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgaXR4bl9maWVsZCBGZWUKICAgIGIgZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV9uZXh0QDYKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMEAzOgogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBiIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfbmV4dEA2CgplbnN1cmVfYnVkZ2V0X2FmdGVyX3doaWxlQDc6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uc3Vicm91dGluZXMuYXNzZXJ0X2Nvb3Jkc19pbl9yYW5nZShyb3c6IGJ5dGVzLCBjb2w6IGJ5dGVzKSAtPiB2b2lkOgphc3NlcnRfY29vcmRzX2luX3JhbmdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI1LTI3CiAgICAvLyAjIFJldXNhYmxlIGFzc2VydCBmdW5jdGlvbjogRmFpbCB0cmFuc2FjdGlvbiBpZiByb3cgYW5kIGNvbCB2YWx1ZXMgYXJlIG91dCBvZiBib3VuZHMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYXNzZXJ0X2Nvb3Jkc19pbl9yYW5nZShyb3c6IGFyYzQuVUludDgsIGNvbDogYXJjNC5VSW50OCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI4CiAgICAvLyBhc3NlcnQgcm93IDwgY3N0LkdSSURfU0laRSBhbmQgY29sIDwgY3N0LkdSSURfU0laRSwgZXJyLklOVkFMSURfUE9TX0NPT1JEUwogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoYnl0ZXMgMHgwYgogICAgYjwKICAgIGJ6IGFzc2VydF9jb29yZHNfaW5fcmFuZ2VfYm9vbF9mYWxzZUAzCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hieXRlcyAweDBiCiAgICBiPAogICAgYnogYXNzZXJ0X2Nvb3Jkc19pbl9yYW5nZV9ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCgphc3NlcnRfY29vcmRzX2luX3JhbmdlX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyOAogICAgLy8gYXNzZXJ0IHJvdyA8IGNzdC5HUklEX1NJWkUgYW5kIGNvbCA8IGNzdC5HUklEX1NJWkUsIGVyci5JTlZBTElEX1BPU19DT09SRFMKICAgIGFzc2VydCAvLyBJbnZhbGlkIHBvc2l0aW9uIGNvb3JkaW5hdGVzLiBFbnN1cmUgYm9oIHJvdyBhbmQgY29sdW1uIGluZGljZXMgYXJlIHdpdGhpbiB2YWxpZCByYW5nZS4KICAgIHJldHN1YgoKYXNzZXJ0X2Nvb3Jkc19pbl9yYW5nZV9ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzAgLy8gMAogICAgYiBhc3NlcnRfY29vcmRzX2luX3JhbmdlX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5zdWJyb3V0aW5lcy5jb252ZXJ0X2dyaWRfY29vcmRzX3RvX2luZGV4KHJvdzogYnl0ZXMsIGNvbDogYnl0ZXMpIC0+IGJ5dGVzOgpjb252ZXJ0X2dyaWRfY29vcmRzX3RvX2luZGV4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI3OC0yODAKICAgIC8vICMgQ29udmVydCBnYW1lIGdyaWQgcm93IGFuZCBjb2wgY29vcmRzIHRvIHRoZWlyIGVxdWl2YWxlbnQgYXJyYXkgaW5kZXgKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY29udmVydF9ncmlkX2Nvb3Jkc190b19pbmRleChyb3c6IGFyYzQuVUludDgsIGNvbDogYXJjNC5VSW50OCkgLT4gYXJjNC5VSW50ODoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI4MwogICAgLy8gcm93Lm5hdGl2ZSAqIGNzdC5HUklEX1NJWkUgKyBjb2wubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIHB1c2hpbnQgMTEgLy8gMTEKICAgICoKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI4Ni0yODcKICAgIC8vICMgUmV0dXJuIGluZGV4IHZhbHVlIHdyYXBwZWQgaW4gYW4gVUludDggZGF0YSB0eXBlCiAgICAvLyByZXR1cm4gYXJjNC5VSW50OChpKQogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLnN1YnJvdXRpbmVzLmdldF9ncmlkX2NlbGxfdmFsdWUoZ2FtZV9pZDogdWludDY0LCBib3hfZ2FtZV9ncmlkOiBieXRlcywgaTogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfZ3JpZF9jZWxsX3ZhbHVlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI5MC0yOTQKICAgIC8vICMgR2V0IHRoZSB2YWx1ZSBvZiBhIGdyaWQgY2VsbCBhdCB0aGUgZXF1aXZhbGVudCBmbGF0dGVuZWQgMUQgYXJyYXkgaW5kZXgKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X2dyaWRfY2VsbF92YWx1ZSgKICAgIC8vICAgICBnYW1lX2lkOiBVSW50NjQsIGJveF9nYW1lX2dyaWQ6IEJveE1hcFtVSW50NjQsIHRhLkdhbWVHcmlkXSwgaTogYXJjNC5VSW50OAogICAgLy8gKSAtPiBhcmM0LlVJbnQ4OgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6Mjk1LTI5NgogICAgLy8gIyBGYWlsIHRyYW5zYWN0aW9uIHVubGVzcyB0aGUgYXNzZXJ0aW9uIGJlbG93IGV2YWx1YXRlcyBUcnVlCiAgICAvLyBhc3NlcnQgZ2FtZV9pZCBpbiBib3hfZ2FtZV9ncmlkLCBlcnIuR0FNRV9JRF9OT1RfRk9VTkQKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gR2FtZSBJRCBub3QgZm91bmQuIEVuc3VyZSB0aGUgZ2FtZSB3YXMgY3JlYXRlZCBhbmQgc3RpbGwgZXhpc3RzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI5NwogICAgLy8gYXNzZXJ0IGkubmF0aXZlIDwgY3N0LkdSSURfQ0VMTF9UT1RBTCwgZXJyLklOVkFMSURfUE9TX0lOREVYCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGR1cAogICAgcHVzaGludCAxMjEgLy8gMTIxCiAgICA8CiAgICBhc3NlcnQgLy8gSW52YWxpZCBwb3NpdGlvbiBpbmRleC4gRW5zdXJlIGluZGV4IHZhbHVlIGlzIHdpdGhpbiB2YWxpZCByYW5nZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozMDEKICAgIC8vIHBhY2tlZCA9IGdhbWVfZ3JpZF9icmVmLmV4dHJhY3QoaS5uYXRpdmUgLy8gY3N0LkdSSURfQ0VMTFNfUEVSX0JZVEUsIDEpCiAgICBkdXAKICAgIGludGNfMiAvLyA0CiAgICAvCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjMwMgogICAgLy8gcmV0dXJuIGFyYzQuVUludDgodW5wYWNrX2dyaWRfY2VsbChvcC5idG9pKHBhY2tlZCksIGkubmF0aXZlKSkKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxMTQKICAgIC8vIGNzdC5HUklEX0NFTExTX1BFUl9CWVRFIC0gMSAtIGkgJSBjc3QuR1JJRF9DRUxMU19QRVJfQllURQogICAgc3dhcAogICAgaW50Y18yIC8vIDQKICAgICUKICAgIHB1c2hpbnQgMyAvLyAzCiAgICBzd2FwCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTE1CiAgICAvLyApICogY3N0LkdSSURfQ0VMTF9CSVRTCiAgICBpbnRjXzMgLy8gMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjExMy0xMTUKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgY3N0LkdSSURfQ0VMTFNfUEVSX0JZVEUgLSAxIC0gaSAlIGNzdC5HUklEX0NFTExTX1BFUl9CWVRFCiAgICAvLyApICogY3N0LkdSSURfQ0VMTF9CSVRTCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTIxCiAgICAvLyByZXR1cm4gKHBhY2tlZCA+PiBncmlkX2NlbGxfc2hpZnQoaSkpICYgY3N0LkdSSURfQ0VMTF9NQVNLCiAgICBzaHIKICAgIHB1c2hpbnQgMyAvLyAzCiAgICAmCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MzAyCiAgICAvLyByZXR1cm4gYXJjNC5VSW50OCh1bnBhY2tfZ3JpZF9jZWxsKG9wLmJ0b2kocGFja2VkKSwgaS5uYXRpdmUpKQogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLnN1YnJvdXRpbmVzLmNvbXB1dGVfZ3JpZF9yb290KGk6IHVpbnQ2NCwgbGVhZjogYnl0ZXMsIHByb29mOiBieXRlcykgLT4gYnl0ZXMsIGJ5dGVzOgpjb21wdXRlX2dyaWRfcm9vdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozMTktMzIxCiAgICAvLyAjIEhhc2ggYSBncmlkIE1lcmtsZSBsZWFmIHVwIHRvIHRoZSByb290LCBvbmUgYG9wLm1pbWNgIG9mIHR3byBub2RlcyBwZXIgbGV2ZWwKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY29tcHV0ZV9ncmlkX3Jvb3QoaTogVUludDY0LCBsZWFmOiBCeXRlcywgcHJvb2Y6IHRhLkdyaWRNZXJrbGVQcm9vZikgLT4gQnl0ZXM6CiAgICBwcm90byAzIDIKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9kaWcgLTIKCmNvbXB1dGVfZ3JpZF9yb290X2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozMjMKICAgIC8vIGZvciBzaWJsaW5nIGluIHByb29mOgogICAgZnJhbWVfZGlnIDAKICAgIHB1c2hpbnQgNyAvLyA3CiAgICA8CiAgICBieiBjb21wdXRlX2dyaWRfcm9vdF9hZnRlcl9mb3JANwogICAgZnJhbWVfZGlnIDAKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgICoKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgcHVzaGludCAzMiAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MzI0LTMyNQogICAgLy8gIyBUaGUgbG93ZXN0IGluZGV4IGJpdCB0ZWxscyBpZiB0aGUgbm9kZSBpcyB0aGUgbGVmdCBvciB0aGUgcmlnaHQgY2hpbGQgb2YgaXRzIHBhcmVudAogICAgLy8gaWYgaSAlIDIgPT0gMDoKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18zIC8vIDIKICAgICUKICAgIGJueiBjb21wdXRlX2dyaWRfcm9vdF9lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjMyNgogICAgLy8gbm9kZSA9IG9wLm1pbWMob3AuTWlNQ0NvbmZpZ3VyYXRpb25zLkJMUzEyXzM4MU1wMTExLCBub2RlICsgc2libGluZy5ieXRlcykKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIG1pbWMgQkxTMTJfMzgxTXAxMTEKICAgIGZyYW1lX2J1cnkgMQoKY29tcHV0ZV9ncmlkX3Jvb3RfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjMyOQogICAgLy8gaSAvLz0gMgogICAgZnJhbWVfZGlnIC0zCiAgICBpbnRjXzMgLy8gMgogICAgLwogICAgZnJhbWVfYnVyeSAtMwogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDAKICAgIGIgY29tcHV0ZV9ncmlkX3Jvb3RfZm9yX2hlYWRlckAxCgpjb21wdXRlX2dyaWRfcm9vdF9lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozMjgKICAgIC8vIG5vZGUgPSBvcC5taW1jKG9wLk1pTUNDb25maWd1cmF0aW9ucy5CTFMxMl8zODFNcDExMSwgc2libGluZy5ieXRlcyArIG5vZGUpCiAgICBmcmFtZV9kaWcgMQogICAgY29uY2F0CiAgICBtaW1jIEJMUzEyXzM4MU1wMTExCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgY29tcHV0ZV9ncmlkX3Jvb3RfYWZ0ZXJfaWZfZWxzZUA1Cgpjb21wdXRlX2dyaWRfcm9vdF9hZnRlcl9mb3JANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozMzAKICAgIC8vIHJldHVybiBub2RlCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIC0xCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLnN1YnJvdXRpbmVzLmFwcGx5X2dyaWRfcm9vdF9jaGFuZ2Uocm9vdDogYnl0ZXMsIGk6IHVpbnQ2NCwgb2xkX3ZhbHVlOiB1aW50NjQsIG5ld192YWx1ZTogdWludDY0LCBwcm9vZjogYnl0ZXMpIC0+IGJ5dGVzLCBieXRlczoKYXBwbHlfZ3JpZF9yb290X2NoYW5nZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozMzMtMzQyCiAgICAvLyAjIFJlcGxhY2UgYSBncmlkIGNlbGwgbGVhZiBpbiBhIGdyaWQgcm9vdCwgYWZ0ZXIgcHJvdmluZyBpdHMgb2xkIHZhbHVlIGFnYWluc3QgdGhlIHJvb3QKICAgIC8vICMgUmV0dXJuIHRoZSBuZXcgcm9vdCwgY29tcHV0ZWQgdy8gdGhlIHNhbWUgc2libGluZ3MgYXMgdGhlIG9sZCB2YWx1ZSBwYXRoCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGFwcGx5X2dyaWRfcm9vdF9jaGFuZ2UoCiAgICAvLyAgICAgcm9vdDogQnl0ZXMsCiAgICAvLyAgICAgaTogVUludDY0LAogICAgLy8gICAgIG9sZF92YWx1ZTogVUludDY0LAogICAgLy8gICAgIG5ld192YWx1ZTogVUludDY0LAogICAgLy8gICAgIHByb29mOiB0YS5HcmlkTWVya2xlUHJvb2YsCiAgICAvLyApIC0+IEJ5dGVzOgogICAgcHJvdG8gNSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MzQ1CiAgICAvLyBjb21wdXRlX2dyaWRfcm9vdChpLCB1OF90b19mcjMyKGFyYzQuVUludDgob2xkX3ZhbHVlKSksIHByb29mKSA9PSByb290CiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA3IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxNzgtMTc5CiAgICAvLyAjIFJldHVybiBiaWctZW5kaWFuIGJ5dGUgYXJyYXkgKEFWTSB0eXBlOiBCeXRlcyksIFVJbnQ4IGxlZnQtcGFkZGVkIHcvIHplcm9zIHRvIG1hdGNoIDMyLWJ5dGUgc2NhbGFyIGZvcm1hdAogICAgLy8gcmV0dXJuIG9wLmJ6ZXJvKDMxKSArIHUuYnl0ZXMKICAgIHB1c2hpbnQgMzEgLy8gMzEKICAgIGJ6ZXJvCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MzQ1CiAgICAvLyBjb21wdXRlX2dyaWRfcm9vdChpLCB1OF90b19mcjMyKGFyYzQuVUludDgob2xkX3ZhbHVlKSksIHByb29mKSA9PSByb290CiAgICBmcmFtZV9kaWcgLTQKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBjb21wdXRlX2dyaWRfcm9vdAogICAgZnJhbWVfYnVyeSAtMQogICAgZnJhbWVfZGlnIC01CiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjM0My0zNDYKICAgIC8vICMgRmFpbCB0cmFuc2FjdGlvbiB1bmxlc3MgdGhlIGFzc2VydGlvbiBiZWxvdyBldmFsdWF0ZXMgVHJ1ZQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBjb21wdXRlX2dyaWRfcm9vdChpLCB1OF90b19mcjMyKGFyYzQuVUludDgob2xkX3ZhbHVlKSksIHByb29mKSA9PSByb290CiAgICAvLyApLCBlcnIuSU5WQUxJRF9HUklEX1BST09GCiAgICBhc3NlcnQgLy8gSW52YWxpZCBncmlkIHByb29mLiBFbnN1cmUgdGhlIE1lcmtsZSBwcm9vZiBtYXRjaGVzIHRoZSBjdXJyZW50IGdyaWQgY2VsbCB2YWx1ZSBhbmQgcm9vdC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozNDcKICAgIC8vIHJldHVybiBjb21wdXRlX2dyaWRfcm9vdChpLCB1OF90b19mcjMyKGFyYzQuVUludDgobmV3X3ZhbHVlKSksIHByb29mKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTc4LTE3OQogICAgLy8gIyBSZXR1cm4gYmlnLWVuZGlhbiBieXRlIGFycmF5IChBVk0gdHlwZTogQnl0ZXMpLCBVSW50OCBsZWZ0LXBhZGRlZCB3LyB6ZXJvcyB0byBtYXRjaCAzMi1ieXRlIHNjYWxhciBmb3JtYXQKICAgIC8vIHJldHVybiBvcC5iemVybygzMSkgKyB1LmJ5dGVzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozNDcKICAgIC8vIHJldHVybiBjb21wdXRlX2dyaWRfcm9vdChpLCB1OF90b19mcjMyKGFyYzQuVUludDgobmV3X3ZhbHVlKSksIHByb29mKQogICAgZnJhbWVfZGlnIC00CiAgICBzd2FwCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgY29tcHV0ZV9ncmlkX3Jvb3QKICAgIGR1cAogICAgZnJhbWVfYnVyeSAtMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLnN1YnJvdXRpbmVzLnNldF9ncmlkX2NlbGwoZ3JpZDogYnl0ZXMsIGk6IHVpbnQ2NCwgdmFsdWU6IHVpbnQ2NCkgLT4gYnl0ZXM6CnNldF9ncmlkX2NlbGw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MzgxLTM4MwogICAgLy8gIyBHZXQgYSBjb3B5IG9mIHRoZSBnYW1lIGdyaWQgYm94IGJ5dGVzIHcvIHRoZSBncmlkIGNlbGwgYXQgaW5kZXggaSBzZXQgdG8gdmFsdWUKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgc2V0X2dyaWRfY2VsbChncmlkOiBCeXRlcywgaTogVUludDY0LCB2YWx1ZTogVUludDY0KSAtPiBCeXRlczoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjM4NAogICAgLy8gYnl0ZV9pbmRleCA9IGkgLy8gY3N0LkdSSURfQ0VMTFNfUEVSX0JZVEUKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18yIC8vIDQKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxMTQKICAgIC8vIGNzdC5HUklEX0NFTExTX1BFUl9CWVRFIC0gMSAtIGkgJSBjc3QuR1JJRF9DRUxMU19QRVJfQllURQogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzIgLy8gNAogICAgJQogICAgcHVzaGludCAzIC8vIDMKICAgIHN3YXAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxMTUKICAgIC8vICkgKiBjc3QuR1JJRF9DRUxMX0JJVFMKICAgIGludGNfMyAvLyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTEzLTExNQogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBjc3QuR1JJRF9DRUxMU19QRVJfQllURSAtIDEgLSBpICUgY3N0LkdSSURfQ0VMTFNfUEVSX0JZVEUKICAgIC8vICkgKiBjc3QuR1JJRF9DRUxMX0JJVFMKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozODYKICAgIC8vIHBhY2tlZCA9IG9wLmdldGJ5dGUoZ3JpZCwgYnl0ZV9pbmRleCkKICAgIGZyYW1lX2RpZyAtMwogICAgZGlnIDIKICAgIGdldGJ5dGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozODcKICAgIC8vIHBhY2tlZCA9IChwYWNrZWQgJiB+KFVJbnQ2NChjc3QuR1JJRF9DRUxMX01BU0spIDw8IHNoaWZ0KSkgfCAodmFsdWUgPDwgc2hpZnQpCiAgICBwdXNoaW50IDMgLy8gMwogICAgZGlnIDIKICAgIHNobAogICAgfgogICAgJgogICAgZnJhbWVfZGlnIC0xCiAgICB1bmNvdmVyIDIKICAgIHNobAogICAgfAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjM4OAogICAgLy8gcmV0dXJuIG9wLnNldGJ5dGUoZ3JpZCwgYnl0ZV9pbmRleCwgcGFja2VkKQogICAgZnJhbWVfZGlnIC0zCiAgICBjb3ZlciAyCiAgICBzZXRieXRlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uc3Vicm91dGluZXMuZmluZF9jaGFyYWN0ZXJfYXQoY2hhcmFjdGVyczogYnl0ZXMsIHByZXNlbnQ6IHVpbnQ2NCwgaTogdWludDY0LCBza2lwX3Nsb3Q6IHVpbnQ2NCkgLT4gdWludDY0LCBieXRlczoKZmluZF9jaGFyYWN0ZXJfYXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MzkxLTM5NgogICAgLy8gIyBHZXQgdGhlIGxvYmJ5IHNsb3Qgb2YgdGhlIHByZXNlbnQgY2hhcmFjdGVyIHN0YW5kaW5nIG9uIGdyaWQgY2VsbCBpLCBvdGhlciB0aGFuIGBza2lwX3Nsb3RgCiAgICAvLyAjIFJldHVybiBNQVhfTE9CQllfU0laRSBpZiBubyBzdWNoIGNoYXJhY3RlciBleGlzdHMsIGBwcmVzZW50YCBpcyBhIGJpdG1hc2sgb2YgbG9iYnkgc2xvdHMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZmluZF9jaGFyYWN0ZXJfYXQoCiAgICAvLyAgICAgY2hhcmFjdGVyczogdGEuR2FtZUNoYXJhY3RlcnMsIHByZXNlbnQ6IFVJbnQ2NCwgaTogVUludDY0LCBza2lwX3Nsb3Q6IFVJbnQ2NAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byA0IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozOTcKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZShjc3QuTUFYX0xPQkJZX1NJWkUpOgogICAgaW50Y18wIC8vIDAKCmZpbmRfY2hhcmFjdGVyX2F0X2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozOTcKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZShjc3QuTUFYX0xPQkJZX1NJWkUpOgogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMiAvLyA0CiAgICA8CiAgICBieiBmaW5kX2NoYXJhY3Rlcl9hdF9hZnRlcl9mb3JAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjM5OQogICAgLy8gc2xvdCAhPSBza2lwX3Nsb3QKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgLTEKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6Mzk5LTQwMQogICAgLy8gc2xvdCAhPSBza2lwX3Nsb3QKICAgIC8vIGFuZCAocHJlc2VudCA+PiBzbG90KSAmIDEgPT0gMQogICAgLy8gYW5kIGNoYXJhY3RlcnNbc2xvdF0ucG9zaXRpb24ubmF0aXZlID09IGkKICAgIGJ6IGZpbmRfY2hhcmFjdGVyX2F0X2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjQwMAogICAgLy8gYW5kIChwcmVzZW50ID4+IHNsb3QpICYgMSA9PSAxCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAwCiAgICBzaHIKICAgIGludGNfMSAvLyAxCiAgICAmCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozOTktNDAxCiAgICAvLyBzbG90ICE9IHNraXBfc2xvdAogICAgLy8gYW5kIChwcmVzZW50ID4+IHNsb3QpICYgMSA9PSAxCiAgICAvLyBhbmQgY2hhcmFjdGVyc1tzbG90XS5wb3NpdGlvbi5uYXRpdmUgPT0gaQogICAgYnogZmluZF9jaGFyYWN0ZXJfYXRfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NDAxCiAgICAvLyBhbmQgY2hhcmFjdGVyc1tzbG90XS5wb3NpdGlvbi5uYXRpdmUgPT0gaQogICAgZnJhbWVfZGlnIDAKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICoKICAgIGZyYW1lX2RpZyAtNAogICAgc3dhcAogICAgcHVzaGludCA0MCAvLyA0MAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBpbnRjXzIgLy8gNAogICAgZ2V0Ynl0ZQogICAgZnJhbWVfZGlnIC0yCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjM5OS00MDEKICAgIC8vIHNsb3QgIT0gc2tpcF9zbG90CiAgICAvLyBhbmQgKHByZXNlbnQgPj4gc2xvdCkgJiAxID09IDEKICAgIC8vIGFuZCBjaGFyYWN0ZXJzW3Nsb3RdLnBvc2l0aW9uLm5hdGl2ZSA9PSBpCiAgICBieiBmaW5kX2NoYXJhY3Rlcl9hdF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo0MDMKICAgIC8vIHJldHVybiBzbG90CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIC00CiAgICB1bmNvdmVyIDIKICAgIHJldHN1YgoKZmluZF9jaGFyYWN0ZXJfYXRfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjM5NwogICAgLy8gZm9yIHNsb3QgaW4gdXJhbmdlKGNzdC5NQVhfTE9CQllfU0laRSk6CiAgICBmcmFtZV9kaWcgMAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMAogICAgYiBmaW5kX2NoYXJhY3Rlcl9hdF9mb3JfaGVhZGVyQDEKCmZpbmRfY2hhcmFjdGVyX2F0X2FmdGVyX2ZvckA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjQwNAogICAgLy8gcmV0dXJuIFVJbnQ2NChjc3QuTUFYX0xPQkJZX1NJWkUpCiAgICBpbnRjXzIgLy8gNAogICAgZnJhbWVfZGlnIC00CiAgICB1bmNvdmVyIDIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5zdWJyb3V0aW5lcy5jaGVja19hY2NfaW5fZ2FtZShnYW1lX2lkOiB1aW50NjQsIGFjY291bnQ6IGJ5dGVzLCBib3hfZ2FtZV9sb2JieTogYnl0ZXMsIGxvYmJ5X3Nsb3Q6IHVpbnQ2NCwgY2xlYXJfcGxheWVyOiB1aW50NjQpIC0+IHVpbnQ2NDoKY2hlY2tfYWNjX2luX2dhbWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NDY2LTQ3NAogICAgLy8gIyBDaGVjayBpZiBhY2NvdW50IGlzIGFuIGFjdGl2ZSBwbGF5ZXIgb2YgYSBnYW1lLCByZWFkaW5nIG9ubHkgaXRzIGxvYmJ5IHNsb3QKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY2hlY2tfYWNjX2luX2dhbWUoCiAgICAvLyAgICAgZ2FtZV9pZDogVUludDY0LAogICAgLy8gICAgIGFjY291bnQ6IEFjY291bnQsCiAgICAvLyAgICAgYm94X2dhbWVfbG9iYnk6IEJveE1hcFtVSW50NjQsIEJ5dGVzXSwKICAgIC8vICAgICBsb2JieV9zbG90OiBVSW50NjQsCiAgICAvLyAgICAgY2xlYXJfcGxheWVyOiBib29sLCAgIyBub3FhOiBGQlQwMDEKICAgIC8vICkgLT4gYm9vbDoKICAgIHByb3RvIDUgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjQ3NS00NzYKICAgIC8vICMgQ2FsY3VsYXRlIHRoZSBzdGFydCBpbmRleCBvZiB0aGUgcGxheWVyIGFkZHJlc3MgZnJvbSBpdHMgbG9iYnkgc2xvdCBhbmQgYWRkcmVzcyBzaXplCiAgICAvLyBzdGFydCA9IGxvYmJ5X3Nsb3QgKiBjc3QuQUREUkVTU19TSVpFCiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgICoKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjQ3OC00NzkKICAgIC8vICMgUmVmZXJlbmNlIHRoZSBnYW1lIGxvYmJ5IGJveCBkaXJlY3RseSwgc28gb25seSB0aGUgMzIgYnl0ZXMgYXQgdGhlIHNsb3QgYXJlIHJlYWQKICAgIC8vIGdhbWVfbG9iYnlfYnJlZiA9IEJveFJlZihrZXk9Ym94X2dhbWVfbG9iYnkua2V5X3ByZWZpeCArIG9wLml0b2IoZ2FtZV9pZCkpCiAgICBmcmFtZV9kaWcgLTUKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjQ4MS00ODIKICAgIC8vICMgQSBzbG90IHBhc3QgdGhlIGVuZCBvZiB0aGUgbG9iYnkgYm94IGNhbiBub3QgaG9sZCB0aGUgYWNjb3VudAogICAgLy8gaWYgc3RhcnQgKyBjc3QuQUREUkVTU19TSVpFID4gZ2FtZV9sb2JieV9icmVmLmxlbmd0aDoKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgICsKICAgIHN3YXAKICAgIGJveF9sZW4KICAgIGFzc2VydCAvLyBjaGVjayBCb3hSZWYgZXhpc3RzCiAgICA+CiAgICBieiBjaGVja19hY2NfaW5fZ2FtZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo0ODMKICAgIC8vIHJldHVybiBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpjaGVja19hY2NfaW5fZ2FtZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NDg1LTQ4NgogICAgLy8gIyBDaGVjayBpZiB0aGUgMzItYnl0ZSBwbGF5ZXIgYWRkcmVzcyBhdCB0aGUgc2xvdCBtYXRjaGVzIHVwIHdpdGggdGhlIGFjY291bnQgYnl0ZXMKICAgIC8vIGlmIGdhbWVfbG9iYnlfYnJlZi5leHRyYWN0KHN0YXJ0LCBjc3QuQUREUkVTU19TSVpFKSAhPSBhY2NvdW50LmJ5dGVzOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICBib3hfZXh0cmFjdAogICAgZnJhbWVfZGlnIC00CiAgICAhPQogICAgYnogY2hlY2tfYWNjX2luX2dhbWVfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NDg3CiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKY2hlY2tfYWNjX2luX2dhbWVfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjQ4OS00OTAKICAgIC8vICMgT3B0aW9uYWxseSwgY2xlYXIgdGhpcyBwbGF5ZXIgZnJvbSB0aGUgYm94IGJ5IHJlcGxhY2luZyB0aGVpciBhZGRyZXNzIHdpdGggemVybyBieXRlcwogICAgLy8gaWYgY2xlYXJfcGxheWVyOgogICAgZnJhbWVfZGlnIC0xCiAgICBieiBjaGVja19hY2NfaW5fZ2FtZV9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo0OTEKICAgIC8vIGdhbWVfbG9iYnlfYnJlZi5yZXBsYWNlKHN0YXJ0LCBjc3QuWkVST0VEX0FERFJfQllURVMpCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIGJ5dGVjIDkgLy8gMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICBib3hfcmVwbGFjZQoKY2hlY2tfYWNjX2luX2dhbWVfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjQ5My00OTQKICAgIC8vICMgQWNjb3VudCB3YXMgZm91bmQgaW4gdGhlIGdhbWUKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uc3Vicm91dGluZXMuZ2V0X3N0YWtlX3RpZXIoYW1vdW50OiB1aW50NjQpIC0+IHVpbnQ2NDoKZ2V0X3N0YWtlX3RpZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTI5LTUzMQogICAgLy8gIyBHZXQgdGhlIHN0YWtlIHRpZXIgb2YgYSBzdGFrZSBhbW91bnQsIGZyb20gMCB1cCB0byBTVEFLRV9USUVSX0NPVU5UIC0gMQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfc3Rha2VfdGllcihhbW91bnQ6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTMyCiAgICAvLyBpZiBhbW91bnQgPj0gY3N0LlNUQUtFX1RJRVJfMzoKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAyMDAwMDAwMDAgLy8gMjAwMDAwMDAwCiAgICA+PQogICAgYnogZ2V0X3N0YWtlX3RpZXJfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTMzCiAgICAvLyByZXR1cm4gVUludDY0KDMpCiAgICBwdXNoaW50IDMgLy8gMwogICAgcmV0c3ViCgpnZXRfc3Rha2VfdGllcl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTM0CiAgICAvLyBpZiBhbW91bnQgPj0gY3N0LlNUQUtFX1RJRVJfMjoKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA1MDAwMDAwMCAvLyA1MDAwMDAwMAogICAgPj0KICAgIGJ6IGdldF9zdGFrZV90aWVyX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjUzNQogICAgLy8gcmV0dXJuIFVJbnQ2NCgyKQogICAgaW50Y18zIC8vIDIKICAgIHJldHN1YgoKZ2V0X3N0YWtlX3RpZXJfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjUzNgogICAgLy8gaWYgYW1vdW50ID49IGNzdC5TVEFLRV9USUVSXzE6CiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMTAwMDAwMDAgLy8gMTAwMDAwMDAKICAgID49CiAgICBieiBnZXRfc3Rha2VfdGllcl9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo1MzcKICAgIC8vIHJldHVybiBVSW50NjQoMSkKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCmdldF9zdGFrZV90aWVyX2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo1MzgKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uc3Vicm91dGluZXMuYWRkX29wZW5fbG9iYnkoYm94X29wZW5fbG9iYmllczogYnl0ZXMsIGJ1Y2tldDogdWludDY0LCBnYW1lX2lkOiB1aW50NjQpIC0+IHVpbnQ2NDoKYWRkX29wZW5fbG9iYnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTQ3LTU1MwogICAgLy8gIyBBcHBlbmQgYSBnYW1lIGlkIHRvIGFuIG9wZW4gbG9iYnkgaW5kZXggYnVja2V0LCByZXR1cm4gVHJ1ZSBpZiB0aGUgZ2FtZSBnb3QgbGlzdGVkCiAgICAvLyAjIEdhbWVzIHdob3NlIGJ1Y2tldCBib3ggd2FzIG5vdCBjcmVhdGVkIHlldCwgb3IgaXMgZnVsbCwgYXJlIG5vdCBsaXN0ZWQ7IGNhbGxlcnMgcmVjb3JkIHRoZSBmbGFnCiAgICAvLyAjIGluIGBHYW1lU3RhdGUub3Blbl9sb2JieV9saXN0ZWRgLCBzbyBvbmx5IGxpc3RlZCBnYW1lcyBhcmUgZXZlciByZW1vdmVkIGFnYWluCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGFkZF9vcGVuX2xvYmJ5KAogICAgLy8gICAgIGJveF9vcGVuX2xvYmJpZXM6IEJveE1hcFtVSW50NjQsIEJ5dGVzXSwgYnVja2V0OiBVSW50NjQsIGdhbWVfaWQ6IFVJbnQ2NAogICAgLy8gKSAtPiBib29sOgogICAgcHJvdG8gMyAxCiAgICBieXRlY18zIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTU0CiAgICAvLyBpZiBidWNrZXQgbm90IGluIGJveF9vcGVuX2xvYmJpZXM6CiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IGFkZF9vcGVuX2xvYmJ5X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjU1NQogICAgLy8gcmV0dXJuIEZhbHNlCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmFkZF9vcGVuX2xvYmJ5X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo1NTkKICAgIC8vIGNvdW50ID0gb3AuYnRvaShvcGVuX2xvYmJ5X2JyZWYuZXh0cmFjdCgwLCA4KSkKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGludCA4IC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjU2MAogICAgLy8gaWYgY291bnQgPj0gY3N0Lk9QRU5fTE9CQllfQ0FQQUNJVFk6CiAgICBwdXNoaW50IDY0IC8vIDY0CiAgICA+PQogICAgYnogYWRkX29wZW5fbG9iYnlfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTYxCiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKYWRkX29wZW5fbG9iYnlfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjU2MgogICAgLy8gb3Blbl9sb2JieV9icmVmLnJlcGxhY2UoY3N0Lk9QRU5fTE9CQllfSURTX09GRlNFVCArIGNvdW50ICogOCwgb3AuaXRvYihnYW1lX2lkKSkKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIHB1c2hpbnQgOCAvLyA4CiAgICAqCiAgICBwdXNoaW50IDggLy8gOAogICAgKwogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBjb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjU2MwogICAgLy8gb3Blbl9sb2JieV9icmVmLnJlcGxhY2UoMCwgb3AuaXRvYihjb3VudCArIDEpKQogICAgc3dhcAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjU2NAogICAgLy8gcmV0dXJuIFRydWUKICAgIGludGNfMSAvLyAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by5jYWxjX3NpbmdsZV9ib3hfY29zdChrZXlfc2l6ZTogYnl0ZXMsIHZhbHVlX3NpemU6IGJ5dGVzKSAtPiB1aW50NjQ6CmNhbGNfc2luZ2xlX2JveF9jb3N0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjUwLTU0CiAgICAvLyAjIFJFQUQtT05MWTogQ2FsY3VsYXRlIHRoZSBtaW5pbXVtIGJhbGFuY2UgcmVxdWlyZW1lbnQgKE1CUikgY29zdCBmb3Igc3RvcmluZyBhIHNpbmdsZSBib3ggdW5pdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgY2FsY19zaW5nbGVfYm94X2Nvc3QoCiAgICAvLyAgICAgc2VsZiwga2V5X3NpemU6IGFyYzQuVUludDgsIHZhbHVlX3NpemU6IGFyYzQuVUludDE2CiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU4CiAgICAvLyBrZXlfc2l6ZS5uYXRpdmUgKyB2YWx1ZV9zaXplLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1NwogICAgLy8gc2l6ZV9jb3N0ID0gYXJjNC5VSW50MTYoNDAwKS5uYXRpdmUgKiAoCiAgICBwdXNoaW50IDQwMCAvLyA0MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1Ny01OQogICAgLy8gc2l6ZV9jb3N0ID0gYXJjNC5VSW50MTYoNDAwKS5uYXRpdmUgKiAoCiAgICAvLyAgICAga2V5X3NpemUubmF0aXZlICsgdmFsdWVfc2l6ZS5uYXRpdmUKICAgIC8vICkgICMgU2l6ZSBmZWUgKDQwMCBwZXIgYnl0ZSAqIChsZW4oa2V5KStsZW4odmFsdWUpKSkKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2MS02MgogICAgLy8gIyBSZXR1cm4gc2luZ2xlIGJveCB0b3RhbCBjb3N0IGFtb3VudAogICAgLy8gcmV0dXJuIGJhc2VfY29zdC5uYXRpdmUgKyBzaXplX2Nvc3QKICAgIHB1c2hpbnQgMjUwMCAvLyAyNTAwCiAgICArCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8ucmVhZF9ncmlkX2NlbGxfdmFsdWVfYnlfaW5kZXgoZ2FtZV9pZDogdWludDY0LCBpOiBieXRlcykgLT4gYnl0ZXM6CnJlYWRfZ3JpZF9jZWxsX3ZhbHVlX2J5X2luZGV4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjY5LTczCiAgICAvLyAjIFJFQUQtT05MWTogUmVhZCBnYW1lIGdyaWQgY2VsbCB2YWx1ZSBhdCBhcnJheSBpbmRleCB1bmRlciB0aGUgZ2l2ZW4gZ2FtZSBpZCBrZXkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIHJlYWRfZ3JpZF9jZWxsX3ZhbHVlX2J5X2luZGV4KAogICAgLy8gICAgIHNlbGYsIGdhbWVfaWQ6IFVJbnQ2NCwgaTogYXJjNC5VSW50OAogICAgLy8gKSAtPiBhcmM0LlVJbnQ4OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzQtNzUKICAgIC8vICMgUmV0dXJuIHRoZSB1bnBhY2tlZCB2YWx1ZSBhdCBncmlkIGNlbGwgaW5kZXgKICAgIC8vIHJldHVybiBzcnQuZ2V0X2dyaWRfY2VsbF92YWx1ZShnYW1lX2lkLCBzZWxmLmJveF9nYW1lX2dyaWQsIGkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ5dGVjIDYgLy8gImdfIgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGdldF9ncmlkX2NlbGxfdmFsdWUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by5yZWFkX2dyaWRfY2VsbF92YWx1ZV9hdF9jb29yZHMoZ2FtZV9pZDogdWludDY0LCB4OiBieXRlcywgeTogYnl0ZXMpIC0+IGJ5dGVzOgpyZWFkX2dyaWRfY2VsbF92YWx1ZV9hdF9jb29yZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzctODEKICAgIC8vICMgUkVBRC1PTkxZOiBSZWFkIGdhbWUgZ3JpZCBjZWxsIHZhbHVlIGF0IHggYW5kIHkgY29vcmRpbmF0ZXMgdW5kZXIgdGhlIGdpdmVuIGdhbWUgaWQga2V5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiByZWFkX2dyaWRfY2VsbF92YWx1ZV9hdF9jb29yZHMoCiAgICAvLyAgICAgc2VsZiwgZ2FtZV9pZDogVUludDY0LCB4OiBhcmM0LlVJbnQ4LCB5OiBhcmM0LlVJbnQ4CiAgICAvLyApIC0+IGFyYzQuVUludDg6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4NAogICAgLy8gZ2FtZV9pZCwgc2VsZi5ib3hfZ2FtZV9ncmlkLCBzcnQuY29udmVydF9ncmlkX2Nvb3Jkc190b19pbmRleCh4LCB5KQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgY29udmVydF9ncmlkX2Nvb3Jkc190b19pbmRleAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgyLTg1CiAgICAvLyAjIENvbnZlcnQgeCAmIHkgY29vcmRzIHRvIGdyaWQgY2VsbCBpbmRleCwgdGhlbiByZXR1cm4gYnl0ZSB2YWx1ZSBhdCB0aGF0IGluZGV4CiAgICAvLyByZXR1cm4gc3J0LmdldF9ncmlkX2NlbGxfdmFsdWUoCiAgICAvLyAgICAgZ2FtZV9pZCwgc2VsZi5ib3hfZ2FtZV9ncmlkLCBzcnQuY29udmVydF9ncmlkX2Nvb3Jkc190b19pbmRleCh4LCB5KQogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODQKICAgIC8vIGdhbWVfaWQsIHNlbGYuYm94X2dhbWVfZ3JpZCwgc3J0LmNvbnZlcnRfZ3JpZF9jb29yZHNfdG9faW5kZXgoeCwgeSkKICAgIGJ5dGVjIDYgLy8gImdfIgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgyLTg1CiAgICAvLyAjIENvbnZlcnQgeCAmIHkgY29vcmRzIHRvIGdyaWQgY2VsbCBpbmRleCwgdGhlbiByZXR1cm4gYnl0ZSB2YWx1ZSBhdCB0aGF0IGluZGV4CiAgICAvLyByZXR1cm4gc3J0LmdldF9ncmlkX2NlbGxfdmFsdWUoCiAgICAvLyAgICAgZ2FtZV9pZCwgc2VsZi5ib3hfZ2FtZV9ncmlkLCBzcnQuY29udmVydF9ncmlkX2Nvb3Jkc190b19pbmRleCh4LCB5KQogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIGdldF9ncmlkX2NlbGxfdmFsdWUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by5kb2VzX2JveF91c2VyX3JlZ2lzdHJ5X2V4aXN0KGFjY291bnQ6IGJ5dGVzKSAtPiB1aW50NjQ6CmRvZXNfYm94X3VzZXJfcmVnaXN0cnlfZXhpc3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODctODkKICAgIC8vICMgUkVBRC1PTkxZOiBSZXR1cm4gVHJ1ZSBpZiB1c2VyIHJlZ2lzdHJ5IGJveCB2YWx1ZSBleGlzdHMsIGVsc2UgRmFsc2UKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGRvZXNfYm94X3VzZXJfcmVnaXN0cnlfZXhpc3Qoc2VsZiwgYWNjb3VudDogQWNjb3VudCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjkwCiAgICAvLyByZXR1cm4gc2VsZi5ib3hfdXNlcl9yZWdpc3RyeS5tYXliZShhY2NvdW50KVsxXQogICAgYnl0ZWMgMTMgLy8gInJfIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGJ1cnkgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLmRvZXNfYm94X2dhbWVfZ3JpZF9leGlzdChnYW1lX2lkOiB1aW50NjQpIC0+IHVpbnQ2NDoKZG9lc19ib3hfZ2FtZV9ncmlkX2V4aXN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjkyLTk0CiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIFRydWUgaWYgZ2FtZSBncmlkIGJveCB2YWx1ZSBleGlzdHMsIGVsc2UgRmFsc2UKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGRvZXNfYm94X2dhbWVfZ3JpZF9leGlzdChzZWxmLCBnYW1lX2lkOiBVSW50NjQpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo5NQogICAgLy8gcmV0dXJuIHNlbGYuYm94X2dhbWVfZ3JpZC5tYXliZShnYW1lX2lkKVsxXQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlYyA2IC8vICJnXyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYnVyeSAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8uZG9lc19ib3hfZ2FtZV9zdGF0ZV9leGlzdChnYW1lX2lkOiB1aW50NjQpIC0+IHVpbnQ2NDoKZG9lc19ib3hfZ2FtZV9zdGF0ZV9leGlzdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo5Ny05OQogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBUcnVlIGlmIGdhbWUgc3RhdGUgYm94IHZhbHVlIGV4aXN0cywgZWxzZSBGYWxzZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZG9lc19ib3hfZ2FtZV9zdGF0ZV9leGlzdChzZWxmLCBnYW1lX2lkOiBVSW50NjQpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMDAKICAgIC8vIHJldHVybiBzZWxmLmJveF9nYW1lX3N0YXRlLm1heWJlKGdhbWVfaWQpWzFdCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gInNfIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBidXJ5IDEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by5kb2VzX2JveF9nYW1lX2NoYXJhY3RlcnNfZXhpc3QoZ2FtZV9pZDogdWludDY0KSAtPiB1aW50NjQ6CmRvZXNfYm94X2dhbWVfY2hhcmFjdGVyc19leGlzdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMDItMTA0CiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIFRydWUgaWYgZ2FtZSBjaGFyYWN0ZXJzIGJveCB2YWx1ZSBleGlzdHMsIGVsc2UgRmFsc2UKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGRvZXNfYm94X2dhbWVfY2hhcmFjdGVyc19leGlzdChzZWxmLCBnYW1lX2lkOiBVSW50NjQpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMDUKICAgIC8vIHJldHVybiBzZWxmLmJveF9nYW1lX2NoYXJhY3RlcnMubWF5YmUoZ2FtZV9pZClbMV0KICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAiY18iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGJ1cnkgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLnJlYWRfYm94X2dhbWVfY2hhcmFjdGVycyhnYW1lX2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpyZWFkX2JveF9nYW1lX2NoYXJhY3RlcnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTA3LTEwOQogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBldmVyeSBnYW1lIGNoYXJhY3RlciBvZiBhIGdhbWUsIGluZGV4ZWQgYnkgbG9iYnkgc2xvdCwgaW4gb25lIGJveCByZWFkCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiByZWFkX2JveF9nYW1lX2NoYXJhY3RlcnMoc2VsZiwgZ2FtZV9pZDogVUludDY0KSAtPiB0YS5HYW1lQ2hhcmFjdGVyczoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjExMC0xMTEKICAgIC8vICMgRmFpbCB0cmFuc2FjdGlvbiB1bmxlc3MgdGhlIGFzc2VydGlvbiBiZWxvdyBldmFsdWF0ZXMgVHJ1ZQogICAgLy8gYXNzZXJ0IGdhbWVfaWQgaW4gc2VsZi5ib3hfZ2FtZV9jaGFyYWN0ZXJzLCBlcnIuR0FNRV9JRF9OT1RfRk9VTkQKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAiY18iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gR2FtZSBJRCBub3QgZm91bmQuIEVuc3VyZSB0aGUgZ2FtZSB3YXMgY3JlYXRlZCBhbmQgc3RpbGwgZXhpc3RzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjExMwogICAgLy8gcmV0dXJuIHNlbGYuYm94X2dhbWVfY2hhcmFjdGVyc1tnYW1lX2lkXQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X2dhbWVfY2hhcmFjdGVycyBlbnRyeSBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by5kb2VzX2JveF9nYW1lX3JlY29yZF9leGlzdChnYW1lX2lkOiB1aW50NjQpIC0+IHVpbnQ2NDoKZG9lc19ib3hfZ2FtZV9yZWNvcmRfZXhpc3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTE1LTExNwogICAgLy8gIyBSRUFELU9OTFk6IFJldHVybiBUcnVlIGlmIHVuaWZpZWQgZ2FtZSByZWNvcmQgYm94IHZhbHVlIGV4aXN0cywgZWxzZSBGYWxzZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZG9lc19ib3hfZ2FtZV9yZWNvcmRfZXhpc3Qoc2VsZiwgZ2FtZV9pZDogVUludDY0KSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTE4CiAgICAvLyByZXR1cm4gc2VsZi5ib3hfZ2FtZV9yZWNvcmQubWF5YmUoZ2FtZV9pZClbMV0KICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgNyAvLyAibV8iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGJ1cnkgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLnJlYWRfZ2FtZV9yZWNvcmRfc3RhdGUoZ2FtZV9pZDogdWludDY0KSAtPiBieXRlczoKcmVhZF9nYW1lX3JlY29yZF9zdGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMjAtMTIyCiAgICAvLyAjIFJFQUQtT05MWTogUmVhZCB0aGUgZ2FtZSBzdGF0ZSBzZWN0aW9uIG9mIGEgdW5pZmllZCBnYW1lIHJlY29yZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgcmVhZF9nYW1lX3JlY29yZF9zdGF0ZShzZWxmLCBnYW1lX2lkOiBVSW50NjQpIC0+IHN0Yy5HYW1lU3RhdGU6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMjMtMTI0CiAgICAvLyAjIEZhaWwgdHJhbnNhY3Rpb24gdW5sZXNzIHRoZSBhc3NlcnRpb24gYmVsb3cgZXZhbHVhdGVzIFRydWUKICAgIC8vIGFzc2VydCBnYW1lX2lkIGluIHNlbGYuYm94X2dhbWVfcmVjb3JkLCBlcnIuR0FNRV9JRF9OT1RfRk9VTkQKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgNyAvLyAibV8iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gR2FtZSBJRCBub3QgZm91bmQuIEVuc3VyZSB0aGUgZ2FtZSB3YXMgY3JlYXRlZCBhbmQgc3RpbGwgZXhpc3RzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gZ2FtZV9yZWNvcmRfYnJlZi5leHRyYWN0KGNzdC5HQU1FX1JFQ09SRF9TVEFURV9PRkZTRVQsIGNzdC5HQU1FX1NUQVRFX1NJWkUpCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGludCA5NiAvLyA5NgogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMzAtMTMyCiAgICAvLyByZXR1cm4gc3RjLkdhbWVTdGF0ZS5mcm9tX2J5dGVzKAogICAgLy8gICAgIGdhbWVfcmVjb3JkX2JyZWYuZXh0cmFjdChjc3QuR0FNRV9SRUNPUkRfU1RBVEVfT0ZGU0VULCBjc3QuR0FNRV9TVEFURV9TSVpFKQogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLnJlYWRfZ2FtZV9yZWNvcmRfY2hhcmFjdGVyKGdhbWVfaWQ6IHVpbnQ2NCwgbG9iYnlfc2xvdDogYnl0ZXMpIC0+IGJ5dGVzOgpyZWFkX2dhbWVfcmVjb3JkX2NoYXJhY3RlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxMzQtMTM4CiAgICAvLyAjIFJFQUQtT05MWTogUmVhZCB0aGUgZ2FtZSBjaGFyYWN0ZXIgYXQgYSBsb2JieSBzbG90IG9mIGEgdW5pZmllZCBnYW1lIHJlY29yZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgcmVhZF9nYW1lX3JlY29yZF9jaGFyYWN0ZXIoCiAgICAvLyAgICAgc2VsZiwgZ2FtZV9pZDogVUludDY0LCBsb2JieV9zbG90OiBhcmM0LlVJbnQ4CiAgICAvLyApIC0+IHN0Yy5HYW1lQ2hhcmFjdGVyOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTM5LTE0MAogICAgLy8gIyBGYWlsIHRyYW5zYWN0aW9uIHVubGVzcyB0aGUgYXNzZXJ0aW9ucyBiZWxvdyBldmFsdWF0ZSBUcnVlCiAgICAvLyBhc3NlcnQgZ2FtZV9pZCBpbiBzZWxmLmJveF9nYW1lX3JlY29yZCwgZXJyLkdBTUVfSURfTk9UX0ZPVU5ECiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGVjIDcgLy8gIm1fIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIEdhbWUgSUQgbm90IGZvdW5kLiBFbnN1cmUgdGhlIGdhbWUgd2FzIGNyZWF0ZWQgYW5kIHN0aWxsIGV4aXN0cy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNDEKICAgIC8vIGFzc2VydCBsb2JieV9zbG90Lm5hdGl2ZSA8IGNzdC5NQVhfTE9CQllfU0laRSwgZXJyLlBMQVlFUl9OT1RfRk9VTkQKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgZHVwCiAgICBpbnRjXzIgLy8gNAogICAgPAogICAgYXNzZXJ0IC8vIFBsYXllciBub3QgZm91bmQuIEVuc3VyZSBwbGF5ZXIgYWRkcmVzcyBpcyBpbnNpZGUgdGhlIGdhbWUgbG9iYnkuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTA2CiAgICAvLyByZXR1cm4gY3N0LkdBTUVfUkVDT1JEX0NIQVJBQ1RFUlNfT0ZGU0VUICsgbG9iYnlfc2xvdCAqIGNzdC5HQU1FX0NIQVJBQ1RFUl9TSVpFCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICAqCiAgICBpbnRjIDQgLy8gMjU1CiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTUwCiAgICAvLyBjc3QuR0FNRV9DSEFSQUNURVJfU0laRSwKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNDgtMTUxCiAgICAvLyBnYW1lX3JlY29yZF9icmVmLmV4dHJhY3QoCiAgICAvLyAgICAgc3J0LmdhbWVfcmVjb3JkX2NoYXJhY3Rlcl9vZmZzZXQobG9iYnlfc2xvdC5uYXRpdmUpLAogICAgLy8gICAgIGNzdC5HQU1FX0NIQVJBQ1RFUl9TSVpFLAogICAgLy8gKQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNDctMTUyCiAgICAvLyByZXR1cm4gc3RjLkdhbWVDaGFyYWN0ZXIuZnJvbV9ieXRlcygKICAgIC8vICAgICBnYW1lX3JlY29yZF9icmVmLmV4dHJhY3QoCiAgICAvLyAgICAgICAgIHNydC5nYW1lX3JlY29yZF9jaGFyYWN0ZXJfb2Zmc2V0KGxvYmJ5X3Nsb3QubmF0aXZlKSwKICAgIC8vICAgICAgICAgY3N0LkdBTUVfQ0hBUkFDVEVSX1NJWkUsCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLnJlYWRfYm94X2dhbWVfbG9iYnkoZ2FtZV9pZDogdWludDY0KSAtPiBieXRlczoKcmVhZF9ib3hfZ2FtZV9sb2JieToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNTQtMTU2CiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIGFuIGFycmF5IG9mIGFsbCBhY3RpdmUgdXNlcnMgaW4gdGhlIGdhbWUgbG9iYnkgYXQgdGltZSBvZiBjYWxsCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiByZWFkX2JveF9nYW1lX2xvYmJ5KHNlbGYsIGdhbWVfaWQ6IFVJbnQ2NCkgLT4gdGEuR2FtZUxvYmJ5OgogICAgcHJvdG8gMSAxCiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTU3LTE1OAogICAgLy8gIyBGYWlsIHRyYW5zYWN0aW9uIHVubGVzcyB0aGUgYXNzZXJ0aW9uIGJlbG93IGV2YWx1YXRlcyBUcnVlCiAgICAvLyBhc3NlcnQgZ2FtZV9pZCBpbiBzZWxmLmJveF9nYW1lX2xvYmJ5LCBlcnIuR0FNRV9JRF9OT1RfRk9VTkQKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgOCAvLyAibF8iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gR2FtZSBJRCBub3QgZm91bmQuIEVuc3VyZSB0aGUgZ2FtZSB3YXMgY3JlYXRlZCBhbmQgc3RpbGwgZXhpc3RzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE2MC0xNjEKICAgIC8vICMgUmV0cmlldmUgYnl0ZSBhcnJheSBvZiBjdXJyZW50IHVzZXIgYWRkcmVzc2VzIGZyb20gdGhlIGJveCB1c2luZyB0aGUgZ2FtZSBpZCBwYXJhbWV0ZXIKICAgIC8vIGdhbWVfbG9iYnlfYl9hcnIgPSBzZWxmLmJveF9nYW1lX2xvYmJ5W2dhbWVfaWRdCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X2dhbWVfbG9iYnkgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTYzLTE2NAogICAgLy8gIyBEZWZpbmUgYSBkeW5hbWljIGFycmF5IHRvIGFwcGVuZCBhbGwgcmVtYWluaW5nIGFjdGl2ZSB1c2VycwogICAgLy8gdXNlcnNfaW5fbG9iYnkgPSB0YS5HYW1lTG9iYnkoKQogICAgYnl0ZWMgMTcgLy8gMHgwMDAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTY2LTE2NwogICAgLy8gIyBJdGVyYXRlIHRocm91Z2ggdGhlIHVzZXJzIGJ5dGUgYXJyYXkKICAgIC8vIGZvciBpIGluIHVyYW5nZSgwLCBnYW1lX2xvYmJ5X2JfYXJyLmxlbmd0aCwgY3N0LkFERFJFU1NfU0laRSk6CiAgICBsZW4KICAgIGludGNfMCAvLyAwCgpyZWFkX2JveF9nYW1lX2xvYmJ5X2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNjYtMTY3CiAgICAvLyAjIEl0ZXJhdGUgdGhyb3VnaCB0aGUgdXNlcnMgYnl0ZSBhcnJheQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKDAsIGdhbWVfbG9iYnlfYl9hcnIubGVuZ3RoLCBjc3QuQUREUkVTU19TSVpFKToKICAgIGZyYW1lX2RpZyA1CiAgICBmcmFtZV9kaWcgNAogICAgPAogICAgYnogcmVhZF9ib3hfZ2FtZV9sb2JieV9hZnRlcl9mb3JANgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE2OC0xNjkKICAgIC8vICMgRXh0cmFjdCB0aGUgYnl0ZXMgcmVwcmVzZW50aW5nIHRoZSB1c2VyIGFkZHJlc3MKICAgIC8vIHVzZXJfYWRkcl9ieXRlcyA9IG9wLmV4dHJhY3QoZ2FtZV9sb2JieV9iX2FyciwgaSwgY3N0LkFERFJFU1NfU0laRSkKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgNQogICAgcHVzaGludCAzMiAvLyAzMgogICAgZXh0cmFjdDMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTcwLTE3MQogICAgLy8gIyBPbmx5IGFwcGVuZCBhZGRyZXNzIGlmIGl0cyBieXRlcyBkbyBOT1QgZXF1YWwgdG8gYSB6ZXJvZWQgYnl0ZSBhcnJheSBvZiBzaXplIDMyCiAgICAvLyBpZiB1c2VyX2FkZHJfYnl0ZXMgIT0gQnl0ZXMoY3N0LlpFUk9FRF9BRERSX0JZVEVTKToKICAgIGJ5dGVjIDkgLy8gMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICAhPQogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2J1cnkgMQogICAgYnogcmVhZF9ib3hfZ2FtZV9sb2JieV9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNzMKICAgIC8vIHVzZXJzX2luX2xvYmJ5LmFwcGVuZChhcmM0LkFkZHJlc3ModXNlcl9hY2NvdW50KSkKICAgIGZyYW1lX2RpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDAKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMQoKcmVhZF9ib3hfZ2FtZV9sb2JieV9hZnRlcl9pZl9lbHNlQDQ6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTY2LTE2NwogICAgLy8gIyBJdGVyYXRlIHRocm91Z2ggdGhlIHVzZXJzIGJ5dGUgYXJyYXkKICAgIC8vIGZvciBpIGluIHVyYW5nZSgwLCBnYW1lX2xvYmJ5X2JfYXJyLmxlbmd0aCwgY3N0LkFERFJFU1NfU0laRSk6CiAgICBmcmFtZV9kaWcgNQogICAgcHVzaGludCAzMiAvLyAzMgogICAgKwogICAgZnJhbWVfYnVyeSA1CiAgICBiIHJlYWRfYm94X2dhbWVfbG9iYnlfZm9yX2hlYWRlckAxCgpyZWFkX2JveF9nYW1lX2xvYmJ5X2FmdGVyX2ZvckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE3NS0xNzYKICAgIC8vICMgUmV0dXJuIHRoZSBhcnJheSBjb250YWluaW5nIHRoZSByZW1haW5pbmcgYWN0aXZlIHVzZXJzIGluIHRoZSBnYW1lIGxvYmJ5CiAgICAvLyByZXR1cm4gdXNlcnNfaW5fbG9iYnkKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by5yZWFkX29wZW5fbG9iYmllcyhsb2JieV9zaXplOiBieXRlcywgc3Rha2VfdGllcjogYnl0ZXMsIHN0YXJ0OiB1aW50NjQsIGNvdW50OiB1aW50NjQpIC0+IGJ5dGVzOgpyZWFkX29wZW5fbG9iYmllczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxNzgtMTg3CiAgICAvLyAjIFJFQUQtT05MWTogUmV0dXJuIGEgcGFnZSBvZiB0aGUgb3BlbiBnYW1lIGlkcyBvZiBhIChsb2JieV9zaXplLCBzdGFrZSB0aWVyKSBidWNrZXQKICAgIC8vICMgVGhlIHBhZ2UgaG9sZHMgdXAgdG8gYGNvdW50YCBpZHMgZnJvbSBlbnRyeSBgc3RhcnRgLCBhbmQgaXMgZW1wdHkgcGFzdCB0aGUgbGFzdCBlbnRyeQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgcmVhZF9vcGVuX2xvYmJpZXMoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBsb2JieV9zaXplOiBhcmM0LlVJbnQ4LAogICAgLy8gICAgIHN0YWtlX3RpZXI6IGFyYzQuVUludDgsCiAgICAvLyAgICAgc3RhcnQ6IFVJbnQ2NCwKICAgIC8vICAgICBjb3VudDogVUludDY0LAogICAgLy8gKSAtPiB0YS5HYW1lSWRzOgogICAgcHJvdG8gNCAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE5MAogICAgLy8gbG9iYnlfc2l6ZSA+PSBjc3QuTUlOX0xPQkJZX1NJWkUKICAgIGZyYW1lX2RpZyAtNAogICAgYnl0ZWMgMTEgLy8gMHgwMgogICAgYj49CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTkwLTE5MgogICAgLy8gbG9iYnlfc2l6ZSA+PSBjc3QuTUlOX0xPQkJZX1NJWkUKICAgIC8vIGFuZCBsb2JieV9zaXplIDw9IGNzdC5NQVhfTE9CQllfU0laRQogICAgLy8gYW5kIGxvYmJ5X3NpemUubmF0aXZlICUgMiA9PSAwCiAgICBieiByZWFkX29wZW5fbG9iYmllc19ib29sX2ZhbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxOTEKICAgIC8vIGFuZCBsb2JieV9zaXplIDw9IGNzdC5NQVhfTE9CQllfU0laRQogICAgZnJhbWVfZGlnIC00CiAgICBieXRlYyAxMiAvLyAweDA0CiAgICBiPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxOTAtMTkyCiAgICAvLyBsb2JieV9zaXplID49IGNzdC5NSU5fTE9CQllfU0laRQogICAgLy8gYW5kIGxvYmJ5X3NpemUgPD0gY3N0Lk1BWF9MT0JCWV9TSVpFCiAgICAvLyBhbmQgbG9iYnlfc2l6ZS5uYXRpdmUgJSAyID09IDAKICAgIGJ6IHJlYWRfb3Blbl9sb2JiaWVzX2Jvb2xfZmFsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE5MgogICAgLy8gYW5kIGxvYmJ5X3NpemUubmF0aXZlICUgMiA9PSAwCiAgICBmcmFtZV9kaWcgLTQKICAgIGJ0b2kKICAgIGludGNfMyAvLyAyCiAgICAlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTkwLTE5MgogICAgLy8gbG9iYnlfc2l6ZSA+PSBjc3QuTUlOX0xPQkJZX1NJWkUKICAgIC8vIGFuZCBsb2JieV9zaXplIDw9IGNzdC5NQVhfTE9CQllfU0laRQogICAgLy8gYW5kIGxvYmJ5X3NpemUubmF0aXZlICUgMiA9PSAwCiAgICBibnogcmVhZF9vcGVuX2xvYmJpZXNfYm9vbF9mYWxzZUA0CiAgICBpbnRjXzEgLy8gMQoKcmVhZF9vcGVuX2xvYmJpZXNfYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjE4OC0xOTMKICAgIC8vICMgRmFpbCB0cmFuc2FjdGlvbiB1bmxlc3MgdGhlIGFzc2VydGlvbnMgYmVsb3cgZXZhbHVhdGUgVHJ1ZQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBsb2JieV9zaXplID49IGNzdC5NSU5fTE9CQllfU0laRQogICAgLy8gICAgIGFuZCBsb2JieV9zaXplIDw9IGNzdC5NQVhfTE9CQllfU0laRQogICAgLy8gICAgIGFuZCBsb2JieV9zaXplLm5hdGl2ZSAlIDIgPT0gMAogICAgLy8gKSwgZXJyLklOVkFMSURfTE9CQllfU0laRQogICAgYXNzZXJ0IC8vIEludmFsaWQgTG9iYnkgc2l6ZS4gVmFsdWUgbXVzdCBiZSBhbiBldmVuIG51bWJlciBhbmQgd2l0aGluIHBlcm1pdHRlZCBib3VuZHMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTk0CiAgICAvLyBhc3NlcnQgc3Rha2VfdGllci5uYXRpdmUgPCBjc3QuU1RBS0VfVElFUl9DT1VOVCwgZXJyLklOVkFMSURfU1RBS0VfVElFUgogICAgZnJhbWVfZGlnIC0zCiAgICBidG9pCiAgICBkdXAKICAgIGludGNfMiAvLyA0CiAgICA8CiAgICBhc3NlcnQgLy8gSW52YWxpZCBzdGFrZSB0aWVyLiBWYWx1ZSBtdXN0IGJlIGJlbG93IHRoZSBudW1iZXIgb2Ygc3Rha2UgdGllcnMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTk2LTE5NwogICAgLy8gIyBBIGJ1Y2tldCB3L28gYW4gaW5kZXggYm94IGhhcyBubyBvcGVuIGdhbWVzIGxpc3RlZAogICAgLy8gYnVja2V0ID0gc3J0LmdldF9vcGVuX2xvYmJ5X2J1Y2tldChsb2JieV9zaXplLm5hdGl2ZSwgc3Rha2VfdGllci5uYXRpdmUpCiAgICBmcmFtZV9kaWcgLTQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo1NDQKICAgIC8vIHJldHVybiAobG9iYnlfc2l6ZSAvLyAyIC0gMSkgKiBjc3QuU1RBS0VfVElFUl9DT1VOVCArIHN0YWtlX3RpZXIKICAgIGludGNfMyAvLyAyCiAgICAvCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgaW50Y18yIC8vIDQKICAgICoKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToxOTgKICAgIC8vIGlmIGJ1Y2tldCBub3QgaW4gc2VsZi5ib3hfb3Blbl9sb2JiaWVzOgogICAgaXRvYgogICAgYnl0ZWMgMTAgLy8gIm9fIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBibnogcmVhZF9vcGVuX2xvYmJpZXNfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MTk5CiAgICAvLyByZXR1cm4gdGEuR2FtZUlkcygpCiAgICBieXRlYyAxNyAvLyAweDAwMDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpyZWFkX29wZW5fbG9iYmllc19hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjAzCiAgICAvLyB1c2VkID0gb3AuYnRvaShvcGVuX2xvYmJ5X2JyZWYuZXh0cmFjdCgwLCA4KSkKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGludCA4IC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjA0CiAgICAvLyBzdGFydCA9IHN0YXJ0IGlmIHN0YXJ0IDwgdXNlZCBlbHNlIHVzZWQKICAgIGZyYW1lX2RpZyAtMgogICAgZGlnIDEKICAgIDwKICAgIGRpZyAxCiAgICBmcmFtZV9kaWcgLTIKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgLTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMDUKICAgIC8vIGNvdW50ID0gY291bnQgaWYgY291bnQgPCB1c2VkIC0gc3RhcnQgZWxzZSB1c2VkIC0gc3RhcnQKICAgIC0KICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9kaWcgLTEKICAgID4KICAgIGJueiByZWFkX29wZW5fbG9iYmllc190ZXJuYXJ5X21lcmdlQDEwCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfYnVyeSAtMQoKcmVhZF9vcGVuX2xvYmJpZXNfdGVybmFyeV9tZXJnZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMDcKICAgIC8vIGFyYzQuVUludDE2KGNvdW50KS5ieXRlcwogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCAxNiAvLyAxNgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA2IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMDgKICAgIC8vICsgb3Blbl9sb2JieV9icmVmLmV4dHJhY3QoY3N0Lk9QRU5fTE9CQllfSURTX09GRlNFVCArIHN0YXJ0ICogOCwgY291bnQgKiA4KQogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDggLy8gOAogICAgKgogICAgcHVzaGludCA4IC8vIDgKICAgICsKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA4IC8vIDgKICAgICoKICAgIGZyYW1lX2RpZyAwCiAgICBjb3ZlciAyCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIwNy0yMDgKICAgIC8vIGFyYzQuVUludDE2KGNvdW50KS5ieXRlcwogICAgLy8gKyBvcGVuX2xvYmJ5X2JyZWYuZXh0cmFjdChjc3QuT1BFTl9MT0JCWV9JRFNfT0ZGU0VUICsgc3RhcnQgKiA4LCBjb3VudCAqIDgpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMDYtMjA5CiAgICAvLyByZXR1cm4gdGEuR2FtZUlkcy5mcm9tX2J5dGVzKAogICAgLy8gICAgIGFyYzQuVUludDE2KGNvdW50KS5ieXRlcwogICAgLy8gICAgICsgb3Blbl9sb2JieV9icmVmLmV4dHJhY3QoY3N0Lk9QRU5fTE9CQllfSURTX09GRlNFVCArIHN0YXJ0ICogOCwgY291bnQgKiA4KQogICAgLy8gKQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCnJlYWRfb3Blbl9sb2JiaWVzX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIHJlYWRfb3Blbl9sb2JiaWVzX2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by5nZW5lcmF0ZSgpIC0+IHZvaWQ6CmdlbmVyYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIyMC0yMjEKICAgIC8vICMgU2V0IEdsb2JhbCBTdGF0ZSB2YXJpYWJsZXMgdG8gdGhlaXIgZGVmYXVsdCBzdGFydGluZyB2YWx1ZXMKICAgIC8vIHNlbGYuZ2FtZV9pZCA9IFVJbnQ2NCgxKQogICAgYnl0ZWNfMiAvLyAiZ2FtZV9pZCIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLmdldF9ib3hfdXNlcl9yZWdpc3RyeShib3hfcl9wYXk6IHVpbnQ2NCkgLT4gdm9pZDoKZ2V0X2JveF91c2VyX3JlZ2lzdHJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIyMy0yMjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGdldF9ib3hfdXNlcl9yZWdpc3RyeSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGJveF9yX3BheTogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMjgtMjI5CiAgICAvLyAjIEZhaWwgdHJhbnNhY3Rpb24gdW5sZXNzIHRoZSBhc3NlcnRpb24gYmVsb3cgZXZhbHVhdGVzIFRydWUKICAgIC8vIGFzc2VydCBHbG9iYWwuZ3JvdXBfc2l6ZSA9PSAyLCBlcnIuSU5WQUxJRF9HUk9VUF9TSVpFCiAgICBnbG9iYWwgR3JvdXBTaXplCiAgICBpbnRjXzMgLy8gMgogICAgPT0KICAgIGFzc2VydCAvLyBJbnZhbGlkIGdyb3VwIHNpemUuIEVuc3VyZSBudW1iZXIgb2YgdHJhbnNhY3Rpb25zIGluIGdyb3VwIGlzIHdpdGhpbiB2YWxpZCBib3VuZHMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjMwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciBub3QgaW4gc2VsZi5ib3hfdXNlcl9yZWdpc3RyeSwgZXJyLkJPWF9GT1VORAogICAgYnl0ZWMgMTMgLy8gInJfIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBCb3ggZm91bmQuIEVuc3VyZSB0aGUgYm94IGRvZXMgbm90IGV4aXN0LgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjIzMy0yMzQKICAgIC8vICMgYXNzZXJ0IGJveF9yX3BheS5hbW91bnQgPT0gY3N0LkJPWF9SX0NPU1QsIGVyci5JTlNVRkZJQ0lFTlRfUEFZX0FNT1VOVAogICAgLy8gYXNzZXJ0IGJveF9yX3BheS5zZW5kZXIgPT0gVHhuLnNlbmRlciwgZXJyLklOVkFMSURfQk9YX1BBWV9TRU5ERVIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIEJveCBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggdHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjM2CiAgICAvLyBib3hfcl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjM1LTIzNwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBib3hfcl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLklOVkFMSURfQk9YX1BBWV9SRUNFSVZFUgogICAgYXNzZXJ0IC8vIEJveCBwYXltZW50IHJlY2VpdmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjI0NAogICAgLy8gZXhwaXJ5X3JvdW5kPWFyYzQuVUludDY0KEdsb2JhbC5yb3VuZCArIGNzdC5CT1hfUl9FWFBfUk9VTkRfREVMVEEpLAogICAgZ2xvYmFsIFJvdW5kCiAgICBwdXNoaW50IDMwIC8vIDMwCiAgICArCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjM5LTI0NQogICAgLy8gIyBDcmVhdGUgYSBuZXcgYm94IHN0b3JhZ2UgdW5pdCBmb3IgdGhlIHVzZXIgcmVnaXN0cnkgdy8gdGhlIHNlbmRlciBhZGRyZXNzIHZhbHVlIGFzIGtleQogICAgLy8gc2VsZi5ib3hfdXNlcl9yZWdpc3RyeVtUeG4uc2VuZGVyXSA9IHN0Yy5Vc2VyUmVnaXN0cnkoCiAgICAvLyAgICAgaG9zdGluZ19nYW1lPWFyYzQuQm9vbChGYWxzZSksICAjIG5vcWE6IEZCVDAwMwogICAgLy8gICAgIGdhbWVfaWQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgY29tbWl0X3JhbmRfcm91bmQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgZXhwaXJ5X3JvdW5kPWFyYzQuVUludDY0KEdsb2JhbC5yb3VuZCArIGNzdC5CT1hfUl9FWFBfUk9VTkRfREVMVEEpLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjM5LTI0MAogICAgLy8gIyBDcmVhdGUgYSBuZXcgYm94IHN0b3JhZ2UgdW5pdCBmb3IgdGhlIHVzZXIgcmVnaXN0cnkgdy8gdGhlIHNlbmRlciBhZGRyZXNzIHZhbHVlIGFzIGtleQogICAgLy8gc2VsZi5ib3hfdXNlcl9yZWdpc3RyeVtUeG4uc2VuZGVyXSA9IHN0Yy5Vc2VyUmVnaXN0cnkoCiAgICBieXRlYyAxMyAvLyAicl8iCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyMzktMjQ1CiAgICAvLyAjIENyZWF0ZSBhIG5ldyBib3ggc3RvcmFnZSB1bml0IGZvciB0aGUgdXNlciByZWdpc3RyeSB3LyB0aGUgc2VuZGVyIGFkZHJlc3MgdmFsdWUgYXMga2V5CiAgICAvLyBzZWxmLmJveF91c2VyX3JlZ2lzdHJ5W1R4bi5zZW5kZXJdID0gc3RjLlVzZXJSZWdpc3RyeSgKICAgIC8vICAgICBob3N0aW5nX2dhbWU9YXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgZ2FtZV9pZD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBjb21taXRfcmFuZF9yb3VuZD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBleHBpcnlfcm91bmQ9YXJjNC5VSW50NjQoR2xvYmFsLnJvdW5kICsgY3N0LkJPWF9SX0VYUF9ST1VORF9ERUxUQSksCiAgICAvLyApCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8ubmV3X2dhbWUoYm94X2dfcGF5OiB1aW50NjQsIGJveF9zX3BheTogdWludDY0LCBib3hfY19wYXk6IHVpbnQ2NCwgYm94X2xfcGF5OiB1aW50NjQsIHN0YWtlX3BheTogdWludDY0LCBsb2JieV9zaXplOiBieXRlcywgY29tbWl0X3NjaGVtZTogYnl0ZXMpIC0+IHVpbnQ2NDoKbmV3X2dhbWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjQ3LTI1OQogICAgLy8gIyBDcmVhdGUgYSBuZXcgZ2FtZSwgcmV0dXJuIFRydWUgaWYgaXQgZ290IGxpc3RlZCBpbiB0aGUgb3BlbiBsb2JieSBpbmRleAogICAgLy8gIyBBIGdhbWUgd2hvc2UgYnVja2V0IGJveCB3YXMgbm90IGNyZWF0ZWQgeWV0LCBvciBpcyBmdWxsLCBzdGF5cyBwbGF5YWJsZSBidXQgdW5saXN0ZWQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIG5ld19nYW1lKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgYm94X2dfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICAgICBib3hfc19wYXk6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLAogICAgLy8gICAgIGJveF9jX3BheTogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sCiAgICAvLyAgICAgYm94X2xfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICAgICBzdGFrZV9wYXk6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLAogICAgLy8gICAgIGxvYmJ5X3NpemU6IGFyYzQuVUludDgsCiAgICAvLyAgICAgY29tbWl0X3NjaGVtZTogYXJjNC5VSW50OCwKICAgIC8vICkgLT4gYm9vbDoKICAgIHByb3RvIDcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjI2MC0yNjEKICAgIC8vICMgRmFpbCB0cmFuc2FjdGlvbiB1bmxlc3MgdGhlIGFzc2VydGlvbiBiZWxvdyBldmFsdWF0ZXMgVHJ1ZQogICAgLy8gYXNzZXJ0IEdsb2JhbC5ncm91cF9zaXplID09IDYsIGVyci5JTlZBTElEX0dST1VQX1NJWkUKICAgIGdsb2JhbCBHcm91cFNpemUKICAgIHB1c2hpbnQgNiAvLyA2CiAgICA9PQogICAgYXNzZXJ0IC8vIEludmFsaWQgZ3JvdXAgc2l6ZS4gRW5zdXJlIG51bWJlciBvZiB0cmFuc2FjdGlvbnMgaW4gZ3JvdXAgaXMgd2l0aGluIHZhbGlkIGJvdW5kcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyNjMKICAgIC8vIGFzc2VydCBib3hfZ19wYXkuYW1vdW50ID49IGNzdC5CT1hfR19DT1NULCBlcnIuSU5TVUZGSUNJRU5UX1BBWV9BTU9VTlQKICAgIGZyYW1lX2RpZyAtNwogICAgZ3R4bnMgQW1vdW50CiAgICBwdXNoaW50IDE4OTAwIC8vIDE4OTAwCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBwYXltZW50IGFtb3VudC4gVmFsdWUgaXMgbm90IGVub3VnaCB0byBjb3ZlciB0aGUgbWluaW11bSByZXF1aXJlbWVudHMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjY0CiAgICAvLyBhc3NlcnQgYm94X3NfcGF5LmFtb3VudCA+PSBjc3QuQk9YX1NfQ09TVCwgZXJyLklOU1VGRklDSUVOVF9QQVlfQU1PVU5UCiAgICBmcmFtZV9kaWcgLTYKICAgIGd0eG5zIEFtb3VudAogICAgcHVzaGludCA0NDkwMCAvLyA0NDkwMAogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgcGF5bWVudCBhbW91bnQuIFZhbHVlIGlzIG5vdCBlbm91Z2ggdG8gY292ZXIgdGhlIG1pbmltdW0gcmVxdWlyZW1lbnRzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjI2NS0yNjYKICAgIC8vICMgYXNzZXJ0IGJveF9jX3BheS5hbW91bnQgPj0gY3N0LkJPWF9DX0NPU1QsIGVyci5JTlNVRkZJQ0lFTlRfUEFZX0FNT1VOVAogICAgLy8gYXNzZXJ0IGJveF9sX3BheS5hbW91bnQgPj0gc2VsZi5jYWxjX3NpbmdsZV9ib3hfY29zdCgKICAgIGZyYW1lX2RpZyAtNAogICAgZ3R4bnMgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjY4CiAgICAvLyB2YWx1ZV9zaXplPWFyYzQuVUludDE2KGNzdC5BRERSRVNTX1NJWkUgKiBsb2JieV9zaXplLm5hdGl2ZSksCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCAzMiAvLyAzMgogICAgKgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCAxNiAvLyAxNgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA2IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyNjcKICAgIC8vIGtleV9zaXplPWFyYzQuVUludDgoMTApLAogICAgcHVzaGJ5dGVzIDB4MGEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyNjUtMjY5CiAgICAvLyAjIGFzc2VydCBib3hfY19wYXkuYW1vdW50ID49IGNzdC5CT1hfQ19DT1NULCBlcnIuSU5TVUZGSUNJRU5UX1BBWV9BTU9VTlQKICAgIC8vIGFzc2VydCBib3hfbF9wYXkuYW1vdW50ID49IHNlbGYuY2FsY19zaW5nbGVfYm94X2Nvc3QoCiAgICAvLyAgICAga2V5X3NpemU9YXJjNC5VSW50OCgxMCksCiAgICAvLyAgICAgdmFsdWVfc2l6ZT1hcmM0LlVJbnQxNihjc3QuQUREUkVTU19TSVpFICogbG9iYnlfc2l6ZS5uYXRpdmUpLAogICAgLy8gKSwgZXJyLklOU1VGRklDSUVOVF9QQVlfQU1PVU5UCiAgICBzd2FwCiAgICBjYWxsc3ViIGNhbGNfc2luZ2xlX2JveF9jb3N0CiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBwYXltZW50IGFtb3VudC4gVmFsdWUgaXMgbm90IGVub3VnaCB0byBjb3ZlciB0aGUgbWluaW11bSByZXF1aXJlbWVudHMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Mjc3CiAgICAvLyBhc3NlcnQgYm94X2dfcGF5LnNlbmRlciA9PSBUeG4uc2VuZGVyLCBlcnIuSU5WQUxJRF9CT1hfUEFZX1NFTkRFUgogICAgZnJhbWVfZGlnIC03CiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gQm94IHBheW1lbnQgc2VuZGVyIGFkZHJlc3MgbXVzdCBtYXRjaCB0cmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyNzgKICAgIC8vIGFzc2VydCBib3hfc19wYXkuc2VuZGVyID09IFR4bi5zZW5kZXIsIGVyci5JTlZBTElEX0JPWF9QQVlfU0VOREVSCiAgICBmcmFtZV9kaWcgLTYKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBCb3ggcGF5bWVudCBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIHRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjI3OQogICAgLy8gYXNzZXJ0IGJveF9jX3BheS5zZW5kZXIgPT0gVHhuLnNlbmRlciwgZXJyLklOVkFMSURfQk9YX1BBWV9TRU5ERVIKICAgIGZyYW1lX2RpZyAtNQogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIEJveCBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggdHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MjgwCiAgICAvLyBhc3NlcnQgYm94X2xfcGF5LnNlbmRlciA9PSBUeG4uc2VuZGVyLCBlcnIuSU5WQUxJRF9CT1hfUEFZX1NFTkRFUgogICAgZnJhbWVfZGlnIC00CiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gQm94IHBheW1lbnQgc2VuZGVyIGFkZHJlc3MgbXVzdCBtYXRjaCB0cmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyODEKICAgIC8vIGFzc2VydCBzdGFrZV9wYXkuc2VuZGVyID09IFR4bi5zZW5kZXIsIGVyci5JTlZBTElEX1NUQUtFX1BBWV9TRU5ERVIKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIFN0YWtlIHBheW1lbnQgc2VuZGVyIGFkZHJlc3MgbXVzdCBtYXRjaCBzZW5kZXIgYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyODQKICAgIC8vIGJveF9nX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTcKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyODMtMjg1CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGJveF9nX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuSU5WQUxJRF9CT1hfUEFZX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gQm94IHBheW1lbnQgcmVjZWl2ZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Mjg3CiAgICAvLyBib3hfc19wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC02CiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Mjg2LTI4OAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBib3hfc19wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLklOVkFMSURfQk9YX1BBWV9SRUNFSVZFUgogICAgYXNzZXJ0IC8vIEJveCBwYXltZW50IHJlY2VpdmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjI5MAogICAgLy8gYm94X2NfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtNQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjI4OS0yOTEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYm94X2NfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksIGVyci5JTlZBTElEX0JPWF9QQVlfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBCb3ggcGF5bWVudCByZWNlaXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyOTMKICAgIC8vIGJveF9sX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTQKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weToyOTItMjk0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGJveF9sX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuSU5WQUxJRF9CT1hfUEFZX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gQm94IHBheW1lbnQgcmVjZWl2ZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Mjk2CiAgICAvLyBzdGFrZV9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0zCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Mjk1LTI5NwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzdGFrZV9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLklOVkFMSURfQk9YX1BBWV9SRUNFSVZFUgogICAgYXNzZXJ0IC8vIEJveCBwYXltZW50IHJlY2VpdmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwMAogICAgLy8gbG9iYnlfc2l6ZSA+PSBjc3QuTUlOX0xPQkJZX1NJWkUKICAgIGZyYW1lX2RpZyAtMgogICAgYnl0ZWMgMTEgLy8gMHgwMgogICAgYj49CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzAwLTMwMgogICAgLy8gbG9iYnlfc2l6ZSA+PSBjc3QuTUlOX0xPQkJZX1NJWkUKICAgIC8vIGFuZCBsb2JieV9zaXplIDw9IGNzdC5NQVhfTE9CQllfU0laRQogICAgLy8gYW5kIGxvYmJ5X3NpemUubmF0aXZlICUgMiA9PSAwCiAgICBieiBuZXdfZ2FtZV9ib29sX2ZhbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMDEKICAgIC8vIGFuZCBsb2JieV9zaXplIDw9IGNzdC5NQVhfTE9CQllfU0laRQogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlYyAxMiAvLyAweDA0CiAgICBiPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMDAtMzAyCiAgICAvLyBsb2JieV9zaXplID49IGNzdC5NSU5fTE9CQllfU0laRQogICAgLy8gYW5kIGxvYmJ5X3NpemUgPD0gY3N0Lk1BWF9MT0JCWV9TSVpFCiAgICAvLyBhbmQgbG9iYnlfc2l6ZS5uYXRpdmUgJSAyID09IDAKICAgIGJ6IG5ld19nYW1lX2Jvb2xfZmFsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwMgogICAgLy8gYW5kIGxvYmJ5X3NpemUubmF0aXZlICUgMiA9PSAwCiAgICBmcmFtZV9kaWcgMAogICAgaW50Y18zIC8vIDIKICAgICUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMDAtMzAyCiAgICAvLyBsb2JieV9zaXplID49IGNzdC5NSU5fTE9CQllfU0laRQogICAgLy8gYW5kIGxvYmJ5X3NpemUgPD0gY3N0Lk1BWF9MT0JCWV9TSVpFCiAgICAvLyBhbmQgbG9iYnlfc2l6ZS5uYXRpdmUgJSAyID09IDAKICAgIGJueiBuZXdfZ2FtZV9ib29sX2ZhbHNlQDQKICAgIGludGNfMSAvLyAxCgpuZXdfZ2FtZV9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Mjk5LTMwMwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBsb2JieV9zaXplID49IGNzdC5NSU5fTE9CQllfU0laRQogICAgLy8gICAgIGFuZCBsb2JieV9zaXplIDw9IGNzdC5NQVhfTE9CQllfU0laRQogICAgLy8gICAgIGFuZCBsb2JieV9zaXplLm5hdGl2ZSAlIDIgPT0gMAogICAgLy8gKSwgZXJyLklOVkFMSURfTE9CQllfU0laRQogICAgYXNzZXJ0IC8vIEludmFsaWQgTG9iYnkgc2l6ZS4gVmFsdWUgbXVzdCBiZSBhbiBldmVuIG51bWJlciBhbmQgd2l0aGluIHBlcm1pdHRlZCBib3VuZHMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzA1CiAgICAvLyBjb21taXRfc2NoZW1lLm5hdGl2ZSA8PSBjc3QuQ09NTUlUX1NDSEVNRV9TSEE1MTJfMjU2CiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGludGNfMyAvLyAyCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMwNC0zMDYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgY29tbWl0X3NjaGVtZS5uYXRpdmUgPD0gY3N0LkNPTU1JVF9TQ0hFTUVfU0hBNTEyXzI1NgogICAgLy8gKSwgZXJyLklOVkFMSURfQ09NTUlUX1NDSEVNRQogICAgYXNzZXJ0IC8vIEludmFsaWQgY29tbWl0IHNjaGVtZS4gRW5zdXJlIHRoZSBzY2hlbWUgaXMgTWlNQyAoMCksIHNoYTI1NiAoMSkgb3Igc2hhNTEyXzI1NiAoMikuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzA4LTMwOQogICAgLy8gIyBDcmVhdGUgYSBuZXcgYm94IHN0b3JhZ2UgdW5pdCBmb3IgdGhlIGdhbWUgZ3JpZCB3LyB0aGUgY3VycmVudCBnbG9iYWwgZ2FtZV9pZCB2YWx1ZSBhcyBrZXkKICAgIC8vIHNlbGYuYm94X2dhbWVfZ3JpZFtzZWxmLmdhbWVfaWRdID0gdGEuR2FtZUdyaWQuZnJvbV9ieXRlcyhjc3QuR1JJRF9aRVJPRURfQllURVMpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiZ2FtZV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lX2lkIGV4aXN0cwogICAgaXRvYgogICAgYnl0ZWMgNiAvLyAiZ18iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzExLTMxMgogICAgLy8gIyBMaXN0IHRoZSBnYW1lIGluIHRoZSBvcGVuIGxvYmJ5IGluZGV4LCB1bmRlciBpdHMgbG9iYnkgc2l6ZSBhbmQgc3Rha2UgdGllciBidWNrZXQKICAgIC8vIHN0YWtlX3RpZXIgPSBzcnQuZ2V0X3N0YWtlX3RpZXIoc3Rha2VfcGF5LmFtb3VudCkKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgQW1vdW50CiAgICBkdXAKICAgIGNhbGxzdWIgZ2V0X3N0YWtlX3RpZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo1NDQKICAgIC8vIHJldHVybiAobG9iYnlfc2l6ZSAvLyAyIC0gMSkgKiBjc3QuU1RBS0VfVElFUl9DT1VOVCArIHN0YWtlX3RpZXIKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzMgLy8gMgogICAgLwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGludGNfMiAvLyA0CiAgICAqCiAgICBkaWcgMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMxNgogICAgLy8gc2VsZi5nYW1lX2lkLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImdhbWVfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2FtZV9pZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMTQKICAgIC8vIHNlbGYuYm94X29wZW5fbG9iYmllcywKICAgIGJ5dGVjIDEwIC8vICJvXyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMTMtMzE3CiAgICAvLyBpc19saXN0ZWQgPSBzcnQuYWRkX29wZW5fbG9iYnkoCiAgICAvLyAgICAgc2VsZi5ib3hfb3Blbl9sb2JiaWVzLAogICAgLy8gICAgIHNydC5nZXRfb3Blbl9sb2JieV9idWNrZXQobG9iYnlfc2l6ZS5uYXRpdmUsIHN0YWtlX3RpZXIpLAogICAgLy8gICAgIHNlbGYuZ2FtZV9pZCwKICAgIC8vICkKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgYWRkX29wZW5fbG9iYnkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMjYKICAgIC8vIGV4cGlyeV90cz1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCArIGNzdC5QSEFTRV9FWFBJUllfSU5URVJWQUwpLAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaW50YyA2IC8vIDEyMDAKICAgICsKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMjcKICAgIC8vIHByaXplX3BvdD1hcmM0LlVJbnQ2NChzdGFrZV9wYXkuYW1vdW50KSwKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMyOAogICAgLy8gYWRtaW5fYWRkcmVzcz1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzMxCiAgICAvLyBzdGFrZV90aWVyPWFyYzQuVUludDgoc3Rha2VfdGllciksCiAgICB1bmNvdmVyIDQKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA3IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMzIKICAgIC8vIG9wZW5fbG9iYnlfbGlzdGVkPWFyYzQuQm9vbChpc19saXN0ZWQpLAogICAgYnl0ZWNfMCAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgZGlnIDYKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMyMQogICAgLy8gc3Rha2luZ19jbG9zZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICBieXRlY18wIC8vIDB4MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMTktMzM0CiAgICAvLyAjIENyZWF0ZSBhIG5ldyBib3ggc3RvcmFnZSB1bml0IGZvciB0aGUgZ2FtZSBzdGF0ZSB3LyB0aGUgY3VycmVudCBnbG9iYWwgZ2FtZV9pZCB2YWx1ZSBhcyBrZXkKICAgIC8vIHNlbGYuYm94X2dhbWVfc3RhdGVbc2VsZi5nYW1lX2lkXSA9IHN0Yy5HYW1lU3RhdGUoCiAgICAvLyAgICAgc3Rha2luZ19jbG9zZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgIyBxdWlja19wbGF5X2VuYWJsZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgcXVpY2tfcGxheV9lbmFibGVkLAogICAgLy8gICAgIGxvYmJ5X3NpemU9bG9iYnlfc2l6ZSwKICAgIC8vICAgICBhY3RpdmVfcGxheWVycz1hcmM0LlVJbnQ4KDEpLAogICAgLy8gICAgIGJveF9sX3N0YXJ0X3Bvcz1hcmM0LlVJbnQxNihjc3QuQUREUkVTU19TSVpFKSwKICAgIC8vICAgICBleHBpcnlfdHM9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBjc3QuUEhBU0VfRVhQSVJZX0lOVEVSVkFMKSwKICAgIC8vICAgICBwcml6ZV9wb3Q9YXJjNC5VSW50NjQoc3Rha2VfcGF5LmFtb3VudCksCiAgICAvLyAgICAgYWRtaW5fYWRkcmVzcz1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgZ3JpZF9yb290PWFyYzQuVUludDI1Ni5mcm9tX2J5dGVzKGNzdC5FTVBUWV9HUklEX1JPT1QpLAogICAgLy8gICAgIGNvbW1pdF9zY2hlbWU9Y29tbWl0X3NjaGVtZSwKICAgIC8vICAgICBzdGFrZV90aWVyPWFyYzQuVUludDgoc3Rha2VfdGllciksCiAgICAvLyAgICAgb3Blbl9sb2JieV9saXN0ZWQ9YXJjNC5Cb29sKGlzX2xpc3RlZCksCiAgICAvLyAgICAgcm91bmRfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMyNAogICAgLy8gYWN0aXZlX3BsYXllcnM9YXJjNC5VSW50OCgxKSwKICAgIGJ5dGVjIDE0IC8vIDB4MDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMTktMzM0CiAgICAvLyAjIENyZWF0ZSBhIG5ldyBib3ggc3RvcmFnZSB1bml0IGZvciB0aGUgZ2FtZSBzdGF0ZSB3LyB0aGUgY3VycmVudCBnbG9iYWwgZ2FtZV9pZCB2YWx1ZSBhcyBrZXkKICAgIC8vIHNlbGYuYm94X2dhbWVfc3RhdGVbc2VsZi5nYW1lX2lkXSA9IHN0Yy5HYW1lU3RhdGUoCiAgICAvLyAgICAgc3Rha2luZ19jbG9zZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgIyBxdWlja19wbGF5X2VuYWJsZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgcXVpY2tfcGxheV9lbmFibGVkLAogICAgLy8gICAgIGxvYmJ5X3NpemU9bG9iYnlfc2l6ZSwKICAgIC8vICAgICBhY3RpdmVfcGxheWVycz1hcmM0LlVJbnQ4KDEpLAogICAgLy8gICAgIGJveF9sX3N0YXJ0X3Bvcz1hcmM0LlVJbnQxNihjc3QuQUREUkVTU19TSVpFKSwKICAgIC8vICAgICBleHBpcnlfdHM9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBjc3QuUEhBU0VfRVhQSVJZX0lOVEVSVkFMKSwKICAgIC8vICAgICBwcml6ZV9wb3Q9YXJjNC5VSW50NjQoc3Rha2VfcGF5LmFtb3VudCksCiAgICAvLyAgICAgYWRtaW5fYWRkcmVzcz1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgZ3JpZF9yb290PWFyYzQuVUludDI1Ni5mcm9tX2J5dGVzKGNzdC5FTVBUWV9HUklEX1JPT1QpLAogICAgLy8gICAgIGNvbW1pdF9zY2hlbWU9Y29tbWl0X3NjaGVtZSwKICAgIC8vICAgICBzdGFrZV90aWVyPWFyYzQuVUludDgoc3Rha2VfdGllciksCiAgICAvLyAgICAgb3Blbl9sb2JieV9saXN0ZWQ9YXJjNC5Cb29sKGlzX2xpc3RlZCksCiAgICAvLyAgICAgcm91bmRfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMjUKICAgIC8vIGJveF9sX3N0YXJ0X3Bvcz1hcmM0LlVJbnQxNihjc3QuQUREUkVTU19TSVpFKSwKICAgIGJ5dGVjIDE4IC8vIDB4MDAyMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMxOS0zMzQKICAgIC8vICMgQ3JlYXRlIGEgbmV3IGJveCBzdG9yYWdlIHVuaXQgZm9yIHRoZSBnYW1lIHN0YXRlIHcvIHRoZSBjdXJyZW50IGdsb2JhbCBnYW1lX2lkIHZhbHVlIGFzIGtleQogICAgLy8gc2VsZi5ib3hfZ2FtZV9zdGF0ZVtzZWxmLmdhbWVfaWRdID0gc3RjLkdhbWVTdGF0ZSgKICAgIC8vICAgICBzdGFraW5nX2Nsb3NlZD1hcmM0LkJvb2woRmFsc2UpLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICAjIHF1aWNrX3BsYXlfZW5hYmxlZD1hcmM0LkJvb2woRmFsc2UpLCAgIyBxdWlja19wbGF5X2VuYWJsZWQsCiAgICAvLyAgICAgbG9iYnlfc2l6ZT1sb2JieV9zaXplLAogICAgLy8gICAgIGFjdGl2ZV9wbGF5ZXJzPWFyYzQuVUludDgoMSksCiAgICAvLyAgICAgYm94X2xfc3RhcnRfcG9zPWFyYzQuVUludDE2KGNzdC5BRERSRVNTX1NJWkUpLAogICAgLy8gICAgIGV4cGlyeV90cz1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCArIGNzdC5QSEFTRV9FWFBJUllfSU5URVJWQUwpLAogICAgLy8gICAgIHByaXplX3BvdD1hcmM0LlVJbnQ2NChzdGFrZV9wYXkuYW1vdW50KSwKICAgIC8vICAgICBhZG1pbl9hZGRyZXNzPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBncmlkX3Jvb3Q9YXJjNC5VSW50MjU2LmZyb21fYnl0ZXMoY3N0LkVNUFRZX0dSSURfUk9PVCksCiAgICAvLyAgICAgY29tbWl0X3NjaGVtZT1jb21taXRfc2NoZW1lLAogICAgLy8gICAgIHN0YWtlX3RpZXI9YXJjNC5VSW50OChzdGFrZV90aWVyKSwKICAgIC8vICAgICBvcGVuX2xvYmJ5X2xpc3RlZD1hcmM0LkJvb2woaXNfbGlzdGVkKSwKICAgIC8vICAgICByb3VuZF9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMyOQogICAgLy8gZ3JpZF9yb290PWFyYzQuVUludDI1Ni5mcm9tX2J5dGVzKGNzdC5FTVBUWV9HUklEX1JPT1QpLAogICAgYnl0ZWMgMTkgLy8gMHgyODg2Y2VjZDNiMjhhZjkzMjJmYmExMDRmNzg3MGVkMWYzMGI1MTFlZWM3ZGYxNGFhYTFhNDcwN2FmNDViNTRiCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzE5LTMzNAogICAgLy8gIyBDcmVhdGUgYSBuZXcgYm94IHN0b3JhZ2UgdW5pdCBmb3IgdGhlIGdhbWUgc3RhdGUgdy8gdGhlIGN1cnJlbnQgZ2xvYmFsIGdhbWVfaWQgdmFsdWUgYXMga2V5CiAgICAvLyBzZWxmLmJveF9nYW1lX3N0YXRlW3NlbGYuZ2FtZV9pZF0gPSBzdGMuR2FtZVN0YXRlKAogICAgLy8gICAgIHN0YWtpbmdfY2xvc2VkPWFyYzQuQm9vbChGYWxzZSksICAjIG5vcWE6IEZCVDAwMwogICAgLy8gICAgICMgcXVpY2tfcGxheV9lbmFibGVkPWFyYzQuQm9vbChGYWxzZSksICAjIHF1aWNrX3BsYXlfZW5hYmxlZCwKICAgIC8vICAgICBsb2JieV9zaXplPWxvYmJ5X3NpemUsCiAgICAvLyAgICAgYWN0aXZlX3BsYXllcnM9YXJjNC5VSW50OCgxKSwKICAgIC8vICAgICBib3hfbF9zdGFydF9wb3M9YXJjNC5VSW50MTYoY3N0LkFERFJFU1NfU0laRSksCiAgICAvLyAgICAgZXhwaXJ5X3RzPWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wICsgY3N0LlBIQVNFX0VYUElSWV9JTlRFUlZBTCksCiAgICAvLyAgICAgcHJpemVfcG90PWFyYzQuVUludDY0KHN0YWtlX3BheS5hbW91bnQpLAogICAgLy8gICAgIGFkbWluX2FkZHJlc3M9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGdyaWRfcm9vdD1hcmM0LlVJbnQyNTYuZnJvbV9ieXRlcyhjc3QuRU1QVFlfR1JJRF9ST09UKSwKICAgIC8vICAgICBjb21taXRfc2NoZW1lPWNvbW1pdF9zY2hlbWUsCiAgICAvLyAgICAgc3Rha2VfdGllcj1hcmM0LlVJbnQ4KHN0YWtlX3RpZXIpLAogICAgLy8gICAgIG9wZW5fbG9iYnlfbGlzdGVkPWFyYzQuQm9vbChpc19saXN0ZWQpLAogICAgLy8gICAgIHJvdW5kX2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMzMwogICAgLy8gcm91bmRfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICBieXRlYyAyMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMTktMzM0CiAgICAvLyAjIENyZWF0ZSBhIG5ldyBib3ggc3RvcmFnZSB1bml0IGZvciB0aGUgZ2FtZSBzdGF0ZSB3LyB0aGUgY3VycmVudCBnbG9iYWwgZ2FtZV9pZCB2YWx1ZSBhcyBrZXkKICAgIC8vIHNlbGYuYm94X2dhbWVfc3RhdGVbc2VsZi5nYW1lX2lkXSA9IHN0Yy5HYW1lU3RhdGUoCiAgICAvLyAgICAgc3Rha2luZ19jbG9zZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgIyBxdWlja19wbGF5X2VuYWJsZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgcXVpY2tfcGxheV9lbmFibGVkLAogICAgLy8gICAgIGxvYmJ5X3NpemU9bG9iYnlfc2l6ZSwKICAgIC8vICAgICBhY3RpdmVfcGxheWVycz1hcmM0LlVJbnQ4KDEpLAogICAgLy8gICAgIGJveF9sX3N0YXJ0X3Bvcz1hcmM0LlVJbnQxNihjc3QuQUREUkVTU19TSVpFKSwKICAgIC8vICAgICBleHBpcnlfdHM9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBjc3QuUEhBU0VfRVhQSVJZX0lOVEVSVkFMKSwKICAgIC8vICAgICBwcml6ZV9wb3Q9YXJjNC5VSW50NjQoc3Rha2VfcGF5LmFtb3VudCksCiAgICAvLyAgICAgYWRtaW5fYWRkcmVzcz1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgZ3JpZF9yb290PWFyYzQuVUludDI1Ni5mcm9tX2J5dGVzKGNzdC5FTVBUWV9HUklEX1JPT1QpLAogICAgLy8gICAgIGNvbW1pdF9zY2hlbWU9Y29tbWl0X3NjaGVtZSwKICAgIC8vICAgICBzdGFrZV90aWVyPWFyYzQuVUludDgoc3Rha2VfdGllciksCiAgICAvLyAgICAgb3Blbl9sb2JieV9saXN0ZWQ9YXJjNC5Cb29sKGlzX2xpc3RlZCksCiAgICAvLyAgICAgcm91bmRfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMTktMzIwCiAgICAvLyAjIENyZWF0ZSBhIG5ldyBib3ggc3RvcmFnZSB1bml0IGZvciB0aGUgZ2FtZSBzdGF0ZSB3LyB0aGUgY3VycmVudCBnbG9iYWwgZ2FtZV9pZCB2YWx1ZSBhcyBrZXkKICAgIC8vIHNlbGYuYm94X2dhbWVfc3RhdGVbc2VsZi5nYW1lX2lkXSA9IHN0Yy5HYW1lU3RhdGUoCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiZ2FtZV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lX2lkIGV4aXN0cwogICAgZHVwCiAgICBpdG9iCiAgICBieXRlYyA0IC8vICJzXyIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMTktMzM0CiAgICAvLyAjIENyZWF0ZSBhIG5ldyBib3ggc3RvcmFnZSB1bml0IGZvciB0aGUgZ2FtZSBzdGF0ZSB3LyB0aGUgY3VycmVudCBnbG9iYWwgZ2FtZV9pZCB2YWx1ZSBhcyBrZXkKICAgIC8vIHNlbGYuYm94X2dhbWVfc3RhdGVbc2VsZi5nYW1lX2lkXSA9IHN0Yy5HYW1lU3RhdGUoCiAgICAvLyAgICAgc3Rha2luZ19jbG9zZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgIyBxdWlja19wbGF5X2VuYWJsZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgcXVpY2tfcGxheV9lbmFibGVkLAogICAgLy8gICAgIGxvYmJ5X3NpemU9bG9iYnlfc2l6ZSwKICAgIC8vICAgICBhY3RpdmVfcGxheWVycz1hcmM0LlVJbnQ4KDEpLAogICAgLy8gICAgIGJveF9sX3N0YXJ0X3Bvcz1hcmM0LlVJbnQxNihjc3QuQUREUkVTU19TSVpFKSwKICAgIC8vICAgICBleHBpcnlfdHM9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBjc3QuUEhBU0VfRVhQSVJZX0lOVEVSVkFMKSwKICAgIC8vICAgICBwcml6ZV9wb3Q9YXJjNC5VSW50NjQoc3Rha2VfcGF5LmFtb3VudCksCiAgICAvLyAgICAgYWRtaW5fYWRkcmVzcz1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgZ3JpZF9yb290PWFyYzQuVUludDI1Ni5mcm9tX2J5dGVzKGNzdC5FTVBUWV9HUklEX1JPT1QpLAogICAgLy8gICAgIGNvbW1pdF9zY2hlbWU9Y29tbWl0X3NjaGVtZSwKICAgIC8vICAgICBzdGFrZV90aWVyPWFyYzQuVUludDgoc3Rha2VfdGllciksCiAgICAvLyAgICAgb3Blbl9sb2JieV9saXN0ZWQ9YXJjNC5Cb29sKGlzX2xpc3RlZCksCiAgICAvLyAgICAgcm91bmRfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozMzgtMzQxCiAgICAvLyAjIENyZWF0ZSBhIG5ldyBib3ggc3RvcmFnZSB1bml0IGZvciB0aGUgZ2FtZSBsb2JieSB3LyB0aGUgY3VycmVudCBnbG9iYWwgZ2FtZV9pZCB2YWx1ZSBhcyBrZXkKICAgIC8vIHNlbGYuYm94X2dhbWVfbG9iYnlbc2VsZi5nYW1lX2lkXSA9IG9wLmJ6ZXJvKAogICAgLy8gICAgIGNzdC5BRERSRVNTX1NJWkUgKiBsb2JieV9zaXplLm5hdGl2ZQogICAgLy8gKSAgIyBBc3NpZ24gemVyb2VkIGJ5dGVzIHRvIHN0b3JlIGFsbCBwbGF5ZXIgYWRkcmVzc2VzIGluIGxvYmJ5ICgzMiBieXRlcyBwZXIgcGxheWVyKQogICAgZnJhbWVfZGlnIDEKICAgIGJ6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzM4LTMzOQogICAgLy8gIyBDcmVhdGUgYSBuZXcgYm94IHN0b3JhZ2UgdW5pdCBmb3IgdGhlIGdhbWUgbG9iYnkgdy8gdGhlIGN1cnJlbnQgZ2xvYmFsIGdhbWVfaWQgdmFsdWUgYXMga2V5CiAgICAvLyBzZWxmLmJveF9nYW1lX2xvYmJ5W3NlbGYuZ2FtZV9pZF0gPSBvcC5iemVybygKICAgIGJ5dGVjIDggLy8gImxfIgogICAgZGlnIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjMzOC0zNDEKICAgIC8vICMgQ3JlYXRlIGEgbmV3IGJveCBzdG9yYWdlIHVuaXQgZm9yIHRoZSBnYW1lIGxvYmJ5IHcvIHRoZSBjdXJyZW50IGdsb2JhbCBnYW1lX2lkIHZhbHVlIGFzIGtleQogICAgLy8gc2VsZi5ib3hfZ2FtZV9sb2JieVtzZWxmLmdhbWVfaWRdID0gb3AuYnplcm8oCiAgICAvLyAgICAgY3N0LkFERFJFU1NfU0laRSAqIGxvYmJ5X3NpemUubmF0aXZlCiAgICAvLyApICAjIEFzc2lnbiB6ZXJvZWQgYnl0ZXMgdG8gc3RvcmUgYWxsIHBsYXllciBhZGRyZXNzZXMgaW4gbG9iYnkgKDMyIGJ5dGVzIHBlciBwbGF5ZXIpCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozNDUKICAgIC8vIG9wLmJ6ZXJvKGNzdC5HQU1FX0NIQVJBQ1RFUl9TSVpFICogY3N0Lk1BWF9MT0JCWV9TSVpFKQogICAgcHVzaGludCAxNjAgLy8gMTYwCiAgICBiemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjM0My0zNDQKICAgIC8vICMgQ3JlYXRlIGEgbmV3IGJveCBzdG9yYWdlIHVuaXQgZm9yIHRoZSBnYW1lIGNoYXJhY3RlcnMgdy8gdGhlIGN1cnJlbnQgZ2xvYmFsIGdhbWVfaWQgdmFsdWUgYXMga2V5CiAgICAvLyBzZWxmLmJveF9nYW1lX2NoYXJhY3RlcnNbc2VsZi5nYW1lX2lkXSA9IHRhLkdhbWVDaGFyYWN0ZXJzLmZyb21fYnl0ZXMoCiAgICBieXRlYyA1IC8vICJjXyIKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzQ4LTM2MAogICAgLy8gIyBQbGFjZSB0aGUgZ2FtZSBjcmVhdG9yIGNoYXJhY3RlciBpbiB0aGUgZmlyc3QgY2hhcmFjdGVyIHNsb3QKICAgIC8vIHNlbGYuYm94X2dhbWVfY2hhcmFjdGVyc1tzZWxmLmdhbWVfaWRdWzBdID0gc3RjLkdhbWVDaGFyYWN0ZXIoCiAgICAvLyAgICAgYXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgYXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgYXJjNC5VSW50OCg2KSwKICAgIC8vICAgICBhcmM0LlVJbnQ4KDApLCAgIyBHYW1lIGNyZWF0b3IgYWRkcmVzcyB0YWtlcyB0aGUgZmlyc3QgbG9iYnkgc2xvdAogICAgLy8gICAgIGFyYzQuVUludDgoY3N0LkFDVElPTl9OT05FKSwKICAgIC8vICAgICBhcmM0LlVJbnQ4KDUpLAogICAgLy8gICAgIGFyYzQuVUludDgoNSksICAjIFRhcmdldCBlcXVhbHMgcG9zaXRpb24gdW50aWwgYSB0dXJuIGlzIHJldmVhbGVkCiAgICAvLyAgICAgYXJjNC5VSW50OCgwKSwKICAgIC8vICAgICBhcmM0LlVJbnQ4KDEpLAogICAgLy8gICAgIGFyYzQuVUludDI1NigwKSwKICAgIC8vICkKICAgIHN3YXAKICAgIGJ5dGVjIDIxIC8vIDB4MDAwNjAwMDAwNTA1MDAwMTAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIHJlcGxhY2UyIDAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozNjYKICAgIC8vIGdhbWVfbG9iYnlfYnJlZi5yZXBsYWNlKDAsIFR4bi5zZW5kZXIuYnl0ZXMpCiAgICBpbnRjXzAgLy8gMAogICAgdHhuIFNlbmRlcgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozNjgtMzY5CiAgICAvLyAjIEluY3JlbWVudCBnYW1lIGlkIGJ5IDEgZm9yIG5leHQgbmV3IGdhbWUgaW5zdGFuY2UKICAgIC8vIHNlbGYuZ2FtZV9pZCArPSAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWNfMiAvLyAiZ2FtZV9pZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzcxCiAgICAvLyByZXR1cm4gaXNfbGlzdGVkCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKbmV3X2dhbWVfYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgbmV3X2dhbWVfYm9vbF9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLm5ld19nYW1lX3JlY29yZChib3hfbV9wYXk6IHVpbnQ2NCwgc3Rha2VfcGF5OiB1aW50NjQsIGxvYmJ5X3NpemU6IGJ5dGVzLCBjb21taXRfc2NoZW1lOiBieXRlcykgLT4gdWludDY0OgpuZXdfZ2FtZV9yZWNvcmQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6MzczLTM4MgogICAgLy8gIyBDcmVhdGUgYSBuZXcgZ2FtZSBhcyBhIHNpbmdsZSB1bmlmaWVkIGdhbWUgcmVjb3JkIGJveCwgdy8gb25lIE1CUiBwYXltZW50IGFuZCBhIHN0YWtlCiAgICAvLyAjIFJldHVybiBUcnVlIGlmIHRoZSBnYW1lIGdvdCBsaXN0ZWQgaW4gdGhlIG9wZW4gbG9iYnkgaW5kZXgsIHNhbWUgYXMgYG5ld19nYW1lYAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgbmV3X2dhbWVfcmVjb3JkKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgYm94X21fcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICAgICBzdGFrZV9wYXk6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLAogICAgLy8gICAgIGxvYmJ5X3NpemU6IGFyYzQuVUludDgsCiAgICAvLyAgICAgY29tbWl0X3NjaGVtZTogYXJjNC5VSW50OCwKICAgIC8vICkgLT4gYm9vbDoKICAgIHByb3RvIDQgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjM4My0zODQKICAgIC8vICMgRmFpbCB0cmFuc2FjdGlvbiB1bmxlc3MgdGhlIGFzc2VydGlvbiBiZWxvdyBldmFsdWF0ZXMgVHJ1ZQogICAgLy8gYXNzZXJ0IEdsb2JhbC5ncm91cF9zaXplID09IDMsIGVyci5JTlZBTElEX0dST1VQX1NJWkUKICAgIGdsb2JhbCBHcm91cFNpemUKICAgIHB1c2hpbnQgMyAvLyAzCiAgICA9PQogICAgYXNzZXJ0IC8vIEludmFsaWQgZ3JvdXAgc2l6ZS4gRW5zdXJlIG51bWJlciBvZiB0cmFuc2FjdGlvbnMgaW4gZ3JvdXAgaXMgd2l0aGluIHZhbGlkIGJvdW5kcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozODYKICAgIC8vIGFzc2VydCBib3hfbV9wYXkuYW1vdW50ID49IGNzdC5CT1hfTV9DT1NULCBlcnIuSU5TVUZGSUNJRU5UX1BBWV9BTU9VTlQKICAgIGZyYW1lX2RpZyAtNAogICAgZ3R4bnMgQW1vdW50CiAgICBwdXNoaW50IDE3MjUwMCAvLyAxNzI1MDAKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IHBheW1lbnQgYW1vdW50LiBWYWx1ZSBpcyBub3QgZW5vdWdoIHRvIGNvdmVyIHRoZSBtaW5pbXVtIHJlcXVpcmVtZW50cy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozODgKICAgIC8vIGFzc2VydCBib3hfbV9wYXkuc2VuZGVyID09IFR4bi5zZW5kZXIsIGVyci5JTlZBTElEX0JPWF9QQVlfU0VOREVSCiAgICBmcmFtZV9kaWcgLTQKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBCb3ggcGF5bWVudCBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIHRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjM4OQogICAgLy8gYXNzZXJ0IHN0YWtlX3BheS5zZW5kZXIgPT0gVHhuLnNlbmRlciwgZXJyLklOVkFMSURfU1RBS0VfUEFZX1NFTkRFUgogICAgZnJhbWVfZGlnIC0zCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gU3Rha2UgcGF5bWVudCBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIHNlbmRlciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjM5MgogICAgLy8gYm94X21fcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtNAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjM5MS0zOTMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYm94X21fcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksIGVyci5JTlZBTElEX0JPWF9QQVlfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBCb3ggcGF5bWVudCByZWNlaXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozOTUKICAgIC8vIHN0YWtlX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTMKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozOTQtMzk2CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHN0YWtlX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuSU5WQUxJRF9CT1hfUEFZX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gQm94IHBheW1lbnQgcmVjZWl2ZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Mzk5CiAgICAvLyBsb2JieV9zaXplID49IGNzdC5NSU5fTE9CQllfU0laRQogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlYyAxMSAvLyAweDAyCiAgICBiPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozOTktNDAxCiAgICAvLyBsb2JieV9zaXplID49IGNzdC5NSU5fTE9CQllfU0laRQogICAgLy8gYW5kIGxvYmJ5X3NpemUgPD0gY3N0Lk1BWF9MT0JCWV9TSVpFCiAgICAvLyBhbmQgbG9iYnlfc2l6ZS5uYXRpdmUgJSAyID09IDAKICAgIGJ6IG5ld19nYW1lX3JlY29yZF9ib29sX2ZhbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0MDAKICAgIC8vIGFuZCBsb2JieV9zaXplIDw9IGNzdC5NQVhfTE9CQllfU0laRQogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlYyAxMiAvLyAweDA0CiAgICBiPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTozOTktNDAxCiAgICAvLyBsb2JieV9zaXplID49IGNzdC5NSU5fTE9CQllfU0laRQogICAgLy8gYW5kIGxvYmJ5X3NpemUgPD0gY3N0Lk1BWF9MT0JCWV9TSVpFCiAgICAvLyBhbmQgbG9iYnlfc2l6ZS5uYXRpdmUgJSAyID09IDAKICAgIGJ6IG5ld19nYW1lX3JlY29yZF9ib29sX2ZhbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0MDEKICAgIC8vIGFuZCBsb2JieV9zaXplLm5hdGl2ZSAlIDIgPT0gMAogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBpbnRjXzMgLy8gMgogICAgJQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjM5OS00MDEKICAgIC8vIGxvYmJ5X3NpemUgPj0gY3N0Lk1JTl9MT0JCWV9TSVpFCiAgICAvLyBhbmQgbG9iYnlfc2l6ZSA8PSBjc3QuTUFYX0xPQkJZX1NJWkUKICAgIC8vIGFuZCBsb2JieV9zaXplLm5hdGl2ZSAlIDIgPT0gMAogICAgYm56IG5ld19nYW1lX3JlY29yZF9ib29sX2ZhbHNlQDQKICAgIGludGNfMSAvLyAxCgpuZXdfZ2FtZV9yZWNvcmRfYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjM5OC00MDIKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbG9iYnlfc2l6ZSA+PSBjc3QuTUlOX0xPQkJZX1NJWkUKICAgIC8vICAgICBhbmQgbG9iYnlfc2l6ZSA8PSBjc3QuTUFYX0xPQkJZX1NJWkUKICAgIC8vICAgICBhbmQgbG9iYnlfc2l6ZS5uYXRpdmUgJSAyID09IDAKICAgIC8vICksIGVyci5JTlZBTElEX0xPQkJZX1NJWkUKICAgIGFzc2VydCAvLyBJbnZhbGlkIExvYmJ5IHNpemUuIFZhbHVlIG11c3QgYmUgYW4gZXZlbiBudW1iZXIgYW5kIHdpdGhpbiBwZXJtaXR0ZWQgYm91bmRzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQwNAogICAgLy8gY29tbWl0X3NjaGVtZS5uYXRpdmUgPD0gY3N0LkNPTU1JVF9TQ0hFTUVfU0hBNTEyXzI1NgogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBpbnRjXzMgLy8gMgogICAgPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0MDMtNDA1CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGNvbW1pdF9zY2hlbWUubmF0aXZlIDw9IGNzdC5DT01NSVRfU0NIRU1FX1NIQTUxMl8yNTYKICAgIC8vICksIGVyci5JTlZBTElEX0NPTU1JVF9TQ0hFTUUKICAgIGFzc2VydCAvLyBJbnZhbGlkIGNvbW1pdCBzY2hlbWUuIEVuc3VyZSB0aGUgc2NoZW1lIGlzIE1pTUMgKDApLCBzaGEyNTYgKDEpIG9yIHNoYTUxMl8yNTYgKDIpLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQxMAogICAgLy8ga2V5PXNlbGYuYm94X2dhbWVfcmVjb3JkLmtleV9wcmVmaXggKyBvcC5pdG9iKHNlbGYuZ2FtZV9pZCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJnYW1lX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVfaWQgZXhpc3RzCiAgICBpdG9iCiAgICBieXRlYyA3IC8vICJtXyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0MDctNDExCiAgICAvLyAjIENyZWF0ZSBhIG5ldyB6ZXJvZWQgYm94IHN0b3JhZ2UgdW5pdCBmb3IgdGhlIGdhbWUgcmVjb3JkIHcvIHRoZSBjdXJyZW50IGdsb2JhbCBnYW1lX2lkIHZhbHVlIGFzIGtleQogICAgLy8gIyBUaGUgemVyb2VkIGdyaWQgc2VjdGlvbiBpcyBhbiBhbGwgcGF0aCBjZWxscyBncmlkLCBzYW1lIGFzIGEgbmV3IGBib3hfZ2FtZV9ncmlkYCB2YWx1ZQogICAgLy8gZ2FtZV9yZWNvcmRfYnJlZiA9IEJveFJlZigKICAgIC8vICAgICBrZXk9c2VsZi5ib3hfZ2FtZV9yZWNvcmQua2V5X3ByZWZpeCArIG9wLml0b2Ioc2VsZi5nYW1lX2lkKQogICAgLy8gKQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQxMAogICAgLy8ga2V5PXNlbGYuYm94X2dhbWVfcmVjb3JkLmtleV9wcmVmaXggKyBvcC5pdG9iKHNlbGYuZ2FtZV9pZCkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQxMgogICAgLy8gZ2FtZV9yZWNvcmRfYnJlZi5jcmVhdGUoc2l6ZT1jc3QuR0FNRV9SRUNPUkRfU0laRSkKICAgIGR1cAogICAgcHVzaGludCA0MTUgLy8gNDE1CiAgICBib3hfY3JlYXRlCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0MTQtNDE1CiAgICAvLyAjIExpc3QgdGhlIGdhbWUgaW4gdGhlIG9wZW4gbG9iYnkgaW5kZXgsIHVuZGVyIGl0cyBsb2JieSBzaXplIGFuZCBzdGFrZSB0aWVyIGJ1Y2tldAogICAgLy8gc3Rha2VfdGllciA9IHNydC5nZXRfc3Rha2VfdGllcihzdGFrZV9wYXkuYW1vdW50KQogICAgZnJhbWVfZGlnIC0zCiAgICBndHhucyBBbW91bnQKICAgIGR1cAogICAgY2FsbHN1YiBnZXRfc3Rha2VfdGllcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQxOAogICAgLy8gc3J0LmdldF9vcGVuX2xvYmJ5X2J1Y2tldChsb2JieV9zaXplLm5hdGl2ZSwgc3Rha2VfdGllciksCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo1NDQKICAgIC8vIHJldHVybiAobG9iYnlfc2l6ZSAvLyAyIC0gMSkgKiBjc3QuU1RBS0VfVElFUl9DT1VOVCArIHN0YWtlX3RpZXIKICAgIGludGNfMyAvLyAyCiAgICAvCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgaW50Y18yIC8vIDQKICAgICoKICAgIGRpZyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDE5CiAgICAvLyBzZWxmLmdhbWVfaWQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiZ2FtZV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lX2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQxNwogICAgLy8gc2VsZi5ib3hfb3Blbl9sb2JiaWVzLAogICAgYnl0ZWMgMTAgLy8gIm9fIgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQxNi00MjAKICAgIC8vIGlzX2xpc3RlZCA9IHNydC5hZGRfb3Blbl9sb2JieSgKICAgIC8vICAgICBzZWxmLmJveF9vcGVuX2xvYmJpZXMsCiAgICAvLyAgICAgc3J0LmdldF9vcGVuX2xvYmJ5X2J1Y2tldChsb2JieV9zaXplLm5hdGl2ZSwgc3Rha2VfdGllciksCiAgICAvLyAgICAgc2VsZi5nYW1lX2lkLAogICAgLy8gKQogICAgY292ZXIgMgogICAgY2FsbHN1YiBhZGRfb3Blbl9sb2JieQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQzMQogICAgLy8gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBjc3QuUEhBU0VfRVhQSVJZX0lOVEVSVkFMCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpbnRjIDYgLy8gMTIwMAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQzMC00MzIKICAgIC8vIGV4cGlyeV90cz1hcmM0LlVJbnQ2NCgKICAgIC8vICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCArIGNzdC5QSEFTRV9FWFBJUllfSU5URVJWQUwKICAgIC8vICksCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDMzCiAgICAvLyBwcml6ZV9wb3Q9YXJjNC5VSW50NjQoc3Rha2VfcGF5LmFtb3VudCksCiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0MzQKICAgIC8vIGFkbWluX2FkZHJlc3M9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQzNwogICAgLy8gc3Rha2VfdGllcj1hcmM0LlVJbnQ4KHN0YWtlX3RpZXIpLAogICAgdW5jb3ZlciA0CiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDM4CiAgICAvLyBvcGVuX2xvYmJ5X2xpc3RlZD1hcmM0LkJvb2woaXNfbGlzdGVkKSwKICAgIGJ5dGVjXzAgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIGRpZyA2CiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0MjYKICAgIC8vIHN0YWtpbmdfY2xvc2VkPWFyYzQuQm9vbChGYWxzZSksICAjIG5vcWE6IEZCVDAwMwogICAgYnl0ZWNfMCAvLyAweDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDI1LTQ0MAogICAgLy8gc3RjLkdhbWVTdGF0ZSgKICAgIC8vICAgICBzdGFraW5nX2Nsb3NlZD1hcmM0LkJvb2woRmFsc2UpLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICBsb2JieV9zaXplPWxvYmJ5X3NpemUsCiAgICAvLyAgICAgYWN0aXZlX3BsYXllcnM9YXJjNC5VSW50OCgxKSwKICAgIC8vICAgICBib3hfbF9zdGFydF9wb3M9YXJjNC5VSW50MTYoY3N0LkFERFJFU1NfU0laRSksCiAgICAvLyAgICAgZXhwaXJ5X3RzPWFyYzQuVUludDY0KAogICAgLy8gICAgICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCArIGNzdC5QSEFTRV9FWFBJUllfSU5URVJWQUwKICAgIC8vICAgICApLAogICAgLy8gICAgIHByaXplX3BvdD1hcmM0LlVJbnQ2NChzdGFrZV9wYXkuYW1vdW50KSwKICAgIC8vICAgICBhZG1pbl9hZGRyZXNzPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBncmlkX3Jvb3Q9YXJjNC5VSW50MjU2LmZyb21fYnl0ZXMoY3N0LkVNUFRZX0dSSURfUk9PVCksCiAgICAvLyAgICAgY29tbWl0X3NjaGVtZT1jb21taXRfc2NoZW1lLAogICAgLy8gICAgIHN0YWtlX3RpZXI9YXJjNC5VSW50OChzdGFrZV90aWVyKSwKICAgIC8vICAgICBvcGVuX2xvYmJ5X2xpc3RlZD1hcmM0LkJvb2woaXNfbGlzdGVkKSwKICAgIC8vICAgICByb3VuZF9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkuYnl0ZXMsCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQyOAogICAgLy8gYWN0aXZlX3BsYXllcnM9YXJjNC5VSW50OCgxKSwKICAgIGJ5dGVjIDE0IC8vIDB4MDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0MjUtNDQwCiAgICAvLyBzdGMuR2FtZVN0YXRlKAogICAgLy8gICAgIHN0YWtpbmdfY2xvc2VkPWFyYzQuQm9vbChGYWxzZSksICAjIG5vcWE6IEZCVDAwMwogICAgLy8gICAgIGxvYmJ5X3NpemU9bG9iYnlfc2l6ZSwKICAgIC8vICAgICBhY3RpdmVfcGxheWVycz1hcmM0LlVJbnQ4KDEpLAogICAgLy8gICAgIGJveF9sX3N0YXJ0X3Bvcz1hcmM0LlVJbnQxNihjc3QuQUREUkVTU19TSVpFKSwKICAgIC8vICAgICBleHBpcnlfdHM9YXJjNC5VSW50NjQoCiAgICAvLyAgICAgICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wICsgY3N0LlBIQVNFX0VYUElSWV9JTlRFUlZBTAogICAgLy8gICAgICksCiAgICAvLyAgICAgcHJpemVfcG90PWFyYzQuVUludDY0KHN0YWtlX3BheS5hbW91bnQpLAogICAgLy8gICAgIGFkbWluX2FkZHJlc3M9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGdyaWRfcm9vdD1hcmM0LlVJbnQyNTYuZnJvbV9ieXRlcyhjc3QuRU1QVFlfR1JJRF9ST09UKSwKICAgIC8vICAgICBjb21taXRfc2NoZW1lPWNvbW1pdF9zY2hlbWUsCiAgICAvLyAgICAgc3Rha2VfdGllcj1hcmM0LlVJbnQ4KHN0YWtlX3RpZXIpLAogICAgLy8gICAgIG9wZW5fbG9iYnlfbGlzdGVkPWFyYzQuQm9vbChpc19saXN0ZWQpLAogICAgLy8gICAgIHJvdW5kX2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gKS5ieXRlcywKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQyOQogICAgLy8gYm94X2xfc3RhcnRfcG9zPWFyYzQuVUludDE2KGNzdC5BRERSRVNTX1NJWkUpLAogICAgYnl0ZWMgMTggLy8gMHgwMDIwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDI1LTQ0MAogICAgLy8gc3RjLkdhbWVTdGF0ZSgKICAgIC8vICAgICBzdGFraW5nX2Nsb3NlZD1hcmM0LkJvb2woRmFsc2UpLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICBsb2JieV9zaXplPWxvYmJ5X3NpemUsCiAgICAvLyAgICAgYWN0aXZlX3BsYXllcnM9YXJjNC5VSW50OCgxKSwKICAgIC8vICAgICBib3hfbF9zdGFydF9wb3M9YXJjNC5VSW50MTYoY3N0LkFERFJFU1NfU0laRSksCiAgICAvLyAgICAgZXhwaXJ5X3RzPWFyYzQuVUludDY0KAogICAgLy8gICAgICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCArIGNzdC5QSEFTRV9FWFBJUllfSU5URVJWQUwKICAgIC8vICAgICApLAogICAgLy8gICAgIHByaXplX3BvdD1hcmM0LlVJbnQ2NChzdGFrZV9wYXkuYW1vdW50KSwKICAgIC8vICAgICBhZG1pbl9hZGRyZXNzPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBncmlkX3Jvb3Q9YXJjNC5VSW50MjU2LmZyb21fYnl0ZXMoY3N0LkVNUFRZX0dSSURfUk9PVCksCiAgICAvLyAgICAgY29tbWl0X3NjaGVtZT1jb21taXRfc2NoZW1lLAogICAgLy8gICAgIHN0YWtlX3RpZXI9YXJjNC5VSW50OChzdGFrZV90aWVyKSwKICAgIC8vICAgICBvcGVuX2xvYmJ5X2xpc3RlZD1hcmM0LkJvb2woaXNfbGlzdGVkKSwKICAgIC8vICAgICByb3VuZF9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkuYnl0ZXMsCiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0MzUKICAgIC8vIGdyaWRfcm9vdD1hcmM0LlVJbnQyNTYuZnJvbV9ieXRlcyhjc3QuRU1QVFlfR1JJRF9ST09UKSwKICAgIGJ5dGVjIDE5IC8vIDB4Mjg4NmNlY2QzYjI4YWY5MzIyZmJhMTA0Zjc4NzBlZDFmMzBiNTExZWVjN2RmMTRhYWExYTQ3MDdhZjQ1YjU0YgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQyNS00NDAKICAgIC8vIHN0Yy5HYW1lU3RhdGUoCiAgICAvLyAgICAgc3Rha2luZ19jbG9zZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgbG9iYnlfc2l6ZT1sb2JieV9zaXplLAogICAgLy8gICAgIGFjdGl2ZV9wbGF5ZXJzPWFyYzQuVUludDgoMSksCiAgICAvLyAgICAgYm94X2xfc3RhcnRfcG9zPWFyYzQuVUludDE2KGNzdC5BRERSRVNTX1NJWkUpLAogICAgLy8gICAgIGV4cGlyeV90cz1hcmM0LlVJbnQ2NCgKICAgIC8vICAgICAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBjc3QuUEhBU0VfRVhQSVJZX0lOVEVSVkFMCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBwcml6ZV9wb3Q9YXJjNC5VSW50NjQoc3Rha2VfcGF5LmFtb3VudCksCiAgICAvLyAgICAgYWRtaW5fYWRkcmVzcz1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgZ3JpZF9yb290PWFyYzQuVUludDI1Ni5mcm9tX2J5dGVzKGNzdC5FTVBUWV9HUklEX1JPT1QpLAogICAgLy8gICAgIGNvbW1pdF9zY2hlbWU9Y29tbWl0X3NjaGVtZSwKICAgIC8vICAgICBzdGFrZV90aWVyPWFyYzQuVUludDgoc3Rha2VfdGllciksCiAgICAvLyAgICAgb3Blbl9sb2JieV9saXN0ZWQ9YXJjNC5Cb29sKGlzX2xpc3RlZCksCiAgICAvLyAgICAgcm91bmRfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyApLmJ5dGVzLAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQzOQogICAgLy8gcm91bmRfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICBieXRlYyAyMCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0MjUtNDQwCiAgICAvLyBzdGMuR2FtZVN0YXRlKAogICAgLy8gICAgIHN0YWtpbmdfY2xvc2VkPWFyYzQuQm9vbChGYWxzZSksICAjIG5vcWE6IEZCVDAwMwogICAgLy8gICAgIGxvYmJ5X3NpemU9bG9iYnlfc2l6ZSwKICAgIC8vICAgICBhY3RpdmVfcGxheWVycz1hcmM0LlVJbnQ4KDEpLAogICAgLy8gICAgIGJveF9sX3N0YXJ0X3Bvcz1hcmM0LlVJbnQxNihjc3QuQUREUkVTU19TSVpFKSwKICAgIC8vICAgICBleHBpcnlfdHM9YXJjNC5VSW50NjQoCiAgICAvLyAgICAgICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wICsgY3N0LlBIQVNFX0VYUElSWV9JTlRFUlZBTAogICAgLy8gICAgICksCiAgICAvLyAgICAgcHJpemVfcG90PWFyYzQuVUludDY0KHN0YWtlX3BheS5hbW91bnQpLAogICAgLy8gICAgIGFkbWluX2FkZHJlc3M9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGdyaWRfcm9vdD1hcmM0LlVJbnQyNTYuZnJvbV9ieXRlcyhjc3QuRU1QVFlfR1JJRF9ST09UKSwKICAgIC8vICAgICBjb21taXRfc2NoZW1lPWNvbW1pdF9zY2hlbWUsCiAgICAvLyAgICAgc3Rha2VfdGllcj1hcmM0LlVJbnQ4KHN0YWtlX3RpZXIpLAogICAgLy8gICAgIG9wZW5fbG9iYnlfbGlzdGVkPWFyYzQuQm9vbChpc19saXN0ZWQpLAogICAgLy8gICAgIHJvdW5kX2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gKS5ieXRlcywKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQyMi00NDEKICAgIC8vICMgUGF0Y2ggdGhlIGdhbWUgc3RhdGUgc2VjdGlvbgogICAgLy8gZ2FtZV9yZWNvcmRfYnJlZi5yZXBsYWNlKAogICAgLy8gICAgIGNzdC5HQU1FX1JFQ09SRF9TVEFURV9PRkZTRVQsCiAgICAvLyAgICAgc3RjLkdhbWVTdGF0ZSgKICAgIC8vICAgICAgICAgc3Rha2luZ19jbG9zZWQ9YXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgICAgIGxvYmJ5X3NpemU9bG9iYnlfc2l6ZSwKICAgIC8vICAgICAgICAgYWN0aXZlX3BsYXllcnM9YXJjNC5VSW50OCgxKSwKICAgIC8vICAgICAgICAgYm94X2xfc3RhcnRfcG9zPWFyYzQuVUludDE2KGNzdC5BRERSRVNTX1NJWkUpLAogICAgLy8gICAgICAgICBleHBpcnlfdHM9YXJjNC5VSW50NjQoCiAgICAvLyAgICAgICAgICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCArIGNzdC5QSEFTRV9FWFBJUllfSU5URVJWQUwKICAgIC8vICAgICAgICAgKSwKICAgIC8vICAgICAgICAgcHJpemVfcG90PWFyYzQuVUludDY0KHN0YWtlX3BheS5hbW91bnQpLAogICAgLy8gICAgICAgICBhZG1pbl9hZGRyZXNzPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgZ3JpZF9yb290PWFyYzQuVUludDI1Ni5mcm9tX2J5dGVzKGNzdC5FTVBUWV9HUklEX1JPT1QpLAogICAgLy8gICAgICAgICBjb21taXRfc2NoZW1lPWNvbW1pdF9zY2hlbWUsCiAgICAvLyAgICAgICAgIHN0YWtlX3RpZXI9YXJjNC5VSW50OChzdGFrZV90aWVyKSwKICAgIC8vICAgICAgICAgb3Blbl9sb2JieV9saXN0ZWQ9YXJjNC5Cb29sKGlzX2xpc3RlZCksCiAgICAvLyAgICAgICAgIHJvdW5kX2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgICkuYnl0ZXMsCiAgICAvLyApCiAgICBkaWcgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQyNAogICAgLy8gY3N0LkdBTUVfUkVDT1JEX1NUQVRFX09GRlNFVCwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDIyLTQ0MQogICAgLy8gIyBQYXRjaCB0aGUgZ2FtZSBzdGF0ZSBzZWN0aW9uCiAgICAvLyBnYW1lX3JlY29yZF9icmVmLnJlcGxhY2UoCiAgICAvLyAgICAgY3N0LkdBTUVfUkVDT1JEX1NUQVRFX09GRlNFVCwKICAgIC8vICAgICBzdGMuR2FtZVN0YXRlKAogICAgLy8gICAgICAgICBzdGFraW5nX2Nsb3NlZD1hcmM0LkJvb2woRmFsc2UpLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICAgICAgbG9iYnlfc2l6ZT1sb2JieV9zaXplLAogICAgLy8gICAgICAgICBhY3RpdmVfcGxheWVycz1hcmM0LlVJbnQ4KDEpLAogICAgLy8gICAgICAgICBib3hfbF9zdGFydF9wb3M9YXJjNC5VSW50MTYoY3N0LkFERFJFU1NfU0laRSksCiAgICAvLyAgICAgICAgIGV4cGlyeV90cz1hcmM0LlVJbnQ2NCgKICAgIC8vICAgICAgICAgICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wICsgY3N0LlBIQVNFX0VYUElSWV9JTlRFUlZBTAogICAgLy8gICAgICAgICApLAogICAgLy8gICAgICAgICBwcml6ZV9wb3Q9YXJjNC5VSW50NjQoc3Rha2VfcGF5LmFtb3VudCksCiAgICAvLyAgICAgICAgIGFkbWluX2FkZHJlc3M9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBncmlkX3Jvb3Q9YXJjNC5VSW50MjU2LmZyb21fYnl0ZXMoY3N0LkVNUFRZX0dSSURfUk9PVCksCiAgICAvLyAgICAgICAgIGNvbW1pdF9zY2hlbWU9Y29tbWl0X3NjaGVtZSwKICAgIC8vICAgICAgICAgc3Rha2VfdGllcj1hcmM0LlVJbnQ4KHN0YWtlX3RpZXIpLAogICAgLy8gICAgICAgICBvcGVuX2xvYmJ5X2xpc3RlZD1hcmM0LkJvb2woaXNfbGlzdGVkKSwKICAgIC8vICAgICAgICAgcm91bmRfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgKS5ieXRlcywKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0NDUKICAgIC8vIHNydC5nYW1lX3JlY29yZF9sb2JieV9vZmZzZXQoVUludDY0KDApKSwgVHhuLnNlbmRlci5ieXRlcwogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQ0My00NDYKICAgIC8vICMgUGF0Y2ggdGhlIGZpcnN0IGxvYmJ5IHNsb3Qgdy8gdGhlIHNlbmRlciBhZGRyZXNzIGJ5dGVzCiAgICAvLyBnYW1lX3JlY29yZF9icmVmLnJlcGxhY2UoCiAgICAvLyAgICAgc3J0LmdhbWVfcmVjb3JkX2xvYmJ5X29mZnNldChVSW50NjQoMCkpLCBUeG4uc2VuZGVyLmJ5dGVzCiAgICAvLyApCiAgICBkaWcgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjUwMAogICAgLy8gcmV0dXJuIGNzdC5HQU1FX1JFQ09SRF9MT0JCWV9PRkZTRVQgKyBsb2JieV9zbG90ICogY3N0LkFERFJFU1NfU0laRQogICAgcHVzaGludCA5NiAvLyA5NgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQ0My00NDYKICAgIC8vICMgUGF0Y2ggdGhlIGZpcnN0IGxvYmJ5IHNsb3Qgdy8gdGhlIHNlbmRlciBhZGRyZXNzIGJ5dGVzCiAgICAvLyBnYW1lX3JlY29yZF9icmVmLnJlcGxhY2UoCiAgICAvLyAgICAgc3J0LmdhbWVfcmVjb3JkX2xvYmJ5X29mZnNldChVSW50NjQoMCkpLCBUeG4uc2VuZGVyLmJ5dGVzCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDQ4LTQ2MwogICAgLy8gIyBQYXRjaCB0aGUgZmlyc3QgY2hhcmFjdGVyIHNsb3Qgdy8gdGhlIGdhbWUgY3JlYXRvciBjaGFyYWN0ZXIKICAgIC8vIGdhbWVfcmVjb3JkX2JyZWYucmVwbGFjZSgKICAgIC8vICAgICBzcnQuZ2FtZV9yZWNvcmRfY2hhcmFjdGVyX29mZnNldChVSW50NjQoMCkpLAogICAgLy8gICAgIHN0Yy5HYW1lQ2hhcmFjdGVyKAogICAgLy8gICAgICAgICBhcmM0LkJvb2woRmFsc2UpLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICAgICAgYXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgICAgIGFyYzQuVUludDgoNiksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDgoMCksICAjIEdhbWUgY3JlYXRvciBhZGRyZXNzIHRha2VzIHRoZSBmaXJzdCBsb2JieSBzbG90CiAgICAvLyAgICAgICAgIGFyYzQuVUludDgoY3N0LkFDVElPTl9OT05FKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50OCg1KSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50OCg1KSwgICMgVGFyZ2V0IGVxdWFscyBwb3NpdGlvbiB1bnRpbCBhIHR1cm4gaXMgcmV2ZWFsZWQKICAgIC8vICAgICAgICAgYXJjNC5VSW50OCgwKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50OCgxKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50MjU2KDApLAogICAgLy8gICAgICkuYnl0ZXMsCiAgICAvLyApCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTA2CiAgICAvLyByZXR1cm4gY3N0LkdBTUVfUkVDT1JEX0NIQVJBQ1RFUlNfT0ZGU0VUICsgbG9iYnlfc2xvdCAqIGNzdC5HQU1FX0NIQVJBQ1RFUl9TSVpFCiAgICBpbnRjIDQgLy8gMjU1CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDUxLTQ2MgogICAgLy8gc3RjLkdhbWVDaGFyYWN0ZXIoCiAgICAvLyAgICAgYXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgYXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgYXJjNC5VSW50OCg2KSwKICAgIC8vICAgICBhcmM0LlVJbnQ4KDApLCAgIyBHYW1lIGNyZWF0b3IgYWRkcmVzcyB0YWtlcyB0aGUgZmlyc3QgbG9iYnkgc2xvdAogICAgLy8gICAgIGFyYzQuVUludDgoY3N0LkFDVElPTl9OT05FKSwKICAgIC8vICAgICBhcmM0LlVJbnQ4KDUpLAogICAgLy8gICAgIGFyYzQuVUludDgoNSksICAjIFRhcmdldCBlcXVhbHMgcG9zaXRpb24gdW50aWwgYSB0dXJuIGlzIHJldmVhbGVkCiAgICAvLyAgICAgYXJjNC5VSW50OCgwKSwKICAgIC8vICAgICBhcmM0LlVJbnQ4KDEpLAogICAgLy8gICAgIGFyYzQuVUludDI1NigwKSwKICAgIC8vICkuYnl0ZXMsCiAgICBieXRlYyAyMSAvLyAweDAwMDYwMDAwMDUwNTAwMDEwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDQ4LTQ2MwogICAgLy8gIyBQYXRjaCB0aGUgZmlyc3QgY2hhcmFjdGVyIHNsb3Qgdy8gdGhlIGdhbWUgY3JlYXRvciBjaGFyYWN0ZXIKICAgIC8vIGdhbWVfcmVjb3JkX2JyZWYucmVwbGFjZSgKICAgIC8vICAgICBzcnQuZ2FtZV9yZWNvcmRfY2hhcmFjdGVyX29mZnNldChVSW50NjQoMCkpLAogICAgLy8gICAgIHN0Yy5HYW1lQ2hhcmFjdGVyKAogICAgLy8gICAgICAgICBhcmM0LkJvb2woRmFsc2UpLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICAgICAgYXJjNC5Cb29sKEZhbHNlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgICAgIGFyYzQuVUludDgoNiksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDgoMCksICAjIEdhbWUgY3JlYXRvciBhZGRyZXNzIHRha2VzIHRoZSBmaXJzdCBsb2JieSBzbG90CiAgICAvLyAgICAgICAgIGFyYzQuVUludDgoY3N0LkFDVElPTl9OT05FKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50OCg1KSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50OCg1KSwgICMgVGFyZ2V0IGVxdWFscyBwb3NpdGlvbiB1bnRpbCBhIHR1cm4gaXMgcmV2ZWFsZWQKICAgIC8vICAgICAgICAgYXJjNC5VSW50OCgwKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50OCgxKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50MjU2KDApLAogICAgLy8gICAgICkuYnl0ZXMsCiAgICAvLyApCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQ2NS00NjYKICAgIC8vICMgSW5jcmVtZW50IGdhbWUgaWQgYnkgMSBmb3IgbmV4dCBuZXcgZ2FtZSBpbnN0YW5jZQogICAgLy8gc2VsZi5nYW1lX2lkICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJnYW1lX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVfaWQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWNfMiAvLyAiZ2FtZV9pZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDY4CiAgICAvLyByZXR1cm4gaXNfbGlzdGVkCiAgICByZXRzdWIKCm5ld19nYW1lX3JlY29yZF9ib29sX2ZhbHNlQDQ6CiAgICBpbnRjXzAgLy8gMAogICAgYiBuZXdfZ2FtZV9yZWNvcmRfYm9vbF9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLmNyZWF0ZV9vcGVuX2xvYmJ5X2luZGV4KGJveF9vX3BheTogdWludDY0LCBsb2JieV9zaXplOiBieXRlcywgc3Rha2VfdGllcjogYnl0ZXMpIC0+IHZvaWQ6CmNyZWF0ZV9vcGVuX2xvYmJ5X2luZGV4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQ3MC00NzgKICAgIC8vICMgQ3JlYXRlIHRoZSBvcGVuIGxvYmJ5IGluZGV4IGJveCBvZiBhIChsb2JieV9zaXplLCBzdGFrZSB0aWVyKSBidWNrZXQsIHcvIG9uZSBNQlIgcGF5bWVudAogICAgLy8gIyBBbnlvbmUgbWF5IGZ1bmQgYSBidWNrZXQ7IGdhbWVzIGNyZWF0ZWQgYmVmb3JlIGl0IGV4aXN0cyBhcmUgbm90IGxpc3RlZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY3JlYXRlX29wZW5fbG9iYnlfaW5kZXgoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBib3hfb19wYXk6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLAogICAgLy8gICAgIGxvYmJ5X3NpemU6IGFyYzQuVUludDgsCiAgICAvLyAgICAgc3Rha2VfdGllcjogYXJjNC5VSW50OCwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQ3OS00ODAKICAgIC8vICMgRmFpbCB0cmFuc2FjdGlvbiB1bmxlc3MgdGhlIGFzc2VydGlvbnMgYmVsb3cgZXZhbHVhdGUgVHJ1ZQogICAgLy8gYXNzZXJ0IEdsb2JhbC5ncm91cF9zaXplID09IDIsIGVyci5JTlZBTElEX0dST1VQX1NJWkUKICAgIGdsb2JhbCBHcm91cFNpemUKICAgIGludGNfMyAvLyAyCiAgICA9PQogICAgYXNzZXJ0IC8vIEludmFsaWQgZ3JvdXAgc2l6ZS4gRW5zdXJlIG51bWJlciBvZiB0cmFuc2FjdGlvbnMgaW4gZ3JvdXAgaXMgd2l0aGluIHZhbGlkIGJvdW5kcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0ODIKICAgIC8vIGFzc2VydCBib3hfb19wYXkuYW1vdW50ID49IGNzdC5CT1hfT19DT1NULCBlcnIuSU5TVUZGSUNJRU5UX1BBWV9BTU9VTlQKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgQW1vdW50CiAgICBwdXNoaW50IDIxNDUwMCAvLyAyMTQ1MDAKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IHBheW1lbnQgYW1vdW50LiBWYWx1ZSBpcyBub3QgZW5vdWdoIHRvIGNvdmVyIHRoZSBtaW5pbXVtIHJlcXVpcmVtZW50cy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0ODMKICAgIC8vIGFzc2VydCBib3hfb19wYXkuc2VuZGVyID09IFR4bi5zZW5kZXIsIGVyci5JTlZBTElEX0JPWF9QQVlfU0VOREVSCiAgICBmcmFtZV9kaWcgLTMKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBCb3ggcGF5bWVudCBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIHRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQ4NQogICAgLy8gYm94X29fcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQ4NC00ODYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYm94X29fcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksIGVyci5JTlZBTElEX0JPWF9QQVlfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBCb3ggcGF5bWVudCByZWNlaXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0ODkKICAgIC8vIGxvYmJ5X3NpemUgPj0gY3N0Lk1JTl9MT0JCWV9TSVpFCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ5dGVjIDExIC8vIDB4MDIKICAgIGI+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQ4OS00OTEKICAgIC8vIGxvYmJ5X3NpemUgPj0gY3N0Lk1JTl9MT0JCWV9TSVpFCiAgICAvLyBhbmQgbG9iYnlfc2l6ZSA8PSBjc3QuTUFYX0xPQkJZX1NJWkUKICAgIC8vIGFuZCBsb2JieV9zaXplLm5hdGl2ZSAlIDIgPT0gMAogICAgYnogY3JlYXRlX29wZW5fbG9iYnlfaW5kZXhfYm9vbF9mYWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDkwCiAgICAvLyBhbmQgbG9iYnlfc2l6ZSA8PSBjc3QuTUFYX0xPQkJZX1NJWkUKICAgIGZyYW1lX2RpZyAtMgogICAgYnl0ZWMgMTIgLy8gMHgwNAogICAgYjw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDg5LTQ5MQogICAgLy8gbG9iYnlfc2l6ZSA+PSBjc3QuTUlOX0xPQkJZX1NJWkUKICAgIC8vIGFuZCBsb2JieV9zaXplIDw9IGNzdC5NQVhfTE9CQllfU0laRQogICAgLy8gYW5kIGxvYmJ5X3NpemUubmF0aXZlICUgMiA9PSAwCiAgICBieiBjcmVhdGVfb3Blbl9sb2JieV9pbmRleF9ib29sX2ZhbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0OTEKICAgIC8vIGFuZCBsb2JieV9zaXplLm5hdGl2ZSAlIDIgPT0gMAogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBpbnRjXzMgLy8gMgogICAgJQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjQ4OS00OTEKICAgIC8vIGxvYmJ5X3NpemUgPj0gY3N0Lk1JTl9MT0JCWV9TSVpFCiAgICAvLyBhbmQgbG9iYnlfc2l6ZSA8PSBjc3QuTUFYX0xPQkJZX1NJWkUKICAgIC8vIGFuZCBsb2JieV9zaXplLm5hdGl2ZSAlIDIgPT0gMAogICAgYm56IGNyZWF0ZV9vcGVuX2xvYmJ5X2luZGV4X2Jvb2xfZmFsc2VANAogICAgaW50Y18xIC8vIDEKCmNyZWF0ZV9vcGVuX2xvYmJ5X2luZGV4X2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0ODgtNDkyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGxvYmJ5X3NpemUgPj0gY3N0Lk1JTl9MT0JCWV9TSVpFCiAgICAvLyAgICAgYW5kIGxvYmJ5X3NpemUgPD0gY3N0Lk1BWF9MT0JCWV9TSVpFCiAgICAvLyAgICAgYW5kIGxvYmJ5X3NpemUubmF0aXZlICUgMiA9PSAwCiAgICAvLyApLCBlcnIuSU5WQUxJRF9MT0JCWV9TSVpFCiAgICBhc3NlcnQgLy8gSW52YWxpZCBMb2JieSBzaXplLiBWYWx1ZSBtdXN0IGJlIGFuIGV2ZW4gbnVtYmVyIGFuZCB3aXRoaW4gcGVybWl0dGVkIGJvdW5kcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0OTMKICAgIC8vIGFzc2VydCBzdGFrZV90aWVyLm5hdGl2ZSA8IGNzdC5TVEFLRV9USUVSX0NPVU5ULCBlcnIuSU5WQUxJRF9TVEFLRV9USUVSCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGR1cAogICAgaW50Y18yIC8vIDQKICAgIDwKICAgIGFzc2VydCAvLyBJbnZhbGlkIHN0YWtlIHRpZXIuIFZhbHVlIG11c3QgYmUgYmVsb3cgdGhlIG51bWJlciBvZiBzdGFrZSB0aWVycy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo0OTUKICAgIC8vIGJ1Y2tldCA9IHNydC5nZXRfb3Blbl9sb2JieV9idWNrZXQobG9iYnlfc2l6ZS5uYXRpdmUsIHN0YWtlX3RpZXIubmF0aXZlKQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTQ0CiAgICAvLyByZXR1cm4gKGxvYmJ5X3NpemUgLy8gMiAtIDEpICogY3N0LlNUQUtFX1RJRVJfQ09VTlQgKyBzdGFrZV90aWVyCiAgICBpbnRjXzMgLy8gMgogICAgLwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGludGNfMiAvLyA0CiAgICAqCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NDk2CiAgICAvLyBhc3NlcnQgYnVja2V0IG5vdCBpbiBzZWxmLmJveF9vcGVuX2xvYmJpZXMsIGVyci5CT1hfRk9VTkQKICAgIGl0b2IKICAgIGJ5dGVjIDEwIC8vICJvXyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBCb3ggZm91bmQuIEVuc3VyZSB0aGUgYm94IGRvZXMgbm90IGV4aXN0LgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjUwMAogICAgLy8gb3Blbl9sb2JieV9icmVmLmNyZWF0ZShzaXplPWNzdC5PUEVOX0xPQkJZX0lOREVYX1NJWkUpCiAgICBwdXNoaW50IDUyMCAvLyA1MjAKICAgIGJveF9jcmVhdGUKICAgIHBvcAogICAgcmV0c3ViCgpjcmVhdGVfb3Blbl9sb2JieV9pbmRleF9ib29sX2ZhbHNlQDQ6CiAgICBpbnRjXzAgLy8gMAogICAgYiBjcmVhdGVfb3Blbl9sb2JieV9pbmRleF9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8uY2xvc2Vfc3Rha2luZyhnYW1lX2lkOiB1aW50NjQpIC0+IHZvaWQ6CmNsb3NlX3N0YWtpbmc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTAyLTUwNQogICAgLy8gIyBDbG9zZSBzdGFraW5nIG9mIGEgZ2FtZSwgc28gaXQgZ29lcyBsaXZlIGFuZCBsZWF2ZXMgdGhlIG9wZW4gbG9iYnkgaW5kZXgKICAgIC8vICMgV29ya3MgZm9yIGJvdGggdGhlIHNlcGFyYXRlIGdhbWUgYm94ZXMgYW5kIHRoZSB1bmlmaWVkIGdhbWUgcmVjb3JkIG9mIGEgZ2FtZSBpZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY2xvc2Vfc3Rha2luZyhzZWxmLCBnYW1lX2lkOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIGludGNfMCAvLyAwCiAgICBkdXBuIDMKICAgIGJ5dGVjXzMgLy8gIiIKICAgIGR1cG4gNAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjUwNi01MDcKICAgIC8vICMgUmVhZCB0aGUgZ2FtZSBzdGF0ZSBmcm9tIHdoaWNoZXZlciBzdG9yYWdlIGhvbGRzIHRoZSBnYW1lCiAgICAvLyBpc19yZWNvcmQgPSBnYW1lX2lkIGluIHNlbGYuYm94X2dhbWVfcmVjb3JkCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGR1cAogICAgYnl0ZWMgNyAvLyAibV8iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjUxMQogICAgLy8gaWYgaXNfcmVjb3JkOgogICAgYnogY2xvc2Vfc3Rha2luZ19lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjUxMi01MTYKICAgIC8vIGdhbWVfc3RhdGUgPSBzdGMuR2FtZVN0YXRlLmZyb21fYnl0ZXMoCiAgICAvLyAgICAgZ2FtZV9yZWNvcmRfYnJlZi5leHRyYWN0KAogICAgLy8gICAgICAgICBjc3QuR0FNRV9SRUNPUkRfU1RBVEVfT0ZGU0VULCBjc3QuR0FNRV9TVEFURV9TSVpFCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgZnJhbWVfZGlnIDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTE0CiAgICAvLyBjc3QuR0FNRV9SRUNPUkRfU1RBVEVfT0ZGU0VULCBjc3QuR0FNRV9TVEFURV9TSVpFCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGludCA5NiAvLyA5NgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjUxMy01MTUKICAgIC8vIGdhbWVfcmVjb3JkX2JyZWYuZXh0cmFjdCgKICAgIC8vICAgICBjc3QuR0FNRV9SRUNPUkRfU1RBVEVfT0ZGU0VULCBjc3QuR0FNRV9TVEFURV9TSVpFCiAgICAvLyApCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjUxMi01MTYKICAgIC8vIGdhbWVfc3RhdGUgPSBzdGMuR2FtZVN0YXRlLmZyb21fYnl0ZXMoCiAgICAvLyAgICAgZ2FtZV9yZWNvcmRfYnJlZi5leHRyYWN0KAogICAgLy8gICAgICAgICBjc3QuR0FNRV9SRUNPUkRfU1RBVEVfT0ZGU0VULCBjc3QuR0FNRV9TVEFURV9TSVpFCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgZnJhbWVfYnVyeSAwCgpjbG9zZV9zdGFraW5nX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1MjItNTIzCiAgICAvLyAjIEZhaWwgdHJhbnNhY3Rpb24gdW5sZXNzIHRoZSBhc3NlcnRpb25zIGJlbG93IGV2YWx1YXRlIFRydWUKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IGdhbWVfc3RhdGUuYWRtaW5fYWRkcmVzcy5uYXRpdmUsIGVyci5TRU5ERVJfTk9UX0dBTUVfQURNSU4KICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGV4dHJhY3QgMjEgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgdGhlIGdhbWUgYWRtaW4gYWRkcmVzcyBjYW4gYWN0IGFzIHRoZSBzZW5kZXIgYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1MjQKICAgIC8vIGFzc2VydCBub3QgZ2FtZV9zdGF0ZS5zdGFraW5nX2Nsb3NlZC5uYXRpdmUsIGVyci5TVEFLSU5HX0NMT1NFRAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICBieXRlY18wIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgIQogICAgYXNzZXJ0IC8vIFN0YWtpbmcgY2xvc2VkLiBUaGUgZ2FtZSBpcyBsaXZlIGFuZCBubyBsb25nZXIgdGFrZXMgcGxheWVycy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1MjYtNTI3CiAgICAvLyAjIFVubGlzdCB0aGUgZ2FtZSBmcm9tIHRoZSBidWNrZXQgaXQgd2FzIGxpc3RlZCBpbiBhdCBjcmVhdGlvbiwgam9pbnMgZG8gbm90IG1vdmUgaXQKICAgIC8vIGlmIGdhbWVfc3RhdGUub3Blbl9sb2JieV9saXN0ZWQubmF0aXZlOgogICAgZHVwCiAgICBwdXNoaW50IDY5NiAvLyA2OTYKICAgIGdldGJpdAogICAgYnl0ZWNfMCAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMQogICAgYnogY2xvc2Vfc3Rha2luZ19hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1MzEKICAgIC8vIGdhbWVfc3RhdGUubG9iYnlfc2l6ZS5uYXRpdmUsIGdhbWVfc3RhdGUuc3Rha2VfdGllci5uYXRpdmUKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICBnZXRieXRlCiAgICBzd2FwCiAgICBwdXNoaW50IDg2IC8vIDg2CiAgICBnZXRieXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTQ0CiAgICAvLyByZXR1cm4gKGxvYmJ5X3NpemUgLy8gMiAtIDEpICogY3N0LlNUQUtFX1RJRVJfQ09VTlQgKyBzdGFrZV90aWVyCiAgICBzd2FwCiAgICBpbnRjXzMgLy8gMgogICAgLwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGludGNfMiAvLyA0CiAgICAqCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTcyLTU3MwogICAgLy8gIyBGYWlsIHRyYW5zYWN0aW9uIHVubGVzcyB0aGUgYXNzZXJ0aW9uIGJlbG93IGV2YWx1YXRlcyBUcnVlCiAgICAvLyBhc3NlcnQgYnVja2V0IGluIGJveF9vcGVuX2xvYmJpZXMsIGVyci5PUEVOX0xPQkJZX05PVF9GT1VORAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjUyOQogICAgLy8gc2VsZi5ib3hfb3Blbl9sb2JiaWVzLAogICAgYnl0ZWMgMTAgLy8gIm9fIgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjU3Mi01NzMKICAgIC8vICMgRmFpbCB0cmFuc2FjdGlvbiB1bmxlc3MgdGhlIGFzc2VydGlvbiBiZWxvdyBldmFsdWF0ZXMgVHJ1ZQogICAgLy8gYXNzZXJ0IGJ1Y2tldCBpbiBib3hfb3Blbl9sb2JiaWVzLCBlcnIuT1BFTl9MT0JCWV9OT1RfRk9VTkQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDMKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gT3BlbiBsb2JieSBub3QgZm91bmQuIFRoZSBnYW1lIGlzIG5vdCBsaXN0ZWQgaW4gaXRzIG9wZW4gbG9iYnkgaW5kZXggYnVja2V0LgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjU3NwogICAgLy8gY291bnQgPSBvcC5idG9pKG9wZW5fbG9iYnlfYnJlZi5leHRyYWN0KDAsIDgpKQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGludCA4IC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjU3OAogICAgLy8gaWRzID0gb3Blbl9sb2JieV9icmVmLmV4dHJhY3QoY3N0Lk9QRU5fTE9CQllfSURTX09GRlNFVCwgY291bnQgKiA4KQogICAgcHVzaGludCA4IC8vIDgKICAgICoKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBzd2FwCiAgICBib3hfZXh0cmFjdAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTc5CiAgICAvLyBmb3VuZCA9IEZhbHNlCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTgwCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoY291bnQpOgogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgNwoKY2xvc2Vfc3Rha2luZ19mb3JfaGVhZGVyQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjU4MAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGNvdW50KToKICAgIGZyYW1lX2RpZyA3CiAgICBmcmFtZV9kaWcgNAogICAgPAogICAgZnJhbWVfZGlnIDUKICAgIGZyYW1lX2J1cnkgNgogICAgYnogY2xvc2Vfc3Rha2luZ19hZnRlcl9mb3JAMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo1ODEKICAgIC8vIGlmIG9wLmV4dHJhY3RfdWludDY0KGlkcywgaSAqIDgpID09IGdhbWVfaWQ6CiAgICBmcmFtZV9kaWcgNwogICAgcHVzaGludCA4IC8vIDgKICAgICoKICAgIGR1cAogICAgZnJhbWVfYnVyeSA4CiAgICBmcmFtZV9kaWcgMgogICAgc3dhcAogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGJ6IGNsb3NlX3N0YWtpbmdfYWZ0ZXJfaWZfZWxzZUAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjU4MwogICAgLy8gY3N0Lk9QRU5fTE9CQllfSURTX09GRlNFVCArIGkgKiA4LCBvcC5leHRyYWN0KGlkcywgKGNvdW50IC0gMSkgKiA4LCA4KQogICAgcHVzaGludCA4IC8vIDgKICAgIGZyYW1lX2RpZyA4CiAgICArCiAgICBmcmFtZV9kaWcgNAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgcHVzaGludCA4IC8vIDgKICAgICoKICAgIGZyYW1lX2RpZyAyCiAgICBzd2FwCiAgICBwdXNoaW50IDggLy8gOAogICAgZXh0cmFjdDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo1ODItNTg0CiAgICAvLyBvcGVuX2xvYmJ5X2JyZWYucmVwbGFjZSgKICAgIC8vICAgICBjc3QuT1BFTl9MT0JCWV9JRFNfT0ZGU0VUICsgaSAqIDgsIG9wLmV4dHJhY3QoaWRzLCAoY291bnQgLSAxKSAqIDgsIDgpCiAgICAvLyApCiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo1ODUKICAgIC8vIG9wZW5fbG9iYnlfYnJlZi5yZXBsYWNlKDAsIG9wLml0b2IoY291bnQgLSAxKSkKICAgIHN3YXAKICAgIGl0b2IKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjU4NgogICAgLy8gZm91bmQgPSBUcnVlCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfYnVyeSA2CgpjbG9zZV9zdGFraW5nX2FmdGVyX2ZvckAxNDoKICAgIGZyYW1lX2RpZyA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTg4CiAgICAvLyBhc3NlcnQgZm91bmQsIGVyci5PUEVOX0xPQkJZX05PVF9GT1VORAogICAgYXNzZXJ0IC8vIE9wZW4gbG9iYnkgbm90IGZvdW5kLiBUaGUgZ2FtZSBpcyBub3QgbGlzdGVkIGluIGl0cyBvcGVuIGxvYmJ5IGluZGV4IGJ1Y2tldC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1MzUKICAgIC8vIGdhbWVfc3RhdGUub3Blbl9sb2JieV9saXN0ZWQgPSBhcmM0LkJvb2woRmFsc2UpICAjIG5vcWE6IEZCVDAwMwogICAgZnJhbWVfZGlnIDAKICAgIHB1c2hpbnQgNjk2IC8vIDY5NgogICAgaW50Y18wIC8vIDAKICAgIHNldGJpdAogICAgZnJhbWVfYnVyeSAxCgpjbG9zZV9zdGFraW5nX2FmdGVyX2lmX2Vsc2VANToKICAgIGZyYW1lX2RpZyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTM3LTUzOAogICAgLy8gIyBNYXJrIHRoZSBnYW1lIGFzIGxpdmUgYW5kIHdyaXRlIHRoZSBnYW1lIHN0YXRlIGJhY2sKICAgIC8vIGdhbWVfc3RhdGUuc3Rha2luZ19jbG9zZWQgPSBhcmM0LkJvb2woVHJ1ZSkgICMgbm9xYTogRkJUMDAzCiAgICBpbnRjXzAgLy8gMAogICAgaW50Y18xIC8vIDEKICAgIHNldGJpdAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTM5CiAgICAvLyBpZiBpc19yZWNvcmQ6CiAgICBmcmFtZV9kaWcgMTEKICAgIGJ6IGNsb3NlX3N0YWtpbmdfZWxzZV9ib2R5QDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1NDAKICAgIC8vIGdhbWVfcmVjb3JkX2JyZWYucmVwbGFjZShjc3QuR0FNRV9SRUNPUkRfU1RBVEVfT0ZGU0VULCBnYW1lX3N0YXRlLmJ5dGVzKQogICAgZnJhbWVfZGlnIDEwCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfZGlnIDAKICAgIGJveF9yZXBsYWNlCiAgICByZXRzdWIKCmNsb3NlX3N0YWtpbmdfZWxzZV9ib2R5QDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTQyCiAgICAvLyBzZWxmLmJveF9nYW1lX3N0YXRlW2dhbWVfaWRdID0gZ2FtZV9zdGF0ZS5jb3B5KCkKICAgIGJ5dGVjIDQgLy8gInNfIgogICAgZnJhbWVfZGlnIDkKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKY2xvc2Vfc3Rha2luZ19hZnRlcl9pZl9lbHNlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjU4MAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGNvdW50KToKICAgIGZyYW1lX2RpZyA3CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA3CiAgICBiIGNsb3NlX3N0YWtpbmdfZm9yX2hlYWRlckAxMAoKY2xvc2Vfc3Rha2luZ19lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1MTgtNTE5CiAgICAvLyAjIEZhaWwgdHJhbnNhY3Rpb24gdW5sZXNzIHRoZSBhc3NlcnRpb24gYmVsb3cgZXZhbHVhdGVzIFRydWUKICAgIC8vIGFzc2VydCBnYW1lX2lkIGluIHNlbGYuYm94X2dhbWVfc3RhdGUsIGVyci5HQU1FX0lEX05PVF9GT1VORAogICAgYnl0ZWMgNCAvLyAic18iCiAgICBmcmFtZV9kaWcgOQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIEdhbWUgSUQgbm90IGZvdW5kLiBFbnN1cmUgdGhlIGdhbWUgd2FzIGNyZWF0ZWQgYW5kIHN0aWxsIGV4aXN0cy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1MjAKICAgIC8vIGdhbWVfc3RhdGUgPSBzZWxmLmJveF9nYW1lX3N0YXRlW2dhbWVfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3hfZ2FtZV9zdGF0ZSBlbnRyeSBleGlzdHMKICAgIGIgY2xvc2Vfc3Rha2luZ19hZnRlcl9pZl9lbHNlQDMKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8uY29tbWl0X3R1cm4oZ2FtZV9pZDogdWludDY0LCBsb2JieV9zbG90OiBieXRlcywgdHVybl9oYXNoOiBieXRlcykgLT4gdm9pZDoKY29tbWl0X3R1cm46CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTQ0LTU1MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY29tbWl0X3R1cm4oCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBnYW1lX2lkOiBVSW50NjQsCiAgICAvLyAgICAgbG9iYnlfc2xvdDogYXJjNC5VSW50OCwKICAgIC8vICAgICB0dXJuX2hhc2g6IGFyYzQuVUludDI1NiwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU1MS01NTMKICAgIC8vICMgRmFpbCB0cmFuc2FjdGlvbiB1bmxlc3MgdGhlIGFzc2VydGlvbiBiZWxvdyBldmFsdWF0ZXMgVHJ1ZQogICAgLy8gIyBhc3NlcnQgR2xvYmFsLmdyb3VwX3NpemUgPT0gMiwgZXJyLklOVkFMSURfR1JPVVBfU0laRQogICAgLy8gYXNzZXJ0IGdhbWVfaWQgaW4gc2VsZi5ib3hfZ2FtZV9zdGF0ZSwgZXJyLkdBTUVfSURfTk9UX0ZPVU5ECiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gInNfIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gR2FtZSBJRCBub3QgZm91bmQuIEVuc3VyZSB0aGUgZ2FtZSB3YXMgY3JlYXRlZCBhbmQgc3RpbGwgZXhpc3RzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU1NwogICAgLy8gYWNjb3VudD1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU1OQogICAgLy8gbG9iYnlfc2xvdD1sb2JieV9zbG90Lm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU1NS01NjEKICAgIC8vIGFzc2VydCBzcnQuY2hlY2tfYWNjX2luX2dhbWUoCiAgICAvLyAgICAgZ2FtZV9pZD1nYW1lX2lkLAogICAgLy8gICAgIGFjY291bnQ9VHhuLnNlbmRlciwKICAgIC8vICAgICBib3hfZ2FtZV9sb2JieT1zZWxmLmJveF9nYW1lX2xvYmJ5LAogICAgLy8gICAgIGxvYmJ5X3Nsb3Q9bG9iYnlfc2xvdC5uYXRpdmUsCiAgICAvLyAgICAgY2xlYXJfcGxheWVyPUZhbHNlLAogICAgLy8gKSwgZXJyLlBMQVlFUl9OT1RfRk9VTkQKICAgIGZyYW1lX2RpZyAtMwogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTU4CiAgICAvLyBib3hfZ2FtZV9sb2JieT1zZWxmLmJveF9nYW1lX2xvYmJ5LAogICAgYnl0ZWMgOCAvLyAibF8iCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTU1LTU2MQogICAgLy8gYXNzZXJ0IHNydC5jaGVja19hY2NfaW5fZ2FtZSgKICAgIC8vICAgICBnYW1lX2lkPWdhbWVfaWQsCiAgICAvLyAgICAgYWNjb3VudD1UeG4uc2VuZGVyLAogICAgLy8gICAgIGJveF9nYW1lX2xvYmJ5PXNlbGYuYm94X2dhbWVfbG9iYnksCiAgICAvLyAgICAgbG9iYnlfc2xvdD1sb2JieV9zbG90Lm5hdGl2ZSwKICAgIC8vICAgICBjbGVhcl9wbGF5ZXI9RmFsc2UsCiAgICAvLyApLCBlcnIuUExBWUVSX05PVF9GT1VORAogICAgZGlnIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1NjAKICAgIC8vIGNsZWFyX3BsYXllcj1GYWxzZSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTU1LTU2MQogICAgLy8gYXNzZXJ0IHNydC5jaGVja19hY2NfaW5fZ2FtZSgKICAgIC8vICAgICBnYW1lX2lkPWdhbWVfaWQsCiAgICAvLyAgICAgYWNjb3VudD1UeG4uc2VuZGVyLAogICAgLy8gICAgIGJveF9nYW1lX2xvYmJ5PXNlbGYuYm94X2dhbWVfbG9iYnksCiAgICAvLyAgICAgbG9iYnlfc2xvdD1sb2JieV9zbG90Lm5hdGl2ZSwKICAgIC8vICAgICBjbGVhcl9wbGF5ZXI9RmFsc2UsCiAgICAvLyApLCBlcnIuUExBWUVSX05PVF9GT1VORAogICAgY2FsbHN1YiBjaGVja19hY2NfaW5fZ2FtZQogICAgYXNzZXJ0IC8vIFBsYXllciBub3QgZm91bmQuIEVuc3VyZSBwbGF5ZXIgYWRkcmVzcyBpcyBpbnNpZGUgdGhlIGdhbWUgbG9iYnkuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTY1CiAgICAvLyBrZXk9c2VsZi5ib3hfZ2FtZV9jaGFyYWN0ZXJzLmtleV9wcmVmaXggKyBvcC5pdG9iKGdhbWVfaWQpCiAgICBieXRlYyA1IC8vICJjXyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1NjMtNTY2CiAgICAvLyAjIFJlYWQgdGhlIHNlbmRlciBjaGFyYWN0ZXIgc2xvdCBvbmNlLCBwYXRjaCBpdCBpbiBtZW1vcnksIHRoZW4gd3JpdGUgaXQgYmFjayBvbmNlCiAgICAvLyBnYW1lX2NoYXJhY3RlcnNfYnJlZiA9IEJveFJlZigKICAgIC8vICAgICBrZXk9c2VsZi5ib3hfZ2FtZV9jaGFyYWN0ZXJzLmtleV9wcmVmaXggKyBvcC5pdG9iKGdhbWVfaWQpCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1NjUKICAgIC8vIGtleT1zZWxmLmJveF9nYW1lX2NoYXJhY3RlcnMua2V5X3ByZWZpeCArIG9wLml0b2IoZ2FtZV9pZCkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU2NwogICAgLy8gY2hhcmFjdGVyX29mZnNldCA9IGxvYmJ5X3Nsb3QubmF0aXZlICogY3N0LkdBTUVfQ0hBUkFDVEVSX1NJWkUKICAgIHN3YXAKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1NjgtNTcwCiAgICAvLyBjaGFyYWN0ZXIgPSBzdGMuR2FtZUNoYXJhY3Rlci5mcm9tX2J5dGVzKAogICAgLy8gICAgIGdhbWVfY2hhcmFjdGVyc19icmVmLmV4dHJhY3QoY2hhcmFjdGVyX29mZnNldCwgY3N0LkdBTUVfQ0hBUkFDVEVSX1NJWkUpCiAgICAvLyApCiAgICBkdXAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTY5CiAgICAvLyBnYW1lX2NoYXJhY3RlcnNfYnJlZi5leHRyYWN0KGNoYXJhY3Rlcl9vZmZzZXQsIGNzdC5HQU1FX0NIQVJBQ1RFUl9TSVpFKQogICAgcHVzaGludCA0MCAvLyA0MAogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1NzIKICAgIC8vIGFzc2VydCBub3QgY2hhcmFjdGVyLmhhc19jb21taXR0ZWRfdHVybi5uYXRpdmUsIGVyci5UVVJOX0FMUkVBRFlfQ09NTUlUVEVECiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIGJ5dGVjXzAgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICAhCiAgICBhc3NlcnQgLy8gVHVybiBhbHJlYWR5IGNvbW1pdHRlZC4gV2FpdCBmb3IgdGhlIGN1cnJlbnQgdHVybiB0byByZXNvbHZlIGJlZm9yZSBjb21taXR0aW5nIGFnYWluLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU3NAogICAgLy8gY2hhcmFjdGVyLnR1cm5faGFzaCA9IHR1cm5faGFzaAogICAgZnJhbWVfZGlnIC0xCiAgICByZXBsYWNlMiA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTc1CiAgICAvLyBjaGFyYWN0ZXIuaGFzX2NvbW1pdHRlZF90dXJuID0gYXJjNC5Cb29sKFRydWUpICAjIG5vcWE6IEZCVDAwMwogICAgaW50Y18wIC8vIDAKICAgIGludGNfMSAvLyAxCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1NzYKICAgIC8vIGdhbWVfY2hhcmFjdGVyc19icmVmLnJlcGxhY2UoY2hhcmFjdGVyX29mZnNldCwgY2hhcmFjdGVyLmJ5dGVzKQogICAgYm94X3JlcGxhY2UKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by5jb21taXRfdHVybnMoZ2FtZV9pZDogdWludDY0LCBjb21taXRzOiBieXRlcykgLT4gdm9pZDoKY29tbWl0X3R1cm5zOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU3OC01ODUKICAgIC8vICMgQ29tbWl0IHRoZSB0dXJuIGhhc2hlcyBvZiBzZXZlcmFsIHBsYXllcnMgYXQgb25jZSwgZS5nLiBmcm9tIGEgcmVsYXkgb3IgZ2FtZSBzZXJ2ZXIKICAgIC8vICMgRWFjaCBjb21taXQgaXMgYXV0aG9yaXplZCBieSB0aGUgcGxheWVyIHNpZ25hdHVyZSBpbnN0ZWFkIG9mIHRoZSB0cmFuc2FjdGlvbiBzZW5kZXIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGNvbW1pdF90dXJucygKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGdhbWVfaWQ6IFVJbnQ2NCwKICAgIC8vICAgICBjb21taXRzOiB0YS5TaWduZWRUdXJuQ29tbWl0cywKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgaW50Y18wIC8vIDAKICAgIGR1cG4gMwogICAgYnl0ZWNfMyAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU4Ni01ODcKICAgIC8vICMgRmFpbCB0cmFuc2FjdGlvbiB1bmxlc3MgdGhlIGFzc2VydGlvbnMgYmVsb3cgZXZhbHVhdGUgVHJ1ZQogICAgLy8gYXNzZXJ0IGdhbWVfaWQgaW4gc2VsZi5ib3hfZ2FtZV9zdGF0ZSwgZXJyLkdBTUVfSURfTk9UX0ZPVU5ECiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGR1cAogICAgYnl0ZWMgNCAvLyAic18iCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gR2FtZSBJRCBub3QgZm91bmQuIEVuc3VyZSB0aGUgZ2FtZSB3YXMgY3JlYXRlZCBhbmQgc3RpbGwgZXhpc3RzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU4OQogICAgLy8gY29tbWl0cy5sZW5ndGggPiAwIGFuZCBjb21taXRzLmxlbmd0aCA8PSBjc3QuTUFYX0xPQkJZX1NJWkUKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGJ6IGNvbW1pdF90dXJuc19ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyA3CiAgICBpbnRjXzIgLy8gNAogICAgPD0KICAgIGJ6IGNvbW1pdF90dXJuc19ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCgpjb21taXRfdHVybnNfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU4OC01OTAKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgY29tbWl0cy5sZW5ndGggPiAwIGFuZCBjb21taXRzLmxlbmd0aCA8PSBjc3QuTUFYX0xPQkJZX1NJWkUKICAgIC8vICksIGVyci5JTlZBTElEX0NPTU1JVFNfTEVOR1RICiAgICBhc3NlcnQgLy8gSW52YWxpZCBjb21taXRzIGxlbmd0aC4gRW5zdXJlIHRoZXJlIGlzIGF0IGxlYXN0IG9uZSBhbmQgYXQgbW9zdCBvbmUgY29tbWl0IHBlciBsb2JieSBzbG90LgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU5NAogICAgLy8gcmVxdWlyZWRfYnVkZ2V0PWNzdC5FRDI1NTE5X1ZFUklGWV9DT1NUICogY29tbWl0cy5sZW5ndGgKICAgIHB1c2hpbnQgMTkwMCAvLyAxOTAwCiAgICBmcmFtZV9kaWcgNwogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU5NQogICAgLy8gKyBjc3QuQ09NTUlUX1RVUk5TX0JBU0VfQlVER0VULAogICAgcHVzaGludCA3MDAgLy8gNzAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTk0LTU5NQogICAgLy8gcmVxdWlyZWRfYnVkZ2V0PWNzdC5FRDI1NTE5X1ZFUklGWV9DT1NUICogY29tbWl0cy5sZW5ndGgKICAgIC8vICsgY3N0LkNPTU1JVF9UVVJOU19CQVNFX0JVREdFVCwKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo1OTYKICAgIC8vIGZlZV9zb3VyY2U9T3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NTkyLTU5NwogICAgLy8gIyBFbnN1cmUgdHJhbnNhY3Rpb24gaGFzIHN1ZmZpY2llbnQgb3Bjb2RlIGJ1ZGdldCBmb3IgZXZlcnkgc2lnbmF0dXJlIGNoZWNrCiAgICAvLyBlbnN1cmVfYnVkZ2V0KAogICAgLy8gICAgIHJlcXVpcmVkX2J1ZGdldD1jc3QuRUQyNTUxOV9WRVJJRllfQ09TVCAqIGNvbW1pdHMubGVuZ3RoCiAgICAvLyAgICAgKyBjc3QuQ09NTUlUX1RVUk5TX0JBU0VfQlVER0VULAogICAgLy8gICAgIGZlZV9zb3VyY2U9T3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCwKICAgIC8vICkKICAgIGNhbGxzdWIgZW5zdXJlX2J1ZGdldAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjU5OS02MDAKICAgIC8vICMgUmVhZCB0aGUgZ2FtZSBsb2JieSBhbmQgdGhlIGdhbWUgY2hhcmFjdGVycyBvbmNlIGZvciB0aGUgd2hvbGUgYmF0Y2gKICAgIC8vIGdhbWVfbG9iYnlfYl9hcnIgPSBzZWxmLmJveF9nYW1lX2xvYmJ5W2dhbWVfaWRdCiAgICBieXRlYyA4IC8vICJsXyIKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3hfZ2FtZV9sb2JieSBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2MDEKICAgIC8vIGNoYXJhY3RlcnMgPSBzZWxmLmJveF9nYW1lX2NoYXJhY3RlcnNbZ2FtZV9pZF0uY29weSgpCiAgICBieXRlYyA1IC8vICJjXyIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDEKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveF9nYW1lX2NoYXJhY3RlcnMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjAzLTYwNQogICAgLy8gIyBNZXNzYWdlIHByZWZpeCBzaGFyZWQgYnkgZXZlcnkgdHVybiBjb21taXQgb2YgdGhpcyByb3VuZDsgdGhlIHJvdW5kIGNvdW50IGNoYW5nZXMgZXZlcnkKICAgIC8vICMgcmVzb2x2ZSwgc28gYSBzaWduYXR1cmUgY2FuIG5vdCBiZSByZXBsYXllZCBpbiBhIGxhdGVyIHJvdW5kIGV2ZW4gaWYgaXRzIGV4cGlyeSBtYXRjaGVzCiAgICAvLyBnYW1lX3N0YXRlID0gc2VsZi5ib3hfZ2FtZV9zdGF0ZVtnYW1lX2lkXS5jb3B5KCkKICAgIGZyYW1lX2RpZyA2CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3hfZ2FtZV9zdGF0ZSBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2MDgKICAgIC8vICsgb3AuaXRvYihHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25JRAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjYwNwogICAgLy8gQnl0ZXMoY3N0LlRVUk5fQ09NTUlUX01TR19QUkVGSVgpCiAgICBwdXNoYnl0ZXMgMHg0ZDU4NzM2MTZjNzY2ZjNhNjM2ZjZkNmQ2OTc0NWY3NDc1NzI2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjYwNy02MDgKICAgIC8vIEJ5dGVzKGNzdC5UVVJOX0NPTU1JVF9NU0dfUFJFRklYKQogICAgLy8gKyBvcC5pdG9iKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjA3LTYwOQogICAgLy8gQnl0ZXMoY3N0LlRVUk5fQ09NTUlUX01TR19QUkVGSVgpCiAgICAvLyArIG9wLml0b2IoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpCiAgICAvLyArIG9wLml0b2IoZ2FtZV9pZCkKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjEwCiAgICAvLyArIGdhbWVfc3RhdGUuZXhwaXJ5X3RzLmJ5dGVzCiAgICBkaWcgMQogICAgZXh0cmFjdCA1IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjA3LTYxMAogICAgLy8gQnl0ZXMoY3N0LlRVUk5fQ09NTUlUX01TR19QUkVGSVgpCiAgICAvLyArIG9wLml0b2IoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpCiAgICAvLyArIG9wLml0b2IoZ2FtZV9pZCkKICAgIC8vICsgZ2FtZV9zdGF0ZS5leHBpcnlfdHMuYnl0ZXMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjYxMQogICAgLy8gKyBnYW1lX3N0YXRlLnJvdW5kX2NvdW50LmJ5dGVzCiAgICBzd2FwCiAgICBleHRyYWN0IDg4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjA3LTYxMQogICAgLy8gQnl0ZXMoY3N0LlRVUk5fQ09NTUlUX01TR19QUkVGSVgpCiAgICAvLyArIG9wLml0b2IoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpCiAgICAvLyArIG9wLml0b2IoZ2FtZV9pZCkKICAgIC8vICsgZ2FtZV9zdGF0ZS5leHBpcnlfdHMuYnl0ZXMKICAgIC8vICsgZ2FtZV9zdGF0ZS5yb3VuZF9jb3VudC5ieXRlcwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjA2LTYxMgogICAgLy8gbWVzc2FnZV9wcmVmaXggPSAoCiAgICAvLyAgICAgQnl0ZXMoY3N0LlRVUk5fQ09NTUlUX01TR19QUkVGSVgpCiAgICAvLyAgICAgKyBvcC5pdG9iKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKQogICAgLy8gICAgICsgb3AuaXRvYihnYW1lX2lkKQogICAgLy8gICAgICsgZ2FtZV9zdGF0ZS5leHBpcnlfdHMuYnl0ZXMKICAgIC8vICAgICArIGdhbWVfc3RhdGUucm91bmRfY291bnQuYnl0ZXMKICAgIC8vICkKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjYxNC02MTUKICAgIC8vICMgSXRlcmF0ZSB0aHJvdWdoIGFsbCB0aGUgc2lnbmVkIGNvbW1pdHMsIGluIGEgc2luZ2xlIHBhc3Mgb3ZlciB0aGUgbG9iYnkKICAgIC8vIGZvciBpIGluIHVyYW5nZShjb21taXRzLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA0Cgpjb21taXRfdHVybnNfZm9yX2hlYWRlckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjYxNC02MTUKICAgIC8vICMgSXRlcmF0ZSB0aHJvdWdoIGFsbCB0aGUgc2lnbmVkIGNvbW1pdHMsIGluIGEgc2luZ2xlIHBhc3Mgb3ZlciB0aGUgbG9iYnkKICAgIC8vIGZvciBpIGluIHVyYW5nZShjb21taXRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDcKICAgIDwKICAgIGJ6IGNvbW1pdF90dXJuc19hZnRlcl9mb3JAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjYxNgogICAgLy8gY29tbWl0ID0gY29tbWl0c1tpXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgOTcgLy8gOTcKICAgICoKICAgIHB1c2hpbnQgOTcgLy8gOTcKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjYxOC02MTkKICAgIC8vICMgRXh0cmFjdCB0aGUgcGxheWVyIGFkZHJlc3MgYnl0ZXMgYXQgdGhlIGNvbW1pdCBsb2JieSBzbG90CiAgICAvLyBzbG90ID0gY29tbWl0LmxvYmJ5X3Nsb3QubmF0aXZlCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBnZXRieXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjIwCiAgICAvLyBzdGFydCA9IHNsb3QgKiBjc3QuQUREUkVTU19TSVpFCiAgICBkdXAKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2MjIKICAgIC8vIHN0YXJ0ICsgY3N0LkFERFJFU1NfU0laRSA8PSBnYW1lX2xvYmJ5X2JfYXJyLmxlbmd0aAogICAgZHVwCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICArCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjIxLTYyMwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzdGFydCArIGNzdC5BRERSRVNTX1NJWkUgPD0gZ2FtZV9sb2JieV9iX2Fyci5sZW5ndGgKICAgIC8vICksIGVyci5QTEFZRVJfTk9UX0ZPVU5ECiAgICBhc3NlcnQgLy8gUGxheWVyIG5vdCBmb3VuZC4gRW5zdXJlIHBsYXllciBhZGRyZXNzIGlzIGluc2lkZSB0aGUgZ2FtZSBsb2JieS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2MjQKICAgIC8vIHBsYXllcl9hZGRyX2J5dGVzID0gb3AuZXh0cmFjdChnYW1lX2xvYmJ5X2JfYXJyLCBzdGFydCwgY3N0LkFERFJFU1NfU0laRSkKICAgIHN3YXAKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGV4dHJhY3QzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjI1LTYyNwogICAgLy8gYXNzZXJ0IHBsYXllcl9hZGRyX2J5dGVzICE9IEJ5dGVzKAogICAgLy8gICAgIGNzdC5aRVJPRURfQUREUl9CWVRFUwogICAgLy8gKSwgZXJyLlBMQVlFUl9OT1RfRk9VTkQKICAgIGR1cAogICAgYnl0ZWMgOSAvLyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgICE9CiAgICBhc3NlcnQgLy8gUGxheWVyIG5vdCBmb3VuZC4gRW5zdXJlIHBsYXllciBhZGRyZXNzIGlzIGluc2lkZSB0aGUgZ2FtZSBsb2JieS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2MzEKICAgIC8vIG1lc3NhZ2VfcHJlZml4ICsgY29tbWl0LnR1cm5faGFzaC5ieXRlcywKICAgIGRpZyAyCiAgICBleHRyYWN0IDEgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgMwogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjYzMgogICAgLy8gY29tbWl0LnNpZ25hdHVyZS5ieXRlcywKICAgIHVuY292ZXIgNAogICAgZXh0cmFjdCAzMyA2NCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2MjktNjM0CiAgICAvLyAjIFZlcmlmeSB0aGUgcGxheWVyIHNpZ25lZCB0aGlzIHR1cm4gaGFzaCBmb3IgdGhpcyBnYW1lIHBoYXNlCiAgICAvLyBhc3NlcnQgb3AuZWQyNTUxOXZlcmlmeV9iYXJlKAogICAgLy8gICAgIG1lc3NhZ2VfcHJlZml4ICsgY29tbWl0LnR1cm5faGFzaC5ieXRlcywKICAgIC8vICAgICBjb21taXQuc2lnbmF0dXJlLmJ5dGVzLAogICAgLy8gICAgIHBsYXllcl9hZGRyX2J5dGVzLAogICAgLy8gKSwgZXJyLklOVkFMSURfQ09NTUlUX1NJR05BVFVSRQogICAgdW5jb3ZlciAzCiAgICBlZDI1NTE5dmVyaWZ5X2JhcmUKICAgIGFzc2VydCAvLyBJbnZhbGlkIGNvbW1pdCBzaWduYXR1cmUuIEVuc3VyZSB0aGUgcGxheWVyIHNpZ25lZCB0aGUgdHVybiBjb21taXQgbWVzc2FnZSBvZiB0aGlzIGdhbWUgcGhhc2UuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjM2LTYzOQogICAgLy8gIyBBIHJlcGVhdGVkIGxvYmJ5IHNsb3QgZmFpbHMgaGVyZSwgYXMgaXRzIGNoYXJhY3RlciB3YXMgYWxyZWFkeSB1cGRhdGVkIGJlbG93CiAgICAvLyBhc3NlcnQgbm90IGNoYXJhY3RlcnNbCiAgICAvLyAgICAgc2xvdAogICAgLy8gXS5oYXNfY29tbWl0dGVkX3R1cm4ubmF0aXZlLCBlcnIuVFVSTl9BTFJFQURZX0NPTU1JVFRFRAogICAgZGlnIDEKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICoKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGRpZyAxCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgYnl0ZWNfMCAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgICEKICAgIGFzc2VydCAvLyBUdXJuIGFscmVhZHkgY29tbWl0dGVkLiBXYWl0IGZvciB0aGUgY3VycmVudCB0dXJuIHRvIHJlc29sdmUgYmVmb3JlIGNvbW1pdHRpbmcgYWdhaW4uCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjQxCiAgICAvLyBjaGFyYWN0ZXJzW3Nsb3RdLnR1cm5faGFzaCA9IGNvbW1pdC50dXJuX2hhc2gKICAgIHVuY292ZXIgMgogICAgcmVwbGFjZTIgOAogICAgdW5jb3ZlciAzCiAgICBpbnRjXzIgLy8gNAogICAgPAogICAgYXNzZXJ0IC8vIEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICB1bmNvdmVyIDIKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHJlcGxhY2UzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjQyCiAgICAvLyBjaGFyYWN0ZXJzW3Nsb3RdLmhhc19jb21taXR0ZWRfdHVybiA9IGFyYzQuQm9vbChUcnVlKSAgIyBub3FhOiBGQlQwMDMKICAgIGR1cAogICAgZGlnIDIKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgaW50Y18wIC8vIDAKICAgIGludGNfMSAvLyAxCiAgICBzZXRiaXQKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIHJlcGxhY2UzCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2MTQtNjE1CiAgICAvLyAjIEl0ZXJhdGUgdGhyb3VnaCBhbGwgdGhlIHNpZ25lZCBjb21taXRzLCBpbiBhIHNpbmdsZSBwYXNzIG92ZXIgdGhlIGxvYmJ5CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoY29tbWl0cy5sZW5ndGgpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNAogICAgYiBjb21taXRfdHVybnNfZm9yX2hlYWRlckA1Cgpjb21taXRfdHVybnNfYWZ0ZXJfZm9yQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjQ0LTY0NQogICAgLy8gIyBXcml0ZSBhbGwgdGhlIHVwZGF0ZWQgZ2FtZSBjaGFyYWN0ZXJzIGJhY2sgdy8gYSBzaW5nbGUgYm94IHdyaXRlCiAgICAvLyBzZWxmLmJveF9nYW1lX2NoYXJhY3RlcnNbZ2FtZV9pZF0gPSBjaGFyYWN0ZXJzLmNvcHkoKQogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAxCiAgICBib3hfcHV0CiAgICByZXRzdWIKCmNvbW1pdF90dXJuc19ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzAgLy8gMAogICAgYiBjb21taXRfdHVybnNfYm9vbF9tZXJnZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLmNvbW1pdF90dXJuX3JlY29yZChnYW1lX2lkOiB1aW50NjQsIGxvYmJ5X3Nsb3Q6IGJ5dGVzLCB0dXJuX2hhc2g6IGJ5dGVzKSAtPiB2b2lkOgpjb21taXRfdHVybl9yZWNvcmQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjQ3LTY1NAogICAgLy8gIyBDb21taXQgYSB0dXJuIGhhc2ggdG8gdGhlIHNlbmRlciBjaGFyYWN0ZXIgb2YgYSB1bmlmaWVkIGdhbWUgcmVjb3JkCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBjb21taXRfdHVybl9yZWNvcmQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBnYW1lX2lkOiBVSW50NjQsCiAgICAvLyAgICAgbG9iYnlfc2xvdDogYXJjNC5VSW50OCwKICAgIC8vICAgICB0dXJuX2hhc2g6IGFyYzQuVUludDI1NiwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjY1NS02NTYKICAgIC8vICMgRmFpbCB0cmFuc2FjdGlvbiB1bmxlc3MgdGhlIGFzc2VydGlvbnMgYmVsb3cgZXZhbHVhdGUgVHJ1ZQogICAgLy8gYXNzZXJ0IGdhbWVfaWQgaW4gc2VsZi5ib3hfZ2FtZV9yZWNvcmQsIGVyci5HQU1FX0lEX05PVF9GT1VORAogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBieXRlYyA3IC8vICJtXyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBHYW1lIElEIG5vdCBmb3VuZC4gRW5zdXJlIHRoZSBnYW1lIHdhcyBjcmVhdGVkIGFuZCBzdGlsbCBleGlzdHMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjYwCiAgICAvLyBhY2NvdW50PVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjYyCiAgICAvLyBsb2JieV9zbG90PWxvYmJ5X3Nsb3QubmF0aXZlLAogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo1MTctNTE4CiAgICAvLyAjIEEgc2xvdCBwYXN0IHRoZSBmaXhlZCBsb2JieSBzZWN0aW9uIGNhbiBub3QgaG9sZCB0aGUgYWNjb3VudAogICAgLy8gaWYgbG9iYnlfc2xvdCA+PSBjc3QuTUFYX0xPQkJZX1NJWkU6CiAgICBpbnRjXzIgLy8gNAogICAgPj0KICAgIGJ6IGNvbW1pdF90dXJuX3JlY29yZF9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo1MTkKICAgIC8vIHJldHVybiBGYWxzZQogICAgaW50Y18wIC8vIDAKCmNvbW1pdF90dXJuX3JlY29yZF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5zYWx2by5zdWJyb3V0aW5lcy5jaGVja19hY2NfaW5fZ2FtZV9yZWNvcmRANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2NTgtNjYzCiAgICAvLyBhc3NlcnQgc3J0LmNoZWNrX2FjY19pbl9nYW1lX3JlY29yZCgKICAgIC8vICAgICBnYW1lX2lkPWdhbWVfaWQsCiAgICAvLyAgICAgYWNjb3VudD1UeG4uc2VuZGVyLAogICAgLy8gICAgIGJveF9nYW1lX3JlY29yZD1zZWxmLmJveF9nYW1lX3JlY29yZCwKICAgIC8vICAgICBsb2JieV9zbG90PWxvYmJ5X3Nsb3QubmF0aXZlLAogICAgLy8gKSwgZXJyLlBMQVlFUl9OT1RfRk9VTkQKICAgIGFzc2VydCAvLyBQbGF5ZXIgbm90IGZvdW5kLiBFbnN1cmUgcGxheWVyIGFkZHJlc3MgaXMgaW5zaWRlIHRoZSBnYW1lIGxvYmJ5LgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjUwNgogICAgLy8gcmV0dXJuIGNzdC5HQU1FX1JFQ09SRF9DSEFSQUNURVJTX09GRlNFVCArIGxvYmJ5X3Nsb3QgKiBjc3QuR0FNRV9DSEFSQUNURVJfU0laRQogICAgZnJhbWVfZGlnIDIKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICoKICAgIGludGMgNCAvLyAyNTUKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2NzAtNjcyCiAgICAvLyBjaGFyYWN0ZXIgPSBzdGMuR2FtZUNoYXJhY3Rlci5mcm9tX2J5dGVzKAogICAgLy8gICAgIGdhbWVfcmVjb3JkX2JyZWYuZXh0cmFjdChjaGFyYWN0ZXJfb2Zmc2V0LCBjc3QuR0FNRV9DSEFSQUNURVJfU0laRSkKICAgIC8vICkKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGRpZyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjcxCiAgICAvLyBnYW1lX3JlY29yZF9icmVmLmV4dHJhY3QoY2hhcmFjdGVyX29mZnNldCwgY3N0LkdBTUVfQ0hBUkFDVEVSX1NJWkUpCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjY3NAogICAgLy8gYXNzZXJ0IG5vdCBjaGFyYWN0ZXIuaGFzX2NvbW1pdHRlZF90dXJuLm5hdGl2ZSwgZXJyLlRVUk5fQUxSRUFEWV9DT01NSVRURUQKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgYnl0ZWNfMCAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgICEKICAgIGFzc2VydCAvLyBUdXJuIGFscmVhZHkgY29tbWl0dGVkLiBXYWl0IGZvciB0aGUgY3VycmVudCB0dXJuIHRvIHJlc29sdmUgYmVmb3JlIGNvbW1pdHRpbmcgYWdhaW4uCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Njc2CiAgICAvLyBjaGFyYWN0ZXIudHVybl9oYXNoID0gdHVybl9oYXNoCiAgICBmcmFtZV9kaWcgLTEKICAgIHJlcGxhY2UyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2NzcKICAgIC8vIGNoYXJhY3Rlci5oYXNfY29tbWl0dGVkX3R1cm4gPSBhcmM0LkJvb2woVHJ1ZSkgICMgbm9xYTogRkJUMDAzCiAgICBpbnRjXzAgLy8gMAogICAgaW50Y18xIC8vIDEKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjY3OAogICAgLy8gZ2FtZV9yZWNvcmRfYnJlZi5yZXBsYWNlKGNoYXJhY3Rlcl9vZmZzZXQsIGNoYXJhY3Rlci5ieXRlcykKICAgIGJveF9yZXBsYWNlCiAgICByZXRzdWIKCmNvbW1pdF90dXJuX3JlY29yZF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NTAwCiAgICAvLyByZXR1cm4gY3N0LkdBTUVfUkVDT1JEX0xPQkJZX09GRlNFVCArIGxvYmJ5X3Nsb3QgKiBjc3QuQUREUkVTU19TSVpFCiAgICBmcmFtZV9kaWcgMgogICAgcHVzaGludCAzMiAvLyAzMgogICAgKgogICAgcHVzaGludCA5NiAvLyA5NgogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjUyNAogICAgLy8gZ2FtZV9yZWNvcmRfYnJlZi5leHRyYWN0KGdhbWVfcmVjb3JkX2xvYmJ5X29mZnNldChsb2JieV9zbG90KSwgY3N0LkFERFJFU1NfU0laRSkKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjUyNC01MjUKICAgIC8vIGdhbWVfcmVjb3JkX2JyZWYuZXh0cmFjdChnYW1lX3JlY29yZF9sb2JieV9vZmZzZXQobG9iYnlfc2xvdCksIGNzdC5BRERSRVNTX1NJWkUpCiAgICAvLyA9PSBhY2NvdW50LmJ5dGVzCiAgICBmcmFtZV9kaWcgMQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2NTgtNjYzCiAgICAvLyBhc3NlcnQgc3J0LmNoZWNrX2FjY19pbl9nYW1lX3JlY29yZCgKICAgIC8vICAgICBnYW1lX2lkPWdhbWVfaWQsCiAgICAvLyAgICAgYWNjb3VudD1UeG4uc2VuZGVyLAogICAgLy8gICAgIGJveF9nYW1lX3JlY29yZD1zZWxmLmJveF9nYW1lX3JlY29yZCwKICAgIC8vICAgICBsb2JieV9zbG90PWxvYmJ5X3Nsb3QubmF0aXZlLAogICAgLy8gKSwgZXJyLlBMQVlFUl9OT1RfRk9VTkQKICAgIGIgY29tbWl0X3R1cm5fcmVjb3JkX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnNhbHZvLnN1YnJvdXRpbmVzLmNoZWNrX2FjY19pbl9nYW1lX3JlY29yZEA0CgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLnJldmVhbF90dXJuKGdhbWVfaWQ6IHVpbnQ2NCwgbG9iYnlfc2xvdDogYnl0ZXMsIG1vdmVtZW50OiBieXRlcywgYWN0aW9uOiBieXRlcywgZGlyZWN0aW9uOiBieXRlcywgc2FsdDogYnl0ZXMpIC0+IHZvaWQ6CnJldmVhbF90dXJuOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjY4MC02OTAKICAgIC8vICMgUmV2ZWFsIGEgY29tbWl0dGVkIHR1cm46IHJlY29tcHV0ZSBpdHMgaGFzaCB3LyB0aGUgZ2FtZSBjb21taXQgc2NoZW1lLCB0aGVuIHZhbGlkYXRlIHRoZSBtb3ZlCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiByZXZlYWxfdHVybigKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGdhbWVfaWQ6IFVJbnQ2NCwKICAgIC8vICAgICBsb2JieV9zbG90OiBhcmM0LlVJbnQ4LAogICAgLy8gICAgIG1vdmVtZW50OiB0YS5Db29yZHNBcnJheSwKICAgIC8vICAgICBhY3Rpb246IGFyYzQuVUludDgsCiAgICAvLyAgICAgZGlyZWN0aW9uOiBhcmM0LlVJbnQ4LAogICAgLy8gICAgIHNhbHQ6IGFyYzQuVUludDY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNiAwCiAgICBpbnRjXzAgLy8gMAogICAgZHVwbiA1CiAgICBieXRlY18zIC8vICIiCiAgICBkdXBuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo2OTEtNjkyCiAgICAvLyAjIEZhaWwgdHJhbnNhY3Rpb24gdW5sZXNzIHRoZSBhc3NlcnRpb25zIGJlbG93IGV2YWx1YXRlIFRydWUKICAgIC8vIGFzc2VydCBnYW1lX2lkIGluIHNlbGYuYm94X2dhbWVfc3RhdGUsIGVyci5HQU1FX0lEX05PVF9GT1VORAogICAgZnJhbWVfZGlnIC02CiAgICBpdG9iCiAgICBkdXAKICAgIGJ5dGVjIDQgLy8gInNfIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBHYW1lIElEIG5vdCBmb3VuZC4gRW5zdXJlIHRoZSBnYW1lIHdhcyBjcmVhdGVkIGFuZCBzdGlsbCBleGlzdHMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NjkzCiAgICAvLyBnYW1lX3N0YXRlID0gc2VsZi5ib3hfZ2FtZV9zdGF0ZVtnYW1lX2lkXS5jb3B5KCkKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveF9nYW1lX3N0YXRlIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjY5NAogICAgLy8gYXNzZXJ0IGdhbWVfc3RhdGUuc3Rha2luZ19jbG9zZWQubmF0aXZlLCBlcnIuU1RBS0lOR19OT1RfQ0xPU0VECiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIGJ5dGVjXzAgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICBhc3NlcnQgLy8gU3Rha2luZyBub3QgY2xvc2VkLiBUaGUgZ2FtZSBhZG1pbiBtdXN0IGNsb3NlIHN0YWtpbmcgYmVmb3JlIHJvdW5kcyBhcmUgcGxheWVkLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjY5OAogICAgLy8gYWNjb3VudD1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjcwMAogICAgLy8gbG9iYnlfc2xvdD1sb2JieV9zbG90Lm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtNQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjY5Ni03MDIKICAgIC8vIGFzc2VydCBzcnQuY2hlY2tfYWNjX2luX2dhbWUoCiAgICAvLyAgICAgZ2FtZV9pZD1nYW1lX2lkLAogICAgLy8gICAgIGFjY291bnQ9VHhuLnNlbmRlciwKICAgIC8vICAgICBib3hfZ2FtZV9sb2JieT1zZWxmLmJveF9nYW1lX2xvYmJ5LAogICAgLy8gICAgIGxvYmJ5X3Nsb3Q9bG9iYnlfc2xvdC5uYXRpdmUsCiAgICAvLyAgICAgY2xlYXJfcGxheWVyPUZhbHNlLAogICAgLy8gKSwgZXJyLlBMQVlFUl9OT1RfRk9VTkQKICAgIGZyYW1lX2RpZyAtNgogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Njk5CiAgICAvLyBib3hfZ2FtZV9sb2JieT1zZWxmLmJveF9nYW1lX2xvYmJ5LAogICAgYnl0ZWMgOCAvLyAibF8iCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Njk2LTcwMgogICAgLy8gYXNzZXJ0IHNydC5jaGVja19hY2NfaW5fZ2FtZSgKICAgIC8vICAgICBnYW1lX2lkPWdhbWVfaWQsCiAgICAvLyAgICAgYWNjb3VudD1UeG4uc2VuZGVyLAogICAgLy8gICAgIGJveF9nYW1lX2xvYmJ5PXNlbGYuYm94X2dhbWVfbG9iYnksCiAgICAvLyAgICAgbG9iYnlfc2xvdD1sb2JieV9zbG90Lm5hdGl2ZSwKICAgIC8vICAgICBjbGVhcl9wbGF5ZXI9RmFsc2UsCiAgICAvLyApLCBlcnIuUExBWUVSX05PVF9GT1VORAogICAgZGlnIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3MDEKICAgIC8vIGNsZWFyX3BsYXllcj1GYWxzZSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Njk2LTcwMgogICAgLy8gYXNzZXJ0IHNydC5jaGVja19hY2NfaW5fZ2FtZSgKICAgIC8vICAgICBnYW1lX2lkPWdhbWVfaWQsCiAgICAvLyAgICAgYWNjb3VudD1UeG4uc2VuZGVyLAogICAgLy8gICAgIGJveF9nYW1lX2xvYmJ5PXNlbGYuYm94X2dhbWVfbG9iYnksCiAgICAvLyAgICAgbG9iYnlfc2xvdD1sb2JieV9zbG90Lm5hdGl2ZSwKICAgIC8vICAgICBjbGVhcl9wbGF5ZXI9RmFsc2UsCiAgICAvLyApLCBlcnIuUExBWUVSX05PVF9GT1VORAogICAgY2FsbHN1YiBjaGVja19hY2NfaW5fZ2FtZQogICAgYXNzZXJ0IC8vIFBsYXllciBub3QgZm91bmQuIEVuc3VyZSBwbGF5ZXIgYWRkcmVzcyBpcyBpbnNpZGUgdGhlIGdhbWUgbG9iYnkuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzA2CiAgICAvLyBrZXk9c2VsZi5ib3hfZ2FtZV9jaGFyYWN0ZXJzLmtleV9wcmVmaXggKyBvcC5pdG9iKGdhbWVfaWQpCiAgICBieXRlYyA1IC8vICJjXyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3MDQtNzA3CiAgICAvLyAjIFJlYWQgdGhlIHNlbmRlciBjaGFyYWN0ZXIgc2xvdCBvbmNlLCBwYXRjaCBpdCBpbiBtZW1vcnksIHRoZW4gd3JpdGUgaXQgYmFjayBvbmNlCiAgICAvLyBnYW1lX2NoYXJhY3RlcnNfYnJlZiA9IEJveFJlZigKICAgIC8vICAgICBrZXk9c2VsZi5ib3hfZ2FtZV9jaGFyYWN0ZXJzLmtleV9wcmVmaXggKyBvcC5pdG9iKGdhbWVfaWQpCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3MDYKICAgIC8vIGtleT1zZWxmLmJveF9nYW1lX2NoYXJhY3RlcnMua2V5X3ByZWZpeCArIG9wLml0b2IoZ2FtZV9pZCkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjcwNC03MDcKICAgIC8vICMgUmVhZCB0aGUgc2VuZGVyIGNoYXJhY3RlciBzbG90IG9uY2UsIHBhdGNoIGl0IGluIG1lbW9yeSwgdGhlbiB3cml0ZSBpdCBiYWNrIG9uY2UKICAgIC8vIGdhbWVfY2hhcmFjdGVyc19icmVmID0gQm94UmVmKAogICAgLy8gICAgIGtleT1zZWxmLmJveF9nYW1lX2NoYXJhY3RlcnMua2V5X3ByZWZpeCArIG9wLml0b2IoZ2FtZV9pZCkKICAgIC8vICkKICAgIGR1cAogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjcwOAogICAgLy8gY2hhcmFjdGVyX29mZnNldCA9IGxvYmJ5X3Nsb3QubmF0aXZlICogY3N0LkdBTUVfQ0hBUkFDVEVSX1NJWkUKICAgIHN3YXAKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICoKICAgIGR1cAogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjcxMAogICAgLy8gZ2FtZV9jaGFyYWN0ZXJzX2JyZWYuZXh0cmFjdChjaGFyYWN0ZXJfb2Zmc2V0LCBjc3QuR0FNRV9DSEFSQUNURVJfU0laRSkKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzA5LTcxMQogICAgLy8gY2hhcmFjdGVyID0gc3RjLkdhbWVDaGFyYWN0ZXIuZnJvbV9ieXRlcygKICAgIC8vICAgICBnYW1lX2NoYXJhY3RlcnNfYnJlZi5leHRyYWN0KGNoYXJhY3Rlcl9vZmZzZXQsIGNzdC5HQU1FX0NIQVJBQ1RFUl9TSVpFKQogICAgLy8gKQogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzEzCiAgICAvLyBhc3NlcnQgY2hhcmFjdGVyLmhhc19jb21taXR0ZWRfdHVybi5uYXRpdmUsIGVyci5UVVJOX05PVF9DT01NSVRURUQKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgYnl0ZWNfMCAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIGFzc2VydCAvLyBUdXJuIG5vdCBjb21taXR0ZWQuIENvbW1pdCBhIHR1cm4gaGFzaCBiZWZvcmUgcmV2ZWFsaW5nIHRoZSB0dXJuLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjcxNAogICAgLy8gYXNzZXJ0IG5vdCBjaGFyYWN0ZXIuaGFzX3JldmVhbGVkX3R1cm4ubmF0aXZlLCBlcnIuVFVSTl9BTFJFQURZX1JFVkVBTEVECiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICBnZXRiaXQKICAgIGJ5dGVjXzAgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICAhCiAgICBhc3NlcnQgLy8gVHVybiBhbHJlYWR5IHJldmVhbGVkLiBXYWl0IGZvciB0aGUgcm91bmQgdG8gcmVzb2x2ZSBiZWZvcmUgcmV2ZWFsaW5nIGFnYWluLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjcxNQogICAgLy8gYXNzZXJ0IG1vdmVtZW50Lmxlbmd0aCA8PSBjaGFyYWN0ZXIubW92ZV9wb2ludHMubmF0aXZlLCBlcnIuTU9WRU1FTlRfT1ZFUkZMT1cKICAgIGZyYW1lX2RpZyAtNAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIHN3YXAKICAgIHB1c2hpbnQgNiAvLyA2CiAgICBnZXRieXRlCiAgICBkaWcgMQogICAgPj0KICAgIGFzc2VydCAvLyBNb3ZlbWVudCBvdmVyZmxvdy4gRW5zdXJlIG1vdmVtZW50IGxlbmd0aCAobnVtIG9mIGluZGljaWVzKSBpcyB3aXRoaW4gdmFsaWQgcmFuZ2UuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzE2CiAgICAvLyBhc3NlcnQgYWN0aW9uIDw9IGNzdC5NQVhfQUNUSU9OLCBlcnIuQUNUSU9OX09WRVJGTE9XCiAgICBmcmFtZV9kaWcgLTMKICAgIGJ5dGVjIDE0IC8vIDB4MDEKICAgIGI8PQogICAgYXNzZXJ0IC8vIEFjdGlvbiBvdmVyZmxvdy4gRW5zdXJlIGFjdGlvbiBpbmRleCBpcyB3aXRoaW4gdmFsaWQgcmFuZ2UuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzE3CiAgICAvLyBhc3NlcnQgZGlyZWN0aW9uIDw9IGNzdC5NQVhfRElSRUNUSU9OLCBlcnIuRElSRUNUSU9OX09WRVJGTE9XCiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hieXRlcyAweDAzCiAgICBiPD0KICAgIGFzc2VydCAvLyBEaXJlY3Rpb24gb3ZlcmZsb3cuIEVuc3VyZSBkaXJlY3Rpb24gaW5kZXggaXMgd2l0aGluIHZhbGlkIHJhbmdlLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjcxOS03MjAKICAgIC8vICMgRW5zdXJlIHRyYW5zYWN0aW9uIGhhcyBzdWZmaWNpZW50IG9wY29kZSBidWRnZXQgZm9yIHRoZSBjaGVja3MsIHRoZSBtb3ZlcyBhbmQgdGhlIHR1cm4gaGFzaAogICAgLy8gY29tbWl0X3NjaGVtZSA9IGdhbWVfc3RhdGUuY29tbWl0X3NjaGVtZS5uYXRpdmUKICAgIHN3YXAKICAgIHB1c2hpbnQgODUgLy8gODUKICAgIGdldGJ5dGUKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI1NgogICAgLy8gYnVkZ2V0ID0gY3N0LlJFVkVBTF9UVVJOX0JBU0VfQlVER0VUICsgY3N0LlJFVkVBTF9NT1ZFX0NPU1QgKiBuX21vdmVzCiAgICBwdXNoaW50IDEyMCAvLyAxMjAKICAgIHVuY292ZXIgMgogICAgKgogICAgcHVzaGludCAxNDAwIC8vIDE0MDAKICAgICsKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjU3CiAgICAvLyBpZiBjb21taXRfc2NoZW1lID09IGNzdC5DT01NSVRfU0NIRU1FX01JTUM6CiAgICBibnogcmV2ZWFsX3R1cm5fYWZ0ZXJfaWZfZWxzZUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjU5CiAgICAvLyBjc3QuVFVSTl9QUkVJTUFHRV9GSVhFRF9GSUVMRFMgKyAyICogbl9tb3ZlcwogICAgaW50Y18zIC8vIDIKICAgIGZyYW1lX2RpZyAxNAogICAgKgogICAgcHVzaGludCA1IC8vIDUKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyNTgKICAgIC8vIGJ1ZGdldCArPSBjc3QuTUlNQ19CQVNFX0NPU1QgKyBjc3QuTUlNQ19FTEVNRU5UX0NPU1QgKiAoCiAgICBwdXNoaW50IDU1MCAvLyA1NTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyNTgtMjYwCiAgICAvLyBidWRnZXQgKz0gY3N0Lk1JTUNfQkFTRV9DT1NUICsgY3N0Lk1JTUNfRUxFTUVOVF9DT1NUICogKAogICAgLy8gICAgIGNzdC5UVVJOX1BSRUlNQUdFX0ZJWEVEX0ZJRUxEUyArIDIgKiBuX21vdmVzCiAgICAvLyApCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjU4CiAgICAvLyBidWRnZXQgKz0gY3N0Lk1JTUNfQkFTRV9DT1NUICsgY3N0Lk1JTUNfRUxFTUVOVF9DT1NUICogKAogICAgcHVzaGludCAxMCAvLyAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI1OC0yNjAKICAgIC8vIGJ1ZGdldCArPSBjc3QuTUlNQ19CQVNFX0NPU1QgKyBjc3QuTUlNQ19FTEVNRU5UX0NPU1QgKiAoCiAgICAvLyAgICAgY3N0LlRVUk5fUFJFSU1BR0VfRklYRURfRklFTERTICsgMiAqIG5fbW92ZXMKICAgIC8vICkKICAgICsKICAgIGZyYW1lX2RpZyAxNgogICAgKwogICAgZnJhbWVfYnVyeSAxNwoKcmV2ZWFsX3R1cm5fYWZ0ZXJfaWZfZWxzZUA1OgogICAgZnJhbWVfZGlnIDE3CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzIzCiAgICAvLyBmZWVfc291cmNlPU9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQsCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjcyMS03MjQKICAgIC8vIGVuc3VyZV9idWRnZXQoCiAgICAvLyAgICAgcmVxdWlyZWRfYnVkZ2V0PXNydC5nZXRfcmV2ZWFsX3R1cm5fYnVkZ2V0KGNvbW1pdF9zY2hlbWUsIG1vdmVtZW50Lmxlbmd0aCksCiAgICAvLyAgICAgZmVlX3NvdXJjZT1PcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0LAogICAgLy8gKQogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjM3CiAgICAvLyBpZiBjb21taXRfc2NoZW1lID09IGNzdC5DT01NSVRfU0NIRU1FX1NIQTI1NjoKICAgIGZyYW1lX2RpZyAxNQogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiByZXZlYWxfdHVybl9hZnRlcl9pZl9lbHNlQDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyMTgKICAgIC8vIG9wLml0b2IoY3N0LkRPTUFJTl9QUkVGSVgpCiAgICBpbnRjIDcgLy8gMzU4MTE2NzgzNzI3CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjE4LTIxOQogICAgLy8gb3AuaXRvYihjc3QuRE9NQUlOX1BSRUZJWCkKICAgIC8vICsgb3AuaXRvYihnYW1lX2lkKQogICAgZnJhbWVfZGlnIDEwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyMTgtMjIwCiAgICAvLyBvcC5pdG9iKGNzdC5ET01BSU5fUFJFRklYKQogICAgLy8gKyBvcC5pdG9iKGdhbWVfaWQpCiAgICAvLyArIG1vdmVtZW50LmJ5dGVzCiAgICBmcmFtZV9kaWcgLTQKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjIxOC0yMjEKICAgIC8vIG9wLml0b2IoY3N0LkRPTUFJTl9QUkVGSVgpCiAgICAvLyArIG9wLml0b2IoZ2FtZV9pZCkKICAgIC8vICsgbW92ZW1lbnQuYnl0ZXMKICAgIC8vICsgYWN0aW9uLmJ5dGVzCiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjIxOC0yMjIKICAgIC8vIG9wLml0b2IoY3N0LkRPTUFJTl9QUkVGSVgpCiAgICAvLyArIG9wLml0b2IoZ2FtZV9pZCkKICAgIC8vICsgbW92ZW1lbnQuYnl0ZXMKICAgIC8vICsgYWN0aW9uLmJ5dGVzCiAgICAvLyArIGRpcmVjdGlvbi5ieXRlcwogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyMTgtMjIzCiAgICAvLyBvcC5pdG9iKGNzdC5ET01BSU5fUFJFRklYKQogICAgLy8gKyBvcC5pdG9iKGdhbWVfaWQpCiAgICAvLyArIG1vdmVtZW50LmJ5dGVzCiAgICAvLyArIGFjdGlvbi5ieXRlcwogICAgLy8gKyBkaXJlY3Rpb24uYnl0ZXMKICAgIC8vICsgc2FsdC5ieXRlcwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyMzgtMjQwCiAgICAvLyByZXR1cm4gb3Auc2hhMjU2KAogICAgLy8gICAgIGJ1aWxkX3R1cm5fcHJlaW1hZ2VfYnl0ZXMoZ2FtZV9pZCwgbW92ZW1lbnQsIGFjdGlvbiwgZGlyZWN0aW9uLCBzYWx0KQogICAgLy8gKQogICAgc2hhMjU2CgpyZXZlYWxfdHVybl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5zYWx2by5zdWJyb3V0aW5lcy5jb21wdXRlX3R1cm5faGFzaEAxNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3MzYKICAgIC8vID09IGNoYXJhY3Rlci50dXJuX2hhc2guYnl0ZXMKICAgIGZyYW1lX2RpZyAxMwogICAgZHVwCiAgICBleHRyYWN0IDggMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzI4LTczNgogICAgLy8gc3J0LmNvbXB1dGVfdHVybl9oYXNoKAogICAgLy8gICAgIGNvbW1pdF9zY2hlbWUsCiAgICAvLyAgICAgZ2FtZV9pZCwKICAgIC8vICAgICBtb3ZlbWVudCwKICAgIC8vICAgICBhY3Rpb24sCiAgICAvLyAgICAgZGlyZWN0aW9uLAogICAgLy8gICAgIHNhbHQsCiAgICAvLyApCiAgICAvLyA9PSBjaGFyYWN0ZXIudHVybl9oYXNoLmJ5dGVzCiAgICB1bmNvdmVyIDIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzI2LTczNwogICAgLy8gIyBSZWNvbXB1dGUgdGhlIHR1cm4gaGFzaCB3LyB0aGUgZ2FtZSBjb21taXQgc2NoZW1lCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNydC5jb21wdXRlX3R1cm5faGFzaCgKICAgIC8vICAgICAgICAgY29tbWl0X3NjaGVtZSwKICAgIC8vICAgICAgICAgZ2FtZV9pZCwKICAgIC8vICAgICAgICAgbW92ZW1lbnQsCiAgICAvLyAgICAgICAgIGFjdGlvbiwKICAgIC8vICAgICAgICAgZGlyZWN0aW9uLAogICAgLy8gICAgICAgICBzYWx0LAogICAgLy8gICAgICkKICAgIC8vICAgICA9PSBjaGFyYWN0ZXIudHVybl9oYXNoLmJ5dGVzCiAgICAvLyApLCBlcnIuVFVSTl9IQVNIX01JU01BVENICiAgICBhc3NlcnQgLy8gVHVybiBoYXNoIG1pc21hdGNoLiBFbnN1cmUgdGhlIHJldmVhbGVkIHR1cm4gaXMgdGhlIG9uZSBjb21taXR0ZWQgZm9yIHRoaXMgZ2FtZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3NDMKICAgIC8vIHNydC5jb252ZXJ0X2dyaWRfaW5kZXhfdG9fY29vcmRzKGNoYXJhY3Rlci5wb3NpdGlvbiksCiAgICBkdXAKICAgIGV4dHJhY3QgNCAxIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfYnVyeSAyCiAgICBpbnRjXzIgLy8gNAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI2Ny0yNjgKICAgIC8vICMgRmFpbCB0cmFuc2FjdGlvbiB1bmxlc3MgdGhlIGFzc2VydGlvbiBiZWxvdyBldmFsdWF0ZXMgVHJ1ZQogICAgLy8gYXNzZXJ0IGkubmF0aXZlIDwgY3N0LkdSSURfQ0VMTF9UT1RBTCwgZXJyLklOVkFMSURfUE9TX0lOREVYCiAgICBnZXRieXRlCiAgICBkdXAKICAgIHB1c2hpbnQgMTIxIC8vIDEyMQogICAgPAogICAgYXNzZXJ0IC8vIEludmFsaWQgcG9zaXRpb24gaW5kZXguIEVuc3VyZSBpbmRleCB2YWx1ZSBpcyB3aXRoaW4gdmFsaWQgcmFuZ2UuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjcwLTI3MQogICAgLy8gIyBDb252ZXJ0IGdhbWUgZ3JpZCBmbGF0dGVuZWQgMUQgYXJyYXkgaW5kZXggaW50byAyRCBjb29yZGluYXRlcwogICAgLy8gcm93ID0gaS5uYXRpdmUgLy8gY3N0LkdSSURfU0laRSAgIyBDb21wdXRlICdyb3cnIGZyb20gaW50ZWdlciBmbG9vciBkaXZpc2lvbgogICAgZHVwCiAgICBwdXNoaW50IDExIC8vIDExCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjcyCiAgICAvLyBjb2wgPSBpLm5hdGl2ZSAlIGNzdC5HUklEX1NJWkUgICMgQ29tcHV0ZSAnY29sJyBjb29yZGluYXRlIGZyb20gcmVtYWluZGVyCiAgICBzd2FwCiAgICBwdXNoaW50IDExIC8vIDExCiAgICAlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6Mjc0LTI3NQogICAgLy8gIyBXcmFwIGNvb3JkaW5hdGVzIGluIGEgYENvb3Jkc1BhaXJgIHR1cGxlIG9iamVjdCBhbmQgcmV0dXJuCiAgICAvLyByZXR1cm4gdGEuQ29vcmRzUGFpcigoYXJjNC5VSW50OChyb3cpLCBhcmM0LlVJbnQ4KGNvbCkpKQogICAgc3dhcAogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgc3dhcAogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzQyCiAgICAvLyBzZWxmLmJveF9nYW1lX2dyaWQsCiAgICBieXRlYyA2IC8vICJnXyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo3MC03MQogICAgLy8gIyBGYWlsIHRyYW5zYWN0aW9uIHVubGVzcyB0aGUgYXNzZXJ0aW9ucyBiZWxvdyBldmFsdWF0ZSBUcnVlLCBvbmNlIGZvciB0aGUgd2hvbGUgc2VxdWVuY2UKICAgIC8vIGFzc2VydCBnYW1lX2lkIGluIGJveF9nYW1lX2dyaWQsIGVyci5HQU1FX0lEX05PVF9GT1VORAogICAgZnJhbWVfZGlnIDEwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gR2FtZSBJRCBub3QgZm91bmQuIEVuc3VyZSB0aGUgZ2FtZSB3YXMgY3JlYXRlZCBhbmQgc3RpbGwgZXhpc3RzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjczLTc0CiAgICAvLyAjIEFzc2VydCBzdGFydGluZyByb3cgYW5kIGNvbHVtbiBhcmUgd2l0aGluIHZhbGlkIHJhbmdlLCBzbyBldmVyeSBuZWlnaGJvciBpbmRleCBpcyBhIGdyaWQgaW5kZXgKICAgIC8vIHJvdywgY29sID0gcG9zaXRpb24ubmF0aXZlCiAgICBkaWcgMQogICAgZXh0cmFjdCAwIDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMgogICAgZXh0cmFjdCAxIDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NzUKICAgIC8vIGFzc2VydF9jb29yZHNfaW5fcmFuZ2Uocm93LCBjb2wpCiAgICBjYWxsc3ViIGFzc2VydF9jb29yZHNfaW5fcmFuZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo3Ny03OAogICAgLy8gIyBSZWFkIHRoZSBnYW1lIGdyaWQgYm94IG9uY2UsIGFsbCBuZWlnaGJvciBsb29rdXBzIGJlbG93IHVzZSB0aGlzIGxvY2FsIGNvcHkKICAgIC8vIGdyaWQgPSBib3hfZ2FtZV9ncmlkW2dhbWVfaWRdLmJ5dGVzCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDEKICAgIGFzc2VydCAvLyBjaGVjayBCb3hNYXAgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6ODAtODEKICAgIC8vICMgVHJhY2sgY3VycmVudCBwb3NpdGlvbiBhcyBhIGdyaWQgaW5kZXgsIHNvIGVhY2ggbW92ZSBpcyBhIG5laWdoYm9yIHRhYmxlIGxvb2t1cAogICAgLy8gY3VycmVudCA9IHJvdy5uYXRpdmUgKiBjc3QuR1JJRF9TSVpFICsgY29sLm5hdGl2ZQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6NzMtNzQKICAgIC8vICMgQXNzZXJ0IHN0YXJ0aW5nIHJvdyBhbmQgY29sdW1uIGFyZSB3aXRoaW4gdmFsaWQgcmFuZ2UsIHNvIGV2ZXJ5IG5laWdoYm9yIGluZGV4IGlzIGEgZ3JpZCBpbmRleAogICAgLy8gcm93LCBjb2wgPSBwb3NpdGlvbi5uYXRpdmUKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6ODAtODEKICAgIC8vICMgVHJhY2sgY3VycmVudCBwb3NpdGlvbiBhcyBhIGdyaWQgaW5kZXgsIHNvIGVhY2ggbW92ZSBpcyBhIG5laWdoYm9yIHRhYmxlIGxvb2t1cAogICAgLy8gY3VycmVudCA9IHJvdy5uYXRpdmUgKiBjc3QuR1JJRF9TSVpFICsgY29sLm5hdGl2ZQogICAgZ2V0Ynl0ZQogICAgcHVzaGludCAxMSAvLyAxMQogICAgKgogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjczLTc0CiAgICAvLyAjIEFzc2VydCBzdGFydGluZyByb3cgYW5kIGNvbHVtbiBhcmUgd2l0aGluIHZhbGlkIHJhbmdlLCBzbyBldmVyeSBuZWlnaGJvciBpbmRleCBpcyBhIGdyaWQgaW5kZXgKICAgIC8vIHJvdywgY29sID0gcG9zaXRpb24ubmF0aXZlCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjgwLTgxCiAgICAvLyAjIFRyYWNrIGN1cnJlbnQgcG9zaXRpb24gYXMgYSBncmlkIGluZGV4LCBzbyBlYWNoIG1vdmUgaXMgYSBuZWlnaGJvciB0YWJsZSBsb29rdXAKICAgIC8vIGN1cnJlbnQgPSByb3cubmF0aXZlICogY3N0LkdSSURfU0laRSArIGNvbC5uYXRpdmUKICAgIGdldGJ5dGUKICAgICsKICAgIGZyYW1lX2J1cnkgNgogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgNwoKcmV2ZWFsX3R1cm5fZm9yX2hlYWRlckAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo4My04NAogICAgLy8gIyBJdGVyYXRlIHRocm91Z2ggdGhlIGNvb3JkcyBpbiB0aGUgbW92ZW1lbnQgc2VxdWVuY2UKICAgIC8vIGZvciBjb29yZHMgaW4gbW92ZW1lbnQ6CiAgICBmcmFtZV9kaWcgNwogICAgZnJhbWVfZGlnIDE0CiAgICA8CiAgICBieiByZXZlYWxfdHVybl9hZnRlcl9mb3JAMzEKICAgIGZyYW1lX2RpZyAtNAogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyA3CiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgaW50Y18zIC8vIDIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5Ojg1LTg2CiAgICAvLyAjIEV4dHJhY3Qgcm93IGFuZCBjb2x1bW4gdmFsdWVzIGZyb20gdGhlIGVudHJ5CiAgICAvLyByb3csIGNvbCA9IGNvb3Jkcy5uYXRpdmUKICAgIGR1cAogICAgZXh0cmFjdCAwIDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMQogICAgZXh0cmFjdCAxIDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6ODgtODkKICAgIC8vICMgQXNzZXJ0IHJvdyBhbmQgY29sdW1uIGFyZSB3aXRoaW4gdmFsaWQgcmFuZ2UKICAgIC8vIGFzc2VydF9jb29yZHNfaW5fcmFuZ2Uocm93LCBjb2wpCiAgICBjYWxsc3ViIGFzc2VydF9jb29yZHNfaW5fcmFuZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo5MS05MgogICAgLy8gIyBDaGVjayBpZiBjb29yZHMgZW50cnkgZnJvbSBtb3ZlbWVudCBzZXF1ZW5jZSBpcyBub3QgYSB2YWxpZCBtb3ZlCiAgICAvLyB0YXJnZXQgPSByb3cubmF0aXZlICogY3N0LkdSSURfU0laRSArIGNvbC5uYXRpdmUKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5Ojg1LTg2CiAgICAvLyAjIEV4dHJhY3Qgcm93IGFuZCBjb2x1bW4gdmFsdWVzIGZyb20gdGhlIGVudHJ5CiAgICAvLyByb3csIGNvbCA9IGNvb3Jkcy5uYXRpdmUKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6OTEtOTIKICAgIC8vICMgQ2hlY2sgaWYgY29vcmRzIGVudHJ5IGZyb20gbW92ZW1lbnQgc2VxdWVuY2UgaXMgbm90IGEgdmFsaWQgbW92ZQogICAgLy8gdGFyZ2V0ID0gcm93Lm5hdGl2ZSAqIGNzdC5HUklEX1NJWkUgKyBjb2wubmF0aXZlCiAgICBnZXRieXRlCiAgICBwdXNoaW50IDExIC8vIDExCiAgICAqCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6ODUtODYKICAgIC8vICMgRXh0cmFjdCByb3cgYW5kIGNvbHVtbiB2YWx1ZXMgZnJvbSB0aGUgZW50cnkKICAgIC8vIHJvdywgY29sID0gY29vcmRzLm5hdGl2ZQogICAgaW50Y18xIC8vIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo5MS05MgogICAgLy8gIyBDaGVjayBpZiBjb29yZHMgZW50cnkgZnJvbSBtb3ZlbWVudCBzZXF1ZW5jZSBpcyBub3QgYSB2YWxpZCBtb3ZlCiAgICAvLyB0YXJnZXQgPSByb3cubmF0aXZlICogY3N0LkdSSURfU0laRSArIGNvbC5uYXRpdmUKICAgIGdldGJ5dGUKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTA3CiAgICAvLyByZXR1cm4gdW5wYWNrX2dyaWRfY2VsbChvcC5nZXRieXRlKGdyaWQsIGkgLy8gY3N0LkdSSURfQ0VMTFNfUEVSX0JZVEUpLCBpKSA9PSAwCiAgICBkdXAKICAgIGludGNfMiAvLyA0CiAgICAvCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgZ2V0Ynl0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjExNAogICAgLy8gY3N0LkdSSURfQ0VMTFNfUEVSX0JZVEUgLSAxIC0gaSAlIGNzdC5HUklEX0NFTExTX1BFUl9CWVRFCiAgICBzd2FwCiAgICBpbnRjXzIgLy8gNAogICAgJQogICAgcHVzaGludCAzIC8vIDMKICAgIHN3YXAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxMTUKICAgIC8vICkgKiBjc3QuR1JJRF9DRUxMX0JJVFMKICAgIGludGNfMyAvLyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTEzLTExNQogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBjc3QuR1JJRF9DRUxMU19QRVJfQllURSAtIDEgLSBpICUgY3N0LkdSSURfQ0VMTFNfUEVSX0JZVEUKICAgIC8vICkgKiBjc3QuR1JJRF9DRUxMX0JJVFMKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxMjEKICAgIC8vIHJldHVybiAocGFja2VkID4+IGdyaWRfY2VsbF9zaGlmdChpKSkgJiBjc3QuR1JJRF9DRUxMX01BU0sKICAgIHNocgogICAgcHVzaGludCAzIC8vIDMKICAgICYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxMjctMTI4CiAgICAvLyAjIEEgbW92ZSBjYW4gb25seSBlbmQgb24gYSBwYXRoIGNlbGwKICAgIC8vIGlmIG5vdCBpc19wYXRoX2NlbGwoZ3JpZCwgdGFyZ2V0KToKICAgIGJ6IHJldmVhbF90dXJuX2FmdGVyX2lmX2Vsc2VAMjIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxMjkKICAgIC8vIHJldHVybiBGYWxzZQogICAgaW50Y18wIC8vIDAKCnJldmVhbF90dXJuX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnNhbHZvLnN1YnJvdXRpbmVzLmlzX25laWdoYm9yX3BhdGhfY2VsbEAyODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo5MwogICAgLy8gaWYgbm90IGlzX25laWdoYm9yX3BhdGhfY2VsbChncmlkLCBjdXJyZW50LCB0YXJnZXQpOgogICAgYm56IHJldmVhbF90dXJuX2FmdGVyX2lmX2Vsc2VAMzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTo5NAogICAgLy8gcmV0dXJuIEZhbHNlCiAgICBpbnRjXzAgLy8gMAoKcmV2ZWFsX3R1cm5fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuc2Fsdm8uc3Vicm91dGluZXMuaXNfbW92ZV9zZXF1ZW5jZV92YWxpZEAzMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3MzktNzQ1CiAgICAvLyAjIFZhbGlkYXRlIHRoZSBtb3ZlbWVudCBmcm9tIHRoZSBjaGFyYWN0ZXIgcG9zaXRpb24KICAgIC8vIGFzc2VydCBzcnQuaXNfbW92ZV9zZXF1ZW5jZV92YWxpZCgKICAgIC8vICAgICBnYW1lX2lkLAogICAgLy8gICAgIHNlbGYuYm94X2dhbWVfZ3JpZCwKICAgIC8vICAgICBzcnQuY29udmVydF9ncmlkX2luZGV4X3RvX2Nvb3JkcyhjaGFyYWN0ZXIucG9zaXRpb24pLAogICAgLy8gICAgIG1vdmVtZW50LmNvcHkoKSwKICAgIC8vICksIGVyci5JTlZBTElEX01PVkVfU0VRVUVOQ0UKICAgIGFzc2VydCAvLyBJbnZhbGlkIG1vdmUgc2VxdWVuY2UuIEVuc3VyZSBldmVyeSBtb3ZlbWVudCBlbnRyeSBpcyBhIHBhdGggY2VsbCBuZXh0IHRvIHRoZSBwcmV2aW91cyBvbmUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzQ3LTc0OAogICAgLy8gIyBSZWNvcmQgdGhlIHJldmVhbGVkIHR1cm4gb24gdGhlIGNoYXJhY3RlciwgYHJlc29sdmVfcm91bmRgIGFwcGxpZXMgaXQgdy8gZXZlcnkgb3RoZXIgdHVybgogICAgLy8gY2hhcmFjdGVyLnRhcmdldCA9IGNoYXJhY3Rlci5wb3NpdGlvbgogICAgZnJhbWVfZGlnIDEzCiAgICBmcmFtZV9kaWcgMgogICAgcmVwbGFjZTIgNQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEzCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3NDkKICAgIC8vIGlmIG1vdmVtZW50Lmxlbmd0aCA+IDA6CiAgICBmcmFtZV9kaWcgMTQKICAgIGJ6IHJldmVhbF90dXJuX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc1MAogICAgLy8gcm93LCBjb2wgPSBtb3ZlbWVudFttb3ZlbWVudC5sZW5ndGggLSAxXS5uYXRpdmUKICAgIGZyYW1lX2RpZyAxNAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGZyYW1lX2RpZyAtNAogICAgZXh0cmFjdCAyIDAKICAgIHN3YXAKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICBpbnRjXzMgLy8gMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGV4dHJhY3QgMCAxIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgc3dhcAogICAgZXh0cmFjdCAxIDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzUxCiAgICAvLyBjaGFyYWN0ZXIudGFyZ2V0ID0gc3J0LmNvbnZlcnRfZ3JpZF9jb29yZHNfdG9faW5kZXgocm93LCBjb2wpCiAgICBjYWxsc3ViIGNvbnZlcnRfZ3JpZF9jb29yZHNfdG9faW5kZXgKICAgIGZyYW1lX2RpZyAxMwogICAgc3dhcAogICAgcmVwbGFjZTIgNQogICAgZnJhbWVfYnVyeSAwCgpyZXZlYWxfdHVybl9hZnRlcl9pZl9lbHNlQDI6CiAgICBmcmFtZV9kaWcgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc1MgogICAgLy8gY2hhcmFjdGVyLmFjdGlvbiA9IGFjdGlvbgogICAgZnJhbWVfZGlnIC0zCiAgICByZXBsYWNlMiAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzUzCiAgICAvLyBjaGFyYWN0ZXIuZGlyZWN0aW9uID0gZGlyZWN0aW9uCiAgICBmcmFtZV9kaWcgLTIKICAgIHJlcGxhY2UyIDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3NTQKICAgIC8vIGNoYXJhY3Rlci5oYXNfcmV2ZWFsZWRfdHVybiA9IGFyYzQuQm9vbChUcnVlKSAgIyBub3FhOiBGQlQwMDMKICAgIGludGNfMSAvLyAxCiAgICBkdXAKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc1NQogICAgLy8gZ2FtZV9jaGFyYWN0ZXJzX2JyZWYucmVwbGFjZShjaGFyYWN0ZXJfb2Zmc2V0LCBjaGFyYWN0ZXIuYnl0ZXMpCiAgICBmcmFtZV9kaWcgMTEKICAgIGZyYW1lX2RpZyAxMgogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgcmV0c3ViCgpyZXZlYWxfdHVybl9hZnRlcl9pZl9lbHNlQDMwOgogICAgZnJhbWVfZGlnIDcKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDcKICAgIGZyYW1lX2RpZyA5CiAgICBmcmFtZV9idXJ5IDYKICAgIGIgcmV2ZWFsX3R1cm5fZm9yX2hlYWRlckAxOQoKcmV2ZWFsX3R1cm5fYWZ0ZXJfaWZfZWxzZUAyMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxMzMKICAgIC8vIEJ5dGVzKGNzdC5ORUlHSEJPUl9UQUJMRSksIGkgKiBjc3QuTkVJR0hCT1JfQ09VTlQsIGNzdC5ORUlHSEJPUl9DT1VOVAogICAgZnJhbWVfZGlnIDYKICAgIGludGNfMiAvLyA0CiAgICAqCiAgICBieXRlYyAyMiAvLyAweGZmMGJmZjAxZmYwYzAwMDJmZjBkMDEwM2ZmMGUwMjA0ZmYwZjAzMDVmZjEwMDQwNmZmMTEwNTA3ZmYxMjA2MDhmZjEzMDcwOWZmMTQwODBhZmYxNTA5ZmYwMDE2ZmYwYzAxMTcwYjBkMDIxODBjMGUwMzE5MGQwZjA0MWEwZTEwMDUxYjBmMTEwNjFjMTAxMjA3MWQxMTEzMDgxZTEyMTQwOTFmMTMxNTBhMjAxNGZmMGIyMWZmMTcwYzIyMTYxODBkMjMxNzE5MGUyNDE4MWEwZjI1MTkxYjEwMjYxYTFjMTEyNzFiMWQxMjI4MWMxZTEzMjkxZDFmMTQyYTFlMjAxNTJiMWZmZjE2MmNmZjIyMTcyZDIxMjMxODJlMjIyNDE5MmYyMzI1MWEzMDI0MjYxYjMxMjUyNzFjMzIyNjI4MWQzMzI3MjkxZTM0MjgyYTFmMzUyOTJiMjAzNjJhZmYyMTM3ZmYyZDIyMzgyYzJlMjMzOTJkMmYyNDNhMmUzMDI1M2IyZjMxMjYzYzMwMzIyNzNkMzEzMzI4M2UzMjM0MjkzZjMzMzUyYTQwMzQzNjJiNDEzNWZmMmM0MmZmMzgyZDQzMzczOTJlNDQzODNhMmY0NTM5M2IzMDQ2M2EzYzMxNDczYjNkMzI0ODNjM2UzMzQ5M2QzZjM0NGEzZTQwMzU0YjNmNDEzNjRjNDBmZjM3NGRmZjQzMzg0ZTQyNDQzOTRmNDM0NTNhNTA0NDQ2M2I1MTQ1NDczYzUyNDY0ODNkNTM0NzQ5M2U1NDQ4NGEzZjU1NDk0YjQwNTY0YTRjNDE1NzRiZmY0MjU4ZmY0ZTQzNTk0ZDRmNDQ1YTRlNTA0NTViNGY1MTQ2NWM1MDUyNDc1ZDUxNTM0ODVlNTI1NDQ5NWY1MzU1NGE2MDU0NTY0YjYxNTU1NzRjNjI1NmZmNGQ2M2ZmNTk0ZTY0NTg1YTRmNjU1OTViNTA2NjVhNWM1MTY3NWI1ZDUyNjg1YzVlNTM2OTVkNWY1NDZhNWU2MDU1NmI1ZjYxNTY2YzYwNjI1NzZkNjFmZjU4NmVmZjY0NTk2ZjYzNjU1YTcwNjQ2NjViNzE2NTY3NWM3MjY2Njg1ZDczNjc2OTVlNzQ2ODZhNWY3NTY5NmI2MDc2NmE2YzYxNzc2YjZkNjI3ODZjZmY2M2ZmZmY2ZjY0ZmY2ZTcwNjVmZjZmNzE2NmZmNzA3MjY3ZmY3MTczNjhmZjcyNzQ2OWZmNzM3NTZhZmY3NDc2NmJmZjc1Nzc2Y2ZmNzY3ODZkZmY3N2ZmCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTMxLTEzNAogICAgLy8gIyBFeHRyYWN0IHRoZSBOb3J0aCwgU291dGgsIFdlc3QgYW5kIEVhc3QgbmVpZ2hib3IgaW5kaWNlcyBvZiBjZWxsIGkgZnJvbSB0aGUgbmVpZ2hib3IgdGFibGUKICAgIC8vIG5laWdoYm9ycyA9IG9wLmV4dHJhY3QoCiAgICAvLyAgICAgQnl0ZXMoY3N0Lk5FSUdIQk9SX1RBQkxFKSwgaSAqIGNzdC5ORUlHSEJPUl9DT1VOVCwgY3N0Lk5FSUdIQk9SX0NPVU5UCiAgICAvLyApCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTMzCiAgICAvLyBCeXRlcyhjc3QuTkVJR0hCT1JfVEFCTEUpLCBpICogY3N0Lk5FSUdIQk9SX0NPVU5ULCBjc3QuTkVJR0hCT1JfQ09VTlQKICAgIGludGNfMiAvLyA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTMxLTEzNAogICAgLy8gIyBFeHRyYWN0IHRoZSBOb3J0aCwgU291dGgsIFdlc3QgYW5kIEVhc3QgbmVpZ2hib3IgaW5kaWNlcyBvZiBjZWxsIGkgZnJvbSB0aGUgbmVpZ2hib3IgdGFibGUKICAgIC8vIG5laWdoYm9ycyA9IG9wLmV4dHJhY3QoCiAgICAvLyAgICAgQnl0ZXMoY3N0Lk5FSUdIQk9SX1RBQkxFKSwgaSAqIGNzdC5ORUlHSEJPUl9DT1VOVCwgY3N0Lk5FSUdIQk9SX0NPVU5UCiAgICAvLyApCiAgICBleHRyYWN0MwogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTM2LTEzNwogICAgLy8gIyBUYXJnZXQgaXMgYSBuZWlnaGJvciBpZiBhbnkgZW50cnkgbWF0Y2hlcyBpdCAodGhlIDI1NSBwYWRkaW5nIG5ldmVyIG1hdGNoZXMgYSBncmlkIGluZGV4KQogICAgLy8gZm9yIGsgaW4gdXJhbmdlKGNzdC5ORUlHSEJPUl9DT1VOVCk6CiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA4CgpyZXZlYWxfdHVybl9mb3JfaGVhZGVyQDIzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjEzNi0xMzcKICAgIC8vICMgVGFyZ2V0IGlzIGEgbmVpZ2hib3IgaWYgYW55IGVudHJ5IG1hdGNoZXMgaXQgKHRoZSAyNTUgcGFkZGluZyBuZXZlciBtYXRjaGVzIGEgZ3JpZCBpbmRleCkKICAgIC8vIGZvciBrIGluIHVyYW5nZShjc3QuTkVJR0hCT1JfQ09VTlQpOgogICAgZnJhbWVfZGlnIDgKICAgIGludGNfMiAvLyA0CiAgICA8CiAgICBieiByZXZlYWxfdHVybl9hZnRlcl9mb3JAMjcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxMzgKICAgIC8vIGlmIG9wLmdldGJ5dGUobmVpZ2hib3JzLCBrKSA9PSB0YXJnZXQ6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDgKICAgIGdldGJ5dGUKICAgIGZyYW1lX2RpZyA5CiAgICA9PQogICAgYnogcmV2ZWFsX3R1cm5fYWZ0ZXJfaWZfZWxzZUAyNgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjEzOQogICAgLy8gcmV0dXJuIFRydWUKICAgIGludGNfMSAvLyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6OTMKICAgIC8vIGlmIG5vdCBpc19uZWlnaGJvcl9wYXRoX2NlbGwoZ3JpZCwgY3VycmVudCwgdGFyZ2V0KToKICAgIGIgcmV2ZWFsX3R1cm5fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuc2Fsdm8uc3Vicm91dGluZXMuaXNfbmVpZ2hib3JfcGF0aF9jZWxsQDI4CgpyZXZlYWxfdHVybl9hZnRlcl9pZl9lbHNlQDI2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjEzNi0xMzcKICAgIC8vICMgVGFyZ2V0IGlzIGEgbmVpZ2hib3IgaWYgYW55IGVudHJ5IG1hdGNoZXMgaXQgKHRoZSAyNTUgcGFkZGluZyBuZXZlciBtYXRjaGVzIGEgZ3JpZCBpbmRleCkKICAgIC8vIGZvciBrIGluIHVyYW5nZShjc3QuTkVJR0hCT1JfQ09VTlQpOgogICAgZnJhbWVfZGlnIDgKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDgKICAgIGIgcmV2ZWFsX3R1cm5fZm9yX2hlYWRlckAyMwoKcmV2ZWFsX3R1cm5fYWZ0ZXJfZm9yQDI3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjE0MAogICAgLy8gcmV0dXJuIEZhbHNlCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjkzCiAgICAvLyBpZiBub3QgaXNfbmVpZ2hib3JfcGF0aF9jZWxsKGdyaWQsIGN1cnJlbnQsIHRhcmdldCk6CiAgICBiIHJldmVhbF90dXJuX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnNhbHZvLnN1YnJvdXRpbmVzLmlzX25laWdoYm9yX3BhdGhfY2VsbEAyOAoKcmV2ZWFsX3R1cm5fYWZ0ZXJfZm9yQDMxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5Ojk5LTEwMAogICAgLy8gIyBJZiBhbGwgZW50cnkgY29vcmRzIGluIG1vdmVtZW50IGluIHJhbmdlIG9mIGNvdW50IGFyZSB2YWxpZCwgcmV0dXJuIFRydWUKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjczOS03NDUKICAgIC8vICMgVmFsaWRhdGUgdGhlIG1vdmVtZW50IGZyb20gdGhlIGNoYXJhY3RlciBwb3NpdGlvbgogICAgLy8gYXNzZXJ0IHNydC5pc19tb3ZlX3NlcXVlbmNlX3ZhbGlkKAogICAgLy8gICAgIGdhbWVfaWQsCiAgICAvLyAgICAgc2VsZi5ib3hfZ2FtZV9ncmlkLAogICAgLy8gICAgIHNydC5jb252ZXJ0X2dyaWRfaW5kZXhfdG9fY29vcmRzKGNoYXJhY3Rlci5wb3NpdGlvbiksCiAgICAvLyAgICAgbW92ZW1lbnQuY29weSgpLAogICAgLy8gKSwgZXJyLklOVkFMSURfTU9WRV9TRVFVRU5DRQogICAgYiByZXZlYWxfdHVybl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5zYWx2by5zdWJyb3V0aW5lcy5pc19tb3ZlX3NlcXVlbmNlX3ZhbGlkQDMyCgpyZXZlYWxfdHVybl9hZnRlcl9pZl9lbHNlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjQxCiAgICAvLyBpZiBjb21taXRfc2NoZW1lID09IGNzdC5DT01NSVRfU0NIRU1FX1NIQTUxMl8yNTY6CiAgICBmcmFtZV9kaWcgMTUKICAgIGludGNfMyAvLyAyCiAgICA9PQogICAgYnogcmV2ZWFsX3R1cm5fYWZ0ZXJfaWZfZWxzZUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjIxOAogICAgLy8gb3AuaXRvYihjc3QuRE9NQUlOX1BSRUZJWCkKICAgIGludGMgNyAvLyAzNTgxMTY3ODM3MjcKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyMTgtMjE5CiAgICAvLyBvcC5pdG9iKGNzdC5ET01BSU5fUFJFRklYKQogICAgLy8gKyBvcC5pdG9iKGdhbWVfaWQpCiAgICBmcmFtZV9kaWcgMTAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjIxOC0yMjAKICAgIC8vIG9wLml0b2IoY3N0LkRPTUFJTl9QUkVGSVgpCiAgICAvLyArIG9wLml0b2IoZ2FtZV9pZCkKICAgIC8vICsgbW92ZW1lbnQuYnl0ZXMKICAgIGZyYW1lX2RpZyAtNAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjE4LTIyMQogICAgLy8gb3AuaXRvYihjc3QuRE9NQUlOX1BSRUZJWCkKICAgIC8vICsgb3AuaXRvYihnYW1lX2lkKQogICAgLy8gKyBtb3ZlbWVudC5ieXRlcwogICAgLy8gKyBhY3Rpb24uYnl0ZXMKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjE4LTIyMgogICAgLy8gb3AuaXRvYihjc3QuRE9NQUlOX1BSRUZJWCkKICAgIC8vICsgb3AuaXRvYihnYW1lX2lkKQogICAgLy8gKyBtb3ZlbWVudC5ieXRlcwogICAgLy8gKyBhY3Rpb24uYnl0ZXMKICAgIC8vICsgZGlyZWN0aW9uLmJ5dGVzCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjIxOC0yMjMKICAgIC8vIG9wLml0b2IoY3N0LkRPTUFJTl9QUkVGSVgpCiAgICAvLyArIG9wLml0b2IoZ2FtZV9pZCkKICAgIC8vICsgbW92ZW1lbnQuYnl0ZXMKICAgIC8vICsgYWN0aW9uLmJ5dGVzCiAgICAvLyArIGRpcmVjdGlvbi5ieXRlcwogICAgLy8gKyBzYWx0LmJ5dGVzCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjI0Mi0yNDQKICAgIC8vIHJldHVybiBvcC5zaGE1MTJfMjU2KAogICAgLy8gICAgIGJ1aWxkX3R1cm5fcHJlaW1hZ2VfYnl0ZXMoZ2FtZV9pZCwgbW92ZW1lbnQsIGFjdGlvbiwgZGlyZWN0aW9uLCBzYWx0KQogICAgLy8gKQogICAgc2hhNTEyXzI1NgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjcyOC03MzUKICAgIC8vIHNydC5jb21wdXRlX3R1cm5faGFzaCgKICAgIC8vICAgICBjb21taXRfc2NoZW1lLAogICAgLy8gICAgIGdhbWVfaWQsCiAgICAvLyAgICAgbW92ZW1lbnQsCiAgICAvLyAgICAgYWN0aW9uLAogICAgLy8gICAgIGRpcmVjdGlvbiwKICAgIC8vICAgICBzYWx0LAogICAgLy8gKQogICAgYiByZXZlYWxfdHVybl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5zYWx2by5zdWJyb3V0aW5lcy5jb21wdXRlX3R1cm5faGFzaEAxNQoKcmV2ZWFsX3R1cm5fYWZ0ZXJfaWZfZWxzZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxODUtMTg2CiAgICAvLyAjIFJldHVybiBiaWctZW5kaWFuIGJ5dGUgYXJyYXkgKEFWTSB0eXBlOiBCeXRlcyksIFVJbnQ2NCBsZWZ0LXBhZGRlZCB3LyB6ZXJvcyB0byBtYXRjaCAzMi1ieXRlIHNjYWxhciBmb3JtYXQKICAgIC8vIHJldHVybiBvcC5iemVybygyNCkgKyB1LmJ5dGVzCiAgICBwdXNoaW50IDI0IC8vIDI0CiAgICBiemVybwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDUKICAgIGZyYW1lX2RpZyAxMAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDA1MzYxNmM3NjZmCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTk5LTIwMQogICAgLy8gcHJlaW1hZ2UgPSB1NjRfdG9fZnIzMihhcmM0LlVJbnQ2NChjc3QuRE9NQUlOX1BSRUZJWCkpICsgdTY0X3RvX2ZyMzIoCiAgICAvLyAgICAgYXJjNC5VSW50NjQoZ2FtZV9pZCkKICAgIC8vICkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSA0CiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA3CgpyZXZlYWxfdHVybl9mb3JfaGVhZGVyQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjIwMgogICAgLy8gZm9yIGNvb3JkcyBpbiBtb3ZlbWVudDoKICAgIGZyYW1lX2RpZyA3CiAgICBmcmFtZV9kaWcgMTQKICAgIDwKICAgIGJ6IHJldmVhbF90dXJuX2FmdGVyX2ZvckAxNAogICAgZnJhbWVfZGlnIC00CiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDcKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18zIC8vIDIKICAgICoKICAgIGludGNfMyAvLyAyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyMDMKICAgIC8vIHJvdywgY29sID0gY29vcmRzLm5hdGl2ZQogICAgZHVwCiAgICBleHRyYWN0IDAgMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHN3YXAKICAgIGV4dHJhY3QgMSAxIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjE3OC0xNzkKICAgIC8vICMgUmV0dXJuIGJpZy1lbmRpYW4gYnl0ZSBhcnJheSAoQVZNIHR5cGU6IEJ5dGVzKSwgVUludDggbGVmdC1wYWRkZWQgdy8gemVyb3MgdG8gbWF0Y2ggMzItYnl0ZSBzY2FsYXIgZm9ybWF0CiAgICAvLyByZXR1cm4gb3AuYnplcm8oMzEpICsgdS5ieXRlcwogICAgcHVzaGludCAzMSAvLyAzMQogICAgYnplcm8KICAgIGR1cAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjA0CiAgICAvLyBwcmVpbWFnZSArPSB1OF90b19mcjMyKHJvdykgKyB1OF90b19mcjMyKGNvbCkKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSA0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA3CiAgICBiIHJldmVhbF90dXJuX2Zvcl9oZWFkZXJAMTIKCnJldmVhbF90dXJuX2FmdGVyX2ZvckAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxNzgtMTc5CiAgICAvLyAjIFJldHVybiBiaWctZW5kaWFuIGJ5dGUgYXJyYXkgKEFWTSB0eXBlOiBCeXRlcyksIFVJbnQ4IGxlZnQtcGFkZGVkIHcvIHplcm9zIHRvIG1hdGNoIDMyLWJ5dGUgc2NhbGFyIGZvcm1hdAogICAgLy8gcmV0dXJuIG9wLmJ6ZXJvKDMxKSArIHUuYnl0ZXMKICAgIHB1c2hpbnQgMzEgLy8gMzEKICAgIGJ6ZXJvCiAgICBkdXAKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MjA1CiAgICAvLyByZXR1cm4gcHJlaW1hZ2UgKyB1OF90b19mcjMyKGFjdGlvbikgKyB1OF90b19mcjMyKGRpcmVjdGlvbikgKyB1NjRfdG9fZnIzMihzYWx0KQogICAgZnJhbWVfZGlnIDQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjE3OC0xNzkKICAgIC8vICMgUmV0dXJuIGJpZy1lbmRpYW4gYnl0ZSBhcnJheSAoQVZNIHR5cGU6IEJ5dGVzKSwgVUludDggbGVmdC1wYWRkZWQgdy8gemVyb3MgdG8gbWF0Y2ggMzItYnl0ZSBzY2FsYXIgZm9ybWF0CiAgICAvLyByZXR1cm4gb3AuYnplcm8oMzEpICsgdS5ieXRlcwogICAgc3dhcAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyMDUKICAgIC8vIHJldHVybiBwcmVpbWFnZSArIHU4X3RvX2ZyMzIoYWN0aW9uKSArIHU4X3RvX2ZyMzIoZGlyZWN0aW9uKSArIHU2NF90b19mcjMyKHNhbHQpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxODUtMTg2CiAgICAvLyAjIFJldHVybiBiaWctZW5kaWFuIGJ5dGUgYXJyYXkgKEFWTSB0eXBlOiBCeXRlcyksIFVJbnQ2NCBsZWZ0LXBhZGRlZCB3LyB6ZXJvcyB0byBtYXRjaCAzMi1ieXRlIHNjYWxhciBmb3JtYXQKICAgIC8vIHJldHVybiBvcC5iemVybygyNCkgKyB1LmJ5dGVzCiAgICBmcmFtZV9kaWcgNQogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyMDUKICAgIC8vIHJldHVybiBwcmVpbWFnZSArIHU4X3RvX2ZyMzIoYWN0aW9uKSArIHU4X3RvX2ZyMzIoZGlyZWN0aW9uKSArIHU2NF90b19mcjMyKHNhbHQpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToyNDYtMjQ5CiAgICAvLyByZXR1cm4gb3AubWltYygKICAgIC8vICAgICBvcC5NaU1DQ29uZmlndXJhdGlvbnMuQkxTMTJfMzgxTXAxMTEsCiAgICAvLyAgICAgYnVpbGRfdHVybl9wcmVpbWFnZV9mcjMyKGdhbWVfaWQsIG1vdmVtZW50LCBhY3Rpb24sIGRpcmVjdGlvbiwgc2FsdCksCiAgICAvLyApCiAgICBtaW1jIEJMUzEyXzM4MU1wMTExCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzI4LTczNQogICAgLy8gc3J0LmNvbXB1dGVfdHVybl9oYXNoKAogICAgLy8gICAgIGNvbW1pdF9zY2hlbWUsCiAgICAvLyAgICAgZ2FtZV9pZCwKICAgIC8vICAgICBtb3ZlbWVudCwKICAgIC8vICAgICBhY3Rpb24sCiAgICAvLyAgICAgZGlyZWN0aW9uLAogICAgLy8gICAgIHNhbHQsCiAgICAvLyApCiAgICBiIHJldmVhbF90dXJuX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnNhbHZvLnN1YnJvdXRpbmVzLmNvbXB1dGVfdHVybl9oYXNoQDE1CgoKLy8gc21hcnRfY29udHJhY3RzLnNhbHZvLmNvbnRyYWN0LlNhbHZvLnJlc29sdmVfcm91bmQoZ2FtZV9pZDogdWludDY0LCBwcm9vZnM6IGJ5dGVzKSAtPiBieXRlczoKcmVzb2x2ZV9yb3VuZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3NTctNzY0CiAgICAvLyAjIFJlc29sdmUgYSByb3VuZDogYXBwbHkgZXZlcnkgcmV2ZWFsZWQgdHVybiBvZiBhIGdhbWUgaW4gbG9iYnkgc2xvdCBvcmRlciwgaW4gYSBzaW5nbGUgZ3JpZCBwYXNzCiAgICAvLyAjIE1vdmVzIGFyZSBhcHBsaWVkIGZpcnN0LCB0aGVuIHNob3RzOyBhIG1vdmUgb250byBhIGNlbGwgdGhhdCBpcyBubyBsb25nZXIgZnJlZSBpcyBibG9ja2VkCiAgICAvLyAjIGBwcm9vZnNgIGhvbGRzIG9uZSBncmlkIE1lcmtsZSBwcm9vZiBwZXIgY2hhbmdlZCBncmlkIGNlbGwsIGluIGNoYW5nZSBvcmRlciAoc2VlIHV0aWxzLmdyaWRfbWVya2xlKQogICAgLy8gIyBSZXR1cm4gdGhlIG51bWJlciBvZiBoaXRzIGVhY2ggbG9iYnkgc2xvdCB0b29rIHRoaXMgcm91bmQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHJlc29sdmVfcm91bmQoCiAgICAvLyAgICAgc2VsZiwgZ2FtZV9pZDogVUludDY0LCBwcm9vZnM6IHRhLkdyaWRNZXJrbGVQcm9vZnMKICAgIC8vICkgLT4gdGEuUm91bmRIaXRzOgogICAgcHJvdG8gMiAxCiAgICBpbnRjXzAgLy8gMAogICAgZHVwbiA1CiAgICBieXRlY18zIC8vICIiCiAgICBkdXBuIDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzY1LTc2NgogICAgLy8gIyBGYWlsIHRyYW5zYWN0aW9uIHVubGVzcyB0aGUgYXNzZXJ0aW9ucyBiZWxvdyBldmFsdWF0ZSBUcnVlCiAgICAvLyBhc3NlcnQgZ2FtZV9pZCBpbiBzZWxmLmJveF9nYW1lX3N0YXRlLCBlcnIuR0FNRV9JRF9OT1RfRk9VTkQKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgYnl0ZWMgNCAvLyAic18iCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gR2FtZSBJRCBub3QgZm91bmQuIEVuc3VyZSB0aGUgZ2FtZSB3YXMgY3JlYXRlZCBhbmQgc3RpbGwgZXhpc3RzLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc2NwogICAgLy8gZ2FtZV9zdGF0ZSA9IHNlbGYuYm94X2dhbWVfc3RhdGVbZ2FtZV9pZF0uY29weSgpCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvdmVyIDMKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveF9nYW1lX3N0YXRlIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc2OAogICAgLy8gYXNzZXJ0IGdhbWVfc3RhdGUuc3Rha2luZ19jbG9zZWQubmF0aXZlLCBlcnIuU1RBS0lOR19OT1RfQ0xPU0VECiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIGJ5dGVjXzAgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICBhc3NlcnQgLy8gU3Rha2luZyBub3QgY2xvc2VkLiBUaGUgZ2FtZSBhZG1pbiBtdXN0IGNsb3NlIHN0YWtpbmcgYmVmb3JlIHJvdW5kcyBhcmUgcGxheWVkLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc3MwogICAgLy8gKyBjc3QuR1JJRF9ST09UX1VQREFURV9CVURHRVQgKiBwcm9vZnMubGVuZ3RoLAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgY292ZXIgMwogICAgcHVzaGludCAxNjAwMCAvLyAxNjAwMAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc3MgogICAgLy8gcmVxdWlyZWRfYnVkZ2V0PWNzdC5SRVNPTFZFX1JPVU5EX0JBU0VfQlVER0VUCiAgICBwdXNoaW50IDMwMDAgLy8gMzAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc3Mi03NzMKICAgIC8vIHJlcXVpcmVkX2J1ZGdldD1jc3QuUkVTT0xWRV9ST1VORF9CQVNFX0JVREdFVAogICAgLy8gKyBjc3QuR1JJRF9ST09UX1VQREFURV9CVURHRVQgKiBwcm9vZnMubGVuZ3RoLAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc3NAogICAgLy8gZmVlX3NvdXJjZT1PcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0LAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3NzAtNzc1CiAgICAvLyAjIEVuc3VyZSB0cmFuc2FjdGlvbiBoYXMgc3VmZmljaWVudCBvcGNvZGUgYnVkZ2V0LCB3aGljaCBzY2FsZXMgdy8gdGhlIGNoYW5nZWQgZ3JpZCBjZWxscyBvbmx5CiAgICAvLyBlbnN1cmVfYnVkZ2V0KAogICAgLy8gICAgIHJlcXVpcmVkX2J1ZGdldD1jc3QuUkVTT0xWRV9ST1VORF9CQVNFX0JVREdFVAogICAgLy8gICAgICsgY3N0LkdSSURfUk9PVF9VUERBVEVfQlVER0VUICogcHJvb2ZzLmxlbmd0aCwKICAgIC8vICAgICBmZWVfc291cmNlPU9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQsCiAgICAvLyApCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3NzctNzc4CiAgICAvLyAjIFJlYWQgdGhlIGxvYmJ5LCBjaGFyYWN0ZXJzIGFuZCBncmlkIG9uY2UgZm9yIHRoZSB3aG9sZSByb3VuZAogICAgLy8gZ2FtZV9sb2JieV9iX2FyciA9IHNlbGYuYm94X2dhbWVfbG9iYnlbZ2FtZV9pZF0KICAgIGJ5dGVjIDggLy8gImxfIgogICAgZGlnIDIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAzCiAgICBjb3ZlciA0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3hfZ2FtZV9sb2JieSBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3NzkKICAgIC8vIGNoYXJhY3RlcnMgPSBzZWxmLmJveF9nYW1lX2NoYXJhY3RlcnNbZ2FtZV9pZF0uY29weSgpCiAgICBieXRlYyA1IC8vICJjXyIKICAgIGRpZyAzCiAgICBjb25jYXQKICAgIGR1cAogICAgY292ZXIgNAogICAgYm94X2dldAogICAgc3dhcAogICAgY292ZXIgNAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X2dhbWVfY2hhcmFjdGVycyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3ODAKICAgIC8vIGdyaWQgPSBzZWxmLmJveF9nYW1lX2dyaWRbZ2FtZV9pZF0uYnl0ZXMKICAgIGJ5dGVjIDYgLy8gImdfIgogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIGR1cAogICAgY292ZXIgMwogICAgYm94X2dldAogICAgc3dhcAogICAgY292ZXIgMwogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X2dhbWVfZ3JpZCBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3ODEKICAgIC8vIHJvb3QgPSBnYW1lX3N0YXRlLmdyaWRfcm9vdC5ieXRlcwogICAgZHVwCiAgICBleHRyYWN0IDUzIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc4My03ODUKICAgIC8vICMgQ29sbGVjdCBwcmVzZW50IHBsYXllcnMgYW5kIHJldmVhbGVkIHR1cm5zIGFzIGxvYmJ5IHNsb3QgYml0bWFza3MKICAgIC8vICMgQSBwbGF5ZXIgd2hvIGRpZCBub3QgcmV2ZWFsIGJsb2NrcyB0aGUgcm91bmQgb25seSB1bnRpbCB0aGUgcGhhc2UgZXhwaXJlcwogICAgLy8gZXhwaXJlZCA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID49IGdhbWVfc3RhdGUuZXhwaXJ5X3RzLm5hdGl2ZQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgc3dhcAogICAgcHVzaGludCA1IC8vIDUKICAgIGV4dHJhY3RfdWludDY0CiAgICA+PQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc4NgogICAgLy8gcGxheWVyX2NvdW50ID0gZ2FtZV9sb2JieV9iX2Fyci5sZW5ndGggLy8gY3N0LkFERFJFU1NfU0laRQogICAgbGVuCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Nzg3CiAgICAvLyBwcmVzZW50ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc4OC03ODkKICAgIC8vIHJldmVhbGVkID0gVUludDY0KDApCiAgICAvLyBmb3Igc2xvdCBpbiB1cmFuZ2UocGxheWVyX2NvdW50KToKICAgIGR1cG4gMgoKcmVzb2x2ZV9yb3VuZF9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Nzg5CiAgICAvLyBmb3Igc2xvdCBpbiB1cmFuZ2UocGxheWVyX2NvdW50KToKICAgIGZyYW1lX2RpZyAzMAogICAgZnJhbWVfZGlnIDI3CiAgICA8CiAgICBieiByZXNvbHZlX3JvdW5kX2FmdGVyX2ZvckA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzkxCiAgICAvLyBnYW1lX2xvYmJ5X2JfYXJyLCBzbG90ICogY3N0LkFERFJFU1NfU0laRSwgY3N0LkFERFJFU1NfU0laRQogICAgZnJhbWVfZGlnIDMwCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzkwLTc5MgogICAgLy8gdXNlcl9hZGRyX2J5dGVzID0gb3AuZXh0cmFjdCgKICAgIC8vICAgICBnYW1lX2xvYmJ5X2JfYXJyLCBzbG90ICogY3N0LkFERFJFU1NfU0laRSwgY3N0LkFERFJFU1NfU0laRQogICAgLy8gKQogICAgZnJhbWVfZGlnIDIwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzkxCiAgICAvLyBnYW1lX2xvYmJ5X2JfYXJyLCBzbG90ICogY3N0LkFERFJFU1NfU0laRSwgY3N0LkFERFJFU1NfU0laRQogICAgcHVzaGludCAzMiAvLyAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojc5MC03OTIKICAgIC8vIHVzZXJfYWRkcl9ieXRlcyA9IG9wLmV4dHJhY3QoCiAgICAvLyAgICAgZ2FtZV9sb2JieV9iX2Fyciwgc2xvdCAqIGNzdC5BRERSRVNTX1NJWkUsIGNzdC5BRERSRVNTX1NJWkUKICAgIC8vICkKICAgIGV4dHJhY3QzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6NzkzCiAgICAvLyBpZiB1c2VyX2FkZHJfYnl0ZXMgIT0gQnl0ZXMoY3N0LlpFUk9FRF9BRERSX0JZVEVTKToKICAgIGJ5dGVjIDkgLy8gMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICAhPQogICAgZnJhbWVfZGlnIDI5CiAgICBmcmFtZV9idXJ5IDE0CiAgICBmcmFtZV9kaWcgMjgKICAgIGZyYW1lX2J1cnkgMTMKICAgIGJ6IHJlc29sdmVfcm91bmRfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Nzk0CiAgICAvLyBwcmVzZW50IHw9IFVJbnQ2NCgxKSA8PCBzbG90CiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfZGlnIDMwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHNobAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDE2CiAgICBmcmFtZV9kaWcgMjgKICAgIHwKICAgIGZyYW1lX2J1cnkgMjgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3OTUKICAgIC8vIGlmIGNoYXJhY3RlcnNbc2xvdF0uaGFzX3JldmVhbGVkX3R1cm4ubmF0aXZlOgogICAgcHVzaGludCA0MCAvLyA0MAogICAgKgogICAgZnJhbWVfZGlnIDIyCiAgICBzd2FwCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGludGNfMSAvLyAxCiAgICBnZXRiaXQKICAgIGJ5dGVjXzAgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICBieiByZXNvbHZlX3JvdW5kX2Vsc2VfYm9keUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6Nzk2CiAgICAvLyByZXZlYWxlZCB8PSBVSW50NjQoMSkgPDwgc2xvdAogICAgZnJhbWVfZGlnIDI5CiAgICBmcmFtZV9kaWcgMTYKICAgIHwKICAgIGZyYW1lX2J1cnkgMjkKCnJlc29sdmVfcm91bmRfYWZ0ZXJfaWZfZWxzZUA2OgogICAgZnJhbWVfZGlnIDI5CiAgICBmcmFtZV9idXJ5IDE0CiAgICBmcmFtZV9kaWcgMjgKICAgIGZyYW1lX2J1cnkgMTMKCnJlc29sdmVfcm91bmRfYWZ0ZXJfaWZfZWxzZUA3OgogICAgZnJhbWVfZGlnIDE0CiAgICBmcmFtZV9idXJ5IDI5CiAgICBmcmFtZV9kaWcgMTMKICAgIGZyYW1lX2J1cnkgMjgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3ODkKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZShwbGF5ZXJfY291bnQpOgogICAgZnJhbWVfZGlnIDMwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAzMAogICAgYiByZXNvbHZlX3JvdW5kX2Zvcl9oZWFkZXJAMQoKcmVzb2x2ZV9yb3VuZF9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo3OTgKICAgIC8vIGFzc2VydCBleHBpcmVkLCBlcnIuUk9VTkRfTk9UX1JFVkVBTEVECiAgICBmcmFtZV9kaWcgMjYKICAgIGFzc2VydCAvLyBSb3VuZCBub3QgcmV2ZWFsZWQuIEV2ZXJ5IHBsYXllciBtdXN0IHJldmVhbCB0aGVpciB0dXJuIGJlZm9yZSB0aGUgcGhhc2UgZXhwaXJlcy4KICAgIGIgcmVzb2x2ZV9yb3VuZF9hZnRlcl9pZl9lbHNlQDYKCnJlc29sdmVfcm91bmRfYWZ0ZXJfZm9yQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODAwLTgwMQogICAgLy8gIyBNb3ZlIHBoYXNlOiBlYWNoIG1vdmUgY2hhbmdlcyBhdCBtb3N0IHR3byBncmlkIGNlbGxzLCBlYWNoIGNoYW5nZSBjb25zdW1lcyB0aGUgbmV4dCBwcm9vZgogICAgLy8gbl9jaGFuZ2VzID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgwMgogICAgLy8gZm9yIHNsb3QgaW4gdXJhbmdlKHBsYXllcl9jb3VudCk6CiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAzMAoKcmVzb2x2ZV9yb3VuZF9mb3JfaGVhZGVyQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgwMgogICAgLy8gZm9yIHNsb3QgaW4gdXJhbmdlKHBsYXllcl9jb3VudCk6CiAgICBmcmFtZV9kaWcgMzAKICAgIGZyYW1lX2RpZyAyNwogICAgPAogICAgYnogcmVzb2x2ZV9yb3VuZF9hZnRlcl9mb3JAMjAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MDMKICAgIC8vIHBvc2l0aW9uID0gY2hhcmFjdGVyc1tzbG90XS5wb3NpdGlvbi5uYXRpdmUKICAgIGZyYW1lX2RpZyAzMAogICAgZHVwCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICAqCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgOQogICAgZnJhbWVfZGlnIDIyCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIHN3YXAKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBpbnRjXzIgLy8gNAogICAgZ2V0Ynl0ZQogICAgZnJhbWVfYnVyeSAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgwNAogICAgLy8gdGFyZ2V0ID0gY2hhcmFjdGVyc1tzbG90XS50YXJnZXQubmF0aXZlCiAgICBwdXNoaW50IDUgLy8gNQogICAgZ2V0Ynl0ZQogICAgZnJhbWVfYnVyeSAxNQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgwNgogICAgLy8gKHJldmVhbGVkID4+IHNsb3QpICYgMSA9PSAxCiAgICBmcmFtZV9kaWcgMjkKICAgIHN3YXAKICAgIHNocgogICAgaW50Y18xIC8vIDEKICAgICYKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgZnJhbWVfZGlnIDEwCiAgICBmcmFtZV9idXJ5IDExCiAgICBmcmFtZV9kaWcgMjUKICAgIGZyYW1lX2J1cnkgNAogICAgZnJhbWVfZGlnIDI0CiAgICBmcmFtZV9idXJ5IDEKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgwNi04MTAKICAgIC8vIChyZXZlYWxlZCA+PiBzbG90KSAmIDEgPT0gMQogICAgLy8gYW5kIHRhcmdldCAhPSBwb3NpdGlvbgogICAgLy8gYW5kIHNydC5nZXRfZ3JpZF9jZWxsKGdyaWQsIHRhcmdldCkgPT0gY3N0LkdSSURfQ0VMTF9QQVRICiAgICAvLyBhbmQgc3J0LmZpbmRfY2hhcmFjdGVyX2F0KGNoYXJhY3RlcnMsIHByZXNlbnQsIHRhcmdldCwgc2xvdCkKICAgIC8vID09IGNzdC5NQVhfTE9CQllfU0laRQogICAgYnogcmVzb2x2ZV9yb3VuZF9hZnRlcl9pZl9lbHNlQDE4CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODA3CiAgICAvLyBhbmQgdGFyZ2V0ICE9IHBvc2l0aW9uCiAgICBmcmFtZV9kaWcgMTUKICAgIGZyYW1lX2RpZyAxMgogICAgIT0KICAgIGZyYW1lX2RpZyAxMAogICAgZnJhbWVfYnVyeSAxMQogICAgZnJhbWVfZGlnIDI1CiAgICBmcmFtZV9idXJ5IDQKICAgIGZyYW1lX2RpZyAyNAogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9kaWcgMjIKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgwNi04MTAKICAgIC8vIChyZXZlYWxlZCA+PiBzbG90KSAmIDEgPT0gMQogICAgLy8gYW5kIHRhcmdldCAhPSBwb3NpdGlvbgogICAgLy8gYW5kIHNydC5nZXRfZ3JpZF9jZWxsKGdyaWQsIHRhcmdldCkgPT0gY3N0LkdSSURfQ0VMTF9QQVRICiAgICAvLyBhbmQgc3J0LmZpbmRfY2hhcmFjdGVyX2F0KGNoYXJhY3RlcnMsIHByZXNlbnQsIHRhcmdldCwgc2xvdCkKICAgIC8vID09IGNzdC5NQVhfTE9CQllfU0laRQogICAgYnogcmVzb2x2ZV9yb3VuZF9hZnRlcl9pZl9lbHNlQDE4CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6Mzc4CiAgICAvLyByZXR1cm4gdW5wYWNrX2dyaWRfY2VsbChvcC5nZXRieXRlKGdyaWQsIGkgLy8gY3N0LkdSSURfQ0VMTFNfUEVSX0JZVEUpLCBpKQogICAgZnJhbWVfZGlnIDE1CiAgICBkdXAKICAgIGludGNfMiAvLyA0CiAgICAvCiAgICBmcmFtZV9kaWcgMjQKICAgIGR1cAogICAgY292ZXIgMwogICAgc3dhcAogICAgZ2V0Ynl0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjExNAogICAgLy8gY3N0LkdSSURfQ0VMTFNfUEVSX0JZVEUgLSAxIC0gaSAlIGNzdC5HUklEX0NFTExTX1BFUl9CWVRFCiAgICBzd2FwCiAgICBpbnRjXzIgLy8gNAogICAgJQogICAgcHVzaGludCAzIC8vIDMKICAgIHN3YXAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxMTUKICAgIC8vICkgKiBjc3QuR1JJRF9DRUxMX0JJVFMKICAgIGludGNfMyAvLyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTEzLTExNQogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBjc3QuR1JJRF9DRUxMU19QRVJfQllURSAtIDEgLSBpICUgY3N0LkdSSURfQ0VMTFNfUEVSX0JZVEUKICAgIC8vICkgKiBjc3QuR1JJRF9DRUxMX0JJVFMKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxMjEKICAgIC8vIHJldHVybiAocGFja2VkID4+IGdyaWRfY2VsbF9zaGlmdChpKSkgJiBjc3QuR1JJRF9DRUxMX01BU0sKICAgIHNocgogICAgcHVzaGludCAzIC8vIDMKICAgICYKICAgIGZyYW1lX2RpZyAxMAogICAgZnJhbWVfYnVyeSAxMQogICAgZnJhbWVfZGlnIDI1CiAgICBmcmFtZV9idXJ5IDQKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfZGlnIDIyCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MDYtODEwCiAgICAvLyAocmV2ZWFsZWQgPj4gc2xvdCkgJiAxID09IDEKICAgIC8vIGFuZCB0YXJnZXQgIT0gcG9zaXRpb24KICAgIC8vIGFuZCBzcnQuZ2V0X2dyaWRfY2VsbChncmlkLCB0YXJnZXQpID09IGNzdC5HUklEX0NFTExfUEFUSAogICAgLy8gYW5kIHNydC5maW5kX2NoYXJhY3Rlcl9hdChjaGFyYWN0ZXJzLCBwcmVzZW50LCB0YXJnZXQsIHNsb3QpCiAgICAvLyA9PSBjc3QuTUFYX0xPQkJZX1NJWkUKICAgIGJueiByZXNvbHZlX3JvdW5kX2FmdGVyX2lmX2Vsc2VAMTgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MDkKICAgIC8vIGFuZCBzcnQuZmluZF9jaGFyYWN0ZXJfYXQoY2hhcmFjdGVycywgcHJlc2VudCwgdGFyZ2V0LCBzbG90KQogICAgZnJhbWVfZGlnIDIyCiAgICBmcmFtZV9kaWcgMjgKICAgIGZyYW1lX2RpZyAxNQogICAgZnJhbWVfZGlnIDMwCiAgICBjYWxsc3ViIGZpbmRfY2hhcmFjdGVyX2F0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMjIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MTAKICAgIC8vID09IGNzdC5NQVhfTE9CQllfU0laRQogICAgaW50Y18yIC8vIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MDktODEwCiAgICAvLyBhbmQgc3J0LmZpbmRfY2hhcmFjdGVyX2F0KGNoYXJhY3RlcnMsIHByZXNlbnQsIHRhcmdldCwgc2xvdCkKICAgIC8vID09IGNzdC5NQVhfTE9CQllfU0laRQogICAgPT0KICAgIGZyYW1lX2RpZyAxMAogICAgZnJhbWVfYnVyeSAxMQogICAgZnJhbWVfZGlnIDI1CiAgICBmcmFtZV9idXJ5IDQKICAgIGZyYW1lX2RpZyAyNAogICAgZnJhbWVfYnVyeSAxCiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MDYtODEwCiAgICAvLyAocmV2ZWFsZWQgPj4gc2xvdCkgJiAxID09IDEKICAgIC8vIGFuZCB0YXJnZXQgIT0gcG9zaXRpb24KICAgIC8vIGFuZCBzcnQuZ2V0X2dyaWRfY2VsbChncmlkLCB0YXJnZXQpID09IGNzdC5HUklEX0NFTExfUEFUSAogICAgLy8gYW5kIHNydC5maW5kX2NoYXJhY3Rlcl9hdChjaGFyYWN0ZXJzLCBwcmVzZW50LCB0YXJnZXQsIHNsb3QpCiAgICAvLyA9PSBjc3QuTUFYX0xPQkJZX1NJWkUKICAgIGJ6IHJlc29sdmVfcm91bmRfYWZ0ZXJfaWZfZWxzZUAxOAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjM3OAogICAgLy8gcmV0dXJuIHVucGFja19ncmlkX2NlbGwob3AuZ2V0Ynl0ZShncmlkLCBpIC8vIGNzdC5HUklEX0NFTExTX1BFUl9CWVRFKSwgaSkKICAgIGZyYW1lX2RpZyAxMgogICAgZHVwCiAgICBpbnRjXzIgLy8gNAogICAgLwogICAgZnJhbWVfZGlnIDI0CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIHN3YXAKICAgIGdldGJ5dGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxMTQKICAgIC8vIGNzdC5HUklEX0NFTExTX1BFUl9CWVRFIC0gMSAtIGkgJSBjc3QuR1JJRF9DRUxMU19QRVJfQllURQogICAgc3dhcAogICAgaW50Y18yIC8vIDQKICAgICUKICAgIHB1c2hpbnQgMyAvLyAzCiAgICBzd2FwCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTE1CiAgICAvLyApICogY3N0LkdSSURfQ0VMTF9CSVRTCiAgICBpbnRjXzMgLy8gMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjExMy0xMTUKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgY3N0LkdSSURfQ0VMTFNfUEVSX0JZVEUgLSAxIC0gaSAlIGNzdC5HUklEX0NFTExTX1BFUl9CWVRFCiAgICAvLyApICogY3N0LkdSSURfQ0VMTF9CSVRTCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTIxCiAgICAvLyByZXR1cm4gKHBhY2tlZCA+PiBncmlkX2NlbGxfc2hpZnQoaSkpICYgY3N0LkdSSURfQ0VMTF9NQVNLCiAgICBzaHIKICAgIHB1c2hpbnQgMyAvLyAzCiAgICAmCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODEyLTgxMwogICAgLy8gIyBGcmVlIHRoZSBjZWxsIHRoZSBjaGFyYWN0ZXIgbGVhdmVzLCBpZiBpdCB3YXMgbWFya2VkIG9uIHRoZSBncmlkCiAgICAvLyBpZiBzcnQuZ2V0X2dyaWRfY2VsbChncmlkLCBwb3NpdGlvbikgPT0gY3N0LkdSSURfQ0VMTF9PQ0NVUElFRDoKICAgIGludGNfMyAvLyAyCiAgICA9PQogICAgc3dhcAogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9kaWcgMTAKICAgIGZyYW1lX2J1cnkgMTEKICAgIGZyYW1lX2RpZyAyNQogICAgZnJhbWVfYnVyeSA0CiAgICBieiByZXNvbHZlX3JvdW5kX2FmdGVyX2lmX2Vsc2VAMTcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MTkKICAgIC8vIHByb29mc1tuX2NoYW5nZXNdLmNvcHkoKSwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAxMAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjIDUgLy8gMjI0CiAgICAqCiAgICBpbnRjIDUgLy8gMjI0CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MTQtODIwCiAgICAvLyByb290ID0gc3J0LmFwcGx5X2dyaWRfcm9vdF9jaGFuZ2UoCiAgICAvLyAgICAgcm9vdCwKICAgIC8vICAgICBwb3NpdGlvbiwKICAgIC8vICAgICBVSW50NjQoY3N0LkdSSURfQ0VMTF9PQ0NVUElFRCksCiAgICAvLyAgICAgVUludDY0KGNzdC5HUklEX0NFTExfUEFUSCksCiAgICAvLyAgICAgcHJvb2ZzW25fY2hhbmdlc10uY29weSgpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIDI1CiAgICBmcmFtZV9kaWcgMTIKICAgIGR1cAogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgxNwogICAgLy8gVUludDY0KGNzdC5HUklEX0NFTExfT0NDVVBJRUQpLAogICAgaW50Y18zIC8vIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MTgKICAgIC8vIFVJbnQ2NChjc3QuR1JJRF9DRUxMX1BBVEgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MTQtODIwCiAgICAvLyByb290ID0gc3J0LmFwcGx5X2dyaWRfcm9vdF9jaGFuZ2UoCiAgICAvLyAgICAgcm9vdCwKICAgIC8vICAgICBwb3NpdGlvbiwKICAgIC8vICAgICBVSW50NjQoY3N0LkdSSURfQ0VMTF9PQ0NVUElFRCksCiAgICAvLyAgICAgVUludDY0KGNzdC5HUklEX0NFTExfUEFUSCksCiAgICAvLyAgICAgcHJvb2ZzW25fY2hhbmdlc10uY29weSgpLAogICAgLy8gKQogICAgdW5jb3ZlciA0CiAgICBjYWxsc3ViIGFwcGx5X2dyaWRfcm9vdF9jaGFuZ2UKICAgIHBvcAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgyMQogICAgLy8gZ3JpZCA9IHNydC5zZXRfZ3JpZF9jZWxsKGdyaWQsIHBvc2l0aW9uLCBVSW50NjQoY3N0LkdSSURfQ0VMTF9QQVRIKSkKICAgIGZyYW1lX2RpZyAyNAogICAgc3dhcAogICAgaW50Y18wIC8vIDAKICAgIGNhbGxzdWIgc2V0X2dyaWRfY2VsbAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgyMgogICAgLy8gbl9jaGFuZ2VzICs9IDEKICAgIHVuY292ZXIgMgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMTEKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSA0CgpyZXNvbHZlX3JvdW5kX2FmdGVyX2lmX2Vsc2VAMTc6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDQKICAgIGZyYW1lX2RpZyAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgzMAogICAgLy8gcHJvb2ZzW25fY2hhbmdlc10uY29weSgpLAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGludGMgNSAvLyAyMjQKICAgICoKICAgIGludGMgNSAvLyAyMjQKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgyNC04MzEKICAgIC8vICMgTWFyayB0aGUgdGFyZ2V0IGNlbGwgYXMgb2NjdXBpZWQKICAgIC8vIHJvb3QgPSBzcnQuYXBwbHlfZ3JpZF9yb290X2NoYW5nZSgKICAgIC8vICAgICByb290LAogICAgLy8gICAgIHRhcmdldCwKICAgIC8vICAgICBVSW50NjQoY3N0LkdSSURfQ0VMTF9QQVRIKSwKICAgIC8vICAgICBVSW50NjQoY3N0LkdSSURfQ0VMTF9PQ0NVUElFRCksCiAgICAvLyAgICAgcHJvb2ZzW25fY2hhbmdlc10uY29weSgpLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBmcmFtZV9kaWcgMTUKICAgIGR1cAogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgyOAogICAgLy8gVUludDY0KGNzdC5HUklEX0NFTExfUEFUSCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjgyOQogICAgLy8gVUludDY0KGNzdC5HUklEX0NFTExfT0NDVVBJRUQpLAogICAgaW50Y18zIC8vIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MjQtODMxCiAgICAvLyAjIE1hcmsgdGhlIHRhcmdldCBjZWxsIGFzIG9jY3VwaWVkCiAgICAvLyByb290ID0gc3J0LmFwcGx5X2dyaWRfcm9vdF9jaGFuZ2UoCiAgICAvLyAgICAgcm9vdCwKICAgIC8vICAgICB0YXJnZXQsCiAgICAvLyAgICAgVUludDY0KGNzdC5HUklEX0NFTExfUEFUSCksCiAgICAvLyAgICAgVUludDY0KGNzdC5HUklEX0NFTExfT0NDVVBJRUQpLAogICAgLy8gICAgIHByb29mc1tuX2NoYW5nZXNdLmNvcHkoKSwKICAgIC8vICkKICAgIHVuY292ZXIgNAogICAgY2FsbHN1YiBhcHBseV9ncmlkX3Jvb3RfY2hhbmdlCiAgICBwb3AKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MzIKICAgIC8vIGdyaWQgPSBzcnQuc2V0X2dyaWRfY2VsbChncmlkLCB0YXJnZXQsIFVJbnQ2NChjc3QuR1JJRF9DRUxMX09DQ1VQSUVEKSkKICAgIHVuY292ZXIgMgogICAgZGlnIDEKICAgIGludGNfMyAvLyAyCiAgICBjYWxsc3ViIHNldF9ncmlkX2NlbGwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MzMKICAgIC8vIG5fY2hhbmdlcyArPSAxCiAgICB1bmNvdmVyIDIKICAgIGludGNfMSAvLyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODM0CiAgICAvLyBjaGFyYWN0ZXJzW3Nsb3RdLnBvc2l0aW9uID0gYXJjNC5VSW50OCh0YXJnZXQpCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA3IDEKICAgIGZyYW1lX2RpZyAyMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9kaWcgOQogICAgZHVwCiAgICBjb3ZlciA0CiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHN3YXAKICAgIHJlcGxhY2UyIDQKICAgIGZyYW1lX2RpZyAzMAogICAgaW50Y18yIC8vIDQKICAgIDwKICAgIGFzc2VydCAvLyBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgc3dhcAogICAgY292ZXIgMgogICAgcmVwbGFjZTMKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMTEKICAgIHVuY292ZXIgMgogICAgZnJhbWVfYnVyeSA0CiAgICBmcmFtZV9idXJ5IDAKICAgIGZyYW1lX2J1cnkgMQoKcmVzb2x2ZV9yb3VuZF9hZnRlcl9pZl9lbHNlQDE4OgogICAgZnJhbWVfZGlnIDExCiAgICBmcmFtZV9idXJ5IDEwCiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfYnVyeSAyNQogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2J1cnkgMjQKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9idXJ5IDIyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODAyCiAgICAvLyBmb3Igc2xvdCBpbiB1cmFuZ2UocGxheWVyX2NvdW50KToKICAgIGZyYW1lX2RpZyAzMAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMzAKICAgIGIgcmVzb2x2ZV9yb3VuZF9mb3JfaGVhZGVyQDEwCgpyZXNvbHZlX3JvdW5kX2FmdGVyX2ZvckAyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4MzYtODM3CiAgICAvLyAjIEV2ZXJ5IHByb29mIG11c3QgYmUgY29uc3VtZWQsIHNvIHRoZSBncmlkIHJvb3Qgc3RheXMgaW4gc3luYyB3LyB0aGUgZ3JpZAogICAgLy8gYXNzZXJ0IG5fY2hhbmdlcyA9PSBwcm9vZnMubGVuZ3RoLCBlcnIuSU5WQUxJRF9HUklEX1BST09GX0NPVU5UCiAgICBmcmFtZV9kaWcgMTAKICAgIGZyYW1lX2RpZyAxOQogICAgPT0KICAgIGFzc2VydCAvLyBJbnZhbGlkIGdyaWQgcHJvb2YgY291bnQuIFByb3ZpZGUgb25lIGdyaWQgcHJvb2YgcGVyIGNoYW5nZWQgZ3JpZCBjZWxsLCBpbiBjaGFuZ2Ugb3JkZXIuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODM5LTg0MQogICAgLy8gIyBBY3Rpb24gcGhhc2U6IGEgc2hvdCB0cmF2ZWxzIGZyb20gdGhlIHNob290ZXIgcG9zaXRpb24gaW4gaXRzIGZhY2luZyBkaXJlY3Rpb24KICAgIC8vICMgdW50aWwgaXQgaGl0cyBhIGNoYXJhY3RlciwgYW4gb2JzdGFjbGUgb3IgdGhlIGdyaWQgZWRnZQogICAgLy8gaGl0cyA9IHRhLlJvdW5kSGl0cy5mcm9tX2J5dGVzKG9wLmJ6ZXJvKGNzdC5NQVhfTE9CQllfU0laRSkpCiAgICBpbnRjXzIgLy8gNAogICAgYnplcm8KICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg0MgogICAgLy8gZm9yIHNsb3QgaW4gdXJhbmdlKHBsYXllcl9jb3VudCk6CiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAzMAoKcmVzb2x2ZV9yb3VuZF9mb3JfaGVhZGVyQDIxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg0MgogICAgLy8gZm9yIHNsb3QgaW4gdXJhbmdlKHBsYXllcl9jb3VudCk6CiAgICBmcmFtZV9kaWcgMzAKICAgIGZyYW1lX2RpZyAyNwogICAgPAogICAgYnogcmVzb2x2ZV9yb3VuZF9hZnRlcl9mb3JAMzUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4NDMKICAgIC8vIGlmIChyZXZlYWxlZCA+PiBzbG90KSAmIDEgPT0gMSBhbmQgY2hhcmFjdGVyc1sKICAgIGZyYW1lX2RpZyAyOQogICAgZnJhbWVfZGlnIDMwCiAgICBzaHIKICAgIGludGNfMSAvLyAxCiAgICAmCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9idXJ5IDMKICAgIGZyYW1lX2RpZyAyMgogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODQzLTg0NQogICAgLy8gaWYgKHJldmVhbGVkID4+IHNsb3QpICYgMSA9PSAxIGFuZCBjaGFyYWN0ZXJzWwogICAgLy8gICAgIHNsb3QKICAgIC8vIF0uYWN0aW9uLm5hdGl2ZSA9PSBjc3QuQUNUSU9OX1NIT09UOgogICAgYnogcmVzb2x2ZV9yb3VuZF9hZnRlcl9pZl9lbHNlQDMzCiAgICBmcmFtZV9kaWcgMzAKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICoKICAgIGZyYW1lX2RpZyAyMgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDUKICAgIHB1c2hpbnQgMyAvLyAzCiAgICBnZXRieXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODQ1CiAgICAvLyBdLmFjdGlvbi5uYXRpdmUgPT0gY3N0LkFDVElPTl9TSE9PVDoKICAgIGludGNfMSAvLyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODQzLTg0NQogICAgLy8gaWYgKHJldmVhbGVkID4+IHNsb3QpICYgMSA9PSAxIGFuZCBjaGFyYWN0ZXJzWwogICAgLy8gICAgIHNsb3QKICAgIC8vIF0uYWN0aW9uLm5hdGl2ZSA9PSBjc3QuQUNUSU9OX1NIT09UOgogICAgPT0KICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9idXJ5IDMKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMAogICAgYnogcmVzb2x2ZV9yb3VuZF9hZnRlcl9pZl9lbHNlQDMzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODQ2CiAgICAvLyBjZWxsID0gY2hhcmFjdGVyc1tzbG90XS5wb3NpdGlvbi5uYXRpdmUKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGludGNfMiAvLyA0CiAgICBnZXRieXRlCiAgICBmcmFtZV9idXJ5IDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4NDcKICAgIC8vIGRpcmVjdGlvbiA9IGNoYXJhY3RlcnNbc2xvdF0uZGlyZWN0aW9uLm5hdGl2ZQogICAgcHVzaGludCA3IC8vIDcKICAgIGdldGJ5dGUKICAgIGZyYW1lX2J1cnkgNwoKcmVzb2x2ZV9yb3VuZF93aGlsZV90b3BAMjU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODUxCiAgICAvLyBjZWxsICogY3N0Lk5FSUdIQk9SX0NPVU5UICsgZGlyZWN0aW9uLAogICAgZnJhbWVfZGlnIDYKICAgIGludGNfMiAvLyA0CiAgICAqCiAgICBmcmFtZV9kaWcgNwogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg1MAogICAgLy8gQnl0ZXMoY3N0Lk5FSUdIQk9SX1RBQkxFKSwKICAgIGJ5dGVjIDIyIC8vIDB4ZmYwYmZmMDFmZjBjMDAwMmZmMGQwMTAzZmYwZTAyMDRmZjBmMDMwNWZmMTAwNDA2ZmYxMTA1MDdmZjEyMDYwOGZmMTMwNzA5ZmYxNDA4MGFmZjE1MDlmZjAwMTZmZjBjMDExNzBiMGQwMjE4MGMwZTAzMTkwZDBmMDQxYTBlMTAwNTFiMGYxMTA2MWMxMDEyMDcxZDExMTMwODFlMTIxNDA5MWYxMzE1MGEyMDE0ZmYwYjIxZmYxNzBjMjIxNjE4MGQyMzE3MTkwZTI0MTgxYTBmMjUxOTFiMTAyNjFhMWMxMTI3MWIxZDEyMjgxYzFlMTMyOTFkMWYxNDJhMWUyMDE1MmIxZmZmMTYyY2ZmMjIxNzJkMjEyMzE4MmUyMjI0MTkyZjIzMjUxYTMwMjQyNjFiMzEyNTI3MWMzMjI2MjgxZDMzMjcyOTFlMzQyODJhMWYzNTI5MmIyMDM2MmFmZjIxMzdmZjJkMjIzODJjMmUyMzM5MmQyZjI0M2EyZTMwMjUzYjJmMzEyNjNjMzAzMjI3M2QzMTMzMjgzZTMyMzQyOTNmMzMzNTJhNDAzNDM2MmI0MTM1ZmYyYzQyZmYzODJkNDMzNzM5MmU0NDM4M2EyZjQ1MzkzYjMwNDYzYTNjMzE0NzNiM2QzMjQ4M2MzZTMzNDkzZDNmMzQ0YTNlNDAzNTRiM2Y0MTM2NGM0MGZmMzc0ZGZmNDMzODRlNDI0NDM5NGY0MzQ1M2E1MDQ0NDYzYjUxNDU0NzNjNTI0NjQ4M2Q1MzQ3NDkzZTU0NDg0YTNmNTU0OTRiNDA1NjRhNGM0MTU3NGJmZjQyNThmZjRlNDM1OTRkNGY0NDVhNGU1MDQ1NWI0ZjUxNDY1YzUwNTI0NzVkNTE1MzQ4NWU1MjU0NDk1ZjUzNTU0YTYwNTQ1NjRiNjE1NTU3NGM2MjU2ZmY0ZDYzZmY1OTRlNjQ1ODVhNGY2NTU5NWI1MDY2NWE1YzUxNjc1YjVkNTI2ODVjNWU1MzY5NWQ1ZjU0NmE1ZTYwNTU2YjVmNjE1NjZjNjA2MjU3NmQ2MWZmNTg2ZWZmNjQ1OTZmNjM2NTVhNzA2NDY2NWI3MTY1Njc1YzcyNjY2ODVkNzM2NzY5NWU3NDY4NmE1Zjc1Njk2YjYwNzY2YTZjNjE3NzZiNmQ2Mjc4NmNmZjYzZmZmZjZmNjRmZjZlNzA2NWZmNmY3MTY2ZmY3MDcyNjdmZjcxNzM2OGZmNzI3NDY5ZmY3Mzc1NmFmZjc0NzY2YmZmNzU3NzZjZmY3Njc4NmRmZjc3ZmYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4NDktODUyCiAgICAvLyBjZWxsID0gb3AuZ2V0Ynl0ZSgKICAgIC8vICAgICBCeXRlcyhjc3QuTkVJR0hCT1JfVEFCTEUpLAogICAgLy8gICAgIGNlbGwgKiBjc3QuTkVJR0hCT1JfQ09VTlQgKyBkaXJlY3Rpb24sCiAgICAvLyApCiAgICBzd2FwCiAgICBnZXRieXRlCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg1NAogICAgLy8gY2VsbCA9PSBjc3QuTkVJR0hCT1JfTk9ORQogICAgaW50YyA0IC8vIDI1NQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4NTQtODU1CiAgICAvLyBjZWxsID09IGNzdC5ORUlHSEJPUl9OT05FCiAgICAvLyBvciBzcnQuZ2V0X2dyaWRfY2VsbChncmlkLCBjZWxsKSA9PSBjc3QuR1JJRF9DRUxMX09CU1RBQ0xFCiAgICBibnogcmVzb2x2ZV9yb3VuZF9hZnRlcl93aGlsZUAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjM3OAogICAgLy8gcmV0dXJuIHVucGFja19ncmlkX2NlbGwob3AuZ2V0Ynl0ZShncmlkLCBpIC8vIGNzdC5HUklEX0NFTExTX1BFUl9CWVRFKSwgaSkKICAgIGZyYW1lX2RpZyA2CiAgICBkdXAKICAgIGludGNfMiAvLyA0CiAgICAvCiAgICBmcmFtZV9kaWcgMjQKICAgIHN3YXAKICAgIGdldGJ5dGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxMTQKICAgIC8vIGNzdC5HUklEX0NFTExTX1BFUl9CWVRFIC0gMSAtIGkgJSBjc3QuR1JJRF9DRUxMU19QRVJfQllURQogICAgc3dhcAogICAgaW50Y18yIC8vIDQKICAgICUKICAgIHB1c2hpbnQgMyAvLyAzCiAgICBzd2FwCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTE1CiAgICAvLyApICogY3N0LkdSSURfQ0VMTF9CSVRTCiAgICBpbnRjXzMgLy8gMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjExMy0xMTUKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgY3N0LkdSSURfQ0VMTFNfUEVSX0JZVEUgLSAxIC0gaSAlIGNzdC5HUklEX0NFTExTX1BFUl9CWVRFCiAgICAvLyApICogY3N0LkdSSURfQ0VMTF9CSVRTCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MTIxCiAgICAvLyByZXR1cm4gKHBhY2tlZCA+PiBncmlkX2NlbGxfc2hpZnQoaSkpICYgY3N0LkdSSURfQ0VMTF9NQVNLCiAgICBzaHIKICAgIHB1c2hpbnQgMyAvLyAzCiAgICAmCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODU1CiAgICAvLyBvciBzcnQuZ2V0X2dyaWRfY2VsbChncmlkLCBjZWxsKSA9PSBjc3QuR1JJRF9DRUxMX09CU1RBQ0xFCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4NTQtODU1CiAgICAvLyBjZWxsID09IGNzdC5ORUlHSEJPUl9OT05FCiAgICAvLyBvciBzcnQuZ2V0X2dyaWRfY2VsbChncmlkLCBjZWxsKSA9PSBjc3QuR1JJRF9DRUxMX09CU1RBQ0xFCiAgICBibnogcmVzb2x2ZV9yb3VuZF9hZnRlcl93aGlsZUAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg1OAogICAgLy8gaGl0X3Nsb3QgPSBzcnQuZmluZF9jaGFyYWN0ZXJfYXQoY2hhcmFjdGVycywgcHJlc2VudCwgY2VsbCwgc2xvdCkKICAgIGZyYW1lX2RpZyAyMgogICAgZnJhbWVfZGlnIDI4CiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfZGlnIDMwCiAgICBjYWxsc3ViIGZpbmRfY2hhcmFjdGVyX2F0CiAgICBmcmFtZV9idXJ5IDIyCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgOAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg1OQogICAgLy8gaWYgaGl0X3Nsb3QgIT0gY3N0Lk1BWF9MT0JCWV9TSVpFOgogICAgaW50Y18yIC8vIDQKICAgICE9CiAgICBieiByZXNvbHZlX3JvdW5kX3doaWxlX3RvcEAyNQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg2MAogICAgLy8gaGl0c1toaXRfc2xvdF0gPSBhcmM0LlVJbnQ4KGhpdHNbaGl0X3Nsb3RdLm5hdGl2ZSArIDEpCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBmcmFtZV9kaWcgOAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBnZXRieXRlCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgZGlnIDEKICAgIGludGNfMiAvLyA0CiAgICA8CiAgICBhc3NlcnQgLy8gSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHJlcGxhY2UzCiAgICBmcmFtZV9idXJ5IDIKCnJlc29sdmVfcm91bmRfYWZ0ZXJfd2hpbGVAMzI6CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfYnVyeSAzCiAgICBmcmFtZV9kaWcgMjIKICAgIGZyYW1lX2J1cnkgMAoKcmVzb2x2ZV9yb3VuZF9hZnRlcl9pZl9lbHNlQDMzOgogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2J1cnkgMgogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2J1cnkgMjIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4NDIKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZShwbGF5ZXJfY291bnQpOgogICAgZnJhbWVfZGlnIDMwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAzMAogICAgYiByZXNvbHZlX3JvdW5kX2Zvcl9oZWFkZXJAMjEKCnJlc29sdmVfcm91bmRfYWZ0ZXJfZm9yQDM1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg2My04NjQKICAgIC8vICMgUmVvcGVuIGV2ZXJ5IHByZXNlbnQgY2hhcmFjdGVyIGZvciB0aGUgbmV4dCByb3VuZAogICAgLy8gZm9yIHNsb3QgaW4gdXJhbmdlKHBsYXllcl9jb3VudCk6CiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAzMAoKcmVzb2x2ZV9yb3VuZF9mb3JfaGVhZGVyQDM2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg2My04NjQKICAgIC8vICMgUmVvcGVuIGV2ZXJ5IHByZXNlbnQgY2hhcmFjdGVyIGZvciB0aGUgbmV4dCByb3VuZAogICAgLy8gZm9yIHNsb3QgaW4gdXJhbmdlKHBsYXllcl9jb3VudCk6CiAgICBmcmFtZV9kaWcgMzAKICAgIGZyYW1lX2RpZyAyNwogICAgPAogICAgYnogcmVzb2x2ZV9yb3VuZF9hZnRlcl9mb3JANDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4NjUKICAgIC8vIGlmIChwcmVzZW50ID4+IHNsb3QpICYgMSA9PSAxOgogICAgZnJhbWVfZGlnIDI4CiAgICBmcmFtZV9kaWcgMzAKICAgIHNocgogICAgaW50Y18xIC8vIDEKICAgICYKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgZnJhbWVfZGlnIDIyCiAgICBmcmFtZV9idXJ5IDAKICAgIGJ6IHJlc29sdmVfcm91bmRfYWZ0ZXJfaWZfZWxzZUAzOQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg2NgogICAgLy8gY2hhcmFjdGVyc1tzbG90XS5oYXNfY29tbWl0dGVkX3R1cm4gPSBhcmM0LkJvb2woRmFsc2UpICAjIG5vcWE6IEZCVDAwMwogICAgZnJhbWVfZGlnIDMwCiAgICBkdXAKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICoKICAgIGZyYW1lX2RpZyAyMgogICAgZHVwCiAgICBjb3ZlciAzCiAgICBkaWcgMQogICAgcHVzaGludCA0MCAvLyA0MAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICBzZXRiaXQKICAgIHVuY292ZXIgMgogICAgaW50Y18yIC8vIDQKICAgIDwKICAgIGFzc2VydCAvLyBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdW5jb3ZlciAyCiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICByZXBsYWNlMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg2NwogICAgLy8gY2hhcmFjdGVyc1tzbG90XS5oYXNfcmV2ZWFsZWRfdHVybiA9IGFyYzQuQm9vbChGYWxzZSkgICMgbm9xYTogRkJUMDAzCiAgICBkdXAKICAgIGRpZyAyCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGludGNfMSAvLyAxCiAgICBpbnRjXzAgLy8gMAogICAgc2V0Yml0CiAgICBkaWcgMgogICAgc3dhcAogICAgcmVwbGFjZTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4NjgKICAgIC8vIGNoYXJhY3RlcnNbc2xvdF0uYWN0aW9uID0gYXJjNC5VSW50OChjc3QuQUNUSU9OX05PTkUpCiAgICBkdXAKICAgIGRpZyAyCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGVjXzAgLy8gMHgwMAogICAgcmVwbGFjZTIgMwogICAgZGlnIDIKICAgIHN3YXAKICAgIHJlcGxhY2UzCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODY5CiAgICAvLyBjaGFyYWN0ZXJzW3Nsb3RdLnRhcmdldCA9IGNoYXJhY3RlcnNbc2xvdF0ucG9zaXRpb24KICAgIGR1cAogICAgZGlnIDIKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBleHRyYWN0IDQgMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHJlcGxhY2UyIDUKICAgIGRpZyAyCiAgICBzd2FwCiAgICByZXBsYWNlMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg3MAogICAgLy8gY2hhcmFjdGVyc1tzbG90XS50dXJuX2hhc2ggPSBhcmM0LlVJbnQyNTYoMCkKICAgIGR1cAogICAgZGlnIDIKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWMgOSAvLyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIHJlcGxhY2UyIDgKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIHJlcGxhY2UzCiAgICBmcmFtZV9idXJ5IDAKCnJlc29sdmVfcm91bmRfYWZ0ZXJfaWZfZWxzZUAzOToKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9idXJ5IDIyCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODYzLTg2NAogICAgLy8gIyBSZW9wZW4gZXZlcnkgcHJlc2VudCBjaGFyYWN0ZXIgZm9yIHRoZSBuZXh0IHJvdW5kCiAgICAvLyBmb3Igc2xvdCBpbiB1cmFuZ2UocGxheWVyX2NvdW50KToKICAgIGZyYW1lX2RpZyAzMAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMzAKICAgIGIgcmVzb2x2ZV9yb3VuZF9mb3JfaGVhZGVyQDM2CgpyZXNvbHZlX3JvdW5kX2FmdGVyX2ZvckA0MToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4NzItODczCiAgICAvLyAjIFdyaXRlIHRoZSBncmlkLCBjaGFyYWN0ZXJzIGFuZCBnYW1lIHN0YXRlIGJhY2sgb25jZSBlYWNoOyBhIG5ldyBwaGFzZSBzdGFydHMKICAgIC8vIHNlbGYuYm94X2dhbWVfZ3JpZFtnYW1lX2lkXSA9IHRhLkdhbWVHcmlkLmZyb21fYnl0ZXMoZ3JpZCkKICAgIGZyYW1lX2RpZyAyMwogICAgZnJhbWVfZGlnIDI0CiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODc0CiAgICAvLyBzZWxmLmJveF9nYW1lX2NoYXJhY3RlcnNbZ2FtZV9pZF0gPSBjaGFyYWN0ZXJzLmNvcHkoKQogICAgZnJhbWVfZGlnIDIxCiAgICBmcmFtZV9kaWcgMjIKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4NzUKICAgIC8vIGdhbWVfc3RhdGUuZ3JpZF9yb290ID0gYXJjNC5VSW50MjU2LmZyb21fYnl0ZXMocm9vdCkKICAgIGZyYW1lX2RpZyAxOAogICAgZnJhbWVfZGlnIDI1CiAgICByZXBsYWNlMiA1MwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg3NwogICAgLy8gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBjc3QuUEhBU0VfRVhQSVJZX0lOVEVSVkFMCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpbnRjIDYgLy8gMTIwMAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg3Ni04NzgKICAgIC8vIGdhbWVfc3RhdGUuZXhwaXJ5X3RzID0gYXJjNC5VSW50NjQoCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBjc3QuUEhBU0VfRVhQSVJZX0lOVEVSVkFMCiAgICAvLyApCiAgICBpdG9iCiAgICByZXBsYWNlMiA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODc5CiAgICAvLyBnYW1lX3N0YXRlLnJvdW5kX2NvdW50ID0gYXJjNC5VSW50NjQoZ2FtZV9zdGF0ZS5yb3VuZF9jb3VudC5uYXRpdmUgKyAxKQogICAgZHVwCiAgICBwdXNoaW50IDg4IC8vIDg4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDg4CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODgwCiAgICAvLyBzZWxmLmJveF9nYW1lX3N0YXRlW2dhbWVfaWRdID0gZ2FtZV9zdGF0ZS5jb3B5KCkKICAgIGZyYW1lX2RpZyAxNwogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg4MgogICAgLy8gcmV0dXJuIGhpdHMKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by5taW1jX2Fic29yYihjaHVuazogYnl0ZXMsIGlzX2ZpcnN0OiB1aW50NjQpIC0+IGJ5dGVzOgptaW1jX2Fic29yYjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4ODQtODg4CiAgICAvLyAjIEFic29yYiBvbmUgY2h1bmsgb2YgYSBsb25nIE1pTUMgcHJlaW1hZ2UsIHNvIHRoZSBoYXNoIHNwcmVhZHMgb3ZlciBzZXZlcmFsIGFwcCBjYWxscyBpbiBhIGdyb3VwCiAgICAvLyAjIFRoZSBmaXJzdCBjaHVuayBpcyBoYXNoZWQgYWxvbmUsIGV2ZXJ5IGxhdGVyIGNodW5rIGlzIGhhc2hlZCBhZnRlciB0aGUgcHJldmlvdXMgY2h1bmsgZGlnZXN0CiAgICAvLyAjIFJldHVybiB0aGUgcnVubmluZyBkaWdlc3Q7IHRoZSBkaWdlc3QgcmV0dXJuZWQgYnkgdGhlIGxhc3QgY2h1bmsgaXMgdGhlIGZpbmFsIGhhc2gKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIG1pbWNfYWJzb3JiKHNlbGYsIGNodW5rOiBCeXRlcywgaXNfZmlyc3Q6IGJvb2wpIC0+IEJ5dGVzOiAgIyBub3FhOiBGQlQwMDEKICAgIHByb3RvIDIgMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4OTEKICAgIC8vIGNodW5rLmxlbmd0aCA+IDAKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4OTEtODkzCiAgICAvLyBjaHVuay5sZW5ndGggPiAwCiAgICAvLyBhbmQgY2h1bmsubGVuZ3RoICUgY3N0Lk1JTUNfRlJfU0laRSA9PSAwCiAgICAvLyBhbmQgY2h1bmsubGVuZ3RoIDw9IGNzdC5NSU1DX0ZSX1NJWkUgKiBjc3QuTUlNQ19DSFVOS19NQVhfRUxFTUVOVFMKICAgIGJ6IG1pbWNfYWJzb3JiX2Jvb2xfZmFsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg5MgogICAgLy8gYW5kIGNodW5rLmxlbmd0aCAlIGNzdC5NSU1DX0ZSX1NJWkUgPT0gMAogICAgZnJhbWVfZGlnIDIKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgICUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4OTEtODkzCiAgICAvLyBjaHVuay5sZW5ndGggPiAwCiAgICAvLyBhbmQgY2h1bmsubGVuZ3RoICUgY3N0Lk1JTUNfRlJfU0laRSA9PSAwCiAgICAvLyBhbmQgY2h1bmsubGVuZ3RoIDw9IGNzdC5NSU1DX0ZSX1NJWkUgKiBjc3QuTUlNQ19DSFVOS19NQVhfRUxFTUVOVFMKICAgIGJueiBtaW1jX2Fic29yYl9ib29sX2ZhbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4OTMKICAgIC8vIGFuZCBjaHVuay5sZW5ndGggPD0gY3N0Lk1JTUNfRlJfU0laRSAqIGNzdC5NSU1DX0NIVU5LX01BWF9FTEVNRU5UUwogICAgZnJhbWVfZGlnIDIKICAgIHB1c2hpbnQgMjU2IC8vIDI1NgogICAgPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4OTEtODkzCiAgICAvLyBjaHVuay5sZW5ndGggPiAwCiAgICAvLyBhbmQgY2h1bmsubGVuZ3RoICUgY3N0Lk1JTUNfRlJfU0laRSA9PSAwCiAgICAvLyBhbmQgY2h1bmsubGVuZ3RoIDw9IGNzdC5NSU1DX0ZSX1NJWkUgKiBjc3QuTUlNQ19DSFVOS19NQVhfRUxFTUVOVFMKICAgIGJ6IG1pbWNfYWJzb3JiX2Jvb2xfZmFsc2VANAogICAgaW50Y18xIC8vIDEKCm1pbWNfYWJzb3JiX2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo4ODktODk0CiAgICAvLyAjIEZhaWwgdHJhbnNhY3Rpb24gdW5sZXNzIHRoZSBhc3NlcnRpb24gYmVsb3cgZXZhbHVhdGVzIFRydWUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgY2h1bmsubGVuZ3RoID4gMAogICAgLy8gICAgIGFuZCBjaHVuay5sZW5ndGggJSBjc3QuTUlNQ19GUl9TSVpFID09IDAKICAgIC8vICAgICBhbmQgY2h1bmsubGVuZ3RoIDw9IGNzdC5NSU1DX0ZSX1NJWkUgKiBjc3QuTUlNQ19DSFVOS19NQVhfRUxFTUVOVFMKICAgIC8vICksIGVyci5JTlZBTElEX01JTUNfQ0hVTksKICAgIGFzc2VydCAvLyBJbnZhbGlkIE1pTUMgY2h1bmsuIEVuc3VyZSB0aGUgY2h1bmsgaG9sZHMgMSB0byA4IHdob2xlIDMyLWJ5dGUgZmllbGQgZWxlbWVudHMuCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojg5NwogICAgLy8gaWYgbm90IGlzX2ZpcnN0OgogICAgZnJhbWVfZGlnIC0xCiAgICBibnogbWltY19hYnNvcmJfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MzEwLTMxMQogICAgLy8gIyBGYWlsIHRyYW5zYWN0aW9uIHVubGVzcyB0aGUgYXNzZXJ0aW9uIGJlbG93IGV2YWx1YXRlcyBUcnVlCiAgICAvLyBhc3NlcnQgVHhuLmdyb3VwX2luZGV4ID4gMCwgZXJyLklOVkFMSURfTUlNQ19DSEFJTgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGFzc2VydCAvLyBJbnZhbGlkIE1pTUMgY2hhaW4uIEVuc3VyZSB0aGUgcHJldmlvdXMgZ3JvdXAgdHJhbnNhY3Rpb24gaXMgYSBtaW1jX2Fic29yYiBjYWxsIHRvIHRoaXMgYXBwLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjMxMgogICAgLy8gcHJldl90eG4gPSBndHhuLkFwcGxpY2F0aW9uQ2FsbFRyYW5zYWN0aW9uKFR4bi5ncm91cF9pbmRleCAtIDEpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGFwcGwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozMTMKICAgIC8vIGFzc2VydCBwcmV2X3R4bi5hcHBfaWQgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQgYW5kIHByZXZfdHhuLmFwcF9hcmdzKAogICAgZ3R4bnMgQXBwbGljYXRpb25JRAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjMxMy0zMTUKICAgIC8vIGFzc2VydCBwcmV2X3R4bi5hcHBfaWQgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQgYW5kIHByZXZfdHhuLmFwcF9hcmdzKAogICAgLy8gICAgIDAKICAgIC8vICkgPT0gYXJjNC5hcmM0X3NpZ25hdHVyZShjc3QuTUlNQ19BQlNPUkJfU0lHTkFUVVJFKSwgZXJyLklOVkFMSURfTUlNQ19DSEFJTgogICAgYnogbWltY19hYnNvcmJfYm9vbF9mYWxzZUAxMQogICAgZnJhbWVfZGlnIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozMTQKICAgIC8vIDAKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vc3Vicm91dGluZXMucHk6MzEzLTMxNQogICAgLy8gYXNzZXJ0IHByZXZfdHhuLmFwcF9pZCA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZCBhbmQgcHJldl90eG4uYXBwX2FyZ3MoCiAgICAvLyAgICAgMAogICAgLy8gKSA9PSBhcmM0LmFyYzRfc2lnbmF0dXJlKGNzdC5NSU1DX0FCU09SQl9TSUdOQVRVUkUpLCBlcnIuSU5WQUxJRF9NSU1DX0NIQUlOCiAgICBndHhuc2FzIEFwcGxpY2F0aW9uQXJncwogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjMxNQogICAgLy8gKSA9PSBhcmM0LmFyYzRfc2lnbmF0dXJlKGNzdC5NSU1DX0FCU09SQl9TSUdOQVRVUkUpLCBlcnIuSU5WQUxJRF9NSU1DX0NIQUlOCiAgICBieXRlYyAxNSAvLyBtZXRob2QgIm1pbWNfYWJzb3JiKGJ5dGVbXSxib29sKWJ5dGVbXSIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozMTMtMzE1CiAgICAvLyBhc3NlcnQgcHJldl90eG4uYXBwX2lkID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkIGFuZCBwcmV2X3R4bi5hcHBfYXJncygKICAgIC8vICAgICAwCiAgICAvLyApID09IGFyYzQuYXJjNF9zaWduYXR1cmUoY3N0Lk1JTUNfQUJTT1JCX1NJR05BVFVSRSksIGVyci5JTlZBTElEX01JTUNfQ0hBSU4KICAgID09CiAgICBieiBtaW1jX2Fic29yYl9ib29sX2ZhbHNlQDExCiAgICBpbnRjXzEgLy8gMQoKbWltY19hYnNvcmJfYm9vbF9tZXJnZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weTozMTMtMzE1CiAgICAvLyBhc3NlcnQgcHJldl90eG4uYXBwX2lkID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkIGFuZCBwcmV2X3R4bi5hcHBfYXJncygKICAgIC8vICAgICAwCiAgICAvLyApID09IGFyYzQuYXJjNF9zaWduYXR1cmUoY3N0Lk1JTUNfQUJTT1JCX1NJR05BVFVSRSksIGVyci5JTlZBTElEX01JTUNfQ0hBSU4KICAgIGFzc2VydCAvLyBJbnZhbGlkIE1pTUMgY2hhaW4uIEVuc3VyZSB0aGUgcHJldmlvdXMgZ3JvdXAgdHJhbnNhY3Rpb24gaXMgYSBtaW1jX2Fic29yYiBjYWxsIHRvIHRoaXMgYXBwLgogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL3N1YnJvdXRpbmVzLnB5OjMxNgogICAgLy8gcmV0dXJuIG9wLmdsb2FkX2J5dGVzKFR4bi5ncm91cF9pbmRleCAtIDEsIGNzdC5NSU1DX0NIQUlOX1NMT1QpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGdsb2FkcyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6ODk4LTg5OQogICAgLy8gIyBDaGFpbiBvbnRvIHRoZSBkaWdlc3QgdGhlIHByZXZpb3VzIG1pbWNfYWJzb3JiIGNhbGwgb2YgdGhlIGdyb3VwIGxlZnQgaW4gc2NyYXRjaCBzcGFjZQogICAgLy8gcHJlaW1hZ2UgPSBzcnQubG9hZF9taW1jX2NoYWluX2RpZ2VzdCgpICsgY2h1bmsKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKCm1pbWNfYWJzb3JiX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo5MDUKICAgIC8vICsgY3N0Lk1JTUNfRUxFTUVOVF9DT1NUICogKHByZWltYWdlLmxlbmd0aCAvLyBjc3QuTUlNQ19GUl9TSVpFKSwKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMiAvLyAzMgogICAgLwogICAgcHVzaGludCA1NTAgLy8gNTUwCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6OTAzLTkwNAogICAgLy8gcmVxdWlyZWRfYnVkZ2V0PWNzdC5NSU1DX0FCU09SQl9CQVNFX0JVREdFVAogICAgLy8gKyBjc3QuTUlNQ19CQVNFX0NPU1QKICAgIHB1c2hpbnQgMjEwIC8vIDIxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjkwMy05MDUKICAgIC8vIHJlcXVpcmVkX2J1ZGdldD1jc3QuTUlNQ19BQlNPUkJfQkFTRV9CVURHRVQKICAgIC8vICsgY3N0Lk1JTUNfQkFTRV9DT1NUCiAgICAvLyArIGNzdC5NSU1DX0VMRU1FTlRfQ09TVCAqIChwcmVpbWFnZS5sZW5ndGggLy8gY3N0Lk1JTUNfRlJfU0laRSksCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6OTA2CiAgICAvLyBmZWVfc291cmNlPU9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQsCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjkwMS05MDcKICAgIC8vICMgRW5zdXJlIHRyYW5zYWN0aW9uIGhhcyBzdWZmaWNpZW50IG9wY29kZSBidWRnZXQgZm9yIHRoaXMgY2h1bmsgb25seQogICAgLy8gZW5zdXJlX2J1ZGdldCgKICAgIC8vICAgICByZXF1aXJlZF9idWRnZXQ9Y3N0Lk1JTUNfQUJTT1JCX0JBU0VfQlVER0VUCiAgICAvLyAgICAgKyBjc3QuTUlNQ19CQVNFX0NPU1QKICAgIC8vICAgICArIGNzdC5NSU1DX0VMRU1FTlRfQ09TVCAqIChwcmVpbWFnZS5sZW5ndGggLy8gY3N0Lk1JTUNfRlJfU0laRSksCiAgICAvLyAgICAgZmVlX3NvdXJjZT1PcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0LAogICAgLy8gKQogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6OTA5LTkxMAogICAgLy8gIyBIYXNoIHRoZSBjaHVuaywgdGhlbiBsZWF2ZSBpdHMgZGlnZXN0IGluIHNjcmF0Y2ggc3BhY2UgZm9yIHRoZSBuZXh0IGNodW5rCiAgICAvLyBkaWdlc3QgPSBvcC5taW1jKG9wLk1pTUNDb25maWd1cmF0aW9ucy5CTFMxMl8zODFNcDExMSwgcHJlaW1hZ2UpCiAgICBtaW1jIEJMUzEyXzM4MU1wMTExCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6OTExCiAgICAvLyBvcC5TY3JhdGNoLnN0b3JlKGNzdC5NSU1DX0NIQUlOX1NMT1QsIGRpZ2VzdCkKICAgIGR1cAogICAgc3RvcmUgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5OjkxMgogICAgLy8gcmV0dXJuIGRpZ2VzdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCm1pbWNfYWJzb3JiX2Jvb2xfZmFsc2VAMTE6CiAgICBpbnRjXzAgLy8gMAogICAgYiBtaW1jX2Fic29yYl9ib29sX21lcmdlQDEyCgptaW1jX2Fic29yYl9ib29sX2ZhbHNlQDQ6CiAgICBpbnRjXzAgLy8gMAogICAgYiBtaW1jX2Fic29yYl9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMuc2Fsdm8uY29udHJhY3QuU2Fsdm8ubWltY190ZXN0ZXIoKSAtPiBieXRlczoKbWltY190ZXN0ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6OTE0LTkxNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgbWltY190ZXN0ZXIoc2VsZikgLT4gQnl0ZXM6CiAgICBwcm90byAwIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo5MTYtOTE3CiAgICAvLyAjIEVuc3VyZSB0cmFuc2FjdGlvbiBoYXMgc3VmZmljaWVudCBvcGNvZGUgYnVkZ2V0CiAgICAvLyBlbnN1cmVfYnVkZ2V0KHJlcXVpcmVkX2J1ZGdldD02ODYwMCwgZmVlX3NvdXJjZT1PcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0KQogICAgcHVzaGludCA2ODYwMCAvLyA2ODYwMAogICAgaW50Y18wIC8vIDAKICAgIGNhbGxzdWIgZW5zdXJlX2J1ZGdldAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojk0My05NDQKICAgIC8vICMgSW5pdGlhbGl6ZSBhIHByZWltYWdlIGJ5dGUgYXJyYXkgdGhhdCB3aWxsIHN0b3JlIHNjYWxhciBpbnB1dCBpbnRzIGZvciBNaU1DIGhhc2hpbmcKICAgIC8vIHByZWltYWdlID0gQnl0ZXMoKQogICAgYnl0ZWNfMyAvLyAweAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojk1Ni05NjAKICAgIC8vICMgIyBBZGQgcmVzdCBvZiB0aGUgc2NhbGFyIGlucHV0cwogICAgLy8gIyBwcmVpbWFnZSArPSBzcnQudThfdG9fZnIzMihhY3Rpb24pCiAgICAvLyAjIHByZWltYWdlICs9IHNydC51OF90b19mcjMyKGRpcmVjdGlvbikKICAgIC8vICMgcHJlaW1hZ2UgKz0gc3J0LnU2NF90b19mcjMyKHNhbHQpCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoMTIxKTogICMgdXJhbmdlKDEyMSkgZ2VuZXJhdGVzIFVJbnQ2NCB2YWx1ZXMgZnJvbSAwIHRvIDEyMAogICAgaW50Y18wIC8vIDAKCm1pbWNfdGVzdGVyX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo5NTYtOTYwCiAgICAvLyAjICMgQWRkIHJlc3Qgb2YgdGhlIHNjYWxhciBpbnB1dHMKICAgIC8vICMgcHJlaW1hZ2UgKz0gc3J0LnU4X3RvX2ZyMzIoYWN0aW9uKQogICAgLy8gIyBwcmVpbWFnZSArPSBzcnQudThfdG9fZnIzMihkaXJlY3Rpb24pCiAgICAvLyAjIHByZWltYWdlICs9IHNydC51NjRfdG9fZnIzMihzYWx0KQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKDEyMSk6ICAjIHVyYW5nZSgxMjEpIGdlbmVyYXRlcyBVSW50NjQgdmFsdWVzIGZyb20gMCB0byAxMjAKICAgIGZyYW1lX2RpZyAxCiAgICBwdXNoaW50IDEyMSAvLyAxMjEKICAgIDwKICAgIGJ6IG1pbWNfdGVzdGVyX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6OTYxCiAgICAvLyBwcmVpbWFnZSArPSBzcnQudThfdG9fZnIzMihhcmM0LlVJbnQ4KDEpKQogICAgZnJhbWVfZGlnIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9zdWJyb3V0aW5lcy5weToxNzgtMTc5CiAgICAvLyAjIFJldHVybiBiaWctZW5kaWFuIGJ5dGUgYXJyYXkgKEFWTSB0eXBlOiBCeXRlcyksIFVJbnQ4IGxlZnQtcGFkZGVkIHcvIHplcm9zIHRvIG1hdGNoIDMyLWJ5dGUgc2NhbGFyIGZvcm1hdAogICAgLy8gcmV0dXJuIG9wLmJ6ZXJvKDMxKSArIHUuYnl0ZXMKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo5NjEKICAgIC8vIHByZWltYWdlICs9IHNydC51OF90b19mcjMyKGFyYzQuVUludDgoMSkpCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3NhbHZvL2NvbnRyYWN0LnB5Ojk1Ni05NjAKICAgIC8vICMgIyBBZGQgcmVzdCBvZiB0aGUgc2NhbGFyIGlucHV0cwogICAgLy8gIyBwcmVpbWFnZSArPSBzcnQudThfdG9fZnIzMihhY3Rpb24pCiAgICAvLyAjIHByZWltYWdlICs9IHNydC51OF90b19mcjMyKGRpcmVjdGlvbikKICAgIC8vICMgcHJlaW1hZ2UgKz0gc3J0LnU2NF90b19mcjMyKHNhbHQpCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoMTIxKTogICMgdXJhbmdlKDEyMSkgZ2VuZXJhdGVzIFVJbnQ2NCB2YWx1ZXMgZnJvbSAwIHRvIDEyMAogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgbWltY190ZXN0ZXJfZm9yX2hlYWRlckAxCgptaW1jX3Rlc3Rlcl9hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zYWx2by9jb250cmFjdC5weTo5NzgKICAgIC8vIG91dHB1dCA9IG9wLm1pbWMob3AuTWlNQ0NvbmZpZ3VyYXRpb25zLkJMUzEyXzM4MU1wMTExLCBwcmVpbWFnZSkKICAgIGZyYW1lX2RpZyAwCiAgICBtaW1jIEJMUzEyXzM4MU1wMTExCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6OTg0CiAgICAvLyByZXR1cm4gb3V0cHV0CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5zYWx2by5jb250cmFjdC5TYWx2by51cGRhdGUoKSAtPiB2b2lkOgp1cGRhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6OTg4CiAgICAvLyBhc3NlcnQgVGVtcGxhdGVWYXJbYm9vbF0oIlVQREFUQUJMRSIpLCBlcnIuVVBEQVRBQkxFX05PVF9UUlVFCiAgICBpbnRjIDkgLy8gVE1QTF9VUERBVEFCTEUKICAgIGFzc2VydCAvLyBUZW1wbGF0ZSB2YXJpYWJsZSAnVVBEQVRBQkxFJyBuZWVkcyB0byBiZSAnVHJ1ZScgYXQgZGVwbG95LXRpbWUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2Fsdm8vY29udHJhY3QucHk6OTg5CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCBlcnIuU0VOREVSX05PVF9DUkVBVE9SCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBhcHAgY3JlYXRvciBjYW4gYWN0IGFzIHRoZSBzZW5kZXIgYWRkcmVzcy4KICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [3530], "errorMessage": "Action overflow. Ensure action index is within valid range."}, {"pc": [1978, 2711], "errorMessage": "Box found. Ensure the box does not exist."}, {"pc": [1994, 2141, 2149, 2157, 2165, 2173, 2441, 2449, 2657], "errorMessage": "Box payment receiver address must match application address."}, {"pc": [1986, 2101, 2109, 2117, 2125, 2425, 2649], "errorMessage": "Box payment sender address must match transaction sender address."}, {"pc": [3537], "errorMessage": "Direction overflow. Ensure direction index is within valid range."}, {"pc": [1056, 1650, 1682, 1702, 1736, 2977, 3000, 3072, 3339, 3434, 3674, 4101], "errorMessage": "Game ID not found. Ensure the game was created and still exists."}, {"pc": [1122, 1315, 2763, 3165, 3170, 3202, 3233, 3243, 3264, 3285, 3298, 3614, 3622, 3677, 3682, 3726, 3728, 3733, 3810, 3812, 3816, 4016, 4018, 4022, 4180, 4256, 4338, 4534, 4586, 4640, 4648, 4742, 4866, 4937, 4945, 4958, 4971, 4984, 4986, 5000], "errorMessage": "Index access is out of bounds"}, {"pc": [2048, 2058, 2093, 2417, 2641], "errorMessage": "Insufficient payment amount. Value is not enough to cover the minimum requirements."}, {"pc": [1846, 2198, 2475, 2683], "errorMessage": "Invalid Lobby size. Value must be an even number and within permitted bounds."}, {"pc": [5108, 5143], "errorMessage": "Invalid MiMC chain. Ensure the previous group transaction is a mimc_absorb call to this app."}, {"pc": [5096], "errorMessage": "Invalid MiMC chunk. Ensure the chunk holds 1 to 8 whole 32-byte field elements."}, {"pc": [2204, 2481], "errorMessage": "Invalid commit scheme. Ensure the scheme is MiMC (0), sha256 (1) or sha512_256 (2)."}, {"pc": [3249], "errorMessage": "Invalid commit signature. Ensure the player signed the turn commit message of this game phase."}, {"pc": [3089], "errorMessage": "Invalid commits length. Ensure there is at least one and at most one commit per lobby slot."}, {"pc": [4694], "errorMessage": "Invalid grid proof count. Provide one grid proof per changed grid cell, in change order."}, {"pc": [1207], "errorMessage": "Invalid grid proof. Ensure the Merkle proof matches the current grid cell value and root."}, {"pc": [1968, 2038, 2407, 2631], "errorMessage": "Invalid group size. Ensure number of transactions in group is within valid bounds."}, {"pc": [3780], "errorMessage": "Invalid move sequence. Ensure every movement entry is a path cell next to the previous one."}, {"pc": [1012], "errorMessage": "Invalid position coordinates. Ensure boh row and column indices are within valid range."}, {"pc": [1064, 3633], "errorMessage": "Invalid position index. Ensure index value is within valid range."}, {"pc": [1853, 2690], "errorMessage": "Invalid stake tier. Value must be below the number of stake tiers."}, {"pc": [3524], "errorMessage": "Movement overflow. Ensure movement length (num of indicies) is within valid range."}, {"pc": [225, 249, 284, 307, 338, 360, 379, 401, 417, 445, 492, 571, 593, 606, 636, 656, 679, 699, 724, 744, 769, 794, 819, 846, 872, 895, 911], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [213], "errorMessage": "OnCompletion is not UpdateApplication"}, {"pc": [5274], "errorMessage": "Only app creator can act as the sender address."}, {"pc": [2767], "errorMessage": "Only the game admin address can act as the sender address."}, {"pc": [2827, 2921], "errorMessage": "Open lobby not found. The game is not listed in its open lobby index bucket."}, {"pc": [1709, 3018, 3221, 3230, 3352, 3465], "errorMessage": "Player not found. Ensure player address is inside the game lobby."}, {"pc": [4303], "errorMessage": "Round not revealed. Every player must reveal their turn before the phase expires."}, {"pc": [2133, 2433], "errorMessage": "Stake payment sender address must match sender address."}, {"pc": [2779], "errorMessage": "Staking closed. The game is live and no longer takes players."}, {"pc": [3447, 4120], "errorMessage": "Staking not closed. The game admin must close staking before rounds are played."}, {"pc": [5268], "errorMessage": "Template variable 'UPDATABLE' needs to be 'True' at deploy-time."}, {"pc": [3043, 3276, 3382], "errorMessage": "Turn already committed. Wait for the current turn to resolve before committing again."}, {"pc": [3509], "errorMessage": "Turn already revealed. Wait for the round to resolve before revealing again."}, {"pc": [3620], "errorMessage": "Turn hash mismatch. Ensure the revealed turn is the one committed for this game."}, {"pc": [3497], "errorMessage": "Turn not committed. Commit a turn hash before revealing the turn."}, {"pc": [597], "errorMessage": "can only call when creating"}, {"pc": [216, 228, 252, 287, 310, 341, 363, 382, 404, 420, 448, 495, 574, 609, 639, 659, 682, 702, 727, 747, 772, 797, 822, 849, 875, 898, 914], "errorMessage": "can only call when not creating"}, {"pc": [3692], "errorMessage": "check BoxMap entry exists"}, {"pc": [1370], "errorMessage": "check BoxRef exists"}, {"pc": [1652, 3129, 4165], "errorMessage": "check self.box_game_characters entry exists"}, {"pc": [4178], "errorMessage": "check self.box_game_grid entry exists"}, {"pc": [1742, 3116, 4152], "errorMessage": "check self.box_game_lobby entry exists"}, {"pc": [2982, 3133, 3436, 4109], "errorMessage": "check self.box_game_state entry exists"}, {"pc": [2208, 2270, 2342, 2485, 2520, 2613], "errorMessage": "check self.game_id exists"}, {"pc": [1037, 1093, 1183, 1216, 1927, 2081, 2297, 2547, 3649, 3660, 4624, 4858], "errorMessage": "overflow"}, {"pc": [5122], "errorMessage": "transaction type is appl"}, {"pc": [430, 458, 468, 506, 516, 527, 537, 547, 584], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"GEN_UNIX": {"type": "AVMUint64"}, "UPDATABLE": {"type": "AVMUint64"}}}"""
+# post-processed: lazy APP_SPEC
+import functools
+
+
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    """Parse the embedded ARC-56 app spec once, on first use"""
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+
+def __getattr__(name: str) -> object:
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# post-processed: fast-path ABI helpers
+import operator
+
+_ABI_CONVERTERS: dict[type, typing.Callable[[object], object]] = {}
+_ARGS_GETTERS: dict[type, typing.Callable[[object], tuple]] = {}
+_IS_TXN_ARG: dict[type, bool] = {}
+_DATACLASS_INITS: dict[type, list[tuple[str, type | None]]] = {}
+_ABI_SCALAR_TYPES = (int, bool, str, bytes, bytearray, type(None))
+
+
+def _fields_getter(cls: type) -> typing.Callable[[object], tuple]:
+    """Build a getter returning the dataclass field values of `cls` as a tuple, in field order"""
+    names = [field.name for field in dataclasses.fields(cls)]
+    if len(names) == 1:
+        name = names[0]
+        return lambda value: (getattr(value, name),)
+    if not names:
+        return lambda value: ()
+    return operator.attrgetter(*names)
+
+
+def _abi_converter(cls: type) -> typing.Callable[[object], object]:
+    """Get the cached converter of a value type into the format expected by underlying client"""
+    converter = _ABI_CONVERTERS.get(cls)
+    if converter is not None:
+        return converter
+
+    if issubclass(cls, _ABI_SCALAR_TYPES):
+        def converter(value: object) -> object:
+            return value
+    elif dataclasses.is_dataclass(cls):
+        getter = _fields_getter(cls)
+
+        def converter(value: object) -> object:
+            return tuple([_convert_abi_value(item) for item in getter(value)])
+    elif issubclass(cls, (list, tuple)):
+        def converter(value: object) -> object:
+            # Arrays of scalars (e.g. uint256[]) are passed through w/o converting item by item
+            if all(type(item) in _ABI_SCALAR_TYPES for item in value):
+                return cls(value)
+            return cls(_convert_abi_value(item) for item in value)
+    else:
+        def converter(value: object) -> object:
+            return value
+
+    _ABI_CONVERTERS[cls] = converter
+    return converter
+
+
+def _convert_abi_value(value: object) -> object:
+    """Convert a single ABI arg value, recursing into dataclasses, lists and tuples"""
+    return _abi_converter(type(value))(value)
+
+
+def _is_txn_arg(value: object) -> bool:
+    """Check (w/ a per-type cache) if a value is a transaction argument the client handles itself"""
+    cls = type(value)
+    is_txn_arg = _IS_TXN_ARG.get(cls)
+    if is_txn_arg is None:
+        is_txn_arg = _IS_TXN_ARG[cls] = isinstance(value, algokit_utils.AppMethodCallTransactionArgument)
+    return is_txn_arg
+
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
     if args is None:
         return None
 
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
-    match args:
-        case tuple():
-            method_args = list(args)
-        case _ if dataclasses.is_dataclass(args):
-            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
-        case _:
-            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+    if isinstance(args, tuple):
+        method_args = list(args)
+    else:
+        getter = _ARGS_GETTERS.get(type(args))
+        if getter is None:
+            if not dataclasses.is_dataclass(args):
+                raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+            getter = _ARGS_GETTERS[type(args)] = _fields_getter(type(args))
+        method_args = list(getter(args))
 
     return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        _convert_abi_value(arg) if not _is_txn_arg(arg) else arg
         for arg in method_args
     ] if method_args else None
 
@@ -51,25 +122,35 @@ def _init_dataclass(cls: type, data: dict) -> object:
     """
     Recursively instantiate a dataclass of type `cls` from `data`.
 
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
+    The (field name, nested dataclass type) plan of each `cls` is built once and cached.
     """
+    plan = _DATACLASS_INITS.get(cls)
+    if plan is None:
+        plan = _DATACLASS_INITS[cls] = [
+            (field.name, typing.cast(type, field.type) if dataclasses.is_dataclass(field.type) else None)
+            for field in dataclasses.fields(cls)
+        ]
+
     field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
+    for name, nested in plan:
+        field_value = data.get(name)
         # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        if nested is not None and isinstance(field_value, dict):
+            field_values[name] = _init_dataclass(nested, field_value)
         else:
-            field_values[field.name] = field_value
+            field_values[name] = field_value
     return cls(**field_values)
 
 @dataclasses.dataclass(frozen=True)
 class GameCharacter:
     """Struct for GameCharacter"""
     has_committed_turn: bool
+    has_revealed_turn: bool
     id: int
+    lobby_slot: int
+    action: int
     position: int
+    target: int
     move_points: int
     direction: int
     turn_hash: int
@@ -84,6 +165,11 @@ class GameState:
     expiry_ts: int
     prize_pot: int
     admin_address: str
+    grid_root: int
+    commit_scheme: int
+    stake_tier: int
+    open_lobby_listed: bool
+    round_count: int
 
 @dataclasses.dataclass(frozen=True)
 class UserRegistry:
@@ -153,13 +239,50 @@ class DoesBoxGameStateExistArgs:
         return "does_box_game_state_exist(uint64)bool"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
-class DoesBoxGameCharacterExistArgs:
-    """Dataclass for does_box_game_character_exist arguments"""
-    account: str | bytes
+class DoesBoxGameCharactersExistArgs:
+    """Dataclass for does_box_game_characters_exist arguments"""
+    game_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "does_box_game_characters_exist(uint64)bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ReadBoxGameCharactersArgs:
+    """Dataclass for read_box_game_characters arguments"""
+    game_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "read_box_game_characters(uint64)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)[4]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DoesBoxGameRecordExistArgs:
+    """Dataclass for does_box_game_record_exist arguments"""
+    game_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "does_box_game_record_exist(uint64)bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ReadGameRecordStateArgs:
+    """Dataclass for read_game_record_state arguments"""
+    game_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "read_game_record_state(uint64)(bool,uint8,uint8,uint16,uint64,uint64,address,uint256,uint8,uint8,bool,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ReadGameRecordCharacterArgs:
+    """Dataclass for read_game_record_character arguments"""
+    game_id: int
+    lobby_slot: int
 
     @property
     def abi_method_signature(self) -> str:
-        return "does_box_game_character_exist(account)bool"
+        return "read_game_record_character(uint64,uint8)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class ReadBoxGameLobbyArgs:
@@ -170,6 +293,18 @@ class ReadBoxGameLobbyArgs:
     def abi_method_signature(self) -> str:
         return "read_box_game_lobby(uint64)address[]"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ReadOpenLobbiesArgs:
+    """Dataclass for read_open_lobbies arguments"""
+    lobby_size: int
+    stake_tier: int
+    start: int
+    count: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "read_open_lobbies(uint8,uint8,uint64,uint64)uint64[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetBoxUserRegistryArgs:
     """Dataclass for get_box_user_registry arguments"""
@@ -188,20 +323,109 @@ class NewGameArgs:
     box_l_pay: algokit_utils.AppMethodCallTransactionArgument
     stake_pay: algokit_utils.AppMethodCallTransactionArgument
     lobby_size: int
+    commit_scheme: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "new_game(pay,pay,pay,pay,pay,uint8,uint8)bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class NewGameRecordArgs:
+    """Dataclass for new_game_record arguments"""
+    box_m_pay: algokit_utils.AppMethodCallTransactionArgument
+    stake_pay: algokit_utils.AppMethodCallTransactionArgument
+    lobby_size: int
+    commit_scheme: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "new_game_record(pay,pay,uint8,uint8)bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateOpenLobbyIndexArgs:
+    """Dataclass for create_open_lobby_index arguments"""
+    box_o_pay: algokit_utils.AppMethodCallTransactionArgument
+    lobby_size: int
+    stake_tier: int
 
     @property
     def abi_method_signature(self) -> str:
-        return "new_game(pay,pay,pay,pay,pay,uint8)void"
+        return "create_open_lobby_index(pay,uint8,uint8)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CloseStakingArgs:
+    """Dataclass for close_staking arguments"""
+    game_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "close_staking(uint64)void"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CommitTurnArgs:
     """Dataclass for commit_turn arguments"""
     game_id: int
+    lobby_slot: int
+    turn_hash: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "commit_turn(uint64,uint8,uint256)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CommitTurnsArgs:
+    """Dataclass for commit_turns arguments"""
+    game_id: int
+    commits: list[tuple[int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "commit_turns(uint64,(uint8,uint256,byte[64])[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CommitTurnRecordArgs:
+    """Dataclass for commit_turn_record arguments"""
+    game_id: int
+    lobby_slot: int
     turn_hash: int
 
     @property
     def abi_method_signature(self) -> str:
-        return "commit_turn(uint64,uint256)void"
+        return "commit_turn_record(uint64,uint8,uint256)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RevealTurnArgs:
+    """Dataclass for reveal_turn arguments"""
+    game_id: int
+    lobby_slot: int
+    movement: list[tuple[int, int]]
+    action: int
+    direction: int
+    salt: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "reveal_turn(uint64,uint8,(uint8,uint8)[],uint8,uint8,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ResolveRoundArgs:
+    """Dataclass for resolve_round arguments"""
+    game_id: int
+    proofs: list[tuple[int, int, int, int, int, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "resolve_round(uint64,uint256[7][])uint8[4]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class MimcAbsorbArgs:
+    """Dataclass for mimc_absorb arguments"""
+    chunk: bytes | str
+    is_first: bool
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "mimc_absorb(byte[],bool)byte[]"
 
 
 class _SalvoUpdate:
@@ -319,16 +543,68 @@ class SalvoParams:
             "args": method_args,
         }))
 
-    def does_box_game_character_exist(
+    def does_box_game_characters_exist(
+        self,
+        args: tuple[int] | DoesBoxGameCharactersExistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "does_box_game_characters_exist(uint64)bool",
+            "args": method_args,
+        }))
+
+    def read_box_game_characters(
+        self,
+        args: tuple[int] | ReadBoxGameCharactersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "read_box_game_characters(uint64)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)[4]",
+            "args": method_args,
+        }))
+
+    def does_box_game_record_exist(
+        self,
+        args: tuple[int] | DoesBoxGameRecordExistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "does_box_game_record_exist(uint64)bool",
+            "args": method_args,
+        }))
+
+    def read_game_record_state(
+        self,
+        args: tuple[int] | ReadGameRecordStateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "read_game_record_state(uint64)(bool,uint8,uint8,uint16,uint64,uint64,address,uint256,uint8,uint8,bool,uint64)",
+            "args": method_args,
+        }))
+
+    def read_game_record_character(
         self,
-        args: tuple[str | bytes] | DoesBoxGameCharacterExistArgs,
+        args: tuple[int, int] | ReadGameRecordCharacterArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "does_box_game_character_exist(account)bool",
+            "method": "read_game_record_character(uint64,uint8)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)",
             "args": method_args,
         }))
 
@@ -345,6 +621,19 @@ class SalvoParams:
             "args": method_args,
         }))
 
+    def read_open_lobbies(
+        self,
+        args: tuple[int, int, int, int] | ReadOpenLobbiesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "read_open_lobbies(uint8,uint8,uint64,uint64)uint64[]",
+            "args": method_args,
+        }))
+
     def get_box_user_registry(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | GetBoxUserRegistryArgs,
@@ -360,27 +649,131 @@ class SalvoParams:
 
     def new_game(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int] | NewGameArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int, int] | NewGameArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "new_game(pay,pay,pay,pay,pay,uint8,uint8)bool",
+            "args": method_args,
+        }))
+
+    def new_game_record(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int, int] | NewGameRecordArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "new_game_record(pay,pay,uint8,uint8)bool",
+            "args": method_args,
+        }))
+
+    def create_open_lobby_index(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | CreateOpenLobbyIndexArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_open_lobby_index(pay,uint8,uint8)void",
+            "args": method_args,
+        }))
+
+    def close_staking(
+        self,
+        args: tuple[int] | CloseStakingArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "new_game(pay,pay,pay,pay,pay,uint8)void",
+            "method": "close_staking(uint64)void",
             "args": method_args,
         }))
 
     def commit_turn(
         self,
-        args: tuple[int, int] | CommitTurnArgs,
+        args: tuple[int, int, int] | CommitTurnArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "commit_turn(uint64,uint8,uint256)void",
+            "args": method_args,
+        }))
+
+    def commit_turns(
+        self,
+        args: tuple[int, list[tuple[int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]] | CommitTurnsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "commit_turns(uint64,(uint8,uint256,byte[64])[])void",
+            "args": method_args,
+        }))
+
+    def commit_turn_record(
+        self,
+        args: tuple[int, int, int] | CommitTurnRecordArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "commit_turn_record(uint64,uint8,uint256)void",
+            "args": method_args,
+        }))
+
+    def reveal_turn(
+        self,
+        args: tuple[int, int, list[tuple[int, int]], int, int, int] | RevealTurnArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reveal_turn(uint64,uint8,(uint8,uint8)[],uint8,uint8,uint64)void",
+            "args": method_args,
+        }))
+
+    def resolve_round(
+        self,
+        args: tuple[int, list[tuple[int, int, int, int, int, int, int]]] | ResolveRoundArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "resolve_round(uint64,uint256[7][])uint8[4]",
+            "args": method_args,
+        }))
+
+    def mimc_absorb(
+        self,
+        args: tuple[bytes | str, bool] | MimcAbsorbArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "commit_turn(uint64,uint256)void",
+            "method": "mimc_absorb(byte[],bool)byte[]",
             "args": method_args,
         }))
 
@@ -532,97 +925,266 @@ class SalvoCreateTransactionParams:
             "args": method_args,
         }))
 
-    def does_box_game_character_exist(
+    def does_box_game_characters_exist(
         self,
-        args: tuple[str | bytes] | DoesBoxGameCharacterExistArgs,
+        args: tuple[int] | DoesBoxGameCharactersExistArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "does_box_game_character_exist(account)bool",
+            "method": "does_box_game_characters_exist(uint64)bool",
             "args": method_args,
         }))
 
-    def read_box_game_lobby(
+    def read_box_game_characters(
         self,
-        args: tuple[int] | ReadBoxGameLobbyArgs,
+        args: tuple[int] | ReadBoxGameCharactersArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "read_box_game_lobby(uint64)address[]",
+            "method": "read_box_game_characters(uint64)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)[4]",
             "args": method_args,
         }))
 
-    def get_box_user_registry(
+    def does_box_game_record_exist(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | GetBoxUserRegistryArgs,
+        args: tuple[int] | DoesBoxGameRecordExistArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_box_user_registry(pay)void",
+            "method": "does_box_game_record_exist(uint64)bool",
             "args": method_args,
         }))
 
-    def new_game(
+    def read_game_record_state(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int] | NewGameArgs,
+        args: tuple[int] | ReadGameRecordStateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "new_game(pay,pay,pay,pay,pay,uint8)void",
+            "method": "read_game_record_state(uint64)(bool,uint8,uint8,uint16,uint64,uint64,address,uint256,uint8,uint8,bool,uint64)",
             "args": method_args,
         }))
 
-    def commit_turn(
+    def read_game_record_character(
         self,
-        args: tuple[int, int] | CommitTurnArgs,
+        args: tuple[int, int] | ReadGameRecordCharacterArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "commit_turn(uint64,uint256)void",
+            "method": "read_game_record_character(uint64,uint8)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)",
             "args": method_args,
         }))
 
-    def mimc_tester(
+    def read_box_game_lobby(
         self,
+        args: tuple[int] | ReadBoxGameLobbyArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "mimc_tester()byte[]",
+            "method": "read_box_game_lobby(uint64)address[]",
+            "args": method_args,
         }))
 
-    def generate(
+    def read_open_lobbies(
         self,
+        args: tuple[int, int, int, int] | ReadOpenLobbiesArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "generate()void",
+            "method": "read_open_lobbies(uint8,uint8,uint64,uint64)uint64[]",
+            "args": method_args,
         }))
 
-    def clear_state(
+    def get_box_user_registry(
         self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | GetBoxUserRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_box_user_registry(pay)void",
+            "args": method_args,
+        }))
+
+    def new_game(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int, int] | NewGameArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "new_game(pay,pay,pay,pay,pay,uint8,uint8)bool",
+            "args": method_args,
+        }))
+
+    def new_game_record(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int, int] | NewGameRecordArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "new_game_record(pay,pay,uint8,uint8)bool",
+            "args": method_args,
+        }))
+
+    def create_open_lobby_index(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | CreateOpenLobbyIndexArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_open_lobby_index(pay,uint8,uint8)void",
+            "args": method_args,
+        }))
+
+    def close_staking(
+        self,
+        args: tuple[int] | CloseStakingArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_staking(uint64)void",
+            "args": method_args,
+        }))
+
+    def commit_turn(
+        self,
+        args: tuple[int, int, int] | CommitTurnArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "commit_turn(uint64,uint8,uint256)void",
+            "args": method_args,
+        }))
+
+    def commit_turns(
+        self,
+        args: tuple[int, list[tuple[int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]] | CommitTurnsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "commit_turns(uint64,(uint8,uint256,byte[64])[])void",
+            "args": method_args,
+        }))
+
+    def commit_turn_record(
+        self,
+        args: tuple[int, int, int] | CommitTurnRecordArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "commit_turn_record(uint64,uint8,uint256)void",
+            "args": method_args,
+        }))
+
+    def reveal_turn(
+        self,
+        args: tuple[int, int, list[tuple[int, int]], int, int, int] | RevealTurnArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reveal_turn(uint64,uint8,(uint8,uint8)[],uint8,uint8,uint64)void",
+            "args": method_args,
+        }))
+
+    def resolve_round(
+        self,
+        args: tuple[int, list[tuple[int, int, int, int, int, int, int]]] | ResolveRoundArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "resolve_round(uint64,uint256[7][])uint8[4]",
+            "args": method_args,
+        }))
+
+    def mimc_absorb(
+        self,
+        args: tuple[bytes | str, bool] | MimcAbsorbArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mimc_absorb(byte[],bool)byte[]",
+            "args": method_args,
+        }))
+
+    def mimc_tester(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mimc_tester()byte[]",
+        }))
+
+    def generate(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "generate()void",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
     ) -> Transaction:
         return self.app_client.create_transaction.bare.clear_state(
             params,
@@ -769,9 +1331,9 @@ class SalvoSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
 
-    def does_box_game_character_exist(
+    def does_box_game_characters_exist(
         self,
-        args: tuple[str | bytes] | DoesBoxGameCharacterExistArgs,
+        args: tuple[int] | DoesBoxGameCharactersExistArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[bool]:
@@ -779,12 +1341,76 @@ class SalvoSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "does_box_game_character_exist(account)bool",
+            "method": "does_box_game_characters_exist(uint64)bool",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
 
+    def read_box_game_characters(
+        self,
+        args: tuple[int] | ReadBoxGameCharactersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "read_box_game_characters(uint64)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)[4]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int]]], parsed_response)
+
+    def does_box_game_record_exist(
+        self,
+        args: tuple[int] | DoesBoxGameRecordExistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "does_box_game_record_exist(uint64)bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def read_game_record_state(
+        self,
+        args: tuple[int] | ReadGameRecordStateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[GameState]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "read_game_record_state(uint64)(bool,uint8,uint8,uint16,uint64,uint64,address,uint256,uint8,uint8,bool,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(GameState, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[GameState], parsed_response)
+
+    def read_game_record_character(
+        self,
+        args: tuple[int, int] | ReadGameRecordCharacterArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[GameCharacter]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "read_game_record_character(uint64,uint8)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(GameCharacter, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[GameCharacter], parsed_response)
+
     def read_box_game_lobby(
         self,
         args: tuple[int] | ReadBoxGameLobbyArgs,
@@ -801,6 +1427,22 @@ class SalvoSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[list[str]], parsed_response)
 
+    def read_open_lobbies(
+        self,
+        args: tuple[int, int, int, int] | ReadOpenLobbiesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "read_open_lobbies(uint8,uint8,uint64,uint64)uint64[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
     def get_box_user_registry(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | GetBoxUserRegistryArgs,
@@ -819,7 +1461,55 @@ class SalvoSend:
 
     def new_game(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int] | NewGameArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int, int] | NewGameArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "new_game(pay,pay,pay,pay,pay,uint8,uint8)bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def new_game_record(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int, int] | NewGameRecordArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "new_game_record(pay,pay,uint8,uint8)bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def create_open_lobby_index(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | CreateOpenLobbyIndexArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_open_lobby_index(pay,uint8,uint8)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def close_staking(
+        self,
+        args: tuple[int] | CloseStakingArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
@@ -827,7 +1517,7 @@ class SalvoSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "new_game(pay,pay,pay,pay,pay,uint8)void",
+            "method": "close_staking(uint64)void",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -835,7 +1525,39 @@ class SalvoSend:
 
     def commit_turn(
         self,
-        args: tuple[int, int] | CommitTurnArgs,
+        args: tuple[int, int, int] | CommitTurnArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "commit_turn(uint64,uint8,uint256)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def commit_turns(
+        self,
+        args: tuple[int, list[tuple[int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]] | CommitTurnsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "commit_turns(uint64,(uint8,uint256,byte[64])[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def commit_turn_record(
+        self,
+        args: tuple[int, int, int] | CommitTurnRecordArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
@@ -843,12 +1565,60 @@ class SalvoSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "commit_turn(uint64,uint256)void",
+            "method": "commit_turn_record(uint64,uint8,uint256)void",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def reveal_turn(
+        self,
+        args: tuple[int, int, list[tuple[int, int]], int, int, int] | RevealTurnArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reveal_turn(uint64,uint8,(uint8,uint8)[],uint8,uint8,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def resolve_round(
+        self,
+        args: tuple[int, list[tuple[int, int, int, int, int, int, int]]] | ResolveRoundArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[int, int, int, int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "resolve_round(uint64,uint256[7][])uint8[4]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, int, int, int]], parsed_response)
+
+    def mimc_absorb(
+        self,
+        args: tuple[bytes | str, bool] | MimcAbsorbArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bytes]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mimc_absorb(byte[],bool)byte[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bytes], parsed_response)
+
     def mimc_tester(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -950,8 +1720,7 @@ class _BoxState:
         # Pre-generated mapping of value types to their struct classes
         self._struct_classes: dict[str, typing.Type[typing.Any]] = {
             "UserRegistry": UserRegistry,
-            "GameState": GameState,
-            "GameCharacter": GameCharacter
+            "GameState": GameState
         }
 
     def get_all(self) -> dict[str, typing.Any]:
@@ -980,7 +1749,7 @@ class _BoxState:
         )
 
     @property
-    def box_game_grid(self) -> "_MapState[int, tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]":
+    def box_game_grid(self) -> "_MapState[int, bytes]":
         """Get values from the box_game_grid map in box state"""
         return _MapState(
             self.app_client.state.box,
@@ -1007,12 +1776,30 @@ class _BoxState:
         )
 
     @property
-    def box_game_character(self) -> "_MapState[str, GameCharacter]":
-        """Get values from the box_game_character map in box state"""
+    def box_game_characters(self) -> "_MapState[int, tuple[tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int]]]":
+        """Get values from the box_game_characters map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "box_game_characters",
+            None
+        )
+
+    @property
+    def box_game_record(self) -> "_MapState[int, bytes]":
+        """Get values from the box_game_record map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "box_game_record",
+            None
+        )
+
+    @property
+    def box_open_lobbies(self) -> "_MapState[int, bytes]":
+        """Get values from the box_open_lobbies map in box state"""
         return _MapState(
             self.app_client.state.box,
-            "box_game_character",
-            self._struct_classes.get("GameCharacter")
+            "box_open_lobbies",
+            None
         )
 
 _KeyType = typing.TypeVar("_KeyType")
@@ -1087,7 +1874,7 @@ class SalvoClient:
             self.app_client = algokit_utils.AppClient(
                 algokit_utils.AppClientParams(
                     algorand=algorand,
-                    app_spec=APP_SPEC,
+                    app_spec=_get_app_spec(),
                     app_id=app_id,
                     app_name=app_name,
                     default_sender=default_sender,
@@ -1120,7 +1907,7 @@ class SalvoClient:
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
                 app_name=app_name,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -1142,7 +1929,7 @@ class SalvoClient:
     ) -> "SalvoClient":
         return SalvoClient(
             algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 app_name=app_name,
                 default_sender=default_sender,
@@ -1208,64 +1995,142 @@ class SalvoClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["read_grid_cell_value_by_index(uint64,uint8)uint8"],
+        method: typing.Literal["read_grid_cell_value_by_index(uint64,uint8)uint8"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["read_grid_cell_value_at_coords(uint64,uint8,uint8)uint8"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["does_box_user_registry_exist(account)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["does_box_game_grid_exist(uint64)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["does_box_game_state_exist(uint64)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["does_box_game_characters_exist(uint64)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["read_box_game_characters(uint64)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)[4]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["does_box_game_record_exist(uint64)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["read_game_record_state(uint64)(bool,uint8,uint8,uint16,uint64,uint64,address,uint256,uint8,uint8,bool,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> GameState | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["read_game_record_character(uint64,uint8)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> GameCharacter | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["read_box_game_lobby(uint64)address[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[str] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["read_open_lobbies(uint8,uint8,uint64,uint64)uint64[]"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> int | None: ...
+    ) -> list[int] | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["read_grid_cell_value_at_coords(uint64,uint8,uint8)uint8"],
+        method: typing.Literal["get_box_user_registry(pay)void"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> int | None: ...
+    ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["does_box_user_registry_exist(account)bool"],
+        method: typing.Literal["new_game(pay,pay,pay,pay,pay,uint8,uint8)bool"],
         return_value: algokit_utils.ABIReturn | None
     ) -> bool | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["does_box_game_grid_exist(uint64)bool"],
+        method: typing.Literal["new_game_record(pay,pay,uint8,uint8)bool"],
         return_value: algokit_utils.ABIReturn | None
     ) -> bool | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["does_box_game_state_exist(uint64)bool"],
+        method: typing.Literal["create_open_lobby_index(pay,uint8,uint8)void"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> bool | None: ...
+    ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["does_box_game_character_exist(account)bool"],
+        method: typing.Literal["close_staking(uint64)void"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> bool | None: ...
+    ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["read_box_game_lobby(uint64)address[]"],
+        method: typing.Literal["commit_turn(uint64,uint8,uint256)void"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> list[str] | None: ...
+    ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_box_user_registry(pay)void"],
+        method: typing.Literal["commit_turns(uint64,(uint8,uint256,byte[64])[])void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["new_game(pay,pay,pay,pay,pay,uint8)void"],
+        method: typing.Literal["commit_turn_record(uint64,uint8,uint256)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["commit_turn(uint64,uint256)void"],
+        method: typing.Literal["reveal_turn(uint64,uint8,(uint8,uint8)[],uint8,uint8,uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["resolve_round(uint64,uint256[7][])uint8[4]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[int, int, int, int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["mimc_absorb(byte[],bool)byte[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bytes | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["mimc_tester()byte[]"],
@@ -1294,7 +2159,7 @@ class SalvoClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | bool | bytes | int | list[str]:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | GameCharacter | GameState | None | bool | bytes | int | list[int] | list[str] | tuple[int, int, int, int] | tuple[tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int], tuple[bool, bool, int, int, int, int, int, int, int, int]]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -1371,7 +2236,7 @@ class SalvoFactory(algokit_utils.TypedAppFactoryProtocol[SalvoMethodCallCreatePa
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -1495,243 +2360,503 @@ class SalvoFactoryCreateParams:
     ) -> algokit_utils.AppCreateParams:
         """Creates an instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
-            compilation_params=compilation_params)
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def calc_single_box_cost(
+        self,
+        args: tuple[int, int] | CalcSingleBoxCostArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the calc_single_box_cost(uint8,uint16)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "calc_single_box_cost(uint8,uint16)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def read_gen_unix(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the read_gen_unix()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "read_gen_unix()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def read_grid_cell_value_by_index(
+        self,
+        args: tuple[int, int] | ReadGridCellValueByIndexArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the read_grid_cell_value_by_index(uint64,uint8)uint8 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "read_grid_cell_value_by_index(uint64,uint8)uint8",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def read_grid_cell_value_at_coords(
+        self,
+        args: tuple[int, int, int] | ReadGridCellValueAtCoordsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the read_grid_cell_value_at_coords(uint64,uint8,uint8)uint8 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "read_grid_cell_value_at_coords(uint64,uint8,uint8)uint8",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def does_box_user_registry_exist(
+        self,
+        args: tuple[str | bytes] | DoesBoxUserRegistryExistArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the does_box_user_registry_exist(account)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "does_box_user_registry_exist(account)bool",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def does_box_game_grid_exist(
+        self,
+        args: tuple[int] | DoesBoxGameGridExistArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the does_box_game_grid_exist(uint64)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "does_box_game_grid_exist(uint64)bool",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def does_box_game_state_exist(
+        self,
+        args: tuple[int] | DoesBoxGameStateExistArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the does_box_game_state_exist(uint64)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "does_box_game_state_exist(uint64)bool",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def does_box_game_characters_exist(
+        self,
+        args: tuple[int] | DoesBoxGameCharactersExistArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the does_box_game_characters_exist(uint64)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "does_box_game_characters_exist(uint64)bool",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def read_box_game_characters(
+        self,
+        args: tuple[int] | ReadBoxGameCharactersArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the read_box_game_characters(uint64)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)[4] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "read_box_game_characters(uint64)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)[4]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def does_box_game_record_exist(
+        self,
+        args: tuple[int] | DoesBoxGameRecordExistArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the does_box_game_record_exist(uint64)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "does_box_game_record_exist(uint64)bool",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def read_game_record_state(
+        self,
+        args: tuple[int] | ReadGameRecordStateArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the read_game_record_state(uint64)(bool,uint8,uint8,uint16,uint64,uint64,address,uint256,uint8,uint8,bool,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "read_game_record_state(uint64)(bool,uint8,uint8,uint16,uint64,uint64,address,uint256,uint8,uint8,bool,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def read_game_record_character(
+        self,
+        args: tuple[int, int] | ReadGameRecordCharacterArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the read_game_record_character(uint64,uint8)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "read_game_record_character(uint64,uint8)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def read_box_game_lobby(
+        self,
+        args: tuple[int] | ReadBoxGameLobbyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the read_box_game_lobby(uint64)address[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "read_box_game_lobby(uint64)address[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-    def calc_single_box_cost(
+    def read_open_lobbies(
         self,
-        args: tuple[int, int] | CalcSingleBoxCostArgs,
+        args: tuple[int, int, int, int] | ReadOpenLobbiesArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the calc_single_box_cost(uint8,uint16)uint64 ABI method"""
+        """Creates a new instance using the read_open_lobbies(uint8,uint8,uint64,uint64)uint64[] ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "calc_single_box_cost(uint8,uint16)uint64",
+                "method": "read_open_lobbies(uint8,uint8,uint64,uint64)uint64[]",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def read_gen_unix(
+    def get_box_user_registry(
         self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | GetBoxUserRegistryArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the read_gen_unix()uint64 ABI method"""
+        """Creates a new instance using the get_box_user_registry(pay)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "read_gen_unix()uint64",
-                "args": None,
+                "method": "get_box_user_registry(pay)void",
+                "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def read_grid_cell_value_by_index(
+    def new_game(
         self,
-        args: tuple[int, int] | ReadGridCellValueByIndexArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int, int] | NewGameArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the read_grid_cell_value_by_index(uint64,uint8)uint8 ABI method"""
+        """Creates a new instance using the new_game(pay,pay,pay,pay,pay,uint8,uint8)bool ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "read_grid_cell_value_by_index(uint64,uint8)uint8",
+                "method": "new_game(pay,pay,pay,pay,pay,uint8,uint8)bool",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def read_grid_cell_value_at_coords(
+    def new_game_record(
         self,
-        args: tuple[int, int, int] | ReadGridCellValueAtCoordsArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int, int] | NewGameRecordArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the read_grid_cell_value_at_coords(uint64,uint8,uint8)uint8 ABI method"""
+        """Creates a new instance using the new_game_record(pay,pay,uint8,uint8)bool ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "read_grid_cell_value_at_coords(uint64,uint8,uint8)uint8",
+                "method": "new_game_record(pay,pay,uint8,uint8)bool",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def does_box_user_registry_exist(
+    def create_open_lobby_index(
         self,
-        args: tuple[str | bytes] | DoesBoxUserRegistryExistArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | CreateOpenLobbyIndexArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the does_box_user_registry_exist(account)bool ABI method"""
+        """Creates a new instance using the create_open_lobby_index(pay,uint8,uint8)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "does_box_user_registry_exist(account)bool",
+                "method": "create_open_lobby_index(pay,uint8,uint8)void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def does_box_game_grid_exist(
+    def close_staking(
         self,
-        args: tuple[int] | DoesBoxGameGridExistArgs,
+        args: tuple[int] | CloseStakingArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the does_box_game_grid_exist(uint64)bool ABI method"""
+        """Creates a new instance using the close_staking(uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "does_box_game_grid_exist(uint64)bool",
+                "method": "close_staking(uint64)void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def does_box_game_state_exist(
+    def commit_turn(
         self,
-        args: tuple[int] | DoesBoxGameStateExistArgs,
+        args: tuple[int, int, int] | CommitTurnArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the does_box_game_state_exist(uint64)bool ABI method"""
+        """Creates a new instance using the commit_turn(uint64,uint8,uint256)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "does_box_game_state_exist(uint64)bool",
+                "method": "commit_turn(uint64,uint8,uint256)void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def does_box_game_character_exist(
+    def commit_turns(
         self,
-        args: tuple[str | bytes] | DoesBoxGameCharacterExistArgs,
+        args: tuple[int, list[tuple[int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]] | CommitTurnsArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the does_box_game_character_exist(account)bool ABI method"""
+        """Creates a new instance using the commit_turns(uint64,(uint8,uint256,byte[64])[])void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "does_box_game_character_exist(account)bool",
+                "method": "commit_turns(uint64,(uint8,uint256,byte[64])[])void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def read_box_game_lobby(
+    def commit_turn_record(
         self,
-        args: tuple[int] | ReadBoxGameLobbyArgs,
+        args: tuple[int, int, int] | CommitTurnRecordArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the read_box_game_lobby(uint64)address[] ABI method"""
+        """Creates a new instance using the commit_turn_record(uint64,uint8,uint256)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "read_box_game_lobby(uint64)address[]",
+                "method": "commit_turn_record(uint64,uint8,uint256)void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_box_user_registry(
+    def reveal_turn(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | GetBoxUserRegistryArgs,
+        args: tuple[int, int, list[tuple[int, int]], int, int, int] | RevealTurnArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_box_user_registry(pay)void ABI method"""
+        """Creates a new instance using the reveal_turn(uint64,uint8,(uint8,uint8)[],uint8,uint8,uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_box_user_registry(pay)void",
+                "method": "reveal_turn(uint64,uint8,(uint8,uint8)[],uint8,uint8,uint64)void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def new_game(
+    def resolve_round(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int] | NewGameArgs,
+        args: tuple[int, list[tuple[int, int, int, int, int, int, int]]] | ResolveRoundArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the new_game(pay,pay,pay,pay,pay,uint8)void ABI method"""
+        """Creates a new instance using the resolve_round(uint64,uint256[7][])uint8[4] ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "new_game(pay,pay,pay,pay,pay,uint8)void",
+                "method": "resolve_round(uint64,uint256[7][])uint8[4]",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def commit_turn(
+    def mimc_absorb(
         self,
-        args: tuple[int, int] | CommitTurnArgs,
+        args: tuple[bytes | str, bool] | MimcAbsorbArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the commit_turn(uint64,uint256)void ABI method"""
+        """Creates a new instance using the mimc_absorb(byte[],bool)byte[] ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "commit_turn(uint64,uint256)void",
+                "method": "mimc_absorb(byte[],bool)byte[]",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -2092,21 +3217,97 @@ class SalvoComposer:
         )
         return self
 
-    def does_box_game_character_exist(
+    def does_box_game_characters_exist(
+        self,
+        args: tuple[int] | DoesBoxGameCharactersExistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "SalvoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.does_box_game_characters_exist(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "does_box_game_characters_exist(uint64)bool", v
+            )
+        )
+        return self
+
+    def read_box_game_characters(
+        self,
+        args: tuple[int] | ReadBoxGameCharactersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "SalvoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.read_box_game_characters(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "read_box_game_characters(uint64)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)[4]", v
+            )
+        )
+        return self
+
+    def does_box_game_record_exist(
+        self,
+        args: tuple[int] | DoesBoxGameRecordExistArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "SalvoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.does_box_game_record_exist(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "does_box_game_record_exist(uint64)bool", v
+            )
+        )
+        return self
+
+    def read_game_record_state(
+        self,
+        args: tuple[int] | ReadGameRecordStateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "SalvoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.read_game_record_state(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "read_game_record_state(uint64)(bool,uint8,uint8,uint16,uint64,uint64,address,uint256,uint8,uint8,bool,uint64)", v
+            )
+        )
+        return self
+
+    def read_game_record_character(
         self,
-        args: tuple[str | bytes] | DoesBoxGameCharacterExistArgs,
+        args: tuple[int, int] | ReadGameRecordCharacterArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "SalvoComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.does_box_game_character_exist(
+            self.client.params.read_game_record_character(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "does_box_game_character_exist(account)bool", v
+                "read_game_record_character(uint64,uint8)(bool,bool,uint8,uint8,uint8,uint8,uint8,uint8,uint8,uint256)", v
             )
         )
         return self
@@ -2130,6 +3331,25 @@ class SalvoComposer:
         )
         return self
 
+    def read_open_lobbies(
+        self,
+        args: tuple[int, int, int, int] | ReadOpenLobbiesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "SalvoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.read_open_lobbies(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "read_open_lobbies(uint8,uint8,uint64,uint64)uint64[]", v
+            )
+        )
+        return self
+
     def get_box_user_registry(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | GetBoxUserRegistryArgs,
@@ -2151,7 +3371,7 @@ class SalvoComposer:
 
     def new_game(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int] | NewGameArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int, int] | NewGameArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "SalvoComposer":
@@ -2163,14 +3383,71 @@ class SalvoComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "new_game(pay,pay,pay,pay,pay,uint8)void", v
+                "new_game(pay,pay,pay,pay,pay,uint8,uint8)bool", v
+            )
+        )
+        return self
+
+    def new_game_record(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int, int] | NewGameRecordArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "SalvoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.new_game_record(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "new_game_record(pay,pay,uint8,uint8)bool", v
+            )
+        )
+        return self
+
+    def create_open_lobby_index(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | CreateOpenLobbyIndexArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "SalvoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_open_lobby_index(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_open_lobby_index(pay,uint8,uint8)void", v
+            )
+        )
+        return self
+
+    def close_staking(
+        self,
+        args: tuple[int] | CloseStakingArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "SalvoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.close_staking(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "close_staking(uint64)void", v
             )
         )
         return self
 
     def commit_turn(
         self,
-        args: tuple[int, int] | CommitTurnArgs,
+        args: tuple[int, int, int] | CommitTurnArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "SalvoComposer":
@@ -2182,7 +3459,102 @@ class SalvoComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "commit_turn(uint64,uint256)void", v
+                "commit_turn(uint64,uint8,uint256)void", v
+            )
+        )
+        return self
+
+    def commit_turns(
+        self,
+        args: tuple[int, list[tuple[int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]] | CommitTurnsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "SalvoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.commit_turns(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "commit_turns(uint64,(uint8,uint256,byte[64])[])void", v
+            )
+        )
+        return self
+
+    def commit_turn_record(
+        self,
+        args: tuple[int, int, int] | CommitTurnRecordArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "SalvoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.commit_turn_record(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "commit_turn_record(uint64,uint8,uint256)void", v
+            )
+        )
+        return self
+
+    def reveal_turn(
+        self,
+        args: tuple[int, int, list[tuple[int, int]], int, int, int] | RevealTurnArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "SalvoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.reveal_turn(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "reveal_turn(uint64,uint8,(uint8,uint8)[],uint8,uint8,uint64)void", v
+            )
+        )
+        return self
+
+    def resolve_round(
+        self,
+        args: tuple[int, list[tuple[int, int, int, int, int, int, int]]] | ResolveRoundArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "SalvoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.resolve_round(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "resolve_round(uint64,uint256[7][])uint8[4]", v
+            )
+        )
+        return self
+
+    def mimc_absorb(
+        self,
+        args: tuple[bytes | str, bool] | MimcAbsorbArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "SalvoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.mimc_absorb(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "mimc_absorb(byte[],bool)byte[]", v
             )
         )
         return self
@@ -0,0 +1,186 @@
+import logging
+import re
+import sys
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Marker left in post-processed clients, so running the step twice is a no-op
+FAST_ABI_MARKER = "# post-processed: fast-path ABI helpers"
+
+# Generated `_parse_abi_args` + `_init_dataclass` block, up to the first struct dataclass
+GENERATED_HELPERS_RE = re.compile(
+    r"^def _parse_abi_args\(.*?^    return cls\(\*\*field_values\)\n",
+    re.MULTILINE | re.DOTALL,
+)
+
+# Drop-in replacements for the generated helpers. Instead of walking `dataclasses.fields` on every call,
+# each value type gets a converter built on first use and cached, so repeat calls only do dict lookups.
+FAST_ABI_HELPERS = f'''{FAST_ABI_MARKER}
+import operator
+
+_ABI_CONVERTERS: dict[type, typing.Callable[[object], object]] = {{}}
+_ARGS_GETTERS: dict[type, typing.Callable[[object], tuple]] = {{}}
+_IS_TXN_ARG: dict[type, bool] = {{}}
+_DATACLASS_INITS: dict[type, list[tuple[str, type | None]]] = {{}}
+_ABI_SCALAR_TYPES = (int, bool, str, bytes, bytearray, type(None))
+
+
+def _fields_getter(cls: type) -> typing.Callable[[object], tuple]:
+    """Build a getter returning the dataclass field values of `cls` as a tuple, in field order"""
+    names = [field.name for field in dataclasses.fields(cls)]
+    if len(names) == 1:
+        name = names[0]
+        return lambda value: (getattr(value, name),)
+    if not names:
+        return lambda value: ()
+    return operator.attrgetter(*names)
+
+
+def _abi_converter(cls: type) -> typing.Callable[[object], object]:
+    """Get the cached converter of a value type into the format expected by underlying client"""
+    converter = _ABI_CONVERTERS.get(cls)
+    if converter is not None:
+        return converter
+
+    if issubclass(cls, _ABI_SCALAR_TYPES):
+        def converter(value: object) -> object:
+            return value
+    elif dataclasses.is_dataclass(cls):
+        getter = _fields_getter(cls)
+
+        def converter(value: object) -> object:
+            return tuple([_convert_abi_value(item) for item in getter(value)])
+    elif issubclass(cls, (list, tuple)):
+        def converter(value: object) -> object:
+            # Arrays of scalars (e.g. uint256[]) are passed through w/o converting item by item
+            if all(type(item) in _ABI_SCALAR_TYPES for item in value):
+                return cls(value)
+            return cls(_convert_abi_value(item) for item in value)
+    else:
+        def converter(value: object) -> object:
+            return value
+
+    _ABI_CONVERTERS[cls] = converter
+    return converter
+
+
+def _convert_abi_value(value: object) -> object:
+    """Convert a single ABI arg value, recursing into dataclasses, lists and tuples"""
+    return _abi_converter(type(value))(value)
+
+
+def _is_txn_arg(value: object) -> bool:
+    """Check (w/ a per-type cache) if a value is a transaction argument the client handles itself"""
+    cls = type(value)
+    is_txn_arg = _IS_TXN_ARG.get(cls)
+    if is_txn_arg is None:
+        is_txn_arg = _IS_TXN_ARG[cls] = isinstance(value, algokit_utils.AppMethodCallTransactionArgument)
+    return is_txn_arg
+
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    if isinstance(args, tuple):
+        method_args = list(args)
+    else:
+        getter = _ARGS_GETTERS.get(type(args))
+        if getter is None:
+            if not dataclasses.is_dataclass(args):
+                raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+            getter = _ARGS_GETTERS[type(args)] = _fields_getter(type(args))
+        method_args = list(getter(args))
+
+    return [
+        _convert_abi_value(arg) if not _is_txn_arg(arg) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    The (field name, nested dataclass type) plan of each `cls` is built once and cached.
+    """
+    plan = _DATACLASS_INITS.get(cls)
+    if plan is None:
+        plan = _DATACLASS_INITS[cls] = [
+            (field.name, typing.cast(type, field.type) if dataclasses.is_dataclass(field.type) else None)
+            for field in dataclasses.fields(cls)
+        ]
+
+    field_values = {{}}
+    for name, nested in plan:
+        field_value = data.get(name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if nested is not None and isinstance(field_value, dict):
+            field_values[name] = _init_dataclass(nested, field_value)
+        else:
+            field_values[name] = field_value
+    return cls(**field_values)
+'''
+
+
+# Marker left in post-processed clients, so running the step twice is a no-op
+LAZY_APP_SPEC_MARKER = "# post-processed: lazy APP_SPEC"
+
+# Generated eager app spec parse, run at module import
+GENERATED_APP_SPEC = (
+    "APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)\n"
+)
+
+# Lazy replacement: the spec is parsed on first use, `from <client> import APP_SPEC` keeps working
+LAZY_APP_SPEC = f'''{LAZY_APP_SPEC_MARKER}
+import functools
+
+
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    """Parse the embedded ARC-56 app spec once, on first use"""
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+
+def __getattr__(name: str) -> object:
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+'''
+
+
+# Replace the generated ABI helpers of a client source w/ the fast-path ones
+def patch_fast_abi_helpers(source: str) -> str:
+    if FAST_ABI_MARKER in source:
+        return source
+    source, count = GENERATED_HELPERS_RE.subn(
+        lambda _: FAST_ABI_HELPERS, source, count=1
+    )
+    if count != 1:
+        raise ValueError("Generated `_parse_abi_args`/`_init_dataclass` not found")
+    return source
+
+
+# Defer the app spec parse of a client source until `APP_SPEC` is first used
+def patch_lazy_app_spec(source: str) -> str:
+    if LAZY_APP_SPEC_MARKER in source:
+        return source
+    if GENERATED_APP_SPEC not in source:
+        raise ValueError("Generated `APP_SPEC` assignment not found")
+    source = source.replace(GENERATED_APP_SPEC, LAZY_APP_SPEC, 1)
+    return source.replace("app_spec=APP_SPEC,", "app_spec=_get_app_spec(),")
+
+
+# Post-process a generated client file in place
+def postprocess_client(client_path: Path) -> None:
+    source = client_path.read_text()
+    patched = patch_lazy_app_spec(patch_fast_abi_helpers(source))
+    if patched != source:
+        logger.info(f"Post-processing generated client {client_path}")
+        client_path.write_text(patched)
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:]:
+        postprocess_client(Path(arg))
@@ -3,6 +3,67 @@
 # DOMAIN
 DOMAIN_PREFIX = 0x53616C766F
 
+# MIMC
+# Chunked MiMC: each `mimc_absorb` call hashes the previous chunk digest followed by its own chunk
+MIMC_FR_SIZE = 32  # Field element size of `op.mimc` input, in bytes
+MIMC_BASE_COST = 10  # `op.mimc` BLS12_381Mp111 cost: 10 + 550 per element
+MIMC_ELEMENT_COST = 550
+MIMC_CHUNK_MAX_ELEMENTS = 8  # So 121 grid cells fit in one 16 txn group
+MIMC_ABSORB_BASE_BUDGET = 200  # `mimc_absorb` budget besides the hash itself
+MIMC_CHAIN_SLOT = 0  # Scratch slot of the chunk digest the next group txn chains onto
+MIMC_ABSORB_SIGNATURE = "mimc_absorb(byte[],bool)byte[]"
+
+# GRID MERKLE
+# MiMC Merkle tree over the 121 grid cells (as 32-byte field elements), padded w/ zero leaves to 128
+# Each node is `op.mimc(left | right)`; a cell update rehashes only its GRID_MERKLE_DEPTH path nodes
+GRID_MERKLE_DEPTH = 7
+GRID_MERKLE_LEAVES = 128
+GRID_ROOT_UPDATE_BUDGET = 16_000  # 2 paths * 7 nodes * (10 + 550 * 2), plus overhead
+# Root of an all path cells grid, i.e. of a new game grid
+EMPTY_GRID_ROOT = (
+    b"\x28\x86\xce\xcd\x3b\x28\xaf\x93\x22\xfb\xa1\x04\xf7\x87\x0e\xd1"
+    b"\xf3\x0b\x51\x1e\xec\x7d\xf1\x4a\xaa\x1a\x47\x07\xaf\x45\xb5\x4b"
+)
+
+# COMMIT SCHEMES
+# Turn hash scheme of a game, set once at game creation in `GameState.commit_scheme`
+COMMIT_SCHEME_MIMC = 0  # MiMC over 32-byte field elements, provable in the ZK circuit
+COMMIT_SCHEME_SHA256 = (
+    1  # sha256 over the compact turn encoding, for games w/o ZK proofs
+)
+COMMIT_SCHEME_SHA512_256 = 2  # sha512_256 over the compact turn encoding
+TURN_PREIMAGE_FIXED_FIELDS = 5  # MiMC preimage fields besides the moves: domain, game id, action, direction, salt
+REVEAL_TURN_BASE_BUDGET = (
+    1_400  # `reveal_turn` budget besides moves and hash: box reads/writes, checks
+)
+REVEAL_MOVE_COST = (
+    120  # `is_move_sequence_valid` cost per move: range checks and neighbor lookup
+)
+MAX_ACTION = 1
+MAX_DIRECTION = 3
+
+# ROUND RESOLUTION
+# Actions and directions of a revealed turn; directions index the NEIGHBOR_TABLE entries of a cell
+ACTION_NONE = 0
+ACTION_SHOOT = 1  # Hit the first character in the facing direction, unless an obstacle is in the way
+DIRECTION_NORTH = 0
+DIRECTION_SOUTH = 1
+DIRECTION_WEST = 2
+DIRECTION_EAST = 3
+RESOLVE_ROUND_BASE_BUDGET = (
+    3_000  # `resolve_round` budget besides the grid root updates
+)
+
+# SIGNED COMMITS
+# Signed turn commit message:
+# SIGN_BYTES_PREFIX | TURN_COMMIT_DOMAIN | app id | game id | expiry_ts | round_count | turn hash
+# "MX" is the prefix wallets and `algosdk.util.sign_bytes` put in front of arbitrary signed data
+SIGN_BYTES_PREFIX = b"MX"
+TURN_COMMIT_DOMAIN = b"salvo:commit_turn"
+TURN_COMMIT_MSG_PREFIX = SIGN_BYTES_PREFIX + TURN_COMMIT_DOMAIN
+ED25519_VERIFY_COST = 1_900  # Opcode cost of `ed25519verify_bare`
+COMMIT_TURNS_BASE_BUDGET = 700  # `commit_turns` budget besides the signature checks
+
 # ADDRESS
 CREATOR_ADDRESS = "QXZGTA53IL35I3GOOJCBYMZYTD4EMQYRVN6AMEVSEIWZVEHU3NJWR62HIM"
 ADDRESS_SIZE = 32
@@ -11,13 +72,152 @@ ZEROED_ADDR_BYTES = b"\x00" * 32
 # GRID
 GRID_SIZE = 11
 GRID_CELL_TOTAL = 121
-GRID_ZEROED_BYTES = b"\x00" * GRID_CELL_TOTAL
+
+# Grid box cells are bit-packed, 2 bits per cell (4 cells per byte, first cell in the high bits)
+GRID_CELL_PATH = 0
+GRID_CELL_OBSTACLE = 1
+GRID_CELL_OCCUPIED = 2
+GRID_CELL_BITS = 2
+GRID_CELL_MASK = 3  # Largest value a packed cell can hold
+GRID_CELLS_PER_BYTE = 4
+GRID_PACKED_SIZE = 31  # 121 cells * 2 bits, rounded up to whole bytes
+GRID_ZEROED_BYTES = b"\x00" * GRID_PACKED_SIZE
+
+# NEIGHBOR TABLE
+# Grid index of the North, South, West and East neighbor of every cell, 4 bytes per cell (255 = off the grid)
+NEIGHBOR_COUNT = 4
+NEIGHBOR_NONE = 255
+NEIGHBOR_TABLE = (
+    b"\xff\x0b\xff\x01"  # 0: (0, 0)
+    b"\xff\x0c\x00\x02"  # 1: (0, 1)
+    b"\xff\x0d\x01\x03"  # 2: (0, 2)
+    b"\xff\x0e\x02\x04"  # 3: (0, 3)
+    b"\xff\x0f\x03\x05"  # 4: (0, 4)
+    b"\xff\x10\x04\x06"  # 5: (0, 5)
+    b"\xff\x11\x05\x07"  # 6: (0, 6)
+    b"\xff\x12\x06\x08"  # 7: (0, 7)
+    b"\xff\x13\x07\x09"  # 8: (0, 8)
+    b"\xff\x14\x08\x0a"  # 9: (0, 9)
+    b"\xff\x15\x09\xff"  # 10: (0, 10)
+    b"\x00\x16\xff\x0c"  # 11: (1, 0)
+    b"\x01\x17\x0b\x0d"  # 12: (1, 1)
+    b"\x02\x18\x0c\x0e"  # 13: (1, 2)
+    b"\x03\x19\x0d\x0f"  # 14: (1, 3)
+    b"\x04\x1a\x0e\x10"  # 15: (1, 4)
+    b"\x05\x1b\x0f\x11"  # 16: (1, 5)
+    b"\x06\x1c\x10\x12"  # 17: (1, 6)
+    b"\x07\x1d\x11\x13"  # 18: (1, 7)
+    b"\x08\x1e\x12\x14"  # 19: (1, 8)
+    b"\x09\x1f\x13\x15"  # 20: (1, 9)
+    b"\x0a\x20\x14\xff"  # 21: (1, 10)
+    b"\x0b\x21\xff\x17"  # 22: (2, 0)
+    b"\x0c\x22\x16\x18"  # 23: (2, 1)
+    b"\x0d\x23\x17\x19"  # 24: (2, 2)
+    b"\x0e\x24\x18\x1a"  # 25: (2, 3)
+    b"\x0f\x25\x19\x1b"  # 26: (2, 4)
+    b"\x10\x26\x1a\x1c"  # 27: (2, 5)
+    b"\x11\x27\x1b\x1d"  # 28: (2, 6)
+    b"\x12\x28\x1c\x1e"  # 29: (2, 7)
+    b"\x13\x29\x1d\x1f"  # 30: (2, 8)
+    b"\x14\x2a\x1e\x20"  # 31: (2, 9)
+    b"\x15\x2b\x1f\xff"  # 32: (2, 10)
+    b"\x16\x2c\xff\x22"  # 33: (3, 0)
+    b"\x17\x2d\x21\x23"  # 34: (3, 1)
+    b"\x18\x2e\x22\x24"  # 35: (3, 2)
+    b"\x19\x2f\x23\x25"  # 36: (3, 3)
+    b"\x1a\x30\x24\x26"  # 37: (3, 4)
+    b"\x1b\x31\x25\x27"  # 38: (3, 5)
+    b"\x1c\x32\x26\x28"  # 39: (3, 6)
+    b"\x1d\x33\x27\x29"  # 40: (3, 7)
+    b"\x1e\x34\x28\x2a"  # 41: (3, 8)
+    b"\x1f\x35\x29\x2b"  # 42: (3, 9)
+    b"\x20\x36\x2a\xff"  # 43: (3, 10)
+    b"\x21\x37\xff\x2d"  # 44: (4, 0)
+    b"\x22\x38\x2c\x2e"  # 45: (4, 1)
+    b"\x23\x39\x2d\x2f"  # 46: (4, 2)
+    b"\x24\x3a\x2e\x30"  # 47: (4, 3)
+    b"\x25\x3b\x2f\x31"  # 48: (4, 4)
+    b"\x26\x3c\x30\x32"  # 49: (4, 5)
+    b"\x27\x3d\x31\x33"  # 50: (4, 6)
+    b"\x28\x3e\x32\x34"  # 51: (4, 7)
+    b"\x29\x3f\x33\x35"  # 52: (4, 8)
+    b"\x2a\x40\x34\x36"  # 53: (4, 9)
+    b"\x2b\x41\x35\xff"  # 54: (4, 10)
+    b"\x2c\x42\xff\x38"  # 55: (5, 0)
+    b"\x2d\x43\x37\x39"  # 56: (5, 1)
+    b"\x2e\x44\x38\x3a"  # 57: (5, 2)
+    b"\x2f\x45\x39\x3b"  # 58: (5, 3)
+    b"\x30\x46\x3a\x3c"  # 59: (5, 4)
+    b"\x31\x47\x3b\x3d"  # 60: (5, 5)
+    b"\x32\x48\x3c\x3e"  # 61: (5, 6)
+    b"\x33\x49\x3d\x3f"  # 62: (5, 7)
+    b"\x34\x4a\x3e\x40"  # 63: (5, 8)
+    b"\x35\x4b\x3f\x41"  # 64: (5, 9)
+    b"\x36\x4c\x40\xff"  # 65: (5, 10)
+    b"\x37\x4d\xff\x43"  # 66: (6, 0)
+    b"\x38\x4e\x42\x44"  # 67: (6, 1)
+    b"\x39\x4f\x43\x45"  # 68: (6, 2)
+    b"\x3a\x50\x44\x46"  # 69: (6, 3)
+    b"\x3b\x51\x45\x47"  # 70: (6, 4)
+    b"\x3c\x52\x46\x48"  # 71: (6, 5)
+    b"\x3d\x53\x47\x49"  # 72: (6, 6)
+    b"\x3e\x54\x48\x4a"  # 73: (6, 7)
+    b"\x3f\x55\x49\x4b"  # 74: (6, 8)
+    b"\x40\x56\x4a\x4c"  # 75: (6, 9)
+    b"\x41\x57\x4b\xff"  # 76: (6, 10)
+    b"\x42\x58\xff\x4e"  # 77: (7, 0)
+    b"\x43\x59\x4d\x4f"  # 78: (7, 1)
+    b"\x44\x5a\x4e\x50"  # 79: (7, 2)
+    b"\x45\x5b\x4f\x51"  # 80: (7, 3)
+    b"\x46\x5c\x50\x52"  # 81: (7, 4)
+    b"\x47\x5d\x51\x53"  # 82: (7, 5)
+    b"\x48\x5e\x52\x54"  # 83: (7, 6)
+    b"\x49\x5f\x53\x55"  # 84: (7, 7)
+    b"\x4a\x60\x54\x56"  # 85: (7, 8)
+    b"\x4b\x61\x55\x57"  # 86: (7, 9)
+    b"\x4c\x62\x56\xff"  # 87: (7, 10)
+    b"\x4d\x63\xff\x59"  # 88: (8, 0)
+    b"\x4e\x64\x58\x5a"  # 89: (8, 1)
+    b"\x4f\x65\x59\x5b"  # 90: (8, 2)
+    b"\x50\x66\x5a\x5c"  # 91: (8, 3)
+    b"\x51\x67\x5b\x5d"  # 92: (8, 4)
+    b"\x52\x68\x5c\x5e"  # 93: (8, 5)
+    b"\x53\x69\x5d\x5f"  # 94: (8, 6)
+    b"\x54\x6a\x5e\x60"  # 95: (8, 7)
+    b"\x55\x6b\x5f\x61"  # 96: (8, 8)
+    b"\x56\x6c\x60\x62"  # 97: (8, 9)
+    b"\x57\x6d\x61\xff"  # 98: (8, 10)
+    b"\x58\x6e\xff\x64"  # 99: (9, 0)
+    b"\x59\x6f\x63\x65"  # 100: (9, 1)
+    b"\x5a\x70\x64\x66"  # 101: (9, 2)
+    b"\x5b\x71\x65\x67"  # 102: (9, 3)
+    b"\x5c\x72\x66\x68"  # 103: (9, 4)
+    b"\x5d\x73\x67\x69"  # 104: (9, 5)
+    b"\x5e\x74\x68\x6a"  # 105: (9, 6)
+    b"\x5f\x75\x69\x6b"  # 106: (9, 7)
+    b"\x60\x76\x6a\x6c"  # 107: (9, 8)
+    b"\x61\x77\x6b\x6d"  # 108: (9, 9)
+    b"\x62\x78\x6c\xff"  # 109: (9, 10)
+    b"\x63\xff\xff\x6f"  # 110: (10, 0)
+    b"\x64\xff\x6e\x70"  # 111: (10, 1)
+    b"\x65\xff\x6f\x71"  # 112: (10, 2)
+    b"\x66\xff\x70\x72"  # 113: (10, 3)
+    b"\x67\xff\x71\x73"  # 114: (10, 4)
+    b"\x68\xff\x72\x74"  # 115: (10, 5)
+    b"\x69\xff\x73\x75"  # 116: (10, 6)
+    b"\x6a\xff\x74\x76"  # 117: (10, 7)
+    b"\x6b\xff\x75\x77"  # 118: (10, 8)
+    b"\x6c\xff\x76\x78"  # 119: (10, 9)
+    b"\x6d\xff\x77\xff"  # 120: (10, 10)
+)
 
 # BOX
 BOX_R_COST = 26_100  # 26_100
-BOX_G_COST = 54_900  # 54_900
-BOX_S_COST = 27_700  # 27_700
-BOX_C_COST = 30_900  # 30_900
+BOX_G_COST = 18_900  # 18_900 (2_500 + 400 * (10 + 31)), was 54_900 unpacked
+BOX_S_COST = 44_900  # 44_900 (2_500 + 400 * (10 + 96))
+BOX_C_COST = 70_500  # 70_500 (2_500 + 400 * (10 + 40 * 4)), one box per game
+BOX_M_COST = 172_500  # 172_500 (2_500 + 400 * (10 + 415))
+BOX_O_COST = 214_500  # 214_500 (2_500 + 400 * (10 + 520)), one box per bucket
 BOX_R_EXP_ROUND_DELTA = 30
 
 # STAKE
@@ -28,3 +228,27 @@ MAX_STAKE_AMOUNT = 500_000_000
 MIN_LOBBY_SIZE = 2
 MAX_LOBBY_SIZE = 4
 PHASE_EXPIRY_INTERVAL = 1200
+
+# OPEN LOBBY INDEX
+# One box per (lobby_size, stake tier) bucket: a uint64 count, then up to capacity open game ids
+# Removal swaps the last id into the freed entry, so ids stay dense but unordered
+STAKE_TIER_1 = 10_000_000  # Stakes below fall in tier 0
+STAKE_TIER_2 = 50_000_000
+STAKE_TIER_3 = 200_000_000
+STAKE_TIER_COUNT = 4
+OPEN_LOBBY_BUCKET_COUNT = STAKE_TIER_COUNT * (MAX_LOBBY_SIZE // 2)
+OPEN_LOBBY_CAPACITY = 64
+OPEN_LOBBY_IDS_OFFSET = 8
+OPEN_LOBBY_INDEX_SIZE = OPEN_LOBBY_IDS_OFFSET + 8 * OPEN_LOBBY_CAPACITY
+
+# GAME RECORD
+# Unified per-game box w/ fixed offsets: GameState | lobby addresses | packed grid | characters
+# Lobby and character sections always hold MAX_LOBBY_SIZE slots, so offsets never depend on lobby size
+GAME_STATE_SIZE = 96
+GAME_STATE_GRID_ROOT_OFFSET = 53  # Start index of `GameState.grid_root`
+GAME_CHARACTER_SIZE = 40
+GAME_RECORD_STATE_OFFSET = 0
+GAME_RECORD_LOBBY_OFFSET = GAME_RECORD_STATE_OFFSET + GAME_STATE_SIZE
+GAME_RECORD_GRID_OFFSET = GAME_RECORD_LOBBY_OFFSET + ADDRESS_SIZE * MAX_LOBBY_SIZE
+GAME_RECORD_CHARACTERS_OFFSET = GAME_RECORD_GRID_OFFSET + GRID_PACKED_SIZE
+GAME_RECORD_SIZE = GAME_RECORD_CHARACTERS_OFFSET + GAME_CHARACTER_SIZE * MAX_LOBBY_SIZE
@@ -28,7 +28,7 @@ from . import type_aliases as ta
 
 
 # Smart contract class
-class Salvo(ARC4Contract, avm_version=11):
+class Salvo(ARC4Contract, avm_version=11, scratch_slots=(cst.MIMC_CHAIN_SLOT,)):
     game_id: UInt64
 
     # Application init method
@@ -39,7 +39,13 @@ class Salvo(ARC4Contract, avm_version=11):
         self.box_game_grid = BoxMap(UInt64, ta.GameGrid, key_prefix="g_")
         self.box_game_state = BoxMap(UInt64, stc.GameState, key_prefix="s_")
         self.box_game_lobby = BoxMap(UInt64, Bytes, key_prefix="l_")
-        self.box_game_character = BoxMap(Account, stc.GameCharacter, key_prefix="c_")
+        self.box_game_characters = BoxMap(UInt64, ta.GameCharacters, key_prefix="c_")
+
+        # Unified game record: game state, lobby, grid and characters of a game in one box
+        self.box_game_record = BoxMap(UInt64, Bytes, key_prefix="m_")
+
+        # Open lobby index: open game ids per (lobby_size, stake tier) bucket
+        self.box_open_lobbies = BoxMap(UInt64, Bytes, key_prefix="o_")
 
     # READ-ONLY: Calculate the minimum balance requirement (MBR) cost for storing a single box unit
     @arc4.abimethod(readonly=True)
@@ -65,7 +71,7 @@ class Salvo(ARC4Contract, avm_version=11):
     def read_grid_cell_value_by_index(
         self, game_id: UInt64, i: arc4.UInt8
     ) -> arc4.UInt8:
-        # Return byte value at grid cell index
+        # Return the unpacked value at grid cell index
         return srt.get_grid_cell_value(game_id, self.box_game_grid, i)
 
     # READ-ONLY: Read game grid cell value at x and y coordinates under the given game id key
@@ -93,10 +99,57 @@ class Salvo(ARC4Contract, avm_version=11):
     def does_box_game_state_exist(self, game_id: UInt64) -> bool:
         return self.box_game_state.maybe(game_id)[1]
 
-    # READ-ONLY: Return True if game character box value exists, else False
+    # READ-ONLY: Return True if game characters box value exists, else False
+    @arc4.abimethod(readonly=True)
+    def does_box_game_characters_exist(self, game_id: UInt64) -> bool:
+        return self.box_game_characters.maybe(game_id)[1]
+
+    # READ-ONLY: Return every game character of a game, indexed by lobby slot, in one box read
+    @arc4.abimethod(readonly=True)
+    def read_box_game_characters(self, game_id: UInt64) -> ta.GameCharacters:
+        # Fail transaction unless the assertion below evaluates True
+        assert game_id in self.box_game_characters, err.GAME_ID_NOT_FOUND
+
+        return self.box_game_characters[game_id]
+
+    # READ-ONLY: Return True if unified game record box value exists, else False
     @arc4.abimethod(readonly=True)
-    def does_box_game_character_exist(self, account: Account) -> bool:
-        return self.box_game_character.maybe(account)[1]
+    def does_box_game_record_exist(self, game_id: UInt64) -> bool:
+        return self.box_game_record.maybe(game_id)[1]
+
+    # READ-ONLY: Read the game state section of a unified game record
+    @arc4.abimethod(readonly=True)
+    def read_game_record_state(self, game_id: UInt64) -> stc.GameState:
+        # Fail transaction unless the assertion below evaluates True
+        assert game_id in self.box_game_record, err.GAME_ID_NOT_FOUND
+
+        # Extract only the game state bytes at their fixed offset
+        game_record_bref = BoxRef(
+            key=self.box_game_record.key_prefix + op.itob(game_id)
+        )
+        return stc.GameState.from_bytes(
+            game_record_bref.extract(cst.GAME_RECORD_STATE_OFFSET, cst.GAME_STATE_SIZE)
+        )
+
+    # READ-ONLY: Read the game character at a lobby slot of a unified game record
+    @arc4.abimethod(readonly=True)
+    def read_game_record_character(
+        self, game_id: UInt64, lobby_slot: arc4.UInt8
+    ) -> stc.GameCharacter:
+        # Fail transaction unless the assertions below evaluate True
+        assert game_id in self.box_game_record, err.GAME_ID_NOT_FOUND
+        assert lobby_slot.native < cst.MAX_LOBBY_SIZE, err.PLAYER_NOT_FOUND
+
+        # Extract only the game character bytes at their fixed offset
+        game_record_bref = BoxRef(
+            key=self.box_game_record.key_prefix + op.itob(game_id)
+        )
+        return stc.GameCharacter.from_bytes(
+            game_record_bref.extract(
+                srt.game_record_character_offset(lobby_slot.native),
+                cst.GAME_CHARACTER_SIZE,
+            )
+        )
 
     # READ-ONLY: Return an array of all active users in the game lobby at time of call
     @arc4.abimethod(readonly=True)
@@ -122,6 +175,39 @@ class Salvo(ARC4Contract, avm_version=11):
         # Return the array containing the remaining active users in the game lobby
         return users_in_lobby
 
+    # READ-ONLY: Return a page of the open game ids of a (lobby_size, stake tier) bucket
+    # The page holds up to `count` ids from entry `start`, and is empty past the last entry
+    @arc4.abimethod(readonly=True)
+    def read_open_lobbies(
+        self,
+        lobby_size: arc4.UInt8,
+        stake_tier: arc4.UInt8,
+        start: UInt64,
+        count: UInt64,
+    ) -> ta.GameIds:
+        # Fail transaction unless the assertions below evaluate True
+        assert (
+            lobby_size >= cst.MIN_LOBBY_SIZE
+            and lobby_size <= cst.MAX_LOBBY_SIZE
+            and lobby_size.native % 2 == 0
+        ), err.INVALID_LOBBY_SIZE
+        assert stake_tier.native < cst.STAKE_TIER_COUNT, err.INVALID_STAKE_TIER
+
+        # A bucket w/o an index box has no open games listed
+        bucket = srt.get_open_lobby_bucket(lobby_size.native, stake_tier.native)
+        if bucket not in self.box_open_lobbies:
+            return ta.GameIds()
+
+        # Clamp the page to the used entries and return it w/ a single box extract
+        open_lobby_bref = BoxRef(key=self.box_open_lobbies.key_prefix + op.itob(bucket))
+        used = op.btoi(open_lobby_bref.extract(0, 8))
+        start = start if start < used else used
+        count = count if count < used - start else used - start
+        return ta.GameIds.from_bytes(
+            arc4.UInt16(count).bytes
+            + open_lobby_bref.extract(cst.OPEN_LOBBY_IDS_OFFSET + start * 8, count * 8)
+        )
+
     # Generate the smart contract application client
     @arc4.abimethod(create="require")
     def generate(
@@ -158,6 +244,8 @@ class Salvo(ARC4Contract, avm_version=11):
             expiry_round=arc4.UInt64(Global.round + cst.BOX_R_EXP_ROUND_DELTA),
         )
 
+    # Create a new game, return True if it got listed in the open lobby index
+    # A game whose bucket box was not created yet, or is full, stays playable but unlisted
     @arc4.abimethod
     def new_game(
         self,
@@ -167,7 +255,8 @@ class Salvo(ARC4Contract, avm_version=11):
         box_l_pay: gtxn.PaymentTransaction,
         stake_pay: gtxn.PaymentTransaction,
         lobby_size: arc4.UInt8,
-    ) -> None:
+        commit_scheme: arc4.UInt8,
+    ) -> bool:
         # Fail transaction unless the assertion below evaluates True
         assert Global.group_size == 6, err.INVALID_GROUP_SIZE
 
@@ -212,10 +301,21 @@ class Salvo(ARC4Contract, avm_version=11):
             and lobby_size <= cst.MAX_LOBBY_SIZE
             and lobby_size.native % 2 == 0
         ), err.INVALID_LOBBY_SIZE
+        assert (
+            commit_scheme.native <= cst.COMMIT_SCHEME_SHA512_256
+        ), err.INVALID_COMMIT_SCHEME
 
         # Create a new box storage unit for the game grid w/ the current global game_id value as key
         self.box_game_grid[self.game_id] = ta.GameGrid.from_bytes(cst.GRID_ZEROED_BYTES)
 
+        # List the game in the open lobby index, under its lobby size and stake tier bucket
+        stake_tier = srt.get_stake_tier(stake_pay.amount)
+        is_listed = srt.add_open_lobby(
+            self.box_open_lobbies,
+            srt.get_open_lobby_bucket(lobby_size.native, stake_tier),
+            self.game_id,
+        )
+
         # Create a new box storage unit for the game state w/ the current global game_id value as key
         self.box_game_state[self.game_id] = stc.GameState(
             staking_closed=arc4.Bool(False),  # noqa: FBT003
@@ -226,6 +326,11 @@ class Salvo(ARC4Contract, avm_version=11):
             expiry_ts=arc4.UInt64(Global.latest_timestamp + cst.PHASE_EXPIRY_INTERVAL),
             prize_pot=arc4.UInt64(stake_pay.amount),
             admin_address=arc4.Address(Txn.sender),
+            grid_root=arc4.UInt256.from_bytes(cst.EMPTY_GRID_ROOT),
+            commit_scheme=commit_scheme,
+            stake_tier=arc4.UInt8(stake_tier),
+            open_lobby_listed=arc4.Bool(is_listed),
+            round_count=arc4.UInt64(0),
         )
 
         # NOTE: STAKE_PAY.AMOUNT in new game needs to be put in game state so others can match
@@ -235,11 +340,20 @@ class Salvo(ARC4Contract, avm_version=11):
             cst.ADDRESS_SIZE * lobby_size.native
         )  # Assign zeroed bytes to store all player addresses in lobby (32 bytes per player)
 
-        # Create a new box storage unit for the game character w/ the sender address value as key
-        self.box_game_character[Txn.sender] = stc.GameCharacter(
+        # Create a new box storage unit for the game characters w/ the current global game_id value as key
+        self.box_game_characters[self.game_id] = ta.GameCharacters.from_bytes(
+            op.bzero(cst.GAME_CHARACTER_SIZE * cst.MAX_LOBBY_SIZE)
+        )  # Assign zeroed bytes to store all player characters in lobby (one slot per player)
+
+        # Place the game creator character in the first character slot
+        self.box_game_characters[self.game_id][0] = stc.GameCharacter(
+            arc4.Bool(False),  # noqa: FBT003
             arc4.Bool(False),  # noqa: FBT003
             arc4.UInt8(6),
+            arc4.UInt8(0),  # Game creator address takes the first lobby slot
+            arc4.UInt8(cst.ACTION_NONE),
             arc4.UInt8(5),
+            arc4.UInt8(5),  # Target equals position until a turn is revealed
             arc4.UInt8(0),
             arc4.UInt8(1),
             arc4.UInt256(0),
@@ -254,10 +368,184 @@ class Salvo(ARC4Contract, avm_version=11):
         # Increment game id by 1 for next new game instance
         self.game_id += 1
 
+        return is_listed
+
+    # Create a new game as a single unified game record box, w/ one MBR payment and a stake
+    # Return True if the game got listed in the open lobby index, same as `new_game`
+    @arc4.abimethod
+    def new_game_record(
+        self,
+        box_m_pay: gtxn.PaymentTransaction,
+        stake_pay: gtxn.PaymentTransaction,
+        lobby_size: arc4.UInt8,
+        commit_scheme: arc4.UInt8,
+    ) -> bool:
+        # Fail transaction unless the assertion below evaluates True
+        assert Global.group_size == 3, err.INVALID_GROUP_SIZE
+
+        assert box_m_pay.amount >= cst.BOX_M_COST, err.INSUFFICIENT_PAY_AMOUNT
+
+        assert box_m_pay.sender == Txn.sender, err.INVALID_BOX_PAY_SENDER
+        assert stake_pay.sender == Txn.sender, err.INVALID_STAKE_PAY_SENDER
+
+        assert (
+            box_m_pay.receiver == Global.current_application_address
+        ), err.INVALID_BOX_PAY_RECEIVER
+        assert (
+            stake_pay.receiver == Global.current_application_address
+        ), err.INVALID_BOX_PAY_RECEIVER
+
+        assert (
+            lobby_size >= cst.MIN_LOBBY_SIZE
+            and lobby_size <= cst.MAX_LOBBY_SIZE
+            and lobby_size.native % 2 == 0
+        ), err.INVALID_LOBBY_SIZE
+        assert (
+            commit_scheme.native <= cst.COMMIT_SCHEME_SHA512_256
+        ), err.INVALID_COMMIT_SCHEME
+
+        # Create a new zeroed box storage unit for the game record w/ the current global game_id value as key
+        # The zeroed grid section is an all path cells grid, same as a new `box_game_grid` value
+        game_record_bref = BoxRef(
+            key=self.box_game_record.key_prefix + op.itob(self.game_id)
+        )
+        game_record_bref.create(size=cst.GAME_RECORD_SIZE)
+
+        # List the game in the open lobby index, under its lobby size and stake tier bucket
+        stake_tier = srt.get_stake_tier(stake_pay.amount)
+        is_listed = srt.add_open_lobby(
+            self.box_open_lobbies,
+            srt.get_open_lobby_bucket(lobby_size.native, stake_tier),
+            self.game_id,
+        )
+
+        # Patch the game state section
+        game_record_bref.replace(
+            cst.GAME_RECORD_STATE_OFFSET,
+            stc.GameState(
+                staking_closed=arc4.Bool(False),  # noqa: FBT003
+                lobby_size=lobby_size,
+                active_players=arc4.UInt8(1),
+                box_l_start_pos=arc4.UInt16(cst.ADDRESS_SIZE),
+                expiry_ts=arc4.UInt64(
+                    Global.latest_timestamp + cst.PHASE_EXPIRY_INTERVAL
+                ),
+                prize_pot=arc4.UInt64(stake_pay.amount),
+                admin_address=arc4.Address(Txn.sender),
+                grid_root=arc4.UInt256.from_bytes(cst.EMPTY_GRID_ROOT),
+                commit_scheme=commit_scheme,
+                stake_tier=arc4.UInt8(stake_tier),
+                open_lobby_listed=arc4.Bool(is_listed),
+                round_count=arc4.UInt64(0),
+            ).bytes,
+        )
+
+        # Patch the first lobby slot w/ the sender address bytes
+        game_record_bref.replace(
+            srt.game_record_lobby_offset(UInt64(0)), Txn.sender.bytes
+        )
+
+        # Patch the first character slot w/ the game creator character
+        game_record_bref.replace(
+            srt.game_record_character_offset(UInt64(0)),
+            stc.GameCharacter(
+                arc4.Bool(False),  # noqa: FBT003
+                arc4.Bool(False),  # noqa: FBT003
+                arc4.UInt8(6),
+                arc4.UInt8(0),  # Game creator address takes the first lobby slot
+                arc4.UInt8(cst.ACTION_NONE),
+                arc4.UInt8(5),
+                arc4.UInt8(5),  # Target equals position until a turn is revealed
+                arc4.UInt8(0),
+                arc4.UInt8(1),
+                arc4.UInt256(0),
+            ).bytes,
+        )
+
+        # Increment game id by 1 for next new game instance
+        self.game_id += 1
+
+        return is_listed
+
+    # Create the open lobby index box of a (lobby_size, stake tier) bucket, w/ one MBR payment
+    # Anyone may fund a bucket; games created before it exists are not listed
+    @arc4.abimethod
+    def create_open_lobby_index(
+        self,
+        box_o_pay: gtxn.PaymentTransaction,
+        lobby_size: arc4.UInt8,
+        stake_tier: arc4.UInt8,
+    ) -> None:
+        # Fail transaction unless the assertions below evaluate True
+        assert Global.group_size == 2, err.INVALID_GROUP_SIZE
+
+        assert box_o_pay.amount >= cst.BOX_O_COST, err.INSUFFICIENT_PAY_AMOUNT
+        assert box_o_pay.sender == Txn.sender, err.INVALID_BOX_PAY_SENDER
+        assert (
+            box_o_pay.receiver == Global.current_application_address
+        ), err.INVALID_BOX_PAY_RECEIVER
+
+        assert (
+            lobby_size >= cst.MIN_LOBBY_SIZE
+            and lobby_size <= cst.MAX_LOBBY_SIZE
+            and lobby_size.native % 2 == 0
+        ), err.INVALID_LOBBY_SIZE
+        assert stake_tier.native < cst.STAKE_TIER_COUNT, err.INVALID_STAKE_TIER
+
+        bucket = srt.get_open_lobby_bucket(lobby_size.native, stake_tier.native)
+        assert bucket not in self.box_open_lobbies, err.BOX_FOUND
+
+        # Create a zeroed index box, i.e. a zero count and no open game ids
+        open_lobby_bref = BoxRef(key=self.box_open_lobbies.key_prefix + op.itob(bucket))
+        open_lobby_bref.create(size=cst.OPEN_LOBBY_INDEX_SIZE)
+
+    # Close staking of a game, so it goes live and leaves the open lobby index
+    # Works for both the separate game boxes and the unified game record of a game id
+    @arc4.abimethod
+    def close_staking(self, game_id: UInt64) -> None:
+        # Read the game state from whichever storage holds the game
+        is_record = game_id in self.box_game_record
+        game_record_bref = BoxRef(
+            key=self.box_game_record.key_prefix + op.itob(game_id)
+        )
+        if is_record:
+            game_state = stc.GameState.from_bytes(
+                game_record_bref.extract(
+                    cst.GAME_RECORD_STATE_OFFSET, cst.GAME_STATE_SIZE
+                )
+            )
+        else:
+            # Fail transaction unless the assertion below evaluates True
+            assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
+            game_state = self.box_game_state[game_id].copy()
+
+        # Fail transaction unless the assertions below evaluate True
+        assert Txn.sender == game_state.admin_address.native, err.SENDER_NOT_GAME_ADMIN
+        assert not game_state.staking_closed.native, err.STAKING_CLOSED
+
+        # Unlist the game from the bucket it was listed in at creation, joins do not move it
+        if game_state.open_lobby_listed.native:
+            srt.remove_open_lobby(
+                self.box_open_lobbies,
+                srt.get_open_lobby_bucket(
+                    game_state.lobby_size.native, game_state.stake_tier.native
+                ),
+                game_id,
+            )
+            game_state.open_lobby_listed = arc4.Bool(False)  # noqa: FBT003
+
+        # Mark the game as live and write the game state back
+        game_state.staking_closed = arc4.Bool(True)  # noqa: FBT003
+        if is_record:
+            game_record_bref.replace(cst.GAME_RECORD_STATE_OFFSET, game_state.bytes)
+        else:
+            self.box_game_state[game_id] = game_state.copy()
+
     @arc4.abimethod
     def commit_turn(
         self,
         game_id: UInt64,
+        lobby_slot: arc4.UInt8,
         turn_hash: arc4.UInt256,
     ) -> None:
         # Fail transaction unless the assertion below evaluates True
@@ -268,79 +556,360 @@ class Salvo(ARC4Contract, avm_version=11):
             game_id=game_id,
             account=Txn.sender,
             box_game_lobby=self.box_game_lobby,
-            player_count=self.box_game_state[game_id].active_players.native,
+            lobby_slot=lobby_slot.native,
+            clear_player=False,
+        ), err.PLAYER_NOT_FOUND
+
+        # Read the sender character slot once, patch it in memory, then write it back once
+        game_characters_bref = BoxRef(
+            key=self.box_game_characters.key_prefix + op.itob(game_id)
+        )
+        character_offset = lobby_slot.native * cst.GAME_CHARACTER_SIZE
+        character = stc.GameCharacter.from_bytes(
+            game_characters_bref.extract(character_offset, cst.GAME_CHARACTER_SIZE)
+        )
+
+        assert not character.has_committed_turn.native, err.TURN_ALREADY_COMMITTED
+
+        character.turn_hash = turn_hash
+        character.has_committed_turn = arc4.Bool(True)  # noqa: FBT003
+        game_characters_bref.replace(character_offset, character.bytes)
+
+    # Commit the turn hashes of several players at once, e.g. from a relay or game server
+    # Each commit is authorized by the player signature instead of the transaction sender
+    @arc4.abimethod
+    def commit_turns(
+        self,
+        game_id: UInt64,
+        commits: ta.SignedTurnCommits,
+    ) -> None:
+        # Fail transaction unless the assertions below evaluate True
+        assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
+        assert (
+            commits.length > 0 and commits.length <= cst.MAX_LOBBY_SIZE
+        ), err.INVALID_COMMITS_LENGTH
+
+        # Ensure transaction has sufficient opcode budget for every signature check
+        ensure_budget(
+            required_budget=cst.ED25519_VERIFY_COST * commits.length
+            + cst.COMMIT_TURNS_BASE_BUDGET,
+            fee_source=OpUpFeeSource.GroupCredit,
+        )
+
+        # Read the game lobby and the game characters once for the whole batch
+        game_lobby_b_arr = self.box_game_lobby[game_id]
+        characters = self.box_game_characters[game_id].copy()
+
+        # Message prefix shared by every turn commit of this round; the round count changes every
+        # resolve, so a signature can not be replayed in a later round even if its expiry matches
+        game_state = self.box_game_state[game_id].copy()
+        message_prefix = (
+            Bytes(cst.TURN_COMMIT_MSG_PREFIX)
+            + op.itob(Global.current_application_id.id)
+            + op.itob(game_id)
+            + game_state.expiry_ts.bytes
+            + game_state.round_count.bytes
+        )
+
+        # Iterate through all the signed commits, in a single pass over the lobby
+        for i in urange(commits.length):
+            commit = commits[i].copy()
+
+            # Extract the player address bytes at the commit lobby slot
+            slot = commit.lobby_slot.native
+            start = slot * cst.ADDRESS_SIZE
+            assert (
+                start + cst.ADDRESS_SIZE <= game_lobby_b_arr.length
+            ), err.PLAYER_NOT_FOUND
+            player_addr_bytes = op.extract(game_lobby_b_arr, start, cst.ADDRESS_SIZE)
+            assert player_addr_bytes != Bytes(
+                cst.ZEROED_ADDR_BYTES
+            ), err.PLAYER_NOT_FOUND
+
+            # Verify the player signed this turn hash for this game phase
+            assert op.ed25519verify_bare(
+                message_prefix + commit.turn_hash.bytes,
+                commit.signature.bytes,
+                player_addr_bytes,
+            ), err.INVALID_COMMIT_SIGNATURE
+
+            # A repeated lobby slot fails here, as its character was already updated below
+            assert not characters[
+                slot
+            ].has_committed_turn.native, err.TURN_ALREADY_COMMITTED
+
+            characters[slot].turn_hash = commit.turn_hash
+            characters[slot].has_committed_turn = arc4.Bool(True)  # noqa: FBT003
+
+        # Write all the updated game characters back w/ a single box write
+        self.box_game_characters[game_id] = characters.copy()
+
+    # Commit a turn hash to the sender character of a unified game record
+    @arc4.abimethod
+    def commit_turn_record(
+        self,
+        game_id: UInt64,
+        lobby_slot: arc4.UInt8,
+        turn_hash: arc4.UInt256,
+    ) -> None:
+        # Fail transaction unless the assertions below evaluate True
+        assert game_id in self.box_game_record, err.GAME_ID_NOT_FOUND
+
+        assert srt.check_acc_in_game_record(
+            game_id=game_id,
+            account=Txn.sender,
+            box_game_record=self.box_game_record,
+            lobby_slot=lobby_slot.native,
+        ), err.PLAYER_NOT_FOUND
+
+        # Read the sender character slot once, patch it in memory, then write it back once
+        game_record_bref = BoxRef(
+            key=self.box_game_record.key_prefix + op.itob(game_id)
+        )
+        character_offset = srt.game_record_character_offset(lobby_slot.native)
+        character = stc.GameCharacter.from_bytes(
+            game_record_bref.extract(character_offset, cst.GAME_CHARACTER_SIZE)
+        )
+
+        assert not character.has_committed_turn.native, err.TURN_ALREADY_COMMITTED
+
+        character.turn_hash = turn_hash
+        character.has_committed_turn = arc4.Bool(True)  # noqa: FBT003
+        game_record_bref.replace(character_offset, character.bytes)
+
+    # Reveal a committed turn: recompute its hash w/ the game commit scheme, then validate the move
+    @arc4.abimethod
+    def reveal_turn(
+        self,
+        game_id: UInt64,
+        lobby_slot: arc4.UInt8,
+        movement: ta.CoordsArray,
+        action: arc4.UInt8,
+        direction: arc4.UInt8,
+        salt: arc4.UInt64,
+    ) -> None:
+        # Fail transaction unless the assertions below evaluate True
+        assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
+        game_state = self.box_game_state[game_id].copy()
+        assert game_state.staking_closed.native, err.STAKING_NOT_CLOSED
+
+        assert srt.check_acc_in_game(
+            game_id=game_id,
+            account=Txn.sender,
+            box_game_lobby=self.box_game_lobby,
+            lobby_slot=lobby_slot.native,
             clear_player=False,
         ), err.PLAYER_NOT_FOUND
 
+        # Read the sender character slot once, patch it in memory, then write it back once
+        game_characters_bref = BoxRef(
+            key=self.box_game_characters.key_prefix + op.itob(game_id)
+        )
+        character_offset = lobby_slot.native * cst.GAME_CHARACTER_SIZE
+        character = stc.GameCharacter.from_bytes(
+            game_characters_bref.extract(character_offset, cst.GAME_CHARACTER_SIZE)
+        )
+
+        assert character.has_committed_turn.native, err.TURN_NOT_COMMITTED
+        assert not character.has_revealed_turn.native, err.TURN_ALREADY_REVEALED
+        assert movement.length <= character.move_points.native, err.MOVEMENT_OVERFLOW
+        assert action <= cst.MAX_ACTION, err.ACTION_OVERFLOW
+        assert direction <= cst.MAX_DIRECTION, err.DIRECTION_OVERFLOW
+
+        # Ensure transaction has sufficient opcode budget for the checks, the moves and the turn hash
+        commit_scheme = game_state.commit_scheme.native
+        ensure_budget(
+            required_budget=srt.get_reveal_turn_budget(commit_scheme, movement.length),
+            fee_source=OpUpFeeSource.GroupCredit,
+        )
+
+        # Recompute the turn hash w/ the game commit scheme
         assert (
-            self.box_game_character[Txn.sender].has_committed_turn.native  # noqa: E712
-            == False
+            srt.compute_turn_hash(
+                commit_scheme,
+                game_id,
+                movement,
+                action,
+                direction,
+                salt,
+            )
+            == character.turn_hash.bytes
+        ), err.TURN_HASH_MISMATCH
+
+        # Validate the movement from the character position
+        assert srt.is_move_sequence_valid(
+            game_id,
+            self.box_game_grid,
+            srt.convert_grid_index_to_coords(character.position),
+            movement.copy(),
+        ), err.INVALID_MOVE_SEQUENCE
+
+        # Record the revealed turn on the character, `resolve_round` applies it w/ every other turn
+        character.target = character.position
+        if movement.length > 0:
+            row, col = movement[movement.length - 1].native
+            character.target = srt.convert_grid_coords_to_index(row, col)
+        character.action = action
+        character.direction = direction
+        character.has_revealed_turn = arc4.Bool(True)  # noqa: FBT003
+        game_characters_bref.replace(character_offset, character.bytes)
+
+    # Resolve a round: apply every revealed turn of a game in lobby slot order, in a single grid pass
+    # Moves are applied first, then shots; a move onto a cell that is no longer free is blocked
+    # `proofs` holds one grid Merkle proof per changed grid cell, in change order (see utils.grid_merkle)
+    # Return the number of hits each lobby slot took this round
+    @arc4.abimethod
+    def resolve_round(
+        self, game_id: UInt64, proofs: ta.GridMerkleProofs
+    ) -> ta.RoundHits:
+        # Fail transaction unless the assertions below evaluate True
+        assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
+        game_state = self.box_game_state[game_id].copy()
+        assert game_state.staking_closed.native, err.STAKING_NOT_CLOSED
+
+        # Ensure transaction has sufficient opcode budget, which scales w/ the changed grid cells only
+        ensure_budget(
+            required_budget=cst.RESOLVE_ROUND_BASE_BUDGET
+            + cst.GRID_ROOT_UPDATE_BUDGET * proofs.length,
+            fee_source=OpUpFeeSource.GroupCredit,
+        )
+
+        # Read the lobby, characters and grid once for the whole round
+        game_lobby_b_arr = self.box_game_lobby[game_id]
+        characters = self.box_game_characters[game_id].copy()
+        grid = self.box_game_grid[game_id].bytes
+        root = game_state.grid_root.bytes
+
+        # Collect present players and revealed turns as lobby slot bitmasks
+        # A player who did not reveal blocks the round only until the phase expires
+        expired = Global.latest_timestamp >= game_state.expiry_ts.native
+        player_count = game_lobby_b_arr.length // cst.ADDRESS_SIZE
+        present = UInt64(0)
+        revealed = UInt64(0)
+        for slot in urange(player_count):
+            user_addr_bytes = op.extract(
+                game_lobby_b_arr, slot * cst.ADDRESS_SIZE, cst.ADDRESS_SIZE
+            )
+            if user_addr_bytes != Bytes(cst.ZEROED_ADDR_BYTES):
+                present |= UInt64(1) << slot
+                if characters[slot].has_revealed_turn.native:
+                    revealed |= UInt64(1) << slot
+                else:
+                    assert expired, err.ROUND_NOT_REVEALED
+
+        # Move phase: each move changes at most two grid cells, each change consumes the next proof
+        n_changes = UInt64(0)
+        for slot in urange(player_count):
+            position = characters[slot].position.native
+            target = characters[slot].target.native
+            if (
+                (revealed >> slot) & 1 == 1
+                and target != position
+                and srt.get_grid_cell(grid, target) == cst.GRID_CELL_PATH
+                and srt.find_character_at(characters, present, target, slot)
+                == cst.MAX_LOBBY_SIZE
+            ):
+                # Free the cell the character leaves, if it was marked on the grid
+                if srt.get_grid_cell(grid, position) == cst.GRID_CELL_OCCUPIED:
+                    root = srt.apply_grid_root_change(
+                        root,
+                        position,
+                        UInt64(cst.GRID_CELL_OCCUPIED),
+                        UInt64(cst.GRID_CELL_PATH),
+                        proofs[n_changes].copy(),
+                    )
+                    grid = srt.set_grid_cell(grid, position, UInt64(cst.GRID_CELL_PATH))
+                    n_changes += 1
+
+                # Mark the target cell as occupied
+                root = srt.apply_grid_root_change(
+                    root,
+                    target,
+                    UInt64(cst.GRID_CELL_PATH),
+                    UInt64(cst.GRID_CELL_OCCUPIED),
+                    proofs[n_changes].copy(),
+                )
+                grid = srt.set_grid_cell(grid, target, UInt64(cst.GRID_CELL_OCCUPIED))
+                n_changes += 1
+                characters[slot].position = arc4.UInt8(target)
+
+        # Every proof must be consumed, so the grid root stays in sync w/ the grid
+        assert n_changes == proofs.length, err.INVALID_GRID_PROOF_COUNT
+
+        # Action phase: a shot travels from the shooter position in its facing direction
+        # until it hits a character, an obstacle or the grid edge
+        hits = ta.RoundHits.from_bytes(op.bzero(cst.MAX_LOBBY_SIZE))
+        for slot in urange(player_count):
+            if (revealed >> slot) & 1 == 1 and characters[
+                slot
+            ].action.native == cst.ACTION_SHOOT:
+                cell = characters[slot].position.native
+                direction = characters[slot].direction.native
+                while True:
+                    cell = op.getbyte(
+                        Bytes(cst.NEIGHBOR_TABLE),
+                        cell * cst.NEIGHBOR_COUNT + direction,
+                    )
+                    if (
+                        cell == cst.NEIGHBOR_NONE
+                        or srt.get_grid_cell(grid, cell) == cst.GRID_CELL_OBSTACLE
+                    ):
+                        break
+                    hit_slot = srt.find_character_at(characters, present, cell, slot)
+                    if hit_slot != cst.MAX_LOBBY_SIZE:
+                        hits[hit_slot] = arc4.UInt8(hits[hit_slot].native + 1)
+                        break
+
+        # Reopen every present character for the next round
+        for slot in urange(player_count):
+            if (present >> slot) & 1 == 1:
+                characters[slot].has_committed_turn = arc4.Bool(False)  # noqa: FBT003
+                characters[slot].has_revealed_turn = arc4.Bool(False)  # noqa: FBT003
+                characters[slot].action = arc4.UInt8(cst.ACTION_NONE)
+                characters[slot].target = characters[slot].position
+                characters[slot].turn_hash = arc4.UInt256(0)
+
+        # Write the grid, characters and game state back once each; a new phase starts
+        self.box_game_grid[game_id] = ta.GameGrid.from_bytes(grid)
+        self.box_game_characters[game_id] = characters.copy()
+        game_state.grid_root = arc4.UInt256.from_bytes(root)
+        game_state.expiry_ts = arc4.UInt64(
+            Global.latest_timestamp + cst.PHASE_EXPIRY_INTERVAL
         )
+        game_state.round_count = arc4.UInt64(game_state.round_count.native + 1)
+        self.box_game_state[game_id] = game_state.copy()
 
-        self.box_game_character[Txn.sender].turn_hash = turn_hash
-        self.box_game_character[Txn.sender].has_committed_turn = arc4.Bool(
-            True  # noqa: FBT003
+        return hits
+
+    # Absorb one chunk of a long MiMC preimage, so the hash spreads over several app calls in a group
+    # The first chunk is hashed alone, every later chunk is hashed after the previous chunk digest
+    # Return the running digest; the digest returned by the last chunk is the final hash
+    @arc4.abimethod
+    def mimc_absorb(self, chunk: Bytes, is_first: bool) -> Bytes:  # noqa: FBT001
+        # Fail transaction unless the assertion below evaluates True
+        assert (
+            chunk.length > 0
+            and chunk.length % cst.MIMC_FR_SIZE == 0
+            and chunk.length <= cst.MIMC_FR_SIZE * cst.MIMC_CHUNK_MAX_ELEMENTS
+        ), err.INVALID_MIMC_CHUNK
+
+        preimage = chunk
+        if not is_first:
+            # Chain onto the digest the previous mimc_absorb call of the group left in scratch space
+            preimage = srt.load_mimc_chain_digest() + chunk
+
+        # Ensure transaction has sufficient opcode budget for this chunk only
+        ensure_budget(
+            required_budget=cst.MIMC_ABSORB_BASE_BUDGET
+            + cst.MIMC_BASE_COST
+            + cst.MIMC_ELEMENT_COST * (preimage.length // cst.MIMC_FR_SIZE),
+            fee_source=OpUpFeeSource.GroupCredit,
         )
 
-    # @arc4.abimethod
-    # def reveal_turn(
-    #     self,
-    #     game_id: UInt64,
-    #     location: arc4.UInt8,
-    #     fatigue: arc4.UInt8,
-    #     pathing: ta.CoordsArray,
-    #     direction: arc4.UInt8,
-    #     action: arc4.UInt8,
-    #     salt: arc4.UInt64,
-    #     # turn_hash: arc4.UInt256,
-    # ) -> None:
-    #     # Fail transaction unless the assertion below evaluates True
-    #     # assert Global.group_size == 2, err.INVALID_GROUP_SIZE
-    #     assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
-
-    #     assert srt.check_acc_in_game(
-    #         game_id=game_id,
-    #         account=Txn.sender,
-    #         box_game_lobby=self.box_game_lobby,
-    #         player_count=self.box_game_state[game_id].active_players.native,
-    #         clear_player=False,
-    #     ), err.PLAYER_NOT_FOUND
-
-    #     assert (
-    #         self.box_game_character[Txn.sender].has_committed_turn.native  # noqa: E712
-    #         == False
-    #     )
-
-    #     self.box_game_character[Txn.sender].has_committed_turn = arc4.Bool(
-    #         True  # noqa: FBT003
-    #     )
-
-    # @arc4.abimethod
-    # def reveal_turn(
-    #     self,
-    #     game_id: UInt64,
-    #     location: arc4.UInt8,
-    #     fatigue: arc4.UInt8,
-    #     pathing: ta.CoordsArray,
-    #     direction: arc4.UInt8,
-    #     action: arc4.UInt8,
-    #     salt: arc4.UInt64,
-    # ) -> bool:
-
-    #     assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
-
-    #     assert srt.check_acc_in_game(
-    #         game_id=game_id,
-    #         account=Txn.sender,
-    #         box_game_lobby=self.box_game_lobby,
-    #         player_count=self.box_game_state[game_id].active_players.native,
-    #         clear_player=False,
-    #     ), err.PLAYER_NOT_FOUND
-
-    #     assert (
-    #         self.box_game_character[Txn.sender].has_committed_turn.native  # noqa: E712
-    #         == True
-    #     )
+        # Hash the chunk, then leave its digest in scratch space for the next chunk
+        digest = op.mimc(op.MiMCConfigurations.BLS12_381Mp111, preimage)
+        op.Scratch.store(cst.MIMC_CHAIN_SLOT, digest)
+        return digest
 
     @arc4.abimethod
     def mimc_tester(self) -> Bytes:
@@ -15,11 +15,14 @@ INVALID_LOBBY_SIZE: Final[str] = (
 INVALID_POS_INDEX: Final[str] = (
     "Invalid position index. Ensure index value is within valid range."
 )
+INVALID_CELL_VALUE: Final[str] = (
+    "Invalid cell value. Value must fit in the bits of a packed grid cell."
+)
 INVALID_POS_COORDS: Final[str] = (
     "Invalid position coordinates. Ensure boh row and column indices are within valid range."
 )
 INVALID_MOVE_SEQUENCE: Final[str] = (
-    "Invalid move sequence. Ensure coordinate entries within the movement array are valid path cells."
+    "Invalid move sequence. Ensure every movement entry is a path cell next to the previous one."
 )
 INVALID_STAKE_AMOUNT: Final[str] = (
     "Invalid stake amount. Value must be a multiple of 1 and within permitted bounds."
@@ -61,6 +64,57 @@ ACTION_OVERFLOW: Final[str] = (
 DIRECTION_OVERFLOW: Final[str] = (
     "Direction overflow. Ensure direction index is within valid range."
 )
+TURN_ALREADY_COMMITTED: Final[str] = (
+    "Turn already committed. Wait for the current turn to resolve before committing again."
+)
+INVALID_COMMITS_LENGTH: Final[str] = (
+    "Invalid commits length. Ensure there is at least one and at most one commit per lobby slot."
+)
+INVALID_COMMIT_SIGNATURE: Final[str] = (
+    "Invalid commit signature. Ensure the player signed the turn commit message of this game phase."
+)
+INVALID_MIMC_CHUNK: Final[str] = (
+    "Invalid MiMC chunk. Ensure the chunk holds 1 to 8 whole 32-byte field elements."
+)
+INVALID_MIMC_CHAIN: Final[str] = (
+    "Invalid MiMC chain. Ensure the previous group transaction is a mimc_absorb call to this app."
+)
+INVALID_GRID_PROOF: Final[str] = (
+    "Invalid grid proof. Ensure the Merkle proof matches the current grid cell value and root."
+)
+INVALID_COMMIT_SCHEME: Final[str] = (
+    "Invalid commit scheme. Ensure the scheme is MiMC (0), sha256 (1) or sha512_256 (2)."
+)
+TURN_NOT_COMMITTED: Final[str] = (
+    "Turn not committed. Commit a turn hash before revealing the turn."
+)
+TURN_HASH_MISMATCH: Final[str] = (
+    "Turn hash mismatch. Ensure the revealed turn is the one committed for this game."
+)
+TURN_ALREADY_REVEALED: Final[str] = (
+    "Turn already revealed. Wait for the round to resolve before revealing again."
+)
+ROUND_NOT_REVEALED: Final[str] = (
+    "Round not revealed. Every player must reveal their turn before the phase expires."
+)
+INVALID_GRID_PROOF_COUNT: Final[str] = (
+    "Invalid grid proof count. Provide one grid proof per changed grid cell, in change order."
+)
+INVALID_STAKE_TIER: Final[str] = (
+    "Invalid stake tier. Value must be below the number of stake tiers."
+)
+STAKING_CLOSED: Final[str] = (
+    "Staking closed. The game is live and no longer takes players."
+)
+STAKING_NOT_CLOSED: Final[str] = (
+    "Staking not closed. The game admin must close staking before rounds are played."
+)
+OPEN_LOBBY_NOT_FOUND: Final[str] = (
+    "Open lobby not found. The game is not listed in its open lobby index bucket."
+)
+SENDER_NOT_GAME_ADMIN: Final[str] = (
+    "Only the game admin address can act as the sender address."
+)
 UPDATABLE_NOT_TRUE: Final[str] = (
     "Template variable 'UPDATABLE' needs to be 'True' at deploy-time."
 )
@@ -1,4 +1,6 @@
 # smart_contracts/salvo/structs.py
+from typing import Literal
+
 from algopy import arc4
 
 
@@ -24,17 +26,35 @@ class GameState(arc4.Struct):
     expiry_ts: arc4.UInt64  # Expiry timestamp of game phase, queue or live
     prize_pot: arc4.UInt64  # Prize pot amount for winner payouts
     admin_address: arc4.Address  # Game creator address, assigned as admin
+    grid_root: arc4.UInt256  # MiMC Merkle root of the game grid cells
+    commit_scheme: arc4.UInt8  # Turn hash scheme, one of the COMMIT_SCHEME_* constants
+    # Stake tier of the creator stake, fixes the open lobby index bucket
+    stake_tier: arc4.UInt8
+    # If True, the game is listed in its open lobby index bucket
+    open_lobby_listed: arc4.Bool
+    round_count: arc4.UInt64  # Rounds resolved so far, signed into every turn commit
 
 
 # Define a struct that will store the game character object data
 class GameCharacter(arc4.Struct):
     has_committed_turn: arc4.Bool
+    has_revealed_turn: arc4.Bool  # Packed into the same byte as `has_committed_turn`
     id: arc4.UInt8
-    # action: arc4.UInt8
+    lobby_slot: arc4.UInt8  # Index of the player address slot in the game lobby box
+    action: arc4.UInt8  # Revealed action, applied by `resolve_round`
     position: arc4.UInt8
+    target: arc4.UInt8  # Revealed destination grid index, applied by `resolve_round`
     move_points: arc4.UInt8
     direction: arc4.UInt8
     turn_hash: arc4.UInt256
     # health: arc4.UInt8
     # range: arc4.UInt8
     # accuracy: arc4.UInt8
+
+
+# Define a struct that will store a player turn commitment signed for a relay to submit
+class SignedTurnCommit(arc4.Struct):
+    lobby_slot: arc4.UInt8  # Lobby slot of the signing player
+    turn_hash: arc4.UInt256  # Turn hash to commit, same as the `commit_turn` argument
+    # Ed25519 signature of the turn commit message by the player address
+    signature: arc4.StaticArray[arc4.Byte, Literal[64]]
@@ -1,8 +1,24 @@
 # smart_contracts/salvo/structs.py
-from algopy import Account, BoxMap, BoxRef, Bytes, UInt64, arc4, op, subroutine, urange
+from algopy import (
+    Account,
+    BoxMap,
+    BoxRef,
+    Bytes,
+    Global,
+    OpUpFeeSource,
+    Txn,
+    UInt64,
+    arc4,
+    ensure_budget,
+    gtxn,
+    op,
+    subroutine,
+    urange,
+)
 
 from . import constants as cst
 from . import errors as err
+from . import structs as stc
 from . import type_aliases as ta
 
 
@@ -51,6 +67,19 @@ def is_move_sequence_valid(
     position: ta.CoordsPair,
     movement: ta.CoordsArray,
 ) -> bool:
+    # Fail transaction unless the assertions below evaluate True, once for the whole sequence
+    assert game_id in box_game_grid, err.GAME_ID_NOT_FOUND
+
+    # Assert starting row and column are within valid range, so every neighbor index is a grid index
+    row, col = position.native
+    assert_coords_in_range(row, col)
+
+    # Read the game grid box once, all neighbor lookups below use this local copy
+    grid = box_game_grid[game_id].bytes
+
+    # Track current position as a grid index, so each move is a neighbor table lookup
+    current = row.native * cst.GRID_SIZE + col.native
+
     # Iterate through the coords in the movement sequence
     for coords in movement:
         # Extract row and column values from the entry
@@ -59,43 +88,63 @@ def is_move_sequence_valid(
         # Assert row and column are within valid range
         assert_coords_in_range(row, col)
 
-        # Get all neighbors of current position and a valid path count
-        neighbors_with_count = get_neighbors_with_count(
-            game_id,
-            box_game_grid,
-            position,
-        )
-
         # Check if coords entry from movement sequence is not a valid move
-        if not is_single_move_valid(neighbors_with_count, coords):
+        target = row.native * cst.GRID_SIZE + col.native
+        if not is_neighbor_path_cell(grid, current, target):
             return False
 
-        # Update current position coords
-        position = coords
+        # Update current position index
+        current = target
 
     # If all entry coords in movement in range of count are valid, return True
     return True
 
 
+# Check if the grid cell at index i is a path cell, w/ `grid` being the game grid box bytes
+# Callers must ensure i is in range, `getbyte` fails the transaction otherwise
 @subroutine
-def is_path_cell(
-    game_id: UInt64,
-    box_game_grid: BoxMap[UInt64, ta.GameGrid],
-    row: arc4.UInt8,
-    col: arc4.UInt8,
-) -> bool:
-    return get_grid_cell_value(
-        game_id,
-        box_game_grid,
-        convert_grid_coords_to_index(row, col),
-    ) == arc4.UInt8(0)
+def is_path_cell(grid: Bytes, i: UInt64) -> bool:
+    return unpack_grid_cell(op.getbyte(grid, i // cst.GRID_CELLS_PER_BYTE), i) == 0
+
+
+# Get the bit shift of grid cell i inside its packed byte (first cell of a byte in the high bits)
+@subroutine
+def grid_cell_shift(i: UInt64) -> UInt64:
+    return (
+        cst.GRID_CELLS_PER_BYTE - 1 - i % cst.GRID_CELLS_PER_BYTE
+    ) * cst.GRID_CELL_BITS
+
+
+# Get the value of grid cell i from the packed byte holding it
+@subroutine
+def unpack_grid_cell(packed: UInt64, i: UInt64) -> UInt64:
+    return (packed >> grid_cell_shift(i)) & cst.GRID_CELL_MASK
+
+
+# Check if the grid cell at index `target` is a path cell that neighbors the cell at index i
+@subroutine
+def is_neighbor_path_cell(grid: Bytes, i: UInt64, target: UInt64) -> bool:
+    # A move can only end on a path cell
+    if not is_path_cell(grid, target):
+        return False
+
+    # Extract the North, South, West and East neighbor indices of cell i from the neighbor table
+    neighbors = op.extract(
+        Bytes(cst.NEIGHBOR_TABLE), i * cst.NEIGHBOR_COUNT, cst.NEIGHBOR_COUNT
+    )
+
+    # Target is a neighbor if any entry matches it (the 255 padding never matches a grid index)
+    for k in urange(cst.NEIGHBOR_COUNT):
+        if op.getbyte(neighbors, k) == target:
+            return True
+    return False
 
 
 # Get every cell that neighbors current position coords and a count of valid paths cells
+# `grid` is the game grid box bytes, read once by the caller
 @subroutine
 def get_neighbors_with_count(
-    game_id: UInt64,
-    box_game_grid: BoxMap[UInt64, ta.GameGrid],
+    grid: Bytes,
     position: ta.CoordsPair,
 ) -> ta.NeighborsWithCount:
     # Initialize neighbors array with placeholder coords (use 255 as padding value)
@@ -104,56 +153,23 @@ def get_neighbors_with_count(
         placeholder_coords, placeholder_coords, placeholder_coords, placeholder_coords
     )
 
-    # Extract current position coordinates (row, col) and initialize valid neighbor counter
+    # Calculate where the neighbor table entries of current position start and initialize counter
     row, col = position.native
-    count = arc4.UInt8(0)
+    offset = (row.native * cst.GRID_SIZE + col.native) * cst.NEIGHBOR_COUNT
+    count = UInt64(0)
 
-    # North: (row > 0) ensures row value isn't going below zero (out of grid bounds when moving North)
-    if (
-        row > 0
-        and is_path_cell(  # 'is_path_cell' checks if North neighbor is a valid path cell
-            game_id, box_game_grid, arc4.UInt8(row.native - 1), col
-        )
-    ):
-        # Overwrite placeholder coords w/ valid North neighbor coords (row-1, col) at current count index
-        neighbors[count.native] = ta.CoordsPair((arc4.UInt8(row.native - 1), col))
-        count = arc4.UInt8(count.native + 1)  # Increment count by 1
-
-    # South: (row+1 < GRID_SIZE) ensures row value isn't going above GRIZ_SIZE (out of grid bounds when moving South)
-    if (
-        row.native + 1 < cst.GRID_SIZE
-        and is_path_cell(  # 'is_path_cell' checks if South neighbor is a valid path cell
-            game_id, box_game_grid, arc4.UInt8(row.native + 1), col
-        )
-    ):
-        # Overwrite placeholder coords w/ valid South neighbor coords (row+1, col) at current count index
-        neighbors[count.native] = ta.CoordsPair((arc4.UInt8(row.native + 1), col))
-        count = arc4.UInt8(count.native + 1)  # Increment count by 1
-
-    # West: (col > 0) ensures col value isn't going below zero (out of grid bounds when moving West)
-    if (
-        col > 0
-        and is_path_cell(  # 'is_path_cell' checks if West neighbor is a valid path cell
-            game_id, box_game_grid, row, arc4.UInt8(col.native - 1)
-        )
-    ):
-        # Overwrite placeholder coords w/ valid West neighbor coords (row, col-1) at current count index
-        neighbors[count.native] = ta.CoordsPair((row, arc4.UInt8(col.native - 1)))
-        count = arc4.UInt8(count.native + 1)  # Increment count by 1
-
-    # East: (col+1 < GRID_SIZE) ensures col value isn't going above GRIZ_SIZE (out of grid bounds when moving East)
-    if (
-        col.native + 1 < cst.GRID_SIZE
-        and is_path_cell(  # 'is_path_cell' checks if East neighbor is a valid path cell
-            game_id, box_game_grid, row, arc4.UInt8(col.native + 1)
-        )
-    ):
-        # Overwrite placeholder coords w/ valid East neighbor coords (row, col+1) at current count index
-        neighbors[count.native] = ta.CoordsPair((row, arc4.UInt8(col.native + 1)))
-        count = arc4.UInt8(count.native + 1)
+    # Iterate through the North, South, West and East neighbor indices of current position
+    for k in urange(cst.NEIGHBOR_COUNT):
+        i = op.getbyte(Bytes(cst.NEIGHBOR_TABLE), offset + k)
+
+        # Skip neighbors off the grid, then check if the neighbor is a valid path cell
+        if i != cst.NEIGHBOR_NONE and is_path_cell(grid, i):
+            # Overwrite placeholder coords w/ valid neighbor coords at current count index
+            neighbors[count] = convert_grid_index_to_coords(arc4.UInt8(i))
+            count += 1  # Increment count by 1
 
     # Return tuple implicitly w/ a copy of neighbors array and the count variable
-    return neighbors.copy(), count
+    return neighbors.copy(), arc4.UInt8(count)
 
 
 # Convert UInt8 to 32-byte field scalar for BLS12-381 curve
@@ -170,6 +186,81 @@ def u64_to_fr32(u: arc4.UInt64) -> Bytes:
     return op.bzero(24) + u.bytes
 
 
+# Build the MiMC turn preimage: DOMAIN_PREFIX, game id, (row, col) per move, action, direction and salt as fr32 elements
+# The game id binds the commitment to its game, so a reveal cannot be replayed in another game
+@subroutine
+def build_turn_preimage_fr32(
+    game_id: UInt64,
+    movement: ta.CoordsArray,
+    action: arc4.UInt8,
+    direction: arc4.UInt8,
+    salt: arc4.UInt64,
+) -> Bytes:
+    preimage = u64_to_fr32(arc4.UInt64(cst.DOMAIN_PREFIX)) + u64_to_fr32(
+        arc4.UInt64(game_id)
+    )
+    for coords in movement:
+        row, col = coords.native
+        preimage += u8_to_fr32(row) + u8_to_fr32(col)
+    return preimage + u8_to_fr32(action) + u8_to_fr32(direction) + u64_to_fr32(salt)
+
+
+# Build the compact sha turn preimage: DOMAIN_PREFIX, game id, ARC-4 movement, action, direction and salt
+@subroutine
+def build_turn_preimage_bytes(
+    game_id: UInt64,
+    movement: ta.CoordsArray,
+    action: arc4.UInt8,
+    direction: arc4.UInt8,
+    salt: arc4.UInt64,
+) -> Bytes:
+    return (
+        op.itob(cst.DOMAIN_PREFIX)
+        + op.itob(game_id)
+        + movement.bytes
+        + action.bytes
+        + direction.bytes
+        + salt.bytes
+    )
+
+
+# Hash a revealed turn w/ the commit scheme of its game
+@subroutine
+def compute_turn_hash(
+    commit_scheme: UInt64,
+    game_id: UInt64,
+    movement: ta.CoordsArray,
+    action: arc4.UInt8,
+    direction: arc4.UInt8,
+    salt: arc4.UInt64,
+) -> Bytes:
+    if commit_scheme == cst.COMMIT_SCHEME_SHA256:
+        return op.sha256(
+            build_turn_preimage_bytes(game_id, movement, action, direction, salt)
+        )
+    if commit_scheme == cst.COMMIT_SCHEME_SHA512_256:
+        return op.sha512_256(
+            build_turn_preimage_bytes(game_id, movement, action, direction, salt)
+        )
+
+    return op.mimc(
+        op.MiMCConfigurations.BLS12_381Mp111,
+        build_turn_preimage_fr32(game_id, movement, action, direction, salt),
+    )
+
+
+# Get the opcode budget of a whole `reveal_turn` call: its checks and box writes, the move validation,
+# and the MiMC hash for games using the MiMC commit scheme (sha reveals skip that part entirely)
+@subroutine
+def get_reveal_turn_budget(commit_scheme: UInt64, n_moves: UInt64) -> UInt64:
+    budget = cst.REVEAL_TURN_BASE_BUDGET + cst.REVEAL_MOVE_COST * n_moves
+    if commit_scheme == cst.COMMIT_SCHEME_MIMC:
+        budget += cst.MIMC_BASE_COST + cst.MIMC_ELEMENT_COST * (
+            cst.TURN_PREIMAGE_FIXED_FIELDS + 2 * n_moves
+        )
+    return budget
+
+
 # Convert game grid array index to its equivalent row and col coordinates
 @subroutine
 def convert_grid_index_to_coords(i: arc4.UInt8) -> ta.CoordsPair:
@@ -205,24 +296,150 @@ def get_grid_cell_value(
     assert game_id in box_game_grid, err.GAME_ID_NOT_FOUND
     assert i.native < cst.GRID_CELL_TOTAL, err.INVALID_POS_INDEX
 
-    # Access the game grid box contents, at the given index, and return the byte value
-    return box_game_grid[game_id][i.native]
+    # Read only the packed byte holding the cell from the game grid box, then extract the cell bits
+    game_grid_bref = BoxRef(key=box_game_grid.key_prefix + op.itob(game_id))
+    packed = game_grid_bref.extract(i.native // cst.GRID_CELLS_PER_BYTE, 1)
+    return arc4.UInt8(unpack_grid_cell(op.btoi(packed), i.native))
+
+
+# Get the MiMC digest the previous `mimc_absorb` call of the group left in scratch space
+# This is how a method consumes a chained hash: the client groups it right after the last chunk call,
+# and the method compares the digest read here against the preimage it expects (e.g. the grid cells)
+@subroutine
+def load_mimc_chain_digest() -> Bytes:
+    # Fail transaction unless the assertion below evaluates True
+    assert Txn.group_index > 0, err.INVALID_MIMC_CHAIN
+    prev_txn = gtxn.ApplicationCallTransaction(Txn.group_index - 1)
+    assert prev_txn.app_id == Global.current_application_id and prev_txn.app_args(
+        0
+    ) == arc4.arc4_signature(cst.MIMC_ABSORB_SIGNATURE), err.INVALID_MIMC_CHAIN
+    return op.gload_bytes(Txn.group_index - 1, cst.MIMC_CHAIN_SLOT)
+
+
+# Hash a grid Merkle leaf up to the root, one `op.mimc` of two nodes per level
+@subroutine
+def compute_grid_root(i: UInt64, leaf: Bytes, proof: ta.GridMerkleProof) -> Bytes:
+    node = leaf
+    for sibling in proof:
+        # The lowest index bit tells if the node is the left or the right child of its parent
+        if i % 2 == 0:
+            node = op.mimc(op.MiMCConfigurations.BLS12_381Mp111, node + sibling.bytes)
+        else:
+            node = op.mimc(op.MiMCConfigurations.BLS12_381Mp111, sibling.bytes + node)
+        i //= 2
+    return node
+
+
+# Replace a grid cell leaf in a grid root, after proving its old value against the root
+# Return the new root, computed w/ the same siblings as the old value path
+@subroutine
+def apply_grid_root_change(
+    root: Bytes,
+    i: UInt64,
+    old_value: UInt64,
+    new_value: UInt64,
+    proof: ta.GridMerkleProof,
+) -> Bytes:
+    # Fail transaction unless the assertion below evaluates True
+    assert (
+        compute_grid_root(i, u8_to_fr32(arc4.UInt8(old_value)), proof) == root
+    ), err.INVALID_GRID_PROOF
+    return compute_grid_root(i, u8_to_fr32(arc4.UInt8(new_value)), proof)
+
+
+# Replace a grid cell leaf in the game state grid root, after proving its old value against the root
+@subroutine
+def update_grid_root(
+    game_id: UInt64,
+    box_game_state: BoxMap[UInt64, stc.GameState],
+    i: UInt64,
+    old_value: UInt64,
+    new_value: UInt64,
+    proof: ta.GridMerkleProof,
+) -> None:
+    # Ensure transaction has sufficient opcode budget to rehash both leaf paths
+    ensure_budget(
+        required_budget=cst.GRID_ROOT_UPDATE_BUDGET,
+        fee_source=OpUpFeeSource.GroupCredit,
+    )
+
+    # Read and write only the grid root bytes of the game state box
+    game_state_bref = BoxRef(key=box_game_state.key_prefix + op.itob(game_id))
+    root = game_state_bref.extract(cst.GAME_STATE_GRID_ROOT_OFFSET, cst.MIMC_FR_SIZE)
+    game_state_bref.replace(
+        cst.GAME_STATE_GRID_ROOT_OFFSET,
+        apply_grid_root_change(root, i, old_value, new_value, proof),
+    )
+
+
+# Get the value of the grid cell at index i, w/ `grid` being the game grid box bytes
+@subroutine
+def get_grid_cell(grid: Bytes, i: UInt64) -> UInt64:
+    return unpack_grid_cell(op.getbyte(grid, i // cst.GRID_CELLS_PER_BYTE), i)
+
+
+# Get a copy of the game grid box bytes w/ the grid cell at index i set to value
+@subroutine
+def set_grid_cell(grid: Bytes, i: UInt64, value: UInt64) -> Bytes:
+    byte_index = i // cst.GRID_CELLS_PER_BYTE
+    shift = grid_cell_shift(i)
+    packed = op.getbyte(grid, byte_index)
+    packed = (packed & ~(UInt64(cst.GRID_CELL_MASK) << shift)) | (value << shift)
+    return op.setbyte(grid, byte_index, packed)
+
+
+# Get the lobby slot of the present character standing on grid cell i, other than `skip_slot`
+# Return MAX_LOBBY_SIZE if no such character exists, `present` is a bitmask of lobby slots
+@subroutine
+def find_character_at(
+    characters: ta.GameCharacters, present: UInt64, i: UInt64, skip_slot: UInt64
+) -> UInt64:
+    for slot in urange(cst.MAX_LOBBY_SIZE):
+        if (
+            slot != skip_slot
+            and (present >> slot) & 1 == 1
+            and characters[slot].position.native == i
+        ):
+            return slot
+    return UInt64(cst.MAX_LOBBY_SIZE)
 
 
 # Set the value of a grid cell at the equivalent flattened 1D array index
+# Keep the game state grid root in sync, rehashing only the cell path given by `proof`
 @subroutine
 def set_grid_cell_value_at_index(
     game_id: UInt64,
     box_game_grid: BoxMap[UInt64, ta.GameGrid],
+    box_game_state: BoxMap[UInt64, stc.GameState],
     i: arc4.UInt8,
     value: arc4.UInt8,
+    proof: ta.GridMerkleProof,
 ) -> None:
     # Fail transaction unless the assertion below evaluates True
     assert game_id in box_game_grid, err.BOX_NOT_FOUND
+    assert game_id in box_game_state, err.GAME_ID_NOT_FOUND
     assert i.native < cst.GRID_CELL_TOTAL, err.INVALID_POS_INDEX
+    assert value.native <= cst.GRID_CELL_MASK, err.INVALID_CELL_VALUE
 
-    # Access the game grid box contents, at the given index, and update the byte value
-    box_game_grid[game_id][i.native] = value
+    # Read only the packed byte holding the cell from the game grid box
+    game_grid_bref = BoxRef(key=box_game_grid.key_prefix + op.itob(game_id))
+    byte_index = i.native // cst.GRID_CELLS_PER_BYTE
+    packed = op.btoi(game_grid_bref.extract(byte_index, 1))
+
+    # Rehash the cell path into the grid root
+    update_grid_root(
+        game_id,
+        box_game_state,
+        i.native,
+        unpack_grid_cell(packed, i.native),
+        value.native,
+        proof,
+    )
+
+    # Clear the cell bits, set them to the new value, then write the single byte back
+    shift = grid_cell_shift(i.native)
+    packed = (packed & ~(UInt64(cst.GRID_CELL_MASK) << shift)) | (value.native << shift)
+    game_grid_bref.replace(byte_index, op.extract(op.itob(packed), 7, 1))
 
 
 # Set the value of a grid cell at the equivalent x and y coordinates
@@ -230,48 +447,142 @@ def set_grid_cell_value_at_index(
 def set_grid_cell_value_at_coords(
     game_id: UInt64,
     box_game_grid: BoxMap[UInt64, ta.GameGrid],
+    box_game_state: BoxMap[UInt64, stc.GameState],
     row: arc4.UInt8,
     col: arc4.UInt8,
     value: arc4.UInt8,
+    proof: ta.GridMerkleProof,
 ) -> None:
     set_grid_cell_value_at_index(
-        game_id, box_game_grid, convert_grid_coords_to_index(row, col), value
+        game_id,
+        box_game_grid,
+        box_game_state,
+        convert_grid_coords_to_index(row, col),
+        value,
+        proof,
     )
 
 
-# Check if account is an active player of a game
+# Check if account is an active player of a game, reading only its lobby slot
 @subroutine
 def check_acc_in_game(
     game_id: UInt64,
     account: Account,
     box_game_lobby: BoxMap[UInt64, Bytes],
-    player_count: UInt64,
+    lobby_slot: UInt64,
     clear_player: bool,  # noqa: FBT001
 ) -> bool:
-    # Calculate total byte length to iterate over based on player count and address size
-    game_lobby_length = player_count * cst.ADDRESS_SIZE
+    # Calculate the start index of the player address from its lobby slot and address size
+    start = lobby_slot * cst.ADDRESS_SIZE
 
-    # Initialize flag to track if account is found in game
-    acc_in_game = False
+    # Reference the game lobby box directly, so only the 32 bytes at the slot are read
+    game_lobby_bref = BoxRef(key=box_game_lobby.key_prefix + op.itob(game_id))
 
-    # Iterate through the lobby byte array length in 32-byte chunks (one address per chunk)
-    for i in urange(0, game_lobby_length, cst.ADDRESS_SIZE):
-        # Extract the 32-byte player address at start index i
-        player_addr_bytes = op.extract(box_game_lobby[game_id], i, cst.ADDRESS_SIZE)
+    # A slot past the end of the lobby box can not hold the account
+    if start + cst.ADDRESS_SIZE > game_lobby_bref.length:
+        return False
 
-        # Check if the extracted player address bytes match up with the account bytes
-        if account.bytes == player_addr_bytes:
-            acc_in_game = True
+    # Check if the 32-byte player address at the slot matches up with the account bytes
+    if game_lobby_bref.extract(start, cst.ADDRESS_SIZE) != account.bytes:
+        return False
 
-            # Optionally, clear this player from the box by replacing their address with zero bytes
-            if clear_player:
-                game_lobby_bref = BoxRef(
-                    key=box_game_lobby.key_prefix + op.itob(game_id)
-                )
-                game_lobby_bref.replace(i, cst.ZEROED_ADDR_BYTES)
+    # Optionally, clear this player from the box by replacing their address with zero bytes
+    if clear_player:
+        game_lobby_bref.replace(start, cst.ZEROED_ADDR_BYTES)
+
+    # Account was found in the game
+    return True
+
+
+# Get the start index of a lobby slot player address inside a unified game record
+@subroutine
+def game_record_lobby_offset(lobby_slot: UInt64) -> UInt64:
+    return cst.GAME_RECORD_LOBBY_OFFSET + lobby_slot * cst.ADDRESS_SIZE
+
+
+# Get the start index of a lobby slot game character inside a unified game record
+@subroutine
+def game_record_character_offset(lobby_slot: UInt64) -> UInt64:
+    return cst.GAME_RECORD_CHARACTERS_OFFSET + lobby_slot * cst.GAME_CHARACTER_SIZE
+
+
+# Check if account holds the given lobby slot of a unified game record, reading only that slot
+@subroutine
+def check_acc_in_game_record(
+    game_id: UInt64,
+    account: Account,
+    box_game_record: BoxMap[UInt64, Bytes],
+    lobby_slot: UInt64,
+) -> bool:
+    # A slot past the fixed lobby section can not hold the account
+    if lobby_slot >= cst.MAX_LOBBY_SIZE:
+        return False
+
+    # Compare the account bytes w/ the 32-byte player address at the slot
+    game_record_bref = BoxRef(key=box_game_record.key_prefix + op.itob(game_id))
+    return (
+        game_record_bref.extract(game_record_lobby_offset(lobby_slot), cst.ADDRESS_SIZE)
+        == account.bytes
+    )
 
-            # Exit loop early since sender was found
-            break
 
-    # Return True if account was found in the game, else False
-    return acc_in_game
+# Get the stake tier of a stake amount, from 0 up to STAKE_TIER_COUNT - 1
+@subroutine
+def get_stake_tier(amount: UInt64) -> UInt64:
+    if amount >= cst.STAKE_TIER_3:
+        return UInt64(3)
+    if amount >= cst.STAKE_TIER_2:
+        return UInt64(2)
+    if amount >= cst.STAKE_TIER_1:
+        return UInt64(1)
+    return UInt64(0)
+
+
+# Get the open lobby index bucket of a lobby size and stake tier, the key of its index box
+@subroutine
+def get_open_lobby_bucket(lobby_size: UInt64, stake_tier: UInt64) -> UInt64:
+    return (lobby_size // 2 - 1) * cst.STAKE_TIER_COUNT + stake_tier
+
+
+# Append a game id to an open lobby index bucket, return True if the game got listed
+# Games whose bucket box was not created yet, or is full, are not listed; callers record the flag
+# in `GameState.open_lobby_listed`, so only listed games are ever removed again
+@subroutine
+def add_open_lobby(
+    box_open_lobbies: BoxMap[UInt64, Bytes], bucket: UInt64, game_id: UInt64
+) -> bool:
+    if bucket not in box_open_lobbies:
+        return False
+
+    # Write the id after the last entry, then bump the count; both are single patches
+    open_lobby_bref = BoxRef(key=box_open_lobbies.key_prefix + op.itob(bucket))
+    count = op.btoi(open_lobby_bref.extract(0, 8))
+    if count >= cst.OPEN_LOBBY_CAPACITY:
+        return False
+    open_lobby_bref.replace(cst.OPEN_LOBBY_IDS_OFFSET + count * 8, op.itob(game_id))
+    open_lobby_bref.replace(0, op.itob(count + 1))
+    return True
+
+
+# Remove a listed game id from an open lobby index bucket, moving the last entry into its place
+@subroutine
+def remove_open_lobby(
+    box_open_lobbies: BoxMap[UInt64, Bytes], bucket: UInt64, game_id: UInt64
+) -> None:
+    # Fail transaction unless the assertion below evaluates True
+    assert bucket in box_open_lobbies, err.OPEN_LOBBY_NOT_FOUND
+
+    # Read the used entries once and look up the game id
+    open_lobby_bref = BoxRef(key=box_open_lobbies.key_prefix + op.itob(bucket))
+    count = op.btoi(open_lobby_bref.extract(0, 8))
+    ids = open_lobby_bref.extract(cst.OPEN_LOBBY_IDS_OFFSET, count * 8)
+    found = False
+    for i in urange(count):
+        if op.extract_uint64(ids, i * 8) == game_id:
+            open_lobby_bref.replace(
+                cst.OPEN_LOBBY_IDS_OFFSET + i * 8, op.extract(ids, (count - 1) * 8, 8)
+            )
+            open_lobby_bref.replace(0, op.itob(count - 1))
+            found = True
+            break
+    assert found, err.OPEN_LOBBY_NOT_FOUND
@@ -3,8 +3,28 @@ from typing import Literal, TypeAlias
 
 from algopy import arc4
 
-# 11x11 game grid represented as a 1D flattened static array of 121 cells
-GameGrid: TypeAlias = arc4.StaticArray[arc4.UInt8, Literal[121]]
+from . import structs as stc
+
+# 11x11 game grid represented as a 1D flattened array of 121 cells, bit-packed 2 bits per cell in 31 bytes
+GameGrid: TypeAlias = arc4.StaticArray[arc4.Byte, Literal[31]]
+
+# Game characters of a game, one fixed-size slot per lobby slot (MAX_LOBBY_SIZE slots)
+GameCharacters: TypeAlias = arc4.StaticArray[stc.GameCharacter, Literal[4]]
+
+# Dynamic array of signed turn commitments submitted together by a relay
+SignedTurnCommits: TypeAlias = arc4.DynamicArray[stc.SignedTurnCommit]
+
+# Sibling nodes of a grid cell leaf, from the leaf level up to the root (GRID_MERKLE_DEPTH nodes)
+GridMerkleProof: TypeAlias = arc4.StaticArray[arc4.UInt256, Literal[7]]
+
+# Dynamic array of grid Merkle proofs, one per changed grid cell
+GridMerkleProofs: TypeAlias = arc4.DynamicArray[GridMerkleProof]
+
+# Number of hits each lobby slot took in a resolved round
+RoundHits: TypeAlias = arc4.StaticArray[arc4.UInt8, Literal[4]]
+
+# Page of open game ids from an open lobby index bucket
+GameIds: TypeAlias = arc4.DynamicArray[arc4.UInt64]
 
 # Dynamic array of user addresses denoting the game lobby
 GameLobby: TypeAlias = arc4.DynamicArray[arc4.Address]
@@ -0,0 +1,115 @@
+# tests/abi_args_benchmark.py
+# Microbenchmark of the generated client ABI helpers vs. the post-processed fast-path ones
+# Run w/ `python -m tests.abi_args_benchmark`
+import dataclasses
+import timeit
+import typing
+
+import algokit_utils
+
+from smart_contracts.artifacts.plonk_verifier import plonk_verifier_client as pv
+from tests.zk_binary_test import make_proof
+from utils.fr import R
+from utils.zk_models import LagrangeWitness
+
+
+# Reference copy of the helpers emitted by algokit-client-generator
+def reference_parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(
+                convert_dataclass(getattr(value, field.name))
+                for field in dataclasses.fields(value)
+            )
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [
+                getattr(args, field.name) for field in dataclasses.fields(args)
+            ]
+        case _:
+            raise ValueError(
+                "Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments."
+            )
+
+    return (
+        [
+            (
+                convert_dataclass(arg)
+                if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument)
+                else arg
+            )
+            for arg in method_args
+        ]
+        if method_args
+        else None
+    )
+
+
+def reference_init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = reference_init_dataclass(
+                typing.cast(type, field.type), field_value
+            )
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+
+# Build `verify` args the way the localnet tests submit them
+def make_verify_args() -> tuple:
+    proof = make_proof(1)
+    lw = LagrangeWitness(l=(0, *range(1, 9)), xin=R - 2, zh=R - 3)
+    return list(range(8)), proof, lw
+
+
+if __name__ == "__main__":
+    args = make_verify_args()
+    verify_args = pv.VerifyArgs(
+        signals=args[0],
+        proof=pv.Proof(**dataclasses.asdict(args[1])),
+        lw=pv.LagrangeWitness(L=list(args[2].l), xin=args[2].xin, zh=args[2].zh),
+    )
+    encoded = {"A": b"\x00" * 96, "eval_a": 1}
+    number = 20_000
+
+    for label, reference, fast, arg in [
+        ("parse tuple args", reference_parse_abi_args, pv._parse_abi_args, args),
+        ("parse VerifyArgs", reference_parse_abi_args, pv._parse_abi_args, verify_args),
+    ]:
+        assert reference(arg) == fast(arg)
+        slow_s = timeit.timeit(lambda: reference(arg), number=number)  # noqa: B023
+        fast_s = timeit.timeit(lambda: fast(arg), number=number)  # noqa: B023
+        print(
+            f"{label:<18} reference {slow_s / number * 1e6:6.2f} us"
+            f" | fast {fast_s / number * 1e6:6.2f} us | x{slow_s / fast_s:.1f}"
+        )
+
+    data = dataclasses.asdict(verify_args.proof)
+    slow_s = timeit.timeit(
+        lambda: reference_init_dataclass(pv.Proof, data), number=number
+    )
+    fast_s = timeit.timeit(lambda: pv._init_dataclass(pv.Proof, data), number=number)
+    print(
+        f"{'init Proof':<18} reference {slow_s / number * 1e6:6.2f} us"
+        f" | fast {fast_s / number * 1e6:6.2f} us | x{slow_s / fast_s:.1f}"
+    )
@@ -0,0 +1,58 @@
+# tests/app_call_fee_test.py
+import pytest
+from algosdk.transaction import SuggestedParams
+
+from smart_contracts.salvo import constants as cst
+from utils.app_call_fee import budget_fee, fee_budget, with_flat_fee
+from utils.mimc_absorb import mimc_absorb_fee
+from utils.turn_commit import commit_turns_fee
+
+
+def make_sp() -> SuggestedParams:
+    return SuggestedParams(
+        fee=0, first=10, last=1010, gh="A" * 43 + "=", min_fee=1_000, flat_fee=True
+    )
+
+
+def test_budget_fee() -> None:
+    assert budget_fee(0) == 1_000
+    assert budget_fee(1) == budget_fee(700) == 2_000
+    assert budget_fee(701) == 3_000
+    assert budget_fee(701, min_fee=2_000) == 6_000
+    for required in range(0, 5_000, 97):
+        assert fee_budget(budget_fee(required)) >= required + 700
+
+
+def test_with_flat_fee() -> None:
+    sp = with_flat_fee(make_sp(), 5_000)
+
+    assert (sp.fee, sp.flat_fee, sp.min_fee) == (5_000, True, 1_000)
+    assert (sp.first, sp.last, sp.gh) == (10, 1010, "A" * 43 + "=")
+
+
+# Each helper fee must pay for the opcode budget its contract method ensures
+@pytest.mark.parametrize(
+    ("fee", "required"),
+    [
+        *(
+            (
+                commit_turns_fee(n),
+                cst.ED25519_VERIFY_COST * n + cst.COMMIT_TURNS_BASE_BUDGET,
+            )
+            for n in range(1, cst.MAX_LOBBY_SIZE + 1)
+        ),
+        *(
+            (
+                mimc_absorb_fee(elements * 32, is_first=is_first),
+                cst.MIMC_ABSORB_BASE_BUDGET
+                + cst.MIMC_BASE_COST
+                + cst.MIMC_ELEMENT_COST * (elements + (0 if is_first else 1)),
+            )
+            for elements in range(1, cst.MIMC_CHUNK_MAX_ELEMENTS + 1)
+            for is_first in (True, False)
+        ),
+    ],
+)
+def test_fee_covers_budget(fee: int, required: int) -> None:
+    # The app call itself adds one budget share on top of its OpUp inner calls
+    assert fee_budget(fee) - 700 >= required
@@ -0,0 +1,126 @@
+# tests/bitboard_test.py
+import random
+from collections import deque
+
+import pytest
+
+from salvo_engine import (
+    CELL_OBSTACLE,
+    Bitboard,
+    cell_bit,
+    check_move_sequence,
+    iter_cells,
+    neighbors,
+    shift_east,
+    shift_north,
+    shift_south,
+    shift_west,
+)
+from smart_contracts.salvo import constants as cst
+from smart_contracts.salvo import errors as err
+
+
+# Random 121 grid cell values w/ obstacle and occupied cells
+def random_box(rng: random.Random) -> bytes:
+    return bytes(rng.choices((0, 1, 2), weights=(7, 2, 1))[0] for _ in range(121))
+
+
+# Naive BFS over the byte grid, returning the reachable cells and their distances
+def ref_distances(box: bytes, position: tuple[int, int]) -> dict[tuple[int, int], int]:
+    dist = {position: 0}
+    queue = deque([position])
+    while queue:
+        row, col = queue.popleft()
+        for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if (
+                0 <= r < cst.GRID_SIZE
+                and 0 <= c < cst.GRID_SIZE
+                and (r, c) not in dist
+                and box[r * cst.GRID_SIZE + c] == 0
+            ):
+                dist[(r, c)] = dist[(row, col)] + 1
+                queue.append((r, c))
+    return dist
+
+
+def test_box_round_trip() -> None:
+    rng = random.Random(1)
+    for _ in range(50):
+        box = random_box(rng)
+        board = Bitboard.from_cells(box)
+        assert board.to_cells() == box
+        assert set(iter_cells(board.free)) == {
+            divmod(i, cst.GRID_SIZE) for i, v in enumerate(box) if v == 0
+        }
+
+    with pytest.raises(ValueError, match="121 bytes"):
+        Bitboard.from_cells(bytes(120))
+    with pytest.raises(ValueError, match="Unknown grid cell value"):
+        Bitboard.from_cells(bytes(120) + b"\x07")
+    with pytest.raises(ValueError, match="both"):
+        Bitboard(obstacles=cell_bit(0, 0), occupancy=cell_bit(0, 0))
+
+
+def test_shifts_respect_row_edges() -> None:
+    for row in range(cst.GRID_SIZE):
+        for col in range(cst.GRID_SIZE):
+            bit = cell_bit(row, col)
+            assert list(iter_cells(shift_north(bit))) == (
+                [(row - 1, col)] if row > 0 else []
+            )
+            assert list(iter_cells(shift_south(bit))) == (
+                [(row + 1, col)] if row < 10 else []
+            )
+            assert list(iter_cells(shift_west(bit))) == (
+                [(row, col - 1)] if col > 0 else []
+            )
+            assert list(iter_cells(shift_east(bit))) == (
+                [(row, col + 1)] if col < 10 else []
+            )
+
+
+def test_moves_match_reference_engine() -> None:
+    rng = random.Random(2)
+    for _ in range(100):
+        box = random_box(rng)
+        board = Bitboard.from_cells(box)
+        position = (rng.randrange(11), rng.randrange(11))
+        movement = []
+        current = position
+        for _ in range(rng.randint(1, 6)):
+            options = list(iter_cells(neighbors(cell_bit(*current))))
+            current = rng.choice(options)
+            movement.append(current)
+        assert board.is_move_sequence_valid(position, movement) == check_move_sequence(
+            box, position, movement
+        )
+
+
+def test_reachability_matches_bfs() -> None:
+    rng = random.Random(3)
+    for _ in range(50):
+        box = random_box(rng)
+        board = Bitboard.from_cells(box)
+        position = (rng.randrange(11), rng.randrange(11))
+        dist = ref_distances(box, position)
+        assert set(iter_cells(board.reachable(position))) == set(dist)
+        for max_steps in (0, 1, 3, 5):
+            expected = {cell for cell, d in dist.items() if d <= max_steps}
+            assert set(iter_cells(board.reachable(position, max_steps))) == expected
+        target = (rng.randrange(11), rng.randrange(11))
+        assert board.can_reach(position, target, 4) == (dist.get(target, 99) <= 4)
+
+
+def test_updates() -> None:
+    board = Bitboard(occupancy=cell_bit(0, 0))
+    assert board.can_reach((0, 0), (0, 2), 2)
+
+    blocked = board.with_obstacle(0, 1).with_obstacle(1, 0)
+    assert not blocked.can_reach((0, 0), (0, 2))
+    assert blocked.to_cells()[1] == CELL_OBSTACLE
+    assert blocked.with_obstacle(0, 1, present=False).can_reach((0, 0), (0, 2), 2)
+
+    moved = board.with_move((0, 0), (5, 5))
+    assert moved.is_path_cell(0, 0) and not moved.is_path_cell(5, 5)
+    with pytest.raises(ValueError, match=err.INVALID_POS_COORDS):
+        board.is_move_valid((0, 0), (0, 11))
@@ -0,0 +1,111 @@
+# tests/fr_test.py
+import random
+
+import pytest
+
+from utils.fr import (
+    R,
+    calc_challenges,
+    calc_lagrange_witness,
+    fr_batch_inv,
+    fr_div,
+    fr_inv,
+    fr_mul,
+    fr_pow,
+    fr_sub,
+)
+from utils.zk_models import Proof, VerificationKey
+
+# Multiplicative generator of the BLS12-381 scalar field
+FR_GENERATOR = 7
+
+
+# Build a verification key and proof filled w/ deterministic pseudo-random bytes (transcript only hashes them)
+def make_vk_and_proof(power: int, n_public: int) -> tuple[VerificationKey, Proof]:
+    rng = random.Random(power * 1_000 + n_public)
+
+    def point() -> bytes:
+        return rng.randbytes(96)
+
+    vk = VerificationKey(
+        Qm=point(),
+        Ql=point(),
+        Qr=point(),
+        Qo=point(),
+        Qc=point(),
+        S1=point(),
+        S2=point(),
+        S3=point(),
+        power=power,
+        nPublic=n_public,
+        k1=2,
+        k2=3,
+        X_2=rng.randbytes(192),
+    )
+    proof = Proof(
+        A=point(),
+        B=point(),
+        C=point(),
+        Z=point(),
+        T1=point(),
+        T2=point(),
+        T3=point(),
+        Wxi=point(),
+        Wxiw=point(),
+        **{
+            key: rng.randrange(R)
+            for key in ["eval_a", "eval_b", "eval_c", "eval_s1", "eval_s2", "eval_zw"]
+        },
+    )
+    return vk, proof
+
+
+def test_batch_inv_matches_single_inverses() -> None:
+    rng = random.Random(1)
+    values = [rng.randrange(1, R) for _ in range(64)]
+
+    assert fr_batch_inv(values) == [fr_inv(v) for v in values]
+    assert fr_batch_inv([]) == []
+
+
+def test_batch_inv_rejects_zero() -> None:
+    with pytest.raises(ValueError, match="Fr inverse of zero"):
+        fr_batch_inv([3, R, 5])
+
+
+def test_lagrange_witness_matches_naive_formula() -> None:
+    power, n_public = 4, 5
+    vk, proof = make_vk_and_proof(power, n_public)
+    signals = list(range(1, n_public + 1))
+    w = fr_pow(FR_GENERATOR, (R - 1) >> power)
+
+    lw = calc_lagrange_witness(vk, signals, proof, w)
+    xi = calc_challenges(vk, signals, proof).xi
+
+    n = 1 << power
+    assert lw.xin == fr_pow(xi, n)
+    assert lw.zh == fr_sub(lw.xin, 1)
+    assert lw.l[0] == 0
+    assert lw.l[1:] == tuple(
+        fr_div(fr_mul(fr_pow(w, i), lw.zh), fr_mul(n, fr_sub(xi, fr_pow(w, i))))
+        for i in range(n_public)
+    )
+
+
+def test_lagrange_basis_sums_to_one_over_full_domain() -> None:
+    power = 3
+    vk, proof = make_vk_and_proof(power, 1 << power)
+    signals = [0] * (1 << power)
+    w = fr_pow(FR_GENERATOR, (R - 1) >> power)
+
+    lw = calc_lagrange_witness(vk, signals, proof, w)
+
+    assert sum(lw.l) % R == 1
+
+
+def test_lagrange_witness_without_public_signals_has_one_entry() -> None:
+    vk, proof = make_vk_and_proof(2, 0)
+
+    lw = calc_lagrange_witness(vk, [], proof, fr_pow(FR_GENERATOR, (R - 1) >> 2))
+
+    assert len(lw.l) == 2
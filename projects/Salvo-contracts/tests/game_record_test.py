@@ -0,0 +1,104 @@
+# tests/game_record_test.py
+import pytest
+from algosdk import account
+
+from salvo_engine import (
+    Bitboard,
+    GameRecord,
+    decode_game_characters,
+    game_record_character_offset,
+    game_record_lobby_offset,
+)
+from salvo_engine.game_record import GAME_CHARACTER_TYPE, GAME_STATE_TYPE
+from smart_contracts.salvo import constants as cst
+
+
+# Build a record value the way `new_game_record` patches a zeroed box
+def make_record(creator: str, grid: bytes) -> bytearray:
+    record = bytearray(cst.GAME_RECORD_SIZE)
+    state = GAME_STATE_TYPE.encode(
+        [
+            False,
+            4,
+            1,
+            32,
+            1_000,
+            5_000_000,
+            creator,
+            int.from_bytes(cst.EMPTY_GRID_ROOT, "big"),
+            cst.COMMIT_SCHEME_SHA256,
+            1,
+            True,
+            2,
+        ]
+    )
+    record[cst.GAME_RECORD_STATE_OFFSET : cst.GAME_RECORD_LOBBY_OFFSET] = state
+    start = game_record_lobby_offset(0)
+    record[start : start + cst.ADDRESS_SIZE] = GAME_STATE_TYPE.child_types[6].encode(
+        creator
+    )
+    start = game_record_character_offset(0)
+    character = GAME_CHARACTER_TYPE.encode([False, False, 6, 0, 0, 5, 5, 0, 1, 0])
+    record[start : start + cst.GAME_CHARACTER_SIZE] = character
+    record[cst.GAME_RECORD_GRID_OFFSET : cst.GAME_RECORD_CHARACTERS_OFFSET] = grid
+    return record
+
+
+def test_layout_matches_struct_sizes() -> None:
+    assert GAME_STATE_TYPE.byte_len() == cst.GAME_STATE_SIZE
+    assert GAME_CHARACTER_TYPE.byte_len() == cst.GAME_CHARACTER_SIZE
+    assert cst.GAME_RECORD_SIZE == (
+        cst.GAME_STATE_SIZE
+        + cst.MAX_LOBBY_SIZE * (cst.ADDRESS_SIZE + cst.GAME_CHARACTER_SIZE)
+        + cst.GRID_PACKED_SIZE
+    )
+    assert game_record_character_offset(cst.MAX_LOBBY_SIZE) == cst.GAME_RECORD_SIZE
+
+    # One box replaces four, along w/ their 2_500 base MBR each
+    assert cst.BOX_M_COST == 2_500 + 400 * (10 + cst.GAME_RECORD_SIZE)
+    lobby = 2_500 + 400 * (10 + cst.ADDRESS_SIZE * cst.MAX_LOBBY_SIZE)
+    assert cst.BOX_M_COST < cst.BOX_G_COST + cst.BOX_S_COST + lobby + cst.BOX_C_COST
+
+
+def test_decode() -> None:
+    creator = account.generate_account()[1]
+    board = Bitboard().with_obstacle(2, 3)
+    record = GameRecord.decode(make_record(creator, board.to_box()))
+
+    assert record.state["admin_address"] == creator
+    assert record.state["lobby_size"] == 4
+    assert record.state["commit_scheme"] == cst.COMMIT_SCHEME_SHA256
+    assert record.state["stake_tier"] == 1
+    assert record.state["open_lobby_listed"] is True
+    assert record.state["round_count"] == 2
+    assert record.state["grid_root"].to_bytes(32, "big") == cst.EMPTY_GRID_ROOT
+    assert record.lobby == (creator, None, None, None)
+    assert record.lobby_slot(creator) == 0
+    assert record.characters[0]["lobby_slot"] == 0
+    assert record.characters[0]["move_points"] == 0
+    assert Bitboard.from_cells(record.grid) == board
+
+    with pytest.raises(ValueError, match="not in the game lobby"):
+        record.lobby_slot(account.generate_account()[1])
+    with pytest.raises(ValueError, match="415 bytes"):
+        GameRecord.decode(bytes(100))
+
+
+def test_decode_game_characters() -> None:
+    value = bytearray(cst.GAME_CHARACTER_SIZE * cst.MAX_LOBBY_SIZE)
+    start = 2 * cst.GAME_CHARACTER_SIZE
+    value[start : start + cst.GAME_CHARACTER_SIZE] = GAME_CHARACTER_TYPE.encode(
+        [True, True, 7, 2, 1, 60, 61, 3, 2, 12345]
+    )
+    characters = decode_game_characters(value)
+
+    assert len(characters) == cst.MAX_LOBBY_SIZE
+    assert characters[2]["lobby_slot"] == 2
+    assert characters[2]["turn_hash"] == 12345
+    assert characters[2]["has_committed_turn"] is True
+    assert characters[2]["has_revealed_turn"] is True
+    assert characters[2]["target"] == 61
+    assert not characters[0]["has_committed_turn"]
+
+    with pytest.raises(ValueError, match="160 bytes"):
+        decode_game_characters(bytes(cst.GAME_CHARACTER_SIZE))
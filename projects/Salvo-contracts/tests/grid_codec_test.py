@@ -0,0 +1,70 @@
+# tests/grid_codec_test.py
+import random
+
+import numpy as np
+import pytest
+
+from salvo_engine import (
+    Bitboard,
+    get_packed_cell,
+    grids_from_boxes,
+    grids_from_cells,
+    pack_grid,
+    pack_grid_array,
+    unpack_grid,
+)
+from smart_contracts.salvo import constants as cst
+
+
+# Random 121 cell values over the full 2-bit range
+def random_cells(rng: random.Random) -> bytes:
+    return bytes(rng.randrange(cst.GRID_CELL_MASK + 1) for _ in range(121))
+
+
+# Naive packer: cell i goes into byte i // 4, first cell of a byte in the high bits
+def ref_pack(cells: bytes) -> bytes:
+    packed = bytearray(cst.GRID_PACKED_SIZE)
+    for i, value in enumerate(cells):
+        packed[i // 4] |= value << (6 - 2 * (i % 4))
+    return bytes(packed)
+
+
+def test_layout_constants() -> None:
+    assert cst.GRID_PACKED_SIZE == -(-cst.GRID_CELL_TOTAL * cst.GRID_CELL_BITS // 8)
+    assert cst.GRID_CELL_MASK == (1 << cst.GRID_CELL_BITS) - 1
+    assert len(cst.GRID_ZEROED_BYTES) == cst.GRID_PACKED_SIZE
+    # Box MBR: 2_500 base + 400 per byte of the 10-byte key and the packed value
+    assert cst.BOX_G_COST == 2_500 + 400 * (10 + cst.GRID_PACKED_SIZE)
+
+
+def test_round_trip_matches_reference() -> None:
+    rng = random.Random(1)
+    cells = [random_cells(rng) for _ in range(20)]
+    for c in cells:
+        packed = pack_grid(c)
+        assert packed == ref_pack(c)
+        assert unpack_grid(packed) == c
+        assert [get_packed_cell(packed, i) for i in range(121)] == list(c)
+
+    boxes = [pack_grid(c) for c in cells]
+    assert np.array_equal(grids_from_boxes(boxes), grids_from_cells(cells))
+    assert pack_grid_array(grids_from_cells(cells)).tobytes() == b"".join(boxes)
+
+
+def test_bitboard_box_round_trip() -> None:
+    board = Bitboard(occupancy=1 << 120).with_obstacle(0, 3).with_obstacle(5, 5)
+    box = board.to_box()
+    assert len(box) == cst.GRID_PACKED_SIZE
+    assert Bitboard.from_box(box) == board
+    assert get_packed_cell(box, 3) == 1 and get_packed_cell(box, 120) == 2
+
+
+def test_invalid_values() -> None:
+    with pytest.raises(ValueError, match="does not fit"):
+        pack_grid(bytes(120) + b"\x04")
+    with pytest.raises(ValueError, match="121 bytes"):
+        pack_grid(bytes(31))
+    with pytest.raises(ValueError, match="31 bytes"):
+        unpack_grid(bytes(121))
+    with pytest.raises(ValueError, match="out of range"):
+        get_packed_cell(bytes(31), 121)
@@ -0,0 +1,66 @@
+# tests/grid_merkle_test.py
+import random
+
+import pytest
+
+from smart_contracts.salvo import constants as cst
+from utils.grid_merkle import (
+    GridMerkleTree,
+    compute_grid_root,
+    grid_leaf,
+    verify_grid_proof,
+)
+from utils.mimc import mimc
+
+
+def random_cells(seed: int) -> bytes:
+    rng = random.Random(seed)
+    return bytes(rng.choice((0, 0, 0, 1, 2)) for _ in range(cst.GRID_CELL_TOTAL))
+
+
+# Reference root: hash the padded leaves level by level
+def ref_root(cells: bytes) -> bytes:
+    nodes = [grid_leaf(value) for value in cells]
+    nodes += [grid_leaf(0)] * (cst.GRID_MERKLE_LEAVES - len(nodes))
+    while len(nodes) > 1:
+        nodes = [mimc(nodes[j] + nodes[j + 1]) for j in range(0, len(nodes), 2)]
+    return nodes[0]
+
+
+def test_empty_grid_root() -> None:
+    assert cst.GRID_MERKLE_LEAVES == 1 << cst.GRID_MERKLE_DEPTH
+    assert GridMerkleTree(bytes(cst.GRID_CELL_TOTAL)).root == cst.EMPTY_GRID_ROOT
+
+
+def test_proofs() -> None:
+    cells = random_cells(1)
+    tree = GridMerkleTree(cells)
+    assert tree.root == ref_root(cells)
+
+    for i in (0, 1, 60, 119, 120):
+        proof = tree.proof(i)
+        assert len(proof) == cst.GRID_MERKLE_DEPTH
+        assert verify_grid_proof(tree.root, i, cells[i], proof)
+        assert not verify_grid_proof(tree.root, i, (cells[i] + 1) % 3, proof)
+        assert not verify_grid_proof(tree.root, i ^ 1, cells[i], proof)
+
+    with pytest.raises(ValueError, match="position index"):
+        tree.proof(cst.GRID_CELL_TOTAL)
+    with pytest.raises(ValueError, match="7 nodes"):
+        compute_grid_root(0, grid_leaf(0), tree.proof(0)[:-1])
+
+
+def test_set_cell_matches_rebuild() -> None:
+    cells = bytearray(random_cells(2))
+    tree = GridMerkleTree(cells)
+    rng = random.Random(3)
+    for _ in range(5):
+        i, value = rng.randrange(cst.GRID_CELL_TOTAL), rng.randrange(3)
+
+        # Same steps as `srt.update_grid_root`: check the old leaf, then rehash the new one
+        proof = tree.proof(i)
+        assert compute_grid_root(i, grid_leaf(cells[i]), proof) == tree.root
+        new_root = compute_grid_root(i, grid_leaf(value), proof)
+
+        cells[i] = value
+        assert tree.set_cell(i, value) == new_root == ref_root(bytes(cells))
@@ -0,0 +1,72 @@
+# tests/mimc_absorb_test.py
+import pytest
+from algosdk import account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+
+from smart_contracts.salvo import constants as cst
+from tests.app_call_fee_test import make_sp
+from utils.mimc import mimc
+from utils.mimc_absorb import (
+    MIMC_ABSORB_METHOD,
+    build_mimc_absorb_group,
+    mimc_absorb_fee,
+    mimc_chained,
+    split_mimc_chunks,
+)
+
+# Same preimage as `mimc_tester`: 121 field elements of value 1
+GRID_PREIMAGE = (bytes(31) + b"\x01") * cst.GRID_CELL_TOTAL
+
+
+def test_split() -> None:
+    chunks = split_mimc_chunks(GRID_PREIMAGE)
+
+    assert b"".join(chunks) == GRID_PREIMAGE
+    assert len(chunks) == 16
+    assert all(len(chunk) == 8 * 32 for chunk in chunks[:-1])
+    assert len(chunks[-1]) == 32
+
+    with pytest.raises(ValueError, match="positive multiple of 32"):
+        split_mimc_chunks(bytes(33))
+    with pytest.raises(ValueError, match="1 to 8 elements"):
+        split_mimc_chunks(GRID_PREIMAGE, 9)
+
+
+def test_chained_digest() -> None:
+    chunks = split_mimc_chunks(GRID_PREIMAGE)
+
+    # Each call hashes the previous digest followed by its chunk
+    digest = mimc(chunks[0])
+    for chunk in chunks[1:]:
+        digest = mimc(digest + chunk)
+    assert mimc_chained(chunks) == digest
+
+    # A preimage that fits one chunk hashes the same as a single `op.mimc`
+    assert mimc_chained(split_mimc_chunks(GRID_PREIMAGE[:256])) == mimc(
+        GRID_PREIMAGE[:256]
+    )
+
+
+def test_build_group() -> None:
+    private_key, address = account.generate_account()
+    atc = build_mimc_absorb_group(
+        address, AccountTransactionSigner(private_key), make_sp(), 1002, GRID_PREIMAGE
+    )
+    txns = [t.txn for t in atc.build_group()]
+
+    assert len(txns) == 16
+    assert txns[0].group is not None
+    for i, txn in enumerate(txns):
+        assert txn.app_args[0] == MIMC_ABSORB_METHOD.get_selector()
+        is_first = MIMC_ABSORB_METHOD.args[1].type.decode(txn.app_args[2])
+        assert is_first == (i == 0)
+    chunks = [MIMC_ABSORB_METHOD.args[0].type.decode(t.app_args[1]) for t in txns]
+    assert b"".join(bytes(chunk) for chunk in chunks) == GRID_PREIMAGE
+
+    # Peak per-call fee stays bounded by the chunk size instead of the preimage size
+    assert max(txn.fee for txn in txns) == mimc_absorb_fee(8 * 32, is_first=False)
+
+    with pytest.raises(ValueError, match="more than a group of 16"):
+        build_mimc_absorb_group(
+            address, None, make_sp(), 1002, GRID_PREIMAGE + bytes(32) * 8
+        )
@@ -0,0 +1,75 @@
+# tests/mimc_test.py
+import random
+
+import pytest
+from Cryptodome.Hash import keccak
+
+from utils.fr import R
+from utils.mimc import MiMC, mimc, mimc_batch, mimc_fields
+
+
+# Straightforward MiMC reference, written directly from the gnark-crypto definition
+def naive_mimc(elements: list[int]) -> int:
+    constants = []
+    rnd = keccak.new(digest_bits=256, data=b"seed").digest()
+    for _ in range(111):
+        rnd = keccak.new(digest_bits=256, data=rnd).digest()
+        constants.append(int.from_bytes(rnd, "big") % R)
+
+    h = 0
+    for m in elements:
+        x = m
+        for c in constants:
+            x = pow(x + h + c, 5, R)
+        h = (x + h + h + m) % R
+    return h
+
+
+# Build a preimage of `n` pseudo-random field elements
+def make_preimage(rng: random.Random, n: int) -> bytes:
+    return b"".join(rng.randrange(R).to_bytes(32, "big") for _ in range(n))
+
+
+def test_matches_naive_definition() -> None:
+    rng = random.Random(8)
+    preimage = make_preimage(rng, 5)
+    elements = [int.from_bytes(preimage[i : i + 32], "big") for i in range(0, 160, 32)]
+
+    assert int.from_bytes(mimc(preimage), "big") == naive_mimc(elements)
+    assert mimc_fields(elements) == naive_mimc(elements)
+
+
+def test_streaming_matches_one_shot() -> None:
+    rng = random.Random(9)
+    preimage = make_preimage(rng, 7)
+    hasher = MiMC()
+    cut = 0
+    while cut < len(preimage):
+        step = rng.randrange(1, 50)
+        hasher.update(preimage[cut : cut + step])
+        cut += step
+
+    assert hasher.digest() == mimc(preimage)
+    assert hasher.copy().hexdigest() == mimc(preimage).hex()
+
+
+def test_batch_matches_single_hashes() -> None:
+    rng = random.Random(10)
+    preimages = [make_preimage(rng, rng.randrange(1, 6)) for _ in range(20)]
+
+    assert mimc_batch(preimages) == [mimc(p) for p in preimages]
+
+
+@pytest.mark.parametrize(
+    ("preimage", "message"),
+    [
+        (b"", "cannot be empty"),
+        (bytes(33), "not a multiple of 32"),
+        (R.to_bytes(32, "big"), "element 0 is not in Fr"),
+    ],
+)
+def test_malformed_preimage_is_rejected(preimage: bytes, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        mimc(preimage)
+    with pytest.raises(ValueError, match=message):
+        mimc_batch([preimage])
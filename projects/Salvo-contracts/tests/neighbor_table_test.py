@@ -0,0 +1,45 @@
+# tests/neighbor_table_test.py
+import random
+
+from salvo_engine import (
+    NEIGHBOR_INDICES,
+    Bitboard,
+    build_neighbor_table,
+    cell_bit,
+    is_neighbor_path_cell,
+    neighbor_indices,
+    neighbors,
+)
+from smart_contracts.salvo import constants as cst
+from tests.bitboard_test import random_box
+
+
+def test_contract_table_matches_generator() -> None:
+    assert cst.NEIGHBOR_TABLE == build_neighbor_table()
+    assert len(cst.NEIGHBOR_TABLE) == cst.GRID_CELL_TOTAL * cst.NEIGHBOR_COUNT
+    assert NEIGHBOR_INDICES.shape == (cst.GRID_CELL_TOTAL, cst.NEIGHBOR_COUNT)
+
+
+def test_table_matches_bitboard_neighbors() -> None:
+    for i in range(cst.GRID_CELL_TOTAL):
+        row, col = divmod(i, cst.GRID_SIZE)
+        expected = neighbors(cell_bit(row, col))
+        assert sum(1 << n for n in neighbor_indices(i)) == expected
+
+    # Corners have two neighbors (N/W off the grid for the first cell), inner cells four
+    assert list(NEIGHBOR_INDICES[0]) == [cst.NEIGHBOR_NONE, 11, cst.NEIGHBOR_NONE, 1]
+    assert len(neighbor_indices(60)) == 4
+
+
+def test_single_moves_match_bitboard() -> None:
+    rng = random.Random(1)
+    for _ in range(20):
+        box = random_box(rng)
+        board = Bitboard.from_cells(box)
+        for _ in range(50):
+            # Mostly adjacent targets, so both valid and blocked moves come up
+            i = rng.randrange(121)
+            target = rng.choice([*neighbor_indices(i), rng.randrange(121)])
+            assert is_neighbor_path_cell(box, i, target) == board.is_move_valid(
+                divmod(i, 11), divmod(target, 11)
+            )
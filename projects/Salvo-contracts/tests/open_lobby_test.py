@@ -0,0 +1,56 @@
+# tests/open_lobby_test.py
+import pytest
+
+from salvo_engine import (
+    decode_open_lobby_index,
+    open_lobby_box_key,
+    open_lobby_bucket,
+    stake_tier,
+)
+from smart_contracts.salvo import constants as cst
+
+
+def test_layout() -> None:
+    assert cst.BOX_O_COST == 2_500 + 400 * (10 + cst.OPEN_LOBBY_INDEX_SIZE)
+    assert len(open_lobby_box_key(0)) == 10
+
+    # One index box per bucket fits in a single box reference
+    assert cst.OPEN_LOBBY_INDEX_SIZE <= 1024
+
+
+def test_buckets() -> None:
+    assert stake_tier(cst.MIN_STAKE_AMOUNT) == 0
+    assert stake_tier(cst.STAKE_TIER_1 - 1) == 0
+    assert stake_tier(cst.STAKE_TIER_1) == 1
+    assert stake_tier(cst.STAKE_TIER_2) == 2
+    assert stake_tier(cst.MAX_STAKE_AMOUNT) == cst.STAKE_TIER_COUNT - 1
+
+    buckets = {
+        open_lobby_bucket(lobby_size, tier)
+        for lobby_size in range(cst.MIN_LOBBY_SIZE, cst.MAX_LOBBY_SIZE + 1, 2)
+        for tier in range(cst.STAKE_TIER_COUNT)
+    }
+    assert buckets == set(range(cst.OPEN_LOBBY_BUCKET_COUNT))
+
+    with pytest.raises(ValueError, match="lobby size"):
+        open_lobby_bucket(3, 0)
+    with pytest.raises(ValueError, match="stake tier"):
+        open_lobby_bucket(2, cst.STAKE_TIER_COUNT)
+
+
+def test_decode() -> None:
+    value = bytearray(cst.OPEN_LOBBY_INDEX_SIZE)
+    value[:8] = (3).to_bytes(8, "big")
+    for j, game_id in enumerate((7, 2, 40, 99)):
+        start = cst.OPEN_LOBBY_IDS_OFFSET + 8 * j
+        value[start : start + 8] = game_id.to_bytes(8, "big")
+
+    # Entries past the count are stale and ignored
+    assert decode_open_lobby_index(value) == (7, 2, 40)
+    assert decode_open_lobby_index(bytes(cst.OPEN_LOBBY_INDEX_SIZE)) == ()
+
+    with pytest.raises(ValueError, match="520 bytes"):
+        decode_open_lobby_index(bytes(8))
+    value[:8] = (cst.OPEN_LOBBY_CAPACITY + 1).to_bytes(8, "big")
+    with pytest.raises(ValueError, match="capacity"):
+        decode_open_lobby_index(value)
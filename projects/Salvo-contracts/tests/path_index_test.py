@@ -0,0 +1,105 @@
+# tests/path_index_test.py
+import random
+
+import numpy as np
+import pytest
+
+from salvo_engine import (
+    UNREACHABLE,
+    Bitboard,
+    PathIndex,
+    clear_path_index_cache,
+    iter_cells,
+    reachable_cells,
+)
+from smart_contracts.salvo import constants as cst
+from smart_contracts.salvo import errors as err
+from tests.bitboard_test import random_box, ref_distances
+
+
+# Distance matrix built from the naive per-cell BFS
+def ref_matrix(box: bytes) -> np.ndarray:
+    matrix = np.full((121, 121), UNREACHABLE, dtype=np.uint8)
+    for source in range(cst.GRID_CELL_TOTAL):
+        for (row, col), d in ref_distances(box, divmod(source, 11)).items():
+            matrix[source, row * cst.GRID_SIZE + col] = d
+    return matrix
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> None:
+    clear_path_index_cache()
+
+
+def test_matrix_matches_bfs() -> None:
+    rng = random.Random(1)
+    for _ in range(5):
+        box = random_box(rng)
+        index = PathIndex.for_grid(Bitboard.from_cells(box))
+        assert np.array_equal(index.matrix, ref_matrix(box))
+        assert not index.matrix.flags.writeable
+
+
+def test_queries() -> None:
+    # Character at (0, 0), walled into the top left corner w/ (0, 1)
+    board = Bitboard(occupancy=1)
+    for row, col in ((0, 2), (1, 1), (1, 0)):
+        board = board.with_obstacle(row, col)
+    index = PathIndex.for_grid(board)
+
+    assert index.distance((0, 0), (0, 1)) == 1
+    assert index.distance((0, 0), (0, 3)) == UNREACHABLE
+    assert index.distance((2, 0), (1, 2)) == 3
+    assert index.can_reach((2, 0), (1, 2), 3)
+    assert not index.can_reach((2, 0), (1, 2), 2)
+    assert not index.can_reach((0, 0), (0, 3), 1000)
+    assert set(iter_cells(reachable_cells(index, (0, 0), 1000))) == {(0, 0), (0, 1)}
+    with pytest.raises(ValueError, match=err.INVALID_POS_COORDS):
+        index.distance((0, 0), (11, 0))
+
+
+def test_cache_is_keyed_by_walkable_cells() -> None:
+    board = Bitboard().with_obstacle(5, 5)
+    index = PathIndex.for_grid(board)
+    assert PathIndex.for_grid(board.to_box()) is index
+
+    # An occupied cell blocks paths exactly like an obstacle does
+    assert PathIndex.for_grid(Bitboard(occupancy=board.obstacles)) is index
+    assert PathIndex.for_grid(Bitboard()) is not index
+
+
+def test_incremental_update_matches_rebuild() -> None:
+    rng = random.Random(2)
+    board = Bitboard.from_cells(random_box(rng))
+    index = PathIndex.for_grid(board)
+    index.matrix  # noqa: B018
+    for _ in range(30):
+        row, col = rng.randrange(11), rng.randrange(11)
+        board = (
+            board.with_obstacle(
+                row, col, present=not board.obstacles & (1 << (row * 11 + col))
+            )
+            if not board.occupancy & (1 << (row * 11 + col))
+            else board
+        )
+        updated = index.update(board)
+        assert np.array_equal(updated.matrix, ref_matrix(board.to_cells()))
+        index = updated
+
+
+def test_update_keeps_unaffected_rows() -> None:
+    # A wall down column 5 splits the board, so changes on the East side leave West rows intact
+    board = Bitboard()
+    for row in range(cst.GRID_SIZE):
+        board = board.with_obstacle(row, 5)
+    index = PathIndex.for_grid(board)
+    index.matrix  # noqa: B018
+
+    updated = index.update(board.with_obstacle(3, 8))
+    west = [row * 11 + col for row in range(11) for col in range(5)]
+    assert updated._ready[west].all()
+    assert not updated._ready[3 * 11 + 9]
+    assert np.array_equal(
+        updated.matrix, ref_matrix(board.with_obstacle(3, 8).to_cells())
+    )
+    assert updated.update(board) is index
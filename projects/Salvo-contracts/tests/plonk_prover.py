@@ -0,0 +1,300 @@
+# tests/plonk_prover.py
+# Minimal snarkjs-layout PLONK prover over BLS12-381, used to build honest proof fixtures
+# The setup picks tau first and derives X_2 = tau * G2 from it, like a (single party) powers of tau ceremony;
+# commitments are p(tau) * G1, the same point an MSM over the SRS would give
+import random
+from collections.abc import Sequence
+
+from utils.bls12_381 import G1_GEN, G2_GEN, g1_mul, g1_to_bytes, g2_mul, g2_to_bytes
+from utils.fr import R, fr_inv, fr_pow, fr_to_bytes, get_challenge
+from utils.zk_models import Proof, VerificationKey
+
+# Multiplicative generator of the BLS12-381 scalar field, and the snarkjs coset shifts
+FR_GENERATOR = 7
+K1 = 2
+K2 = 3
+
+Poly = list[int]  # Coefficients, lowest degree first
+
+
+def poly_add(a: Poly, b: Poly) -> Poly:
+    out = [0] * max(len(a), len(b))
+    for i, c in enumerate(a):
+        out[i] = c
+    for i, c in enumerate(b):
+        out[i] = (out[i] + c) % R
+    return out
+
+
+def poly_scale(a: Poly, k: int) -> Poly:
+    return [c * k % R for c in a]
+
+
+def poly_sub(a: Poly, b: Poly) -> Poly:
+    return poly_add(a, poly_scale(b, R - 1))
+
+
+def poly_mul(a: Poly, b: Poly) -> Poly:
+    out = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            out[i + j] = (out[i + j] + x * y) % R
+    return out
+
+
+def poly_eval(a: Poly, x: int) -> int:
+    acc = 0
+    for c in reversed(a):
+        acc = (acc * x + c) % R
+    return acc
+
+
+# Get p(k * X) from p(X)
+def poly_stretch(a: Poly, k: int) -> Poly:
+    return [c * fr_pow(k, i) % R for i, c in enumerate(a)]
+
+
+# Divide by (X - z), the division must be exact
+def poly_div_linear(a: Poly, z: int) -> Poly:
+    out = [0] * (len(a) - 1)
+    acc = 0
+    for i in range(len(a) - 1, 0, -1):
+        acc = (acc * z + a[i]) % R
+        out[i - 1] = acc
+    if (acc * z + a[0]) % R:
+        raise ValueError("Polynomial does not vanish at z")
+    return out
+
+
+# Divide by the vanishing polynomial X^n - 1, the division must be exact
+def poly_div_zh(a: Poly, n: int) -> Poly:
+    rem = list(a)
+    out = [0] * max(len(a) - n, 0)
+    for i in range(len(a) - 1, n - 1, -1):
+        out[i - n] = rem[i]
+        rem[i - n] = (rem[i - n] + rem[i]) % R
+        rem[i] = 0
+    if any(rem):
+        raise ValueError("Polynomial does not vanish on the domain")
+    return out
+
+
+# Interpolate the evaluations over the domain w^0..w^(n-1) w/ an inverse DFT
+def interpolate(values: Sequence[int], w: int) -> Poly:
+    n = len(values)
+    n_inv, w_inv = fr_inv(n), fr_inv(w)
+    return [
+        n_inv * sum(v * fr_pow(w_inv, i * j) for i, v in enumerate(values)) % R
+        for j in range(n)
+    ]
+
+
+# Class for a circuit in PLONK gate form: one gate per domain row, public inputs in the first rows
+# Every gate asserts qm*a*b + ql*a + qr*b + qo*c + qc + PI = 0, w/ PI(w^i) = -signals[i]
+# Wire values naming the same variable are tied by copy constraints
+class Circuit:
+    def __init__(self, power: int, n_public: int) -> None:
+        self.power = power
+        self.n = 1 << power
+        self.n_public = n_public
+        self.w = fr_pow(FR_GENERATOR, (R - 1) >> power)
+        self.selectors = {key: [0] * self.n for key in ("qm", "ql", "qr", "qo", "qc")}
+        self.wires: list[list[str | None]] = [[None] * self.n for _ in range(3)]
+        self.rows = 0
+
+    # Add a gate w/ the variable names of its a, b and c wires (None for an unused wire)
+    def gate(
+        self,
+        a: str | None = None,
+        b: str | None = None,
+        c: str | None = None,
+        **selectors: int,
+    ) -> None:
+        for key, value in selectors.items():
+            self.selectors[key][self.rows] = value % R
+        for column, name in enumerate((a, b, c)):
+            self.wires[column][self.rows] = name
+        self.rows += 1
+
+    # Get the permutation of every wire slot, rotating through the slots of each variable
+    def sigma(self) -> list[list[int]]:
+        shifts = (1, K1, K2)
+        ids = [[k * fr_pow(self.w, i) % R for i in range(self.n)] for k in shifts]
+        sigma = [list(column) for column in ids]
+        slots: dict[str, list[tuple[int, int]]] = {}
+        for column in range(3):
+            for row in range(self.n):
+                name = self.wires[column][row]
+                if name is not None:
+                    slots.setdefault(name, []).append((column, row))
+        for cycle in slots.values():
+            for (column, row), (next_column, next_row) in zip(
+                cycle, cycle[1:] + cycle[:1], strict=True
+            ):
+                sigma[column][row] = ids[next_column][next_row]
+        return sigma
+
+
+# Class for the honest setup and prover of a circuit
+class Prover:
+    def __init__(self, circuit: Circuit, seed: int = 0) -> None:
+        self.circuit = circuit
+        self.tau = random.Random(seed).randrange(2, R)
+        c = circuit
+        self.q = {key: interpolate(values, c.w) for key, values in c.selectors.items()}
+        self.s = [interpolate(column, c.w) for column in c.sigma()]
+        self.vk = VerificationKey(
+            Qm=self.commit(self.q["qm"]),
+            Ql=self.commit(self.q["ql"]),
+            Qr=self.commit(self.q["qr"]),
+            Qo=self.commit(self.q["qo"]),
+            Qc=self.commit(self.q["qc"]),
+            S1=self.commit(self.s[0]),
+            S2=self.commit(self.s[1]),
+            S3=self.commit(self.s[2]),
+            power=c.power,
+            nPublic=c.n_public,
+            k1=K1,
+            k2=K2,
+            X_2=g2_to_bytes(g2_mul(G2_GEN, self.tau)),
+        )
+
+    def commit(self, p: Poly) -> bytes:
+        return g1_to_bytes(g1_mul(G1_GEN, poly_eval(p, self.tau)))
+
+    # Prove the circuit for a witness, mapping every variable name to its value
+    def prove(self, witness: dict[str, int], signals: Sequence[int]) -> Proof:
+        c, q, s = self.circuit, self.q, self.s
+        n, w = c.n, self.circuit.w
+        values = [
+            [witness[name] % R if name is not None else 0 for name in column]
+            for column in c.wires
+        ]
+        a, b, cc = (interpolate(column, w) for column in values)
+        lagrange = [interpolate([int(i == j) for i in range(n)], w) for j in range(n)]
+        pi = [0]
+        for i, signal in enumerate(signals):
+            pi = poly_sub(pi, poly_scale(lagrange[i], signal))
+
+        # Round 1: wire commitments, then beta and gamma
+        commit_a, commit_b, commit_c = self.commit(a), self.commit(b), self.commit(cc)
+        vk = self.vk
+        td = vk.Qm + vk.Ql + vk.Qr + vk.Qo + vk.Qc + vk.S1 + vk.S2 + vk.S3
+        td += b"".join(fr_to_bytes(signal) for signal in signals)
+        beta = get_challenge(td + commit_a + commit_b + commit_c)
+        gamma = get_challenge(fr_to_bytes(beta))
+
+        # Round 2: permutation accumulator over the domain
+        sigma = c.sigma()
+        z_values = [1]
+        for i in range(n - 1):
+            num, den = 1, 1
+            for column, k in enumerate((1, K1, K2)):
+                x = fr_pow(w, i) * k % R
+                num = num * (values[column][i] + beta * x + gamma) % R
+                den = den * (values[column][i] + beta * sigma[column][i] + gamma) % R
+            z_values.append(z_values[-1] * num * fr_inv(den) % R)
+        z = interpolate(z_values, w)
+        commit_z = self.commit(z)
+        alpha = get_challenge(fr_to_bytes(beta) + fr_to_bytes(gamma) + commit_z)
+
+        # Round 3: quotient t = (gate + PI + alpha * perm + alpha^2 * (Z - 1) * L1) / Z_H, split in n chunks
+        gate = poly_add(
+            poly_add(poly_mul(q["qm"], poly_mul(a, b)), poly_mul(q["ql"], a)),
+            poly_add(
+                poly_add(poly_mul(q["qr"], b), poly_mul(q["qo"], cc)),
+                poly_add(q["qc"], pi),
+            ),
+        )
+        perm_id = z
+        perm_sigma = poly_stretch(z, w)
+        for p, k, sp in ((a, 1, s[0]), (b, K1, s[1]), (cc, K2, s[2])):
+            perm_id = poly_mul(perm_id, poly_add(p, [gamma, beta * k % R]))
+            perm_sigma = poly_mul(
+                perm_sigma, poly_add(poly_add(p, poly_scale(sp, beta)), [gamma])
+            )
+        numerator = poly_add(
+            poly_add(gate, poly_scale(poly_sub(perm_id, perm_sigma), alpha)),
+            poly_scale(poly_mul(poly_sub(z, [1]), lagrange[0]), alpha * alpha % R),
+        )
+        t = poly_div_zh(numerator, n)
+        t += [0] * (3 * n - len(t))
+        t1, t2, t3 = t[:n], t[n : 2 * n], t[2 * n :]
+        commit_t = [self.commit(chunk) for chunk in (t1, t2, t3)]
+        xi = get_challenge(fr_to_bytes(alpha) + b"".join(commit_t))
+
+        # Round 4: opening evaluations
+        evals = [
+            poly_eval(a, xi),
+            poly_eval(b, xi),
+            poly_eval(cc, xi),
+            poly_eval(s[0], xi),
+            poly_eval(s[1], xi),
+            poly_eval(z, xi * w % R),
+        ]
+        eval_a, eval_b, eval_c, eval_s1, eval_s2, eval_zw = evals
+        v1 = get_challenge(fr_to_bytes(xi) + b"".join(fr_to_bytes(e) for e in evals))
+        v = [0, v1] + [fr_pow(v1, i) for i in range(2, 6)]
+
+        # Round 5: linearisation polynomial r, w/ r(xi) = -r0, and the two opening proofs
+        xin = fr_pow(xi, n)
+        zh = (xin - 1) % R
+        l1 = poly_eval(lagrange[0], xi)
+        e3a = (eval_a + beta * eval_s1 + gamma) % R
+        e3b = (eval_b + beta * eval_s2 + gamma) % R
+        r0 = (
+            poly_eval(pi, xi)
+            - l1 * alpha * alpha
+            - alpha * e3a * e3b * (eval_c + gamma) * eval_zw
+        ) % R
+        z_scalar = (
+            alpha
+            * (eval_a + beta * xi + gamma)
+            * (eval_b + beta * K1 * xi + gamma)
+            * (eval_c + beta * K2 * xi + gamma)
+            + l1 * alpha * alpha
+        ) % R
+        r = poly_add(
+            poly_add(
+                poly_add(
+                    poly_scale(q["qm"], eval_a * eval_b % R),
+                    poly_scale(q["ql"], eval_a),
+                ),
+                poly_add(
+                    poly_add(poly_scale(q["qr"], eval_b), poly_scale(q["qo"], eval_c)),
+                    q["qc"],
+                ),
+            ),
+            poly_sub(
+                poly_scale(z, z_scalar),
+                poly_scale(s[2], alpha * beta * eval_zw * e3a * e3b % R),
+            ),
+        )
+        t_xi = poly_add(
+            t1, poly_add(poly_scale(t2, xin), poly_scale(t3, xin * xin % R))
+        )
+        r = poly_sub(r, poly_scale(t_xi, zh))
+
+        opening = poly_add(r, [r0])
+        for vi, p, e in zip(v[1:], (a, b, cc, s[0], s[1]), evals, strict=False):
+            opening = poly_add(opening, poly_scale(poly_sub(p, [e]), vi))
+        wxi = poly_div_linear(opening, xi)
+        wxiw = poly_div_linear(poly_sub(z, [eval_zw]), xi * w % R)
+
+        return Proof(
+            A=commit_a,
+            B=commit_b,
+            C=commit_c,
+            Z=commit_z,
+            T1=commit_t[0],
+            T2=commit_t[1],
+            T3=commit_t[2],
+            Wxi=self.commit(wxi),
+            Wxiw=self.commit(wxiw),
+            eval_a=eval_a,
+            eval_b=eval_b,
+            eval_c=eval_c,
+            eval_s1=eval_s1,
+            eval_s2=eval_s2,
+            eval_zw=eval_zw,
+        )
@@ -0,0 +1,248 @@
+# tests/plonk_verify_test.py
+import json
+import random
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from tests.plonk_prover import Circuit, Prover
+from utils.bls12_381 import (
+    FP_SIZE,
+    G1_GEN,
+    G2_GEN,
+    g1_mul,
+    g1_neg,
+    g1_to_bytes,
+    g2_mul,
+    g2_to_bytes,
+    pairing_check,
+)
+from utils.fr import R, calc_challenges, calc_lagrange_witness, fr_div, fr_mul, fr_pow
+from utils.plonk_verify import (
+    PROOF_EVAL_LABELS,
+    PROOF_G1_LABELS,
+    calc_e,
+    calc_f_terms,
+    calc_pi,
+    calc_r0,
+    check_proof,
+    verify_proof,
+)
+from utils.zk_models import Proof, VerificationKey
+
+# Multiplicative generator of the BLS12-381 scalar field
+FR_GENERATOR = 7
+POWER = 4
+ROOT_OF_UNITY = fr_pow(FR_GENERATOR, (R - 1) >> POWER)
+SIGNALS = [42, 7]
+
+
+# Build a verification key and proof that pass the pairing check by picking the G2 trapdoor after the fact.
+# Every G1 point is a known multiple of the generator, so the pairing equation can be solved for X_2.
+def make_passing_vk_and_proof() -> tuple[VerificationKey, Proof]:
+    rng = random.Random(2024)
+    dlog = {
+        label: rng.randrange(1, R)
+        for label in [
+            *["Qm", "Ql", "Qr", "Qo", "Qc", "S1", "S2", "S3"],
+            *["A", "B", "C", "Z", "T1", "T2", "T3", "Wxi", "Wxiw"],
+        ]
+    }
+    point = {label: g1_to_bytes(g1_mul(G1_GEN, k)) for label, k in dlog.items()}
+    by_bytes = {point[label]: k for label, k in dlog.items()}
+
+    vk = VerificationKey(
+        **{
+            label: point[label]
+            for label in ["Qm", "Ql", "Qr", "Qo", "Qc", "S1", "S2", "S3"]
+        },
+        power=POWER,
+        nPublic=len(SIGNALS),
+        k1=2,
+        k2=3,
+        X_2=bytes(192),  # Placeholder, X_2 is not part of the transcript
+    )
+    proof = Proof(
+        **{
+            label: point[label]
+            for label in ["A", "B", "C", "Z", "T1", "T2", "T3", "Wxi", "Wxiw"]
+        },
+        **{
+            key: rng.randrange(R)
+            for key in ["eval_a", "eval_b", "eval_c", "eval_s1", "eval_s2", "eval_zw"]
+        },
+    )
+
+    # Replay the verifier arithmetic in the exponent
+    ch = calc_challenges(vk, SIGNALS, proof)
+    lw = calc_lagrange_witness(vk, SIGNALS, proof, ROOT_OF_UNITY, challenges=ch)
+    r0 = calc_r0(proof, ch, calc_pi(SIGNALS, lw), lw.l[1])
+    points, scalars = calc_f_terms(vk, proof, ch, lw)
+    f = sum(by_bytes[p] * s for p, s in zip(points, scalars, strict=True)) % R
+    e = calc_e(proof, ch, r0)
+    a1 = (dlog["Wxi"] + ch.u * dlog["Wxiw"]) % R
+    b1 = (
+        ch.xi * dlog["Wxi"]
+        + fr_mul(fr_mul(ch.u, ch.xi), ROOT_OF_UNITY) * dlog["Wxiw"]
+        + f
+        - e
+    ) % R
+
+    # e(-A1, tau*G2) * e(B1, G2) == 1  <=>  tau = B1 / A1
+    tau = fr_div(b1, a1)
+    return replace(vk, X_2=g2_to_bytes(g2_mul(G2_GEN, tau))), proof
+
+
+@pytest.fixture(scope="module")
+def passing() -> tuple[VerificationKey, Proof]:
+    return make_passing_vk_and_proof()
+
+
+def test_pairing_check_is_bilinear() -> None:
+    k = 0xC0FFEE
+    assert pairing_check(
+        [(g1_mul(G1_GEN, k), G2_GEN), (g1_neg(G1_GEN), g2_mul(G2_GEN, k))]
+    )
+    assert not pairing_check(
+        [(g1_mul(G1_GEN, k), G2_GEN), (g1_neg(G1_GEN), g2_mul(G2_GEN, k + 1))]
+    )
+
+
+def test_passing_proof_verifies(passing: tuple[VerificationKey, Proof]) -> None:
+    vk, proof = passing
+
+    check_proof(vk, ROOT_OF_UNITY, SIGNALS, proof)
+    assert verify_proof(vk, ROOT_OF_UNITY, SIGNALS, proof)
+
+
+def test_tampered_evaluation_fails_pairing(
+    passing: tuple[VerificationKey, Proof],
+) -> None:
+    vk, proof = passing
+
+    with pytest.raises(ValueError, match="Verification failed"):
+        check_proof(vk, ROOT_OF_UNITY, SIGNALS, replace(proof, eval_c=proof.eval_c + 1))
+
+
+def test_tampered_signal_fails_pairing(passing: tuple[VerificationKey, Proof]) -> None:
+    vk, proof = passing
+
+    assert not verify_proof(vk, ROOT_OF_UNITY, [SIGNALS[0], SIGNALS[1] + 1], proof)
+
+
+@pytest.mark.parametrize(
+    ("change", "message"),
+    [
+        ({"A": b"\x01" * 96}, "A not in G1"),
+        ({"Wxiw": b"\x00" * 95 + b"\x01"}, "Wxiw not in G1"),
+        ({"eval_zw": R}, "eval_zw not in Fr"),
+    ],
+)
+def test_malformed_proof_fails_before_pairing(
+    passing: tuple[VerificationKey, Proof], change: dict, message: str
+) -> None:
+    vk, proof = passing
+
+    with pytest.raises(ValueError, match=message):
+        check_proof(vk, ROOT_OF_UNITY, SIGNALS, replace(proof, **change))
+
+
+def test_wrong_signal_count_is_rejected(passing: tuple[VerificationKey, Proof]) -> None:
+    vk, proof = passing
+
+    with pytest.raises(ValueError, match="Invalid number of public inputs"):
+        check_proof(vk, ROOT_OF_UNITY, SIGNALS[:1], proof)
+
+
+def test_inconsistent_lagrange_witness_is_rejected(
+    passing: tuple[VerificationKey, Proof],
+) -> None:
+    vk, proof = passing
+    lw = calc_lagrange_witness(vk, SIGNALS, proof, ROOT_OF_UNITY)
+
+    with pytest.raises(ValueError, match=r"lw.zh != xi\^n - 1"):
+        check_proof(vk, ROOT_OF_UNITY, SIGNALS, proof, replace(lw, zh=(lw.zh + 1) % R))
+
+
+# Circuit proving knowledge of x, y w/ x * y == out, x + y == 13 and x == 6, where out is public.
+# Every selector is used once so no vk commitment is the point at infinity.
+def make_honest_prover() -> Prover:
+    circuit = Circuit(power=3, n_public=1)
+    circuit.gate(a="out", ql=1)
+    circuit.gate(a="x", b="y", c="out", qm=1, qo=-1)
+    circuit.gate(a="x", b="y", c="sum", ql=1, qr=1, qo=-1)
+    circuit.gate(a="x", ql=1, qc=-6)
+    return Prover(circuit, seed=2024)
+
+
+HONEST_WITNESS = {"x": 6, "y": 7, "out": 42, "sum": 13}
+HONEST_SIGNALS = [42]
+
+# Real snarkjs PLONK proof over BLS12-381, as served by the frontend
+SNARKJS_PROOF_PATH = (
+    Path(__file__).resolve().parents[2] / "Salvo-frontend" / "public" / "proof.json"
+)
+
+
+# Encode a snarkjs affine G1 point [x, y, "1"] as x || y, 48 bytes each
+def snarkjs_g1(point: list[str]) -> bytes:
+    assert point[2] == "1"
+    return b"".join(int(c).to_bytes(FP_SIZE, "big") for c in point[:2])
+
+
+def load_snarkjs_proof() -> Proof:
+    data = json.loads(SNARKJS_PROOF_PATH.read_text())
+    assert (data["protocol"], data["curve"]) == ("plonk", "bls12381")
+    return Proof(
+        **{label: snarkjs_g1(data[label]) for label in PROOF_G1_LABELS},
+        **{label: int(data[label]) for label in PROOF_EVAL_LABELS},
+    )
+
+
+@pytest.fixture(scope="module")
+def honest() -> tuple[Prover, Proof]:
+    prover = make_honest_prover()
+    return prover, prover.prove(HONEST_WITNESS, HONEST_SIGNALS)
+
+
+def test_honest_proof_verifies(honest: tuple[Prover, Proof]) -> None:
+    prover, proof = honest
+    w = prover.circuit.w
+
+    check_proof(prover.vk, w, HONEST_SIGNALS, proof)
+    assert not verify_proof(prover.vk, w, [43], proof)
+    assert not verify_proof(
+        prover.vk, w, HONEST_SIGNALS, replace(proof, eval_zw=proof.eval_zw + 1)
+    )
+
+
+def test_honest_prover_rejects_bad_witness() -> None:
+    prover = make_honest_prover()
+
+    with pytest.raises(ValueError, match="does not vanish"):
+        prover.prove({**HONEST_WITNESS, "out": 41}, [41])
+
+
+def test_snarkjs_proof_passes_structural_checks(
+    honest: tuple[Prover, Proof],
+) -> None:
+    prover, _ = honest
+    proof = load_snarkjs_proof()
+
+    # Every commitment is in G1 and every evaluation in Fr, so only the pairing fails against an unrelated vk
+    with pytest.raises(ValueError, match="Verification failed"):
+        check_proof(prover.vk, prover.circuit.w, HONEST_SIGNALS, proof)
+
+
+def test_group_checks_run_before_field_checks(
+    passing: tuple[VerificationKey, Proof],
+) -> None:
+    vk, proof = passing
+    malformed = replace(proof, T3=b"\x01" * 96, eval_a=R)
+
+    # The verifier contract asserts the G1 subgroup checks first
+    with pytest.raises(ValueError, match="T3 not in G1"):
+        check_proof(vk, ROOT_OF_UNITY, SIGNALS, malformed)
+    with pytest.raises(ValueError, match="eval_a not in Fr"):
+        check_proof(vk, ROOT_OF_UNITY, SIGNALS[:1], replace(proof, eval_a=R))
@@ -0,0 +1,113 @@
+# tests/postprocess_client_test.py
+import dataclasses
+import importlib
+
+import pytest
+from algosdk.account import generate_account
+from algosdk.transaction import PaymentTxn, SuggestedParams
+
+from smart_contracts.artifacts.plonk_verifier import plonk_verifier_client as pv
+from smart_contracts.artifacts.salvo import salvo_client
+from smart_contracts.postprocess_client import (
+    FAST_ABI_HELPERS,
+    FAST_ABI_MARKER,
+    GENERATED_APP_SPEC,
+    LAZY_APP_SPEC_MARKER,
+    patch_fast_abi_helpers,
+    patch_lazy_app_spec,
+)
+from tests.abi_args_benchmark import (
+    make_verify_args,
+    reference_init_dataclass,
+    reference_parse_abi_args,
+)
+
+
+# Class for a nested struct, to exercise recursion into dataclass fields and arrays of structs
+@dataclasses.dataclass
+class Outer:
+    inner: pv.LagrangeWitness
+    many: list[pv.LagrangeWitness]
+    name: str
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        None,
+        (),
+        make_verify_args(),
+        pv.VerifyArgs(
+            signals=[1, 2],
+            proof=pv.Proof(**dataclasses.asdict(make_verify_args()[1])),
+            lw=pv.LagrangeWitness(L=[0, 1], xin=2, zh=1),
+        ),
+        (
+            Outer(
+                inner=pv.LagrangeWitness(L=[1], xin=2, zh=3),
+                many=[pv.LagrangeWitness(L=[], xin=0, zh=0)],
+                name="x",
+            ),
+            (1, (2, [3, b"4"])),
+        ),
+    ],
+)
+def test_fast_parse_abi_args_matches_generated(args: object) -> None:
+    assert pv._parse_abi_args(args) == reference_parse_abi_args(args)
+
+
+def test_transaction_args_are_passed_through() -> None:
+    address = generate_account()[1]
+    sp = SuggestedParams(fee=1_000, first=1, last=2, gh="A" * 44, flat_fee=True)
+    txn = PaymentTxn(address, sp, address, 0)
+
+    assert pv._parse_abi_args((txn, 1))[0] is txn
+
+
+def test_invalid_args_type_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Invalid 'args' type"):
+        pv._parse_abi_args([1, 2])
+
+
+def test_fast_init_dataclass_matches_generated() -> None:
+    data = {"inner": {"L": [1], "xin": 2, "zh": 3}, "many": [], "name": "x"}
+
+    assert pv._init_dataclass(Outer, data) == reference_init_dataclass(Outer, data)
+
+
+def test_generated_clients_are_post_processed() -> None:
+    for client in (pv, salvo_client):
+        with open(client.__file__) as f:
+            source = f.read()
+        assert FAST_ABI_MARKER in source
+        assert LAZY_APP_SPEC_MARKER in source
+
+
+def test_patch_is_idempotent_and_requires_generated_helpers() -> None:
+    patched = patch_fast_abi_helpers(FAST_ABI_HELPERS)
+
+    assert patched == FAST_ABI_HELPERS
+    with pytest.raises(ValueError, match="not found"):
+        patch_fast_abi_helpers("import typing\n")
+
+
+def test_app_spec_is_parsed_on_first_use() -> None:
+    client = importlib.reload(pv)
+    assert client._get_app_spec.cache_info().currsize == 0
+
+    from smart_contracts.artifacts.plonk_verifier.plonk_verifier_client import APP_SPEC
+
+    assert APP_SPEC.name == "PlonkVerifier"
+    assert client.APP_SPEC is APP_SPEC
+    assert client._get_app_spec.cache_info().currsize == 1
+    with pytest.raises(AttributeError):
+        client.NOT_A_SPEC  # noqa: B018
+
+
+def test_lazy_app_spec_patch_rewrites_internal_references() -> None:
+    source = GENERATED_APP_SPEC + "x = dict(app_spec=APP_SPEC,)\n"
+    patched = patch_lazy_app_spec(source)
+
+    assert "app_spec=_get_app_spec()," in patched
+    assert GENERATED_APP_SPEC not in patched
+    assert patch_lazy_app_spec(patched) == patched
@@ -0,0 +1,130 @@
+# tests/resolution_test.py
+import pytest
+
+from salvo_engine import Bitboard, resolve_round
+from smart_contracts.salvo import constants as cst
+from smart_contracts.salvo import errors as err
+from utils.grid_merkle import (
+    GridMerkleTree,
+    compute_grid_root,
+    grid_leaf,
+    verify_grid_proof,
+)
+
+
+def character(
+    position: int,
+    target: int | None = None,
+    action: int = cst.ACTION_NONE,
+    direction: int = cst.DIRECTION_NORTH,
+    *,
+    revealed: bool = True,
+) -> dict:
+    return {
+        "has_revealed_turn": revealed,
+        "position": position,
+        "target": position if target is None else target,
+        "action": action,
+        "direction": direction,
+    }
+
+
+# Grid w/ every given cell marked occupied
+def occupied_cells(*cells: int, obstacles: tuple[int, ...] = ()) -> bytes:
+    grid = bytearray(cst.GRID_CELL_TOTAL)
+    for i in cells:
+        grid[i] = cst.GRID_CELL_OCCUPIED
+    for i in obstacles:
+        grid[i] = cst.GRID_CELL_OBSTACLE
+    return bytes(grid)
+
+
+def test_moves_and_changes() -> None:
+    cells = occupied_cells(0, 60)
+    result = resolve_round(cells, [character(0, 12), character(60, 61)], [True, True])
+
+    assert result.positions == (12, 61)
+    assert result.blocked == ()
+    assert result.changes == (
+        (0, cst.GRID_CELL_OCCUPIED, cst.GRID_CELL_PATH),
+        (12, cst.GRID_CELL_PATH, cst.GRID_CELL_OCCUPIED),
+        (60, cst.GRID_CELL_OCCUPIED, cst.GRID_CELL_PATH),
+        (61, cst.GRID_CELL_PATH, cst.GRID_CELL_OCCUPIED),
+    )
+    assert result.cells == occupied_cells(12, 61)
+
+
+def test_collision_goes_to_lowest_slot() -> None:
+    # Both characters reveal a move onto cell 1; slot 0 moves first, slot 1 stays
+    cells = occupied_cells(0, 2)
+    result = resolve_round(cells, [character(0, 1), character(2, 1)], [True, True])
+
+    assert result.positions == (1, 2)
+    assert result.blocked == (1,)
+    assert result.cells == occupied_cells(1, 2)
+
+    # A move onto an obstacle is blocked too
+    cells = occupied_cells(0, obstacles=(1,))
+    result = resolve_round(cells, [character(0, 1)], [True])
+    assert result.positions == (0,)
+    assert result.blocked == (0,)
+    assert result.changes == ()
+
+
+def test_shots() -> None:
+    # Slot 0 at (5, 0) shoots East along row 5; slot 1 moves into the line of fire first
+    cells = occupied_cells(55, 49, 65)
+    characters = [
+        character(55, action=cst.ACTION_SHOOT, direction=cst.DIRECTION_EAST),
+        character(49, 60),
+        character(65, action=cst.ACTION_SHOOT, direction=cst.DIRECTION_NORTH),
+    ]
+    result = resolve_round(cells, characters, [True, True, True])
+
+    assert result.positions == (55, 60, 65)
+    assert result.hits == (0, 1, 0)
+
+    # An obstacle stops the shot
+    cells = occupied_cells(55, 60, obstacles=(57,))
+    characters = [
+        character(55, action=cst.ACTION_SHOOT, direction=cst.DIRECTION_EAST),
+        character(60),
+    ]
+    assert resolve_round(cells, characters, [True, True]).hits == (0, 0)
+
+
+def test_unrevealed_player() -> None:
+    cells = occupied_cells(0, 60)
+    characters = [character(0, 1), character(60, 61, revealed=False)]
+
+    with pytest.raises(ValueError, match=err.ROUND_NOT_REVEALED):
+        resolve_round(cells, characters, [True, True])
+
+    # Once the phase expired, the unrevealed character simply stays in place
+    result = resolve_round(cells, characters, [True, True], expired=True)
+    assert result.positions == (1, 60)
+
+    # An absent lobby slot never blocks the round
+    result = resolve_round(cells, characters, [True, False])
+    assert result.positions == (1, 60)
+
+
+def test_change_proofs() -> None:
+    cells = occupied_cells(0, 60, obstacles=(30,))
+    result = resolve_round(cells, [character(0, 12), character(60, 61)], [True, True])
+    tree = GridMerkleTree(cells)
+    root = tree.root
+    proofs = tree.change_proofs(result.changes)
+
+    # Replay the changes like `srt.apply_grid_root_change`
+    for (i, old, new), proof in zip(result.changes, proofs, strict=True):
+        assert verify_grid_proof(root, i, old, proof)
+        root = compute_grid_root(i, grid_leaf(new), proof)
+    assert root == tree.root == GridMerkleTree(result.cells).root
+    assert (
+        Bitboard.from_cells(result.cells).obstacles
+        == Bitboard.from_cells(cells).obstacles
+    )
+
+    with pytest.raises(ValueError, match="does not hold value"):
+        GridMerkleTree(cells).change_proofs([(1, cst.GRID_CELL_OCCUPIED, 0)])
@@ -0,0 +1,655 @@
+# tests/salvo_contract_test.py
+# Contract tests on the algorand-python-testing emulator, so the contract code itself runs w/o a LocalNet
+# Round outcomes are checked against the off-chain twin in `salvo_engine.resolution`
+import re
+import typing
+from collections.abc import Callable, Iterator, Sequence
+
+import pytest
+
+# The emulator ships w/ the algorand-python-testing dependency, which needs Python 3.12+
+pytest.importorskip("algopy_testing")
+
+import algopy
+from algopy import Account, Bytes, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+from algosdk import account
+
+from salvo_engine import (
+    RoundResult,
+    decode_game_characters,
+    pack_grid,
+    resolve_round,
+    unpack_grid,
+)
+from smart_contracts.salvo import constants as cst
+from smart_contracts.salvo import errors as err
+from smart_contracts.salvo import structs as stc
+from smart_contracts.salvo import type_aliases as ta
+from smart_contracts.salvo.contract import Salvo
+from utils.grid_merkle import GridMerkleTree
+from utils.mimc import mimc
+from utils.turn_commit import SignedTurnCommit, sign_turn_commit
+from utils.turn_preimage import TurnPreimage
+
+START_TS = 1_760_000_000
+
+
+def as_bytes(value: Bytes | bytes) -> bytes:
+    return value.value if isinstance(value, Bytes) else value
+
+
+@pytest.fixture()
+def context(monkeypatch: pytest.MonkeyPatch) -> Iterator[AlgopyTestContext]:
+    # The emulator does not implement `op.mimc`, run the bit-exact off-chain MiMC instead
+    monkeypatch.setattr(
+        algopy.op, "mimc", lambda _config, data: Bytes(mimc(as_bytes(data)))
+    )
+    with algopy_testing_context() as ctx:
+        ctx.ledger.patch_global_fields(latest_timestamp=UInt64(START_TS))
+        yield ctx
+
+
+@pytest.fixture()
+def salvo(context: AlgopyTestContext) -> Salvo:
+    contract = Salvo()
+    contract.generate()
+    return contract
+
+
+# Call a contract method as the app call of a group, after the given payments
+def call(
+    context: AlgopyTestContext,
+    salvo: Salvo,
+    sender: Account,
+    method: Callable[..., object],
+    *args: object,
+    pays: Sequence[algopy.gtxn.PaymentTransaction] = (),
+) -> object:
+    app_call = context.any.txn.application_call(
+        sender=sender, app_id=context.ledger.get_app(salvo)
+    )
+    with context.txn.create_group(gtxns=[*pays, app_call], active_txn_index=len(pays)):
+        return method(*pays, *args)
+
+
+# Get a payment from sender to the app, e.g. a box MBR payment of a grouped call
+def pay(
+    context: AlgopyTestContext, salvo: Salvo, sender: Account, amount: int
+) -> algopy.gtxn.PaymentTransaction:
+    return context.any.txn.payment(
+        sender=sender,
+        receiver=context.ledger.get_app(salvo).address,
+        amount=UInt64(amount),
+    )
+
+
+# Create a game w/ `new_game`, return True if it got listed in the open lobby index
+def create_game(
+    context: AlgopyTestContext,
+    salvo: Salvo,
+    creator: Account,
+    *,
+    lobby_size: int = 2,
+    commit_scheme: int = cst.COMMIT_SCHEME_SHA256,
+    stake: int = 0,
+) -> bool:
+    box_l_cost = 2_500 + 400 * (10 + lobby_size * cst.ADDRESS_SIZE)
+    pays = [
+        pay(context, salvo, creator, amount)
+        for amount in (cst.BOX_G_COST, cst.BOX_S_COST, cst.BOX_C_COST, box_l_cost)
+    ]
+    pays.append(pay(context, salvo, creator, stake))
+    return call(
+        context,
+        salvo,
+        creator,
+        salvo.new_game,
+        arc4.UInt8(lobby_size),
+        arc4.UInt8(commit_scheme),
+        pays=pays,
+    )
+
+
+# Create a game w/ `new_game`, return its game id
+def new_game(
+    context: AlgopyTestContext,
+    salvo: Salvo,
+    creator: Account,
+    *,
+    lobby_size: int = 2,
+    commit_scheme: int = cst.COMMIT_SCHEME_SHA256,
+    stake: int = 0,
+) -> int:
+    game_id = salvo.game_id.value
+    create_game(
+        context,
+        salvo,
+        creator,
+        lobby_size=lobby_size,
+        commit_scheme=commit_scheme,
+        stake=stake,
+    )
+    return game_id
+
+
+# Seat a player in a lobby slot; the contract has no join method yet, so the slot is written directly
+def seat_player(salvo: Salvo, game_id: int, slot: int, player: Account) -> None:
+    lobby = salvo.box_game_lobby[UInt64(game_id)].value
+    start = slot * cst.ADDRESS_SIZE
+    salvo.box_game_lobby[UInt64(game_id)] = Bytes(
+        lobby[:start] + player.bytes.value + lobby[start + cst.ADDRESS_SIZE :]
+    )
+
+
+# Place the character of a lobby slot on a grid cell, w/ enough move points for the test moves
+def place_character(
+    salvo: Salvo, game_id: int, slot: int, position: int, move_points: int = 3
+) -> None:
+    salvo.box_game_characters[UInt64(game_id)][slot] = stc.GameCharacter(
+        arc4.Bool(False),  # noqa: FBT003
+        arc4.Bool(False),  # noqa: FBT003
+        arc4.UInt8(slot),
+        arc4.UInt8(slot),
+        arc4.UInt8(cst.ACTION_NONE),
+        arc4.UInt8(position),
+        arc4.UInt8(position),
+        arc4.UInt8(move_points),
+        arc4.UInt8(cst.DIRECTION_SOUTH),
+        arc4.UInt256(0),
+    )
+
+
+# Replace the grid of a game, keeping the game state grid root in sync
+def set_grid(salvo: Salvo, game_id: int, cells: bytes) -> None:
+    salvo.box_game_grid[UInt64(game_id)] = ta.GameGrid.from_bytes(pack_grid(cells))
+    salvo.box_game_state[UInt64(game_id)].grid_root = arc4.UInt256.from_bytes(
+        GridMerkleTree(cells).root
+    )
+
+
+# Create a live two player game: the creator in slot 0 on cell `first`, `player` in slot 1 on cell `second`
+def live_game(
+    context: AlgopyTestContext,
+    salvo: Salvo,
+    player: Account,
+    first: int,
+    second: int,
+    *,
+    commit_scheme: int = cst.COMMIT_SCHEME_SHA256,
+) -> int:
+    creator = context.default_sender
+    game_id = new_game(context, salvo, creator, commit_scheme=commit_scheme)
+    seat_player(salvo, game_id, 1, player)
+    place_character(salvo, game_id, 0, first)
+    place_character(salvo, game_id, 1, second)
+    call(context, salvo, creator, salvo.close_staking, UInt64(game_id))
+    return game_id
+
+
+def coords_array(movement: Sequence[tuple[int, int]]) -> ta.CoordsArray:
+    return ta.CoordsArray(
+        *(ta.CoordsPair((arc4.UInt8(row), arc4.UInt8(col))) for row, col in movement)
+    )
+
+
+# Commit a turn w/ `commit_turn`, then reveal it w/ `reveal_turn`
+def play_turn(
+    context: AlgopyTestContext,
+    salvo: Salvo,
+    sender: Account,
+    game_id: int,
+    slot: int,
+    turn: TurnPreimage,
+) -> None:
+    commit_scheme = salvo.box_game_state[UInt64(game_id)].commit_scheme.native
+    call(
+        context,
+        salvo,
+        sender,
+        salvo.commit_turn,
+        UInt64(game_id),
+        arc4.UInt8(slot),
+        arc4.UInt256(turn.commitment_int(commit_scheme)),
+    )
+    call(
+        context,
+        salvo,
+        sender,
+        salvo.reveal_turn,
+        UInt64(game_id),
+        arc4.UInt8(slot),
+        coords_array(turn.movement),
+        arc4.UInt8(turn.action),
+        arc4.UInt8(turn.direction),
+        arc4.UInt64(turn.salt),
+    )
+
+
+def grid_proofs(proofs: Sequence[Sequence[bytes]]) -> ta.GridMerkleProofs:
+    return ta.GridMerkleProofs(
+        *(
+            ta.GridMerkleProof(*(arc4.UInt256.from_bytes(node) for node in proof))
+            for proof in proofs
+        )
+    )
+
+
+def game_cells(salvo: Salvo, game_id: int) -> bytes:
+    return unpack_grid(salvo.box_game_grid[UInt64(game_id)].bytes.value)
+
+
+def game_characters(salvo: Salvo, game_id: int) -> tuple[dict[str, object], ...]:
+    return decode_game_characters(
+        salvo.box_game_characters[UInt64(game_id)].bytes.value
+    )
+
+
+# Resolve a round w/ `resolve_round`, using the off-chain twin for the expected outcome and the grid proofs
+# Return the expected round result and the hits the contract returned, one per lobby slot
+def resolve(
+    context: AlgopyTestContext, salvo: Salvo, game_id: int, *, expired: bool = False
+) -> tuple[RoundResult, list[int]]:
+    cells = game_cells(salvo, game_id)
+    lobby = salvo.box_game_lobby[UInt64(game_id)].value
+    present = [
+        lobby[i : i + cst.ADDRESS_SIZE] != cst.ZEROED_ADDR_BYTES
+        for i in range(0, len(lobby), cst.ADDRESS_SIZE)
+    ]
+    characters = game_characters(salvo, game_id)[: len(present)]
+    expected = resolve_round(cells, characters, present, expired=expired)
+    proofs = GridMerkleTree(cells).change_proofs(expected.changes)
+    hits = call(
+        context,
+        salvo,
+        context.default_sender,
+        salvo.resolve_round,
+        UInt64(game_id),
+        grid_proofs(proofs),
+    )
+    return expected, [hit.native for hit in hits]
+
+
+# Check a round outcome on-chain against the off-chain twin result
+def assert_round(
+    salvo: Salvo, game_id: int, expected: RoundResult, hits: list[int]
+) -> None:
+    characters = game_characters(salvo, game_id)
+    assert hits[: len(expected.hits)] == list(expected.hits)
+    assert game_cells(salvo, game_id) == expected.cells
+    assert salvo.box_game_state[UInt64(game_id)].grid_root.bytes.value == (
+        GridMerkleTree(expected.cells).root
+    )
+    for slot, position in enumerate(expected.positions):
+        assert characters[slot]["position"] == position
+
+
+def test_full_round(context: AlgopyTestContext, salvo: Salvo) -> None:
+    creator, player = context.default_sender, context.any.account()
+    game_id = live_game(
+        context, salvo, player, 5, 60, commit_scheme=cst.COMMIT_SCHEME_MIMC
+    )
+
+    # Slot 0 walks (0, 5) -> (1, 5) -> (2, 5), slot 1 steps (5, 5) -> (5, 6) and shoots North
+    play_turn(
+        context,
+        salvo,
+        creator,
+        game_id,
+        0,
+        TurnPreimage(game_id, ((1, 5), (2, 5)), cst.ACTION_NONE, 0, 11),
+    )
+    play_turn(
+        context,
+        salvo,
+        player,
+        game_id,
+        1,
+        TurnPreimage(game_id, ((5, 6),), cst.ACTION_SHOOT, cst.DIRECTION_NORTH, 22),
+    )
+    expected, hits = resolve(context, salvo, game_id)
+
+    assert expected.positions == (27, 61)
+    assert expected.blocked == ()
+    assert hits == [0, 0, 0, 0]
+    assert_round(salvo, game_id, expected, hits)
+
+    # Every character is reopened for the next round, which starts a new phase
+    for character in game_characters(salvo, game_id)[:2]:
+        assert not character["has_committed_turn"]
+        assert not character["has_revealed_turn"]
+        assert character["target"] == character["position"]
+        assert character["turn_hash"] == 0
+    state = salvo.box_game_state[UInt64(game_id)]
+    assert state.expiry_ts.native == START_TS + cst.PHASE_EXPIRY_INTERVAL
+
+    # The next round frees the cell slot 0 leaves, and proves it against the updated root
+    play_turn(
+        context,
+        salvo,
+        creator,
+        game_id,
+        0,
+        TurnPreimage(game_id, ((2, 4),), cst.ACTION_NONE, 0, 33),
+    )
+    play_turn(context, salvo, player, game_id, 1, TurnPreimage(game_id, (), 0, 0, 44))
+    expected, hits = resolve(context, salvo, game_id)
+
+    assert expected.changes == (
+        (27, cst.GRID_CELL_OCCUPIED, cst.GRID_CELL_PATH),
+        (26, cst.GRID_CELL_PATH, cst.GRID_CELL_OCCUPIED),
+    )
+    assert_round(salvo, game_id, expected, hits)
+
+
+def test_move_blocked_by_character(context: AlgopyTestContext, salvo: Salvo) -> None:
+    creator, player = context.default_sender, context.any.account()
+    game_id = live_game(context, salvo, player, 5, 6)
+
+    # Slot 0 reveals a move onto the cell slot 1 keeps standing on
+    play_turn(
+        context, salvo, creator, game_id, 0, TurnPreimage(game_id, ((0, 6),), 0, 0, 1)
+    )
+    play_turn(context, salvo, player, game_id, 1, TurnPreimage(game_id, (), 0, 0, 2))
+    expected, hits = resolve(context, salvo, game_id)
+
+    assert expected.blocked == (0,)
+    assert expected.changes == ()
+    assert_round(salvo, game_id, expected, hits)
+    assert game_characters(salvo, game_id)[0]["position"] == 5
+
+
+@pytest.mark.parametrize(
+    ("obstacles", "expected_hits"),
+    [((), [0, 1, 0, 0]), ((7,), [0, 0, 0, 0])],
+    ids=["hit", "stopped_by_obstacle"],
+)
+def test_shot(
+    context: AlgopyTestContext,
+    salvo: Salvo,
+    obstacles: tuple[int, ...],
+    expected_hits: list[int],
+) -> None:
+    creator, player = context.default_sender, context.any.account()
+    game_id = live_game(context, salvo, player, 5, 8)
+    cells = bytearray(cst.GRID_CELL_TOTAL)
+    for i in obstacles:
+        cells[i] = cst.GRID_CELL_OBSTACLE
+    set_grid(salvo, game_id, bytes(cells))
+
+    # Slot 0 shoots East along row 0, toward slot 1 three cells away
+    turn = TurnPreimage(game_id, (), cst.ACTION_SHOOT, cst.DIRECTION_EAST, 3)
+    play_turn(context, salvo, creator, game_id, 0, turn)
+    play_turn(context, salvo, player, game_id, 1, TurnPreimage(game_id, (), 0, 0, 4))
+    expected, hits = resolve(context, salvo, game_id)
+
+    assert hits == expected_hits
+    assert_round(salvo, game_id, expected, hits)
+
+
+def test_grid_proof_count(context: AlgopyTestContext, salvo: Salvo) -> None:
+    creator, player = context.default_sender, context.any.account()
+    game_id = live_game(context, salvo, player, 5, 60)
+    play_turn(context, salvo, creator, game_id, 0, TurnPreimage(game_id, (), 0, 0, 5))
+    play_turn(context, salvo, player, game_id, 1, TurnPreimage(game_id, (), 0, 0, 6))
+
+    # No cell changes this round, so a spare proof is rejected
+    cells = game_cells(salvo, game_id)
+    spare = grid_proofs([GridMerkleTree(cells).proof(5)])
+    with pytest.raises(AssertionError, match=re.escape(err.INVALID_GRID_PROOF_COUNT)):
+        call(
+            context,
+            salvo,
+            creator,
+            salvo.resolve_round,
+            UInt64(game_id),
+            spare,
+        )
+
+
+def test_round_not_revealed(context: AlgopyTestContext, salvo: Salvo) -> None:
+    creator, player = context.default_sender, context.any.account()
+    game_id = live_game(context, salvo, player, 5, 60)
+    play_turn(
+        context, salvo, creator, game_id, 0, TurnPreimage(game_id, ((0, 4),), 0, 0, 7)
+    )
+
+    # Slot 1 has not revealed, so the round waits until the phase expires
+    with pytest.raises(AssertionError, match=re.escape(err.ROUND_NOT_REVEALED)):
+        resolve(context, salvo, game_id, expired=True)
+
+    context.ledger.patch_global_fields(
+        latest_timestamp=UInt64(START_TS + cst.PHASE_EXPIRY_INTERVAL)
+    )
+    expected, hits = resolve(context, salvo, game_id, expired=True)
+
+    assert expected.positions == (4, 60)
+    assert_round(salvo, game_id, expected, hits)
+
+
+def test_staking_not_closed(context: AlgopyTestContext, salvo: Salvo) -> None:
+    creator = context.default_sender
+    game_id = new_game(context, salvo, creator)
+    turn = TurnPreimage(game_id, (), 0, 0, 8)
+    call(
+        context,
+        salvo,
+        creator,
+        salvo.commit_turn,
+        UInt64(game_id),
+        arc4.UInt8(0),
+        arc4.UInt256(turn.commitment_int(cst.COMMIT_SCHEME_SHA256)),
+    )
+
+    # Reveals and rounds only run once the game admin closed staking
+    with pytest.raises(AssertionError, match=re.escape(err.STAKING_NOT_CLOSED)):
+        call(
+            context,
+            salvo,
+            creator,
+            salvo.reveal_turn,
+            UInt64(game_id),
+            arc4.UInt8(0),
+            coords_array(()),
+            arc4.UInt8(0),
+            arc4.UInt8(0),
+            arc4.UInt64(turn.salt),
+        )
+    with pytest.raises(AssertionError, match=re.escape(err.STAKING_NOT_CLOSED)):
+        call(
+            context,
+            salvo,
+            creator,
+            salvo.resolve_round,
+            UInt64(game_id),
+            grid_proofs([]),
+        )
+
+
+# Create a live two player game w/ off-chain keys for both slots, so each player can sign turn commits
+def signing_game(context: AlgopyTestContext, salvo: Salvo) -> tuple[int, list[str]]:
+    keys = [account.generate_account() for _ in range(2)]
+    game_id = live_game(context, salvo, Account(keys[1][1]), 5, 60)
+    seat_player(salvo, game_id, 0, Account(keys[0][1]))
+    return game_id, [private_key for private_key, _ in keys]
+
+
+# Sign a turn commit for the current round of a game, as a relay would collect it
+def sign_commit(
+    context: AlgopyTestContext,
+    salvo: Salvo,
+    game_id: int,
+    private_key: str,
+    slot: int,
+    turn_hash: int,
+) -> SignedTurnCommit:
+    state = salvo.box_game_state[UInt64(game_id)]
+    return sign_turn_commit(
+        private_key,
+        context.ledger.get_app(salvo).id.value,
+        game_id,
+        state.expiry_ts.native.value,
+        state.round_count.native.value,
+        slot,
+        turn_hash,
+    )
+
+
+def commit_turns(
+    context: AlgopyTestContext,
+    salvo: Salvo,
+    game_id: int,
+    commits: Sequence[SignedTurnCommit],
+) -> None:
+    signed = ta.SignedTurnCommits(
+        *(
+            stc.SignedTurnCommit(
+                arc4.UInt8(commit.lobby_slot),
+                arc4.UInt256(commit.turn_hash),
+                arc4.StaticArray[arc4.Byte, typing.Literal[64]](
+                    *(arc4.Byte(b) for b in commit.signature)
+                ),
+            )
+            for commit in commits
+        )
+    )
+    call(
+        context,
+        salvo,
+        context.any.account(),
+        salvo.commit_turns,
+        UInt64(game_id),
+        signed,
+    )
+
+
+def test_commit_turns(context: AlgopyTestContext, salvo: Salvo) -> None:
+    game_id, keys = signing_game(context, salvo)
+    commits = [
+        sign_commit(context, salvo, game_id, key, slot, 100 + slot)
+        for slot, key in enumerate(keys)
+    ]
+
+    # Any relay account can submit the turns, each one is authorized by its player signature
+    commit_turns(context, salvo, game_id, commits)
+
+    for slot, character in enumerate(game_characters(salvo, game_id)[:2]):
+        assert character["has_committed_turn"]
+        assert character["turn_hash"] == 100 + slot
+
+
+@pytest.mark.parametrize(
+    ("slots", "error"),
+    [
+        ((0, 0), err.TURN_ALREADY_COMMITTED),
+        ((2,), err.PLAYER_NOT_FOUND),
+        ((0,) * (cst.MAX_LOBBY_SIZE + 1), err.INVALID_COMMITS_LENGTH),
+        ((), err.INVALID_COMMITS_LENGTH),
+    ],
+    ids=["repeated_slot", "slot_outside_lobby", "too_many_commits", "no_commits"],
+)
+def test_commit_turns_rejected(
+    context: AlgopyTestContext, salvo: Salvo, slots: tuple[int, ...], error: str
+) -> None:
+    game_id, keys = signing_game(context, salvo)
+    commits = [sign_commit(context, salvo, game_id, keys[0], slot, 1) for slot in slots]
+
+    with pytest.raises(AssertionError, match=re.escape(error)):
+        commit_turns(context, salvo, game_id, commits)
+
+
+def test_commit_turns_empty_slot(context: AlgopyTestContext, salvo: Salvo) -> None:
+    private_key = account.generate_account()[0]
+    game_id = new_game(context, salvo, context.default_sender)
+
+    # Slot 1 of the two player lobby was never joined, so no address can sign for it
+    commit = sign_commit(context, salvo, game_id, private_key, 1, 1)
+    with pytest.raises(AssertionError, match=re.escape(err.PLAYER_NOT_FOUND)):
+        commit_turns(context, salvo, game_id, [commit])
+
+
+def test_commit_turns_invalid_signature(
+    context: AlgopyTestContext, salvo: Salvo
+) -> None:
+    game_id, keys = signing_game(context, salvo)
+    signed = sign_commit(context, salvo, game_id, keys[0], 0, 1)
+
+    # Signed by the other player, or w/ a turn hash other than the signed one
+    for commit in (
+        sign_commit(context, salvo, game_id, keys[1], 0, 1),
+        SignedTurnCommit(0, 2, signed.signature),
+    ):
+        with pytest.raises(
+            AssertionError, match=re.escape(err.INVALID_COMMIT_SIGNATURE)
+        ):
+            commit_turns(context, salvo, game_id, [commit])
+
+
+def test_commit_turns_replay(context: AlgopyTestContext, salvo: Salvo) -> None:
+    game_id, keys = signing_game(context, salvo)
+    stale = sign_commit(context, salvo, game_id, keys[0], 0, 1)
+    expiry_ts = salvo.box_game_state[UInt64(game_id)].expiry_ts.native.value
+
+    # Resolve an expired round at the same timestamp, so the next phase keeps the same expiry
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(expiry_ts))
+    resolve(context, salvo, game_id, expired=True)
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(START_TS))
+    state = salvo.box_game_state[UInt64(game_id)]
+    state.expiry_ts = arc4.UInt64(expiry_ts)
+
+    # The round count moved on, so the signature of the previous round no longer verifies
+    assert state.round_count.native == 1
+    with pytest.raises(AssertionError, match=re.escape(err.INVALID_COMMIT_SIGNATURE)):
+        commit_turns(context, salvo, game_id, [stale])
+    commit_turns(
+        context, salvo, game_id, [sign_commit(context, salvo, game_id, keys[0], 0, 1)]
+    )
+
+
+def read_open_lobbies(
+    context: AlgopyTestContext, salvo: Salvo, lobby_size: int, stake_tier: int
+) -> list[int]:
+    game_ids = call(
+        context,
+        salvo,
+        context.default_sender,
+        salvo.read_open_lobbies,
+        arc4.UInt8(lobby_size),
+        arc4.UInt8(stake_tier),
+        UInt64(0),
+        UInt64(cst.OPEN_LOBBY_CAPACITY),
+    )
+    return [game_id.native.value for game_id in game_ids]
+
+
+def test_open_lobby_lifecycle(context: AlgopyTestContext, salvo: Salvo) -> None:
+    creator = context.default_sender
+    call(
+        context,
+        salvo,
+        creator,
+        salvo.create_open_lobby_index,
+        arc4.UInt8(2),
+        arc4.UInt8(1),
+        pays=[pay(context, salvo, creator, cst.BOX_O_COST)],
+    )
+
+    # A tier 1 stake lists the game in the funded bucket
+    game_id = salvo.game_id.value
+    assert create_game(context, salvo, creator, stake=cst.STAKE_TIER_1)
+    state = salvo.box_game_state[UInt64(game_id)]
+    assert state.stake_tier.native == 1
+    assert state.open_lobby_listed.native
+    assert read_open_lobbies(context, salvo, 2, 1) == [game_id]
+
+    # Tier 0 has no bucket box yet, so the game is created but reported unlisted
+    unlisted_id = salvo.game_id.value
+    assert not create_game(context, salvo, creator)
+    assert not salvo.box_game_state[UInt64(unlisted_id)].open_lobby_listed.native
+    assert read_open_lobbies(context, salvo, 2, 0) == []
+
+    # Closing staking unlists the listed game, and leaves the unlisted one alone
+    call(context, salvo, creator, salvo.close_staking, UInt64(game_id))
+    assert read_open_lobbies(context, salvo, 2, 1) == []
+    assert not salvo.box_game_state[UInt64(game_id)].open_lobby_listed.native
+    call(context, salvo, creator, salvo.close_staking, UInt64(unlisted_id))
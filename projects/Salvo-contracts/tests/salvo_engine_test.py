@@ -0,0 +1,219 @@
+# tests/salvo_engine_test.py
+import random
+
+import numpy as np
+import pytest
+
+from salvo_engine import (
+    MOVE_INVALID,
+    MOVE_REVERTED_COORDS,
+    MOVE_VALID,
+    check_move_sequence,
+    get_neighbors_with_count,
+    grids_from_cells,
+    is_move_sequence_valid,
+)
+from smart_contracts.salvo import constants as cst
+from smart_contracts.salvo import errors as err
+
+
+# Raised by the scalar port wherever the contract would fail the transaction
+class RevertedError(Exception):
+    pass
+
+
+# Scalar port of `srt.is_path_cell`, incl. the `getbyte` failure past the end of the grid
+def ref_is_path_cell(grid: bytes, row: int, col: int) -> bool:
+    i = row * cst.GRID_SIZE + col
+    if i >= cst.GRID_CELL_TOTAL:
+        raise RevertedError("getbyte")
+    return grid[i] == 0
+
+
+# Scalar port of `srt.get_neighbors_with_count`
+def ref_get_neighbors_with_count(
+    grid: bytes, position: tuple[int, int]
+) -> tuple[list[tuple[int, int]], int]:
+    neighbors = [(255, 255)] * 4
+    row, col = position
+    count = 0
+    if row > 0 and ref_is_path_cell(grid, row - 1, col):
+        neighbors[count] = (row - 1, col)
+        count += 1
+    if row + 1 < cst.GRID_SIZE and ref_is_path_cell(grid, row + 1, col):
+        neighbors[count] = (row + 1, col)
+        count += 1
+    if col > 0 and ref_is_path_cell(grid, row, col - 1):
+        neighbors[count] = (row, col - 1)
+        count += 1
+    if col + 1 < cst.GRID_SIZE and ref_is_path_cell(grid, row, col + 1):
+        neighbors[count] = (row, col + 1)
+        count += 1
+    return neighbors, count
+
+
+# Scalar port of `srt.is_move_sequence_valid`
+def ref_is_move_sequence_valid(
+    grid: bytes, position: tuple[int, int], movement: list[tuple[int, int]]
+) -> bool:
+    if not (position[0] < cst.GRID_SIZE and position[1] < cst.GRID_SIZE):
+        raise RevertedError(err.INVALID_POS_COORDS)
+    for coords in movement:
+        row, col = coords
+        if not (row < cst.GRID_SIZE and col < cst.GRID_SIZE):
+            raise RevertedError(err.INVALID_POS_COORDS)
+        neighbors, count = ref_get_neighbors_with_count(grid, position)
+        if coords not in neighbors[:count]:
+            return False
+        position = coords
+    return True
+
+
+# Random grid w/ roughly `density` obstacle cells
+def random_grid(rng: random.Random, density: float = 0.3) -> bytes:
+    return bytes(
+        rng.randint(1, 3) if rng.random() < density else 0
+        for _ in range(cst.GRID_CELL_TOTAL)
+    )
+
+
+# Random walk over path cells, w/ an occasional arbitrary step so some sequences are invalid
+def random_movement(
+    rng: random.Random, grid: bytes, position: tuple[int, int], length: int
+) -> list[tuple[int, int]]:
+    movement = []
+    for _ in range(length):
+        row, col = position
+        options = [
+            (r, c)
+            for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+            if 0 <= r < cst.GRID_SIZE
+            and 0 <= c < cst.GRID_SIZE
+            and grid[r * cst.GRID_SIZE + c] == 0
+        ]
+        if not options or rng.random() < 0.1:
+            position = (rng.randrange(cst.GRID_SIZE), rng.randrange(cst.GRID_SIZE))
+        else:
+            position = rng.choice(options)
+        movement.append(position)
+    return movement
+
+
+# Outcome code of the scalar port
+def ref_outcome(grid: bytes, position: tuple[int, int], movement: list) -> int:
+    try:
+        return (
+            MOVE_VALID
+            if ref_is_move_sequence_valid(grid, position, movement)
+            else MOVE_INVALID
+        )
+    except RevertedError as e:
+        assert str(e) == err.INVALID_POS_COORDS
+        return MOVE_REVERTED_COORDS
+
+
+def test_neighbors_match_contract() -> None:
+    rng = random.Random(1)
+    grids = [random_grid(rng) for _ in range(200)]
+    positions = [(rng.randrange(11), rng.randrange(11)) for _ in grids]
+
+    neighbors, counts, reverted = get_neighbors_with_count(
+        grids_from_cells(grids), positions
+    )
+    assert not reverted.any()
+    for i, (grid, position) in enumerate(zip(grids, positions, strict=True)):
+        expected, count = ref_get_neighbors_with_count(grid, position)
+        assert counts[i] == count
+        assert [tuple(pair) for pair in neighbors[i].tolist()] == expected
+
+
+def test_move_sequences_match_contract() -> None:
+    rng = random.Random(2)
+    n_games, max_len = 300, 8
+    grids = [random_grid(rng) for _ in range(n_games)]
+    positions = [(rng.randrange(11), rng.randrange(11)) for _ in grids]
+    lengths = [rng.randint(0, max_len) for _ in grids]
+    movements = [
+        random_movement(rng, grid, position, length)
+        for grid, position, length in zip(grids, positions, lengths, strict=True)
+    ]
+
+    # Pad the ragged sequences w/ out of range coords that must never be read
+    padded = np.full((n_games, max_len, 2), 255, dtype=np.int64)
+    for i, movement in enumerate(movements):
+        if movement:
+            padded[i, : len(movement)] = movement
+
+    outcomes = is_move_sequence_valid(
+        grids_from_cells(grids), positions, padded, lengths
+    )
+    expected = [
+        ref_outcome(grid, position, movement)
+        for grid, position, movement in zip(grids, positions, movements, strict=True)
+    ]
+    assert outcomes.tolist() == expected
+    assert {MOVE_VALID, MOVE_INVALID} <= set(expected)
+
+
+def test_out_of_range_positions_match_contract() -> None:
+    rng = random.Random(3)
+    cases = []
+    for _ in range(300):
+        grid = random_grid(rng, density=0.1)
+        # Start positions past the grid edge
+        position = rng.choice(
+            [
+                (rng.randrange(11), rng.randrange(11, 256)),
+                (rng.randrange(11, 256), rng.randrange(11)),
+                (rng.randrange(11, 256), rng.randrange(11, 256)),
+            ]
+        )
+        movement = [(rng.randrange(12), rng.randrange(12)) for _ in range(3)]
+        cases.append((grid, position, movement))
+
+    outcomes = is_move_sequence_valid(
+        grids_from_cells([case[0] for case in cases]),
+        [case[1] for case in cases],
+        [case[2] for case in cases],
+    )
+    assert outcomes.tolist() == [ref_outcome(*case) for case in cases]
+    assert (outcomes == MOVE_REVERTED_COORDS).all()
+
+    # Neighbor lookups of such positions either alias into another row or fail `getbyte`
+    _, _, reverted = get_neighbors_with_count(
+        grids_from_cells([case[0] for case in cases]), [case[1] for case in cases]
+    )
+    for case, is_reverted in zip(cases, reverted, strict=True):
+        try:
+            ref_get_neighbors_with_count(case[0], case[1])
+            assert not is_reverted
+        except RevertedError:
+            assert is_reverted
+    assert reverted.any() and not reverted.all()
+
+
+def test_check_move_sequence() -> None:
+    grid = bytearray(cst.GRID_CELL_TOTAL)
+    grid[1 * cst.GRID_SIZE + 1] = 1  # Obstacle at (1, 1)
+
+    assert check_move_sequence(bytes(grid), (0, 0), [(0, 1), (0, 2), (1, 2)])
+    assert not check_move_sequence(bytes(grid), (0, 0), [(0, 1), (1, 1)])
+    # An invalid move returns early, before a later out of range entry is checked
+    assert not check_move_sequence(bytes(grid), (0, 0), [(2, 2), (11, 0)])
+    with pytest.raises(ValueError, match=err.INVALID_POS_COORDS):
+        check_move_sequence(bytes(grid), (0, 0), [(0, 1), (0, 11)])
+    # The start position is range checked too, even for an empty movement
+    with pytest.raises(ValueError, match=err.INVALID_POS_COORDS):
+        check_move_sequence(bytes(grid), (10, 20), [])
+
+
+def test_invalid_inputs() -> None:
+    grids = np.zeros((2, cst.GRID_CELL_TOTAL), dtype=np.uint8)
+    with pytest.raises(ValueError, match="shape"):
+        is_move_sequence_valid(grids[:, :100], [(0, 0), (0, 0)], [[(0, 1)], [(0, 1)]])
+    with pytest.raises(ValueError, match="UInt8"):
+        get_neighbors_with_count(grids, [(0, 0), (0, 256)])
+    with pytest.raises(ValueError, match="Lengths"):
+        is_move_sequence_valid(grids, [(0, 0), (0, 0)], [[(0, 1)], [(0, 1)]], [1, 2])
+    with pytest.raises(ValueError, match="bytes"):
+        grids_from_cells([bytes(cst.GRID_CELL_TOTAL), bytes(10)])
@@ -1,5 +1,4 @@
 # tests/salvo_localnet_test.py
-import json
 import logging
 from datetime import datetime
 from typing import NamedTuple
@@ -7,11 +6,11 @@ from typing import NamedTuple
 import pytest
 from algokit_utils import (
     AppClientCompilationParams,
+    CommonAppCallParams,
     FundAppAccountParams,
     OnSchemaBreak,
     OnUpdate,
     PaymentParams,
-    SendParams,
     TealTemplateParams,
     micro_algo,
 )
@@ -19,11 +18,6 @@ from algokit_utils.algorand import AlgorandClient
 from algokit_utils.models import SigningAccount
 from algosdk.transaction import wait_for_confirmation
 
-from smart_contracts.artifacts.plonk_verifier.lagrange_witness_calculator_client import (
-    CalculateLagrangeWitnessArgs,
-    LagrangeWitnessCalculatorFactory,
-    LagrangeWitnessCalculatorMethodCallCreateParams,
-)
 from smart_contracts.artifacts.plonk_verifier.plonk_verifier_client import (
     PlonkVerifierBareCallCreateParams,
     PlonkVerifierClient,
@@ -39,14 +33,11 @@ from smart_contracts.artifacts.salvo.salvo_client import (
     SalvoFactory,
     SalvoMethodCallCreateParams,
 )
-from tests.utils import send_app_call_txn
+from smart_contracts.salvo import constants as cst
+from tests.utils import create_payment_txn, send_app_call_txn
 from utils.zk_getters import (
-    get_zk_lagrange_witness,
-    get_zk_proof,
+    ARTIFACTS,
     get_zk_proof_as_bytes,
-    get_zk_public_signals,
-    get_zk_root_of_unity_as_bytes,
-    get_zk_vkey,
     get_zk_vkey_as_bytes,
 )
 
@@ -57,13 +48,17 @@ from utils.zk_getters import (
 
 # VKEY_HEX = "0c00f31ab5823625090ce62aa6ca7518aed43c19597efcde4b89699f785b57f63cf6fb61991c01d00fd73135390e2df415d6e7125b0d2a2a9905bb4e05e025c8c31838b70057dc2e4134655ecb6e14df864a496c6447dbe4405619244e2d0108170275dadb4524ba602ce3e5e33bab66463a9f200a1774bf007f95be2f516326755085a5be0bfc98c4d6d4edbc273fc0018b41f2a760be868b9ed1e489a8a1949cff4cc7e72982c5174501c9d026934e5b13a0c8830c24500f777f5f217bd16715dd83342b5ed88dee6b736c833b84c432d97f6b337cc5854d82e4c3d9ab565e16a69c9b13bbc079a615df923fede40419001a1263eae13174c6dd85c7c0f7aa8cc4ab9deaf4bc51844a48b8f0f332a40166d83c47087d4ecaba8eabdc458e850d2159718c0f4efc8b9544065d2514f2bc8ba2377f2c6b4144f270fe38ad270b4d9ffc3cdc418437c2f281222852e43f0f9277fa9b627d5746672f1ae580ca4d64f7c241ed1df01f7878cb16cebfa0b5c3e616c9d0927fe7cec3dbc3681f853911b1cb79e7420a5f43cd91d41ce0d958153317f966a355f53dc8dabf763824f13addd707ea0d51471e303275de4536af069c04360e0a150cc9b76ba4c5c1ad816f1672baf222559a2a10ff4eccd1aaa195d33a15549a09caecc36d54a7eb161c0eb8c47da18ea60c787afa38053e499c109d33f1b5cdcb190184dc52545f47c52f83296ab31c925ff8f3180c9430575c00770edb41b5fa8fd318f878edab8c9d9308ceb03cddf176be687d0099c0b887100a9882606f827b0b68df14bf1a2cfa0e98d588db4b23de0280652d681eda9e65917606ef7aafc7274aa9e99b0fe9abc3d18bc2debf306f42bf928f6239b7c90b7602ca76ccc5339d7220c1f6e6736d4821dca005175d12500a07213adcc935432d4cf80472d586458cd0c6cd97f9e30e225dba250741b3eab9641c2aa11ee36ca07cbb8cb357843b88af1114f0c6b50f7a2da7852cc2fb7909656324ff695503adab95acb224c39123f182818286a6ad0bee365e954b0a81458c68c29590e0d622b33b8899703f16f2ffcbee2fc257000000000000000e000000000000000100000000000000020000000000000003168551071152798719667016500518019151568737276451525831503196981418651227967346087557263864360675191150a95a893af9fe055ae324275a5bd0eb3d8c159341ba0e2760f89aa18d2ef5cc1983640d57578e3864806446abb506812fb467b56359872f4932bcaf91d209ff70d768e238f42faea14d4326870a36307966f49d1957659b1750739a36140a3880ad5f146daee7e480adee15a7b0221dd48d35cf33a21fd33eb6818889fd32879937582f89469a7897096959cbba"
 VKEY2HEX = "0c00f31ab5823625090ce62aa6ca7518aed43c19597efcde4b89699f785b57f63cf6fb61991c01d00fd73135390e2df415d6e7125b0d2a2a9905bb4e05e025c8c31838b70057dc2e4134655ecb6e14df864a496c6447dbe4405619244e2d0108170275dadb4524ba602ce3e5e33bab66463a9f200a1774bf007f95be2f516326755085a5be0bfc98c4d6d4edbc273fc0018b41f2a760be868b9ed1e489a8a1949cff4cc7e72982c5174501c9d026934e5b13a0c8830c24500f777f5f217bd16715dd83342b5ed88dee6b736c833b84c432d97f6b337cc5854d82e4c3d9ab565e16a69c9b13bbc079a615df923fede40419001a1263eae13174c6dd85c7c0f7aa8cc4ab9deaf4bc51844a48b8f0f332a40166d83c47087d4ecaba8eabdc458e850d2159718c0f4efc8b9544065d2514f2bc8ba2377f2c6b4144f270fe38ad270b4d9ffc3cdc418437c2f281222852e43f0f9277fa9b627d5746672f1ae580ca4d64f7c241ed1df01f7878cb16cebfa0b5c3e616c9d0927fe7cec3dbc3681f853911b1cb79e7420a5f43cd91d41ce0d958153317f966a355f53dc8dabf763824f13addd707ea0d51471e303275de4536af069c04360e0a150cc9b76ba4c5c1ad816f1672baf222559a2a10ff4eccd1aaa195d33a15549a09caecc36d54a7eb161c0eb8c47da18ea60c787afa38053e499c109d33f1b5cdcb190184dc52545f47c52f83296ab31c925ff8f3180c9430575c00770edb41b5fa8fd318f878edab8c9d9308ceb03cddf176be687d0099c0b887100a9882606f827b0b68df14bf1a2cfa0e98d588db4b23de0280652d681eda9e65917606ef7aafc7274aa9e99b0fe9abc3d18bc2debf306f42bf928f6239b7c90b7602ca76ccc5339d7220c1f6e6736d4821dca005175d12500a07213adcc935432d4cf80472d586458cd0c6cd97f9e30e225dba250741b3eab9641c2aa11ee36ca07cbb8cb357843b88af1114f0c6b50f7a2da7852cc2fb7909656324ff695503adab95acb224c39123f182818286a6ad0bee365e954b0a81458c68c29590e0d622b33b8899703f16f2ffcbee2fc257000000000000000e00000000000000010000000000000002000000000000000306ecb29d7853319169f87575d7d4e59516938ad445aed9dc7c7b706da5ce06a13cbd6eeda9c338beeb64874080abeee31333c853d054e888aa68bfcc4841dd1f18fbc89405d6760044c4937edd27dfdc2e600322c58f1644312403d4c83b4afc0727d07987d6580bfab9389fb2f7fada2d3f25437a97ac00c45bc1d17040f814588a89e0830b5d9f0a64d36a01a6838f00d8387b76c074e64972014465ae09e92c2840e8d0408f80281e600befe6ec4ee0c613caae9cf32b61de8a67ca9d96e1"
+# Opcode cost ceiling of `commit_turn`, which reads and writes the sender character slot once
+# Counted by hand from the compiled TEAL, not simulated yet; set it to the simulated cost on the
+# first LocalNet run, and lower it whenever the turn-commit path gets cheaper
+COMMIT_TURN_MAX_OPCODE_COST = 98
+
 # Setup the logging.Logger
 logger = logging.getLogger(__name__)
 
 
 class AppFactories(NamedTuple):
     salvo_factories: dict[str, SalvoFactory]
-    lwc_factories: dict[str, LagrangeWitnessCalculatorFactory]
     pvl_factories: dict[str, PlonkVerifierWithLogsFactory]
     pv_factories: dict[str, PlonkVerifierFactory]
 
@@ -126,21 +121,21 @@ def app_factories(
     algorand: AlgorandClient,
     creator: SigningAccount,
 ) -> AppFactories:
-    proof = get_zk_proof()
+    proof = ARTIFACTS.proof()
     proof_bytes = get_zk_proof_as_bytes(proof)
     logger.info(proof_bytes.hex())
-    logger.info(get_zk_lagrange_witness())
-    logger.info(get_zk_vkey_as_bytes(get_zk_vkey(logger), logger))
-    logger.info(get_zk_vkey(logger))
+    logger.info(ARTIFACTS.lagrange_witness())
+    logger.info(get_zk_vkey_as_bytes(ARTIFACTS.vkey(), logger))
+    logger.info(ARTIFACTS.vkey())
 
     # Define the on-deployment/compilation parameters
     salvo_template_params: TealTemplateParams = {
         "GEN_UNIX": int(datetime.now().timestamp()),
     }
     plonk_verifier_template_params: TealTemplateParams = {
-        # "VERIFICATION_KEY": get_zk_vkey_as_bytes(get_zk_vkey(logger), logger),
+        # "VERIFICATION_KEY": get_zk_vkey_as_bytes(ARTIFACTS.vkey(), logger),
         "VERIFICATION_KEY": bytes.fromhex(VKEY2HEX),
-        "ROOT_OF_UNITY": get_zk_root_of_unity_as_bytes(),
+        "ROOT_OF_UNITY": ARTIFACTS.root_of_unity_as_bytes(),
     }
 
     salvo_factories = {
@@ -155,18 +150,6 @@ def app_factories(
             ),
         )
     }
-    lwc_factories = {
-        "lwc_factory_1": algorand.client.get_typed_app_factory(
-            LagrangeWitnessCalculatorFactory,
-            default_sender=creator.address,
-            default_signer=creator.signer,
-            compilation_params=AppClientCompilationParams(
-                deploy_time_params=plonk_verifier_template_params,
-                updatable=None,
-                deletable=None,
-            ),
-        )
-    }
     pvl_factories = {
         "pvl_factory_1": algorand.client.get_typed_app_factory(
             PlonkVerifierWithLogsFactory,
@@ -194,7 +177,6 @@ def app_factories(
 
     return AppFactories(
         salvo_factories=salvo_factories,
-        lwc_factories=lwc_factories,
         pvl_factories=pvl_factories,
         pv_factories=pv_factories,
     )
@@ -260,47 +242,6 @@ def app_clients(algorand: AlgorandClient, app_factories: AppFactories) -> AppCli
         except Exception as e:
             logger.info(f"Failed to deploy {name}: {e}")
 
-    for name, factory in app_factories.lwc_factories.items():
-        try:
-            deploy_result = factory.deploy(
-                on_update=OnUpdate.UpdateApp,
-                on_schema_break=OnSchemaBreak.ReplaceApp,
-                create_params=LagrangeWitnessCalculatorMethodCallCreateParams(
-                    on_complete=5,  # 5=DeleteApplication
-                    method="calculateLagrangeWitness",
-                    args=CalculateLagrangeWitnessArgs(
-                        signals=get_zk_public_signals(), proof=get_zk_proof()
-                    ),
-                    max_fee=micro_algo(500_000),
-                ),
-                send_params=SendParams(cover_app_call_inner_transaction_fees=True),
-            )[1]
-
-            # Verify transaction was confirmed by the network
-            wait_for_confirmation(
-                algorand.client.algod, deploy_result.create_result.tx_id, 3
-            )
-            assert (
-                deploy_result.create_result.confirmation
-            ), "deploy_result.create_result.confirmation transaction failed confirmation."
-
-            # Retrieve the ABI return value from the LWC deployment result create method call
-            lwc_abi_return = deploy_result.create_result.abi_return
-
-            # Map the LWC ABI return value to separate keys in a flat object
-            lw_data = {
-                "l": lwc_abi_return[0],
-                "xin": lwc_abi_return[1],
-                "zh": lwc_abi_return[2],
-            }
-
-            # Write LW into a JSON file
-            with open("./circuits/main/artifacts/lagrange_witness.json", "w") as f:
-                json.dump(lw_data, f, indent=4)
-
-        except Exception as e:
-            logger.info(f"Failed to deploy {name}: {e}")
-
     pvl_clients = {}
     for name, factory in app_factories.pvl_factories.items():
         try:
@@ -471,7 +412,11 @@ def test_plonk_verify(creator: SigningAccount, app_clients: AppClients) -> None:
             app=pvl,
             sender=sender,
             method=pvl.send.verify,
-            args=(get_zk_public_signals(), get_zk_proof(), get_zk_lagrange_witness()),
+            args=(
+                ARTIFACTS.public_signals(),
+                ARTIFACTS.proof(),
+                ARTIFACTS.lagrange_witness(),
+            ),
             max_fee=500_000,
             note=note,
             description="App Call Method Call Transaction: verify()",
@@ -485,13 +430,13 @@ def test_plonk_verify(creator: SigningAccount, app_clients: AppClients) -> None:
 
     # composer = pv.new_group()
 
-    # logger.info(get_zk_public_signals())
-    # logger.info(get_zk_proof())
-    # logger.info(get_zk_lagrange_witness())
-    # logger.info(get_zk_vkey(logger))
+    # logger.info(ARTIFACTS.public_signals())
+    # logger.info(ARTIFACTS.proof())
+    # logger.info(ARTIFACTS.lagrange_witness())
+    # logger.info(ARTIFACTS.vkey())
 
     # composer.verify(
-    #     args=(get_zk_public_signals(), get_zk_proof(), get_zk_lagrange_witness()),
+    #     args=(ARTIFACTS.public_signals(), ARTIFACTS.proof(), ARTIFACTS.lagrange_witness()),
     #     params=CommonAppCallParams(
     #         sender=creator.address,
     #         signer=creator.signer,
@@ -754,3 +699,44 @@ def test_mimc_tester(
     # )
 
     # logger.info(result)
+
+
+# Test case checking the opcode cost of the `commit_turn` method stays under its ceiling
+def test_commit_turn_opcode_cost(
+    creator: SigningAccount,
+    app_clients: AppClients,
+) -> None:
+    # Get smart contract application client from from app clients dict
+    salvo = app_clients.salvo_clients["salvo_client_1"]
+    params = CommonAppCallParams(sender=creator.address, signer=creator.signer)
+
+    # Create a new game, the creator takes lobby slot 0
+    lobby_size = 2
+    box_l_cost = 2_500 + 400 * (10 + lobby_size * cst.ADDRESS_SIZE)
+    game_id = salvo.state.global_state.game_id
+    salvo.new_group().new_game(
+        args=(
+            create_payment_txn(salvo, creator, cst.BOX_G_COST),
+            create_payment_txn(salvo, creator, cst.BOX_S_COST),
+            create_payment_txn(salvo, creator, cst.BOX_C_COST),
+            create_payment_txn(salvo, creator, box_l_cost),
+            create_payment_txn(salvo, creator, 0),
+            lobby_size,
+            cst.COMMIT_SCHEME_MIMC,
+        ),
+        params=params,
+    ).send()
+
+    # Simulate the turn commitment and read the opcode budget it consumed
+    result = (
+        salvo.new_group()
+        .commit_turn(args=(game_id, 0, 1234567890), params=params)
+        .simulate(allow_unnamed_resources=True)
+    )
+    cost = result.simulate_response["txn-groups"][0]["app-budget-consumed"]
+    logger.info(f"commit_turn opcode cost: {cost}")
+
+    assert cost <= COMMIT_TURN_MAX_OPCODE_COST, (
+        f"commit_turn opcode cost {cost} exceeds its "
+        f"{COMMIT_TURN_MAX_OPCODE_COST} ceiling"
+    )
@@ -0,0 +1,125 @@
+# tests/turn_preimage_test.py
+import hashlib
+
+import pytest
+from Cryptodome.Hash import SHA512
+
+from smart_contracts.salvo import constants as cst
+from utils.mimc import mimc
+from utils.turn_preimage import (
+    TurnPreimage,
+    hash_turn_preimages,
+    pack_turn_preimages,
+    turn_preimage_size,
+)
+
+
+# Mirror of `srt.u8_to_fr32`
+def u8_to_fr32(u: int) -> bytes:
+    return bytes(31) + u.to_bytes(1, "big")
+
+
+# Mirror of `srt.u64_to_fr32`
+def u64_to_fr32(u: int) -> bytes:
+    return bytes(24) + u.to_bytes(8, "big")
+
+
+def test_preimage_matches_contract_encoding() -> None:
+    movement = [(0, 7), (0, 8), (0, 9), (1, 9), (1, 10)]
+    turn = TurnPreimage(42, movement, action=0, direction=2, salt=1234567888999)
+
+    # Same concatenation order as `srt.build_turn_preimage_fr32`
+    expected = u64_to_fr32(cst.DOMAIN_PREFIX) + u64_to_fr32(42)
+    for row, col in movement:
+        expected += u8_to_fr32(row) + u8_to_fr32(col)
+    expected += u8_to_fr32(0) + u8_to_fr32(2) + u64_to_fr32(1234567888999)
+
+    assert turn.data == expected
+    assert len(turn.data) == turn_preimage_size(len(movement))
+    assert turn.fields() == [
+        cst.DOMAIN_PREFIX,
+        42,
+        *[c for coords in movement for c in coords],
+        0,
+        2,
+        1234567888999,
+    ]
+    assert turn.hash() == mimc(expected)
+    assert turn.hash_int() == int.from_bytes(mimc(expected), "big")
+
+
+def test_batch_packing_and_hashing() -> None:
+    turns = [
+        TurnPreimage(1, [(5, 5)], action=1, direction=0, salt=1),
+        TurnPreimage(2, [], action=0, direction=3, salt=2),
+        TurnPreimage(2, [(1, 2), (2, 2)], action=0, direction=1, salt=3),
+    ]
+    buf, spans = pack_turn_preimages(turns)
+
+    assert [bytes(buf[start:end]) for start, end in spans] == [t.data for t in turns]
+    assert hash_turn_preimages(turns) == [t.hash() for t in turns]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"movement": [(256, 0)]}, "row 256 does not fit in a UInt8"),
+        ({"action": -1}, "action -1 does not fit in a UInt8"),
+        ({"salt": 1 << 64}, "does not fit in a UInt64"),
+        ({"game_id": -1}, "game_id -1 does not fit in a UInt64"),
+    ],
+)
+def test_out_of_range_values_are_rejected(kwargs: dict, message: str) -> None:
+    turn = {
+        "game_id": 1,
+        "movement": [],
+        "action": 0,
+        "direction": 0,
+        "salt": 0,
+        **kwargs,
+    }
+
+    with pytest.raises(ValueError, match=message):
+        TurnPreimage(**turn)
+
+
+def test_reveal_encoding_matches_contract() -> None:
+    movement = [(0, 7), (0, 8), (1, 8)]
+    turn = TurnPreimage(42, movement, action=1, direction=3, salt=987654321)
+
+    # Same concatenation order as `srt.build_turn_preimage_bytes`, movement as an ARC-4 uint8[2][]
+    expected = (
+        cst.DOMAIN_PREFIX.to_bytes(8, "big")
+        + (42).to_bytes(8, "big")
+        + (3).to_bytes(2, "big")
+        + bytes([0, 7, 0, 8, 1, 8])
+        + bytes([1, 3])
+        + (987654321).to_bytes(8, "big")
+    )
+    assert turn.reveal_bytes() == expected
+    assert turn.reveal_args() == (movement, 1, 3, 987654321)
+
+
+def test_commitment_schemes() -> None:
+    turn = TurnPreimage(7, [(0, 7)], action=0, direction=2, salt=5)
+    data = turn.reveal_bytes()
+
+    assert turn.commitment(cst.COMMIT_SCHEME_MIMC) == mimc(turn.data)
+    assert turn.commitment(cst.COMMIT_SCHEME_SHA256) == hashlib.sha256(data).digest()
+    assert (
+        turn.commitment(cst.COMMIT_SCHEME_SHA512_256)
+        == SHA512.new(data, truncate="256").digest()
+    )
+    assert turn.commitment_int(cst.COMMIT_SCHEME_MIMC) == turn.hash_int()
+
+    # Every scheme binds the commitment to its game, so a reveal cannot be replayed elsewhere
+    other = TurnPreimage(8, [(0, 7)], action=0, direction=2, salt=5)
+    for scheme in (
+        cst.COMMIT_SCHEME_MIMC,
+        cst.COMMIT_SCHEME_SHA256,
+        cst.COMMIT_SCHEME_SHA512_256,
+    ):
+        assert turn.commitment(scheme) != other.commitment(scheme)
+
+    with pytest.raises(ValueError, match="Unknown commit scheme"):
+        turn.commitment(3)
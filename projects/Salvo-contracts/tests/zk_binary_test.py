@@ -0,0 +1,155 @@
+# tests/zk_binary_test.py
+import random
+from hashlib import sha256
+from pathlib import Path
+
+import pytest
+
+from tests.zk_getters_test import write_artifacts
+from utils.fr import R
+from utils.zk_binary import (
+    HEADER,
+    KIND_PROOF,
+    PROOF_SIZE,
+    VKEY_SIZE,
+    ContainerReader,
+    convert_json_artifacts,
+    write_container,
+    write_proofs,
+    write_vkeys,
+)
+from utils.zk_codec import VKEY_CODEC
+from utils.zk_getters import ArtifactStore, get_zk_proof_as_bytes
+from utils.zk_models import Proof, VerificationKey
+
+
+# Build a proof filled w/ deterministic pseudo-random bytes
+def make_proof(seed: int) -> Proof:
+    rng = random.Random(seed)
+    return Proof(
+        **{
+            label: rng.randbytes(96)
+            for label in ["A", "B", "C", "Z", "T1", "T2", "T3", "Wxi", "Wxiw"]
+        },
+        **{
+            key: rng.randrange(R)
+            for key in ["eval_a", "eval_b", "eval_c", "eval_s1", "eval_s2", "eval_zw"]
+        },
+    )
+
+
+# Build a verification key filled w/ deterministic pseudo-random bytes
+def make_vkey(seed: int) -> VerificationKey:
+    rng = random.Random(seed)
+    return VerificationKey(
+        **{
+            label: rng.randbytes(96)
+            for label in ["Qm", "Ql", "Qr", "Qo", "Qc", "S1", "S2", "S3"]
+        },
+        power=rng.randrange(32),
+        nPublic=rng.randrange(8),
+        k1=2,
+        k2=3,
+        X_2=rng.randbytes(192),
+    )
+
+
+def test_proof_container_round_trip(tmp_path: Path) -> None:
+    proofs = [make_proof(i) for i in range(5)]
+    path = tmp_path / "proofs.bin"
+    write_proofs(path, proofs, index=True)
+
+    assert path.stat().st_size == HEADER.size + 5 * (PROOF_SIZE + 32)
+    with ContainerReader(path) as reader:
+        assert len(reader) == 5
+        for proof, view in zip(proofs, reader, strict=True):
+            assert view.to_proof() == proof
+            assert view.eval_zw == proof.eval_zw
+            assert isinstance(view.Wxi, memoryview)
+            assert view.Wxi == proof.Wxi
+            assert view.raw == get_zk_proof_as_bytes(proof)
+            del view
+        key = sha256(get_zk_proof_as_bytes(proofs[3])).digest()
+        assert reader.find(key) == 3
+
+
+def test_vkey_container_round_trip(tmp_path: Path) -> None:
+    vk = make_vkey(7)
+    path = tmp_path / "vkeys.bin"
+    write_vkeys(path, [vk])
+
+    with ContainerReader(path) as reader:
+        view = reader[0]
+        assert len(view.raw) == VKEY_SIZE
+        assert view.raw == VKEY_CODEC.encode(vk)
+        assert (view.power, view.nPublic, view.k1, view.k2) == (
+            vk.power,
+            vk.nPublic,
+            vk.k1,
+            vk.k2,
+        )
+        assert view.X_2 == vk.X_2
+        assert view.to_vkey() == vk
+        del view
+        with pytest.raises(KeyError, match="no index"):
+            reader.find(bytes(32))
+
+
+def test_convert_json_artifacts(tmp_path: Path) -> None:
+    write_artifacts(tmp_path)
+    store = ArtifactStore(tmp_path)
+    convert_json_artifacts(store, tmp_path / "proof.bin", tmp_path / "vkey.bin")
+
+    with ContainerReader(tmp_path / "proof.bin") as reader:
+        assert reader[0].to_proof() == store.proof()
+    with ContainerReader(tmp_path / "vkey.bin") as reader:
+        assert reader[0].to_vkey() == store.vkey()
+
+
+@pytest.mark.parametrize(
+    ("mangle", "message"),
+    [
+        (lambda data: b"XXXX" + data[4:], "Not a v1 container"),
+        (lambda data: data[:-1], "Expected"),
+        (lambda data: data[:8], "Truncated container header"),
+    ],
+)
+def test_malformed_container_is_rejected(
+    tmp_path: Path, mangle: object, message: str
+) -> None:
+    path = tmp_path / "proofs.bin"
+    write_container(path, KIND_PROOF, [get_zk_proof_as_bytes(make_proof(1))])
+    path.write_bytes(mangle(path.read_bytes()))  # type: ignore[operator]
+
+    with pytest.raises(ValueError, match=message):
+        ContainerReader(path)
+
+
+def test_wrong_record_size_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="expected 1056 bytes"):
+        write_container(tmp_path / "proofs.bin", KIND_PROOF, [bytes(992)])
+
+
+def test_key_out_of_range(tmp_path: Path) -> None:
+    path = tmp_path / "proofs.bin"
+    write_proofs(path, [make_proof(i) for i in range(2)], index=True)
+
+    with ContainerReader(path) as reader:
+        assert reader.key(-1) == reader.key(1)
+        with pytest.raises(IndexError, match="out of range"):
+            reader.key(2)
+
+
+def test_close_with_live_view_closes_file(tmp_path: Path) -> None:
+    path = tmp_path / "proofs.bin"
+    write_proofs(path, [make_proof(1)])
+    reader = ContainerReader(path)
+    view = reader[0]
+
+    with pytest.raises(BufferError):
+        reader.close()
+    assert reader._file.closed
+
+    # Once the view is gone the mapping can be closed too
+    del view
+    reader.close()
@@ -0,0 +1,82 @@
+# tests/zk_codec_test.py
+import json
+from dataclasses import asdict
+
+import pytest
+from algokit_utils import StructField, get_abi_encoded_value
+
+from tests.zk_binary_test import make_proof, make_vkey
+from utils.fr import R
+from utils.zk_codec import (
+    LAGRANGE_WITNESS_CODEC,
+    PLONK_VERIFIER_ARC56_PATH,
+    PROOF_CODEC,
+    VKEY_CODEC,
+)
+from utils.zk_models import LagrangeWitness
+
+# ARC-56 struct specs, used as the reference encoder
+with open(PLONK_VERIFIER_ARC56_PATH) as f:
+    STRUCTS = {
+        name: [StructField(name=field["name"], type=field["type"]) for field in fields]
+        for name, fields in json.load(f)["structs"].items()
+    }
+
+
+def test_static_structs_match_reference_encoder() -> None:
+    proof = make_proof(1)
+    vk = make_vkey(2)
+
+    assert PROOF_CODEC.encode(proof) == get_abi_encoded_value(
+        asdict(proof), "Proof", STRUCTS
+    )
+    assert VKEY_CODEC.encode(vk) == get_abi_encoded_value(
+        asdict(vk), "VerificationKey", STRUCTS
+    )
+    assert (PROOF_CODEC.head_size, VKEY_CODEC.head_size) == (1056, 992)
+
+
+def test_lagrange_witness_matches_reference_encoder() -> None:
+    lw = LagrangeWitness(l=(0, 5, R - 1), xin=7, zh=6)
+    encoded = LAGRANGE_WITNESS_CODEC.encode(lw)
+
+    assert encoded == get_abi_encoded_value(
+        {"L": list(lw.l), "xin": lw.xin, "zh": lw.zh}, "LagrangeWitness", STRUCTS
+    )
+    assert LAGRANGE_WITNESS_CODEC.decode(encoded) == lw
+
+
+def test_batch_encoding_is_contiguous() -> None:
+    proofs = [make_proof(i) for i in range(4)]
+    buf = PROOF_CODEC.encode_many(proofs)
+
+    assert bytes(buf) == b"".join(PROOF_CODEC.encode(proof) for proof in proofs)
+    assert PROOF_CODEC.decode_many(memoryview(buf), len(proofs)) == proofs
+
+
+def test_encode_into_preallocated_buffer() -> None:
+    vk = make_vkey(3)
+    buf = bytearray(10 + VKEY_CODEC.size())
+
+    assert VKEY_CODEC.encode_into(vk, memoryview(buf), 10) == len(buf)
+    assert VKEY_CODEC.decode(buf, 10) == vk
+
+
+@pytest.mark.parametrize(
+    ("change", "message"),
+    [
+        ({"A": bytes(95)}, r"Proof.A: expected 96 bytes"),
+        # Same total size, but misaligned fields
+        ({"A": bytes(97), "B": bytes(95)}, r"Proof.A: expected 96 bytes, but got 97"),
+        ({"eval_a": 1 << 256}, "Proof: value out of range"),
+    ],
+)
+def test_invalid_field_is_rejected(change: dict, message: str) -> None:
+    proof = make_proof(5)
+
+    invalid = type(proof)(**{**asdict(proof), **change})
+
+    with pytest.raises(ValueError, match=message):
+        PROOF_CODEC.encode(invalid)
+    with pytest.raises(ValueError, match=message):
+        PROOF_CODEC.encode_into(invalid, bytearray(PROOF_CODEC.size()))
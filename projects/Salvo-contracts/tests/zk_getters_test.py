@@ -0,0 +1,118 @@
+# tests/zk_getters_test.py
+import base64
+import json
+import os
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+import pytest
+
+from utils.fr import R
+from utils.zk_getters import ArtifactStore
+
+PROOF_EVALS = {
+    "eval_a": 1,
+    "eval_b": 2,
+    "eval_c": 3,
+    "eval_s1": 4,
+    "eval_s2": 5,
+    "eval_zw": 6,
+}
+
+
+# Write a minimal, self-consistent set of ZK circuit artifact files into a directory
+def write_artifacts(artifacts_dir: Path) -> None:
+    files = {
+        "public.json": ["42", "7"],
+        "verification_key.json": {
+            "power": "4",
+            "nPublic": "2",
+            "k1": "2",
+            "k2": "3",
+            "w": str(R - 1),
+        },
+        "vkey_gpoints_payload.json": {
+            "data": base64.b64encode(bytes(range(256)) * 3 + bytes(192)).decode()
+        },
+        "proof.json": {key: str(value) for key, value in PROOF_EVALS.items()},
+        "proof_payload.json": {
+            "data": base64.b64encode(bytes(range(96)) * 9 + bytes(192)).decode()
+        },
+    }
+    for name, data in files.items():
+        (artifacts_dir / name).write_text(json.dumps(data))
+
+
+# Bump a file's mtime so the store sees a change even within the same clock tick
+def touch_forward(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_artifacts_are_parsed_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    write_artifacts(tmp_path)
+    store = ArtifactStore(tmp_path)
+    loads: list[str] = []
+    json_load = json.load
+
+    def counting_load(f):  # noqa: ANN001, ANN202
+        loads.append(Path(f.name).name)
+        return json_load(f)
+
+    monkeypatch.setattr(json, "load", counting_load)
+
+    for _ in range(3):
+        assert store.public_signals() == (42, 7)
+        assert store.root_of_unity() == R - 1
+        assert store.vkey() is store.vkey()
+        assert store.proof() is store.proof()
+        assert len(store.lagrange_witness().l) == 3
+
+    assert sorted(loads) == sorted(
+        [
+            "public.json",
+            "verification_key.json",
+            "vkey_gpoints_payload.json",
+            "proof.json",
+            "proof_payload.json",
+        ]
+    )
+
+
+def test_changed_artifact_is_reloaded(tmp_path: Path) -> None:
+    write_artifacts(tmp_path)
+    store = ArtifactStore(tmp_path)
+    proof = store.proof()
+    vk = store.vkey()
+    lw = store.lagrange_witness()
+
+    proof_path = tmp_path / "proof.json"
+    proof_path.write_text(
+        json.dumps({**json.loads(proof_path.read_text()), "eval_zw": "7"})
+    )
+    touch_forward(proof_path)
+
+    assert store.proof().eval_zw == 7
+    assert store.proof() is not proof
+    assert store.vkey() is vk
+    assert store.lagrange_witness() is not lw
+
+
+def test_decoded_artifacts_are_immutable(tmp_path: Path) -> None:
+    write_artifacts(tmp_path)
+    store = ArtifactStore(tmp_path)
+
+    with pytest.raises(FrozenInstanceError):
+        store.proof().eval_a = 0  # type: ignore[misc]
+    assert isinstance(store.lagrange_witness().l, tuple)
+    assert isinstance(store.public_signals(), tuple)
+
+
+def test_malformed_payload_is_rejected(tmp_path: Path) -> None:
+    write_artifacts(tmp_path)
+    (tmp_path / "proof_payload.json").write_text(json.dumps({"data": ""}))
+
+    with pytest.raises(ValueError, match="Expected 1056 bytes"):
+        ArtifactStore(tmp_path).proof()
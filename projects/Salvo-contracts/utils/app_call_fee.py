@@ -0,0 +1,33 @@
+# utils/app_call_fee.py
+from math import ceil
+
+from algosdk.transaction import SuggestedParams
+
+# Opcode budget added by each app call in a group, incl. the OpUp inner calls of `ensure_budget`
+APP_CALL_BUDGET = 700
+
+# Minimum fee per transaction, used when the suggested params carry none
+DEFAULT_MIN_FEE = 1_000
+
+
+# Get the flat fee of an app call whose `ensure_budget` needs `required_budget`, covering its OpUp inner calls
+def budget_fee(required_budget: int, min_fee: int = DEFAULT_MIN_FEE) -> int:
+    return (1 + ceil(required_budget / APP_CALL_BUDGET)) * min_fee
+
+
+# Get the opcode budget a flat fee pays for: the app call itself plus one OpUp inner call per extra min fee
+def fee_budget(fee: int, min_fee: int = DEFAULT_MIN_FEE) -> int:
+    return APP_CALL_BUDGET * (fee // min_fee)
+
+
+# Copy suggested params w/ a flat fee, keeping the validity window and genesis of the original
+def with_flat_fee(sp: SuggestedParams, fee: int) -> SuggestedParams:
+    return SuggestedParams(
+        fee=fee,
+        first=sp.first,
+        last=sp.last,
+        gh=sp.gh,
+        gen=sp.gen,
+        flat_fee=True,
+        min_fee=sp.min_fee,
+    )
@@ -0,0 +1,440 @@
+# utils/bls12_381.py
+from collections.abc import Sequence
+from typing import TypeAlias
+
+from utils.fr import R
+
+# BLS12-381 base field modulus (p)
+P = 0x1A0111EA397FE69A4B1BA7B6434BACD764774B84F38512BF6730D2A0F6B0F6241EABFFFEB153FFFFB9FEFFFFFFFFAAAB
+
+# Curve parameter |x| driving the optimal ate Miller loop (x itself is negative)
+ATE_LOOP_COUNT = 0xD201000000010000
+
+# Encoded sizes, matching the AVM `ec_*` opcodes (big-endian, uncompressed, c0 before c1 for Fq2)
+FP_SIZE = 48
+G1_SIZE = 96
+G2_SIZE = 192
+
+# Fq2 element a + b*i (i^2 = -1) represented as a tuple (a, b)
+Fq2: TypeAlias = tuple[int, int]
+
+# Affine points, `None` denotes the point at infinity
+G1Point: TypeAlias = tuple[int, int] | None
+G2Point: TypeAlias = tuple[Fq2, Fq2] | None
+
+# Jacobian points (X, Y, Z), Z == 0 denotes the point at infinity
+G1Jacobian: TypeAlias = tuple[int, int, int]
+
+# Fq12 element as 12 coefficients of a polynomial in w, reduced modulo w^12 - 2w^6 + 2
+Fq12: TypeAlias = tuple[int, ...]
+
+# Curve equation constants: E(Fq): y^2 = x^3 + 4, twist E'(Fq2): y^2 = x^3 + 4(1 + i)
+B1 = 4
+B2: Fq2 = (4, 4)
+
+# Generators, identical to the `G1_ONE` and `G2_ONE` constants used by the verifier contract
+G1_GEN: G1Point = (
+    0x17F1D3A73197D7942695638C4FA9AC0FC3688C4F9774B905A14E3A3F171BAC586C55E83FF97A1AEFFB3AF00ADB22C6BB,
+    0x08B3F481E3AAA0F1A09E30ED741D8AE4FCF5E095D5D00AF600DB18CB2C04B3EDD03CC744A2888AE40CAA232946C5E7E1,
+)
+G2_GEN: G2Point = (
+    (
+        0x024AA2B2F08F0A91260805272DC51051C6E47AD4FA403B02B4510B647AE3D1770BAC0326A805BBEFD48056C8C121BDB8,
+        0x13E02B6052719F607DACD3A088274F65596BD0D09920B61AB5DA61BBDC7F5049334CF11213945D57E5AC7D055D042B7E,
+    ),
+    (
+        0x0CE5D527727D6E118CC9CDC6DA2E351AADFD9BAA8CBDD3A76D429A695160D12C923AC9CC3BACA289E193548608B82801,
+        0x0606C4A02EA734CC32ACD2B02BC28B99CB3E287E85A763AF267492AB572E99AB3F370D275CEC1DA1AAA9075FF05F79BE,
+    ),
+)
+
+FQ12_ONE: Fq12 = (1,) + (0,) * 11
+
+
+# ----------------------------------------------------------------------------
+# Fq2 arithmetic
+# ----------------------------------------------------------------------------
+
+
+def f2_add(a: Fq2, b: Fq2) -> Fq2:
+    return (a[0] + b[0]) % P, (a[1] + b[1]) % P
+
+
+def f2_sub(a: Fq2, b: Fq2) -> Fq2:
+    return (a[0] - b[0]) % P, (a[1] - b[1]) % P
+
+
+def f2_neg(a: Fq2) -> Fq2:
+    return -a[0] % P, -a[1] % P
+
+
+def f2_mul(a: Fq2, b: Fq2) -> Fq2:
+    return (a[0] * b[0] - a[1] * b[1]) % P, (a[0] * b[1] + a[1] * b[0]) % P
+
+
+def f2_sqr(a: Fq2) -> Fq2:
+    return (a[0] + a[1]) * (a[0] - a[1]) % P, 2 * a[0] * a[1] % P
+
+
+def f2_scale(a: Fq2, k: int) -> Fq2:
+    return a[0] * k % P, a[1] * k % P
+
+
+def f2_inv(a: Fq2) -> Fq2:
+    # (a + bi)^-1 = (a - bi) / (a^2 + b^2)
+    inv = pow(a[0] * a[0] + a[1] * a[1], -1, P)
+    return a[0] * inv % P, -a[1] * inv % P
+
+
+# ----------------------------------------------------------------------------
+# G1 arithmetic (Jacobian coordinates internally, affine at the boundaries)
+# ----------------------------------------------------------------------------
+
+
+def g1_is_on_curve(pt: G1Point) -> bool:
+    if pt is None:
+        return True
+    x, y = pt
+    return (y * y - x * x * x - B1) % P == 0
+
+
+def g1_to_jacobian(pt: G1Point) -> G1Jacobian:
+    return (1, 1, 0) if pt is None else (pt[0], pt[1], 1)
+
+
+def g1_from_jacobian(pt: G1Jacobian) -> G1Point:
+    x, y, z = pt
+    if z == 0:
+        return None
+    z_inv = pow(z, -1, P)
+    z_inv2 = z_inv * z_inv % P
+    return x * z_inv2 % P, y * z_inv2 * z_inv % P
+
+
+def g1_double_jacobian(pt: G1Jacobian) -> G1Jacobian:
+    x, y, z = pt
+    if z == 0 or y == 0:
+        return 1, 1, 0
+    yy = y * y % P
+    s = 4 * x * yy % P
+    m = 3 * x * x % P
+    nx = (m * m - 2 * s) % P
+    ny = (m * (s - nx) - 8 * yy * yy) % P
+    nz = 2 * y * z % P
+    return nx, ny, nz
+
+
+def g1_add_jacobian(p1: G1Jacobian, p2: G1Jacobian) -> G1Jacobian:
+    x1, y1, z1 = p1
+    x2, y2, z2 = p2
+    if z1 == 0:
+        return p2
+    if z2 == 0:
+        return p1
+    z1z1 = z1 * z1 % P
+    z2z2 = z2 * z2 % P
+    u1 = x1 * z2z2 % P
+    u2 = x2 * z1z1 % P
+    s1 = y1 * z2 * z2z2 % P
+    s2 = y2 * z1 * z1z1 % P
+    if u1 == u2:
+        # Same x coordinate: either the same point (double) or opposite points (infinity)
+        return g1_double_jacobian(p1) if s1 == s2 else (1, 1, 0)
+    h = (u2 - u1) % P
+    hh = h * h % P
+    hhh = h * hh % P
+    rr = (s2 - s1) % P
+    v = u1 * hh % P
+    nx = (rr * rr - hhh - 2 * v) % P
+    ny = (rr * (v - nx) - s1 * hhh) % P
+    nz = z1 * z2 * h % P
+    return nx, ny, nz
+
+
+def g1_mul_jacobian(pt: G1Jacobian, k: int) -> G1Jacobian:
+    result: G1Jacobian = (1, 1, 0)
+    for bit in bin(k)[2:] if k > 0 else "":
+        result = g1_double_jacobian(result)
+        if bit == "1":
+            result = g1_add_jacobian(result, pt)
+    return result
+
+
+def g1_add(p1: G1Point, p2: G1Point) -> G1Point:
+    return g1_from_jacobian(g1_add_jacobian(g1_to_jacobian(p1), g1_to_jacobian(p2)))
+
+
+def g1_neg(pt: G1Point) -> G1Point:
+    return None if pt is None else (pt[0], -pt[1] % P)
+
+
+def g1_mul(pt: G1Point, k: int) -> G1Point:
+    return g1_from_jacobian(g1_mul_jacobian(g1_to_jacobian(pt), k % R))
+
+
+# Multi-scalar multiplication (same semantics as `ec_multi_scalar_mul`, points assumed in G1)
+def g1_msm(points: Sequence[G1Point], scalars: Sequence[int]) -> G1Point:
+    acc: G1Jacobian = (1, 1, 0)
+    for pt, k in zip(points, scalars, strict=True):
+        acc = g1_add_jacobian(acc, g1_mul_jacobian(g1_to_jacobian(pt), k % R))
+    return g1_from_jacobian(acc)
+
+
+# Check the point lies in the prime order subgroup (same semantics as `ec_subgroup_check`)
+def g1_in_subgroup(pt: G1Point) -> bool:
+    return g1_is_on_curve(pt) and g1_mul_jacobian(g1_to_jacobian(pt), R)[2] == 0
+
+
+# Decode a 96-byte AVM G1 point (all-zero bytes encode the point at infinity)
+def g1_from_bytes(b: bytes) -> G1Point:
+    if len(b) != G1_SIZE:
+        raise ValueError(f"Expected {G1_SIZE} bytes, but got {len(b)} bytes instead")
+    if not any(b):
+        return None
+    x = int.from_bytes(b[:FP_SIZE], "big")
+    y = int.from_bytes(b[FP_SIZE:], "big")
+    if x >= P or y >= P:
+        raise ValueError("G1 coordinate not in Fp")
+    if not g1_is_on_curve((x, y)):
+        raise ValueError("G1 point not on curve")
+    return x, y
+
+
+# Encode a G1 point into its 96-byte AVM representation
+def g1_to_bytes(pt: G1Point) -> bytes:
+    if pt is None:
+        return bytes(G1_SIZE)
+    return pt[0].to_bytes(FP_SIZE, "big") + pt[1].to_bytes(FP_SIZE, "big")
+
+
+# ----------------------------------------------------------------------------
+# G2 arithmetic (affine coordinates over Fq2)
+# ----------------------------------------------------------------------------
+
+
+def g2_is_on_curve(pt: G2Point) -> bool:
+    if pt is None:
+        return True
+    x, y = pt
+    return f2_sub(f2_sqr(y), f2_add(f2_mul(f2_sqr(x), x), B2)) == (0, 0)
+
+
+def g2_neg(pt: G2Point) -> G2Point:
+    return None if pt is None else (pt[0], f2_neg(pt[1]))
+
+
+def g2_add(p1: G2Point, p2: G2Point) -> G2Point:
+    if p1 is None:
+        return p2
+    if p2 is None:
+        return p1
+    (x1, y1), (x2, y2) = p1, p2
+    if x1 == x2:
+        if y1 != y2 or y1 == (0, 0):
+            return None
+        lam = f2_mul(f2_scale(f2_sqr(x1), 3), f2_inv(f2_scale(y1, 2)))
+    else:
+        lam = f2_mul(f2_sub(y2, y1), f2_inv(f2_sub(x2, x1)))
+    x3 = f2_sub(f2_sub(f2_sqr(lam), x1), x2)
+    y3 = f2_sub(f2_mul(lam, f2_sub(x1, x3)), y1)
+    return x3, y3
+
+
+def g2_mul(pt: G2Point, k: int) -> G2Point:
+    result: G2Point = None
+    for bit in bin(k)[2:] if k > 0 else "":
+        result = g2_add(result, result)
+        if bit == "1":
+            result = g2_add(result, pt)
+    return result
+
+
+def g2_in_subgroup(pt: G2Point) -> bool:
+    return g2_is_on_curve(pt) and g2_mul(pt, R) is None
+
+
+# Decode a 192-byte AVM G2 point, laid out as x.c0 || x.c1 || y.c0 || y.c1
+def g2_from_bytes(b: bytes) -> G2Point:
+    if len(b) != G2_SIZE:
+        raise ValueError(f"Expected {G2_SIZE} bytes, but got {len(b)} bytes instead")
+    if not any(b):
+        return None
+    x0, x1, y0, y1 = (
+        int.from_bytes(b[i : i + FP_SIZE], "big") for i in range(0, G2_SIZE, FP_SIZE)
+    )
+    if max(x0, x1, y0, y1) >= P:
+        raise ValueError("G2 coordinate not in Fp2")
+    pt = (x0, x1), (y0, y1)
+    if not g2_is_on_curve(pt):
+        raise ValueError("G2 point not on curve")
+    return pt
+
+
+# Encode a G2 point into its 192-byte AVM representation
+def g2_to_bytes(pt: G2Point) -> bytes:
+    if pt is None:
+        return bytes(G2_SIZE)
+    (x0, x1), (y0, y1) = pt
+    return b"".join(c.to_bytes(FP_SIZE, "big") for c in (x0, x1, y0, y1))
+
+
+# ----------------------------------------------------------------------------
+# Fq12 arithmetic and pairing
+# ----------------------------------------------------------------------------
+
+
+def f12_mul(a: Fq12, b: Fq12) -> Fq12:
+    # Schoolbook product, skipping zero coefficients so sparse line values stay cheap
+    prod = [0] * 23
+    for i, ai in enumerate(a):
+        if ai:
+            for j, bj in enumerate(b):
+                if bj:
+                    prod[i + j] += ai * bj
+
+    # Reduce w^k for k >= 12 using w^12 = 2w^6 - 2
+    for k in range(22, 11, -1):
+        c = prod[k]
+        if c:
+            prod[k - 6] += 2 * c
+            prod[k - 12] -= 2 * c
+
+    return tuple(c % P for c in prod[:12])
+
+
+def f12_pow(a: Fq12, e: int) -> Fq12:
+    result = FQ12_ONE
+    for bit in bin(e)[2:]:
+        result = f12_mul(result, result)
+        if bit == "1":
+            result = f12_mul(result, a)
+    return result
+
+
+# Raise to the power p^6, which maps w -> -w (negates odd coefficients)
+def f12_conj(a: Fq12) -> Fq12:
+    return tuple(c if i % 2 == 0 else -c % P for i, c in enumerate(a))
+
+
+# Invert through the extended Euclidean algorithm over Fq[w] against the modulus w^12 - 2w^6 + 2
+def f12_inv(a: Fq12) -> Fq12:
+    lm, hm = [1] + [0] * 12, [0] * 13
+    low, high = [*a, 0], [2, 0, 0, 0, 0, 0, -2 % P, 0, 0, 0, 0, 0, 1]
+    while _deg(low):
+        quot = _poly_div(high, low)
+        nm, new = hm[:], high[:]
+        for i in range(13):
+            for j in range(13 - i):
+                nm[i + j] -= lm[i] * quot[j]
+                new[i + j] -= low[i] * quot[j]
+        lm, low, hm, high = [c % P for c in nm], [c % P for c in new], lm, low
+    low_inv = pow(low[0], -1, P)
+    return tuple(c * low_inv % P for c in lm[:12])
+
+
+def _deg(poly: list[int]) -> int:
+    d = len(poly) - 1
+    while d and poly[d] == 0:
+        d -= 1
+    return d
+
+
+def _poly_div(a: list[int], b: list[int]) -> list[int]:
+    rem, dega, degb = a[:], _deg(a), _deg(b)
+    quot = [0] * 13
+    lead_inv = pow(b[degb], -1, P)
+    for i in range(dega - degb, -1, -1):
+        quot[i] = rem[degb + i] * lead_inv % P
+        for c in range(degb + 1):
+            rem[c + i] -= b[c] * quot[i]
+    return quot
+
+
+# Powers w^(k * p) used to apply the Frobenius map coefficient by coefficient, computed on first use
+_FROBENIUS_BASIS: list[Fq12] = []
+
+
+# Raise to the power p (Frobenius map)
+def f12_frob(a: Fq12) -> Fq12:
+    if not _FROBENIUS_BASIS:
+        w_p = f12_pow((0, 1) + (0,) * 10, P)
+        basis = [FQ12_ONE]
+        for _ in range(11):
+            basis.append(f12_mul(basis[-1], w_p))
+        _FROBENIUS_BASIS.extend(basis)
+
+    result = [0] * 12
+    for c, wk in zip(a, _FROBENIUS_BASIS, strict=True):
+        if c:
+            for i, wi in enumerate(wk):
+                result[i] += c * wi
+    return tuple(c % P for c in result)
+
+
+# Raise a unitary element (g^(p^6 + 1) == 1) to the power x, where x is the negative curve parameter
+def _unitary_pow_x(g: Fq12) -> Fq12:
+    return f12_conj(f12_pow(g, ATE_LOOP_COUNT))
+
+
+# Final exponentiation up to a factor of 3, which is coprime to r and so keeps "== 1" checks exact
+def final_exponentiation(f: Fq12) -> Fq12:
+    # Easy part: f^((p^6 - 1)(p^2 + 1)), the result is unitary so inverses become conjugates
+    g = f12_mul(f12_conj(f), f12_inv(f))
+    g = f12_mul(f12_frob(f12_frob(g)), g)
+
+    # Hard part: 3(p^4 - p^2 + 1)/r = (x - 1)^2 (x + p) (x^2 + p^2 - 1) + 3
+    a = f12_mul(_unitary_pow_x(g), f12_conj(g))
+    a = f12_mul(_unitary_pow_x(a), f12_conj(a))
+    b = f12_mul(_unitary_pow_x(a), f12_frob(a))
+    c = f12_mul(_unitary_pow_x(_unitary_pow_x(b)), f12_frob(f12_frob(b)))
+    c = f12_mul(c, f12_conj(b))
+    return f12_mul(c, f12_mul(f12_mul(g, g), g))
+
+
+# Evaluate the (w^3 scaled) line through twist points with slope `lam` at the G1 point P
+def _line(lam: Fq2, xt: Fq2, yt: Fq2, xp: int, yp: int) -> Fq12:
+    # Untwisting maps (x, y) -> (x / w^2, y / w^3) and the slope to lam / w, which gives
+    # w^3 * l(P) = (lam * xt - yt) - lam * xp * w^2 + yp * w^3
+    # and every Fq2 coefficient (a + bi) at w^k expands to (a - b) at w^k plus b at w^(k+6)
+    c0 = f2_sub(f2_mul(lam, xt), yt)
+    c2 = f2_scale(f2_neg(lam), xp)
+    coeffs = [0] * 12
+    coeffs[0] = (c0[0] - c0[1]) % P
+    coeffs[6] = c0[1]
+    coeffs[2] = (c2[0] - c2[1]) % P
+    coeffs[8] = c2[1]
+    coeffs[3] = yp
+    return tuple(coeffs)
+
+
+# Optimal ate Miller loop for a single (P, Q) pair (the sign of x is irrelevant for a product check)
+def miller_loop(p: G1Point, q: G2Point) -> Fq12:
+    if p is None or q is None:
+        return FQ12_ONE
+    xp, yp = p
+    xq, yq = q
+    xt, yt = xq, yq
+    f = FQ12_ONE
+    for bit in bin(ATE_LOOP_COUNT)[3:]:
+        # Doubling step: tangent line at T
+        lam = f2_mul(f2_scale(f2_sqr(xt), 3), f2_inv(f2_scale(yt, 2)))
+        f = f12_mul(f12_mul(f, f), _line(lam, xt, yt, xp, yp))
+        x3 = f2_sub(f2_sqr(lam), f2_scale(xt, 2))
+        yt = f2_sub(f2_mul(lam, f2_sub(xt, x3)), yt)
+        xt = x3
+        if bit == "1":
+            # Addition step: chord through T and Q
+            lam = f2_mul(f2_sub(yq, yt), f2_inv(f2_sub(xq, xt)))
+            f = f12_mul(f, _line(lam, xt, yt, xp, yp))
+            x3 = f2_sub(f2_sub(f2_sqr(lam), xt), xq)
+            yt = f2_sub(f2_mul(lam, f2_sub(xt, x3)), yt)
+            xt = x3
+    return f
+
+
+# Return True if the product of e(P_i, Q_i) equals one (same semantics as `ec_pairing_check`)
+def pairing_check(pairs: Sequence[tuple[G1Point, G2Point]]) -> bool:
+    f = FQ12_ONE
+    for p, q in pairs:
+        f = f12_mul(f, miller_loop(p, q))
+    return final_exponentiation(f) == FQ12_ONE
@@ -0,0 +1,175 @@
+# utils/fr.py
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from Cryptodome.Hash import keccak
+
+from utils.zk_models import LagrangeWitness, Proof, VerificationKey
+
+# BLS12-381 scalar field modulus (r)
+R = 0x73EDA753299D7D483339D80809A1D80553BDA402FFFE5BFEFFFFFFFF00000001
+
+# Size of a field element encoded as big-endian bytes
+FR_SIZE = 32
+
+
+# Reduce an integer into the scalar field
+def fr(a: int) -> int:
+    return a % R
+
+
+# Add two scalar field elements
+def fr_add(a: int, b: int) -> int:
+    return (a + b) % R
+
+
+# Subtract two scalar field elements
+def fr_sub(a: int, b: int) -> int:
+    return (a - b) % R
+
+
+# Multiply two scalar field elements
+def fr_mul(a: int, b: int) -> int:
+    return (a * b) % R
+
+
+# Negate a scalar field element
+def fr_neg(a: int) -> int:
+    return -a % R
+
+
+# Raise a scalar field element to the given exponent
+def fr_pow(a: int, e: int) -> int:
+    return pow(a, e, R)
+
+
+# Invert a scalar field element, fail on zero (mirrors the contract `frInv` assert)
+def fr_inv(a: int) -> int:
+    if a % R == 0:
+        raise ValueError("Fr inverse of zero")
+    return pow(a, -1, R)
+
+
+# Divide two scalar field elements
+def fr_div(a: int, b: int) -> int:
+    return fr_mul(a, fr_inv(b))
+
+
+# Invert many scalar field elements at the cost of a single modular inverse (Montgomery's trick)
+def fr_batch_inv(values: Sequence[int]) -> list[int]:
+    # Accumulate running prefix products: prefix[i] = values[0] * ... * values[i - 1]
+    prefix = [1] * len(values)
+    acc = 1
+    for i, value in enumerate(values):
+        if value % R == 0:
+            raise ValueError("Fr inverse of zero")
+        prefix[i] = acc
+        acc = acc * value % R
+
+    # Invert the full product once, then peel off one factor per element walking backwards
+    acc_inv = pow(acc, -1, R)
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        inverses[i] = acc_inv * prefix[i] % R
+        acc_inv = acc_inv * values[i] % R
+
+    return inverses
+
+
+# Convert a scalar field element into its 32-byte big-endian representation
+def fr_to_bytes(a: int) -> bytes:
+    return (a % R).to_bytes(FR_SIZE, "big")
+
+
+# Derive a Fiat-Shamir challenge from the transcript data (keccak256 reduced into the field)
+def get_challenge(td: bytes) -> int:
+    return int.from_bytes(keccak.new(digest_bits=256, data=td).digest(), "big") % R
+
+
+# Class for the PLONK verifier Fiat-Shamir challenges
+@dataclass(frozen=True)
+class Challenges:
+    beta: int
+    gamma: int
+    alpha: int
+    xi: int
+    v: tuple[int, ...]  # v[0] unused, v[i] = v1^i for i in 1..5
+    u: int
+
+
+# Recompute the verifier transcript challenges exactly like `PlonkVerifier` and `LagrangeWitnessCalculator`
+def calc_challenges(
+    vk: VerificationKey, signals: Sequence[int], proof: Proof
+) -> Challenges:
+    # Round 1: verification key selector/permutation points, public signals and wire commitments
+    td = vk.Qm + vk.Ql + vk.Qr + vk.Qo + vk.Qc + vk.S1 + vk.S2 + vk.S3
+    td += b"".join(fr_to_bytes(signal) for signal in signals)
+    td += proof.A + proof.B + proof.C
+    beta = get_challenge(td)
+
+    # Round 2: gamma is derived from beta alone
+    gamma = get_challenge(fr_to_bytes(beta))
+
+    # Round 3: permutation accumulator commitment
+    alpha = get_challenge(fr_to_bytes(beta) + fr_to_bytes(gamma) + proof.Z)
+
+    # Round 4: quotient polynomial commitments
+    xi = get_challenge(fr_to_bytes(alpha) + proof.T1 + proof.T2 + proof.T3)
+
+    # Round 5: opening evaluations, then powers v1^i
+    td = fr_to_bytes(xi)
+    for e in (
+        proof.eval_a,
+        proof.eval_b,
+        proof.eval_c,
+        proof.eval_s1,
+        proof.eval_s2,
+        proof.eval_zw,
+    ):
+        td += e.to_bytes(FR_SIZE, "big")
+    v1 = get_challenge(td)
+    v = [0, v1]
+    for _ in range(2, 6):
+        v.append(fr_mul(v[-1], v1))
+
+    # Round 6: opening proof commitments
+    u = get_challenge(proof.Wxi + proof.Wxiw)
+
+    return Challenges(beta=beta, gamma=gamma, alpha=alpha, xi=xi, v=tuple(v), u=u)
+
+
+# Compute the Lagrange witness off-chain (same output as `LagrangeWitnessCalculator.calculateLagrangeWitness`)
+def calc_lagrange_witness(
+    vk: VerificationKey,
+    signals: Sequence[int],
+    proof: Proof,
+    root_of_unity: int,
+    challenges: Challenges | None = None,
+) -> LagrangeWitness:
+    # Reuse already computed challenges when the caller has them at hand
+    if challenges is None:
+        challenges = calc_challenges(vk, signals, proof)
+    xi = challenges.xi
+
+    # Evaluate xi^n through repeated squaring, n = 2^power is the domain size
+    xin = xi
+    for _ in range(vk.power):
+        xin = fr_mul(xin, xin)
+
+    # Vanishing polynomial Z_H(xi) = xi^n - 1
+    zh = fr_sub(xin, 1)
+    n = fr(1 << vk.power)
+
+    # Collect roots of unity w^(i-1) and the matching L_i denominators n * (xi - w^(i-1))
+    iterations = 1 if vk.nPublic == 0 else vk.nPublic
+    roots = [1] * iterations
+    for i in range(1, iterations):
+        roots[i] = fr_mul(roots[i - 1], root_of_unity)
+    denominators = [fr_mul(n, fr_sub(xi, w)) for w in roots]
+
+    # L_i(xi) = w^(i-1) * Z_H(xi) / (n * (xi - w^(i-1))), with all denominators sharing one inverse
+    lagrange = [0]  # L[0] is unused, the contract starts reading at index 1
+    for w, inv in zip(roots, fr_batch_inv(denominators), strict=True):
+        lagrange.append(fr_mul(fr_mul(w, zh), inv))
+
+    return LagrangeWitness(l=tuple(lagrange), xin=xin, zh=zh)
@@ -0,0 +1,88 @@
+# utils/grid_merkle.py
+from collections.abc import Sequence
+
+from smart_contracts.salvo import constants as cst
+from smart_contracts.salvo import errors as err
+from utils.fr import FR_SIZE
+from utils.mimc import mimc
+
+
+# Get the leaf of a grid cell value, the same 32-byte field element as `srt.u8_to_fr32`
+def grid_leaf(value: int) -> bytes:
+    if not 0 <= value <= cst.GRID_CELL_MASK:
+        raise ValueError(f"Unknown grid cell value {value}")
+    return value.to_bytes(FR_SIZE, "big")
+
+
+# Hash a leaf up to the root w/ its sibling path, same as `srt.compute_grid_root`
+def compute_grid_root(i: int, leaf: bytes, proof: Sequence[bytes]) -> bytes:
+    if len(proof) != cst.GRID_MERKLE_DEPTH:
+        raise ValueError(
+            f"Grid proof must have {cst.GRID_MERKLE_DEPTH} nodes, got {len(proof)}"
+        )
+    node = leaf
+    for sibling in proof:
+        node = mimc(node + sibling) if i % 2 == 0 else mimc(sibling + node)
+        i //= 2
+    return node
+
+
+# Check a grid cell value against a grid root
+def verify_grid_proof(root: bytes, i: int, value: int, proof: Sequence[bytes]) -> bool:
+    return compute_grid_root(i, grid_leaf(value), proof) == root
+
+
+# Class for the MiMC Merkle tree of a game grid, the off-chain twin of `GameState.grid_root`
+# `levels[0]` holds the 128 leaves (121 cells, then zero padding) and `levels[-1]` the root
+class GridMerkleTree:
+    def __init__(self, cells: bytes | bytearray | Sequence[int]) -> None:
+        if len(cells) != cst.GRID_CELL_TOTAL:
+            raise ValueError(
+                f"Grid cells must be {cst.GRID_CELL_TOTAL} values, got {len(cells)}"
+            )
+        leaves = [grid_leaf(value) for value in cells]
+        leaves += [grid_leaf(0)] * (cst.GRID_MERKLE_LEAVES - cst.GRID_CELL_TOTAL)
+        self.levels = [leaves]
+        while len(self.levels[-1]) > 1:
+            nodes = self.levels[-1]
+            self.levels.append(
+                [mimc(nodes[j] + nodes[j + 1]) for j in range(0, len(nodes), 2)]
+            )
+
+    @property
+    def root(self) -> bytes:
+        return self.levels[-1][0]
+
+    # Get the sibling path of a grid cell, e.g. the `proof` argument of `srt.set_grid_cell_value_at_index`
+    def proof(self, i: int) -> list[bytes]:
+        if not 0 <= i < cst.GRID_CELL_TOTAL:
+            raise ValueError(err.INVALID_POS_INDEX)
+        siblings = []
+        for nodes in self.levels[:-1]:
+            siblings.append(nodes[i ^ 1])
+            i //= 2
+        return siblings
+
+    # Set a grid cell value, rehashing only its path, and return the new root
+    def set_cell(self, i: int, value: int) -> bytes:
+        if not 0 <= i < cst.GRID_CELL_TOTAL:
+            raise ValueError(err.INVALID_POS_INDEX)
+        self.levels[0][i] = grid_leaf(value)
+        for depth in range(cst.GRID_MERKLE_DEPTH):
+            i //= 2
+            below = self.levels[depth]
+            self.levels[depth + 1][i] = mimc(below[2 * i] + below[2 * i + 1])
+        return self.root
+
+    # Get the proofs of a sequence of cell changes, applying each change before the next proof
+    # `changes` holds (i, old, new) tuples, e.g. `RoundResult.changes`; the `proofs` argument of `resolve_round`
+    def change_proofs(
+        self, changes: Sequence[tuple[int, int, int]]
+    ) -> list[list[bytes]]:
+        proofs = []
+        for i, old, new in changes:
+            if self.levels[0][i] != grid_leaf(old):
+                raise ValueError(f"Grid cell {i} does not hold value {old}")
+            proofs.append(self.proof(i))
+            self.set_cell(i, new)
+        return proofs
@@ -0,0 +1,136 @@
+# utils/mimc.py
+from collections.abc import Iterable, Sequence
+
+from Cryptodome.Hash import keccak
+
+from utils.fr import FR_SIZE, R
+
+# MiMC configuration matching `op.mimc(MiMCConfigurations.BLS12_381Mp111, ...)` (gnark-crypto bls12-381 MiMC)
+MIMC_ROUNDS = 111
+MIMC_SEED = b"seed"
+
+
+# Derive the round constants: a keccak256 chain seeded w/ keccak256("seed"), each digest reduced into Fr
+def _calc_round_constants() -> tuple[int, ...]:
+    rnd = keccak.new(digest_bits=256, data=MIMC_SEED).digest()
+    constants = []
+    for _ in range(MIMC_ROUNDS):
+        rnd = keccak.new(digest_bits=256, data=rnd).digest()
+        constants.append(int.from_bytes(rnd, "big") % R)
+    return tuple(constants)
+
+
+# Round constants, precomputed once at import
+ROUND_CONSTANTS = _calc_round_constants()
+
+
+# Run the MiMC block cipher x -> (x + h + c_i)^5 over all rounds, keyed w/ the current chaining value h
+def _encrypt(m: int, h: int) -> int:
+    for c in ROUND_CONSTANTS:
+        t = (m + h + c) % R
+        t2 = t * t % R
+        m = t2 * t2 % R * t % R
+    return (m + h) % R
+
+
+# Absorb field elements into the chaining value (Miyaguchi-Preneel: h = E_h(m) + h + m)
+def _absorb(h: int, elements: Iterable[int]) -> int:
+    for m in elements:
+        h = (_encrypt(m, h) + h + m) % R
+    return h
+
+
+# Split a preimage into field elements, failing like the AVM opcode on malformed input
+def bytes_to_fields(data: bytes | bytearray | memoryview) -> list[int]:
+    if len(data) % FR_SIZE != 0:
+        raise ValueError(
+            f"MiMC input length {len(data)} is not a multiple of {FR_SIZE}"
+        )
+    elements = [
+        int.from_bytes(data[i : i + FR_SIZE], "big")
+        for i in range(0, len(data), FR_SIZE)
+    ]
+    for i, element in enumerate(elements):
+        if element >= R:
+            raise ValueError(f"MiMC input element {i} is not in Fr")
+    return elements
+
+
+# Class for a streaming MiMC hasher w/ a hashlib-like interface
+# Data may be fed in chunks of any size; complete 32-byte blocks are absorbed as soon as they arrive
+class MiMC:
+    digest_size = FR_SIZE
+    block_size = FR_SIZE
+
+    def __init__(self, data: bytes = b"") -> None:
+        self._h = 0
+        self._count = 0  # Number of absorbed field elements
+        self._pending = b""  # Trailing bytes of an incomplete block
+        if data:
+            self.update(data)
+
+    # Feed more preimage bytes
+    def update(self, data: bytes | bytearray | memoryview) -> None:
+        buf = self._pending + bytes(data)
+        full = len(buf) - len(buf) % FR_SIZE
+        elements = bytes_to_fields(memoryview(buf)[:full])
+        self._h = _absorb(self._h, elements)
+        self._count += len(elements)
+        self._pending = buf[full:]
+
+    # Feed field elements directly, skipping the bytes round trip
+    def update_fields(self, elements: Sequence[int]) -> None:
+        if self._pending:
+            raise ValueError("Cannot absorb field elements after an incomplete block")
+        for i, element in enumerate(elements):
+            if not 0 <= element < R:
+                raise ValueError(f"MiMC input element {i} is not in Fr")
+        self._h = _absorb(self._h, elements)
+        self._count += len(elements)
+
+    # Get the current digest as a field element
+    def int_digest(self) -> int:
+        if self._pending:
+            raise ValueError(
+                f"MiMC input length is not a multiple of {FR_SIZE} "
+                f"({len(self._pending)} trailing bytes)"
+            )
+        if self._count == 0:
+            raise ValueError("MiMC input cannot be empty")
+        return self._h
+
+    # Get the current digest as 32 big-endian bytes, the same output as `op.mimc`
+    def digest(self) -> bytes:
+        return self.int_digest().to_bytes(FR_SIZE, "big")
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+    # Get an independent copy of the hasher state
+    def copy(self) -> "MiMC":
+        other = MiMC()
+        other._h, other._count, other._pending = self._h, self._count, self._pending
+        return other
+
+
+# Hash a preimage, bit-exact w/ `op.mimc(MiMCConfigurations.BLS12_381Mp111, preimage)`
+def mimc(data: bytes | bytearray | memoryview) -> bytes:
+    return MiMC(bytes(data)).digest()
+
+
+# Hash a sequence of field elements, returning the digest as a field element
+def mimc_fields(elements: Sequence[int]) -> int:
+    hasher = MiMC()
+    hasher.update_fields(elements)
+    return hasher.int_digest()
+
+
+# Hash many preimages, e.g. every player's turn commitment of a round
+def mimc_batch(preimages: Iterable[bytes | bytearray | memoryview]) -> list[bytes]:
+    digests = []
+    for data in preimages:
+        elements = bytes_to_fields(data)
+        if not elements:
+            raise ValueError("MiMC input cannot be empty")
+        digests.append(_absorb(0, elements).to_bytes(FR_SIZE, "big"))
+    return digests
@@ -0,0 +1,100 @@
+# utils/mimc_absorb.py
+from collections.abc import Sequence
+
+from algosdk import abi
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionSigner,
+)
+from algosdk.transaction import SuggestedParams
+
+from smart_contracts.salvo import constants as cst
+from utils.app_call_fee import DEFAULT_MIN_FEE, budget_fee, with_flat_fee
+from utils.fr import FR_SIZE
+from utils.mimc import MiMC
+
+# ABI method of the contract chunked MiMC call
+MIMC_ABSORB_METHOD = abi.Method.from_signature(cst.MIMC_ABSORB_SIGNATURE)
+
+# Largest number of transactions in an atomic group
+MAX_GROUP_SIZE = 16
+
+
+# Split a MiMC preimage into chunks of at most `max_elements` field elements, one per `mimc_absorb` call
+def split_mimc_chunks(
+    data: bytes | bytearray | memoryview,
+    max_elements: int = cst.MIMC_CHUNK_MAX_ELEMENTS,
+) -> list[bytes]:
+    if not data or len(data) % FR_SIZE != 0:
+        raise ValueError(
+            f"MiMC input length {len(data)} is not a positive multiple of {FR_SIZE}"
+        )
+    if not 0 < max_elements <= cst.MIMC_CHUNK_MAX_ELEMENTS:
+        raise ValueError(
+            f"Chunks hold 1 to {cst.MIMC_CHUNK_MAX_ELEMENTS} elements, got {max_elements}"
+        )
+    size = max_elements * FR_SIZE
+    return [bytes(data[i : i + size]) for i in range(0, len(data), size)]
+
+
+# Hash chunks the way consecutive `mimc_absorb` calls do, returning the final digest
+# A single chunk gives the plain `op.mimc` digest of that chunk
+def mimc_chained(chunks: Sequence[bytes | bytearray | memoryview]) -> bytes:
+    if not chunks:
+        raise ValueError("MiMC input cannot be empty")
+    digest = b""
+    for chunk in chunks:
+        digest = MiMC(digest + bytes(chunk)).digest()
+    return digest
+
+
+# Get the flat fee of a `mimc_absorb` call, covering the OpUp inner calls of its `ensure_budget`
+def mimc_absorb_fee(
+    chunk_size: int, *, is_first: bool, min_fee: int = DEFAULT_MIN_FEE
+) -> int:
+    elements = chunk_size // FR_SIZE + (0 if is_first else 1)
+    return budget_fee(
+        cst.MIMC_ABSORB_BASE_BUDGET
+        + cst.MIMC_BASE_COST
+        + cst.MIMC_ELEMENT_COST * elements,
+        min_fee,
+    )
+
+
+# Build a group of `mimc_absorb` calls hashing a whole preimage, one call per chunk
+# The return value of the last call is the digest, equal to `mimc_chained(split_mimc_chunks(data))`
+# A contract method consuming the digest is added to the returned group right after the last chunk call,
+# and reads it on-chain w/ `srt.load_mimc_chain_digest`
+def build_mimc_absorb_group(
+    sender: str,
+    signer: TransactionSigner,
+    sp: SuggestedParams,
+    app_id: int,
+    data: bytes | bytearray | memoryview,
+    max_elements: int = cst.MIMC_CHUNK_MAX_ELEMENTS,
+) -> AtomicTransactionComposer:
+    chunks = split_mimc_chunks(data, max_elements)
+    if len(chunks) > MAX_GROUP_SIZE:
+        raise ValueError(
+            f"MiMC input of {len(data) // FR_SIZE} elements needs {len(chunks)} chunks, "
+            f"more than a group of {MAX_GROUP_SIZE} can hold"
+        )
+
+    atc = AtomicTransactionComposer()
+    for i, chunk in enumerate(chunks):
+        is_first = i == 0
+        atc.add_method_call(
+            app_id=app_id,
+            method=MIMC_ABSORB_METHOD,
+            sender=sender,
+            sp=with_flat_fee(
+                sp,
+                mimc_absorb_fee(
+                    len(chunk), is_first=is_first, min_fee=sp.min_fee or DEFAULT_MIN_FEE
+                ),
+            ),
+            signer=signer,
+            method_args=[chunk, is_first],
+            note=i.to_bytes(1, "big"),  # Keeps otherwise identical chunk calls distinct
+        )
+    return atc
@@ -0,0 +1,219 @@
+# utils/plonk_verify.py
+from collections.abc import Sequence
+
+from utils.bls12_381 import (
+    G1_GEN,
+    G2_GEN,
+    G1Point,
+    g1_add,
+    g1_from_bytes,
+    g1_in_subgroup,
+    g1_msm,
+    g1_mul,
+    g1_neg,
+    g2_from_bytes,
+    pairing_check,
+)
+from utils.fr import (
+    Challenges,
+    R,
+    calc_challenges,
+    calc_lagrange_witness,
+    fr_add,
+    fr_mul,
+    fr_neg,
+    fr_sub,
+)
+from utils.zk_models import LagrangeWitness, Proof, VerificationKey
+
+# Proof G1 labels, in the order the verifier contract runs its subgroup checks
+PROOF_G1_LABELS = ["A", "B", "C", "Z", "T1", "T2", "T3", "Wxi", "Wxiw"]
+
+# Proof scalar labels, in the order the verifier contract runs its field checks
+PROOF_EVAL_LABELS = ["eval_a", "eval_b", "eval_c", "eval_s1", "eval_s2", "eval_zw"]
+
+
+# Fail verification w/ the same message the verifier contract asserts with
+def _assert(condition: bool, message: str) -> None:  # noqa: FBT001
+    if not condition:
+        raise ValueError(message)
+
+
+# Decode a G1 point, treating malformed encodings like a failed subgroup check
+def _decode_g1(data: bytes, label: str) -> G1Point:
+    try:
+        point = g1_from_bytes(data)
+    except ValueError as e:
+        raise ValueError(f"{label} not in G1") from e
+    _assert(g1_in_subgroup(point), f"{label} not in G1")
+    return point
+
+
+# Compute the public input polynomial evaluation PI(xi) = -sum(w_i * L_i(xi))
+def calc_pi(signals: Sequence[int], lw: LagrangeWitness) -> int:
+    pi = 0
+    for i, signal in enumerate(signals):
+        pi = fr_sub(pi, fr_mul(signal % R, lw.l[i + 1]))
+    return pi
+
+
+# Compute the constant term r0 of the linearisation polynomial
+def calc_r0(proof: Proof, ch: Challenges, pi: int, l1: int) -> int:
+    e2 = fr_mul(l1, fr_mul(ch.alpha, ch.alpha))
+    e3a = fr_add(fr_add(proof.eval_a, fr_mul(ch.beta, proof.eval_s1)), ch.gamma)
+    e3b = fr_add(fr_add(proof.eval_b, fr_mul(ch.beta, proof.eval_s2)), ch.gamma)
+    e3c = fr_add(proof.eval_c, ch.gamma)
+    e3 = fr_mul(fr_mul(fr_mul(fr_mul(e3a, e3b), e3c), proof.eval_zw), ch.alpha)
+    return fr_sub(fr_sub(pi, e2), e3)
+
+
+# Collect the points and scalars whose multi-scalar product is the batched commitment F
+def calc_f_terms(
+    vk: VerificationKey, proof: Proof, ch: Challenges, lw: LagrangeWitness
+) -> tuple[list[bytes], list[int]]:
+    # Gate constraint selectors: Qm*(a*b) + Ql*a + Qr*b + Qo*c + Qc
+    gate_scalars = [
+        fr_mul(proof.eval_a, proof.eval_b),
+        proof.eval_a,
+        proof.eval_b,
+        proof.eval_c,
+    ]
+
+    # Quotient polynomial chunks: -zh * (T1 + xin*T2 + xin^2*T3)
+    quotient_scalars = [
+        fr_neg(lw.zh),
+        fr_neg(fr_mul(lw.xin, lw.zh)),
+        fr_neg(fr_mul(fr_mul(lw.xin, lw.xin), lw.zh)),
+    ]
+
+    # Permutation argument: Z * (d2a + d2b + u)
+    betaxi = fr_mul(ch.beta, ch.xi)
+    d2a = fr_mul(
+        fr_mul(
+            fr_mul(
+                fr_add(fr_add(proof.eval_a, betaxi), ch.gamma),
+                fr_add(fr_add(proof.eval_b, fr_mul(betaxi, vk.k1)), ch.gamma),
+            ),
+            fr_add(fr_add(proof.eval_c, fr_mul(betaxi, vk.k2)), ch.gamma),
+        ),
+        ch.alpha,
+    )
+    d2b = fr_mul(lw.l[1], fr_mul(ch.alpha, ch.alpha))
+    z_scalar = fr_add(fr_add(d2a, d2b), ch.u)
+
+    # Permutation argument: -S3 * (a + beta*s1 + gamma)(b + beta*s2 + gamma) * alpha * beta * zw
+    s3_scalar = fr_mul(
+        fr_mul(
+            fr_add(fr_add(proof.eval_a, fr_mul(ch.beta, proof.eval_s1)), ch.gamma),
+            fr_add(fr_add(proof.eval_b, fr_mul(ch.beta, proof.eval_s2)), ch.gamma),
+        ),
+        fr_mul(fr_mul(ch.alpha, ch.beta), proof.eval_zw),
+    )
+
+    points = [
+        vk.Qm,
+        vk.Ql,
+        vk.Qr,
+        vk.Qo,
+        proof.T1,
+        proof.T2,
+        proof.T3,
+        vk.Qc,
+        proof.Z,
+        vk.S3,
+        proof.A,
+        proof.B,
+        proof.C,
+        vk.S1,
+        vk.S2,
+    ]
+    scalars = [
+        *gate_scalars,
+        *quotient_scalars,
+        1,  # Qc
+        z_scalar,
+        fr_neg(s3_scalar),
+        *ch.v[1:6],  # A, B, C, S1, S2 batched w/ v1..v5
+    ]
+    return points, scalars
+
+
+# Compute the scalar e of the batched evaluation E = e * G1
+def calc_e(proof: Proof, ch: Challenges, r0: int) -> int:
+    e = fr_sub(fr_mul(ch.v[1], proof.eval_a), r0)
+    e = fr_add(e, fr_mul(ch.v[2], proof.eval_b))
+    e = fr_add(e, fr_mul(ch.v[3], proof.eval_c))
+    e = fr_add(e, fr_mul(ch.v[4], proof.eval_s1))
+    e = fr_add(e, fr_mul(ch.v[5], proof.eval_s2))
+    return fr_add(e, fr_mul(ch.u, proof.eval_zw))
+
+
+# Run every check `PlonkVerifier.verify` runs, raising ValueError w/ the contract assert message on failure
+def check_proof(
+    vk: VerificationKey,
+    root_of_unity: int,
+    signals: Sequence[int],
+    proof: Proof,
+    lw: LagrangeWitness | None = None,
+) -> None:
+    # Same order as the contract, so both reject a malformed proof w/ the same message:
+    # proof commitments must be valid G1 points inside the prime order subgroup
+    g1 = {label: _decode_g1(getattr(proof, label), label) for label in PROOF_G1_LABELS}
+
+    # Then evaluations and public signals must be field elements
+    for label in PROOF_EVAL_LABELS:
+        _assert(getattr(proof, label) < R, f"{label} not in Fr")
+    _assert(len(signals) == vk.nPublic, "Invalid number of public inputs")
+    for signal in signals:
+        _assert(signal < R, "public signal not in Fr")
+
+    # Recompute the transcript, and the Lagrange witness if the caller did not supply one
+    ch = calc_challenges(vk, signals, proof)
+    if lw is None:
+        lw = calc_lagrange_witness(vk, signals, proof, root_of_unity, challenges=ch)
+
+    # Lagrange witness consistency, identical to the on-chain checks
+    _assert(lw.xin < R, "lw.xin not in Fr")
+    _assert(lw.zh < R, "lw.zh not in Fr")
+    for value in lw.l:
+        _assert(value < R, "lw.L not in Fr")
+    xin = ch.xi
+    for _ in range(vk.power):
+        xin = fr_mul(xin, xin)
+    _assert(lw.xin == xin, "lw.xin != xi^n")
+    _assert(lw.zh == fr_sub(xin, 1), "lw.zh != xi^n - 1")
+    _assert(len(lw.l) >= max(vk.nPublic, 1) + 1, "lw.L length too short")
+    _assert(ch.xi != 1, "invalid xi (equals 1)")
+
+    # Linearisation: r0, the batched commitment F and the batched evaluation E
+    r0 = calc_r0(proof, ch, calc_pi(signals, lw), lw.l[1])
+    points, scalars = calc_f_terms(vk, proof, ch, lw)
+    f = g1_msm([g1_from_bytes(p) for p in points], scalars)
+    e = g1_mul(G1_GEN, calc_e(proof, ch, r0))
+
+    # Opening proof: e(-A1, X_2) * e(B1, G2) == 1
+    a1 = g1_add(g1["Wxi"], g1_mul(g1["Wxiw"], ch.u))
+    b1 = g1_msm(
+        [g1["Wxi"], g1["Wxiw"]],
+        [ch.xi, fr_mul(fr_mul(ch.u, ch.xi), root_of_unity)],
+    )
+    b1 = g1_add(g1_add(b1, f), g1_neg(e))
+    _assert(
+        pairing_check([(g1_neg(a1), g2_from_bytes(vk.X_2)), (b1, G2_GEN)]),
+        "Verification failed",
+    )
+
+
+# Return True if the proof would pass `PlonkVerifier.verify`, so only passing proofs get submitted
+def verify_proof(
+    vk: VerificationKey,
+    root_of_unity: int,
+    signals: Sequence[int],
+    proof: Proof,
+    lw: LagrangeWitness | None = None,
+) -> bool:
+    try:
+        check_proof(vk, root_of_unity, signals, proof, lw)
+    except ValueError:
+        return False
+    return True
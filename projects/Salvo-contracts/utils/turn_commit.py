@@ -0,0 +1,152 @@
+# utils/turn_commit.py
+import base64
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from algosdk import abi, util
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionSigner,
+)
+from algosdk.transaction import SignedTransaction, SuggestedParams
+
+from smart_contracts.salvo import constants as cst
+from utils.app_call_fee import DEFAULT_MIN_FEE, budget_fee, with_flat_fee
+
+# ABI method of the contract batched turn commitment call
+COMMIT_TURNS_METHOD = abi.Method.from_signature(
+    "commit_turns(uint64,(uint8,uint256,byte[64])[])void"
+)
+
+SIGNATURE_SIZE = 64
+UINT256_MAX = (1 << 256) - 1
+
+
+# Get the key of a per-game box, i.e. its key prefix followed by the big-endian game id
+def game_box_key(key_prefix: bytes, game_id: int) -> bytes:
+    return key_prefix + game_id.to_bytes(8, "big")
+
+
+# Get the turn commit message a player signs, without the "MX" prefix `util.sign_bytes` adds
+# Same bytes as the contract `message_prefix + commit.turn_hash.bytes` after "MX"
+def turn_commit_message(
+    app_id: int, game_id: int, expiry_ts: int, round_count: int, turn_hash: int
+) -> bytes:
+    if not 0 <= turn_hash <= UINT256_MAX:
+        raise ValueError(f"Turn hash {turn_hash} does not fit in a UInt256")
+    return (
+        cst.TURN_COMMIT_DOMAIN
+        + app_id.to_bytes(8, "big")
+        + game_id.to_bytes(8, "big")
+        + expiry_ts.to_bytes(8, "big")
+        + round_count.to_bytes(8, "big")
+        + turn_hash.to_bytes(32, "big")
+    )
+
+
+# Class for a player turn commitment signed off-chain, the counterpart of `stc.SignedTurnCommit`
+@dataclass(frozen=True)
+class SignedTurnCommit:
+    lobby_slot: int
+    turn_hash: int
+    signature: bytes
+
+    def __post_init__(self) -> None:
+        if len(self.signature) != SIGNATURE_SIZE:
+            raise ValueError(
+                f"Signature must be {SIGNATURE_SIZE} bytes, got {len(self.signature)}"
+            )
+
+    # Get the ABI tuple value of the commit, for the `commits` method argument
+    def abi_value(self) -> list:
+        return [self.lobby_slot, self.turn_hash, list(self.signature)]
+
+
+# Sign a turn commitment w/ a player private key (base64, as returned by `account.generate_account`)
+def sign_turn_commit(
+    private_key: str,
+    app_id: int,
+    game_id: int,
+    expiry_ts: int,
+    round_count: int,
+    lobby_slot: int,
+    turn_hash: int,
+) -> SignedTurnCommit:
+    message = turn_commit_message(app_id, game_id, expiry_ts, round_count, turn_hash)
+    signature = base64.b64decode(util.sign_bytes(message, private_key))
+    return SignedTurnCommit(lobby_slot, turn_hash, signature)
+
+
+# Check a signed turn commitment against a player address, e.g. before a relay submits it
+def verify_turn_commit(
+    address: str,
+    app_id: int,
+    game_id: int,
+    expiry_ts: int,
+    round_count: int,
+    commit: SignedTurnCommit,
+) -> bool:
+    message = turn_commit_message(
+        app_id, game_id, expiry_ts, round_count, commit.turn_hash
+    )
+    return util.verify_bytes(message, base64.b64encode(commit.signature), address)
+
+
+# Get the flat fee of a `commit_turns` call, covering the OpUp inner calls of its `ensure_budget`
+def commit_turns_fee(n_commits: int, min_fee: int = DEFAULT_MIN_FEE) -> int:
+    return budget_fee(
+        cst.ED25519_VERIFY_COST * n_commits + cst.COMMIT_TURNS_BASE_BUDGET, min_fee
+    )
+
+
+# Build a group w/ one `commit_turns` app call committing every given turn of a game at once
+# The relay `sender` signs the group, while each commit carries its own player signature
+def build_commit_turns_group(
+    sender: str,
+    signer: TransactionSigner,
+    sp: SuggestedParams,
+    app_id: int,
+    game_id: int,
+    commits: Sequence[SignedTurnCommit],
+) -> AtomicTransactionComposer:
+    if not 0 < len(commits) <= cst.MAX_LOBBY_SIZE:
+        raise ValueError(
+            f"Expected 1 to {cst.MAX_LOBBY_SIZE} commits, got {len(commits)}"
+        )
+    slots = [commit.lobby_slot for commit in commits]
+    if len(set(slots)) != len(slots):
+        raise ValueError(f"Each lobby slot can only be committed once, got {slots}")
+
+    sp = with_flat_fee(
+        sp, commit_turns_fee(len(commits), sp.min_fee or DEFAULT_MIN_FEE)
+    )
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id=app_id,
+        method=COMMIT_TURNS_METHOD,
+        sender=sender,
+        sp=sp,
+        signer=signer,
+        method_args=[game_id, [commit.abi_value() for commit in commits]],
+        boxes=[
+            (app_id, game_box_key(b"s_", game_id)),
+            (app_id, game_box_key(b"l_", game_id)),
+            (app_id, game_box_key(b"c_", game_id)),
+        ],
+    )
+    return atc
+
+
+# Build and sign the `commit_turns` group of a relay account, ready for `algod.send_transactions`
+def sign_commit_turns_group(
+    relay_address: str,
+    relay_private_key: str,
+    sp: SuggestedParams,
+    app_id: int,
+    game_id: int,
+    commits: Sequence[SignedTurnCommit],
+) -> list[SignedTransaction]:
+    signer = AccountTransactionSigner(relay_private_key)
+    atc = build_commit_turns_group(relay_address, signer, sp, app_id, game_id, commits)
+    return atc.gather_signatures()
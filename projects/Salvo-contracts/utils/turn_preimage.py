@@ -0,0 +1,179 @@
+# utils/turn_preimage.py
+import hashlib
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from Cryptodome.Hash import SHA512
+
+from smart_contracts.salvo import constants as cst
+from utils.fr import FR_SIZE
+from utils.mimc import MiMC, mimc_batch
+
+# Coordinates pair (row, col), the off-chain counterpart of `ta.CoordsPair`
+Coords = tuple[int, int]
+
+# Number of field elements besides the movement coords: DOMAIN_PREFIX, game_id, action, direction, salt
+FIXED_FIELDS = cst.TURN_PREIMAGE_FIXED_FIELDS
+
+UINT8_MAX = (1 << 8) - 1
+UINT64_MAX = (1 << 64) - 1
+
+
+# Get the preimage size in bytes for a movement of `n_moves` coords
+def turn_preimage_size(n_moves: int) -> int:
+    return (FIXED_FIELDS + 2 * n_moves) * FR_SIZE
+
+
+# Write a UInt8 into the 32-byte slot at `offset`, same as `srt.u8_to_fr32` (the slot is already zeroed)
+def _put_u8(buf: bytearray | memoryview, offset: int, u: int, label: str) -> None:
+    if not 0 <= u <= UINT8_MAX:
+        raise ValueError(f"{label} {u} does not fit in a UInt8")
+    buf[offset + FR_SIZE - 1] = u
+
+
+# Write a UInt64 into the 32-byte slot at `offset`, same as `srt.u64_to_fr32` (the slot is already zeroed)
+def _put_u64(buf: bytearray | memoryview, offset: int, u: int, label: str) -> None:
+    if not 0 <= u <= UINT64_MAX:
+        raise ValueError(f"{label} {u} does not fit in a UInt64")
+    buf[offset + FR_SIZE - 8 : offset + FR_SIZE] = u.to_bytes(8, "big")
+
+
+# Encode a turn preimage into a zeroed buffer starting at `offset`, return the offset right after it
+# Layout: DOMAIN_PREFIX(u64), game_id(u64), (row, col)(u8, u8) per move, action(u8), direction(u8), salt(u64)
+def encode_turn_preimage_into(
+    buf: bytearray | memoryview,
+    offset: int,
+    game_id: int,
+    movement: Sequence[Coords],
+    action: int,
+    direction: int,
+    salt: int,
+) -> int:
+    end = offset + turn_preimage_size(len(movement))
+    if end > len(buf):
+        raise ValueError(f"Buffer too small, need {end} bytes but got {len(buf)}")
+
+    _put_u64(buf, offset, cst.DOMAIN_PREFIX, "DOMAIN_PREFIX")
+    _put_u64(buf, offset + FR_SIZE, game_id, "game_id")
+    offset += 2 * FR_SIZE
+    for row, col in movement:
+        _put_u8(buf, offset, row, "row")
+        _put_u8(buf, offset + FR_SIZE, col, "col")
+        offset += 2 * FR_SIZE
+    _put_u8(buf, offset, action, "action")
+    _put_u8(buf, offset + FR_SIZE, direction, "direction")
+    _put_u64(buf, offset + 2 * FR_SIZE, salt, "salt")
+    return end
+
+
+# Encode the compact turn preimage of the sha commit schemes, same as `srt.build_turn_preimage_bytes`
+# Layout: DOMAIN_PREFIX(u64), game_id(u64), movement (ARC-4: u16 length, row, col bytes), action, direction, salt(u64)
+def encode_turn_reveal(
+    game_id: int,
+    movement: Sequence[Coords],
+    action: int,
+    direction: int,
+    salt: int,
+) -> bytes:
+    for label, u in (("action", action), ("direction", direction)):
+        if not 0 <= u <= UINT8_MAX:
+            raise ValueError(f"{label} {u} does not fit in a UInt8")
+    for label, u in (("game_id", game_id), ("salt", salt)):
+        if not 0 <= u <= UINT64_MAX:
+            raise ValueError(f"{label} {u} does not fit in a UInt64")
+    coords = bytes(c for pair in movement for c in pair)  # Fails on values past a UInt8
+    return (
+        cst.DOMAIN_PREFIX.to_bytes(8, "big")
+        + game_id.to_bytes(8, "big")
+        + len(movement).to_bytes(2, "big")
+        + coords
+        + bytes((action, direction))
+        + salt.to_bytes(8, "big")
+    )
+
+
+# Class for a player turn preimage, packed once into a single preallocated `32 * n` byte buffer
+@dataclass(frozen=True)
+class TurnPreimage:
+    game_id: int
+    movement: tuple[Coords, ...]
+    action: int
+    direction: int
+    salt: int
+    # Raw preimage bytes, byte-identical to the contract `preimage` passed to `op.mimc`
+    data: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        movement = tuple((row, col) for row, col in self.movement)
+        buf = bytearray(turn_preimage_size(len(movement)))
+        encode_turn_preimage_into(
+            buf, 0, self.game_id, movement, self.action, self.direction, self.salt
+        )
+        object.__setattr__(self, "movement", movement)
+        object.__setattr__(self, "data", bytes(buf))
+
+    # Get the preimage as field elements, e.g. as circuit witness input
+    def fields(self) -> list[int]:
+        return [
+            int.from_bytes(self.data[i : i + FR_SIZE], "big")
+            for i in range(0, len(self.data), FR_SIZE)
+        ]
+
+    # Get the MiMC turn hash as 32 big-endian bytes, the same value as `op.mimc`
+    def hash(self) -> bytes:
+        return MiMC(self.data).digest()
+
+    # Get the MiMC turn hash as an integer, e.g. for `GameCharacter.turn_hash` (arc4.UInt256)
+    def hash_int(self) -> int:
+        return int.from_bytes(self.hash(), "big")
+
+    # Get the compact preimage a sha commit scheme game hashes for this turn
+    def reveal_bytes(self) -> bytes:
+        return encode_turn_reveal(
+            self.game_id, self.movement, self.action, self.direction, self.salt
+        )
+
+    # Get the turn hash of a game commit scheme, the same value as `srt.compute_turn_hash`
+    def commitment(self, commit_scheme: int) -> bytes:
+        if commit_scheme == cst.COMMIT_SCHEME_MIMC:
+            return self.hash()
+        if commit_scheme == cst.COMMIT_SCHEME_SHA256:
+            return hashlib.sha256(self.reveal_bytes()).digest()
+        if commit_scheme == cst.COMMIT_SCHEME_SHA512_256:
+            return SHA512.new(self.reveal_bytes(), truncate="256").digest()
+        raise ValueError(f"Unknown commit scheme {commit_scheme}")
+
+    # Get the turn hash of a game commit scheme as an integer, for the `commit_turn` argument
+    def commitment_int(self, commit_scheme: int) -> int:
+        return int.from_bytes(self.commitment(commit_scheme), "big")
+
+    # Get the `reveal_turn` arguments after `game_id` and `lobby_slot`
+    def reveal_args(self) -> tuple[list[Coords], int, int, int]:
+        return list(self.movement), self.action, self.direction, self.salt
+
+
+# Pack many turn preimages back to back into one buffer, return it w/ each preimage's (start, end)
+def pack_turn_preimages(
+    turns: Sequence[TurnPreimage],
+) -> tuple[bytearray, list[tuple[int, int]]]:
+    buf = bytearray(sum(turn_preimage_size(len(turn.movement)) for turn in turns))
+    spans = []
+    offset = 0
+    for turn in turns:
+        end = encode_turn_preimage_into(
+            buf,
+            offset,
+            turn.game_id,
+            turn.movement,
+            turn.action,
+            turn.direction,
+            turn.salt,
+        )
+        spans.append((offset, end))
+        offset = end
+    return buf, spans
+
+
+# Hash many turn preimages, e.g. every player's commitment of a round
+def hash_turn_preimages(turns: Iterable[TurnPreimage]) -> list[bytes]:
+    return mimc_batch(turn.data for turn in turns)
@@ -0,0 +1,282 @@
+# utils/zk_binary.py
+import mmap
+import struct
+from collections.abc import Iterable, Iterator, Sequence
+from hashlib import sha256
+from pathlib import Path
+from types import TracebackType
+
+from utils.zk_codec import PROOF_CODEC, VKEY_CODEC
+from utils.zk_getters import ArtifactStore
+from utils.zk_models import Proof, VerificationKey
+
+# Container layout (all integers big endian, like the ABI encoding of the records):
+#   header  | magic(4) | version(2) | kind(1) | flags(1) | count(4) | record_size(4) |
+#   records | count * record_size bytes, each record is the ABI encoding of a Proof/VerificationKey
+#   index   | count * 32-byte record keys (only if FLAG_INDEX is set)
+MAGIC = b"SLVZ"
+VERSION = 1
+HEADER = struct.Struct(">4sHBBII")
+
+# Container record kinds
+KIND_PROOF = 1
+KIND_VKEY = 2
+
+# Container flags
+FLAG_INDEX = 0x01
+
+# Size of a single record key in the optional index
+KEY_SIZE = 32
+
+# Size of the encoded curve points and scalars
+G1_SIZE = 96
+G2_SIZE = 192
+FR_SIZE = 32
+UINT64_SIZE = 8
+
+# Proof record layout: 9 * G1(96) + 6 * fEval(32) = 1056 bytes
+PROOF_G1_LABELS = ["A", "B", "C", "Z", "T1", "T2", "T3", "Wxi", "Wxiw"]
+PROOF_EVAL_LABELS = ["eval_a", "eval_b", "eval_c", "eval_s1", "eval_s2", "eval_zw"]
+PROOF_SIZE = len(PROOF_G1_LABELS) * G1_SIZE + len(PROOF_EVAL_LABELS) * FR_SIZE
+
+# Verification key record layout: 8 * G1(96) + 4 * uint64(8) + 1 * G2(192) = 992 bytes
+VKEY_G1_LABELS = ["Qm", "Ql", "Qr", "Qo", "Qc", "S1", "S2", "S3"]
+VKEY_UINT64_LABELS = ["power", "nPublic", "k1", "k2"]
+VKEY_SIZE = (
+    len(VKEY_G1_LABELS) * G1_SIZE + len(VKEY_UINT64_LABELS) * UINT64_SIZE + G2_SIZE
+)
+
+# Record size of each container kind
+RECORD_SIZES = {KIND_PROOF: PROOF_SIZE, KIND_VKEY: VKEY_SIZE}
+
+
+# Class for a zero-copy view over one proof record; G1 points are memoryview slices of the container
+class ProofView:
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: memoryview) -> None:
+        self.raw = raw  # ABI encoded proof, can be submitted as-is
+
+    # Get a G1 point slice by its position in the record
+    def _g1(self, i: int) -> memoryview:
+        return self.raw[i * G1_SIZE : (i + 1) * G1_SIZE]
+
+    # Get a scalar by its position in the evaluations section of the record
+    def _eval(self, i: int) -> int:
+        start = len(PROOF_G1_LABELS) * G1_SIZE + i * FR_SIZE
+        return int.from_bytes(self.raw[start : start + FR_SIZE], "big")
+
+    A = property(lambda self: self._g1(0))
+    B = property(lambda self: self._g1(1))
+    C = property(lambda self: self._g1(2))
+    Z = property(lambda self: self._g1(3))
+    T1 = property(lambda self: self._g1(4))
+    T2 = property(lambda self: self._g1(5))
+    T3 = property(lambda self: self._g1(6))
+    Wxi = property(lambda self: self._g1(7))
+    Wxiw = property(lambda self: self._g1(8))
+    eval_a = property(lambda self: self._eval(0))
+    eval_b = property(lambda self: self._eval(1))
+    eval_c = property(lambda self: self._eval(2))
+    eval_s1 = property(lambda self: self._eval(3))
+    eval_s2 = property(lambda self: self._eval(4))
+    eval_zw = property(lambda self: self._eval(5))
+
+    # Copy the record out into a new instance of the Proof data class
+    def to_proof(self) -> Proof:
+        return PROOF_CODEC.decode(self.raw)
+
+
+# Class for a zero-copy view over one verification key record
+class VerificationKeyView:
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: memoryview) -> None:
+        # ABI encoded verification key, can be used as a template value as-is
+        self.raw = raw
+
+    # Get a G1 point slice by its position in the record
+    def _g1(self, i: int) -> memoryview:
+        return self.raw[i * G1_SIZE : (i + 1) * G1_SIZE]
+
+    # Get a uint64 by its position in the scalars section of the record
+    def _uint64(self, i: int) -> int:
+        start = len(VKEY_G1_LABELS) * G1_SIZE + i * UINT64_SIZE
+        return int.from_bytes(self.raw[start : start + UINT64_SIZE], "big")
+
+    Qm = property(lambda self: self._g1(0))
+    Ql = property(lambda self: self._g1(1))
+    Qr = property(lambda self: self._g1(2))
+    Qo = property(lambda self: self._g1(3))
+    Qc = property(lambda self: self._g1(4))
+    S1 = property(lambda self: self._g1(5))
+    S2 = property(lambda self: self._g1(6))
+    S3 = property(lambda self: self._g1(7))
+    power = property(lambda self: self._uint64(0))
+    nPublic = property(lambda self: self._uint64(1))  # noqa: N815
+    k1 = property(lambda self: self._uint64(2))
+    k2 = property(lambda self: self._uint64(3))
+    X_2 = property(lambda self: self.raw[VKEY_SIZE - G2_SIZE : VKEY_SIZE])
+
+    # Copy the record out into a new instance of the VerificationKey data class
+    def to_vkey(self) -> VerificationKey:
+        return VKEY_CODEC.decode(self.raw)
+
+
+# Write already encoded records into a container file, w/ an optional index of 32-byte keys
+def write_container(
+    path: Path,
+    kind: int,
+    records: Sequence[bytes],
+    keys: Sequence[bytes] | None = None,
+) -> None:
+    if kind not in RECORD_SIZES:
+        raise ValueError(f"Unknown container kind: {kind}")
+    record_size = RECORD_SIZES[kind]
+    for i, record in enumerate(records):
+        if len(record) != record_size:
+            raise ValueError(
+                f"Record {i}: expected {record_size} bytes, but got {len(record)} bytes"
+            )
+    if keys is not None:
+        if len(keys) != len(records):
+            raise ValueError(f"Expected {len(records)} keys, but got {len(keys)} keys")
+        for i, key in enumerate(keys):
+            if len(key) != KEY_SIZE:
+                raise ValueError(
+                    f"Key {i}: expected {KEY_SIZE} bytes, but got {len(key)} bytes"
+                )
+
+    flags = FLAG_INDEX if keys is not None else 0
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, kind, flags, len(records), record_size))
+        f.writelines(records)
+        if keys is not None:
+            f.writelines(keys)
+
+
+# Write proofs into a container file, indexing them by the given keys (or by record hash when index=True)
+def write_proofs(
+    path: Path,
+    proofs: Iterable[Proof],
+    keys: Sequence[bytes] | None = None,
+    index: bool = False,  # noqa: FBT001, FBT002
+) -> None:
+    records = [PROOF_CODEC.encode(proof) for proof in proofs]
+    if keys is None and index:
+        keys = [sha256(record).digest() for record in records]
+    write_container(path, KIND_PROOF, records, keys)
+
+
+# Write verification keys into a container file
+def write_vkeys(path: Path, vkeys: Iterable[VerificationKey]) -> None:
+    write_container(path, KIND_VKEY, [VKEY_CODEC.encode(vk) for vk in vkeys])
+
+
+# Convert the current JSON artifacts (proof.json + proof_payload.json, verification_key.json +
+# vkey_gpoints_payload.json) into a proof container and a verification key container
+def convert_json_artifacts(
+    store: ArtifactStore, proof_path: Path, vkey_path: Path
+) -> None:
+    write_proofs(proof_path, [store.proof()], index=True)
+    write_vkeys(vkey_path, [store.vkey()])
+
+
+# Class for a memory-mapped container reader handing out zero-copy record views
+# Views borrow the mapping, so they must not be used after the reader is closed
+class ContainerReader:
+    def __init__(self, path: Path) -> None:
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty container file: {path}") from None
+        self._buf = memoryview(self._mmap)
+        self._index: dict[bytes, int] | None = None
+
+        # Validate the header against the file size before handing out any view
+        if len(self._buf) < HEADER.size:
+            self.close()
+            raise ValueError(f"Truncated container header: {path}")
+        magic, version, kind, flags, count, record_size = HEADER.unpack_from(self._buf)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a v{VERSION} container file: {path}")
+        if RECORD_SIZES.get(kind) != record_size:
+            self.close()
+            raise ValueError(
+                f"Invalid record kind/size ({kind}, {record_size}): {path}"
+            )
+        expected = HEADER.size + count * (
+            record_size + (KEY_SIZE if flags & FLAG_INDEX else 0)
+        )
+        size = len(self._buf)
+        if size != expected:
+            self.close()
+            raise ValueError(f"Expected {expected} bytes, but got {size} bytes: {path}")
+
+        self.kind = kind
+        self.count = count
+        self.record_size = record_size
+        self.has_index = bool(flags & FLAG_INDEX)
+
+    def __enter__(self) -> "ContainerReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    # Release the memoryview, then close the file and the mapping
+    # Closing raises BufferError while record views handed out by this reader are still alive;
+    # the file is closed regardless, the mapping is freed once the last view goes
+    def close(self) -> None:
+        try:
+            self._buf.release()
+            self._mmap.close()
+        finally:
+            self._file.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    # Get the raw ABI encoded record at the given position
+    def raw(self, i: int) -> memoryview:
+        if not -self.count <= i < self.count:
+            raise IndexError(f"Record {i} out of range (count {self.count})")
+        start = HEADER.size + (i % self.count) * self.record_size
+        return self._buf[start : start + self.record_size]
+
+    # Get a zero-copy view of the record at the given position
+    def __getitem__(self, i: int) -> ProofView | VerificationKeyView:
+        if self.kind == KIND_PROOF:
+            return ProofView(self.raw(i))
+        return VerificationKeyView(self.raw(i))
+
+    def __iter__(self) -> Iterator[ProofView | VerificationKeyView]:
+        return (self[i] for i in range(self.count))
+
+    # Get the key of the record at the given position
+    def key(self, i: int) -> bytes:
+        if not self.has_index:
+            raise KeyError("Container has no index")
+        if not -self.count <= i < self.count:
+            raise IndexError(f"Record {i} out of range (count {self.count})")
+        start = (
+            HEADER.size + self.count * self.record_size + (i % self.count) * KEY_SIZE
+        )
+        return bytes(self._buf[start : start + KEY_SIZE])
+
+    # Find the position of a record by its key, building the key lookup table on first use
+    def find(self, key: bytes) -> int:
+        if self._index is None:
+            self._index = {self.key(i): i for i in range(self.count)}
+        try:
+            return self._index[key]
+        except KeyError as e:
+            raise KeyError(f"Record key not found: {key.hex()}") from e
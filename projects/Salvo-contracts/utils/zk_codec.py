@@ -0,0 +1,253 @@
+# utils/zk_codec.py
+import json
+import re
+import struct
+from collections.abc import Callable, Sequence
+from operator import attrgetter
+from pathlib import Path
+from typing import Any
+
+from utils.zk_models import LagrangeWitness, Proof, VerificationKey
+
+# Setup paths
+APP_DIR = Path(__file__).parent.parent
+PLONK_VERIFIER_ARC56_PATH = (
+    APP_DIR
+    / "smart_contracts"
+    / "artifacts"
+    / "plonk_verifier"
+    / "PlonkVerifier.arc56.json"
+)
+
+# ARC-56 field names that differ from their Python data class attribute names
+ATTR_NAMES = {"L": "l"}
+
+# ABI types supported by the codec: byte[N], uintN and dynamic uintN[]
+BYTES_RE = re.compile(r"^byte\[(\d+)\]$")
+UINT_RE = re.compile(r"^uint(\d+)$")
+UINT_ARRAY_RE = re.compile(r"^uint(\d+)\[\]$")
+
+# Size of the ABI head offset and dynamic array length prefixes
+UINT16_SIZE = 2
+
+# Struct format codes of the uintN sizes `struct` packs natively
+UINT_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+# Kinds of struct fields
+BYTES = 0
+UINT = 1
+UINT_ARRAY = 2
+
+
+# Get a getter converting a uintN field `struct` cannot pack natively into its big-endian bytes
+def _uint_getter(attr: str, size: int) -> Callable[[Any], bytes]:
+    def get(value: Any) -> bytes:  # noqa: ANN401
+        return getattr(value, attr).to_bytes(size, "big")
+
+    return get
+
+
+# Class for a struct encoder/decoder w/ field offsets computed once from its ARC-56 struct spec
+# Static fields live at fixed head offsets; dynamic `uintN[]` fields get a 2-byte head offset into the tail
+class StructCodec:
+    def __init__(self, name: str, fields: Sequence[dict], cls: type) -> None:
+        self.name = name
+        self.cls = cls
+
+        # Lay out the head: (attr, start, end, is_int) for static fields, (attr, start, elem_size) for dynamic
+        self._static: list[tuple[str, int, int, bool]] = []
+        self._dynamic: list[tuple[str, int, int]] = []
+        self._head: list[tuple[str, int, int]] = []  # (attr, kind, size) in field order
+        offset = 0
+        for field in fields:
+            attr = ATTR_NAMES.get(field["name"], field["name"])
+            abi_type = field["type"]
+            if match := BYTES_RE.match(abi_type):
+                size = int(match[1])
+                self._static.append((attr, offset, offset + size, False))
+                self._head.append((attr, BYTES, size))
+            elif match := UINT_RE.match(abi_type):
+                size = int(match[1]) // 8
+                self._static.append((attr, offset, offset + size, True))
+                self._head.append((attr, UINT, size))
+            elif match := UINT_ARRAY_RE.match(abi_type):
+                size = UINT16_SIZE
+                self._dynamic.append((attr, offset, int(match[1]) // 8))
+                self._head.append((attr, UINT_ARRAY, int(match[1]) // 8))
+            else:
+                raise ValueError(f"Unsupported ABI type in struct {name}: {abi_type}")
+            offset += size
+
+        self.head_size = offset
+        self.is_static = not self._dynamic
+        self._attrs = [field[0] for field in self._static] + [
+            field[0] for field in self._dynamic
+        ]
+        byte_fields = [(attr, size) for attr, kind, size in self._head if kind == BYTES]
+        self._byte_attrs = [attr for attr, _ in byte_fields]
+        self._byte_sizes = [size for _, size in byte_fields]
+        self._byte_getter = attrgetter(*self._byte_attrs) if byte_fields else None
+        self._head_struct, self._head_getters = self._compile_head()
+
+    # Build the head `struct.Struct` once, w/ one getter per head item so encoding never dispatches on kinds
+    # uintN fields `struct` cannot pack natively (e.g. uint256) are converted to big-endian bytes first
+    def _compile_head(self) -> tuple[struct.Struct, list[Callable[[Any], Any] | None]]:
+        fmt = [">"]
+        getters: list[Callable[[Any], Any] | None] = []
+        for attr, kind, size in self._head:
+            if kind == BYTES:
+                fmt.append(f"{size}s")
+                getters.append(attrgetter(attr))
+            elif kind == UINT and size in UINT_FORMATS:
+                fmt.append(UINT_FORMATS[size])
+                getters.append(attrgetter(attr))
+            elif kind == UINT:
+                fmt.append(f"{size}s")
+                getters.append(_uint_getter(attr, size))
+            else:
+                fmt.append(UINT_FORMATS[UINT16_SIZE])
+                getters.append(None)  # Tail offset, filled in per instance
+        return struct.Struct("".join(fmt)), getters
+
+    # Get the head items of a struct instance, dynamic fields resolve to their tail offset
+    def _head_items(self, value: Any) -> list:  # noqa: ANN401
+        if self.is_static:
+            return [getter(value) for getter in self._head_getters]  # type: ignore[misc]
+        items = []
+        tail = self.head_size
+        for getter, (attr, _, size) in zip(self._head_getters, self._head, strict=True):
+            if getter is not None:
+                items.append(getter(value))
+            else:
+                items.append(tail)
+                tail += UINT16_SIZE + len(getattr(value, attr)) * size
+        return items
+
+    # Raise a descriptive error for the first byte array field w/ the wrong length
+    # `struct` pads or truncates `Ns` items silently, so every static byte field is checked
+    def _check_lengths(self, value: Any) -> None:  # noqa: ANN401
+        if self._byte_getter is None:
+            return
+        fields = self._byte_getter(value)
+        if len(self._byte_attrs) == 1:
+            fields = (fields,)
+        if list(map(len, fields)) == self._byte_sizes:
+            return
+        for attr, size, field in zip(
+            self._byte_attrs, self._byte_sizes, fields, strict=True
+        ):
+            if len(field) != size:
+                raise ValueError(
+                    f"{self.name}.{attr}: expected {size} bytes, "
+                    f"but got {len(field)} bytes"
+                )
+
+    # Get the encoded size of a struct instance (constant for static structs)
+    def size(self, value: Any = None) -> int:  # noqa: ANN401
+        size = self.head_size
+        for attr, _, elem_size in self._dynamic:
+            size += UINT16_SIZE + len(getattr(value, attr)) * elem_size
+        return size
+
+    # Encode a struct instance into a new bytes object
+    def encode(self, value: Any) -> bytes:  # noqa: ANN401
+        if not self.is_static:
+            buf = bytearray(self.size(value))
+            self.encode_into(value, buf)
+            return bytes(buf)
+
+        self._check_lengths(value)
+        try:
+            return self._head_struct.pack(*self._head_items(value))
+        except (OverflowError, struct.error) as e:
+            raise ValueError(f"{self.name}: value out of range: {e}") from e
+
+    # Encode a struct instance into `buf` starting at `offset`, return the offset right after it
+    # Writes straight into `buf`, w/o building an intermediate bytes object
+    def encode_into(
+        self, value: Any, buf: bytearray | memoryview, offset: int = 0  # noqa: ANN401
+    ) -> int:
+        self._check_lengths(value)
+        end = offset + self.size(value)
+        if end > len(buf):
+            raise ValueError(
+                f"{self.name}: buffer too small, need {end} bytes but got {len(buf)}"
+            )
+        try:
+            self._head_struct.pack_into(buf, offset, *self._head_items(value))
+            pos = offset + self.head_size
+            for attr, _, elem_size in self._dynamic:
+                items = getattr(value, attr)
+                buf[pos : pos + UINT16_SIZE] = len(items).to_bytes(UINT16_SIZE, "big")
+                pos += UINT16_SIZE
+                for x in items:
+                    buf[pos : pos + elem_size] = x.to_bytes(elem_size, "big")
+                    pos += elem_size
+        except (OverflowError, struct.error) as e:
+            raise ValueError(f"{self.name}: value out of range: {e}") from e
+        return end
+
+    # Encode many struct instances back to back into one contiguous preallocated buffer
+    def encode_many(self, values: Sequence[Any]) -> bytearray:
+        buf = bytearray(sum(self.size(value) for value in values))
+        view = memoryview(buf)
+        offset = 0
+        for value in values:
+            offset = self.encode_into(value, view, offset)
+        view.release()
+        return buf
+
+    # Decode a struct instance from `data` starting at `offset`
+    def decode(
+        self, data: bytes | bytearray | memoryview, offset: int = 0
+    ) -> Any:  # noqa: ANN401
+        if len(data) - offset < self.head_size:
+            raise ValueError(
+                f"{self.name}: expected at least {self.head_size} bytes, "
+                f"but got {len(data) - offset} bytes"
+            )
+        values: list = []
+        for _, start, end, is_int in self._static:
+            field = data[offset + start : offset + end]
+            values.append(int.from_bytes(field, "big") if is_int else bytes(field))
+        for _, start, elem_size in self._dynamic:
+            tail = offset + int.from_bytes(
+                data[offset + start : offset + start + UINT16_SIZE], "big"
+            )
+            length = int.from_bytes(data[tail : tail + UINT16_SIZE], "big")
+            tail += UINT16_SIZE
+            values.append(
+                tuple(
+                    int.from_bytes(data[i : i + elem_size], "big")
+                    for i in range(tail, tail + length * elem_size, elem_size)
+                )
+            )
+        return self.cls(**dict(zip(self._attrs, values, strict=True)))
+
+    # Decode `count` back to back static struct instances from one contiguous buffer
+    def decode_many(self, data: bytes | bytearray | memoryview, count: int) -> list:
+        if not self.is_static:
+            raise ValueError(f"{self.name}: batch decoding needs a static struct")
+        return [self.decode(data, i * self.head_size) for i in range(count)]
+
+
+# Build the codecs from the plonk verifier ARC-56 struct specs
+def load_codecs(arc56_path: Path = PLONK_VERIFIER_ARC56_PATH) -> dict[str, StructCodec]:
+    with open(arc56_path) as f:
+        structs = json.load(f)["structs"]
+
+    classes = {
+        "Proof": Proof,
+        "VerificationKey": VerificationKey,
+        "LagrangeWitness": LagrangeWitness,
+    }
+    return {
+        name: StructCodec(name, structs[name], cls) for name, cls in classes.items()
+    }
+
+
+# Shared codecs, laid out once at import
+_CODECS = load_codecs()
+PROOF_CODEC = _CODECS["Proof"]
+VKEY_CODEC = _CODECS["VerificationKey"]
+LAGRANGE_WITNESS_CODEC = _CODECS["LagrangeWitness"]
@@ -1,12 +1,12 @@
 import base64
 import json
-from dataclasses import asdict
+from collections.abc import Callable
 from logging import Logger
 from pathlib import Path
+from typing import Any, TypeVar
 
-from algokit_utils import get_abi_encoded_value
-
-from smart_contracts.artifacts.plonk_verifier.plonk_verifier_client import APP_SPEC
+from utils.fr import calc_lagrange_witness
+from utils.zk_codec import PROOF_CODEC, VKEY_CODEC
 from utils.zk_models import LagrangeWitness, Proof, VerificationKey
 
 # Setup paths
@@ -14,52 +14,121 @@ APP_DIR = Path(__file__).parent.parent
 ARTIFACTS_DIR = APP_DIR / "circuits" / "main" / "artifacts"
 VKEY_PATH = ARTIFACTS_DIR / "verification_key.json"
 
-FRONTEND_DIR = APP_DIR.parent / "Salvo-frontend"
-
-
-# Get ZK circuit Lagrange witness
-def get_zk_lagrange_witness() -> LagrangeWitness:
-    # Load raw data from ZK circuit public JSON file
-    with open(ARTIFACTS_DIR / "lagrange_witness.json") as f:
-        lw_json = json.load(f)
-
-    return LagrangeWitness(
-        l=lw_json["l"],
-        xin=lw_json["xin"],
-        zh=lw_json["zh"],
-    )
-
+# Artifact file names inside the artifacts directory
+PUBLIC_FILE = "public.json"
+VKEY_FILE = "verification_key.json"
+VKEY_POINTS_FILE = "vkey_gpoints_payload.json"
+PROOF_FILE = "proof.json"
+PROOF_PAYLOAD_FILE = "proof_payload.json"
 
-# Get ZK circuit public signals
-def get_zk_public_signals() -> list[int]:
-    # Load raw data from ZK circuit public JSON file
-    with open(ARTIFACTS_DIR / "public.json") as f:
-        public_json = json.load(f)
+FRONTEND_DIR = APP_DIR.parent / "Salvo-frontend"
 
-    # Iterate through the public_json file and return a list of each element as an int
-    return [int(i) for i in public_json]
 
+# Type of a decoded artifact object returned by the store
+T = TypeVar("T")
+
+# File stamp used to invalidate cached artifacts: (mtime in nanoseconds, size in bytes)
+Stamp = tuple[int, int]
+
+
+# Class for a memoized loader of the ZK circuit artifacts directory
+# Each file is parsed once and each decoded object is built once, until the file's mtime or size changes
+class ArtifactStore:
+    def __init__(self, artifacts_dir: Path = ARTIFACTS_DIR) -> None:
+        self.artifacts_dir = artifacts_dir
+        self._json: dict[Path, tuple[Stamp, Any]] = {}
+        self._decoded: dict[str, tuple[tuple[Stamp, ...], Any]] = {}
+
+    # Get the stamp of an artifact file
+    def _stamp(self, name: str) -> Stamp:
+        stat = (self.artifacts_dir / name).stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    # Get the parsed contents of an artifact JSON file, re-reading it only if it changed on disk
+    def _read_json(self, name: str) -> Any:  # noqa: ANN401
+        path = self.artifacts_dir / name
+        stamp = self._stamp(name)
+        cached = self._json.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        with open(path) as f:
+            data = json.load(f)
+        self._json[path] = (stamp, data)
+        return data
+
+    # Get a decoded object built from the given artifact files, rebuilding it only if any of them changed
+    def _get(self, key: str, names: tuple[str, ...], build: Callable[[], T]) -> T:
+        stamps = tuple(self._stamp(name) for name in names)
+        cached = self._decoded.get(key)
+        if cached is not None and cached[0] == stamps:
+            return cached[1]
+
+        value = build()
+        self._decoded[key] = (stamps, value)
+        return value
+
+    # Drop every cached file and decoded object
+    def clear(self) -> None:
+        self._json.clear()
+        self._decoded.clear()
+
+    # Get ZK circuit public signals
+    def public_signals(self) -> tuple[int, ...]:
+        return self._get(
+            "public_signals",
+            (PUBLIC_FILE,),
+            lambda: tuple(int(i) for i in self._read_json(PUBLIC_FILE)),
+        )
 
-# Get ZK circuit verification key `root of unity` field
-def get_zk_root_of_unity_as_bytes() -> bytes:
-    # Load raw data from ZK circuit verification key JSON file
-    with open(ARTIFACTS_DIR / "verification_key.json") as f:
-        vkey_json = json.load(f)
+    # Get ZK circuit verification key `root of unity` field as big endian bytes of length 32
+    def root_of_unity_as_bytes(self) -> bytes:
+        return self._get(
+            "root_of_unity",
+            (VKEY_FILE,),
+            lambda: int(self._read_json(VKEY_FILE)["w"]).to_bytes(32, byteorder="big"),
+        )
 
-    # Convert `root of unity` value to big endian bytes of length 32
-    return int(vkey_json["w"]).to_bytes(32, byteorder="big")
+    # Get ZK circuit verification key `root of unity` field as an integer
+    def root_of_unity(self) -> int:
+        return int.from_bytes(self.root_of_unity_as_bytes(), "big")
+
+    # Get ZK circuit verification key data
+    def vkey(self) -> VerificationKey:
+        return self._get(
+            "vkey",
+            (VKEY_FILE, VKEY_POINTS_FILE),
+            lambda: decode_zk_vkey(
+                self._read_json(VKEY_FILE), self._read_json(VKEY_POINTS_FILE)
+            ),
+        )
 
+    # Get ZK circuit proof data
+    def proof(self) -> Proof:
+        return self._get(
+            "proof",
+            (PROOF_FILE, PROOF_PAYLOAD_FILE),
+            lambda: decode_zk_proof(
+                self._read_json(PROOF_FILE), self._read_json(PROOF_PAYLOAD_FILE)
+            ),
+        )
 
-# Get ZK circuit verification key data
-def get_zk_vkey(logger: Logger) -> VerificationKey:
-    # Load raw data from ZK circuit verification key JSON file
-    with open(ARTIFACTS_DIR / "verification_key.json") as f:
-        vkey_json = json.load(f)
+    # Get ZK circuit Lagrange witness, computed off-chain instead of calling `LagrangeWitnessCalculator`
+    def lagrange_witness(self) -> LagrangeWitness:
+        return self._get(
+            "lagrange_witness",
+            (VKEY_FILE, VKEY_POINTS_FILE, PUBLIC_FILE, PROOF_FILE, PROOF_PAYLOAD_FILE),
+            lambda: calc_lagrange_witness(
+                vk=self.vkey(),
+                signals=self.public_signals(),
+                proof=self.proof(),
+                root_of_unity=self.root_of_unity(),
+            ),
+        )
 
-    # Load serialized data from ZK circuit verification key curve points payload JSON file
-    with open(ARTIFACTS_DIR / "vkey_gpoints_payload.json") as f:
-        vkey_points_json = json.load(f)
 
+# Decode ZK circuit verification key data from its JSON file and curve points payload JSON file
+def decode_zk_vkey(vkey_json: dict, vkey_points_json: dict) -> VerificationKey:
     # Decode the base64 encoded verifcation key curve points data
     vkey_points_bytes = base64.b64decode(vkey_points_json["data"])
 
@@ -83,16 +152,6 @@ def get_zk_vkey(logger: Logger) -> VerificationKey:
     x2_start = 8 * point_size  # 768
     vkey_g2_point = vkey_points_bytes[x2_start : x2_start + 192]
 
-    x1 = vkey_g2_point[0:48]
-    x0 = vkey_g2_point[48:96]
-    y1 = vkey_g2_point[96:144]
-    y0 = vkey_g2_point[144:192]
-
-    logger.info(x1)
-    logger.info(x0)
-    logger.info(y1)
-    logger.info(y0)
-
     # Extract the smaller-sized scalar values as standard integers from the raw json data
     try:
         scalars = {
@@ -106,27 +165,16 @@ def get_zk_vkey(logger: Logger) -> VerificationKey:
     except ValueError as e:
         raise ValueError(f"Invalid scalar value in vkey JSON: {e}") from e
 
-    # Build an instance of the VerificationKey class
-    vk = VerificationKey(
+    # Return a new instance of the VerificationKey data class
+    return VerificationKey(
         **vkey_g1_points,  # expands Qm, Ql, Qr, Qo, Qc, S1, S2, S3,
         **scalars,  # expands power, nPublic, k1, k2
         X_2=vkey_g2_point,  # X_2
     )
 
-    # Return a new instance of the Proof data class
-    return vk
-
-
-# Encode ZK circuit proof data for LWC contract compatibility
-def get_zk_proof() -> Proof:
-    # Load raw data from ZK circuit proof JSON file
-    with open(ARTIFACTS_DIR / "proof.json") as f:
-        proof_json = json.load(f)
-
-    # Load serialized data from ZK circuit proof payload JSON file
-    with open(ARTIFACTS_DIR / "proof_payload.json") as f:
-        proof_payload_json = json.load(f)
 
+# Decode ZK circuit proof data from its JSON file and proof payload JSON file
+def decode_zk_proof(proof_json: dict, proof_payload_json: dict) -> Proof:
     # Decode the base64 encoded proof data
     proof_bytes = base64.b64decode(proof_payload_json["data"])
 
@@ -165,53 +213,17 @@ def get_zk_proof() -> Proof:
     )
 
 
+# Shared store for the default artifacts directory, so every caller hits the same cache
+ARTIFACTS = ArtifactStore()
+
+
 # Get ZK circuit verification key data as bytes
 def get_zk_vkey_as_bytes(vk: VerificationKey, logger: Logger) -> bytes:
-    logger.info(
-        get_abi_encoded_value(asdict(vk), "VerificationKey", APP_SPEC.structs).hex()
-    )
-    return get_abi_encoded_value(asdict(vk), "VerificationKey", APP_SPEC.structs)
-    # return (
-    #     vk.Qm  # 96 bytes
-    #     + vk.Ql  # 96 bytes
-    #     + vk.Qr  # 96 bytes
-    #     + vk.Qo  # 96 bytes
-    #     + vk.Qc  # 96 bytes
-    #     + vk.S1  # 96 bytes
-    #     + vk.S2  # 96 bytes
-    #     + vk.S3  # 96 bytes
-    #     + vk.power.to_bytes(8, "big")  # 8 bytes
-    #     + vk.nPublic.to_bytes(8, "big")  # 8 bytes
-    #     + vk.k1.to_bytes(8, "big")  # 8 bytes
-    #     + vk.k2.to_bytes(8, "big")  # 8 bytes
-    #     + vk.X_2  # 192 bytes
-    # )  # Total length: 992 bytes
-
-
-# export function encodeVk(
-#   vkey: VerificationKey,
-#   appSpec: Arc56Contract,
-# ): Uint8Array {
-#   return getABIEncodedValue(vkey, "VerificationKey", appSpec.structs);
-# }
+    vkey_bytes = VKEY_CODEC.encode(vk)  # Total length: 992 bytes
+    logger.info(vkey_bytes.hex())
+    return vkey_bytes
 
 
-# Get ZK circuit verification key data as bytes
+# Get ZK circuit proof data as bytes
 def get_zk_proof_as_bytes(proof: Proof) -> bytes:
-    return (
-        proof.A  # 96 bytes
-        + proof.B  # 96 bytes
-        + proof.C  # 96 bytes
-        + proof.Z  # 96 bytes
-        + proof.T1  # 96 bytes
-        + proof.T2  # 96 bytes
-        + proof.T3  # 96 bytes
-        + proof.Wxi  # 96 bytes
-        + proof.Wxiw  # 96 bytes
-        + proof.eval_a.to_bytes(32, "big")  # 32 bytes
-        + proof.eval_b.to_bytes(32, "big")  # 32 bytes
-        + proof.eval_c.to_bytes(32, "big")  # 32 bytes
-        + proof.eval_s1.to_bytes(32, "big")  # 32 bytes
-        + proof.eval_s2.to_bytes(32, "big")  # 32 bytes
-        + proof.eval_zw.to_bytes(32, "big")  # 32 bytes
-    )  # Total length: 1056 bytes
+    return PROOF_CODEC.encode(proof)  # Total length: 1056 bytes
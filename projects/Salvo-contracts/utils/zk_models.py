@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 
 # Class for ZK circuit verification_key.json file data
-@dataclass
+@dataclass(frozen=True)
 class VerificationKey:
     Qm: bytes  # 96 bytes
     Ql: bytes  # 96 bytes
@@ -20,7 +20,7 @@ class VerificationKey:
 
 
 # Class for ZK circuit proof.json file data
-@dataclass
+@dataclass(frozen=True)
 class Proof:
     A: bytes  # 96 bytes
     B: bytes  # 96 bytes
@@ -40,8 +40,8 @@ class Proof:
 
 
 # Class for ZK circuit lagrange_witness.json file data
-@dataclass
+@dataclass(frozen=True)
 class LagrangeWitness:
-    l: list[int]  # uint256[]
+    l: tuple[int, ...]  # uint256[]
     xin: int  # uint256
     zh: int  # uint256